@@ -1,56 +0,0 @@
-function L3(i,n){for(var r=0;r<n.length;r++){const s=n[r];if(typeof s!="string"&&!Array.isArray(s)){for(const l in s)if(l!=="default"&&!(l in i)){const c=Object.getOwnPropertyDescriptor(s,l);c&&Object.defineProperty(i,l,c.get?c:{enumerable:!0,get:()=>s[l]})}}}return Object.freeze(Object.defineProperty(i,Symbol.toStringTag,{value:"Module"}))}(function(){const n=document.createElement("link").relList;if(n&&n.supports&&n.supports("modulepreload"))return;for(const l of document.querySelectorAll('link[rel="modulepreload"]'))s(l);new MutationObserver(l=>{for(const c of l)if(c.type==="childList")for(const u of c.addedNodes)u.tagName==="LINK"&&u.rel==="modulepreload"&&s(u)}).observe(document,{childList:!0,subtree:!0});function r(l){const c={};return l.integrity&&(c.integrity=l.integrity),l.referrerPolicy&&(c.referrerPolicy=l.referrerPolicy),l.crossOrigin==="use-credentials"?c.credentials="include":l.crossOrigin==="anonymous"?c.credentials="omit":c.credentials="same-origin",c}function s(l){if(l.ep)return;l.ep=!0;const c=r(l);fetch(l.href,c)}})();function Ty(i){return i&&i.__esModule&&Object.prototype.hasOwnProperty.call(i,"default")?i.default:i}var tp={exports:{}},Do={};var Wx;function U3(){if(Wx)return Do;Wx=1;var i=Symbol.for("react.transitional.element"),n=Symbol.for("react.fragment");function r(s,l,c){var u=null;if(c!==void 0&&(u=""+c),l.key!==void 0&&(u=""+l.key),"key"in l){c={};for(var d in l)d!=="key"&&(c[d]=l[d])}else c=l;return l=c.ref,{$$typeof:i,type:s,key:u,ref:l!==void 0?l:null,props:c}}return Do.Fragment=n,Do.jsx=r,Do.jsxs=r,Do}var ev;function H3(){return ev||(ev=1,tp.exports=U3()),tp.exports}var h=H3(),np={exports:{}},we={};var tv;function B3(){if(tv)return we;tv=1;var i=Symbol.for("react.transitional.element"),n=Symbol.for("react.portal"),r=Symbol.for("react.fragment"),s=Symbol.for("react.strict_mode"),l=Symbol.for("react.profiler"),c=Symbol.for("react.consumer"),u=Symbol.for("react.context"),d=Symbol.for("react.forward_ref"),g=Symbol.for("react.suspense"),m=Symbol.for("react.memo"),x=Symbol.for("react.lazy"),v=Symbol.for("react.activity"),S=Symbol.iterator;function A(k){return k===null||typeof k!="object"?null:(k=S&&k[S]||k["@@iterator"],typeof k=="function"?k:null)}var N={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},_=Object.assign,T={};function j(k,I,F){this.props=k,this.context=I,this.refs=T,this.updater=F||N}j.prototype.isReactComponent={},j.prototype.setState=function(k,I){if(typeof k!="object"&&typeof k!="function"&&k!=null)throw Error("takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,k,I,"setState")},j.prototype.forceUpdate=function(k){this.updater.enqueueForceUpdate(this,k,"forceUpdate")};function E(){}E.prototype=j.prototype;function M(k,I,F){this.props=k,this.context=I,this.refs=T,this.updater=F||N}var R=M.prototype=new E;R.constructor=M,_(R,j.prototype),R.isPureReactComponent=!0;var O=Array.isArray;function P(){}var z={H:null,A:null,T:null,S:null},C=Object.prototype.hasOwnProperty;function G(k,I,F){var ae=F.ref;return{$$typeof:i,type:k,key:I,ref:ae!==void 0?ae:null,props:F}}function W(k,I){return G(k.type,I,k.props)}function re(k){return typeof k=="object"&&k!==null&&k.$$typeof===i}function Z(k){var I={"=":"=0",":":"=2"};return"$"+k.replace(/[=:]/g,function(F){return I[F]})}var se=/\/+/g;function le(k,I){return typeof k=="object"&&k!==null&&k.key!=null?Z(""+k.key):I.toString(36)}function Q(k){switch(k.status){case"fulfilled":return k.value;case"rejected":throw k.reason;default:switch(typeof k.status=="string"?k.then(P,P):(k.status="pending",k.then(function(I){k.status==="pending"&&(k.status="fulfilled",k.value=I)},function(I){k.status==="pending"&&(k.status="rejected",k.reason=I)})),k.status){case"fulfilled":return k.value;case"rejected":throw k.reason}}throw k}function H(k,I,F,ae,ce){var ge=typeof k;(ge==="undefined"||ge==="boolean")&&(k=null);var oe=!1;if(k===null)oe=!0;else switch(ge){case"bigint":case"string":case"number":oe=!0;break;case"object":switch(k.$$typeof){case i:case n:oe=!0;break;case x:return oe=k._init,H(oe(k._payload),I,F,ae,ce)}}if(oe)return ce=ce(k),oe=ae===""?"."+le(k,0):ae,O(ce)?(F="",oe!=null&&(F=oe.replace(se,"$&/")+"/"),H(ce,I,F,"",function($t){return $t})):ce!=null&&(re(ce)&&(ce=W(ce,F+(ce.key==null||k&&k.key===ce.key?"":(""+ce.key).replace(se,"$&/")+"/")+oe)),I.push(ce)),1;oe=0;var Ke=ae===""?".":ae+":";if(O(k))for(var Ne=0;Ne<k.length;Ne++)ae=k[Ne],ge=Ke+le(ae,Ne),oe+=H(ae,I,F,ge,ce);else if(Ne=A(k),typeof Ne=="function")for(k=Ne.call(k),Ne=0;!(ae=k.next()).done;)ae=ae.value,ge=Ke+le(ae,Ne++),oe+=H(ae,I,F,ge,ce);else if(ge==="object"){if(typeof k.then=="function")return H(Q(k),I,F,ae,ce);throw I=String(k),Error("Objects are not valid as a React child (found: "+(I==="[object Object]"?"object with keys {"+Object.keys(k).join(", ")+"}":I)+"). If you meant to render a collection of children, use an array instead.")}return oe}function K(k,I,F){if(k==null)return k;var ae=[],ce=0;return H(k,ae,"","",function(ge){return I.call(F,ge,ce++)}),ae}function J(k){if(k._status===-1){var I=k._result;I=I(),I.then(function(F){(k._status===0||k._status===-1)&&(k._status=1,k._result=F)},function(F){(k._status===0||k._status===-1)&&(k._status=2,k._result=F)}),k._status===-1&&(k._status=0,k._result=I)}if(k._status===1)return k._result.default;throw k._result}var me=typeof reportError=="function"?reportError:function(k){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var I=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof k=="object"&&k!==null&&typeof k.message=="string"?String(k.message):String(k),error:k});if(!window.dispatchEvent(I))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",k);return}console.error(k)},U={map:K,forEach:function(k,I,F){K(k,function(){I.apply(this,arguments)},F)},count:function(k){var I=0;return K(k,function(){I++}),I},toArray:function(k){return K(k,function(I){return I})||[]},only:function(k){if(!re(k))throw Error("React.Children.only expected to receive a single React element child.");return k}};return we.Activity=v,we.Children=U,we.Component=j,we.Fragment=r,we.Profiler=l,we.PureComponent=M,we.StrictMode=s,we.Suspense=g,we.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=z,we.__COMPILER_RUNTIME={__proto__:null,c:function(k){return z.H.useMemoCache(k)}},we.cache=function(k){return function(){return k.apply(null,arguments)}},we.cacheSignal=function(){return null},we.cloneElement=function(k,I,F){if(k==null)throw Error("The argument must be a React element, but you passed "+k+".");var ae=_({},k.props),ce=k.key;if(I!=null)for(ge in I.key!==void 0&&(ce=""+I.key),I)!C.call(I,ge)||ge==="key"||ge==="__self"||ge==="__source"||ge==="ref"&&I.ref===void 0||(ae[ge]=I[ge]);var ge=arguments.length-2;if(ge===1)ae.children=F;else if(1<ge){for(var oe=Array(ge),Ke=0;Ke<ge;Ke++)oe[Ke]=arguments[Ke+2];ae.children=oe}return G(k.type,ce,ae)},we.createContext=function(k){return k={$$typeof:u,_currentValue:k,_currentValue2:k,_threadCount:0,Provider:null,Consumer:null},k.Provider=k,k.Consumer={$$typeof:c,_context:k},k},we.createElement=function(k,I,F){var ae,ce={},ge=null;if(I!=null)for(ae in I.key!==void 0&&(ge=""+I.key),I)C.call(I,ae)&&ae!=="key"&&ae!=="__self"&&ae!=="__source"&&(ce[ae]=I[ae]);var oe=arguments.length-2;if(oe===1)ce.children=F;else if(1<oe){for(var Ke=Array(oe),Ne=0;Ne<oe;Ne++)Ke[Ne]=arguments[Ne+2];ce.children=Ke}if(k&&k.defaultProps)for(ae in oe=k.defaultProps,oe)ce[ae]===void 0&&(ce[ae]=oe[ae]);return G(k,ge,ce)},we.createRef=function(){return{current:null}},we.forwardRef=function(k){return{$$typeof:d,render:k}},we.isValidElement=re,we.lazy=function(k){return{$$typeof:x,_payload:{_status:-1,_result:k},_init:J}},we.memo=function(k,I){return{$$typeof:m,type:k,compare:I===void 0?null:I}},we.startTransition=function(k){var I=z.T,F={};z.T=F;try{var ae=k(),ce=z.S;ce!==null&&ce(F,ae),typeof ae=="object"&&ae!==null&&typeof ae.then=="function"&&ae.then(P,me)}catch(ge){me(ge)}finally{I!==null&&F.types!==null&&(I.types=F.types),z.T=I}},we.unstable_useCacheRefresh=function(){return z.H.useCacheRefresh()},we.use=function(k){return z.H.use(k)},we.useActionState=function(k,I,F){return z.H.useActionState(k,I,F)},we.useCallback=function(k,I){return z.H.useCallback(k,I)},we.useContext=function(k){return z.H.useContext(k)},we.useDebugValue=function(){},we.useDeferredValue=function(k,I){return z.H.useDeferredValue(k,I)},we.useEffect=function(k,I){return z.H.useEffect(k,I)},we.useEffectEvent=function(k){return z.H.useEffectEvent(k)},we.useId=function(){return z.H.useId()},we.useImperativeHandle=function(k,I,F){return z.H.useImperativeHandle(k,I,F)},we.useInsertionEffect=function(k,I){return z.H.useInsertionEffect(k,I)},we.useLayoutEffect=function(k,I){return z.H.useLayoutEffect(k,I)},we.useMemo=function(k,I){return z.H.useMemo(k,I)},we.useOptimistic=function(k,I){return z.H.useOptimistic(k,I)},we.useReducer=function(k,I,F){return z.H.useReducer(k,I,F)},we.useRef=function(k){return z.H.useRef(k)},we.useState=function(k){return z.H.useState(k)},we.useSyncExternalStore=function(k,I,F){return z.H.useSyncExternalStore(k,I,F)},we.useTransition=function(){return z.H.useTransition()},we.version="19.2.3",we}var nv;function bm(){return nv||(nv=1,np.exports=B3()),np.exports}var b=bm();const Ua=Ty(b),_m=L3({__proto__:null,default:Ua},[b]);var ap={exports:{}},ko={},sp={exports:{}},rp={};var av;function F3(){return av||(av=1,(function(i){function n(H,K){var J=H.length;H.push(K);e:for(;0<J;){var me=J-1>>>1,U=H[me];if(0<l(U,K))H[me]=K,H[J]=U,J=me;else break e}}function r(H){return H.length===0?null:H[0]}function s(H){if(H.length===0)return null;var K=H[0],J=H.pop();if(J!==K){H[0]=J;e:for(var me=0,U=H.length,k=U>>>1;me<k;){var I=2*(me+1)-1,F=H[I],ae=I+1,ce=H[ae];if(0>l(F,J))ae<U&&0>l(ce,F)?(H[me]=ce,H[ae]=J,me=ae):(H[me]=F,H[I]=J,me=I);else if(ae<U&&0>l(ce,J))H[me]=ce,H[ae]=J,me=ae;else break e}}return K}function l(H,K){var J=H.sortIndex-K.sortIndex;return J!==0?J:H.id-K.id}if(i.unstable_now=void 0,typeof performance=="object"&&typeof performance.now=="function"){var c=performance;i.unstable_now=function(){return c.now()}}else{var u=Date,d=u.now();i.unstable_now=function(){return u.now()-d}}var g=[],m=[],x=1,v=null,S=3,A=!1,N=!1,_=!1,T=!1,j=typeof setTimeout=="function"?setTimeout:null,E=typeof clearTimeout=="function"?clearTimeout:null,M=typeof setImmediate<"u"?setImmediate:null;function R(H){for(var K=r(m);K!==null;){if(K.callback===null)s(m);else if(K.startTime<=H)s(m),K.sortIndex=K.expirationTime,n(g,K);else break;K=r(m)}}function O(H){if(_=!1,R(H),!N)if(r(g)!==null)N=!0,P||(P=!0,Z());else{var K=r(m);K!==null&&Q(O,K.startTime-H)}}var P=!1,z=-1,C=5,G=-1;function W(){return T?!0:!(i.unstable_now()-G<C)}function re(){if(T=!1,P){var H=i.unstable_now();G=H;var K=!0;try{e:{N=!1,_&&(_=!1,E(z),z=-1),A=!0;var J=S;try{t:{for(R(H),v=r(g);v!==null&&!(v.expirationTime>H&&W());){var me=v.callback;if(typeof me=="function"){v.callback=null,S=v.priorityLevel;var U=me(v.expirationTime<=H);if(H=i.unstable_now(),typeof U=="function"){v.callback=U,R(H),K=!0;break t}v===r(g)&&s(g),R(H)}else s(g);v=r(g)}if(v!==null)K=!0;else{var k=r(m);k!==null&&Q(O,k.startTime-H),K=!1}}break e}finally{v=null,S=J,A=!1}K=void 0}}finally{K?Z():P=!1}}}var Z;if(typeof M=="function")Z=function(){M(re)};else if(typeof MessageChannel<"u"){var se=new MessageChannel,le=se.port2;se.port1.onmessage=re,Z=function(){le.postMessage(null)}}else Z=function(){j(re,0)};function Q(H,K){z=j(function(){H(i.unstable_now())},K)}i.unstable_IdlePriority=5,i.unstable_ImmediatePriority=1,i.unstable_LowPriority=4,i.unstable_NormalPriority=3,i.unstable_Profiling=null,i.unstable_UserBlockingPriority=2,i.unstable_cancelCallback=function(H){H.callback=null},i.unstable_forceFrameRate=function(H){0>H||125<H?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):C=0<H?Math.floor(1e3/H):5},i.unstable_getCurrentPriorityLevel=function(){return S},i.unstable_next=function(H){switch(S){case 1:case 2:case 3:var K=3;break;default:K=S}var J=S;S=K;try{return H()}finally{S=J}},i.unstable_requestPaint=function(){T=!0},i.unstable_runWithPriority=function(H,K){switch(H){case 1:case 2:case 3:case 4:case 5:break;default:H=3}var J=S;S=H;try{return K()}finally{S=J}},i.unstable_scheduleCallback=function(H,K,J){var me=i.unstable_now();switch(typeof J=="object"&&J!==null?(J=J.delay,J=typeof J=="number"&&0<J?me+J:me):J=me,H){case 1:var U=-1;break;case 2:U=250;break;case 5:U=1073741823;break;case 4:U=1e4;break;default:U=5e3}return U=J+U,H={id:x++,callback:K,priorityLevel:H,startTime:J,expirationTime:U,sortIndex:-1},J>me?(H.sortIndex=J,n(m,H),r(g)===null&&H===r(m)&&(_?(E(z),z=-1):_=!0,Q(O,J-me))):(H.sortIndex=U,n(g,H),N||A||(N=!0,P||(P=!0,Z()))),H},i.unstable_shouldYield=W,i.unstable_wrapCallback=function(H){var K=S;return function(){var J=S;S=K;try{return H.apply(this,arguments)}finally{S=J}}}})(rp)),rp}var sv;function Y3(){return sv||(sv=1,sp.exports=F3()),sp.exports}var ip={exports:{}},bn={};var rv;function q3(){if(rv)return bn;rv=1;var i=bm();function n(g){var m="https://react.dev/errors/"+g;if(1<arguments.length){m+="?args[]="+encodeURIComponent(arguments[1]);for(var x=2;x<arguments.length;x++)m+="&args[]="+encodeURIComponent(arguments[x])}return"Minified React error #"+g+"; visit "+m+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function r(){}var s={d:{f:r,r:function(){throw Error(n(522))},D:r,C:r,L:r,m:r,X:r,S:r,M:r},p:0,findDOMNode:null},l=Symbol.for("react.portal");function c(g,m,x){var v=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:l,key:v==null?null:""+v,children:g,containerInfo:m,implementation:x}}var u=i.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE;function d(g,m){if(g==="font")return"";if(typeof m=="string")return m==="use-credentials"?m:""}return bn.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=s,bn.createPortal=function(g,m){var x=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!m||m.nodeType!==1&&m.nodeType!==9&&m.nodeType!==11)throw Error(n(299));return c(g,m,null,x)},bn.flushSync=function(g){var m=u.T,x=s.p;try{if(u.T=null,s.p=2,g)return g()}finally{u.T=m,s.p=x,s.d.f()}},bn.preconnect=function(g,m){typeof g=="string"&&(m?(m=m.crossOrigin,m=typeof m=="string"?m==="use-credentials"?m:"":void 0):m=null,s.d.C(g,m))},bn.prefetchDNS=function(g){typeof g=="string"&&s.d.D(g)},bn.preinit=function(g,m){if(typeof g=="string"&&m&&typeof m.as=="string"){var x=m.as,v=d(x,m.crossOrigin),S=typeof m.integrity=="string"?m.integrity:void 0,A=typeof m.fetchPriority=="string"?m.fetchPriority:void 0;x==="style"?s.d.S(g,typeof m.precedence=="string"?m.precedence:void 0,{crossOrigin:v,integrity:S,fetchPriority:A}):x==="script"&&s.d.X(g,{crossOrigin:v,integrity:S,fetchPriority:A,nonce:typeof m.nonce=="string"?m.nonce:void 0})}},bn.preinitModule=function(g,m){if(typeof g=="string")if(typeof m=="object"&&m!==null){if(m.as==null||m.as==="script"){var x=d(m.as,m.crossOrigin);s.d.M(g,{crossOrigin:x,integrity:typeof m.integrity=="string"?m.integrity:void 0,nonce:typeof m.nonce=="string"?m.nonce:void 0})}}else m==null&&s.d.M(g)},bn.preload=function(g,m){if(typeof g=="string"&&typeof m=="object"&&m!==null&&typeof m.as=="string"){var x=m.as,v=d(x,m.crossOrigin);s.d.L(g,x,{crossOrigin:v,integrity:typeof m.integrity=="string"?m.integrity:void 0,nonce:typeof m.nonce=="string"?m.nonce:void 0,type:typeof m.type=="string"?m.type:void 0,fetchPriority:typeof m.fetchPriority=="string"?m.fetchPriority:void 0,referrerPolicy:typeof m.referrerPolicy=="string"?m.referrerPolicy:void 0,imageSrcSet:typeof m.imageSrcSet=="string"?m.imageSrcSet:void 0,imageSizes:typeof m.imageSizes=="string"?m.imageSizes:void 0,media:typeof m.media=="string"?m.media:void 0})}},bn.preloadModule=function(g,m){if(typeof g=="string")if(m){var x=d(m.as,m.crossOrigin);s.d.m(g,{as:typeof m.as=="string"&&m.as!=="script"?m.as:void 0,crossOrigin:x,integrity:typeof m.integrity=="string"?m.integrity:void 0})}else s.d.m(g)},bn.requestFormReset=function(g){s.d.r(g)},bn.unstable_batchedUpdates=function(g,m){return g(m)},bn.useFormState=function(g,m,x){return u.H.useFormState(g,m,x)},bn.useFormStatus=function(){return u.H.useHostTransitionStatus()},bn.version="19.2.3",bn}var iv;function wy(){if(iv)return ip.exports;iv=1;function i(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(i)}catch(n){console.error(n)}}return i(),ip.exports=q3(),ip.exports}var lv;function G3(){if(lv)return ko;lv=1;var i=Y3(),n=bm(),r=wy();function s(e){var t="https://react.dev/errors/"+e;if(1<arguments.length){t+="?args[]="+encodeURIComponent(arguments[1]);for(var a=2;a<arguments.length;a++)t+="&args[]="+encodeURIComponent(arguments[a])}return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function l(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11)}function c(e){var t=e,a=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do t=e,(t.flags&4098)!==0&&(a=t.return),e=t.return;while(e)}return t.tag===3?a:null}function u(e){if(e.tag===13){var t=e.memoizedState;if(t===null&&(e=e.alternate,e!==null&&(t=e.memoizedState)),t!==null)return t.dehydrated}return null}function d(e){if(e.tag===31){var t=e.memoizedState;if(t===null&&(e=e.alternate,e!==null&&(t=e.memoizedState)),t!==null)return t.dehydrated}return null}function g(e){if(c(e)!==e)throw Error(s(188))}function m(e){var t=e.alternate;if(!t){if(t=c(e),t===null)throw Error(s(188));return t!==e?null:e}for(var a=e,o=t;;){var f=a.return;if(f===null)break;var p=f.alternate;if(p===null){if(o=f.return,o!==null){a=o;continue}break}if(f.child===p.child){for(p=f.child;p;){if(p===a)return g(f),e;if(p===o)return g(f),t;p=p.sibling}throw Error(s(188))}if(a.return!==o.return)a=f,o=p;else{for(var y=!1,w=f.child;w;){if(w===a){y=!0,a=f,o=p;break}if(w===o){y=!0,o=f,a=p;break}w=w.sibling}if(!y){for(w=p.child;w;){if(w===a){y=!0,a=p,o=f;break}if(w===o){y=!0,o=p,a=f;break}w=w.sibling}if(!y)throw Error(s(189))}}if(a.alternate!==o)throw Error(s(190))}if(a.tag!==3)throw Error(s(188));return a.stateNode.current===a?e:t}function x(e){var t=e.tag;if(t===5||t===26||t===27||t===6)return e;for(e=e.child;e!==null;){if(t=x(e),t!==null)return t;e=e.sibling}return null}var v=Object.assign,S=Symbol.for("react.element"),A=Symbol.for("react.transitional.element"),N=Symbol.for("react.portal"),_=Symbol.for("react.fragment"),T=Symbol.for("react.strict_mode"),j=Symbol.for("react.profiler"),E=Symbol.for("react.consumer"),M=Symbol.for("react.context"),R=Symbol.for("react.forward_ref"),O=Symbol.for("react.suspense"),P=Symbol.for("react.suspense_list"),z=Symbol.for("react.memo"),C=Symbol.for("react.lazy"),G=Symbol.for("react.activity"),W=Symbol.for("react.memo_cache_sentinel"),re=Symbol.iterator;function Z(e){return e===null||typeof e!="object"?null:(e=re&&e[re]||e["@@iterator"],typeof e=="function"?e:null)}var se=Symbol.for("react.client.reference");function le(e){if(e==null)return null;if(typeof e=="function")return e.$$typeof===se?null:e.displayName||e.name||null;if(typeof e=="string")return e;switch(e){case _:return"Fragment";case j:return"Profiler";case T:return"StrictMode";case O:return"Suspense";case P:return"SuspenseList";case G:return"Activity"}if(typeof e=="object")switch(e.$$typeof){case N:return"Portal";case M:return e.displayName||"Context";case E:return(e._context.displayName||"Context")+".Consumer";case R:var t=e.render;return e=e.displayName,e||(e=t.displayName||t.name||"",e=e!==""?"ForwardRef("+e+")":"ForwardRef"),e;case z:return t=e.displayName||null,t!==null?t:le(e.type)||"Memo";case C:t=e._payload,e=e._init;try{return le(e(t))}catch{}}return null}var Q=Array.isArray,H=n.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,K=r.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,J={pending:!1,data:null,method:null,action:null},me=[],U=-1;function k(e){return{current:e}}function I(e){0>U||(e.current=me[U],me[U]=null,U--)}function F(e,t){U++,me[U]=e.current,e.current=t}var ae=k(null),ce=k(null),ge=k(null),oe=k(null);function Ke(e,t){switch(F(ge,t),F(ce,e),F(ae,null),t.nodeType){case 9:case 11:e=(e=t.documentElement)&&(e=e.namespaceURI)?Sx(e):0;break;default:if(e=t.tagName,t=t.namespaceURI)t=Sx(t),e=Ax(t,e);else switch(e){case"svg":e=1;break;case"math":e=2;break;default:e=0}}I(ae),F(ae,e)}function Ne(){I(ae),I(ce),I(ge)}function $t(e){e.memoizedState!==null&&F(oe,e);var t=ae.current,a=Ax(t,e.type);t!==a&&(F(ce,e),F(ae,a))}function xt(e){ce.current===e&&(I(ae),I(ce)),oe.current===e&&(I(oe),Co._currentValue=J)}var vt,qe;function tt(e){if(vt===void 0)try{throw Error()}catch(a){var t=a.stack.trim().match(/\n( *(at )?)/);vt=t&&t[1]||"",qe=-1<a.stack.indexOf(`
-    at`)?" (<anonymous>)":-1<a.stack.indexOf("@")?"@unknown:0:0":""}return`
-`+vt+e+qe}var nn=!1;function on(e,t){if(!e||nn)return"";nn=!0;var a=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{var o={DetermineComponentFrameRoot:function(){try{if(t){var ne=function(){throw Error()};if(Object.defineProperty(ne.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(ne,[])}catch(X){var V=X}Reflect.construct(e,[],ne)}else{try{ne.call()}catch(X){V=X}e.call(ne.prototype)}}else{try{throw Error()}catch(X){V=X}(ne=e())&&typeof ne.catch=="function"&&ne.catch(function(){})}}catch(X){if(X&&V&&typeof X.stack=="string")return[X.stack,V.stack]}return[null,null]}};o.DetermineComponentFrameRoot.displayName="DetermineComponentFrameRoot";var f=Object.getOwnPropertyDescriptor(o.DetermineComponentFrameRoot,"name");f&&f.configurable&&Object.defineProperty(o.DetermineComponentFrameRoot,"name",{value:"DetermineComponentFrameRoot"});var p=o.DetermineComponentFrameRoot(),y=p[0],w=p[1];if(y&&w){var D=y.split(`
-`),q=w.split(`
-`);for(f=o=0;o<D.length&&!D[o].includes("DetermineComponentFrameRoot");)o++;for(;f<q.length&&!q[f].includes("DetermineComponentFrameRoot");)f++;if(o===D.length||f===q.length)for(o=D.length-1,f=q.length-1;1<=o&&0<=f&&D[o]!==q[f];)f--;for(;1<=o&&0<=f;o--,f--)if(D[o]!==q[f]){if(o!==1||f!==1)do if(o--,f--,0>f||D[o]!==q[f]){var ee=`
-`+D[o].replace(" at new "," at ");return e.displayName&&ee.includes("<anonymous>")&&(ee=ee.replace("<anonymous>",e.displayName)),ee}while(1<=o&&0<=f);break}}}finally{nn=!1,Error.prepareStackTrace=a}return(a=e?e.displayName||e.name:"")?tt(a):""}function $(e,t){switch(e.tag){case 26:case 27:case 5:return tt(e.type);case 16:return tt("Lazy");case 13:return e.child!==t&&t!==null?tt("Suspense Fallback"):tt("Suspense");case 19:return tt("SuspenseList");case 0:case 15:return on(e.type,!1);case 11:return on(e.type.render,!1);case 1:return on(e.type,!0);case 31:return tt("Activity");default:return""}}function gn(e){try{var t="",a=null;do t+=$(e,a),a=e,e=e.return;while(e);return t}catch(o){return`
-Error generating stack: `+o.message+`
-`+o.stack}}var In=Object.prototype.hasOwnProperty,ba=i.unstable_scheduleCallback,ut=i.unstable_cancelCallback,Xa=i.unstable_shouldYield,ts=i.unstable_requestPaint,Pt=i.unstable_now,Yt=i.unstable_getCurrentPriorityLevel,Za=i.unstable_ImmediatePriority,yt=i.unstable_UserBlockingPriority,xn=i.unstable_NormalPriority,Un=i.unstable_LowPriority,_a=i.unstable_IdlePriority,Yr=i.log,Rt=i.unstable_setDisableYieldValue,ns=null,Tt=null;function Nn(e){if(typeof Yr=="function"&&Rt(e),Tt&&typeof Tt.setStrictMode=="function")try{Tt.setStrictMode(ns,e)}catch{}}var qt=Math.clz32?Math.clz32:Re,as=Math.log,As=Math.LN2;function Re(e){return e>>>=0,e===0?32:31-(as(e)/As|0)|0}var Sa=256,vn=262144,yn=4194304;function Jt(e){var t=e&42;if(t!==0)return t;switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:return 128;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:return e&261888;case 262144:case 524288:case 1048576:case 2097152:return e&3932160;case 4194304:case 8388608:case 16777216:case 33554432:return e&62914560;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return e}}function Aa(e,t,a){var o=e.pendingLanes;if(o===0)return 0;var f=0,p=e.suspendedLanes,y=e.pingedLanes;e=e.warmLanes;var w=o&134217727;return w!==0?(o=w&~p,o!==0?f=Jt(o):(y&=w,y!==0?f=Jt(y):a||(a=w&~e,a!==0&&(f=Jt(a))))):(w=o&~p,w!==0?f=Jt(w):y!==0?f=Jt(y):a||(a=o&~e,a!==0&&(f=Jt(a)))),f===0?0:t!==0&&t!==f&&(t&p)===0&&(p=f&-f,a=t&-t,p>=a||p===32&&(a&4194048)!==0)?t:f}function Ta(e,t){return(e.pendingLanes&~(e.suspendedLanes&~e.pingedLanes)&t)===0}function Ka(e,t){switch(e){case 1:case 2:case 4:case 8:case 64:return t+250;case 16:case 32:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:return-1;case 67108864:case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function er(){var e=yn;return yn<<=1,(yn&62914560)===0&&(yn=4194304),e}function Ae(e){for(var t=[],a=0;31>a;a++)t.push(e);return t}function xe(e,t){e.pendingLanes|=t,t!==268435456&&(e.suspendedLanes=0,e.pingedLanes=0,e.warmLanes=0)}function $e(e,t,a,o,f,p){var y=e.pendingLanes;e.pendingLanes=a,e.suspendedLanes=0,e.pingedLanes=0,e.warmLanes=0,e.expiredLanes&=a,e.entangledLanes&=a,e.errorRecoveryDisabledLanes&=a,e.shellSuspendCounter=0;var w=e.entanglements,D=e.expirationTimes,q=e.hiddenUpdates;for(a=y&~a;0<a;){var ee=31-qt(a),ne=1<<ee;w[ee]=0,D[ee]=-1;var V=q[ee];if(V!==null)for(q[ee]=null,ee=0;ee<V.length;ee++){var X=V[ee];X!==null&&(X.lane&=-536870913)}a&=~ne}o!==0&&ie(e,o,0),p!==0&&f===0&&e.tag!==0&&(e.suspendedLanes|=p&~(y&~t))}function ie(e,t,a){e.pendingLanes|=t,e.suspendedLanes&=~t;var o=31-qt(t);e.entangledLanes|=t,e.entanglements[o]=e.entanglements[o]|1073741824|a&261930}function Te(e,t){var a=e.entangledLanes|=t;for(e=e.entanglements;a;){var o=31-qt(a),f=1<<o;f&t|e[o]&t&&(e[o]|=t),a&=~f}}function ve(e,t){var a=t&-t;return a=(a&42)!==0?1:Se(a),(a&(e.suspendedLanes|t))!==0?0:a}function Se(e){switch(e){case 2:e=1;break;case 8:e=4;break;case 32:e=16;break;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:e=128;break;case 268435456:e=134217728;break;default:e=0}return e}function Mt(e){return e&=-e,2<e?8<e?(e&134217727)!==0?32:268435456:8:2}function Oe(){var e=K.p;return e!==0?e:(e=window.event,e===void 0?32:Xx(e.type))}function bt(e,t){var a=K.p;try{return K.p=e,t()}finally{K.p=a}}var dt=Math.random().toString(36).slice(2),ze="__reactFiber$"+dt,Me="__reactProps$"+dt,Qe="__reactContainer$"+dt,jn="__reactEvents$"+dt,ht="__reactListeners$"+dt,En="__reactHandles$"+dt,Wn="__reactResources$"+dt,wt="__reactMarker$"+dt;function Lt(e){delete e[ze],delete e[Me],delete e[jn],delete e[ht],delete e[En]}function Nt(e){var t=e[ze];if(t)return t;for(var a=e.parentNode;a;){if(t=a[Qe]||a[ze]){if(a=t.alternate,t.child!==null||a!==null&&a.child!==null)for(e=zx(e);e!==null;){if(a=e[ze])return a;e=zx(e)}return t}e=a,a=e.parentNode}return null}function Hn(e){if(e=e[ze]||e[Qe]){var t=e.tag;if(t===5||t===6||t===13||t===31||t===26||t===27||t===3)return e}return null}function ss(e){var t=e.tag;if(t===5||t===26||t===27||t===6)return e.stateNode;throw Error(s(33))}function jt(e){var t=e[Wn];return t||(t=e[Wn]={hoistableStyles:new Map,hoistableScripts:new Map}),t}function Pe(e){e[wt]=!0}var ea=new Set,zi={};function rs(e,t){wa(e,t),wa(e+"Capture",t)}function wa(e,t){for(zi[e]=t,e=0;e<t.length;e++)ea.add(t[e])}var Na=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),tr={},qr={};function is(e){return In.call(qr,e)?!0:In.call(tr,e)?!1:Na.test(e)?qr[e]=!0:(tr[e]=!0,!1)}function Nc(e,t,a){if(is(t))if(a===null)e.removeAttribute(t);else{switch(typeof a){case"undefined":case"function":case"symbol":e.removeAttribute(t);return;case"boolean":var o=t.toLowerCase().slice(0,5);if(o!=="data-"&&o!=="aria-"){e.removeAttribute(t);return}}e.setAttribute(t,""+a)}}function jc(e,t,a){if(a===null)e.removeAttribute(t);else{switch(typeof a){case"undefined":case"function":case"symbol":case"boolean":e.removeAttribute(t);return}e.setAttribute(t,""+a)}}function Ts(e,t,a,o){if(o===null)e.removeAttribute(a);else{switch(typeof o){case"undefined":case"function":case"symbol":case"boolean":e.removeAttribute(a);return}e.setAttributeNS(t,a,""+o)}}function ja(e){switch(typeof e){case"bigint":case"boolean":case"number":case"string":case"undefined":return e;case"object":return e;default:return""}}function pg(e){var t=e.type;return(e=e.nodeName)&&e.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function z2(e,t,a){var o=Object.getOwnPropertyDescriptor(e.constructor.prototype,t);if(!e.hasOwnProperty(t)&&typeof o<"u"&&typeof o.get=="function"&&typeof o.set=="function"){var f=o.get,p=o.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return f.call(this)},set:function(y){a=""+y,p.call(this,y)}}),Object.defineProperty(e,t,{enumerable:o.enumerable}),{getValue:function(){return a},setValue:function(y){a=""+y},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}function Kf(e){if(!e._valueTracker){var t=pg(e)?"checked":"value";e._valueTracker=z2(e,t,""+e[t])}}function mg(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var a=t.getValue(),o="";return e&&(o=pg(e)?e.checked?"true":"false":e.value),e=o,e!==a?(t.setValue(e),!0):!1}function Ec(e){if(e=e||(typeof document<"u"?document:void 0),typeof e>"u")return null;try{return e.activeElement||e.body}catch{return e.body}}var R2=/[\n"\\]/g;function Ea(e){return e.replace(R2,function(t){return"\\"+t.charCodeAt(0).toString(16)+" "})}function Qf(e,t,a,o,f,p,y,w){e.name="",y!=null&&typeof y!="function"&&typeof y!="symbol"&&typeof y!="boolean"?e.type=y:e.removeAttribute("type"),t!=null?y==="number"?(t===0&&e.value===""||e.value!=t)&&(e.value=""+ja(t)):e.value!==""+ja(t)&&(e.value=""+ja(t)):y!=="submit"&&y!=="reset"||e.removeAttribute("value"),t!=null?$f(e,y,ja(t)):a!=null?$f(e,y,ja(a)):o!=null&&e.removeAttribute("value"),f==null&&p!=null&&(e.defaultChecked=!!p),f!=null&&(e.checked=f&&typeof f!="function"&&typeof f!="symbol"),w!=null&&typeof w!="function"&&typeof w!="symbol"&&typeof w!="boolean"?e.name=""+ja(w):e.removeAttribute("name")}function gg(e,t,a,o,f,p,y,w){if(p!=null&&typeof p!="function"&&typeof p!="symbol"&&typeof p!="boolean"&&(e.type=p),t!=null||a!=null){if(!(p!=="submit"&&p!=="reset"||t!=null)){Kf(e);return}a=a!=null?""+ja(a):"",t=t!=null?""+ja(t):a,w||t===e.value||(e.value=t),e.defaultValue=t}o=o??f,o=typeof o!="function"&&typeof o!="symbol"&&!!o,e.checked=w?e.checked:!!o,e.defaultChecked=!!o,y!=null&&typeof y!="function"&&typeof y!="symbol"&&typeof y!="boolean"&&(e.name=y),Kf(e)}function $f(e,t,a){t==="number"&&Ec(e.ownerDocument)===e||e.defaultValue===""+a||(e.defaultValue=""+a)}function Ri(e,t,a,o){if(e=e.options,t){t={};for(var f=0;f<a.length;f++)t["$"+a[f]]=!0;for(a=0;a<e.length;a++)f=t.hasOwnProperty("$"+e[a].value),e[a].selected!==f&&(e[a].selected=f),f&&o&&(e[a].defaultSelected=!0)}else{for(a=""+ja(a),t=null,f=0;f<e.length;f++){if(e[f].value===a){e[f].selected=!0,o&&(e[f].defaultSelected=!0);return}t!==null||e[f].disabled||(t=e[f])}t!==null&&(t.selected=!0)}}function xg(e,t,a){if(t!=null&&(t=""+ja(t),t!==e.value&&(e.value=t),a==null)){e.defaultValue!==t&&(e.defaultValue=t);return}e.defaultValue=a!=null?""+ja(a):""}function vg(e,t,a,o){if(t==null){if(o!=null){if(a!=null)throw Error(s(92));if(Q(o)){if(1<o.length)throw Error(s(93));o=o[0]}a=o}a==null&&(a=""),t=a}a=ja(t),e.defaultValue=a,o=e.textContent,o===a&&o!==""&&o!==null&&(e.value=o),Kf(e)}function Mi(e,t){if(t){var a=e.firstChild;if(a&&a===e.lastChild&&a.nodeType===3){a.nodeValue=t;return}}e.textContent=t}var M2=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function yg(e,t,a){var o=t.indexOf("--")===0;a==null||typeof a=="boolean"||a===""?o?e.setProperty(t,""):t==="float"?e.cssFloat="":e[t]="":o?e.setProperty(t,a):typeof a!="number"||a===0||M2.has(t)?t==="float"?e.cssFloat=a:e[t]=(""+a).trim():e[t]=a+"px"}function bg(e,t,a){if(t!=null&&typeof t!="object")throw Error(s(62));if(e=e.style,a!=null){for(var o in a)!a.hasOwnProperty(o)||t!=null&&t.hasOwnProperty(o)||(o.indexOf("--")===0?e.setProperty(o,""):o==="float"?e.cssFloat="":e[o]="");for(var f in t)o=t[f],t.hasOwnProperty(f)&&a[f]!==o&&yg(e,f,o)}else for(var p in t)t.hasOwnProperty(p)&&yg(e,p,t[p])}function Jf(e){if(e.indexOf("-")===-1)return!1;switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var D2=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),k2=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function Cc(e){return k2.test(""+e)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":e}function ws(){}var If=null;function Wf(e){return e=e.target||e.srcElement||window,e.correspondingUseElement&&(e=e.correspondingUseElement),e.nodeType===3?e.parentNode:e}var Di=null,ki=null;function _g(e){var t=Hn(e);if(t&&(e=t.stateNode)){var a=e[Me]||null;e:switch(e=t.stateNode,t.type){case"input":if(Qf(e,a.value,a.defaultValue,a.defaultValue,a.checked,a.defaultChecked,a.type,a.name),t=a.name,a.type==="radio"&&t!=null){for(a=e;a.parentNode;)a=a.parentNode;for(a=a.querySelectorAll('input[name="'+Ea(""+t)+'"][type="radio"]'),t=0;t<a.length;t++){var o=a[t];if(o!==e&&o.form===e.form){var f=o[Me]||null;if(!f)throw Error(s(90));Qf(o,f.value,f.defaultValue,f.defaultValue,f.checked,f.defaultChecked,f.type,f.name)}}for(t=0;t<a.length;t++)o=a[t],o.form===e.form&&mg(o)}break e;case"textarea":xg(e,a.value,a.defaultValue);break e;case"select":t=a.value,t!=null&&Ri(e,!!a.multiple,t,!1)}}}var ed=!1;function Sg(e,t,a){if(ed)return e(t,a);ed=!0;try{var o=e(t);return o}finally{if(ed=!1,(Di!==null||ki!==null)&&(gu(),Di&&(t=Di,e=ki,ki=Di=null,_g(t),e)))for(t=0;t<e.length;t++)_g(e[t])}}function Vl(e,t){var a=e.stateNode;if(a===null)return null;var o=a[Me]||null;if(o===null)return null;a=o[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(o=!o.disabled)||(e=e.type,o=!(e==="button"||e==="input"||e==="select"||e==="textarea")),e=!o;break e;default:e=!1}if(e)return null;if(a&&typeof a!="function")throw Error(s(231,t,typeof a));return a}var Ns=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),td=!1;if(Ns)try{var Xl={};Object.defineProperty(Xl,"passive",{get:function(){td=!0}}),window.addEventListener("test",Xl,Xl),window.removeEventListener("test",Xl,Xl)}catch{td=!1}var nr=null,nd=null,zc=null;function Ag(){if(zc)return zc;var e,t=nd,a=t.length,o,f="value"in nr?nr.value:nr.textContent,p=f.length;for(e=0;e<a&&t[e]===f[e];e++);var y=a-e;for(o=1;o<=y&&t[a-o]===f[p-o];o++);return zc=f.slice(e,1<o?1-o:void 0)}function Rc(e){var t=e.keyCode;return"charCode"in e?(e=e.charCode,e===0&&t===13&&(e=13)):e=t,e===10&&(e=13),32<=e||e===13?e:0}function Mc(){return!0}function Tg(){return!1}function Bn(e){function t(a,o,f,p,y){this._reactName=a,this._targetInst=f,this.type=o,this.nativeEvent=p,this.target=y,this.currentTarget=null;for(var w in e)e.hasOwnProperty(w)&&(a=e[w],this[w]=a?a(p):p[w]);return this.isDefaultPrevented=(p.defaultPrevented!=null?p.defaultPrevented:p.returnValue===!1)?Mc:Tg,this.isPropagationStopped=Tg,this}return v(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var a=this.nativeEvent;a&&(a.preventDefault?a.preventDefault():typeof a.returnValue!="unknown"&&(a.returnValue=!1),this.isDefaultPrevented=Mc)},stopPropagation:function(){var a=this.nativeEvent;a&&(a.stopPropagation?a.stopPropagation():typeof a.cancelBubble!="unknown"&&(a.cancelBubble=!0),this.isPropagationStopped=Mc)},persist:function(){},isPersistent:Mc}),t}var Gr={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},Dc=Bn(Gr),Zl=v({},Gr,{view:0,detail:0}),O2=Bn(Zl),ad,sd,Kl,kc=v({},Zl,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:id,button:0,buttons:0,relatedTarget:function(e){return e.relatedTarget===void 0?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==Kl&&(Kl&&e.type==="mousemove"?(ad=e.screenX-Kl.screenX,sd=e.screenY-Kl.screenY):sd=ad=0,Kl=e),ad)},movementY:function(e){return"movementY"in e?e.movementY:sd}}),wg=Bn(kc),P2=v({},kc,{dataTransfer:0}),L2=Bn(P2),U2=v({},Zl,{relatedTarget:0}),rd=Bn(U2),H2=v({},Gr,{animationName:0,elapsedTime:0,pseudoElement:0}),B2=Bn(H2),F2=v({},Gr,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),Y2=Bn(F2),q2=v({},Gr,{data:0}),Ng=Bn(q2),G2={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},V2={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},X2={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function Z2(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):(e=X2[e])?!!t[e]:!1}function id(){return Z2}var K2=v({},Zl,{key:function(e){if(e.key){var t=G2[e.key]||e.key;if(t!=="Unidentified")return t}return e.type==="keypress"?(e=Rc(e),e===13?"Enter":String.fromCharCode(e)):e.type==="keydown"||e.type==="keyup"?V2[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:id,charCode:function(e){return e.type==="keypress"?Rc(e):0},keyCode:function(e){return e.type==="keydown"||e.type==="keyup"?e.keyCode:0},which:function(e){return e.type==="keypress"?Rc(e):e.type==="keydown"||e.type==="keyup"?e.keyCode:0}}),Q2=Bn(K2),$2=v({},kc,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),jg=Bn($2),J2=v({},Zl,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:id}),I2=Bn(J2),W2=v({},Gr,{propertyName:0,elapsedTime:0,pseudoElement:0}),eS=Bn(W2),tS=v({},kc,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),nS=Bn(tS),aS=v({},Gr,{newState:0,oldState:0}),sS=Bn(aS),rS=[9,13,27,32],ld=Ns&&"CompositionEvent"in window,Ql=null;Ns&&"documentMode"in document&&(Ql=document.documentMode);var iS=Ns&&"TextEvent"in window&&!Ql,Eg=Ns&&(!ld||Ql&&8<Ql&&11>=Ql),Cg=" ",zg=!1;function Rg(e,t){switch(e){case"keyup":return rS.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Mg(e){return e=e.detail,typeof e=="object"&&"data"in e?e.data:null}var Oi=!1;function lS(e,t){switch(e){case"compositionend":return Mg(t);case"keypress":return t.which!==32?null:(zg=!0,Cg);case"textInput":return e=t.data,e===Cg&&zg?null:e;default:return null}}function oS(e,t){if(Oi)return e==="compositionend"||!ld&&Rg(e,t)?(e=Ag(),zc=nd=nr=null,Oi=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Eg&&t.locale!=="ko"?null:t.data;default:return null}}var cS={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Dg(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t==="input"?!!cS[e.type]:t==="textarea"}function kg(e,t,a,o){Di?ki?ki.push(o):ki=[o]:Di=o,t=Au(t,"onChange"),0<t.length&&(a=new Dc("onChange","change",null,a,o),e.push({event:a,listeners:t}))}var $l=null,Jl=null;function uS(e){gx(e,0)}function Oc(e){var t=ss(e);if(mg(t))return e}function Og(e,t){if(e==="change")return t}var Pg=!1;if(Ns){var od;if(Ns){var cd="oninput"in document;if(!cd){var Lg=document.createElement("div");Lg.setAttribute("oninput","return;"),cd=typeof Lg.oninput=="function"}od=cd}else od=!1;Pg=od&&(!document.documentMode||9<document.documentMode)}function Ug(){$l&&($l.detachEvent("onpropertychange",Hg),Jl=$l=null)}function Hg(e){if(e.propertyName==="value"&&Oc(Jl)){var t=[];kg(t,Jl,e,Wf(e)),Sg(uS,t)}}function fS(e,t,a){e==="focusin"?(Ug(),$l=t,Jl=a,$l.attachEvent("onpropertychange",Hg)):e==="focusout"&&Ug()}function dS(e){if(e==="selectionchange"||e==="keyup"||e==="keydown")return Oc(Jl)}function hS(e,t){if(e==="click")return Oc(t)}function pS(e,t){if(e==="input"||e==="change")return Oc(t)}function mS(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var ta=typeof Object.is=="function"?Object.is:mS;function Il(e,t){if(ta(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;var a=Object.keys(e),o=Object.keys(t);if(a.length!==o.length)return!1;for(o=0;o<a.length;o++){var f=a[o];if(!In.call(t,f)||!ta(e[f],t[f]))return!1}return!0}function Bg(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function Fg(e,t){var a=Bg(e);e=0;for(var o;a;){if(a.nodeType===3){if(o=e+a.textContent.length,e<=t&&o>=t)return{node:a,offset:t-e};e=o}e:{for(;a;){if(a.nextSibling){a=a.nextSibling;break e}a=a.parentNode}a=void 0}a=Bg(a)}}function Yg(e,t){return e&&t?e===t?!0:e&&e.nodeType===3?!1:t&&t.nodeType===3?Yg(e,t.parentNode):"contains"in e?e.contains(t):e.compareDocumentPosition?!!(e.compareDocumentPosition(t)&16):!1:!1}function qg(e){e=e!=null&&e.ownerDocument!=null&&e.ownerDocument.defaultView!=null?e.ownerDocument.defaultView:window;for(var t=Ec(e.document);t instanceof e.HTMLIFrameElement;){try{var a=typeof t.contentWindow.location.href=="string"}catch{a=!1}if(a)e=t.contentWindow;else break;t=Ec(e.document)}return t}function ud(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&(t==="input"&&(e.type==="text"||e.type==="search"||e.type==="tel"||e.type==="url"||e.type==="password")||t==="textarea"||e.contentEditable==="true")}var gS=Ns&&"documentMode"in document&&11>=document.documentMode,Pi=null,fd=null,Wl=null,dd=!1;function Gg(e,t,a){var o=a.window===a?a.document:a.nodeType===9?a:a.ownerDocument;dd||Pi==null||Pi!==Ec(o)||(o=Pi,"selectionStart"in o&&ud(o)?o={start:o.selectionStart,end:o.selectionEnd}:(o=(o.ownerDocument&&o.ownerDocument.defaultView||window).getSelection(),o={anchorNode:o.anchorNode,anchorOffset:o.anchorOffset,focusNode:o.focusNode,focusOffset:o.focusOffset}),Wl&&Il(Wl,o)||(Wl=o,o=Au(fd,"onSelect"),0<o.length&&(t=new Dc("onSelect","select",null,t,a),e.push({event:t,listeners:o}),t.target=Pi)))}function Vr(e,t){var a={};return a[e.toLowerCase()]=t.toLowerCase(),a["Webkit"+e]="webkit"+t,a["Moz"+e]="moz"+t,a}var Li={animationend:Vr("Animation","AnimationEnd"),animationiteration:Vr("Animation","AnimationIteration"),animationstart:Vr("Animation","AnimationStart"),transitionrun:Vr("Transition","TransitionRun"),transitionstart:Vr("Transition","TransitionStart"),transitioncancel:Vr("Transition","TransitionCancel"),transitionend:Vr("Transition","TransitionEnd")},hd={},Vg={};Ns&&(Vg=document.createElement("div").style,"AnimationEvent"in window||(delete Li.animationend.animation,delete Li.animationiteration.animation,delete Li.animationstart.animation),"TransitionEvent"in window||delete Li.transitionend.transition);function Xr(e){if(hd[e])return hd[e];if(!Li[e])return e;var t=Li[e],a;for(a in t)if(t.hasOwnProperty(a)&&a in Vg)return hd[e]=t[a];return e}var Xg=Xr("animationend"),Zg=Xr("animationiteration"),Kg=Xr("animationstart"),xS=Xr("transitionrun"),vS=Xr("transitionstart"),yS=Xr("transitioncancel"),Qg=Xr("transitionend"),$g=new Map,pd="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");pd.push("scrollEnd");function Qa(e,t){$g.set(e,t),rs(t,[e])}var Pc=typeof reportError=="function"?reportError:function(e){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof e=="object"&&e!==null&&typeof e.message=="string"?String(e.message):String(e),error:e});if(!window.dispatchEvent(t))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",e);return}console.error(e)},Ca=[],Ui=0,md=0;function Lc(){for(var e=Ui,t=md=Ui=0;t<e;){var a=Ca[t];Ca[t++]=null;var o=Ca[t];Ca[t++]=null;var f=Ca[t];Ca[t++]=null;var p=Ca[t];if(Ca[t++]=null,o!==null&&f!==null){var y=o.pending;y===null?f.next=f:(f.next=y.next,y.next=f),o.pending=f}p!==0&&Jg(a,f,p)}}function Uc(e,t,a,o){Ca[Ui++]=e,Ca[Ui++]=t,Ca[Ui++]=a,Ca[Ui++]=o,md|=o,e.lanes|=o,e=e.alternate,e!==null&&(e.lanes|=o)}function gd(e,t,a,o){return Uc(e,t,a,o),Hc(e)}function Zr(e,t){return Uc(e,null,null,t),Hc(e)}function Jg(e,t,a){e.lanes|=a;var o=e.alternate;o!==null&&(o.lanes|=a);for(var f=!1,p=e.return;p!==null;)p.childLanes|=a,o=p.alternate,o!==null&&(o.childLanes|=a),p.tag===22&&(e=p.stateNode,e===null||e._visibility&1||(f=!0)),e=p,p=p.return;return e.tag===3?(p=e.stateNode,f&&t!==null&&(f=31-qt(a),e=p.hiddenUpdates,o=e[f],o===null?e[f]=[t]:o.push(t),t.lane=a|536870912),p):null}function Hc(e){if(50<So)throw So=0,wh=null,Error(s(185));for(var t=e.return;t!==null;)e=t,t=e.return;return e.tag===3?e.stateNode:null}var Hi={};function bS(e,t,a,o){this.tag=e,this.key=a,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=o,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function na(e,t,a,o){return new bS(e,t,a,o)}function xd(e){return e=e.prototype,!(!e||!e.isReactComponent)}function js(e,t){var a=e.alternate;return a===null?(a=na(e.tag,t,e.key,e.mode),a.elementType=e.elementType,a.type=e.type,a.stateNode=e.stateNode,a.alternate=e,e.alternate=a):(a.pendingProps=t,a.type=e.type,a.flags=0,a.subtreeFlags=0,a.deletions=null),a.flags=e.flags&65011712,a.childLanes=e.childLanes,a.lanes=e.lanes,a.child=e.child,a.memoizedProps=e.memoizedProps,a.memoizedState=e.memoizedState,a.updateQueue=e.updateQueue,t=e.dependencies,a.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},a.sibling=e.sibling,a.index=e.index,a.ref=e.ref,a.refCleanup=e.refCleanup,a}function Ig(e,t){e.flags&=65011714;var a=e.alternate;return a===null?(e.childLanes=0,e.lanes=t,e.child=null,e.subtreeFlags=0,e.memoizedProps=null,e.memoizedState=null,e.updateQueue=null,e.dependencies=null,e.stateNode=null):(e.childLanes=a.childLanes,e.lanes=a.lanes,e.child=a.child,e.subtreeFlags=0,e.deletions=null,e.memoizedProps=a.memoizedProps,e.memoizedState=a.memoizedState,e.updateQueue=a.updateQueue,e.type=a.type,t=a.dependencies,e.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext}),e}function Bc(e,t,a,o,f,p){var y=0;if(o=e,typeof e=="function")xd(e)&&(y=1);else if(typeof e=="string")y=w3(e,a,ae.current)?26:e==="html"||e==="head"||e==="body"?27:5;else e:switch(e){case G:return e=na(31,a,t,f),e.elementType=G,e.lanes=p,e;case _:return Kr(a.children,f,p,t);case T:y=8,f|=24;break;case j:return e=na(12,a,t,f|2),e.elementType=j,e.lanes=p,e;case O:return e=na(13,a,t,f),e.elementType=O,e.lanes=p,e;case P:return e=na(19,a,t,f),e.elementType=P,e.lanes=p,e;default:if(typeof e=="object"&&e!==null)switch(e.$$typeof){case M:y=10;break e;case E:y=9;break e;case R:y=11;break e;case z:y=14;break e;case C:y=16,o=null;break e}y=29,a=Error(s(130,e===null?"null":typeof e,"")),o=null}return t=na(y,a,t,f),t.elementType=e,t.type=o,t.lanes=p,t}function Kr(e,t,a,o){return e=na(7,e,o,t),e.lanes=a,e}function vd(e,t,a){return e=na(6,e,null,t),e.lanes=a,e}function Wg(e){var t=na(18,null,null,0);return t.stateNode=e,t}function yd(e,t,a){return t=na(4,e.children!==null?e.children:[],e.key,t),t.lanes=a,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}var e1=new WeakMap;function za(e,t){if(typeof e=="object"&&e!==null){var a=e1.get(e);return a!==void 0?a:(t={value:e,source:t,stack:gn(t)},e1.set(e,t),t)}return{value:e,source:t,stack:gn(t)}}var Bi=[],Fi=0,Fc=null,eo=0,Ra=[],Ma=0,ar=null,ls=1,os="";function Es(e,t){Bi[Fi++]=eo,Bi[Fi++]=Fc,Fc=e,eo=t}function t1(e,t,a){Ra[Ma++]=ls,Ra[Ma++]=os,Ra[Ma++]=ar,ar=e;var o=ls;e=os;var f=32-qt(o)-1;o&=~(1<<f),a+=1;var p=32-qt(t)+f;if(30<p){var y=f-f%5;p=(o&(1<<y)-1).toString(32),o>>=y,f-=y,ls=1<<32-qt(t)+f|a<<f|o,os=p+e}else ls=1<<p|a<<f|o,os=e}function bd(e){e.return!==null&&(Es(e,1),t1(e,1,0))}function _d(e){for(;e===Fc;)Fc=Bi[--Fi],Bi[Fi]=null,eo=Bi[--Fi],Bi[Fi]=null;for(;e===ar;)ar=Ra[--Ma],Ra[Ma]=null,os=Ra[--Ma],Ra[Ma]=null,ls=Ra[--Ma],Ra[Ma]=null}function n1(e,t){Ra[Ma++]=ls,Ra[Ma++]=os,Ra[Ma++]=ar,ls=t.id,os=t.overflow,ar=e}var cn=null,pt=null,Xe=!1,sr=null,Da=!1,Sd=Error(s(519));function rr(e){var t=Error(s(418,1<arguments.length&&arguments[1]!==void 0&&arguments[1]?"text":"HTML",""));throw to(za(t,e)),Sd}function a1(e){var t=e.stateNode,a=e.type,o=e.memoizedProps;switch(t[ze]=e,t[Me]=o,a){case"dialog":Fe("cancel",t),Fe("close",t);break;case"iframe":case"object":case"embed":Fe("load",t);break;case"video":case"audio":for(a=0;a<To.length;a++)Fe(To[a],t);break;case"source":Fe("error",t);break;case"img":case"image":case"link":Fe("error",t),Fe("load",t);break;case"details":Fe("toggle",t);break;case"input":Fe("invalid",t),gg(t,o.value,o.defaultValue,o.checked,o.defaultChecked,o.type,o.name,!0);break;case"select":Fe("invalid",t);break;case"textarea":Fe("invalid",t),vg(t,o.value,o.defaultValue,o.children)}a=o.children,typeof a!="string"&&typeof a!="number"&&typeof a!="bigint"||t.textContent===""+a||o.suppressHydrationWarning===!0||bx(t.textContent,a)?(o.popover!=null&&(Fe("beforetoggle",t),Fe("toggle",t)),o.onScroll!=null&&Fe("scroll",t),o.onScrollEnd!=null&&Fe("scrollend",t),o.onClick!=null&&(t.onclick=ws),t=!0):t=!1,t||rr(e,!0)}function s1(e){for(cn=e.return;cn;)switch(cn.tag){case 5:case 31:case 13:Da=!1;return;case 27:case 3:Da=!0;return;default:cn=cn.return}}function Yi(e){if(e!==cn)return!1;if(!Xe)return s1(e),Xe=!0,!1;var t=e.tag,a;if((a=t!==3&&t!==27)&&((a=t===5)&&(a=e.type,a=!(a!=="form"&&a!=="button")||Bh(e.type,e.memoizedProps)),a=!a),a&&pt&&rr(e),s1(e),t===13){if(e=e.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(s(317));pt=Cx(e)}else if(t===31){if(e=e.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(s(317));pt=Cx(e)}else t===27?(t=pt,yr(e.type)?(e=Vh,Vh=null,pt=e):pt=t):pt=cn?Oa(e.stateNode.nextSibling):null;return!0}function Qr(){pt=cn=null,Xe=!1}function Ad(){var e=sr;return e!==null&&(Gn===null?Gn=e:Gn.push.apply(Gn,e),sr=null),e}function to(e){sr===null?sr=[e]:sr.push(e)}var Td=k(null),$r=null,Cs=null;function ir(e,t,a){F(Td,t._currentValue),t._currentValue=a}function zs(e){e._currentValue=Td.current,I(Td)}function wd(e,t,a){for(;e!==null;){var o=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,o!==null&&(o.childLanes|=t)):o!==null&&(o.childLanes&t)!==t&&(o.childLanes|=t),e===a)break;e=e.return}}function Nd(e,t,a,o){var f=e.child;for(f!==null&&(f.return=e);f!==null;){var p=f.dependencies;if(p!==null){var y=f.child;p=p.firstContext;e:for(;p!==null;){var w=p;p=f;for(var D=0;D<t.length;D++)if(w.context===t[D]){p.lanes|=a,w=p.alternate,w!==null&&(w.lanes|=a),wd(p.return,a,e),o||(y=null);break e}p=w.next}}else if(f.tag===18){if(y=f.return,y===null)throw Error(s(341));y.lanes|=a,p=y.alternate,p!==null&&(p.lanes|=a),wd(y,a,e),y=null}else y=f.child;if(y!==null)y.return=f;else for(y=f;y!==null;){if(y===e){y=null;break}if(f=y.sibling,f!==null){f.return=y.return,y=f;break}y=y.return}f=y}}function qi(e,t,a,o){e=null;for(var f=t,p=!1;f!==null;){if(!p){if((f.flags&524288)!==0)p=!0;else if((f.flags&262144)!==0)break}if(f.tag===10){var y=f.alternate;if(y===null)throw Error(s(387));if(y=y.memoizedProps,y!==null){var w=f.type;ta(f.pendingProps.value,y.value)||(e!==null?e.push(w):e=[w])}}else if(f===oe.current){if(y=f.alternate,y===null)throw Error(s(387));y.memoizedState.memoizedState!==f.memoizedState.memoizedState&&(e!==null?e.push(Co):e=[Co])}f=f.return}e!==null&&Nd(t,e,a,o),t.flags|=262144}function Yc(e){for(e=e.firstContext;e!==null;){if(!ta(e.context._currentValue,e.memoizedValue))return!0;e=e.next}return!1}function Jr(e){$r=e,Cs=null,e=e.dependencies,e!==null&&(e.firstContext=null)}function un(e){return r1($r,e)}function qc(e,t){return $r===null&&Jr(e),r1(e,t)}function r1(e,t){var a=t._currentValue;if(t={context:t,memoizedValue:a,next:null},Cs===null){if(e===null)throw Error(s(308));Cs=t,e.dependencies={lanes:0,firstContext:t},e.flags|=524288}else Cs=Cs.next=t;return a}var _S=typeof AbortController<"u"?AbortController:function(){var e=[],t=this.signal={aborted:!1,addEventListener:function(a,o){e.push(o)}};this.abort=function(){t.aborted=!0,e.forEach(function(a){return a()})}},SS=i.unstable_scheduleCallback,AS=i.unstable_NormalPriority,Gt={$$typeof:M,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function jd(){return{controller:new _S,data:new Map,refCount:0}}function no(e){e.refCount--,e.refCount===0&&SS(AS,function(){e.controller.abort()})}var ao=null,Ed=0,Gi=0,Vi=null;function TS(e,t){if(ao===null){var a=ao=[];Ed=0,Gi=Rh(),Vi={status:"pending",value:void 0,then:function(o){a.push(o)}}}return Ed++,t.then(i1,i1),t}function i1(){if(--Ed===0&&ao!==null){Vi!==null&&(Vi.status="fulfilled");var e=ao;ao=null,Gi=0,Vi=null;for(var t=0;t<e.length;t++)(0,e[t])()}}function wS(e,t){var a=[],o={status:"pending",value:null,reason:null,then:function(f){a.push(f)}};return e.then(function(){o.status="fulfilled",o.value=t;for(var f=0;f<a.length;f++)(0,a[f])(t)},function(f){for(o.status="rejected",o.reason=f,f=0;f<a.length;f++)(0,a[f])(void 0)}),o}var l1=H.S;H.S=function(e,t){G0=Pt(),typeof t=="object"&&t!==null&&typeof t.then=="function"&&TS(e,t),l1!==null&&l1(e,t)};var Ir=k(null);function Cd(){var e=Ir.current;return e!==null?e:lt.pooledCache}function Gc(e,t){t===null?F(Ir,Ir.current):F(Ir,t.pool)}function o1(){var e=Cd();return e===null?null:{parent:Gt._currentValue,pool:e}}var Xi=Error(s(460)),zd=Error(s(474)),Vc=Error(s(542)),Xc={then:function(){}};function c1(e){return e=e.status,e==="fulfilled"||e==="rejected"}function u1(e,t,a){switch(a=e[a],a===void 0?e.push(t):a!==t&&(t.then(ws,ws),t=a),t.status){case"fulfilled":return t.value;case"rejected":throw e=t.reason,d1(e),e;default:if(typeof t.status=="string")t.then(ws,ws);else{if(e=lt,e!==null&&100<e.shellSuspendCounter)throw Error(s(482));e=t,e.status="pending",e.then(function(o){if(t.status==="pending"){var f=t;f.status="fulfilled",f.value=o}},function(o){if(t.status==="pending"){var f=t;f.status="rejected",f.reason=o}})}switch(t.status){case"fulfilled":return t.value;case"rejected":throw e=t.reason,d1(e),e}throw ei=t,Xi}}function Wr(e){try{var t=e._init;return t(e._payload)}catch(a){throw a!==null&&typeof a=="object"&&typeof a.then=="function"?(ei=a,Xi):a}}var ei=null;function f1(){if(ei===null)throw Error(s(459));var e=ei;return ei=null,e}function d1(e){if(e===Xi||e===Vc)throw Error(s(483))}var Zi=null,so=0;function Zc(e){var t=so;return so+=1,Zi===null&&(Zi=[]),u1(Zi,e,t)}function ro(e,t){t=t.props.ref,e.ref=t!==void 0?t:null}function Kc(e,t){throw t.$$typeof===S?Error(s(525)):(e=Object.prototype.toString.call(t),Error(s(31,e==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":e)))}function h1(e){function t(B,L){if(e){var Y=B.deletions;Y===null?(B.deletions=[L],B.flags|=16):Y.push(L)}}function a(B,L){if(!e)return null;for(;L!==null;)t(B,L),L=L.sibling;return null}function o(B){for(var L=new Map;B!==null;)B.key!==null?L.set(B.key,B):L.set(B.index,B),B=B.sibling;return L}function f(B,L){return B=js(B,L),B.index=0,B.sibling=null,B}function p(B,L,Y){return B.index=Y,e?(Y=B.alternate,Y!==null?(Y=Y.index,Y<L?(B.flags|=67108866,L):Y):(B.flags|=67108866,L)):(B.flags|=1048576,L)}function y(B){return e&&B.alternate===null&&(B.flags|=67108866),B}function w(B,L,Y,te){return L===null||L.tag!==6?(L=vd(Y,B.mode,te),L.return=B,L):(L=f(L,Y),L.return=B,L)}function D(B,L,Y,te){var ye=Y.type;return ye===_?ee(B,L,Y.props.children,te,Y.key):L!==null&&(L.elementType===ye||typeof ye=="object"&&ye!==null&&ye.$$typeof===C&&Wr(ye)===L.type)?(L=f(L,Y.props),ro(L,Y),L.return=B,L):(L=Bc(Y.type,Y.key,Y.props,null,B.mode,te),ro(L,Y),L.return=B,L)}function q(B,L,Y,te){return L===null||L.tag!==4||L.stateNode.containerInfo!==Y.containerInfo||L.stateNode.implementation!==Y.implementation?(L=yd(Y,B.mode,te),L.return=B,L):(L=f(L,Y.children||[]),L.return=B,L)}function ee(B,L,Y,te,ye){return L===null||L.tag!==7?(L=Kr(Y,B.mode,te,ye),L.return=B,L):(L=f(L,Y),L.return=B,L)}function ne(B,L,Y){if(typeof L=="string"&&L!==""||typeof L=="number"||typeof L=="bigint")return L=vd(""+L,B.mode,Y),L.return=B,L;if(typeof L=="object"&&L!==null){switch(L.$$typeof){case A:return Y=Bc(L.type,L.key,L.props,null,B.mode,Y),ro(Y,L),Y.return=B,Y;case N:return L=yd(L,B.mode,Y),L.return=B,L;case C:return L=Wr(L),ne(B,L,Y)}if(Q(L)||Z(L))return L=Kr(L,B.mode,Y,null),L.return=B,L;if(typeof L.then=="function")return ne(B,Zc(L),Y);if(L.$$typeof===M)return ne(B,qc(B,L),Y);Kc(B,L)}return null}function V(B,L,Y,te){var ye=L!==null?L.key:null;if(typeof Y=="string"&&Y!==""||typeof Y=="number"||typeof Y=="bigint")return ye!==null?null:w(B,L,""+Y,te);if(typeof Y=="object"&&Y!==null){switch(Y.$$typeof){case A:return Y.key===ye?D(B,L,Y,te):null;case N:return Y.key===ye?q(B,L,Y,te):null;case C:return Y=Wr(Y),V(B,L,Y,te)}if(Q(Y)||Z(Y))return ye!==null?null:ee(B,L,Y,te,null);if(typeof Y.then=="function")return V(B,L,Zc(Y),te);if(Y.$$typeof===M)return V(B,L,qc(B,Y),te);Kc(B,Y)}return null}function X(B,L,Y,te,ye){if(typeof te=="string"&&te!==""||typeof te=="number"||typeof te=="bigint")return B=B.get(Y)||null,w(L,B,""+te,ye);if(typeof te=="object"&&te!==null){switch(te.$$typeof){case A:return B=B.get(te.key===null?Y:te.key)||null,D(L,B,te,ye);case N:return B=B.get(te.key===null?Y:te.key)||null,q(L,B,te,ye);case C:return te=Wr(te),X(B,L,Y,te,ye)}if(Q(te)||Z(te))return B=B.get(Y)||null,ee(L,B,te,ye,null);if(typeof te.then=="function")return X(B,L,Y,Zc(te),ye);if(te.$$typeof===M)return X(B,L,Y,qc(L,te),ye);Kc(L,te)}return null}function ue(B,L,Y,te){for(var ye=null,Je=null,pe=L,Ce=L=0,Ve=null;pe!==null&&Ce<Y.length;Ce++){pe.index>Ce?(Ve=pe,pe=null):Ve=pe.sibling;var Ie=V(B,pe,Y[Ce],te);if(Ie===null){pe===null&&(pe=Ve);break}e&&pe&&Ie.alternate===null&&t(B,pe),L=p(Ie,L,Ce),Je===null?ye=Ie:Je.sibling=Ie,Je=Ie,pe=Ve}if(Ce===Y.length)return a(B,pe),Xe&&Es(B,Ce),ye;if(pe===null){for(;Ce<Y.length;Ce++)pe=ne(B,Y[Ce],te),pe!==null&&(L=p(pe,L,Ce),Je===null?ye=pe:Je.sibling=pe,Je=pe);return Xe&&Es(B,Ce),ye}for(pe=o(pe);Ce<Y.length;Ce++)Ve=X(pe,B,Ce,Y[Ce],te),Ve!==null&&(e&&Ve.alternate!==null&&pe.delete(Ve.key===null?Ce:Ve.key),L=p(Ve,L,Ce),Je===null?ye=Ve:Je.sibling=Ve,Je=Ve);return e&&pe.forEach(function(Tr){return t(B,Tr)}),Xe&&Es(B,Ce),ye}function be(B,L,Y,te){if(Y==null)throw Error(s(151));for(var ye=null,Je=null,pe=L,Ce=L=0,Ve=null,Ie=Y.next();pe!==null&&!Ie.done;Ce++,Ie=Y.next()){pe.index>Ce?(Ve=pe,pe=null):Ve=pe.sibling;var Tr=V(B,pe,Ie.value,te);if(Tr===null){pe===null&&(pe=Ve);break}e&&pe&&Tr.alternate===null&&t(B,pe),L=p(Tr,L,Ce),Je===null?ye=Tr:Je.sibling=Tr,Je=Tr,pe=Ve}if(Ie.done)return a(B,pe),Xe&&Es(B,Ce),ye;if(pe===null){for(;!Ie.done;Ce++,Ie=Y.next())Ie=ne(B,Ie.value,te),Ie!==null&&(L=p(Ie,L,Ce),Je===null?ye=Ie:Je.sibling=Ie,Je=Ie);return Xe&&Es(B,Ce),ye}for(pe=o(pe);!Ie.done;Ce++,Ie=Y.next())Ie=X(pe,B,Ce,Ie.value,te),Ie!==null&&(e&&Ie.alternate!==null&&pe.delete(Ie.key===null?Ce:Ie.key),L=p(Ie,L,Ce),Je===null?ye=Ie:Je.sibling=Ie,Je=Ie);return e&&pe.forEach(function(P3){return t(B,P3)}),Xe&&Es(B,Ce),ye}function it(B,L,Y,te){if(typeof Y=="object"&&Y!==null&&Y.type===_&&Y.key===null&&(Y=Y.props.children),typeof Y=="object"&&Y!==null){switch(Y.$$typeof){case A:e:{for(var ye=Y.key;L!==null;){if(L.key===ye){if(ye=Y.type,ye===_){if(L.tag===7){a(B,L.sibling),te=f(L,Y.props.children),te.return=B,B=te;break e}}else if(L.elementType===ye||typeof ye=="object"&&ye!==null&&ye.$$typeof===C&&Wr(ye)===L.type){a(B,L.sibling),te=f(L,Y.props),ro(te,Y),te.return=B,B=te;break e}a(B,L);break}else t(B,L);L=L.sibling}Y.type===_?(te=Kr(Y.props.children,B.mode,te,Y.key),te.return=B,B=te):(te=Bc(Y.type,Y.key,Y.props,null,B.mode,te),ro(te,Y),te.return=B,B=te)}return y(B);case N:e:{for(ye=Y.key;L!==null;){if(L.key===ye)if(L.tag===4&&L.stateNode.containerInfo===Y.containerInfo&&L.stateNode.implementation===Y.implementation){a(B,L.sibling),te=f(L,Y.children||[]),te.return=B,B=te;break e}else{a(B,L);break}else t(B,L);L=L.sibling}te=yd(Y,B.mode,te),te.return=B,B=te}return y(B);case C:return Y=Wr(Y),it(B,L,Y,te)}if(Q(Y))return ue(B,L,Y,te);if(Z(Y)){if(ye=Z(Y),typeof ye!="function")throw Error(s(150));return Y=ye.call(Y),be(B,L,Y,te)}if(typeof Y.then=="function")return it(B,L,Zc(Y),te);if(Y.$$typeof===M)return it(B,L,qc(B,Y),te);Kc(B,Y)}return typeof Y=="string"&&Y!==""||typeof Y=="number"||typeof Y=="bigint"?(Y=""+Y,L!==null&&L.tag===6?(a(B,L.sibling),te=f(L,Y),te.return=B,B=te):(a(B,L),te=vd(Y,B.mode,te),te.return=B,B=te),y(B)):a(B,L)}return function(B,L,Y,te){try{so=0;var ye=it(B,L,Y,te);return Zi=null,ye}catch(pe){if(pe===Xi||pe===Vc)throw pe;var Je=na(29,pe,null,B.mode);return Je.lanes=te,Je.return=B,Je}}}var ti=h1(!0),p1=h1(!1),lr=!1;function Rd(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function Md(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,callbacks:null})}function or(e){return{lane:e,tag:0,payload:null,callback:null,next:null}}function cr(e,t,a){var o=e.updateQueue;if(o===null)return null;if(o=o.shared,(We&2)!==0){var f=o.pending;return f===null?t.next=t:(t.next=f.next,f.next=t),o.pending=t,t=Hc(e),Jg(e,null,a),t}return Uc(e,o,t,a),Hc(e)}function io(e,t,a){if(t=t.updateQueue,t!==null&&(t=t.shared,(a&4194048)!==0)){var o=t.lanes;o&=e.pendingLanes,a|=o,t.lanes=a,Te(e,a)}}function Dd(e,t){var a=e.updateQueue,o=e.alternate;if(o!==null&&(o=o.updateQueue,a===o)){var f=null,p=null;if(a=a.firstBaseUpdate,a!==null){do{var y={lane:a.lane,tag:a.tag,payload:a.payload,callback:null,next:null};p===null?f=p=y:p=p.next=y,a=a.next}while(a!==null);p===null?f=p=t:p=p.next=t}else f=p=t;a={baseState:o.baseState,firstBaseUpdate:f,lastBaseUpdate:p,shared:o.shared,callbacks:o.callbacks},e.updateQueue=a;return}e=a.lastBaseUpdate,e===null?a.firstBaseUpdate=t:e.next=t,a.lastBaseUpdate=t}var kd=!1;function lo(){if(kd){var e=Vi;if(e!==null)throw e}}function oo(e,t,a,o){kd=!1;var f=e.updateQueue;lr=!1;var p=f.firstBaseUpdate,y=f.lastBaseUpdate,w=f.shared.pending;if(w!==null){f.shared.pending=null;var D=w,q=D.next;D.next=null,y===null?p=q:y.next=q,y=D;var ee=e.alternate;ee!==null&&(ee=ee.updateQueue,w=ee.lastBaseUpdate,w!==y&&(w===null?ee.firstBaseUpdate=q:w.next=q,ee.lastBaseUpdate=D))}if(p!==null){var ne=f.baseState;y=0,ee=q=D=null,w=p;do{var V=w.lane&-536870913,X=V!==w.lane;if(X?(Ge&V)===V:(o&V)===V){V!==0&&V===Gi&&(kd=!0),ee!==null&&(ee=ee.next={lane:0,tag:w.tag,payload:w.payload,callback:null,next:null});e:{var ue=e,be=w;V=t;var it=a;switch(be.tag){case 1:if(ue=be.payload,typeof ue=="function"){ne=ue.call(it,ne,V);break e}ne=ue;break e;case 3:ue.flags=ue.flags&-65537|128;case 0:if(ue=be.payload,V=typeof ue=="function"?ue.call(it,ne,V):ue,V==null)break e;ne=v({},ne,V);break e;case 2:lr=!0}}V=w.callback,V!==null&&(e.flags|=64,X&&(e.flags|=8192),X=f.callbacks,X===null?f.callbacks=[V]:X.push(V))}else X={lane:V,tag:w.tag,payload:w.payload,callback:w.callback,next:null},ee===null?(q=ee=X,D=ne):ee=ee.next=X,y|=V;if(w=w.next,w===null){if(w=f.shared.pending,w===null)break;X=w,w=X.next,X.next=null,f.lastBaseUpdate=X,f.shared.pending=null}}while(!0);ee===null&&(D=ne),f.baseState=D,f.firstBaseUpdate=q,f.lastBaseUpdate=ee,p===null&&(f.shared.lanes=0),pr|=y,e.lanes=y,e.memoizedState=ne}}function m1(e,t){if(typeof e!="function")throw Error(s(191,e));e.call(t)}function g1(e,t){var a=e.callbacks;if(a!==null)for(e.callbacks=null,e=0;e<a.length;e++)m1(a[e],t)}var Ki=k(null),Qc=k(0);function x1(e,t){e=Hs,F(Qc,e),F(Ki,t),Hs=e|t.baseLanes}function Od(){F(Qc,Hs),F(Ki,Ki.current)}function Pd(){Hs=Qc.current,I(Ki),I(Qc)}var aa=k(null),ka=null;function ur(e){var t=e.alternate;F(Ut,Ut.current&1),F(aa,e),ka===null&&(t===null||Ki.current!==null||t.memoizedState!==null)&&(ka=e)}function Ld(e){F(Ut,Ut.current),F(aa,e),ka===null&&(ka=e)}function v1(e){e.tag===22?(F(Ut,Ut.current),F(aa,e),ka===null&&(ka=e)):fr()}function fr(){F(Ut,Ut.current),F(aa,aa.current)}function sa(e){I(aa),ka===e&&(ka=null),I(Ut)}var Ut=k(0);function $c(e){for(var t=e;t!==null;){if(t.tag===13){var a=t.memoizedState;if(a!==null&&(a=a.dehydrated,a===null||qh(a)||Gh(a)))return t}else if(t.tag===19&&(t.memoizedProps.revealOrder==="forwards"||t.memoizedProps.revealOrder==="backwards"||t.memoizedProps.revealOrder==="unstable_legacy-backwards"||t.memoizedProps.revealOrder==="together")){if((t.flags&128)!==0)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var Rs=0,Ee=null,st=null,Vt=null,Jc=!1,Qi=!1,ni=!1,Ic=0,co=0,$i=null,NS=0;function Dt(){throw Error(s(321))}function Ud(e,t){if(t===null)return!1;for(var a=0;a<t.length&&a<e.length;a++)if(!ta(e[a],t[a]))return!1;return!0}function Hd(e,t,a,o,f,p){return Rs=p,Ee=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,H.H=e===null||e.memoizedState===null?t0:eh,ni=!1,p=a(o,f),ni=!1,Qi&&(p=b1(t,a,o,f)),y1(e),p}function y1(e){H.H=ho;var t=st!==null&&st.next!==null;if(Rs=0,Vt=st=Ee=null,Jc=!1,co=0,$i=null,t)throw Error(s(300));e===null||Xt||(e=e.dependencies,e!==null&&Yc(e)&&(Xt=!0))}function b1(e,t,a,o){Ee=e;var f=0;do{if(Qi&&($i=null),co=0,Qi=!1,25<=f)throw Error(s(301));if(f+=1,Vt=st=null,e.updateQueue!=null){var p=e.updateQueue;p.lastEffect=null,p.events=null,p.stores=null,p.memoCache!=null&&(p.memoCache.index=0)}H.H=n0,p=t(a,o)}while(Qi);return p}function jS(){var e=H.H,t=e.useState()[0];return t=typeof t.then=="function"?uo(t):t,e=e.useState()[0],(st!==null?st.memoizedState:null)!==e&&(Ee.flags|=1024),t}function Bd(){var e=Ic!==0;return Ic=0,e}function Fd(e,t,a){t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~a}function Yd(e){if(Jc){for(e=e.memoizedState;e!==null;){var t=e.queue;t!==null&&(t.pending=null),e=e.next}Jc=!1}Rs=0,Vt=st=Ee=null,Qi=!1,co=Ic=0,$i=null}function Cn(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return Vt===null?Ee.memoizedState=Vt=e:Vt=Vt.next=e,Vt}function Ht(){if(st===null){var e=Ee.alternate;e=e!==null?e.memoizedState:null}else e=st.next;var t=Vt===null?Ee.memoizedState:Vt.next;if(t!==null)Vt=t,st=e;else{if(e===null)throw Ee.alternate===null?Error(s(467)):Error(s(310));st=e,e={memoizedState:st.memoizedState,baseState:st.baseState,baseQueue:st.baseQueue,queue:st.queue,next:null},Vt===null?Ee.memoizedState=Vt=e:Vt=Vt.next=e}return Vt}function Wc(){return{lastEffect:null,events:null,stores:null,memoCache:null}}function uo(e){var t=co;return co+=1,$i===null&&($i=[]),e=u1($i,e,t),t=Ee,(Vt===null?t.memoizedState:Vt.next)===null&&(t=t.alternate,H.H=t===null||t.memoizedState===null?t0:eh),e}function eu(e){if(e!==null&&typeof e=="object"){if(typeof e.then=="function")return uo(e);if(e.$$typeof===M)return un(e)}throw Error(s(438,String(e)))}function qd(e){var t=null,a=Ee.updateQueue;if(a!==null&&(t=a.memoCache),t==null){var o=Ee.alternate;o!==null&&(o=o.updateQueue,o!==null&&(o=o.memoCache,o!=null&&(t={data:o.data.map(function(f){return f.slice()}),index:0})))}if(t==null&&(t={data:[],index:0}),a===null&&(a=Wc(),Ee.updateQueue=a),a.memoCache=t,a=t.data[t.index],a===void 0)for(a=t.data[t.index]=Array(e),o=0;o<e;o++)a[o]=W;return t.index++,a}function Ms(e,t){return typeof t=="function"?t(e):t}function tu(e){var t=Ht();return Gd(t,st,e)}function Gd(e,t,a){var o=e.queue;if(o===null)throw Error(s(311));o.lastRenderedReducer=a;var f=e.baseQueue,p=o.pending;if(p!==null){if(f!==null){var y=f.next;f.next=p.next,p.next=y}t.baseQueue=f=p,o.pending=null}if(p=e.baseState,f===null)e.memoizedState=p;else{t=f.next;var w=y=null,D=null,q=t,ee=!1;do{var ne=q.lane&-536870913;if(ne!==q.lane?(Ge&ne)===ne:(Rs&ne)===ne){var V=q.revertLane;if(V===0)D!==null&&(D=D.next={lane:0,revertLane:0,gesture:null,action:q.action,hasEagerState:q.hasEagerState,eagerState:q.eagerState,next:null}),ne===Gi&&(ee=!0);else if((Rs&V)===V){q=q.next,V===Gi&&(ee=!0);continue}else ne={lane:0,revertLane:q.revertLane,gesture:null,action:q.action,hasEagerState:q.hasEagerState,eagerState:q.eagerState,next:null},D===null?(w=D=ne,y=p):D=D.next=ne,Ee.lanes|=V,pr|=V;ne=q.action,ni&&a(p,ne),p=q.hasEagerState?q.eagerState:a(p,ne)}else V={lane:ne,revertLane:q.revertLane,gesture:q.gesture,action:q.action,hasEagerState:q.hasEagerState,eagerState:q.eagerState,next:null},D===null?(w=D=V,y=p):D=D.next=V,Ee.lanes|=ne,pr|=ne;q=q.next}while(q!==null&&q!==t);if(D===null?y=p:D.next=w,!ta(p,e.memoizedState)&&(Xt=!0,ee&&(a=Vi,a!==null)))throw a;e.memoizedState=p,e.baseState=y,e.baseQueue=D,o.lastRenderedState=p}return f===null&&(o.lanes=0),[e.memoizedState,o.dispatch]}function Vd(e){var t=Ht(),a=t.queue;if(a===null)throw Error(s(311));a.lastRenderedReducer=e;var o=a.dispatch,f=a.pending,p=t.memoizedState;if(f!==null){a.pending=null;var y=f=f.next;do p=e(p,y.action),y=y.next;while(y!==f);ta(p,t.memoizedState)||(Xt=!0),t.memoizedState=p,t.baseQueue===null&&(t.baseState=p),a.lastRenderedState=p}return[p,o]}function _1(e,t,a){var o=Ee,f=Ht(),p=Xe;if(p){if(a===void 0)throw Error(s(407));a=a()}else a=t();var y=!ta((st||f).memoizedState,a);if(y&&(f.memoizedState=a,Xt=!0),f=f.queue,Kd(T1.bind(null,o,f,e),[e]),f.getSnapshot!==t||y||Vt!==null&&Vt.memoizedState.tag&1){if(o.flags|=2048,Ji(9,{destroy:void 0},A1.bind(null,o,f,a,t),null),lt===null)throw Error(s(349));p||(Rs&127)!==0||S1(o,t,a)}return a}function S1(e,t,a){e.flags|=16384,e={getSnapshot:t,value:a},t=Ee.updateQueue,t===null?(t=Wc(),Ee.updateQueue=t,t.stores=[e]):(a=t.stores,a===null?t.stores=[e]:a.push(e))}function A1(e,t,a,o){t.value=a,t.getSnapshot=o,w1(t)&&N1(e)}function T1(e,t,a){return a(function(){w1(t)&&N1(e)})}function w1(e){var t=e.getSnapshot;e=e.value;try{var a=t();return!ta(e,a)}catch{return!0}}function N1(e){var t=Zr(e,2);t!==null&&Vn(t,e,2)}function Xd(e){var t=Cn();if(typeof e=="function"){var a=e;if(e=a(),ni){Nn(!0);try{a()}finally{Nn(!1)}}}return t.memoizedState=t.baseState=e,t.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:Ms,lastRenderedState:e},t}function j1(e,t,a,o){return e.baseState=a,Gd(e,st,typeof o=="function"?o:Ms)}function ES(e,t,a,o,f){if(su(e))throw Error(s(485));if(e=t.action,e!==null){var p={payload:f,action:e,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(y){p.listeners.push(y)}};H.T!==null?a(!0):p.isTransition=!1,o(p),a=t.pending,a===null?(p.next=t.pending=p,E1(t,p)):(p.next=a.next,t.pending=a.next=p)}}function E1(e,t){var a=t.action,o=t.payload,f=e.state;if(t.isTransition){var p=H.T,y={};H.T=y;try{var w=a(f,o),D=H.S;D!==null&&D(y,w),C1(e,t,w)}catch(q){Zd(e,t,q)}finally{p!==null&&y.types!==null&&(p.types=y.types),H.T=p}}else try{p=a(f,o),C1(e,t,p)}catch(q){Zd(e,t,q)}}function C1(e,t,a){a!==null&&typeof a=="object"&&typeof a.then=="function"?a.then(function(o){z1(e,t,o)},function(o){return Zd(e,t,o)}):z1(e,t,a)}function z1(e,t,a){t.status="fulfilled",t.value=a,R1(t),e.state=a,t=e.pending,t!==null&&(a=t.next,a===t?e.pending=null:(a=a.next,t.next=a,E1(e,a)))}function Zd(e,t,a){var o=e.pending;if(e.pending=null,o!==null){o=o.next;do t.status="rejected",t.reason=a,R1(t),t=t.next;while(t!==o)}e.action=null}function R1(e){e=e.listeners;for(var t=0;t<e.length;t++)(0,e[t])()}function M1(e,t){return t}function D1(e,t){if(Xe){var a=lt.formState;if(a!==null){e:{var o=Ee;if(Xe){if(pt){t:{for(var f=pt,p=Da;f.nodeType!==8;){if(!p){f=null;break t}if(f=Oa(f.nextSibling),f===null){f=null;break t}}p=f.data,f=p==="F!"||p==="F"?f:null}if(f){pt=Oa(f.nextSibling),o=f.data==="F!";break e}}rr(o)}o=!1}o&&(t=a[0])}}return a=Cn(),a.memoizedState=a.baseState=t,o={pending:null,lanes:0,dispatch:null,lastRenderedReducer:M1,lastRenderedState:t},a.queue=o,a=I1.bind(null,Ee,o),o.dispatch=a,o=Xd(!1),p=Wd.bind(null,Ee,!1,o.queue),o=Cn(),f={state:t,dispatch:null,action:e,pending:null},o.queue=f,a=ES.bind(null,Ee,f,p,a),f.dispatch=a,o.memoizedState=e,[t,a,!1]}function k1(e){var t=Ht();return O1(t,st,e)}function O1(e,t,a){if(t=Gd(e,t,M1)[0],e=tu(Ms)[0],typeof t=="object"&&t!==null&&typeof t.then=="function")try{var o=uo(t)}catch(y){throw y===Xi?Vc:y}else o=t;t=Ht();var f=t.queue,p=f.dispatch;return a!==t.memoizedState&&(Ee.flags|=2048,Ji(9,{destroy:void 0},CS.bind(null,f,a),null)),[o,p,e]}function CS(e,t){e.action=t}function P1(e){var t=Ht(),a=st;if(a!==null)return O1(t,a,e);Ht(),t=t.memoizedState,a=Ht();var o=a.queue.dispatch;return a.memoizedState=e,[t,o,!1]}function Ji(e,t,a,o){return e={tag:e,create:a,deps:o,inst:t,next:null},t=Ee.updateQueue,t===null&&(t=Wc(),Ee.updateQueue=t),a=t.lastEffect,a===null?t.lastEffect=e.next=e:(o=a.next,a.next=e,e.next=o,t.lastEffect=e),e}function L1(){return Ht().memoizedState}function nu(e,t,a,o){var f=Cn();Ee.flags|=e,f.memoizedState=Ji(1|t,{destroy:void 0},a,o===void 0?null:o)}function au(e,t,a,o){var f=Ht();o=o===void 0?null:o;var p=f.memoizedState.inst;st!==null&&o!==null&&Ud(o,st.memoizedState.deps)?f.memoizedState=Ji(t,p,a,o):(Ee.flags|=e,f.memoizedState=Ji(1|t,p,a,o))}function U1(e,t){nu(8390656,8,e,t)}function Kd(e,t){au(2048,8,e,t)}function zS(e){Ee.flags|=4;var t=Ee.updateQueue;if(t===null)t=Wc(),Ee.updateQueue=t,t.events=[e];else{var a=t.events;a===null?t.events=[e]:a.push(e)}}function H1(e){var t=Ht().memoizedState;return zS({ref:t,nextImpl:e}),function(){if((We&2)!==0)throw Error(s(440));return t.impl.apply(void 0,arguments)}}function B1(e,t){return au(4,2,e,t)}function F1(e,t){return au(4,4,e,t)}function Y1(e,t){if(typeof t=="function"){e=e();var a=t(e);return function(){typeof a=="function"?a():t(null)}}if(t!=null)return e=e(),t.current=e,function(){t.current=null}}function q1(e,t,a){a=a!=null?a.concat([e]):null,au(4,4,Y1.bind(null,t,e),a)}function Qd(){}function G1(e,t){var a=Ht();t=t===void 0?null:t;var o=a.memoizedState;return t!==null&&Ud(t,o[1])?o[0]:(a.memoizedState=[e,t],e)}function V1(e,t){var a=Ht();t=t===void 0?null:t;var o=a.memoizedState;if(t!==null&&Ud(t,o[1]))return o[0];if(o=e(),ni){Nn(!0);try{e()}finally{Nn(!1)}}return a.memoizedState=[o,t],o}function $d(e,t,a){return a===void 0||(Rs&1073741824)!==0&&(Ge&261930)===0?e.memoizedState=t:(e.memoizedState=a,e=X0(),Ee.lanes|=e,pr|=e,a)}function X1(e,t,a,o){return ta(a,t)?a:Ki.current!==null?(e=$d(e,a,o),ta(e,t)||(Xt=!0),e):(Rs&42)===0||(Rs&1073741824)!==0&&(Ge&261930)===0?(Xt=!0,e.memoizedState=a):(e=X0(),Ee.lanes|=e,pr|=e,t)}function Z1(e,t,a,o,f){var p=K.p;K.p=p!==0&&8>p?p:8;var y=H.T,w={};H.T=w,Wd(e,!1,t,a);try{var D=f(),q=H.S;if(q!==null&&q(w,D),D!==null&&typeof D=="object"&&typeof D.then=="function"){var ee=wS(D,o);fo(e,t,ee,la(e))}else fo(e,t,o,la(e))}catch(ne){fo(e,t,{then:function(){},status:"rejected",reason:ne},la())}finally{K.p=p,y!==null&&w.types!==null&&(y.types=w.types),H.T=y}}function RS(){}function Jd(e,t,a,o){if(e.tag!==5)throw Error(s(476));var f=K1(e).queue;Z1(e,f,t,J,a===null?RS:function(){return Q1(e),a(o)})}function K1(e){var t=e.memoizedState;if(t!==null)return t;t={memoizedState:J,baseState:J,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Ms,lastRenderedState:J},next:null};var a={};return t.next={memoizedState:a,baseState:a,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Ms,lastRenderedState:a},next:null},e.memoizedState=t,e=e.alternate,e!==null&&(e.memoizedState=t),t}function Q1(e){var t=K1(e);t.next===null&&(t=e.alternate.memoizedState),fo(e,t.next.queue,{},la())}function Id(){return un(Co)}function $1(){return Ht().memoizedState}function J1(){return Ht().memoizedState}function MS(e){for(var t=e.return;t!==null;){switch(t.tag){case 24:case 3:var a=la();e=or(a);var o=cr(t,e,a);o!==null&&(Vn(o,t,a),io(o,t,a)),t={cache:jd()},e.payload=t;return}t=t.return}}function DS(e,t,a){var o=la();a={lane:o,revertLane:0,gesture:null,action:a,hasEagerState:!1,eagerState:null,next:null},su(e)?W1(t,a):(a=gd(e,t,a,o),a!==null&&(Vn(a,e,o),e0(a,t,o)))}function I1(e,t,a){var o=la();fo(e,t,a,o)}function fo(e,t,a,o){var f={lane:o,revertLane:0,gesture:null,action:a,hasEagerState:!1,eagerState:null,next:null};if(su(e))W1(t,f);else{var p=e.alternate;if(e.lanes===0&&(p===null||p.lanes===0)&&(p=t.lastRenderedReducer,p!==null))try{var y=t.lastRenderedState,w=p(y,a);if(f.hasEagerState=!0,f.eagerState=w,ta(w,y))return Uc(e,t,f,0),lt===null&&Lc(),!1}catch{}if(a=gd(e,t,f,o),a!==null)return Vn(a,e,o),e0(a,t,o),!0}return!1}function Wd(e,t,a,o){if(o={lane:2,revertLane:Rh(),gesture:null,action:o,hasEagerState:!1,eagerState:null,next:null},su(e)){if(t)throw Error(s(479))}else t=gd(e,a,o,2),t!==null&&Vn(t,e,2)}function su(e){var t=e.alternate;return e===Ee||t!==null&&t===Ee}function W1(e,t){Qi=Jc=!0;var a=e.pending;a===null?t.next=t:(t.next=a.next,a.next=t),e.pending=t}function e0(e,t,a){if((a&4194048)!==0){var o=t.lanes;o&=e.pendingLanes,a|=o,t.lanes=a,Te(e,a)}}var ho={readContext:un,use:eu,useCallback:Dt,useContext:Dt,useEffect:Dt,useImperativeHandle:Dt,useLayoutEffect:Dt,useInsertionEffect:Dt,useMemo:Dt,useReducer:Dt,useRef:Dt,useState:Dt,useDebugValue:Dt,useDeferredValue:Dt,useTransition:Dt,useSyncExternalStore:Dt,useId:Dt,useHostTransitionStatus:Dt,useFormState:Dt,useActionState:Dt,useOptimistic:Dt,useMemoCache:Dt,useCacheRefresh:Dt};ho.useEffectEvent=Dt;var t0={readContext:un,use:eu,useCallback:function(e,t){return Cn().memoizedState=[e,t===void 0?null:t],e},useContext:un,useEffect:U1,useImperativeHandle:function(e,t,a){a=a!=null?a.concat([e]):null,nu(4194308,4,Y1.bind(null,t,e),a)},useLayoutEffect:function(e,t){return nu(4194308,4,e,t)},useInsertionEffect:function(e,t){nu(4,2,e,t)},useMemo:function(e,t){var a=Cn();t=t===void 0?null:t;var o=e();if(ni){Nn(!0);try{e()}finally{Nn(!1)}}return a.memoizedState=[o,t],o},useReducer:function(e,t,a){var o=Cn();if(a!==void 0){var f=a(t);if(ni){Nn(!0);try{a(t)}finally{Nn(!1)}}}else f=t;return o.memoizedState=o.baseState=f,e={pending:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:f},o.queue=e,e=e.dispatch=DS.bind(null,Ee,e),[o.memoizedState,e]},useRef:function(e){var t=Cn();return e={current:e},t.memoizedState=e},useState:function(e){e=Xd(e);var t=e.queue,a=I1.bind(null,Ee,t);return t.dispatch=a,[e.memoizedState,a]},useDebugValue:Qd,useDeferredValue:function(e,t){var a=Cn();return $d(a,e,t)},useTransition:function(){var e=Xd(!1);return e=Z1.bind(null,Ee,e.queue,!0,!1),Cn().memoizedState=e,[!1,e]},useSyncExternalStore:function(e,t,a){var o=Ee,f=Cn();if(Xe){if(a===void 0)throw Error(s(407));a=a()}else{if(a=t(),lt===null)throw Error(s(349));(Ge&127)!==0||S1(o,t,a)}f.memoizedState=a;var p={value:a,getSnapshot:t};return f.queue=p,U1(T1.bind(null,o,p,e),[e]),o.flags|=2048,Ji(9,{destroy:void 0},A1.bind(null,o,p,a,t),null),a},useId:function(){var e=Cn(),t=lt.identifierPrefix;if(Xe){var a=os,o=ls;a=(o&~(1<<32-qt(o)-1)).toString(32)+a,t="_"+t+"R_"+a,a=Ic++,0<a&&(t+="H"+a.toString(32)),t+="_"}else a=NS++,t="_"+t+"r_"+a.toString(32)+"_";return e.memoizedState=t},useHostTransitionStatus:Id,useFormState:D1,useActionState:D1,useOptimistic:function(e){var t=Cn();t.memoizedState=t.baseState=e;var a={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return t.queue=a,t=Wd.bind(null,Ee,!0,a),a.dispatch=t,[e,t]},useMemoCache:qd,useCacheRefresh:function(){return Cn().memoizedState=MS.bind(null,Ee)},useEffectEvent:function(e){var t=Cn(),a={impl:e};return t.memoizedState=a,function(){if((We&2)!==0)throw Error(s(440));return a.impl.apply(void 0,arguments)}}},eh={readContext:un,use:eu,useCallback:G1,useContext:un,useEffect:Kd,useImperativeHandle:q1,useInsertionEffect:B1,useLayoutEffect:F1,useMemo:V1,useReducer:tu,useRef:L1,useState:function(){return tu(Ms)},useDebugValue:Qd,useDeferredValue:function(e,t){var a=Ht();return X1(a,st.memoizedState,e,t)},useTransition:function(){var e=tu(Ms)[0],t=Ht().memoizedState;return[typeof e=="boolean"?e:uo(e),t]},useSyncExternalStore:_1,useId:$1,useHostTransitionStatus:Id,useFormState:k1,useActionState:k1,useOptimistic:function(e,t){var a=Ht();return j1(a,st,e,t)},useMemoCache:qd,useCacheRefresh:J1};eh.useEffectEvent=H1;var n0={readContext:un,use:eu,useCallback:G1,useContext:un,useEffect:Kd,useImperativeHandle:q1,useInsertionEffect:B1,useLayoutEffect:F1,useMemo:V1,useReducer:Vd,useRef:L1,useState:function(){return Vd(Ms)},useDebugValue:Qd,useDeferredValue:function(e,t){var a=Ht();return st===null?$d(a,e,t):X1(a,st.memoizedState,e,t)},useTransition:function(){var e=Vd(Ms)[0],t=Ht().memoizedState;return[typeof e=="boolean"?e:uo(e),t]},useSyncExternalStore:_1,useId:$1,useHostTransitionStatus:Id,useFormState:P1,useActionState:P1,useOptimistic:function(e,t){var a=Ht();return st!==null?j1(a,st,e,t):(a.baseState=e,[e,a.queue.dispatch])},useMemoCache:qd,useCacheRefresh:J1};n0.useEffectEvent=H1;function th(e,t,a,o){t=e.memoizedState,a=a(o,t),a=a==null?t:v({},t,a),e.memoizedState=a,e.lanes===0&&(e.updateQueue.baseState=a)}var nh={enqueueSetState:function(e,t,a){e=e._reactInternals;var o=la(),f=or(o);f.payload=t,a!=null&&(f.callback=a),t=cr(e,f,o),t!==null&&(Vn(t,e,o),io(t,e,o))},enqueueReplaceState:function(e,t,a){e=e._reactInternals;var o=la(),f=or(o);f.tag=1,f.payload=t,a!=null&&(f.callback=a),t=cr(e,f,o),t!==null&&(Vn(t,e,o),io(t,e,o))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var a=la(),o=or(a);o.tag=2,t!=null&&(o.callback=t),t=cr(e,o,a),t!==null&&(Vn(t,e,a),io(t,e,a))}};function a0(e,t,a,o,f,p,y){return e=e.stateNode,typeof e.shouldComponentUpdate=="function"?e.shouldComponentUpdate(o,p,y):t.prototype&&t.prototype.isPureReactComponent?!Il(a,o)||!Il(f,p):!0}function s0(e,t,a,o){e=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(a,o),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(a,o),t.state!==e&&nh.enqueueReplaceState(t,t.state,null)}function ai(e,t){var a=t;if("ref"in t){a={};for(var o in t)o!=="ref"&&(a[o]=t[o])}if(e=e.defaultProps){a===t&&(a=v({},a));for(var f in e)a[f]===void 0&&(a[f]=e[f])}return a}function r0(e){Pc(e)}function i0(e){console.error(e)}function l0(e){Pc(e)}function ru(e,t){try{var a=e.onUncaughtError;a(t.value,{componentStack:t.stack})}catch(o){setTimeout(function(){throw o})}}function o0(e,t,a){try{var o=e.onCaughtError;o(a.value,{componentStack:a.stack,errorBoundary:t.tag===1?t.stateNode:null})}catch(f){setTimeout(function(){throw f})}}function ah(e,t,a){return a=or(a),a.tag=3,a.payload={element:null},a.callback=function(){ru(e,t)},a}function c0(e){return e=or(e),e.tag=3,e}function u0(e,t,a,o){var f=a.type.getDerivedStateFromError;if(typeof f=="function"){var p=o.value;e.payload=function(){return f(p)},e.callback=function(){o0(t,a,o)}}var y=a.stateNode;y!==null&&typeof y.componentDidCatch=="function"&&(e.callback=function(){o0(t,a,o),typeof f!="function"&&(mr===null?mr=new Set([this]):mr.add(this));var w=o.stack;this.componentDidCatch(o.value,{componentStack:w!==null?w:""})})}function kS(e,t,a,o,f){if(a.flags|=32768,o!==null&&typeof o=="object"&&typeof o.then=="function"){if(t=a.alternate,t!==null&&qi(t,a,f,!0),a=aa.current,a!==null){switch(a.tag){case 31:case 13:return ka===null?xu():a.alternate===null&&kt===0&&(kt=3),a.flags&=-257,a.flags|=65536,a.lanes=f,o===Xc?a.flags|=16384:(t=a.updateQueue,t===null?a.updateQueue=new Set([o]):t.add(o),Eh(e,o,f)),!1;case 22:return a.flags|=65536,o===Xc?a.flags|=16384:(t=a.updateQueue,t===null?(t={transitions:null,markerInstances:null,retryQueue:new Set([o])},a.updateQueue=t):(a=t.retryQueue,a===null?t.retryQueue=new Set([o]):a.add(o)),Eh(e,o,f)),!1}throw Error(s(435,a.tag))}return Eh(e,o,f),xu(),!1}if(Xe)return t=aa.current,t!==null?((t.flags&65536)===0&&(t.flags|=256),t.flags|=65536,t.lanes=f,o!==Sd&&(e=Error(s(422),{cause:o}),to(za(e,a)))):(o!==Sd&&(t=Error(s(423),{cause:o}),to(za(t,a))),e=e.current.alternate,e.flags|=65536,f&=-f,e.lanes|=f,o=za(o,a),f=ah(e.stateNode,o,f),Dd(e,f),kt!==4&&(kt=2)),!1;var p=Error(s(520),{cause:o});if(p=za(p,a),_o===null?_o=[p]:_o.push(p),kt!==4&&(kt=2),t===null)return!0;o=za(o,a),a=t;do{switch(a.tag){case 3:return a.flags|=65536,e=f&-f,a.lanes|=e,e=ah(a.stateNode,o,e),Dd(a,e),!1;case 1:if(t=a.type,p=a.stateNode,(a.flags&128)===0&&(typeof t.getDerivedStateFromError=="function"||p!==null&&typeof p.componentDidCatch=="function"&&(mr===null||!mr.has(p))))return a.flags|=65536,f&=-f,a.lanes|=f,f=c0(f),u0(f,e,a,o),Dd(a,f),!1}a=a.return}while(a!==null);return!1}var sh=Error(s(461)),Xt=!1;function fn(e,t,a,o){t.child=e===null?p1(t,null,a,o):ti(t,e.child,a,o)}function f0(e,t,a,o,f){a=a.render;var p=t.ref;if("ref"in o){var y={};for(var w in o)w!=="ref"&&(y[w]=o[w])}else y=o;return Jr(t),o=Hd(e,t,a,y,p,f),w=Bd(),e!==null&&!Xt?(Fd(e,t,f),Ds(e,t,f)):(Xe&&w&&bd(t),t.flags|=1,fn(e,t,o,f),t.child)}function d0(e,t,a,o,f){if(e===null){var p=a.type;return typeof p=="function"&&!xd(p)&&p.defaultProps===void 0&&a.compare===null?(t.tag=15,t.type=p,h0(e,t,p,o,f)):(e=Bc(a.type,null,o,t,t.mode,f),e.ref=t.ref,e.return=t,t.child=e)}if(p=e.child,!dh(e,f)){var y=p.memoizedProps;if(a=a.compare,a=a!==null?a:Il,a(y,o)&&e.ref===t.ref)return Ds(e,t,f)}return t.flags|=1,e=js(p,o),e.ref=t.ref,e.return=t,t.child=e}function h0(e,t,a,o,f){if(e!==null){var p=e.memoizedProps;if(Il(p,o)&&e.ref===t.ref)if(Xt=!1,t.pendingProps=o=p,dh(e,f))(e.flags&131072)!==0&&(Xt=!0);else return t.lanes=e.lanes,Ds(e,t,f)}return rh(e,t,a,o,f)}function p0(e,t,a,o){var f=o.children,p=e!==null?e.memoizedState:null;if(e===null&&t.stateNode===null&&(t.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),o.mode==="hidden"){if((t.flags&128)!==0){if(p=p!==null?p.baseLanes|a:a,e!==null){for(o=t.child=e.child,f=0;o!==null;)f=f|o.lanes|o.childLanes,o=o.sibling;o=f&~p}else o=0,t.child=null;return m0(e,t,p,a,o)}if((a&536870912)!==0)t.memoizedState={baseLanes:0,cachePool:null},e!==null&&Gc(t,p!==null?p.cachePool:null),p!==null?x1(t,p):Od(),v1(t);else return o=t.lanes=536870912,m0(e,t,p!==null?p.baseLanes|a:a,a,o)}else p!==null?(Gc(t,p.cachePool),x1(t,p),fr(),t.memoizedState=null):(e!==null&&Gc(t,null),Od(),fr());return fn(e,t,f,a),t.child}function po(e,t){return e!==null&&e.tag===22||t.stateNode!==null||(t.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),t.sibling}function m0(e,t,a,o,f){var p=Cd();return p=p===null?null:{parent:Gt._currentValue,pool:p},t.memoizedState={baseLanes:a,cachePool:p},e!==null&&Gc(t,null),Od(),v1(t),e!==null&&qi(e,t,o,!0),t.childLanes=f,null}function iu(e,t){return t=ou({mode:t.mode,children:t.children},e.mode),t.ref=e.ref,e.child=t,t.return=e,t}function g0(e,t,a){return ti(t,e.child,null,a),e=iu(t,t.pendingProps),e.flags|=2,sa(t),t.memoizedState=null,e}function OS(e,t,a){var o=t.pendingProps,f=(t.flags&128)!==0;if(t.flags&=-129,e===null){if(Xe){if(o.mode==="hidden")return e=iu(t,o),t.lanes=536870912,po(null,e);if(Ld(t),(e=pt)?(e=Ex(e,Da),e=e!==null&&e.data==="&"?e:null,e!==null&&(t.memoizedState={dehydrated:e,treeContext:ar!==null?{id:ls,overflow:os}:null,retryLane:536870912,hydrationErrors:null},a=Wg(e),a.return=t,t.child=a,cn=t,pt=null)):e=null,e===null)throw rr(t);return t.lanes=536870912,null}return iu(t,o)}var p=e.memoizedState;if(p!==null){var y=p.dehydrated;if(Ld(t),f)if(t.flags&256)t.flags&=-257,t=g0(e,t,a);else if(t.memoizedState!==null)t.child=e.child,t.flags|=128,t=null;else throw Error(s(558));else if(Xt||qi(e,t,a,!1),f=(a&e.childLanes)!==0,Xt||f){if(o=lt,o!==null&&(y=ve(o,a),y!==0&&y!==p.retryLane))throw p.retryLane=y,Zr(e,y),Vn(o,e,y),sh;xu(),t=g0(e,t,a)}else e=p.treeContext,pt=Oa(y.nextSibling),cn=t,Xe=!0,sr=null,Da=!1,e!==null&&n1(t,e),t=iu(t,o),t.flags|=4096;return t}return e=js(e.child,{mode:o.mode,children:o.children}),e.ref=t.ref,t.child=e,e.return=t,e}function lu(e,t){var a=t.ref;if(a===null)e!==null&&e.ref!==null&&(t.flags|=4194816);else{if(typeof a!="function"&&typeof a!="object")throw Error(s(284));(e===null||e.ref!==a)&&(t.flags|=4194816)}}function rh(e,t,a,o,f){return Jr(t),a=Hd(e,t,a,o,void 0,f),o=Bd(),e!==null&&!Xt?(Fd(e,t,f),Ds(e,t,f)):(Xe&&o&&bd(t),t.flags|=1,fn(e,t,a,f),t.child)}function x0(e,t,a,o,f,p){return Jr(t),t.updateQueue=null,a=b1(t,o,a,f),y1(e),o=Bd(),e!==null&&!Xt?(Fd(e,t,p),Ds(e,t,p)):(Xe&&o&&bd(t),t.flags|=1,fn(e,t,a,p),t.child)}function v0(e,t,a,o,f){if(Jr(t),t.stateNode===null){var p=Hi,y=a.contextType;typeof y=="object"&&y!==null&&(p=un(y)),p=new a(o,p),t.memoizedState=p.state!==null&&p.state!==void 0?p.state:null,p.updater=nh,t.stateNode=p,p._reactInternals=t,p=t.stateNode,p.props=o,p.state=t.memoizedState,p.refs={},Rd(t),y=a.contextType,p.context=typeof y=="object"&&y!==null?un(y):Hi,p.state=t.memoizedState,y=a.getDerivedStateFromProps,typeof y=="function"&&(th(t,a,y,o),p.state=t.memoizedState),typeof a.getDerivedStateFromProps=="function"||typeof p.getSnapshotBeforeUpdate=="function"||typeof p.UNSAFE_componentWillMount!="function"&&typeof p.componentWillMount!="function"||(y=p.state,typeof p.componentWillMount=="function"&&p.componentWillMount(),typeof p.UNSAFE_componentWillMount=="function"&&p.UNSAFE_componentWillMount(),y!==p.state&&nh.enqueueReplaceState(p,p.state,null),oo(t,o,p,f),lo(),p.state=t.memoizedState),typeof p.componentDidMount=="function"&&(t.flags|=4194308),o=!0}else if(e===null){p=t.stateNode;var w=t.memoizedProps,D=ai(a,w);p.props=D;var q=p.context,ee=a.contextType;y=Hi,typeof ee=="object"&&ee!==null&&(y=un(ee));var ne=a.getDerivedStateFromProps;ee=typeof ne=="function"||typeof p.getSnapshotBeforeUpdate=="function",w=t.pendingProps!==w,ee||typeof p.UNSAFE_componentWillReceiveProps!="function"&&typeof p.componentWillReceiveProps!="function"||(w||q!==y)&&s0(t,p,o,y),lr=!1;var V=t.memoizedState;p.state=V,oo(t,o,p,f),lo(),q=t.memoizedState,w||V!==q||lr?(typeof ne=="function"&&(th(t,a,ne,o),q=t.memoizedState),(D=lr||a0(t,a,D,o,V,q,y))?(ee||typeof p.UNSAFE_componentWillMount!="function"&&typeof p.componentWillMount!="function"||(typeof p.componentWillMount=="function"&&p.componentWillMount(),typeof p.UNSAFE_componentWillMount=="function"&&p.UNSAFE_componentWillMount()),typeof p.componentDidMount=="function"&&(t.flags|=4194308)):(typeof p.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=o,t.memoizedState=q),p.props=o,p.state=q,p.context=y,o=D):(typeof p.componentDidMount=="function"&&(t.flags|=4194308),o=!1)}else{p=t.stateNode,Md(e,t),y=t.memoizedProps,ee=ai(a,y),p.props=ee,ne=t.pendingProps,V=p.context,q=a.contextType,D=Hi,typeof q=="object"&&q!==null&&(D=un(q)),w=a.getDerivedStateFromProps,(q=typeof w=="function"||typeof p.getSnapshotBeforeUpdate=="function")||typeof p.UNSAFE_componentWillReceiveProps!="function"&&typeof p.componentWillReceiveProps!="function"||(y!==ne||V!==D)&&s0(t,p,o,D),lr=!1,V=t.memoizedState,p.state=V,oo(t,o,p,f),lo();var X=t.memoizedState;y!==ne||V!==X||lr||e!==null&&e.dependencies!==null&&Yc(e.dependencies)?(typeof w=="function"&&(th(t,a,w,o),X=t.memoizedState),(ee=lr||a0(t,a,ee,o,V,X,D)||e!==null&&e.dependencies!==null&&Yc(e.dependencies))?(q||typeof p.UNSAFE_componentWillUpdate!="function"&&typeof p.componentWillUpdate!="function"||(typeof p.componentWillUpdate=="function"&&p.componentWillUpdate(o,X,D),typeof p.UNSAFE_componentWillUpdate=="function"&&p.UNSAFE_componentWillUpdate(o,X,D)),typeof p.componentDidUpdate=="function"&&(t.flags|=4),typeof p.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof p.componentDidUpdate!="function"||y===e.memoizedProps&&V===e.memoizedState||(t.flags|=4),typeof p.getSnapshotBeforeUpdate!="function"||y===e.memoizedProps&&V===e.memoizedState||(t.flags|=1024),t.memoizedProps=o,t.memoizedState=X),p.props=o,p.state=X,p.context=D,o=ee):(typeof p.componentDidUpdate!="function"||y===e.memoizedProps&&V===e.memoizedState||(t.flags|=4),typeof p.getSnapshotBeforeUpdate!="function"||y===e.memoizedProps&&V===e.memoizedState||(t.flags|=1024),o=!1)}return p=o,lu(e,t),o=(t.flags&128)!==0,p||o?(p=t.stateNode,a=o&&typeof a.getDerivedStateFromError!="function"?null:p.render(),t.flags|=1,e!==null&&o?(t.child=ti(t,e.child,null,f),t.child=ti(t,null,a,f)):fn(e,t,a,f),t.memoizedState=p.state,e=t.child):e=Ds(e,t,f),e}function y0(e,t,a,o){return Qr(),t.flags|=256,fn(e,t,a,o),t.child}var ih={dehydrated:null,treeContext:null,retryLane:0,hydrationErrors:null};function lh(e){return{baseLanes:e,cachePool:o1()}}function oh(e,t,a){return e=e!==null?e.childLanes&~a:0,t&&(e|=ia),e}function b0(e,t,a){var o=t.pendingProps,f=!1,p=(t.flags&128)!==0,y;if((y=p)||(y=e!==null&&e.memoizedState===null?!1:(Ut.current&2)!==0),y&&(f=!0,t.flags&=-129),y=(t.flags&32)!==0,t.flags&=-33,e===null){if(Xe){if(f?ur(t):fr(),(e=pt)?(e=Ex(e,Da),e=e!==null&&e.data!=="&"?e:null,e!==null&&(t.memoizedState={dehydrated:e,treeContext:ar!==null?{id:ls,overflow:os}:null,retryLane:536870912,hydrationErrors:null},a=Wg(e),a.return=t,t.child=a,cn=t,pt=null)):e=null,e===null)throw rr(t);return Gh(e)?t.lanes=32:t.lanes=536870912,null}var w=o.children;return o=o.fallback,f?(fr(),f=t.mode,w=ou({mode:"hidden",children:w},f),o=Kr(o,f,a,null),w.return=t,o.return=t,w.sibling=o,t.child=w,o=t.child,o.memoizedState=lh(a),o.childLanes=oh(e,y,a),t.memoizedState=ih,po(null,o)):(ur(t),ch(t,w))}var D=e.memoizedState;if(D!==null&&(w=D.dehydrated,w!==null)){if(p)t.flags&256?(ur(t),t.flags&=-257,t=uh(e,t,a)):t.memoizedState!==null?(fr(),t.child=e.child,t.flags|=128,t=null):(fr(),w=o.fallback,f=t.mode,o=ou({mode:"visible",children:o.children},f),w=Kr(w,f,a,null),w.flags|=2,o.return=t,w.return=t,o.sibling=w,t.child=o,ti(t,e.child,null,a),o=t.child,o.memoizedState=lh(a),o.childLanes=oh(e,y,a),t.memoizedState=ih,t=po(null,o));else if(ur(t),Gh(w)){if(y=w.nextSibling&&w.nextSibling.dataset,y)var q=y.dgst;y=q,o=Error(s(419)),o.stack="",o.digest=y,to({value:o,source:null,stack:null}),t=uh(e,t,a)}else if(Xt||qi(e,t,a,!1),y=(a&e.childLanes)!==0,Xt||y){if(y=lt,y!==null&&(o=ve(y,a),o!==0&&o!==D.retryLane))throw D.retryLane=o,Zr(e,o),Vn(y,e,o),sh;qh(w)||xu(),t=uh(e,t,a)}else qh(w)?(t.flags|=192,t.child=e.child,t=null):(e=D.treeContext,pt=Oa(w.nextSibling),cn=t,Xe=!0,sr=null,Da=!1,e!==null&&n1(t,e),t=ch(t,o.children),t.flags|=4096);return t}return f?(fr(),w=o.fallback,f=t.mode,D=e.child,q=D.sibling,o=js(D,{mode:"hidden",children:o.children}),o.subtreeFlags=D.subtreeFlags&65011712,q!==null?w=js(q,w):(w=Kr(w,f,a,null),w.flags|=2),w.return=t,o.return=t,o.sibling=w,t.child=o,po(null,o),o=t.child,w=e.child.memoizedState,w===null?w=lh(a):(f=w.cachePool,f!==null?(D=Gt._currentValue,f=f.parent!==D?{parent:D,pool:D}:f):f=o1(),w={baseLanes:w.baseLanes|a,cachePool:f}),o.memoizedState=w,o.childLanes=oh(e,y,a),t.memoizedState=ih,po(e.child,o)):(ur(t),a=e.child,e=a.sibling,a=js(a,{mode:"visible",children:o.children}),a.return=t,a.sibling=null,e!==null&&(y=t.deletions,y===null?(t.deletions=[e],t.flags|=16):y.push(e)),t.child=a,t.memoizedState=null,a)}function ch(e,t){return t=ou({mode:"visible",children:t},e.mode),t.return=e,e.child=t}function ou(e,t){return e=na(22,e,null,t),e.lanes=0,e}function uh(e,t,a){return ti(t,e.child,null,a),e=ch(t,t.pendingProps.children),e.flags|=2,t.memoizedState=null,e}function _0(e,t,a){e.lanes|=t;var o=e.alternate;o!==null&&(o.lanes|=t),wd(e.return,t,a)}function fh(e,t,a,o,f,p){var y=e.memoizedState;y===null?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:o,tail:a,tailMode:f,treeForkCount:p}:(y.isBackwards=t,y.rendering=null,y.renderingStartTime=0,y.last=o,y.tail=a,y.tailMode=f,y.treeForkCount=p)}function S0(e,t,a){var o=t.pendingProps,f=o.revealOrder,p=o.tail;o=o.children;var y=Ut.current,w=(y&2)!==0;if(w?(y=y&1|2,t.flags|=128):y&=1,F(Ut,y),fn(e,t,o,a),o=Xe?eo:0,!w&&e!==null&&(e.flags&128)!==0)e:for(e=t.child;e!==null;){if(e.tag===13)e.memoizedState!==null&&_0(e,a,t);else if(e.tag===19)_0(e,a,t);else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;e.sibling===null;){if(e.return===null||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}switch(f){case"forwards":for(a=t.child,f=null;a!==null;)e=a.alternate,e!==null&&$c(e)===null&&(f=a),a=a.sibling;a=f,a===null?(f=t.child,t.child=null):(f=a.sibling,a.sibling=null),fh(t,!1,f,a,p,o);break;case"backwards":case"unstable_legacy-backwards":for(a=null,f=t.child,t.child=null;f!==null;){if(e=f.alternate,e!==null&&$c(e)===null){t.child=f;break}e=f.sibling,f.sibling=a,a=f,f=e}fh(t,!0,a,null,p,o);break;case"together":fh(t,!1,null,null,void 0,o);break;default:t.memoizedState=null}return t.child}function Ds(e,t,a){if(e!==null&&(t.dependencies=e.dependencies),pr|=t.lanes,(a&t.childLanes)===0)if(e!==null){if(qi(e,t,a,!1),(a&t.childLanes)===0)return null}else return null;if(e!==null&&t.child!==e.child)throw Error(s(153));if(t.child!==null){for(e=t.child,a=js(e,e.pendingProps),t.child=a,a.return=t;e.sibling!==null;)e=e.sibling,a=a.sibling=js(e,e.pendingProps),a.return=t;a.sibling=null}return t.child}function dh(e,t){return(e.lanes&t)!==0?!0:(e=e.dependencies,!!(e!==null&&Yc(e)))}function PS(e,t,a){switch(t.tag){case 3:Ke(t,t.stateNode.containerInfo),ir(t,Gt,e.memoizedState.cache),Qr();break;case 27:case 5:$t(t);break;case 4:Ke(t,t.stateNode.containerInfo);break;case 10:ir(t,t.type,t.memoizedProps.value);break;case 31:if(t.memoizedState!==null)return t.flags|=128,Ld(t),null;break;case 13:var o=t.memoizedState;if(o!==null)return o.dehydrated!==null?(ur(t),t.flags|=128,null):(a&t.child.childLanes)!==0?b0(e,t,a):(ur(t),e=Ds(e,t,a),e!==null?e.sibling:null);ur(t);break;case 19:var f=(e.flags&128)!==0;if(o=(a&t.childLanes)!==0,o||(qi(e,t,a,!1),o=(a&t.childLanes)!==0),f){if(o)return S0(e,t,a);t.flags|=128}if(f=t.memoizedState,f!==null&&(f.rendering=null,f.tail=null,f.lastEffect=null),F(Ut,Ut.current),o)break;return null;case 22:return t.lanes=0,p0(e,t,a,t.pendingProps);case 24:ir(t,Gt,e.memoizedState.cache)}return Ds(e,t,a)}function A0(e,t,a){if(e!==null)if(e.memoizedProps!==t.pendingProps)Xt=!0;else{if(!dh(e,a)&&(t.flags&128)===0)return Xt=!1,PS(e,t,a);Xt=(e.flags&131072)!==0}else Xt=!1,Xe&&(t.flags&1048576)!==0&&t1(t,eo,t.index);switch(t.lanes=0,t.tag){case 16:e:{var o=t.pendingProps;if(e=Wr(t.elementType),t.type=e,typeof e=="function")xd(e)?(o=ai(e,o),t.tag=1,t=v0(null,t,e,o,a)):(t.tag=0,t=rh(null,t,e,o,a));else{if(e!=null){var f=e.$$typeof;if(f===R){t.tag=11,t=f0(null,t,e,o,a);break e}else if(f===z){t.tag=14,t=d0(null,t,e,o,a);break e}}throw t=le(e)||e,Error(s(306,t,""))}}return t;case 0:return rh(e,t,t.type,t.pendingProps,a);case 1:return o=t.type,f=ai(o,t.pendingProps),v0(e,t,o,f,a);case 3:e:{if(Ke(t,t.stateNode.containerInfo),e===null)throw Error(s(387));o=t.pendingProps;var p=t.memoizedState;f=p.element,Md(e,t),oo(t,o,null,a);var y=t.memoizedState;if(o=y.cache,ir(t,Gt,o),o!==p.cache&&Nd(t,[Gt],a,!0),lo(),o=y.element,p.isDehydrated)if(p={element:o,isDehydrated:!1,cache:y.cache},t.updateQueue.baseState=p,t.memoizedState=p,t.flags&256){t=y0(e,t,o,a);break e}else if(o!==f){f=za(Error(s(424)),t),to(f),t=y0(e,t,o,a);break e}else for(e=t.stateNode.containerInfo,e.nodeType===9?e=e.body:e=e.nodeName==="HTML"?e.ownerDocument.body:e,pt=Oa(e.firstChild),cn=t,Xe=!0,sr=null,Da=!0,a=p1(t,null,o,a),t.child=a;a;)a.flags=a.flags&-3|4096,a=a.sibling;else{if(Qr(),o===f){t=Ds(e,t,a);break e}fn(e,t,o,a)}t=t.child}return t;case 26:return lu(e,t),e===null?(a=kx(t.type,null,t.pendingProps,null))?t.memoizedState=a:Xe||(a=t.type,e=t.pendingProps,o=Tu(ge.current).createElement(a),o[ze]=t,o[Me]=e,dn(o,a,e),Pe(o),t.stateNode=o):t.memoizedState=kx(t.type,e.memoizedProps,t.pendingProps,e.memoizedState),null;case 27:return $t(t),e===null&&Xe&&(o=t.stateNode=Rx(t.type,t.pendingProps,ge.current),cn=t,Da=!0,f=pt,yr(t.type)?(Vh=f,pt=Oa(o.firstChild)):pt=f),fn(e,t,t.pendingProps.children,a),lu(e,t),e===null&&(t.flags|=4194304),t.child;case 5:return e===null&&Xe&&((f=o=pt)&&(o=d3(o,t.type,t.pendingProps,Da),o!==null?(t.stateNode=o,cn=t,pt=Oa(o.firstChild),Da=!1,f=!0):f=!1),f||rr(t)),$t(t),f=t.type,p=t.pendingProps,y=e!==null?e.memoizedProps:null,o=p.children,Bh(f,p)?o=null:y!==null&&Bh(f,y)&&(t.flags|=32),t.memoizedState!==null&&(f=Hd(e,t,jS,null,null,a),Co._currentValue=f),lu(e,t),fn(e,t,o,a),t.child;case 6:return e===null&&Xe&&((e=a=pt)&&(a=h3(a,t.pendingProps,Da),a!==null?(t.stateNode=a,cn=t,pt=null,e=!0):e=!1),e||rr(t)),null;case 13:return b0(e,t,a);case 4:return Ke(t,t.stateNode.containerInfo),o=t.pendingProps,e===null?t.child=ti(t,null,o,a):fn(e,t,o,a),t.child;case 11:return f0(e,t,t.type,t.pendingProps,a);case 7:return fn(e,t,t.pendingProps,a),t.child;case 8:return fn(e,t,t.pendingProps.children,a),t.child;case 12:return fn(e,t,t.pendingProps.children,a),t.child;case 10:return o=t.pendingProps,ir(t,t.type,o.value),fn(e,t,o.children,a),t.child;case 9:return f=t.type._context,o=t.pendingProps.children,Jr(t),f=un(f),o=o(f),t.flags|=1,fn(e,t,o,a),t.child;case 14:return d0(e,t,t.type,t.pendingProps,a);case 15:return h0(e,t,t.type,t.pendingProps,a);case 19:return S0(e,t,a);case 31:return OS(e,t,a);case 22:return p0(e,t,a,t.pendingProps);case 24:return Jr(t),o=un(Gt),e===null?(f=Cd(),f===null&&(f=lt,p=jd(),f.pooledCache=p,p.refCount++,p!==null&&(f.pooledCacheLanes|=a),f=p),t.memoizedState={parent:o,cache:f},Rd(t),ir(t,Gt,f)):((e.lanes&a)!==0&&(Md(e,t),oo(t,null,null,a),lo()),f=e.memoizedState,p=t.memoizedState,f.parent!==o?(f={parent:o,cache:o},t.memoizedState=f,t.lanes===0&&(t.memoizedState=t.updateQueue.baseState=f),ir(t,Gt,o)):(o=p.cache,ir(t,Gt,o),o!==f.cache&&Nd(t,[Gt],a,!0))),fn(e,t,t.pendingProps.children,a),t.child;case 29:throw t.pendingProps}throw Error(s(156,t.tag))}function ks(e){e.flags|=4}function hh(e,t,a,o,f){if((t=(e.mode&32)!==0)&&(t=!1),t){if(e.flags|=16777216,(f&335544128)===f)if(e.stateNode.complete)e.flags|=8192;else if($0())e.flags|=8192;else throw ei=Xc,zd}else e.flags&=-16777217}function T0(e,t){if(t.type!=="stylesheet"||(t.state.loading&4)!==0)e.flags&=-16777217;else if(e.flags|=16777216,!Hx(t))if($0())e.flags|=8192;else throw ei=Xc,zd}function cu(e,t){t!==null&&(e.flags|=4),e.flags&16384&&(t=e.tag!==22?er():536870912,e.lanes|=t,tl|=t)}function mo(e,t){if(!Xe)switch(e.tailMode){case"hidden":t=e.tail;for(var a=null;t!==null;)t.alternate!==null&&(a=t),t=t.sibling;a===null?e.tail=null:a.sibling=null;break;case"collapsed":a=e.tail;for(var o=null;a!==null;)a.alternate!==null&&(o=a),a=a.sibling;o===null?t||e.tail===null?e.tail=null:e.tail.sibling=null:o.sibling=null}}function mt(e){var t=e.alternate!==null&&e.alternate.child===e.child,a=0,o=0;if(t)for(var f=e.child;f!==null;)a|=f.lanes|f.childLanes,o|=f.subtreeFlags&65011712,o|=f.flags&65011712,f.return=e,f=f.sibling;else for(f=e.child;f!==null;)a|=f.lanes|f.childLanes,o|=f.subtreeFlags,o|=f.flags,f.return=e,f=f.sibling;return e.subtreeFlags|=o,e.childLanes=a,t}function LS(e,t,a){var o=t.pendingProps;switch(_d(t),t.tag){case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return mt(t),null;case 1:return mt(t),null;case 3:return a=t.stateNode,o=null,e!==null&&(o=e.memoizedState.cache),t.memoizedState.cache!==o&&(t.flags|=2048),zs(Gt),Ne(),a.pendingContext&&(a.context=a.pendingContext,a.pendingContext=null),(e===null||e.child===null)&&(Yi(t)?ks(t):e===null||e.memoizedState.isDehydrated&&(t.flags&256)===0||(t.flags|=1024,Ad())),mt(t),null;case 26:var f=t.type,p=t.memoizedState;return e===null?(ks(t),p!==null?(mt(t),T0(t,p)):(mt(t),hh(t,f,null,o,a))):p?p!==e.memoizedState?(ks(t),mt(t),T0(t,p)):(mt(t),t.flags&=-16777217):(e=e.memoizedProps,e!==o&&ks(t),mt(t),hh(t,f,e,o,a)),null;case 27:if(xt(t),a=ge.current,f=t.type,e!==null&&t.stateNode!=null)e.memoizedProps!==o&&ks(t);else{if(!o){if(t.stateNode===null)throw Error(s(166));return mt(t),null}e=ae.current,Yi(t)?a1(t):(e=Rx(f,o,a),t.stateNode=e,ks(t))}return mt(t),null;case 5:if(xt(t),f=t.type,e!==null&&t.stateNode!=null)e.memoizedProps!==o&&ks(t);else{if(!o){if(t.stateNode===null)throw Error(s(166));return mt(t),null}if(p=ae.current,Yi(t))a1(t);else{var y=Tu(ge.current);switch(p){case 1:p=y.createElementNS("http://www.w3.org/2000/svg",f);break;case 2:p=y.createElementNS("http://www.w3.org/1998/Math/MathML",f);break;default:switch(f){case"svg":p=y.createElementNS("http://www.w3.org/2000/svg",f);break;case"math":p=y.createElementNS("http://www.w3.org/1998/Math/MathML",f);break;case"script":p=y.createElement("div"),p.innerHTML="<script><\/script>",p=p.removeChild(p.firstChild);break;case"select":p=typeof o.is=="string"?y.createElement("select",{is:o.is}):y.createElement("select"),o.multiple?p.multiple=!0:o.size&&(p.size=o.size);break;default:p=typeof o.is=="string"?y.createElement(f,{is:o.is}):y.createElement(f)}}p[ze]=t,p[Me]=o;e:for(y=t.child;y!==null;){if(y.tag===5||y.tag===6)p.appendChild(y.stateNode);else if(y.tag!==4&&y.tag!==27&&y.child!==null){y.child.return=y,y=y.child;continue}if(y===t)break e;for(;y.sibling===null;){if(y.return===null||y.return===t)break e;y=y.return}y.sibling.return=y.return,y=y.sibling}t.stateNode=p;e:switch(dn(p,f,o),f){case"button":case"input":case"select":case"textarea":o=!!o.autoFocus;break e;case"img":o=!0;break e;default:o=!1}o&&ks(t)}}return mt(t),hh(t,t.type,e===null?null:e.memoizedProps,t.pendingProps,a),null;case 6:if(e&&t.stateNode!=null)e.memoizedProps!==o&&ks(t);else{if(typeof o!="string"&&t.stateNode===null)throw Error(s(166));if(e=ge.current,Yi(t)){if(e=t.stateNode,a=t.memoizedProps,o=null,f=cn,f!==null)switch(f.tag){case 27:case 5:o=f.memoizedProps}e[ze]=t,e=!!(e.nodeValue===a||o!==null&&o.suppressHydrationWarning===!0||bx(e.nodeValue,a)),e||rr(t,!0)}else e=Tu(e).createTextNode(o),e[ze]=t,t.stateNode=e}return mt(t),null;case 31:if(a=t.memoizedState,e===null||e.memoizedState!==null){if(o=Yi(t),a!==null){if(e===null){if(!o)throw Error(s(318));if(e=t.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(s(557));e[ze]=t}else Qr(),(t.flags&128)===0&&(t.memoizedState=null),t.flags|=4;mt(t),e=!1}else a=Ad(),e!==null&&e.memoizedState!==null&&(e.memoizedState.hydrationErrors=a),e=!0;if(!e)return t.flags&256?(sa(t),t):(sa(t),null);if((t.flags&128)!==0)throw Error(s(558))}return mt(t),null;case 13:if(o=t.memoizedState,e===null||e.memoizedState!==null&&e.memoizedState.dehydrated!==null){if(f=Yi(t),o!==null&&o.dehydrated!==null){if(e===null){if(!f)throw Error(s(318));if(f=t.memoizedState,f=f!==null?f.dehydrated:null,!f)throw Error(s(317));f[ze]=t}else Qr(),(t.flags&128)===0&&(t.memoizedState=null),t.flags|=4;mt(t),f=!1}else f=Ad(),e!==null&&e.memoizedState!==null&&(e.memoizedState.hydrationErrors=f),f=!0;if(!f)return t.flags&256?(sa(t),t):(sa(t),null)}return sa(t),(t.flags&128)!==0?(t.lanes=a,t):(a=o!==null,e=e!==null&&e.memoizedState!==null,a&&(o=t.child,f=null,o.alternate!==null&&o.alternate.memoizedState!==null&&o.alternate.memoizedState.cachePool!==null&&(f=o.alternate.memoizedState.cachePool.pool),p=null,o.memoizedState!==null&&o.memoizedState.cachePool!==null&&(p=o.memoizedState.cachePool.pool),p!==f&&(o.flags|=2048)),a!==e&&a&&(t.child.flags|=8192),cu(t,t.updateQueue),mt(t),null);case 4:return Ne(),e===null&&Oh(t.stateNode.containerInfo),mt(t),null;case 10:return zs(t.type),mt(t),null;case 19:if(I(Ut),o=t.memoizedState,o===null)return mt(t),null;if(f=(t.flags&128)!==0,p=o.rendering,p===null)if(f)mo(o,!1);else{if(kt!==0||e!==null&&(e.flags&128)!==0)for(e=t.child;e!==null;){if(p=$c(e),p!==null){for(t.flags|=128,mo(o,!1),e=p.updateQueue,t.updateQueue=e,cu(t,e),t.subtreeFlags=0,e=a,a=t.child;a!==null;)Ig(a,e),a=a.sibling;return F(Ut,Ut.current&1|2),Xe&&Es(t,o.treeForkCount),t.child}e=e.sibling}o.tail!==null&&Pt()>pu&&(t.flags|=128,f=!0,mo(o,!1),t.lanes=4194304)}else{if(!f)if(e=$c(p),e!==null){if(t.flags|=128,f=!0,e=e.updateQueue,t.updateQueue=e,cu(t,e),mo(o,!0),o.tail===null&&o.tailMode==="hidden"&&!p.alternate&&!Xe)return mt(t),null}else 2*Pt()-o.renderingStartTime>pu&&a!==536870912&&(t.flags|=128,f=!0,mo(o,!1),t.lanes=4194304);o.isBackwards?(p.sibling=t.child,t.child=p):(e=o.last,e!==null?e.sibling=p:t.child=p,o.last=p)}return o.tail!==null?(e=o.tail,o.rendering=e,o.tail=e.sibling,o.renderingStartTime=Pt(),e.sibling=null,a=Ut.current,F(Ut,f?a&1|2:a&1),Xe&&Es(t,o.treeForkCount),e):(mt(t),null);case 22:case 23:return sa(t),Pd(),o=t.memoizedState!==null,e!==null?e.memoizedState!==null!==o&&(t.flags|=8192):o&&(t.flags|=8192),o?(a&536870912)!==0&&(t.flags&128)===0&&(mt(t),t.subtreeFlags&6&&(t.flags|=8192)):mt(t),a=t.updateQueue,a!==null&&cu(t,a.retryQueue),a=null,e!==null&&e.memoizedState!==null&&e.memoizedState.cachePool!==null&&(a=e.memoizedState.cachePool.pool),o=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(o=t.memoizedState.cachePool.pool),o!==a&&(t.flags|=2048),e!==null&&I(Ir),null;case 24:return a=null,e!==null&&(a=e.memoizedState.cache),t.memoizedState.cache!==a&&(t.flags|=2048),zs(Gt),mt(t),null;case 25:return null;case 30:return null}throw Error(s(156,t.tag))}function US(e,t){switch(_d(t),t.tag){case 1:return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 3:return zs(Gt),Ne(),e=t.flags,(e&65536)!==0&&(e&128)===0?(t.flags=e&-65537|128,t):null;case 26:case 27:case 5:return xt(t),null;case 31:if(t.memoizedState!==null){if(sa(t),t.alternate===null)throw Error(s(340));Qr()}return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 13:if(sa(t),e=t.memoizedState,e!==null&&e.dehydrated!==null){if(t.alternate===null)throw Error(s(340));Qr()}return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 19:return I(Ut),null;case 4:return Ne(),null;case 10:return zs(t.type),null;case 22:case 23:return sa(t),Pd(),e!==null&&I(Ir),e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 24:return zs(Gt),null;case 25:return null;default:return null}}function w0(e,t){switch(_d(t),t.tag){case 3:zs(Gt),Ne();break;case 26:case 27:case 5:xt(t);break;case 4:Ne();break;case 31:t.memoizedState!==null&&sa(t);break;case 13:sa(t);break;case 19:I(Ut);break;case 10:zs(t.type);break;case 22:case 23:sa(t),Pd(),e!==null&&I(Ir);break;case 24:zs(Gt)}}function go(e,t){try{var a=t.updateQueue,o=a!==null?a.lastEffect:null;if(o!==null){var f=o.next;a=f;do{if((a.tag&e)===e){o=void 0;var p=a.create,y=a.inst;o=p(),y.destroy=o}a=a.next}while(a!==f)}}catch(w){at(t,t.return,w)}}function dr(e,t,a){try{var o=t.updateQueue,f=o!==null?o.lastEffect:null;if(f!==null){var p=f.next;o=p;do{if((o.tag&e)===e){var y=o.inst,w=y.destroy;if(w!==void 0){y.destroy=void 0,f=t;var D=a,q=w;try{q()}catch(ee){at(f,D,ee)}}}o=o.next}while(o!==p)}}catch(ee){at(t,t.return,ee)}}function N0(e){var t=e.updateQueue;if(t!==null){var a=e.stateNode;try{g1(t,a)}catch(o){at(e,e.return,o)}}}function j0(e,t,a){a.props=ai(e.type,e.memoizedProps),a.state=e.memoizedState;try{a.componentWillUnmount()}catch(o){at(e,t,o)}}function xo(e,t){try{var a=e.ref;if(a!==null){switch(e.tag){case 26:case 27:case 5:var o=e.stateNode;break;case 30:o=e.stateNode;break;default:o=e.stateNode}typeof a=="function"?e.refCleanup=a(o):a.current=o}}catch(f){at(e,t,f)}}function cs(e,t){var a=e.ref,o=e.refCleanup;if(a!==null)if(typeof o=="function")try{o()}catch(f){at(e,t,f)}finally{e.refCleanup=null,e=e.alternate,e!=null&&(e.refCleanup=null)}else if(typeof a=="function")try{a(null)}catch(f){at(e,t,f)}else a.current=null}function E0(e){var t=e.type,a=e.memoizedProps,o=e.stateNode;try{e:switch(t){case"button":case"input":case"select":case"textarea":a.autoFocus&&o.focus();break e;case"img":a.src?o.src=a.src:a.srcSet&&(o.srcset=a.srcSet)}}catch(f){at(e,e.return,f)}}function ph(e,t,a){try{var o=e.stateNode;i3(o,e.type,a,t),o[Me]=t}catch(f){at(e,e.return,f)}}function C0(e){return e.tag===5||e.tag===3||e.tag===26||e.tag===27&&yr(e.type)||e.tag===4}function mh(e){e:for(;;){for(;e.sibling===null;){if(e.return===null||C0(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;e.tag!==5&&e.tag!==6&&e.tag!==18;){if(e.tag===27&&yr(e.type)||e.flags&2||e.child===null||e.tag===4)continue e;e.child.return=e,e=e.child}if(!(e.flags&2))return e.stateNode}}function gh(e,t,a){var o=e.tag;if(o===5||o===6)e=e.stateNode,t?(a.nodeType===9?a.body:a.nodeName==="HTML"?a.ownerDocument.body:a).insertBefore(e,t):(t=a.nodeType===9?a.body:a.nodeName==="HTML"?a.ownerDocument.body:a,t.appendChild(e),a=a._reactRootContainer,a!=null||t.onclick!==null||(t.onclick=ws));else if(o!==4&&(o===27&&yr(e.type)&&(a=e.stateNode,t=null),e=e.child,e!==null))for(gh(e,t,a),e=e.sibling;e!==null;)gh(e,t,a),e=e.sibling}function uu(e,t,a){var o=e.tag;if(o===5||o===6)e=e.stateNode,t?a.insertBefore(e,t):a.appendChild(e);else if(o!==4&&(o===27&&yr(e.type)&&(a=e.stateNode),e=e.child,e!==null))for(uu(e,t,a),e=e.sibling;e!==null;)uu(e,t,a),e=e.sibling}function z0(e){var t=e.stateNode,a=e.memoizedProps;try{for(var o=e.type,f=t.attributes;f.length;)t.removeAttributeNode(f[0]);dn(t,o,a),t[ze]=e,t[Me]=a}catch(p){at(e,e.return,p)}}var Os=!1,Zt=!1,xh=!1,R0=typeof WeakSet=="function"?WeakSet:Set,an=null;function HS(e,t){if(e=e.containerInfo,Uh=Ru,e=qg(e),ud(e)){if("selectionStart"in e)var a={start:e.selectionStart,end:e.selectionEnd};else e:{a=(a=e.ownerDocument)&&a.defaultView||window;var o=a.getSelection&&a.getSelection();if(o&&o.rangeCount!==0){a=o.anchorNode;var f=o.anchorOffset,p=o.focusNode;o=o.focusOffset;try{a.nodeType,p.nodeType}catch{a=null;break e}var y=0,w=-1,D=-1,q=0,ee=0,ne=e,V=null;t:for(;;){for(var X;ne!==a||f!==0&&ne.nodeType!==3||(w=y+f),ne!==p||o!==0&&ne.nodeType!==3||(D=y+o),ne.nodeType===3&&(y+=ne.nodeValue.length),(X=ne.firstChild)!==null;)V=ne,ne=X;for(;;){if(ne===e)break t;if(V===a&&++q===f&&(w=y),V===p&&++ee===o&&(D=y),(X=ne.nextSibling)!==null)break;ne=V,V=ne.parentNode}ne=X}a=w===-1||D===-1?null:{start:w,end:D}}else a=null}a=a||{start:0,end:0}}else a=null;for(Hh={focusedElem:e,selectionRange:a},Ru=!1,an=t;an!==null;)if(t=an,e=t.child,(t.subtreeFlags&1028)!==0&&e!==null)e.return=t,an=e;else for(;an!==null;){switch(t=an,p=t.alternate,e=t.flags,t.tag){case 0:if((e&4)!==0&&(e=t.updateQueue,e=e!==null?e.events:null,e!==null))for(a=0;a<e.length;a++)f=e[a],f.ref.impl=f.nextImpl;break;case 11:case 15:break;case 1:if((e&1024)!==0&&p!==null){e=void 0,a=t,f=p.memoizedProps,p=p.memoizedState,o=a.stateNode;try{var ue=ai(a.type,f);e=o.getSnapshotBeforeUpdate(ue,p),o.__reactInternalSnapshotBeforeUpdate=e}catch(be){at(a,a.return,be)}}break;case 3:if((e&1024)!==0){if(e=t.stateNode.containerInfo,a=e.nodeType,a===9)Yh(e);else if(a===1)switch(e.nodeName){case"HEAD":case"HTML":case"BODY":Yh(e);break;default:e.textContent=""}}break;case 5:case 26:case 27:case 6:case 4:case 17:break;default:if((e&1024)!==0)throw Error(s(163))}if(e=t.sibling,e!==null){e.return=t.return,an=e;break}an=t.return}}function M0(e,t,a){var o=a.flags;switch(a.tag){case 0:case 11:case 15:Ls(e,a),o&4&&go(5,a);break;case 1:if(Ls(e,a),o&4)if(e=a.stateNode,t===null)try{e.componentDidMount()}catch(y){at(a,a.return,y)}else{var f=ai(a.type,t.memoizedProps);t=t.memoizedState;try{e.componentDidUpdate(f,t,e.__reactInternalSnapshotBeforeUpdate)}catch(y){at(a,a.return,y)}}o&64&&N0(a),o&512&&xo(a,a.return);break;case 3:if(Ls(e,a),o&64&&(e=a.updateQueue,e!==null)){if(t=null,a.child!==null)switch(a.child.tag){case 27:case 5:t=a.child.stateNode;break;case 1:t=a.child.stateNode}try{g1(e,t)}catch(y){at(a,a.return,y)}}break;case 27:t===null&&o&4&&z0(a);case 26:case 5:Ls(e,a),t===null&&o&4&&E0(a),o&512&&xo(a,a.return);break;case 12:Ls(e,a);break;case 31:Ls(e,a),o&4&&O0(e,a);break;case 13:Ls(e,a),o&4&&P0(e,a),o&64&&(e=a.memoizedState,e!==null&&(e=e.dehydrated,e!==null&&(a=KS.bind(null,a),p3(e,a))));break;case 22:if(o=a.memoizedState!==null||Os,!o){t=t!==null&&t.memoizedState!==null||Zt,f=Os;var p=Zt;Os=o,(Zt=t)&&!p?Us(e,a,(a.subtreeFlags&8772)!==0):Ls(e,a),Os=f,Zt=p}break;case 30:break;default:Ls(e,a)}}function D0(e){var t=e.alternate;t!==null&&(e.alternate=null,D0(t)),e.child=null,e.deletions=null,e.sibling=null,e.tag===5&&(t=e.stateNode,t!==null&&Lt(t)),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}var _t=null,Fn=!1;function Ps(e,t,a){for(a=a.child;a!==null;)k0(e,t,a),a=a.sibling}function k0(e,t,a){if(Tt&&typeof Tt.onCommitFiberUnmount=="function")try{Tt.onCommitFiberUnmount(ns,a)}catch{}switch(a.tag){case 26:Zt||cs(a,t),Ps(e,t,a),a.memoizedState?a.memoizedState.count--:a.stateNode&&(a=a.stateNode,a.parentNode.removeChild(a));break;case 27:Zt||cs(a,t);var o=_t,f=Fn;yr(a.type)&&(_t=a.stateNode,Fn=!1),Ps(e,t,a),No(a.stateNode),_t=o,Fn=f;break;case 5:Zt||cs(a,t);case 6:if(o=_t,f=Fn,_t=null,Ps(e,t,a),_t=o,Fn=f,_t!==null)if(Fn)try{(_t.nodeType===9?_t.body:_t.nodeName==="HTML"?_t.ownerDocument.body:_t).removeChild(a.stateNode)}catch(p){at(a,t,p)}else try{_t.removeChild(a.stateNode)}catch(p){at(a,t,p)}break;case 18:_t!==null&&(Fn?(e=_t,Nx(e.nodeType===9?e.body:e.nodeName==="HTML"?e.ownerDocument.body:e,a.stateNode),cl(e)):Nx(_t,a.stateNode));break;case 4:o=_t,f=Fn,_t=a.stateNode.containerInfo,Fn=!0,Ps(e,t,a),_t=o,Fn=f;break;case 0:case 11:case 14:case 15:dr(2,a,t),Zt||dr(4,a,t),Ps(e,t,a);break;case 1:Zt||(cs(a,t),o=a.stateNode,typeof o.componentWillUnmount=="function"&&j0(a,t,o)),Ps(e,t,a);break;case 21:Ps(e,t,a);break;case 22:Zt=(o=Zt)||a.memoizedState!==null,Ps(e,t,a),Zt=o;break;default:Ps(e,t,a)}}function O0(e,t){if(t.memoizedState===null&&(e=t.alternate,e!==null&&(e=e.memoizedState,e!==null))){e=e.dehydrated;try{cl(e)}catch(a){at(t,t.return,a)}}}function P0(e,t){if(t.memoizedState===null&&(e=t.alternate,e!==null&&(e=e.memoizedState,e!==null&&(e=e.dehydrated,e!==null))))try{cl(e)}catch(a){at(t,t.return,a)}}function BS(e){switch(e.tag){case 31:case 13:case 19:var t=e.stateNode;return t===null&&(t=e.stateNode=new R0),t;case 22:return e=e.stateNode,t=e._retryCache,t===null&&(t=e._retryCache=new R0),t;default:throw Error(s(435,e.tag))}}function fu(e,t){var a=BS(e);t.forEach(function(o){if(!a.has(o)){a.add(o);var f=QS.bind(null,e,o);o.then(f,f)}})}function Yn(e,t){var a=t.deletions;if(a!==null)for(var o=0;o<a.length;o++){var f=a[o],p=e,y=t,w=y;e:for(;w!==null;){switch(w.tag){case 27:if(yr(w.type)){_t=w.stateNode,Fn=!1;break e}break;case 5:_t=w.stateNode,Fn=!1;break e;case 3:case 4:_t=w.stateNode.containerInfo,Fn=!0;break e}w=w.return}if(_t===null)throw Error(s(160));k0(p,y,f),_t=null,Fn=!1,p=f.alternate,p!==null&&(p.return=null),f.return=null}if(t.subtreeFlags&13886)for(t=t.child;t!==null;)L0(t,e),t=t.sibling}var $a=null;function L0(e,t){var a=e.alternate,o=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:Yn(t,e),qn(e),o&4&&(dr(3,e,e.return),go(3,e),dr(5,e,e.return));break;case 1:Yn(t,e),qn(e),o&512&&(Zt||a===null||cs(a,a.return)),o&64&&Os&&(e=e.updateQueue,e!==null&&(o=e.callbacks,o!==null&&(a=e.shared.hiddenCallbacks,e.shared.hiddenCallbacks=a===null?o:a.concat(o))));break;case 26:var f=$a;if(Yn(t,e),qn(e),o&512&&(Zt||a===null||cs(a,a.return)),o&4){var p=a!==null?a.memoizedState:null;if(o=e.memoizedState,a===null)if(o===null)if(e.stateNode===null){e:{o=e.type,a=e.memoizedProps,f=f.ownerDocument||f;t:switch(o){case"title":p=f.getElementsByTagName("title")[0],(!p||p[wt]||p[ze]||p.namespaceURI==="http://www.w3.org/2000/svg"||p.hasAttribute("itemprop"))&&(p=f.createElement(o),f.head.insertBefore(p,f.querySelector("head > title"))),dn(p,o,a),p[ze]=e,Pe(p),o=p;break e;case"link":var y=Lx("link","href",f).get(o+(a.href||""));if(y){for(var w=0;w<y.length;w++)if(p=y[w],p.getAttribute("href")===(a.href==null||a.href===""?null:a.href)&&p.getAttribute("rel")===(a.rel==null?null:a.rel)&&p.getAttribute("title")===(a.title==null?null:a.title)&&p.getAttribute("crossorigin")===(a.crossOrigin==null?null:a.crossOrigin)){y.splice(w,1);break t}}p=f.createElement(o),dn(p,o,a),f.head.appendChild(p);break;case"meta":if(y=Lx("meta","content",f).get(o+(a.content||""))){for(w=0;w<y.length;w++)if(p=y[w],p.getAttribute("content")===(a.content==null?null:""+a.content)&&p.getAttribute("name")===(a.name==null?null:a.name)&&p.getAttribute("property")===(a.property==null?null:a.property)&&p.getAttribute("http-equiv")===(a.httpEquiv==null?null:a.httpEquiv)&&p.getAttribute("charset")===(a.charSet==null?null:a.charSet)){y.splice(w,1);break t}}p=f.createElement(o),dn(p,o,a),f.head.appendChild(p);break;default:throw Error(s(468,o))}p[ze]=e,Pe(p),o=p}e.stateNode=o}else Ux(f,e.type,e.stateNode);else e.stateNode=Px(f,o,e.memoizedProps);else p!==o?(p===null?a.stateNode!==null&&(a=a.stateNode,a.parentNode.removeChild(a)):p.count--,o===null?Ux(f,e.type,e.stateNode):Px(f,o,e.memoizedProps)):o===null&&e.stateNode!==null&&ph(e,e.memoizedProps,a.memoizedProps)}break;case 27:Yn(t,e),qn(e),o&512&&(Zt||a===null||cs(a,a.return)),a!==null&&o&4&&ph(e,e.memoizedProps,a.memoizedProps);break;case 5:if(Yn(t,e),qn(e),o&512&&(Zt||a===null||cs(a,a.return)),e.flags&32){f=e.stateNode;try{Mi(f,"")}catch(ue){at(e,e.return,ue)}}o&4&&e.stateNode!=null&&(f=e.memoizedProps,ph(e,f,a!==null?a.memoizedProps:f)),o&1024&&(xh=!0);break;case 6:if(Yn(t,e),qn(e),o&4){if(e.stateNode===null)throw Error(s(162));o=e.memoizedProps,a=e.stateNode;try{a.nodeValue=o}catch(ue){at(e,e.return,ue)}}break;case 3:if(ju=null,f=$a,$a=wu(t.containerInfo),Yn(t,e),$a=f,qn(e),o&4&&a!==null&&a.memoizedState.isDehydrated)try{cl(t.containerInfo)}catch(ue){at(e,e.return,ue)}xh&&(xh=!1,U0(e));break;case 4:o=$a,$a=wu(e.stateNode.containerInfo),Yn(t,e),qn(e),$a=o;break;case 12:Yn(t,e),qn(e);break;case 31:Yn(t,e),qn(e),o&4&&(o=e.updateQueue,o!==null&&(e.updateQueue=null,fu(e,o)));break;case 13:Yn(t,e),qn(e),e.child.flags&8192&&e.memoizedState!==null!=(a!==null&&a.memoizedState!==null)&&(hu=Pt()),o&4&&(o=e.updateQueue,o!==null&&(e.updateQueue=null,fu(e,o)));break;case 22:f=e.memoizedState!==null;var D=a!==null&&a.memoizedState!==null,q=Os,ee=Zt;if(Os=q||f,Zt=ee||D,Yn(t,e),Zt=ee,Os=q,qn(e),o&8192)e:for(t=e.stateNode,t._visibility=f?t._visibility&-2:t._visibility|1,f&&(a===null||D||Os||Zt||si(e)),a=null,t=e;;){if(t.tag===5||t.tag===26){if(a===null){D=a=t;try{if(p=D.stateNode,f)y=p.style,typeof y.setProperty=="function"?y.setProperty("display","none","important"):y.display="none";else{w=D.stateNode;var ne=D.memoizedProps.style,V=ne!=null&&ne.hasOwnProperty("display")?ne.display:null;w.style.display=V==null||typeof V=="boolean"?"":(""+V).trim()}}catch(ue){at(D,D.return,ue)}}}else if(t.tag===6){if(a===null){D=t;try{D.stateNode.nodeValue=f?"":D.memoizedProps}catch(ue){at(D,D.return,ue)}}}else if(t.tag===18){if(a===null){D=t;try{var X=D.stateNode;f?jx(X,!0):jx(D.stateNode,!1)}catch(ue){at(D,D.return,ue)}}}else if((t.tag!==22&&t.tag!==23||t.memoizedState===null||t===e)&&t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break e;for(;t.sibling===null;){if(t.return===null||t.return===e)break e;a===t&&(a=null),t=t.return}a===t&&(a=null),t.sibling.return=t.return,t=t.sibling}o&4&&(o=e.updateQueue,o!==null&&(a=o.retryQueue,a!==null&&(o.retryQueue=null,fu(e,a))));break;case 19:Yn(t,e),qn(e),o&4&&(o=e.updateQueue,o!==null&&(e.updateQueue=null,fu(e,o)));break;case 30:break;case 21:break;default:Yn(t,e),qn(e)}}function qn(e){var t=e.flags;if(t&2){try{for(var a,o=e.return;o!==null;){if(C0(o)){a=o;break}o=o.return}if(a==null)throw Error(s(160));switch(a.tag){case 27:var f=a.stateNode,p=mh(e);uu(e,p,f);break;case 5:var y=a.stateNode;a.flags&32&&(Mi(y,""),a.flags&=-33);var w=mh(e);uu(e,w,y);break;case 3:case 4:var D=a.stateNode.containerInfo,q=mh(e);gh(e,q,D);break;default:throw Error(s(161))}}catch(ee){at(e,e.return,ee)}e.flags&=-3}t&4096&&(e.flags&=-4097)}function U0(e){if(e.subtreeFlags&1024)for(e=e.child;e!==null;){var t=e;U0(t),t.tag===5&&t.flags&1024&&t.stateNode.reset(),e=e.sibling}}function Ls(e,t){if(t.subtreeFlags&8772)for(t=t.child;t!==null;)M0(e,t.alternate,t),t=t.sibling}function si(e){for(e=e.child;e!==null;){var t=e;switch(t.tag){case 0:case 11:case 14:case 15:dr(4,t,t.return),si(t);break;case 1:cs(t,t.return);var a=t.stateNode;typeof a.componentWillUnmount=="function"&&j0(t,t.return,a),si(t);break;case 27:No(t.stateNode);case 26:case 5:cs(t,t.return),si(t);break;case 22:t.memoizedState===null&&si(t);break;case 30:si(t);break;default:si(t)}e=e.sibling}}function Us(e,t,a){for(a=a&&(t.subtreeFlags&8772)!==0,t=t.child;t!==null;){var o=t.alternate,f=e,p=t,y=p.flags;switch(p.tag){case 0:case 11:case 15:Us(f,p,a),go(4,p);break;case 1:if(Us(f,p,a),o=p,f=o.stateNode,typeof f.componentDidMount=="function")try{f.componentDidMount()}catch(q){at(o,o.return,q)}if(o=p,f=o.updateQueue,f!==null){var w=o.stateNode;try{var D=f.shared.hiddenCallbacks;if(D!==null)for(f.shared.hiddenCallbacks=null,f=0;f<D.length;f++)m1(D[f],w)}catch(q){at(o,o.return,q)}}a&&y&64&&N0(p),xo(p,p.return);break;case 27:z0(p);case 26:case 5:Us(f,p,a),a&&o===null&&y&4&&E0(p),xo(p,p.return);break;case 12:Us(f,p,a);break;case 31:Us(f,p,a),a&&y&4&&O0(f,p);break;case 13:Us(f,p,a),a&&y&4&&P0(f,p);break;case 22:p.memoizedState===null&&Us(f,p,a),xo(p,p.return);break;case 30:break;default:Us(f,p,a)}t=t.sibling}}function vh(e,t){var a=null;e!==null&&e.memoizedState!==null&&e.memoizedState.cachePool!==null&&(a=e.memoizedState.cachePool.pool),e=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(e=t.memoizedState.cachePool.pool),e!==a&&(e!=null&&e.refCount++,a!=null&&no(a))}function yh(e,t){e=null,t.alternate!==null&&(e=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==e&&(t.refCount++,e!=null&&no(e))}function Ja(e,t,a,o){if(t.subtreeFlags&10256)for(t=t.child;t!==null;)H0(e,t,a,o),t=t.sibling}function H0(e,t,a,o){var f=t.flags;switch(t.tag){case 0:case 11:case 15:Ja(e,t,a,o),f&2048&&go(9,t);break;case 1:Ja(e,t,a,o);break;case 3:Ja(e,t,a,o),f&2048&&(e=null,t.alternate!==null&&(e=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==e&&(t.refCount++,e!=null&&no(e)));break;case 12:if(f&2048){Ja(e,t,a,o),e=t.stateNode;try{var p=t.memoizedProps,y=p.id,w=p.onPostCommit;typeof w=="function"&&w(y,t.alternate===null?"mount":"update",e.passiveEffectDuration,-0)}catch(D){at(t,t.return,D)}}else Ja(e,t,a,o);break;case 31:Ja(e,t,a,o);break;case 13:Ja(e,t,a,o);break;case 23:break;case 22:p=t.stateNode,y=t.alternate,t.memoizedState!==null?p._visibility&2?Ja(e,t,a,o):vo(e,t):p._visibility&2?Ja(e,t,a,o):(p._visibility|=2,Ii(e,t,a,o,(t.subtreeFlags&10256)!==0||!1)),f&2048&&vh(y,t);break;case 24:Ja(e,t,a,o),f&2048&&yh(t.alternate,t);break;default:Ja(e,t,a,o)}}function Ii(e,t,a,o,f){for(f=f&&((t.subtreeFlags&10256)!==0||!1),t=t.child;t!==null;){var p=e,y=t,w=a,D=o,q=y.flags;switch(y.tag){case 0:case 11:case 15:Ii(p,y,w,D,f),go(8,y);break;case 23:break;case 22:var ee=y.stateNode;y.memoizedState!==null?ee._visibility&2?Ii(p,y,w,D,f):vo(p,y):(ee._visibility|=2,Ii(p,y,w,D,f)),f&&q&2048&&vh(y.alternate,y);break;case 24:Ii(p,y,w,D,f),f&&q&2048&&yh(y.alternate,y);break;default:Ii(p,y,w,D,f)}t=t.sibling}}function vo(e,t){if(t.subtreeFlags&10256)for(t=t.child;t!==null;){var a=e,o=t,f=o.flags;switch(o.tag){case 22:vo(a,o),f&2048&&vh(o.alternate,o);break;case 24:vo(a,o),f&2048&&yh(o.alternate,o);break;default:vo(a,o)}t=t.sibling}}var yo=8192;function Wi(e,t,a){if(e.subtreeFlags&yo)for(e=e.child;e!==null;)B0(e,t,a),e=e.sibling}function B0(e,t,a){switch(e.tag){case 26:Wi(e,t,a),e.flags&yo&&e.memoizedState!==null&&N3(a,$a,e.memoizedState,e.memoizedProps);break;case 5:Wi(e,t,a);break;case 3:case 4:var o=$a;$a=wu(e.stateNode.containerInfo),Wi(e,t,a),$a=o;break;case 22:e.memoizedState===null&&(o=e.alternate,o!==null&&o.memoizedState!==null?(o=yo,yo=16777216,Wi(e,t,a),yo=o):Wi(e,t,a));break;default:Wi(e,t,a)}}function F0(e){var t=e.alternate;if(t!==null&&(e=t.child,e!==null)){t.child=null;do t=e.sibling,e.sibling=null,e=t;while(e!==null)}}function bo(e){var t=e.deletions;if((e.flags&16)!==0){if(t!==null)for(var a=0;a<t.length;a++){var o=t[a];an=o,q0(o,e)}F0(e)}if(e.subtreeFlags&10256)for(e=e.child;e!==null;)Y0(e),e=e.sibling}function Y0(e){switch(e.tag){case 0:case 11:case 15:bo(e),e.flags&2048&&dr(9,e,e.return);break;case 3:bo(e);break;case 12:bo(e);break;case 22:var t=e.stateNode;e.memoizedState!==null&&t._visibility&2&&(e.return===null||e.return.tag!==13)?(t._visibility&=-3,du(e)):bo(e);break;default:bo(e)}}function du(e){var t=e.deletions;if((e.flags&16)!==0){if(t!==null)for(var a=0;a<t.length;a++){var o=t[a];an=o,q0(o,e)}F0(e)}for(e=e.child;e!==null;){switch(t=e,t.tag){case 0:case 11:case 15:dr(8,t,t.return),du(t);break;case 22:a=t.stateNode,a._visibility&2&&(a._visibility&=-3,du(t));break;default:du(t)}e=e.sibling}}function q0(e,t){for(;an!==null;){var a=an;switch(a.tag){case 0:case 11:case 15:dr(8,a,t);break;case 23:case 22:if(a.memoizedState!==null&&a.memoizedState.cachePool!==null){var o=a.memoizedState.cachePool.pool;o!=null&&o.refCount++}break;case 24:no(a.memoizedState.cache)}if(o=a.child,o!==null)o.return=a,an=o;else e:for(a=e;an!==null;){o=an;var f=o.sibling,p=o.return;if(D0(o),o===a){an=null;break e}if(f!==null){f.return=p,an=f;break e}an=p}}}var FS={getCacheForType:function(e){var t=un(Gt),a=t.data.get(e);return a===void 0&&(a=e(),t.data.set(e,a)),a},cacheSignal:function(){return un(Gt).controller.signal}},YS=typeof WeakMap=="function"?WeakMap:Map,We=0,lt=null,Be=null,Ge=0,nt=0,ra=null,hr=!1,el=!1,bh=!1,Hs=0,kt=0,pr=0,ri=0,_h=0,ia=0,tl=0,_o=null,Gn=null,Sh=!1,hu=0,G0=0,pu=1/0,mu=null,mr=null,It=0,gr=null,nl=null,Bs=0,Ah=0,Th=null,V0=null,So=0,wh=null;function la(){return(We&2)!==0&&Ge!==0?Ge&-Ge:H.T!==null?Rh():Oe()}function X0(){if(ia===0)if((Ge&536870912)===0||Xe){var e=vn;vn<<=1,(vn&3932160)===0&&(vn=262144),ia=e}else ia=536870912;return e=aa.current,e!==null&&(e.flags|=32),ia}function Vn(e,t,a){(e===lt&&(nt===2||nt===9)||e.cancelPendingCommit!==null)&&(al(e,0),xr(e,Ge,ia,!1)),xe(e,a),((We&2)===0||e!==lt)&&(e===lt&&((We&2)===0&&(ri|=a),kt===4&&xr(e,Ge,ia,!1)),us(e))}function Z0(e,t,a){if((We&6)!==0)throw Error(s(327));var o=!a&&(t&127)===0&&(t&e.expiredLanes)===0||Ta(e,t),f=o?VS(e,t):jh(e,t,!0),p=o;do{if(f===0){el&&!o&&xr(e,t,0,!1);break}else{if(a=e.current.alternate,p&&!qS(a)){f=jh(e,t,!1),p=!1;continue}if(f===2){if(p=t,e.errorRecoveryDisabledLanes&p)var y=0;else y=e.pendingLanes&-536870913,y=y!==0?y:y&536870912?536870912:0;if(y!==0){t=y;e:{var w=e;f=_o;var D=w.current.memoizedState.isDehydrated;if(D&&(al(w,y).flags|=256),y=jh(w,y,!1),y!==2){if(bh&&!D){w.errorRecoveryDisabledLanes|=p,ri|=p,f=4;break e}p=Gn,Gn=f,p!==null&&(Gn===null?Gn=p:Gn.push.apply(Gn,p))}f=y}if(p=!1,f!==2)continue}}if(f===1){al(e,0),xr(e,t,0,!0);break}e:{switch(o=e,p=f,p){case 0:case 1:throw Error(s(345));case 4:if((t&4194048)!==t)break;case 6:xr(o,t,ia,!hr);break e;case 2:Gn=null;break;case 3:case 5:break;default:throw Error(s(329))}if((t&62914560)===t&&(f=hu+300-Pt(),10<f)){if(xr(o,t,ia,!hr),Aa(o,0,!0)!==0)break e;Bs=t,o.timeoutHandle=Tx(K0.bind(null,o,a,Gn,mu,Sh,t,ia,ri,tl,hr,p,"Throttled",-0,0),f);break e}K0(o,a,Gn,mu,Sh,t,ia,ri,tl,hr,p,null,-0,0)}}break}while(!0);us(e)}function K0(e,t,a,o,f,p,y,w,D,q,ee,ne,V,X){if(e.timeoutHandle=-1,ne=t.subtreeFlags,ne&8192||(ne&16785408)===16785408){ne={stylesheets:null,count:0,imgCount:0,imgBytes:0,suspenseyImages:[],waitingForImages:!0,waitingForViewTransition:!1,unsuspend:ws},B0(t,p,ne);var ue=(p&62914560)===p?hu-Pt():(p&4194048)===p?G0-Pt():0;if(ue=j3(ne,ue),ue!==null){Bs=p,e.cancelPendingCommit=ue(nx.bind(null,e,t,p,a,o,f,y,w,D,ee,ne,null,V,X)),xr(e,p,y,!q);return}}nx(e,t,p,a,o,f,y,w,D)}function qS(e){for(var t=e;;){var a=t.tag;if((a===0||a===11||a===15)&&t.flags&16384&&(a=t.updateQueue,a!==null&&(a=a.stores,a!==null)))for(var o=0;o<a.length;o++){var f=a[o],p=f.getSnapshot;f=f.value;try{if(!ta(p(),f))return!1}catch{return!1}}if(a=t.child,t.subtreeFlags&16384&&a!==null)a.return=t,t=a;else{if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function xr(e,t,a,o){t&=~_h,t&=~ri,e.suspendedLanes|=t,e.pingedLanes&=~t,o&&(e.warmLanes|=t),o=e.expirationTimes;for(var f=t;0<f;){var p=31-qt(f),y=1<<p;o[p]=-1,f&=~y}a!==0&&ie(e,a,t)}function gu(){return(We&6)===0?(Ao(0),!1):!0}function Nh(){if(Be!==null){if(nt===0)var e=Be.return;else e=Be,Cs=$r=null,Yd(e),Zi=null,so=0,e=Be;for(;e!==null;)w0(e.alternate,e),e=e.return;Be=null}}function al(e,t){var a=e.timeoutHandle;a!==-1&&(e.timeoutHandle=-1,c3(a)),a=e.cancelPendingCommit,a!==null&&(e.cancelPendingCommit=null,a()),Bs=0,Nh(),lt=e,Be=a=js(e.current,null),Ge=t,nt=0,ra=null,hr=!1,el=Ta(e,t),bh=!1,tl=ia=_h=ri=pr=kt=0,Gn=_o=null,Sh=!1,(t&8)!==0&&(t|=t&32);var o=e.entangledLanes;if(o!==0)for(e=e.entanglements,o&=t;0<o;){var f=31-qt(o),p=1<<f;t|=e[f],o&=~p}return Hs=t,Lc(),a}function Q0(e,t){Ee=null,H.H=ho,t===Xi||t===Vc?(t=f1(),nt=3):t===zd?(t=f1(),nt=4):nt=t===sh?8:t!==null&&typeof t=="object"&&typeof t.then=="function"?6:1,ra=t,Be===null&&(kt=1,ru(e,za(t,e.current)))}function $0(){var e=aa.current;return e===null?!0:(Ge&4194048)===Ge?ka===null:(Ge&62914560)===Ge||(Ge&536870912)!==0?e===ka:!1}function J0(){var e=H.H;return H.H=ho,e===null?ho:e}function I0(){var e=H.A;return H.A=FS,e}function xu(){kt=4,hr||(Ge&4194048)!==Ge&&aa.current!==null||(el=!0),(pr&134217727)===0&&(ri&134217727)===0||lt===null||xr(lt,Ge,ia,!1)}function jh(e,t,a){var o=We;We|=2;var f=J0(),p=I0();(lt!==e||Ge!==t)&&(mu=null,al(e,t)),t=!1;var y=kt;e:do try{if(nt!==0&&Be!==null){var w=Be,D=ra;switch(nt){case 8:Nh(),y=6;break e;case 3:case 2:case 9:case 6:aa.current===null&&(t=!0);var q=nt;if(nt=0,ra=null,sl(e,w,D,q),a&&el){y=0;break e}break;default:q=nt,nt=0,ra=null,sl(e,w,D,q)}}GS(),y=kt;break}catch(ee){Q0(e,ee)}while(!0);return t&&e.shellSuspendCounter++,Cs=$r=null,We=o,H.H=f,H.A=p,Be===null&&(lt=null,Ge=0,Lc()),y}function GS(){for(;Be!==null;)W0(Be)}function VS(e,t){var a=We;We|=2;var o=J0(),f=I0();lt!==e||Ge!==t?(mu=null,pu=Pt()+500,al(e,t)):el=Ta(e,t);e:do try{if(nt!==0&&Be!==null){t=Be;var p=ra;t:switch(nt){case 1:nt=0,ra=null,sl(e,t,p,1);break;case 2:case 9:if(c1(p)){nt=0,ra=null,ex(t);break}t=function(){nt!==2&&nt!==9||lt!==e||(nt=7),us(e)},p.then(t,t);break e;case 3:nt=7;break e;case 4:nt=5;break e;case 7:c1(p)?(nt=0,ra=null,ex(t)):(nt=0,ra=null,sl(e,t,p,7));break;case 5:var y=null;switch(Be.tag){case 26:y=Be.memoizedState;case 5:case 27:var w=Be;if(y?Hx(y):w.stateNode.complete){nt=0,ra=null;var D=w.sibling;if(D!==null)Be=D;else{var q=w.return;q!==null?(Be=q,vu(q)):Be=null}break t}}nt=0,ra=null,sl(e,t,p,5);break;case 6:nt=0,ra=null,sl(e,t,p,6);break;case 8:Nh(),kt=6;break e;default:throw Error(s(462))}}XS();break}catch(ee){Q0(e,ee)}while(!0);return Cs=$r=null,H.H=o,H.A=f,We=a,Be!==null?0:(lt=null,Ge=0,Lc(),kt)}function XS(){for(;Be!==null&&!Xa();)W0(Be)}function W0(e){var t=A0(e.alternate,e,Hs);e.memoizedProps=e.pendingProps,t===null?vu(e):Be=t}function ex(e){var t=e,a=t.alternate;switch(t.tag){case 15:case 0:t=x0(a,t,t.pendingProps,t.type,void 0,Ge);break;case 11:t=x0(a,t,t.pendingProps,t.type.render,t.ref,Ge);break;case 5:Yd(t);default:w0(a,t),t=Be=Ig(t,Hs),t=A0(a,t,Hs)}e.memoizedProps=e.pendingProps,t===null?vu(e):Be=t}function sl(e,t,a,o){Cs=$r=null,Yd(t),Zi=null,so=0;var f=t.return;try{if(kS(e,f,t,a,Ge)){kt=1,ru(e,za(a,e.current)),Be=null;return}}catch(p){if(f!==null)throw Be=f,p;kt=1,ru(e,za(a,e.current)),Be=null;return}t.flags&32768?(Xe||o===1?e=!0:el||(Ge&536870912)!==0?e=!1:(hr=e=!0,(o===2||o===9||o===3||o===6)&&(o=aa.current,o!==null&&o.tag===13&&(o.flags|=16384))),tx(t,e)):vu(t)}function vu(e){var t=e;do{if((t.flags&32768)!==0){tx(t,hr);return}e=t.return;var a=LS(t.alternate,t,Hs);if(a!==null){Be=a;return}if(t=t.sibling,t!==null){Be=t;return}Be=t=e}while(t!==null);kt===0&&(kt=5)}function tx(e,t){do{var a=US(e.alternate,e);if(a!==null){a.flags&=32767,Be=a;return}if(a=e.return,a!==null&&(a.flags|=32768,a.subtreeFlags=0,a.deletions=null),!t&&(e=e.sibling,e!==null)){Be=e;return}Be=e=a}while(e!==null);kt=6,Be=null}function nx(e,t,a,o,f,p,y,w,D){e.cancelPendingCommit=null;do yu();while(It!==0);if((We&6)!==0)throw Error(s(327));if(t!==null){if(t===e.current)throw Error(s(177));if(p=t.lanes|t.childLanes,p|=md,$e(e,a,p,y,w,D),e===lt&&(Be=lt=null,Ge=0),nl=t,gr=e,Bs=a,Ah=p,Th=f,V0=o,(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?(e.callbackNode=null,e.callbackPriority=0,$S(xn,function(){return lx(),null})):(e.callbackNode=null,e.callbackPriority=0),o=(t.flags&13878)!==0,(t.subtreeFlags&13878)!==0||o){o=H.T,H.T=null,f=K.p,K.p=2,y=We,We|=4;try{HS(e,t,a)}finally{We=y,K.p=f,H.T=o}}It=1,ax(),sx(),rx()}}function ax(){if(It===1){It=0;var e=gr,t=nl,a=(t.flags&13878)!==0;if((t.subtreeFlags&13878)!==0||a){a=H.T,H.T=null;var o=K.p;K.p=2;var f=We;We|=4;try{L0(t,e);var p=Hh,y=qg(e.containerInfo),w=p.focusedElem,D=p.selectionRange;if(y!==w&&w&&w.ownerDocument&&Yg(w.ownerDocument.documentElement,w)){if(D!==null&&ud(w)){var q=D.start,ee=D.end;if(ee===void 0&&(ee=q),"selectionStart"in w)w.selectionStart=q,w.selectionEnd=Math.min(ee,w.value.length);else{var ne=w.ownerDocument||document,V=ne&&ne.defaultView||window;if(V.getSelection){var X=V.getSelection(),ue=w.textContent.length,be=Math.min(D.start,ue),it=D.end===void 0?be:Math.min(D.end,ue);!X.extend&&be>it&&(y=it,it=be,be=y);var B=Fg(w,be),L=Fg(w,it);if(B&&L&&(X.rangeCount!==1||X.anchorNode!==B.node||X.anchorOffset!==B.offset||X.focusNode!==L.node||X.focusOffset!==L.offset)){var Y=ne.createRange();Y.setStart(B.node,B.offset),X.removeAllRanges(),be>it?(X.addRange(Y),X.extend(L.node,L.offset)):(Y.setEnd(L.node,L.offset),X.addRange(Y))}}}}for(ne=[],X=w;X=X.parentNode;)X.nodeType===1&&ne.push({element:X,left:X.scrollLeft,top:X.scrollTop});for(typeof w.focus=="function"&&w.focus(),w=0;w<ne.length;w++){var te=ne[w];te.element.scrollLeft=te.left,te.element.scrollTop=te.top}}Ru=!!Uh,Hh=Uh=null}finally{We=f,K.p=o,H.T=a}}e.current=t,It=2}}function sx(){if(It===2){It=0;var e=gr,t=nl,a=(t.flags&8772)!==0;if((t.subtreeFlags&8772)!==0||a){a=H.T,H.T=null;var o=K.p;K.p=2;var f=We;We|=4;try{M0(e,t.alternate,t)}finally{We=f,K.p=o,H.T=a}}It=3}}function rx(){if(It===4||It===3){It=0,ts();var e=gr,t=nl,a=Bs,o=V0;(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?It=5:(It=0,nl=gr=null,ix(e,e.pendingLanes));var f=e.pendingLanes;if(f===0&&(mr=null),Mt(a),t=t.stateNode,Tt&&typeof Tt.onCommitFiberRoot=="function")try{Tt.onCommitFiberRoot(ns,t,void 0,(t.current.flags&128)===128)}catch{}if(o!==null){t=H.T,f=K.p,K.p=2,H.T=null;try{for(var p=e.onRecoverableError,y=0;y<o.length;y++){var w=o[y];p(w.value,{componentStack:w.stack})}}finally{H.T=t,K.p=f}}(Bs&3)!==0&&yu(),us(e),f=e.pendingLanes,(a&261930)!==0&&(f&42)!==0?e===wh?So++:(So=0,wh=e):So=0,Ao(0)}}function ix(e,t){(e.pooledCacheLanes&=t)===0&&(t=e.pooledCache,t!=null&&(e.pooledCache=null,no(t)))}function yu(){return ax(),sx(),rx(),lx()}function lx(){if(It!==5)return!1;var e=gr,t=Ah;Ah=0;var a=Mt(Bs),o=H.T,f=K.p;try{K.p=32>a?32:a,H.T=null,a=Th,Th=null;var p=gr,y=Bs;if(It=0,nl=gr=null,Bs=0,(We&6)!==0)throw Error(s(331));var w=We;if(We|=4,Y0(p.current),H0(p,p.current,y,a),We=w,Ao(0,!1),Tt&&typeof Tt.onPostCommitFiberRoot=="function")try{Tt.onPostCommitFiberRoot(ns,p)}catch{}return!0}finally{K.p=f,H.T=o,ix(e,t)}}function ox(e,t,a){t=za(a,t),t=ah(e.stateNode,t,2),e=cr(e,t,2),e!==null&&(xe(e,2),us(e))}function at(e,t,a){if(e.tag===3)ox(e,e,a);else for(;t!==null;){if(t.tag===3){ox(t,e,a);break}else if(t.tag===1){var o=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof o.componentDidCatch=="function"&&(mr===null||!mr.has(o))){e=za(a,e),a=c0(2),o=cr(t,a,2),o!==null&&(u0(a,o,t,e),xe(o,2),us(o));break}}t=t.return}}function Eh(e,t,a){var o=e.pingCache;if(o===null){o=e.pingCache=new YS;var f=new Set;o.set(t,f)}else f=o.get(t),f===void 0&&(f=new Set,o.set(t,f));f.has(a)||(bh=!0,f.add(a),e=ZS.bind(null,e,t,a),t.then(e,e))}function ZS(e,t,a){var o=e.pingCache;o!==null&&o.delete(t),e.pingedLanes|=e.suspendedLanes&a,e.warmLanes&=~a,lt===e&&(Ge&a)===a&&(kt===4||kt===3&&(Ge&62914560)===Ge&&300>Pt()-hu?(We&2)===0&&al(e,0):_h|=a,tl===Ge&&(tl=0)),us(e)}function cx(e,t){t===0&&(t=er()),e=Zr(e,t),e!==null&&(xe(e,t),us(e))}function KS(e){var t=e.memoizedState,a=0;t!==null&&(a=t.retryLane),cx(e,a)}function QS(e,t){var a=0;switch(e.tag){case 31:case 13:var o=e.stateNode,f=e.memoizedState;f!==null&&(a=f.retryLane);break;case 19:o=e.stateNode;break;case 22:o=e.stateNode._retryCache;break;default:throw Error(s(314))}o!==null&&o.delete(t),cx(e,a)}function $S(e,t){return ba(e,t)}var bu=null,rl=null,Ch=!1,_u=!1,zh=!1,vr=0;function us(e){e!==rl&&e.next===null&&(rl===null?bu=rl=e:rl=rl.next=e),_u=!0,Ch||(Ch=!0,IS())}function Ao(e,t){if(!zh&&_u){zh=!0;do for(var a=!1,o=bu;o!==null;){if(e!==0){var f=o.pendingLanes;if(f===0)var p=0;else{var y=o.suspendedLanes,w=o.pingedLanes;p=(1<<31-qt(42|e)+1)-1,p&=f&~(y&~w),p=p&201326741?p&201326741|1:p?p|2:0}p!==0&&(a=!0,hx(o,p))}else p=Ge,p=Aa(o,o===lt?p:0,o.cancelPendingCommit!==null||o.timeoutHandle!==-1),(p&3)===0||Ta(o,p)||(a=!0,hx(o,p));o=o.next}while(a);zh=!1}}function JS(){ux()}function ux(){_u=Ch=!1;var e=0;vr!==0&&o3()&&(e=vr);for(var t=Pt(),a=null,o=bu;o!==null;){var f=o.next,p=fx(o,t);p===0?(o.next=null,a===null?bu=f:a.next=f,f===null&&(rl=a)):(a=o,(e!==0||(p&3)!==0)&&(_u=!0)),o=f}It!==0&&It!==5||Ao(e),vr!==0&&(vr=0)}function fx(e,t){for(var a=e.suspendedLanes,o=e.pingedLanes,f=e.expirationTimes,p=e.pendingLanes&-62914561;0<p;){var y=31-qt(p),w=1<<y,D=f[y];D===-1?((w&a)===0||(w&o)!==0)&&(f[y]=Ka(w,t)):D<=t&&(e.expiredLanes|=w),p&=~w}if(t=lt,a=Ge,a=Aa(e,e===t?a:0,e.cancelPendingCommit!==null||e.timeoutHandle!==-1),o=e.callbackNode,a===0||e===t&&(nt===2||nt===9)||e.cancelPendingCommit!==null)return o!==null&&o!==null&&ut(o),e.callbackNode=null,e.callbackPriority=0;if((a&3)===0||Ta(e,a)){if(t=a&-a,t===e.callbackPriority)return t;switch(o!==null&&ut(o),Mt(a)){case 2:case 8:a=yt;break;case 32:a=xn;break;case 268435456:a=_a;break;default:a=xn}return o=dx.bind(null,e),a=ba(a,o),e.callbackPriority=t,e.callbackNode=a,t}return o!==null&&o!==null&&ut(o),e.callbackPriority=2,e.callbackNode=null,2}function dx(e,t){if(It!==0&&It!==5)return e.callbackNode=null,e.callbackPriority=0,null;var a=e.callbackNode;if(yu()&&e.callbackNode!==a)return null;var o=Ge;return o=Aa(e,e===lt?o:0,e.cancelPendingCommit!==null||e.timeoutHandle!==-1),o===0?null:(Z0(e,o,t),fx(e,Pt()),e.callbackNode!=null&&e.callbackNode===a?dx.bind(null,e):null)}function hx(e,t){if(yu())return null;Z0(e,t,!0)}function IS(){u3(function(){(We&6)!==0?ba(Za,JS):ux()})}function Rh(){if(vr===0){var e=Gi;e===0&&(e=Sa,Sa<<=1,(Sa&261888)===0&&(Sa=256)),vr=e}return vr}function px(e){return e==null||typeof e=="symbol"||typeof e=="boolean"?null:typeof e=="function"?e:Cc(""+e)}function mx(e,t){var a=t.ownerDocument.createElement("input");return a.name=t.name,a.value=t.value,e.id&&a.setAttribute("form",e.id),t.parentNode.insertBefore(a,t),e=new FormData(e),a.parentNode.removeChild(a),e}function WS(e,t,a,o,f){if(t==="submit"&&a&&a.stateNode===f){var p=px((f[Me]||null).action),y=o.submitter;y&&(t=(t=y[Me]||null)?px(t.formAction):y.getAttribute("formAction"),t!==null&&(p=t,y=null));var w=new Dc("action","action",null,o,f);e.push({event:w,listeners:[{instance:null,listener:function(){if(o.defaultPrevented){if(vr!==0){var D=y?mx(f,y):new FormData(f);Jd(a,{pending:!0,data:D,method:f.method,action:p},null,D)}}else typeof p=="function"&&(w.preventDefault(),D=y?mx(f,y):new FormData(f),Jd(a,{pending:!0,data:D,method:f.method,action:p},p,D))},currentTarget:f}]})}}for(var Mh=0;Mh<pd.length;Mh++){var Dh=pd[Mh],e3=Dh.toLowerCase(),t3=Dh[0].toUpperCase()+Dh.slice(1);Qa(e3,"on"+t3)}Qa(Xg,"onAnimationEnd"),Qa(Zg,"onAnimationIteration"),Qa(Kg,"onAnimationStart"),Qa("dblclick","onDoubleClick"),Qa("focusin","onFocus"),Qa("focusout","onBlur"),Qa(xS,"onTransitionRun"),Qa(vS,"onTransitionStart"),Qa(yS,"onTransitionCancel"),Qa(Qg,"onTransitionEnd"),wa("onMouseEnter",["mouseout","mouseover"]),wa("onMouseLeave",["mouseout","mouseover"]),wa("onPointerEnter",["pointerout","pointerover"]),wa("onPointerLeave",["pointerout","pointerover"]),rs("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),rs("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),rs("onBeforeInput",["compositionend","keypress","textInput","paste"]),rs("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),rs("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),rs("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var To="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),n3=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(To));function gx(e,t){t=(t&4)!==0;for(var a=0;a<e.length;a++){var o=e[a],f=o.event;o=o.listeners;e:{var p=void 0;if(t)for(var y=o.length-1;0<=y;y--){var w=o[y],D=w.instance,q=w.currentTarget;if(w=w.listener,D!==p&&f.isPropagationStopped())break e;p=w,f.currentTarget=q;try{p(f)}catch(ee){Pc(ee)}f.currentTarget=null,p=D}else for(y=0;y<o.length;y++){if(w=o[y],D=w.instance,q=w.currentTarget,w=w.listener,D!==p&&f.isPropagationStopped())break e;p=w,f.currentTarget=q;try{p(f)}catch(ee){Pc(ee)}f.currentTarget=null,p=D}}}}function Fe(e,t){var a=t[jn];a===void 0&&(a=t[jn]=new Set);var o=e+"__bubble";a.has(o)||(xx(t,e,2,!1),a.add(o))}function kh(e,t,a){var o=0;t&&(o|=4),xx(a,e,o,t)}var Su="_reactListening"+Math.random().toString(36).slice(2);function Oh(e){if(!e[Su]){e[Su]=!0,ea.forEach(function(a){a!=="selectionchange"&&(n3.has(a)||kh(a,!1,e),kh(a,!0,e))});var t=e.nodeType===9?e:e.ownerDocument;t===null||t[Su]||(t[Su]=!0,kh("selectionchange",!1,t))}}function xx(e,t,a,o){switch(Xx(t)){case 2:var f=z3;break;case 8:f=R3;break;default:f=$h}a=f.bind(null,t,a,e),f=void 0,!td||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(f=!0),o?f!==void 0?e.addEventListener(t,a,{capture:!0,passive:f}):e.addEventListener(t,a,!0):f!==void 0?e.addEventListener(t,a,{passive:f}):e.addEventListener(t,a,!1)}function Ph(e,t,a,o,f){var p=o;if((t&1)===0&&(t&2)===0&&o!==null)e:for(;;){if(o===null)return;var y=o.tag;if(y===3||y===4){var w=o.stateNode.containerInfo;if(w===f)break;if(y===4)for(y=o.return;y!==null;){var D=y.tag;if((D===3||D===4)&&y.stateNode.containerInfo===f)return;y=y.return}for(;w!==null;){if(y=Nt(w),y===null)return;if(D=y.tag,D===5||D===6||D===26||D===27){o=p=y;continue e}w=w.parentNode}}o=o.return}Sg(function(){var q=p,ee=Wf(a),ne=[];e:{var V=$g.get(e);if(V!==void 0){var X=Dc,ue=e;switch(e){case"keypress":if(Rc(a)===0)break e;case"keydown":case"keyup":X=Q2;break;case"focusin":ue="focus",X=rd;break;case"focusout":ue="blur",X=rd;break;case"beforeblur":case"afterblur":X=rd;break;case"click":if(a.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":X=wg;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":X=L2;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":X=I2;break;case Xg:case Zg:case Kg:X=B2;break;case Qg:X=eS;break;case"scroll":case"scrollend":X=O2;break;case"wheel":X=nS;break;case"copy":case"cut":case"paste":X=Y2;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":X=jg;break;case"toggle":case"beforetoggle":X=sS}var be=(t&4)!==0,it=!be&&(e==="scroll"||e==="scrollend"),B=be?V!==null?V+"Capture":null:V;be=[];for(var L=q,Y;L!==null;){var te=L;if(Y=te.stateNode,te=te.tag,te!==5&&te!==26&&te!==27||Y===null||B===null||(te=Vl(L,B),te!=null&&be.push(wo(L,te,Y))),it)break;L=L.return}0<be.length&&(V=new X(V,ue,null,a,ee),ne.push({event:V,listeners:be}))}}if((t&7)===0){e:{if(V=e==="mouseover"||e==="pointerover",X=e==="mouseout"||e==="pointerout",V&&a!==If&&(ue=a.relatedTarget||a.fromElement)&&(Nt(ue)||ue[Qe]))break e;if((X||V)&&(V=ee.window===ee?ee:(V=ee.ownerDocument)?V.defaultView||V.parentWindow:window,X?(ue=a.relatedTarget||a.toElement,X=q,ue=ue?Nt(ue):null,ue!==null&&(it=c(ue),be=ue.tag,ue!==it||be!==5&&be!==27&&be!==6)&&(ue=null)):(X=null,ue=q),X!==ue)){if(be=wg,te="onMouseLeave",B="onMouseEnter",L="mouse",(e==="pointerout"||e==="pointerover")&&(be=jg,te="onPointerLeave",B="onPointerEnter",L="pointer"),it=X==null?V:ss(X),Y=ue==null?V:ss(ue),V=new be(te,L+"leave",X,a,ee),V.target=it,V.relatedTarget=Y,te=null,Nt(ee)===q&&(be=new be(B,L+"enter",ue,a,ee),be.target=Y,be.relatedTarget=it,te=be),it=te,X&&ue)t:{for(be=a3,B=X,L=ue,Y=0,te=B;te;te=be(te))Y++;te=0;for(var ye=L;ye;ye=be(ye))te++;for(;0<Y-te;)B=be(B),Y--;for(;0<te-Y;)L=be(L),te--;for(;Y--;){if(B===L||L!==null&&B===L.alternate){be=B;break t}B=be(B),L=be(L)}be=null}else be=null;X!==null&&vx(ne,V,X,be,!1),ue!==null&&it!==null&&vx(ne,it,ue,be,!0)}}e:{if(V=q?ss(q):window,X=V.nodeName&&V.nodeName.toLowerCase(),X==="select"||X==="input"&&V.type==="file")var Je=Og;else if(Dg(V))if(Pg)Je=pS;else{Je=dS;var pe=fS}else X=V.nodeName,!X||X.toLowerCase()!=="input"||V.type!=="checkbox"&&V.type!=="radio"?q&&Jf(q.elementType)&&(Je=Og):Je=hS;if(Je&&(Je=Je(e,q))){kg(ne,Je,a,ee);break e}pe&&pe(e,V,q),e==="focusout"&&q&&V.type==="number"&&q.memoizedProps.value!=null&&$f(V,"number",V.value)}switch(pe=q?ss(q):window,e){case"focusin":(Dg(pe)||pe.contentEditable==="true")&&(Pi=pe,fd=q,Wl=null);break;case"focusout":Wl=fd=Pi=null;break;case"mousedown":dd=!0;break;case"contextmenu":case"mouseup":case"dragend":dd=!1,Gg(ne,a,ee);break;case"selectionchange":if(gS)break;case"keydown":case"keyup":Gg(ne,a,ee)}var Ce;if(ld)e:{switch(e){case"compositionstart":var Ve="onCompositionStart";break e;case"compositionend":Ve="onCompositionEnd";break e;case"compositionupdate":Ve="onCompositionUpdate";break e}Ve=void 0}else Oi?Rg(e,a)&&(Ve="onCompositionEnd"):e==="keydown"&&a.keyCode===229&&(Ve="onCompositionStart");Ve&&(Eg&&a.locale!=="ko"&&(Oi||Ve!=="onCompositionStart"?Ve==="onCompositionEnd"&&Oi&&(Ce=Ag()):(nr=ee,nd="value"in nr?nr.value:nr.textContent,Oi=!0)),pe=Au(q,Ve),0<pe.length&&(Ve=new Ng(Ve,e,null,a,ee),ne.push({event:Ve,listeners:pe}),Ce?Ve.data=Ce:(Ce=Mg(a),Ce!==null&&(Ve.data=Ce)))),(Ce=iS?lS(e,a):oS(e,a))&&(Ve=Au(q,"onBeforeInput"),0<Ve.length&&(pe=new Ng("onBeforeInput","beforeinput",null,a,ee),ne.push({event:pe,listeners:Ve}),pe.data=Ce)),WS(ne,e,q,a,ee)}gx(ne,t)})}function wo(e,t,a){return{instance:e,listener:t,currentTarget:a}}function Au(e,t){for(var a=t+"Capture",o=[];e!==null;){var f=e,p=f.stateNode;if(f=f.tag,f!==5&&f!==26&&f!==27||p===null||(f=Vl(e,a),f!=null&&o.unshift(wo(e,f,p)),f=Vl(e,t),f!=null&&o.push(wo(e,f,p))),e.tag===3)return o;e=e.return}return[]}function a3(e){if(e===null)return null;do e=e.return;while(e&&e.tag!==5&&e.tag!==27);return e||null}function vx(e,t,a,o,f){for(var p=t._reactName,y=[];a!==null&&a!==o;){var w=a,D=w.alternate,q=w.stateNode;if(w=w.tag,D!==null&&D===o)break;w!==5&&w!==26&&w!==27||q===null||(D=q,f?(q=Vl(a,p),q!=null&&y.unshift(wo(a,q,D))):f||(q=Vl(a,p),q!=null&&y.push(wo(a,q,D)))),a=a.return}y.length!==0&&e.push({event:t,listeners:y})}var s3=/\r\n?/g,r3=/\u0000|\uFFFD/g;function yx(e){return(typeof e=="string"?e:""+e).replace(s3,`
-`).replace(r3,"")}function bx(e,t){return t=yx(t),yx(e)===t}function rt(e,t,a,o,f,p){switch(a){case"children":typeof o=="string"?t==="body"||t==="textarea"&&o===""||Mi(e,o):(typeof o=="number"||typeof o=="bigint")&&t!=="body"&&Mi(e,""+o);break;case"className":jc(e,"class",o);break;case"tabIndex":jc(e,"tabindex",o);break;case"dir":case"role":case"viewBox":case"width":case"height":jc(e,a,o);break;case"style":bg(e,o,p);break;case"data":if(t!=="object"){jc(e,"data",o);break}case"src":case"href":if(o===""&&(t!=="a"||a!=="href")){e.removeAttribute(a);break}if(o==null||typeof o=="function"||typeof o=="symbol"||typeof o=="boolean"){e.removeAttribute(a);break}o=Cc(""+o),e.setAttribute(a,o);break;case"action":case"formAction":if(typeof o=="function"){e.setAttribute(a,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}else typeof p=="function"&&(a==="formAction"?(t!=="input"&&rt(e,t,"name",f.name,f,null),rt(e,t,"formEncType",f.formEncType,f,null),rt(e,t,"formMethod",f.formMethod,f,null),rt(e,t,"formTarget",f.formTarget,f,null)):(rt(e,t,"encType",f.encType,f,null),rt(e,t,"method",f.method,f,null),rt(e,t,"target",f.target,f,null)));if(o==null||typeof o=="symbol"||typeof o=="boolean"){e.removeAttribute(a);break}o=Cc(""+o),e.setAttribute(a,o);break;case"onClick":o!=null&&(e.onclick=ws);break;case"onScroll":o!=null&&Fe("scroll",e);break;case"onScrollEnd":o!=null&&Fe("scrollend",e);break;case"dangerouslySetInnerHTML":if(o!=null){if(typeof o!="object"||!("__html"in o))throw Error(s(61));if(a=o.__html,a!=null){if(f.children!=null)throw Error(s(60));e.innerHTML=a}}break;case"multiple":e.multiple=o&&typeof o!="function"&&typeof o!="symbol";break;case"muted":e.muted=o&&typeof o!="function"&&typeof o!="symbol";break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":break;case"autoFocus":break;case"xlinkHref":if(o==null||typeof o=="function"||typeof o=="boolean"||typeof o=="symbol"){e.removeAttribute("xlink:href");break}a=Cc(""+o),e.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",a);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":o!=null&&typeof o!="function"&&typeof o!="symbol"?e.setAttribute(a,""+o):e.removeAttribute(a);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":o&&typeof o!="function"&&typeof o!="symbol"?e.setAttribute(a,""):e.removeAttribute(a);break;case"capture":case"download":o===!0?e.setAttribute(a,""):o!==!1&&o!=null&&typeof o!="function"&&typeof o!="symbol"?e.setAttribute(a,o):e.removeAttribute(a);break;case"cols":case"rows":case"size":case"span":o!=null&&typeof o!="function"&&typeof o!="symbol"&&!isNaN(o)&&1<=o?e.setAttribute(a,o):e.removeAttribute(a);break;case"rowSpan":case"start":o==null||typeof o=="function"||typeof o=="symbol"||isNaN(o)?e.removeAttribute(a):e.setAttribute(a,o);break;case"popover":Fe("beforetoggle",e),Fe("toggle",e),Nc(e,"popover",o);break;case"xlinkActuate":Ts(e,"http://www.w3.org/1999/xlink","xlink:actuate",o);break;case"xlinkArcrole":Ts(e,"http://www.w3.org/1999/xlink","xlink:arcrole",o);break;case"xlinkRole":Ts(e,"http://www.w3.org/1999/xlink","xlink:role",o);break;case"xlinkShow":Ts(e,"http://www.w3.org/1999/xlink","xlink:show",o);break;case"xlinkTitle":Ts(e,"http://www.w3.org/1999/xlink","xlink:title",o);break;case"xlinkType":Ts(e,"http://www.w3.org/1999/xlink","xlink:type",o);break;case"xmlBase":Ts(e,"http://www.w3.org/XML/1998/namespace","xml:base",o);break;case"xmlLang":Ts(e,"http://www.w3.org/XML/1998/namespace","xml:lang",o);break;case"xmlSpace":Ts(e,"http://www.w3.org/XML/1998/namespace","xml:space",o);break;case"is":Nc(e,"is",o);break;case"innerText":case"textContent":break;default:(!(2<a.length)||a[0]!=="o"&&a[0]!=="O"||a[1]!=="n"&&a[1]!=="N")&&(a=D2.get(a)||a,Nc(e,a,o))}}function Lh(e,t,a,o,f,p){switch(a){case"style":bg(e,o,p);break;case"dangerouslySetInnerHTML":if(o!=null){if(typeof o!="object"||!("__html"in o))throw Error(s(61));if(a=o.__html,a!=null){if(f.children!=null)throw Error(s(60));e.innerHTML=a}}break;case"children":typeof o=="string"?Mi(e,o):(typeof o=="number"||typeof o=="bigint")&&Mi(e,""+o);break;case"onScroll":o!=null&&Fe("scroll",e);break;case"onScrollEnd":o!=null&&Fe("scrollend",e);break;case"onClick":o!=null&&(e.onclick=ws);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":break;case"innerText":case"textContent":break;default:if(!zi.hasOwnProperty(a))e:{if(a[0]==="o"&&a[1]==="n"&&(f=a.endsWith("Capture"),t=a.slice(2,f?a.length-7:void 0),p=e[Me]||null,p=p!=null?p[a]:null,typeof p=="function"&&e.removeEventListener(t,p,f),typeof o=="function")){typeof p!="function"&&p!==null&&(a in e?e[a]=null:e.hasAttribute(a)&&e.removeAttribute(a)),e.addEventListener(t,o,f);break e}a in e?e[a]=o:o===!0?e.setAttribute(a,""):Nc(e,a,o)}}}function dn(e,t,a){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":Fe("error",e),Fe("load",e);var o=!1,f=!1,p;for(p in a)if(a.hasOwnProperty(p)){var y=a[p];if(y!=null)switch(p){case"src":o=!0;break;case"srcSet":f=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(s(137,t));default:rt(e,t,p,y,a,null)}}f&&rt(e,t,"srcSet",a.srcSet,a,null),o&&rt(e,t,"src",a.src,a,null);return;case"input":Fe("invalid",e);var w=p=y=f=null,D=null,q=null;for(o in a)if(a.hasOwnProperty(o)){var ee=a[o];if(ee!=null)switch(o){case"name":f=ee;break;case"type":y=ee;break;case"checked":D=ee;break;case"defaultChecked":q=ee;break;case"value":p=ee;break;case"defaultValue":w=ee;break;case"children":case"dangerouslySetInnerHTML":if(ee!=null)throw Error(s(137,t));break;default:rt(e,t,o,ee,a,null)}}gg(e,p,w,D,q,y,f,!1);return;case"select":Fe("invalid",e),o=y=p=null;for(f in a)if(a.hasOwnProperty(f)&&(w=a[f],w!=null))switch(f){case"value":p=w;break;case"defaultValue":y=w;break;case"multiple":o=w;default:rt(e,t,f,w,a,null)}t=p,a=y,e.multiple=!!o,t!=null?Ri(e,!!o,t,!1):a!=null&&Ri(e,!!o,a,!0);return;case"textarea":Fe("invalid",e),p=f=o=null;for(y in a)if(a.hasOwnProperty(y)&&(w=a[y],w!=null))switch(y){case"value":o=w;break;case"defaultValue":f=w;break;case"children":p=w;break;case"dangerouslySetInnerHTML":if(w!=null)throw Error(s(91));break;default:rt(e,t,y,w,a,null)}vg(e,o,f,p);return;case"option":for(D in a)a.hasOwnProperty(D)&&(o=a[D],o!=null)&&(D==="selected"?e.selected=o&&typeof o!="function"&&typeof o!="symbol":rt(e,t,D,o,a,null));return;case"dialog":Fe("beforetoggle",e),Fe("toggle",e),Fe("cancel",e),Fe("close",e);break;case"iframe":case"object":Fe("load",e);break;case"video":case"audio":for(o=0;o<To.length;o++)Fe(To[o],e);break;case"image":Fe("error",e),Fe("load",e);break;case"details":Fe("toggle",e);break;case"embed":case"source":case"link":Fe("error",e),Fe("load",e);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(q in a)if(a.hasOwnProperty(q)&&(o=a[q],o!=null))switch(q){case"children":case"dangerouslySetInnerHTML":throw Error(s(137,t));default:rt(e,t,q,o,a,null)}return;default:if(Jf(t)){for(ee in a)a.hasOwnProperty(ee)&&(o=a[ee],o!==void 0&&Lh(e,t,ee,o,a,void 0));return}}for(w in a)a.hasOwnProperty(w)&&(o=a[w],o!=null&&rt(e,t,w,o,a,null))}function i3(e,t,a,o){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var f=null,p=null,y=null,w=null,D=null,q=null,ee=null;for(X in a){var ne=a[X];if(a.hasOwnProperty(X)&&ne!=null)switch(X){case"checked":break;case"value":break;case"defaultValue":D=ne;default:o.hasOwnProperty(X)||rt(e,t,X,null,o,ne)}}for(var V in o){var X=o[V];if(ne=a[V],o.hasOwnProperty(V)&&(X!=null||ne!=null))switch(V){case"type":p=X;break;case"name":f=X;break;case"checked":q=X;break;case"defaultChecked":ee=X;break;case"value":y=X;break;case"defaultValue":w=X;break;case"children":case"dangerouslySetInnerHTML":if(X!=null)throw Error(s(137,t));break;default:X!==ne&&rt(e,t,V,X,o,ne)}}Qf(e,y,w,D,q,ee,p,f);return;case"select":X=y=w=V=null;for(p in a)if(D=a[p],a.hasOwnProperty(p)&&D!=null)switch(p){case"value":break;case"multiple":X=D;default:o.hasOwnProperty(p)||rt(e,t,p,null,o,D)}for(f in o)if(p=o[f],D=a[f],o.hasOwnProperty(f)&&(p!=null||D!=null))switch(f){case"value":V=p;break;case"defaultValue":w=p;break;case"multiple":y=p;default:p!==D&&rt(e,t,f,p,o,D)}t=w,a=y,o=X,V!=null?Ri(e,!!a,V,!1):!!o!=!!a&&(t!=null?Ri(e,!!a,t,!0):Ri(e,!!a,a?[]:"",!1));return;case"textarea":X=V=null;for(w in a)if(f=a[w],a.hasOwnProperty(w)&&f!=null&&!o.hasOwnProperty(w))switch(w){case"value":break;case"children":break;default:rt(e,t,w,null,o,f)}for(y in o)if(f=o[y],p=a[y],o.hasOwnProperty(y)&&(f!=null||p!=null))switch(y){case"value":V=f;break;case"defaultValue":X=f;break;case"children":break;case"dangerouslySetInnerHTML":if(f!=null)throw Error(s(91));break;default:f!==p&&rt(e,t,y,f,o,p)}xg(e,V,X);return;case"option":for(var ue in a)V=a[ue],a.hasOwnProperty(ue)&&V!=null&&!o.hasOwnProperty(ue)&&(ue==="selected"?e.selected=!1:rt(e,t,ue,null,o,V));for(D in o)V=o[D],X=a[D],o.hasOwnProperty(D)&&V!==X&&(V!=null||X!=null)&&(D==="selected"?e.selected=V&&typeof V!="function"&&typeof V!="symbol":rt(e,t,D,V,o,X));return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var be in a)V=a[be],a.hasOwnProperty(be)&&V!=null&&!o.hasOwnProperty(be)&&rt(e,t,be,null,o,V);for(q in o)if(V=o[q],X=a[q],o.hasOwnProperty(q)&&V!==X&&(V!=null||X!=null))switch(q){case"children":case"dangerouslySetInnerHTML":if(V!=null)throw Error(s(137,t));break;default:rt(e,t,q,V,o,X)}return;default:if(Jf(t)){for(var it in a)V=a[it],a.hasOwnProperty(it)&&V!==void 0&&!o.hasOwnProperty(it)&&Lh(e,t,it,void 0,o,V);for(ee in o)V=o[ee],X=a[ee],!o.hasOwnProperty(ee)||V===X||V===void 0&&X===void 0||Lh(e,t,ee,V,o,X);return}}for(var B in a)V=a[B],a.hasOwnProperty(B)&&V!=null&&!o.hasOwnProperty(B)&&rt(e,t,B,null,o,V);for(ne in o)V=o[ne],X=a[ne],!o.hasOwnProperty(ne)||V===X||V==null&&X==null||rt(e,t,ne,V,o,X)}function _x(e){switch(e){case"css":case"script":case"font":case"img":case"image":case"input":case"link":return!0;default:return!1}}function l3(){if(typeof performance.getEntriesByType=="function"){for(var e=0,t=0,a=performance.getEntriesByType("resource"),o=0;o<a.length;o++){var f=a[o],p=f.transferSize,y=f.initiatorType,w=f.duration;if(p&&w&&_x(y)){for(y=0,w=f.responseEnd,o+=1;o<a.length;o++){var D=a[o],q=D.startTime;if(q>w)break;var ee=D.transferSize,ne=D.initiatorType;ee&&_x(ne)&&(D=D.responseEnd,y+=ee*(D<w?1:(w-q)/(D-q)))}if(--o,t+=8*(p+y)/(f.duration/1e3),e++,10<e)break}}if(0<e)return t/e/1e6}return navigator.connection&&(e=navigator.connection.downlink,typeof e=="number")?e:5}var Uh=null,Hh=null;function Tu(e){return e.nodeType===9?e:e.ownerDocument}function Sx(e){switch(e){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function Ax(e,t){if(e===0)switch(t){case"svg":return 1;case"math":return 2;default:return 0}return e===1&&t==="foreignObject"?0:e}function Bh(e,t){return e==="textarea"||e==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.children=="bigint"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var Fh=null;function o3(){var e=window.event;return e&&e.type==="popstate"?e===Fh?!1:(Fh=e,!0):(Fh=null,!1)}var Tx=typeof setTimeout=="function"?setTimeout:void 0,c3=typeof clearTimeout=="function"?clearTimeout:void 0,wx=typeof Promise=="function"?Promise:void 0,u3=typeof queueMicrotask=="function"?queueMicrotask:typeof wx<"u"?function(e){return wx.resolve(null).then(e).catch(f3)}:Tx;function f3(e){setTimeout(function(){throw e})}function yr(e){return e==="head"}function Nx(e,t){var a=t,o=0;do{var f=a.nextSibling;if(e.removeChild(a),f&&f.nodeType===8)if(a=f.data,a==="/$"||a==="/&"){if(o===0){e.removeChild(f),cl(t);return}o--}else if(a==="$"||a==="$?"||a==="$~"||a==="$!"||a==="&")o++;else if(a==="html")No(e.ownerDocument.documentElement);else if(a==="head"){a=e.ownerDocument.head,No(a);for(var p=a.firstChild;p;){var y=p.nextSibling,w=p.nodeName;p[wt]||w==="SCRIPT"||w==="STYLE"||w==="LINK"&&p.rel.toLowerCase()==="stylesheet"||a.removeChild(p),p=y}}else a==="body"&&No(e.ownerDocument.body);a=f}while(a);cl(t)}function jx(e,t){var a=e;e=0;do{var o=a.nextSibling;if(a.nodeType===1?t?(a._stashedDisplay=a.style.display,a.style.display="none"):(a.style.display=a._stashedDisplay||"",a.getAttribute("style")===""&&a.removeAttribute("style")):a.nodeType===3&&(t?(a._stashedText=a.nodeValue,a.nodeValue=""):a.nodeValue=a._stashedText||""),o&&o.nodeType===8)if(a=o.data,a==="/$"){if(e===0)break;e--}else a!=="$"&&a!=="$?"&&a!=="$~"&&a!=="$!"||e++;a=o}while(a)}function Yh(e){var t=e.firstChild;for(t&&t.nodeType===10&&(t=t.nextSibling);t;){var a=t;switch(t=t.nextSibling,a.nodeName){case"HTML":case"HEAD":case"BODY":Yh(a),Lt(a);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if(a.rel.toLowerCase()==="stylesheet")continue}e.removeChild(a)}}function d3(e,t,a,o){for(;e.nodeType===1;){var f=a;if(e.nodeName.toLowerCase()!==t.toLowerCase()){if(!o&&(e.nodeName!=="INPUT"||e.type!=="hidden"))break}else if(o){if(!e[wt])switch(t){case"meta":if(!e.hasAttribute("itemprop"))break;return e;case"link":if(p=e.getAttribute("rel"),p==="stylesheet"&&e.hasAttribute("data-precedence"))break;if(p!==f.rel||e.getAttribute("href")!==(f.href==null||f.href===""?null:f.href)||e.getAttribute("crossorigin")!==(f.crossOrigin==null?null:f.crossOrigin)||e.getAttribute("title")!==(f.title==null?null:f.title))break;return e;case"style":if(e.hasAttribute("data-precedence"))break;return e;case"script":if(p=e.getAttribute("src"),(p!==(f.src==null?null:f.src)||e.getAttribute("type")!==(f.type==null?null:f.type)||e.getAttribute("crossorigin")!==(f.crossOrigin==null?null:f.crossOrigin))&&p&&e.hasAttribute("async")&&!e.hasAttribute("itemprop"))break;return e;default:return e}}else if(t==="input"&&e.type==="hidden"){var p=f.name==null?null:""+f.name;if(f.type==="hidden"&&e.getAttribute("name")===p)return e}else return e;if(e=Oa(e.nextSibling),e===null)break}return null}function h3(e,t,a){if(t==="")return null;for(;e.nodeType!==3;)if((e.nodeType!==1||e.nodeName!=="INPUT"||e.type!=="hidden")&&!a||(e=Oa(e.nextSibling),e===null))return null;return e}function Ex(e,t){for(;e.nodeType!==8;)if((e.nodeType!==1||e.nodeName!=="INPUT"||e.type!=="hidden")&&!t||(e=Oa(e.nextSibling),e===null))return null;return e}function qh(e){return e.data==="$?"||e.data==="$~"}function Gh(e){return e.data==="$!"||e.data==="$?"&&e.ownerDocument.readyState!=="loading"}function p3(e,t){var a=e.ownerDocument;if(e.data==="$~")e._reactRetry=t;else if(e.data!=="$?"||a.readyState!=="loading")t();else{var o=function(){t(),a.removeEventListener("DOMContentLoaded",o)};a.addEventListener("DOMContentLoaded",o),e._reactRetry=o}}function Oa(e){for(;e!=null;e=e.nextSibling){var t=e.nodeType;if(t===1||t===3)break;if(t===8){if(t=e.data,t==="$"||t==="$!"||t==="$?"||t==="$~"||t==="&"||t==="F!"||t==="F")break;if(t==="/$"||t==="/&")return null}}return e}var Vh=null;function Cx(e){e=e.nextSibling;for(var t=0;e;){if(e.nodeType===8){var a=e.data;if(a==="/$"||a==="/&"){if(t===0)return Oa(e.nextSibling);t--}else a!=="$"&&a!=="$!"&&a!=="$?"&&a!=="$~"&&a!=="&"||t++}e=e.nextSibling}return null}function zx(e){e=e.previousSibling;for(var t=0;e;){if(e.nodeType===8){var a=e.data;if(a==="$"||a==="$!"||a==="$?"||a==="$~"||a==="&"){if(t===0)return e;t--}else a!=="/$"&&a!=="/&"||t++}e=e.previousSibling}return null}function Rx(e,t,a){switch(t=Tu(a),e){case"html":if(e=t.documentElement,!e)throw Error(s(452));return e;case"head":if(e=t.head,!e)throw Error(s(453));return e;case"body":if(e=t.body,!e)throw Error(s(454));return e;default:throw Error(s(451))}}function No(e){for(var t=e.attributes;t.length;)e.removeAttributeNode(t[0]);Lt(e)}var Pa=new Map,Mx=new Set;function wu(e){return typeof e.getRootNode=="function"?e.getRootNode():e.nodeType===9?e:e.ownerDocument}var Fs=K.d;K.d={f:m3,r:g3,D:x3,C:v3,L:y3,m:b3,X:S3,S:_3,M:A3};function m3(){var e=Fs.f(),t=gu();return e||t}function g3(e){var t=Hn(e);t!==null&&t.tag===5&&t.type==="form"?Q1(t):Fs.r(e)}var il=typeof document>"u"?null:document;function Dx(e,t,a){var o=il;if(o&&typeof t=="string"&&t){var f=Ea(t);f='link[rel="'+e+'"][href="'+f+'"]',typeof a=="string"&&(f+='[crossorigin="'+a+'"]'),Mx.has(f)||(Mx.add(f),e={rel:e,crossOrigin:a,href:t},o.querySelector(f)===null&&(t=o.createElement("link"),dn(t,"link",e),Pe(t),o.head.appendChild(t)))}}function x3(e){Fs.D(e),Dx("dns-prefetch",e,null)}function v3(e,t){Fs.C(e,t),Dx("preconnect",e,t)}function y3(e,t,a){Fs.L(e,t,a);var o=il;if(o&&e&&t){var f='link[rel="preload"][as="'+Ea(t)+'"]';t==="image"&&a&&a.imageSrcSet?(f+='[imagesrcset="'+Ea(a.imageSrcSet)+'"]',typeof a.imageSizes=="string"&&(f+='[imagesizes="'+Ea(a.imageSizes)+'"]')):f+='[href="'+Ea(e)+'"]';var p=f;switch(t){case"style":p=ll(e);break;case"script":p=ol(e)}Pa.has(p)||(e=v({rel:"preload",href:t==="image"&&a&&a.imageSrcSet?void 0:e,as:t},a),Pa.set(p,e),o.querySelector(f)!==null||t==="style"&&o.querySelector(jo(p))||t==="script"&&o.querySelector(Eo(p))||(t=o.createElement("link"),dn(t,"link",e),Pe(t),o.head.appendChild(t)))}}function b3(e,t){Fs.m(e,t);var a=il;if(a&&e){var o=t&&typeof t.as=="string"?t.as:"script",f='link[rel="modulepreload"][as="'+Ea(o)+'"][href="'+Ea(e)+'"]',p=f;switch(o){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":p=ol(e)}if(!Pa.has(p)&&(e=v({rel:"modulepreload",href:e},t),Pa.set(p,e),a.querySelector(f)===null)){switch(o){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(a.querySelector(Eo(p)))return}o=a.createElement("link"),dn(o,"link",e),Pe(o),a.head.appendChild(o)}}}function _3(e,t,a){Fs.S(e,t,a);var o=il;if(o&&e){var f=jt(o).hoistableStyles,p=ll(e);t=t||"default";var y=f.get(p);if(!y){var w={loading:0,preload:null};if(y=o.querySelector(jo(p)))w.loading=5;else{e=v({rel:"stylesheet",href:e,"data-precedence":t},a),(a=Pa.get(p))&&Xh(e,a);var D=y=o.createElement("link");Pe(D),dn(D,"link",e),D._p=new Promise(function(q,ee){D.onload=q,D.onerror=ee}),D.addEventListener("load",function(){w.loading|=1}),D.addEventListener("error",function(){w.loading|=2}),w.loading|=4,Nu(y,t,o)}y={type:"stylesheet",instance:y,count:1,state:w},f.set(p,y)}}}function S3(e,t){Fs.X(e,t);var a=il;if(a&&e){var o=jt(a).hoistableScripts,f=ol(e),p=o.get(f);p||(p=a.querySelector(Eo(f)),p||(e=v({src:e,async:!0},t),(t=Pa.get(f))&&Zh(e,t),p=a.createElement("script"),Pe(p),dn(p,"link",e),a.head.appendChild(p)),p={type:"script",instance:p,count:1,state:null},o.set(f,p))}}function A3(e,t){Fs.M(e,t);var a=il;if(a&&e){var o=jt(a).hoistableScripts,f=ol(e),p=o.get(f);p||(p=a.querySelector(Eo(f)),p||(e=v({src:e,async:!0,type:"module"},t),(t=Pa.get(f))&&Zh(e,t),p=a.createElement("script"),Pe(p),dn(p,"link",e),a.head.appendChild(p)),p={type:"script",instance:p,count:1,state:null},o.set(f,p))}}function kx(e,t,a,o){var f=(f=ge.current)?wu(f):null;if(!f)throw Error(s(446));switch(e){case"meta":case"title":return null;case"style":return typeof a.precedence=="string"&&typeof a.href=="string"?(t=ll(a.href),a=jt(f).hoistableStyles,o=a.get(t),o||(o={type:"style",instance:null,count:0,state:null},a.set(t,o)),o):{type:"void",instance:null,count:0,state:null};case"link":if(a.rel==="stylesheet"&&typeof a.href=="string"&&typeof a.precedence=="string"){e=ll(a.href);var p=jt(f).hoistableStyles,y=p.get(e);if(y||(f=f.ownerDocument||f,y={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},p.set(e,y),(p=f.querySelector(jo(e)))&&!p._p&&(y.instance=p,y.state.loading=5),Pa.has(e)||(a={rel:"preload",as:"style",href:a.href,crossOrigin:a.crossOrigin,integrity:a.integrity,media:a.media,hrefLang:a.hrefLang,referrerPolicy:a.referrerPolicy},Pa.set(e,a),p||T3(f,e,a,y.state))),t&&o===null)throw Error(s(528,""));return y}if(t&&o!==null)throw Error(s(529,""));return null;case"script":return t=a.async,a=a.src,typeof a=="string"&&t&&typeof t!="function"&&typeof t!="symbol"?(t=ol(a),a=jt(f).hoistableScripts,o=a.get(t),o||(o={type:"script",instance:null,count:0,state:null},a.set(t,o)),o):{type:"void",instance:null,count:0,state:null};default:throw Error(s(444,e))}}function ll(e){return'href="'+Ea(e)+'"'}function jo(e){return'link[rel="stylesheet"]['+e+"]"}function Ox(e){return v({},e,{"data-precedence":e.precedence,precedence:null})}function T3(e,t,a,o){e.querySelector('link[rel="preload"][as="style"]['+t+"]")?o.loading=1:(t=e.createElement("link"),o.preload=t,t.addEventListener("load",function(){return o.loading|=1}),t.addEventListener("error",function(){return o.loading|=2}),dn(t,"link",a),Pe(t),e.head.appendChild(t))}function ol(e){return'[src="'+Ea(e)+'"]'}function Eo(e){return"script[async]"+e}function Px(e,t,a){if(t.count++,t.instance===null)switch(t.type){case"style":var o=e.querySelector('style[data-href~="'+Ea(a.href)+'"]');if(o)return t.instance=o,Pe(o),o;var f=v({},a,{"data-href":a.href,"data-precedence":a.precedence,href:null,precedence:null});return o=(e.ownerDocument||e).createElement("style"),Pe(o),dn(o,"style",f),Nu(o,a.precedence,e),t.instance=o;case"stylesheet":f=ll(a.href);var p=e.querySelector(jo(f));if(p)return t.state.loading|=4,t.instance=p,Pe(p),p;o=Ox(a),(f=Pa.get(f))&&Xh(o,f),p=(e.ownerDocument||e).createElement("link"),Pe(p);var y=p;return y._p=new Promise(function(w,D){y.onload=w,y.onerror=D}),dn(p,"link",o),t.state.loading|=4,Nu(p,a.precedence,e),t.instance=p;case"script":return p=ol(a.src),(f=e.querySelector(Eo(p)))?(t.instance=f,Pe(f),f):(o=a,(f=Pa.get(p))&&(o=v({},a),Zh(o,f)),e=e.ownerDocument||e,f=e.createElement("script"),Pe(f),dn(f,"link",o),e.head.appendChild(f),t.instance=f);case"void":return null;default:throw Error(s(443,t.type))}else t.type==="stylesheet"&&(t.state.loading&4)===0&&(o=t.instance,t.state.loading|=4,Nu(o,a.precedence,e));return t.instance}function Nu(e,t,a){for(var o=a.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),f=o.length?o[o.length-1]:null,p=f,y=0;y<o.length;y++){var w=o[y];if(w.dataset.precedence===t)p=w;else if(p!==f)break}p?p.parentNode.insertBefore(e,p.nextSibling):(t=a.nodeType===9?a.head:a,t.insertBefore(e,t.firstChild))}function Xh(e,t){e.crossOrigin==null&&(e.crossOrigin=t.crossOrigin),e.referrerPolicy==null&&(e.referrerPolicy=t.referrerPolicy),e.title==null&&(e.title=t.title)}function Zh(e,t){e.crossOrigin==null&&(e.crossOrigin=t.crossOrigin),e.referrerPolicy==null&&(e.referrerPolicy=t.referrerPolicy),e.integrity==null&&(e.integrity=t.integrity)}var ju=null;function Lx(e,t,a){if(ju===null){var o=new Map,f=ju=new Map;f.set(a,o)}else f=ju,o=f.get(a),o||(o=new Map,f.set(a,o));if(o.has(e))return o;for(o.set(e,null),a=a.getElementsByTagName(e),f=0;f<a.length;f++){var p=a[f];if(!(p[wt]||p[ze]||e==="link"&&p.getAttribute("rel")==="stylesheet")&&p.namespaceURI!=="http://www.w3.org/2000/svg"){var y=p.getAttribute(t)||"";y=e+y;var w=o.get(y);w?w.push(p):o.set(y,[p])}}return o}function Ux(e,t,a){e=e.ownerDocument||e,e.head.insertBefore(a,t==="title"?e.querySelector("head > title"):null)}function w3(e,t,a){if(a===1||t.itemProp!=null)return!1;switch(e){case"meta":case"title":return!0;case"style":if(typeof t.precedence!="string"||typeof t.href!="string"||t.href==="")break;return!0;case"link":if(typeof t.rel!="string"||typeof t.href!="string"||t.href===""||t.onLoad||t.onError)break;return t.rel==="stylesheet"?(e=t.disabled,typeof t.precedence=="string"&&e==null):!0;case"script":if(t.async&&typeof t.async!="function"&&typeof t.async!="symbol"&&!t.onLoad&&!t.onError&&t.src&&typeof t.src=="string")return!0}return!1}function Hx(e){return!(e.type==="stylesheet"&&(e.state.loading&3)===0)}function N3(e,t,a,o){if(a.type==="stylesheet"&&(typeof o.media!="string"||matchMedia(o.media).matches!==!1)&&(a.state.loading&4)===0){if(a.instance===null){var f=ll(o.href),p=t.querySelector(jo(f));if(p){t=p._p,t!==null&&typeof t=="object"&&typeof t.then=="function"&&(e.count++,e=Eu.bind(e),t.then(e,e)),a.state.loading|=4,a.instance=p,Pe(p);return}p=t.ownerDocument||t,o=Ox(o),(f=Pa.get(f))&&Xh(o,f),p=p.createElement("link"),Pe(p);var y=p;y._p=new Promise(function(w,D){y.onload=w,y.onerror=D}),dn(p,"link",o),a.instance=p}e.stylesheets===null&&(e.stylesheets=new Map),e.stylesheets.set(a,t),(t=a.state.preload)&&(a.state.loading&3)===0&&(e.count++,a=Eu.bind(e),t.addEventListener("load",a),t.addEventListener("error",a))}}var Kh=0;function j3(e,t){return e.stylesheets&&e.count===0&&zu(e,e.stylesheets),0<e.count||0<e.imgCount?function(a){var o=setTimeout(function(){if(e.stylesheets&&zu(e,e.stylesheets),e.unsuspend){var p=e.unsuspend;e.unsuspend=null,p()}},6e4+t);0<e.imgBytes&&Kh===0&&(Kh=62500*l3());var f=setTimeout(function(){if(e.waitingForImages=!1,e.count===0&&(e.stylesheets&&zu(e,e.stylesheets),e.unsuspend)){var p=e.unsuspend;e.unsuspend=null,p()}},(e.imgBytes>Kh?50:800)+t);return e.unsuspend=a,function(){e.unsuspend=null,clearTimeout(o),clearTimeout(f)}}:null}function Eu(){if(this.count--,this.count===0&&(this.imgCount===0||!this.waitingForImages)){if(this.stylesheets)zu(this,this.stylesheets);else if(this.unsuspend){var e=this.unsuspend;this.unsuspend=null,e()}}}var Cu=null;function zu(e,t){e.stylesheets=null,e.unsuspend!==null&&(e.count++,Cu=new Map,t.forEach(E3,e),Cu=null,Eu.call(e))}function E3(e,t){if(!(t.state.loading&4)){var a=Cu.get(e);if(a)var o=a.get(null);else{a=new Map,Cu.set(e,a);for(var f=e.querySelectorAll("link[data-precedence],style[data-precedence]"),p=0;p<f.length;p++){var y=f[p];(y.nodeName==="LINK"||y.getAttribute("media")!=="not all")&&(a.set(y.dataset.precedence,y),o=y)}o&&a.set(null,o)}f=t.instance,y=f.getAttribute("data-precedence"),p=a.get(y)||o,p===o&&a.set(null,f),a.set(y,f),this.count++,o=Eu.bind(this),f.addEventListener("load",o),f.addEventListener("error",o),p?p.parentNode.insertBefore(f,p.nextSibling):(e=e.nodeType===9?e.head:e,e.insertBefore(f,e.firstChild)),t.state.loading|=4}}var Co={$$typeof:M,Provider:null,Consumer:null,_currentValue:J,_currentValue2:J,_threadCount:0};function C3(e,t,a,o,f,p,y,w,D){this.tag=1,this.containerInfo=e,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=Ae(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Ae(0),this.hiddenUpdates=Ae(null),this.identifierPrefix=o,this.onUncaughtError=f,this.onCaughtError=p,this.onRecoverableError=y,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=D,this.incompleteTransitions=new Map}function Bx(e,t,a,o,f,p,y,w,D,q,ee,ne){return e=new C3(e,t,a,y,D,q,ee,ne,w),t=1,p===!0&&(t|=24),p=na(3,null,null,t),e.current=p,p.stateNode=e,t=jd(),t.refCount++,e.pooledCache=t,t.refCount++,p.memoizedState={element:o,isDehydrated:a,cache:t},Rd(p),e}function Fx(e){return e?(e=Hi,e):Hi}function Yx(e,t,a,o,f,p){f=Fx(f),o.context===null?o.context=f:o.pendingContext=f,o=or(t),o.payload={element:a},p=p===void 0?null:p,p!==null&&(o.callback=p),a=cr(e,o,t),a!==null&&(Vn(a,e,t),io(a,e,t))}function qx(e,t){if(e=e.memoizedState,e!==null&&e.dehydrated!==null){var a=e.retryLane;e.retryLane=a!==0&&a<t?a:t}}function Qh(e,t){qx(e,t),(e=e.alternate)&&qx(e,t)}function Gx(e){if(e.tag===13||e.tag===31){var t=Zr(e,67108864);t!==null&&Vn(t,e,67108864),Qh(e,67108864)}}function Vx(e){if(e.tag===13||e.tag===31){var t=la();t=Se(t);var a=Zr(e,t);a!==null&&Vn(a,e,t),Qh(e,t)}}var Ru=!0;function z3(e,t,a,o){var f=H.T;H.T=null;var p=K.p;try{K.p=2,$h(e,t,a,o)}finally{K.p=p,H.T=f}}function R3(e,t,a,o){var f=H.T;H.T=null;var p=K.p;try{K.p=8,$h(e,t,a,o)}finally{K.p=p,H.T=f}}function $h(e,t,a,o){if(Ru){var f=Jh(o);if(f===null)Ph(e,t,o,Mu,a),Zx(e,o);else if(D3(f,e,t,a,o))o.stopPropagation();else if(Zx(e,o),t&4&&-1<M3.indexOf(e)){for(;f!==null;){var p=Hn(f);if(p!==null)switch(p.tag){case 3:if(p=p.stateNode,p.current.memoizedState.isDehydrated){var y=Jt(p.pendingLanes);if(y!==0){var w=p;for(w.pendingLanes|=2,w.entangledLanes|=2;y;){var D=1<<31-qt(y);w.entanglements[1]|=D,y&=~D}us(p),(We&6)===0&&(pu=Pt()+500,Ao(0))}}break;case 31:case 13:w=Zr(p,2),w!==null&&Vn(w,p,2),gu(),Qh(p,2)}if(p=Jh(o),p===null&&Ph(e,t,o,Mu,a),p===f)break;f=p}f!==null&&o.stopPropagation()}else Ph(e,t,o,null,a)}}function Jh(e){return e=Wf(e),Ih(e)}var Mu=null;function Ih(e){if(Mu=null,e=Nt(e),e!==null){var t=c(e);if(t===null)e=null;else{var a=t.tag;if(a===13){if(e=u(t),e!==null)return e;e=null}else if(a===31){if(e=d(t),e!==null)return e;e=null}else if(a===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null)}}return Mu=e,null}function Xx(e){switch(e){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(Yt()){case Za:return 2;case yt:return 8;case xn:case Un:return 32;case _a:return 268435456;default:return 32}default:return 32}}var Wh=!1,br=null,_r=null,Sr=null,zo=new Map,Ro=new Map,Ar=[],M3="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function Zx(e,t){switch(e){case"focusin":case"focusout":br=null;break;case"dragenter":case"dragleave":_r=null;break;case"mouseover":case"mouseout":Sr=null;break;case"pointerover":case"pointerout":zo.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":Ro.delete(t.pointerId)}}function Mo(e,t,a,o,f,p){return e===null||e.nativeEvent!==p?(e={blockedOn:t,domEventName:a,eventSystemFlags:o,nativeEvent:p,targetContainers:[f]},t!==null&&(t=Hn(t),t!==null&&Gx(t)),e):(e.eventSystemFlags|=o,t=e.targetContainers,f!==null&&t.indexOf(f)===-1&&t.push(f),e)}function D3(e,t,a,o,f){switch(t){case"focusin":return br=Mo(br,e,t,a,o,f),!0;case"dragenter":return _r=Mo(_r,e,t,a,o,f),!0;case"mouseover":return Sr=Mo(Sr,e,t,a,o,f),!0;case"pointerover":var p=f.pointerId;return zo.set(p,Mo(zo.get(p)||null,e,t,a,o,f)),!0;case"gotpointercapture":return p=f.pointerId,Ro.set(p,Mo(Ro.get(p)||null,e,t,a,o,f)),!0}return!1}function Kx(e){var t=Nt(e.target);if(t!==null){var a=c(t);if(a!==null){if(t=a.tag,t===13){if(t=u(a),t!==null){e.blockedOn=t,bt(e.priority,function(){Vx(a)});return}}else if(t===31){if(t=d(a),t!==null){e.blockedOn=t,bt(e.priority,function(){Vx(a)});return}}else if(t===3&&a.stateNode.current.memoizedState.isDehydrated){e.blockedOn=a.tag===3?a.stateNode.containerInfo:null;return}}}e.blockedOn=null}function Du(e){if(e.blockedOn!==null)return!1;for(var t=e.targetContainers;0<t.length;){var a=Jh(e.nativeEvent);if(a===null){a=e.nativeEvent;var o=new a.constructor(a.type,a);If=o,a.target.dispatchEvent(o),If=null}else return t=Hn(a),t!==null&&Gx(t),e.blockedOn=a,!1;t.shift()}return!0}function Qx(e,t,a){Du(e)&&a.delete(t)}function k3(){Wh=!1,br!==null&&Du(br)&&(br=null),_r!==null&&Du(_r)&&(_r=null),Sr!==null&&Du(Sr)&&(Sr=null),zo.forEach(Qx),Ro.forEach(Qx)}function ku(e,t){e.blockedOn===t&&(e.blockedOn=null,Wh||(Wh=!0,i.unstable_scheduleCallback(i.unstable_NormalPriority,k3)))}var Ou=null;function $x(e){Ou!==e&&(Ou=e,i.unstable_scheduleCallback(i.unstable_NormalPriority,function(){Ou===e&&(Ou=null);for(var t=0;t<e.length;t+=3){var a=e[t],o=e[t+1],f=e[t+2];if(typeof o!="function"){if(Ih(o||a)===null)continue;break}var p=Hn(a);p!==null&&(e.splice(t,3),t-=3,Jd(p,{pending:!0,data:f,method:a.method,action:o},o,f))}}))}function cl(e){function t(D){return ku(D,e)}br!==null&&ku(br,e),_r!==null&&ku(_r,e),Sr!==null&&ku(Sr,e),zo.forEach(t),Ro.forEach(t);for(var a=0;a<Ar.length;a++){var o=Ar[a];o.blockedOn===e&&(o.blockedOn=null)}for(;0<Ar.length&&(a=Ar[0],a.blockedOn===null);)Kx(a),a.blockedOn===null&&Ar.shift();if(a=(e.ownerDocument||e).$$reactFormReplay,a!=null)for(o=0;o<a.length;o+=3){var f=a[o],p=a[o+1],y=f[Me]||null;if(typeof p=="function")y||$x(a);else if(y){var w=null;if(p&&p.hasAttribute("formAction")){if(f=p,y=p[Me]||null)w=y.formAction;else if(Ih(f)!==null)continue}else w=y.action;typeof w=="function"?a[o+1]=w:(a.splice(o,3),o-=3),$x(a)}}}function Jx(){function e(p){p.canIntercept&&p.info==="react-transition"&&p.intercept({handler:function(){return new Promise(function(y){return f=y})},focusReset:"manual",scroll:"manual"})}function t(){f!==null&&(f(),f=null),o||setTimeout(a,20)}function a(){if(!o&&!navigation.transition){var p=navigation.currentEntry;p&&p.url!=null&&navigation.navigate(p.url,{state:p.getState(),info:"react-transition",history:"replace"})}}if(typeof navigation=="object"){var o=!1,f=null;return navigation.addEventListener("navigate",e),navigation.addEventListener("navigatesuccess",t),navigation.addEventListener("navigateerror",t),setTimeout(a,100),function(){o=!0,navigation.removeEventListener("navigate",e),navigation.removeEventListener("navigatesuccess",t),navigation.removeEventListener("navigateerror",t),f!==null&&(f(),f=null)}}}function ep(e){this._internalRoot=e}Pu.prototype.render=ep.prototype.render=function(e){var t=this._internalRoot;if(t===null)throw Error(s(409));var a=t.current,o=la();Yx(a,o,e,t,null,null)},Pu.prototype.unmount=ep.prototype.unmount=function(){var e=this._internalRoot;if(e!==null){this._internalRoot=null;var t=e.containerInfo;Yx(e.current,2,null,e,null,null),gu(),t[Qe]=null}};function Pu(e){this._internalRoot=e}Pu.prototype.unstable_scheduleHydration=function(e){if(e){var t=Oe();e={blockedOn:null,target:e,priority:t};for(var a=0;a<Ar.length&&t!==0&&t<Ar[a].priority;a++);Ar.splice(a,0,e),a===0&&Kx(e)}};var Ix=n.version;if(Ix!=="19.2.3")throw Error(s(527,Ix,"19.2.3"));K.findDOMNode=function(e){var t=e._reactInternals;if(t===void 0)throw typeof e.render=="function"?Error(s(188)):(e=Object.keys(e).join(","),Error(s(268,e)));return e=m(t),e=e!==null?x(e):null,e=e===null?null:e.stateNode,e};var O3={bundleType:0,version:"19.2.3",rendererPackageName:"react-dom",currentDispatcherRef:H,reconcilerVersion:"19.2.3"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var Lu=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Lu.isDisabled&&Lu.supportsFiber)try{ns=Lu.inject(O3),Tt=Lu}catch{}}return ko.createRoot=function(e,t){if(!l(e))throw Error(s(299));var a=!1,o="",f=r0,p=i0,y=l0;return t!=null&&(t.unstable_strictMode===!0&&(a=!0),t.identifierPrefix!==void 0&&(o=t.identifierPrefix),t.onUncaughtError!==void 0&&(f=t.onUncaughtError),t.onCaughtError!==void 0&&(p=t.onCaughtError),t.onRecoverableError!==void 0&&(y=t.onRecoverableError)),t=Bx(e,1,!1,null,null,a,o,null,f,p,y,Jx),e[Qe]=t.current,Oh(e),new ep(t)},ko.hydrateRoot=function(e,t,a){if(!l(e))throw Error(s(299));var o=!1,f="",p=r0,y=i0,w=l0,D=null;return a!=null&&(a.unstable_strictMode===!0&&(o=!0),a.identifierPrefix!==void 0&&(f=a.identifierPrefix),a.onUncaughtError!==void 0&&(p=a.onUncaughtError),a.onCaughtError!==void 0&&(y=a.onCaughtError),a.onRecoverableError!==void 0&&(w=a.onRecoverableError),a.formState!==void 0&&(D=a.formState)),t=Bx(e,1,!0,t,a??null,o,f,D,p,y,w,Jx),t.context=Fx(null),a=t.current,o=la(),o=Se(o),f=or(o),f.callback=null,cr(a,f,o),a=o,t.current.lanes=a,xe(t,a),us(t),e[Qe]=t.current,Oh(e),new Pu(t)},ko.version="19.2.3",ko}var ov;function V3(){if(ov)return ap.exports;ov=1;function i(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(i)}catch(n){console.error(n)}}return i(),ap.exports=G3(),ap.exports}var X3=V3();var cv="popstate";function Z3(i={}){function n(s,l){let{pathname:c,search:u,hash:d}=s.location;return Lp("",{pathname:c,search:u,hash:d},l.state&&l.state.usr||null,l.state&&l.state.key||"default")}function r(s,l){return typeof l=="string"?l:lc(l)}return Q3(n,r,null,i)}function At(i,n){if(i===!1||i===null||typeof i>"u")throw new Error(n)}function Ga(i,n){if(!i){typeof console<"u"&&console.warn(n);try{throw new Error(n)}catch{}}}function K3(){return Math.random().toString(36).substring(2,10)}function uv(i,n){return{usr:i.state,key:i.key,idx:n}}function Lp(i,n,r=null,s){return{pathname:typeof i=="string"?i:i.pathname,search:"",hash:"",...typeof n=="string"?Bl(n):n,state:r,key:n&&n.key||s||K3()}}function lc({pathname:i="/",search:n="",hash:r=""}){return n&&n!=="?"&&(i+=n.charAt(0)==="?"?n:"?"+n),r&&r!=="#"&&(i+=r.charAt(0)==="#"?r:"#"+r),i}function Bl(i){let n={};if(i){let r=i.indexOf("#");r>=0&&(n.hash=i.substring(r),i=i.substring(0,r));let s=i.indexOf("?");s>=0&&(n.search=i.substring(s),i=i.substring(0,s)),i&&(n.pathname=i)}return n}function Q3(i,n,r,s={}){let{window:l=document.defaultView,v5Compat:c=!1}=s,u=l.history,d="POP",g=null,m=x();m==null&&(m=0,u.replaceState({...u.state,idx:m},""));function x(){return(u.state||{idx:null}).idx}function v(){d="POP";let T=x(),j=T==null?null:T-m;m=T,g&&g({action:d,location:_.location,delta:j})}function S(T,j){d="PUSH";let E=Lp(_.location,T,j);m=x()+1;let M=uv(E,m),R=_.createHref(E);try{u.pushState(M,"",R)}catch(O){if(O instanceof DOMException&&O.name==="DataCloneError")throw O;l.location.assign(R)}c&&g&&g({action:d,location:_.location,delta:1})}function A(T,j){d="REPLACE";let E=Lp(_.location,T,j);m=x();let M=uv(E,m),R=_.createHref(E);u.replaceState(M,"",R),c&&g&&g({action:d,location:_.location,delta:0})}function N(T){return $3(T)}let _={get action(){return d},get location(){return i(l,u)},listen(T){if(g)throw new Error("A history only accepts one active listener");return l.addEventListener(cv,v),g=T,()=>{l.removeEventListener(cv,v),g=null}},createHref(T){return n(l,T)},createURL:N,encodeLocation(T){let j=N(T);return{pathname:j.pathname,search:j.search,hash:j.hash}},push:S,replace:A,go(T){return u.go(T)}};return _}function $3(i,n=!1){let r="http://localhost";typeof window<"u"&&(r=window.location.origin!=="null"?window.location.origin:window.location.href),At(r,"No window.location.(origin|href) available to create URL");let s=typeof i=="string"?i:lc(i);return s=s.replace(/ $/,"%20"),!n&&s.startsWith("//")&&(s=r+s),new URL(s,r)}function Ny(i,n,r="/"){return J3(i,n,r,!1)}function J3(i,n,r,s){let l=typeof n=="string"?Bl(n):n,c=Qs(l.pathname||"/",r);if(c==null)return null;let u=jy(i);I3(u);let d=null;for(let g=0;d==null&&g<u.length;++g){let m=cA(c);d=lA(u[g],m,s)}return d}function jy(i,n=[],r=[],s="",l=!1){let c=(u,d,g=l,m)=>{let x={relativePath:m===void 0?u.path||"":m,caseSensitive:u.caseSensitive===!0,childrenIndex:d,route:u};if(x.relativePath.startsWith("/")){if(!x.relativePath.startsWith(s)&&g)return;At(x.relativePath.startsWith(s),`Absolute route path "${x.relativePath}" nested under path "${s}" is not valid. An absolute child route path must start with the combined path of all its parent routes.`),x.relativePath=x.relativePath.slice(s.length)}let v=Zs([s,x.relativePath]),S=r.concat(x);u.children&&u.children.length>0&&(At(u.index!==!0,`Index routes must not have child routes. Please remove all child routes from route path "${v}".`),jy(u.children,n,S,v,g)),!(u.path==null&&!u.index)&&n.push({path:v,score:rA(v,u.index),routesMeta:S})};return i.forEach((u,d)=>{if(u.path===""||!u.path?.includes("?"))c(u,d);else for(let g of Ey(u.path))c(u,d,!0,g)}),n}function Ey(i){let n=i.split("/");if(n.length===0)return[];let[r,...s]=n,l=r.endsWith("?"),c=r.replace(/\?$/,"");if(s.length===0)return l?[c,""]:[c];let u=Ey(s.join("/")),d=[];return d.push(...u.map(g=>g===""?c:[c,g].join("/"))),l&&d.push(...u),d.map(g=>i.startsWith("/")&&g===""?"/":g)}function I3(i){i.sort((n,r)=>n.score!==r.score?r.score-n.score:iA(n.routesMeta.map(s=>s.childrenIndex),r.routesMeta.map(s=>s.childrenIndex)))}var W3=/^:[\w-]+$/,eA=3,tA=2,nA=1,aA=10,sA=-2,fv=i=>i==="*";function rA(i,n){let r=i.split("/"),s=r.length;return r.some(fv)&&(s+=sA),n&&(s+=tA),r.filter(l=>!fv(l)).reduce((l,c)=>l+(W3.test(c)?eA:c===""?nA:aA),s)}function iA(i,n){return i.length===n.length&&i.slice(0,-1).every((s,l)=>s===n[l])?i[i.length-1]-n[n.length-1]:0}function lA(i,n,r=!1){let{routesMeta:s}=i,l={},c="/",u=[];for(let d=0;d<s.length;++d){let g=s[d],m=d===s.length-1,x=c==="/"?n:n.slice(c.length)||"/",v=yf({path:g.relativePath,caseSensitive:g.caseSensitive,end:m},x),S=g.route;if(!v&&m&&r&&!s[s.length-1].route.index&&(v=yf({path:g.relativePath,caseSensitive:g.caseSensitive,end:!1},x)),!v)return null;Object.assign(l,v.params),u.push({params:l,pathname:Zs([c,v.pathname]),pathnameBase:hA(Zs([c,v.pathnameBase])),route:S}),v.pathnameBase!=="/"&&(c=Zs([c,v.pathnameBase]))}return u}function yf(i,n){typeof i=="string"&&(i={path:i,caseSensitive:!1,end:!0});let[r,s]=oA(i.path,i.caseSensitive,i.end),l=n.match(r);if(!l)return null;let c=l[0],u=c.replace(/(.)\/+$/,"$1"),d=l.slice(1);return{params:s.reduce((m,{paramName:x,isOptional:v},S)=>{if(x==="*"){let N=d[S]||"";u=c.slice(0,c.length-N.length).replace(/(.)\/+$/,"$1")}const A=d[S];return v&&!A?m[x]=void 0:m[x]=(A||"").replace(/%2F/g,"/"),m},{}),pathname:c,pathnameBase:u,pattern:i}}function oA(i,n=!1,r=!0){Ga(i==="*"||!i.endsWith("*")||i.endsWith("/*"),`Route path "${i}" will be treated as if it were "${i.replace(/\*$/,"/*")}" because the \`*\` character must always follow a \`/\` in the pattern. To get rid of this warning, please change the route path to "${i.replace(/\*$/,"/*")}".`);let s=[],l="^"+i.replace(/\/*\*?$/,"").replace(/^\/*/,"/").replace(/[\\.*+^${}|()[\]]/g,"\\$&").replace(/\/:([\w-]+)(\?)?/g,(u,d,g)=>(s.push({paramName:d,isOptional:g!=null}),g?"/?([^\\/]+)?":"/([^\\/]+)")).replace(/\/([\w-]+)\?(\/|$)/g,"(/$1)?$2");return i.endsWith("*")?(s.push({paramName:"*"}),l+=i==="*"||i==="/*"?"(.*)$":"(?:\\/(.+)|\\/*)$"):r?l+="\\/*$":i!==""&&i!=="/"&&(l+="(?:(?=\\/|$))"),[new RegExp(l,n?void 0:"i"),s]}function cA(i){try{return i.split("/").map(n=>decodeURIComponent(n).replace(/\//g,"%2F")).join("/")}catch(n){return Ga(!1,`The URL path "${i}" could not be decoded because it is a malformed URL segment. This is probably due to a bad percent encoding (${n}).`),i}}function Qs(i,n){if(n==="/")return i;if(!i.toLowerCase().startsWith(n.toLowerCase()))return null;let r=n.endsWith("/")?n.length-1:n.length,s=i.charAt(r);return s&&s!=="/"?null:i.slice(r)||"/"}var uA=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i;function fA(i,n="/"){let{pathname:r,search:s="",hash:l=""}=typeof i=="string"?Bl(i):i,c;return r?(r=r.replace(/\/\/+/g,"/"),r.startsWith("/")?c=dv(r.substring(1),"/"):c=dv(r,n)):c=n,{pathname:c,search:pA(s),hash:mA(l)}}function dv(i,n){let r=n.replace(/\/+$/,"").split("/");return i.split("/").forEach(l=>{l===".."?r.length>1&&r.pop():l!=="."&&r.push(l)}),r.length>1?r.join("/"):"/"}function lp(i,n,r,s){return`Cannot include a '${i}' character in a manually specified \`to.${n}\` field [${JSON.stringify(s)}].  Please separate it out to the \`to.${r}\` field. Alternatively you may provide the full path as a string in <Link to="..."> and the router will parse it for you.`}function dA(i){return i.filter((n,r)=>r===0||n.route.path&&n.route.path.length>0)}function Sm(i){let n=dA(i);return n.map((r,s)=>s===n.length-1?r.pathname:r.pathnameBase)}function Am(i,n,r,s=!1){let l;typeof i=="string"?l=Bl(i):(l={...i},At(!l.pathname||!l.pathname.includes("?"),lp("?","pathname","search",l)),At(!l.pathname||!l.pathname.includes("#"),lp("#","pathname","hash",l)),At(!l.search||!l.search.includes("#"),lp("#","search","hash",l)));let c=i===""||l.pathname==="",u=c?"/":l.pathname,d;if(u==null)d=r;else{let v=n.length-1;if(!s&&u.startsWith("..")){let S=u.split("/");for(;S[0]==="..";)S.shift(),v-=1;l.pathname=S.join("/")}d=v>=0?n[v]:"/"}let g=fA(l,d),m=u&&u!=="/"&&u.endsWith("/"),x=(c||u===".")&&r.endsWith("/");return!g.pathname.endsWith("/")&&(m||x)&&(g.pathname+="/"),g}var Zs=i=>i.join("/").replace(/\/\/+/g,"/"),hA=i=>i.replace(/\/+$/,"").replace(/^\/*/,"/"),pA=i=>!i||i==="?"?"":i.startsWith("?")?i:"?"+i,mA=i=>!i||i==="#"?"":i.startsWith("#")?i:"#"+i,gA=class{constructor(i,n,r,s=!1){this.status=i,this.statusText=n||"",this.internal=s,r instanceof Error?(this.data=r.toString(),this.error=r):this.data=r}};function xA(i){return i!=null&&typeof i.status=="number"&&typeof i.statusText=="string"&&typeof i.internal=="boolean"&&"data"in i}function vA(i){return i.map(n=>n.route.path).filter(Boolean).join("/").replace(/\/\/*/g,"/")||"/"}var Cy=typeof window<"u"&&typeof window.document<"u"&&typeof window.document.createElement<"u";function zy(i,n){let r=i;if(typeof r!="string"||!uA.test(r))return{absoluteURL:void 0,isExternal:!1,to:r};let s=r,l=!1;if(Cy)try{let c=new URL(window.location.href),u=r.startsWith("//")?new URL(c.protocol+r):new URL(r),d=Qs(u.pathname,n);u.origin===c.origin&&d!=null?r=d+u.search+u.hash:l=!0}catch{Ga(!1,`<Link to="${r}"> contains an invalid URL which will probably break when clicked - please update to a valid URL path.`)}return{absoluteURL:s,isExternal:l,to:r}}Object.getOwnPropertyNames(Object.prototype).sort().join("\0");var Ry=["POST","PUT","PATCH","DELETE"];new Set(Ry);var yA=["GET",...Ry];new Set(yA);var Fl=b.createContext(null);Fl.displayName="DataRouter";var Pf=b.createContext(null);Pf.displayName="DataRouterState";var bA=b.createContext(!1),My=b.createContext({isTransitioning:!1});My.displayName="ViewTransition";var _A=b.createContext(new Map);_A.displayName="Fetchers";var SA=b.createContext(null);SA.displayName="Await";var ya=b.createContext(null);ya.displayName="Navigation";var bc=b.createContext(null);bc.displayName="Location";var _s=b.createContext({outlet:null,matches:[],isDataRoute:!1});_s.displayName="Route";var Tm=b.createContext(null);Tm.displayName="RouteError";var Dy="REACT_ROUTER_ERROR",AA="REDIRECT",TA="ROUTE_ERROR_RESPONSE";function wA(i){if(i.startsWith(`${Dy}:${AA}:{`))try{let n=JSON.parse(i.slice(28));if(typeof n=="object"&&n&&typeof n.status=="number"&&typeof n.statusText=="string"&&typeof n.location=="string"&&typeof n.reloadDocument=="boolean"&&typeof n.replace=="boolean")return n}catch{}}function NA(i){if(i.startsWith(`${Dy}:${TA}:{`))try{let n=JSON.parse(i.slice(40));if(typeof n=="object"&&n&&typeof n.status=="number"&&typeof n.statusText=="string")return new gA(n.status,n.statusText,n.data)}catch{}}function jA(i,{relative:n}={}){At(Yl(),"useHref() may be used only in the context of a <Router> component.");let{basename:r,navigator:s}=b.useContext(ya),{hash:l,pathname:c,search:u}=_c(i,{relative:n}),d=c;return r!=="/"&&(d=c==="/"?r:Zs([r,c])),s.createHref({pathname:d,search:u,hash:l})}function Yl(){return b.useContext(bc)!=null}function Ss(){return At(Yl(),"useLocation() may be used only in the context of a <Router> component."),b.useContext(bc).location}var ky="You should call navigate() in a React.useEffect(), not when your component is first rendered.";function Oy(i){b.useContext(ya).static||b.useLayoutEffect(i)}function Ei(){let{isDataRoute:i}=b.useContext(_s);return i?BA():EA()}function EA(){At(Yl(),"useNavigate() may be used only in the context of a <Router> component.");let i=b.useContext(Fl),{basename:n,navigator:r}=b.useContext(ya),{matches:s}=b.useContext(_s),{pathname:l}=Ss(),c=JSON.stringify(Sm(s)),u=b.useRef(!1);return Oy(()=>{u.current=!0}),b.useCallback((g,m={})=>{if(Ga(u.current,ky),!u.current)return;if(typeof g=="number"){r.go(g);return}let x=Am(g,JSON.parse(c),l,m.relative==="path");i==null&&n!=="/"&&(x.pathname=x.pathname==="/"?n:Zs([n,x.pathname])),(m.replace?r.replace:r.push)(x,m.state,m)},[n,r,c,l,i])}b.createContext(null);function _c(i,{relative:n}={}){let{matches:r}=b.useContext(_s),{pathname:s}=Ss(),l=JSON.stringify(Sm(r));return b.useMemo(()=>Am(i,JSON.parse(l),s,n==="path"),[i,l,s,n])}function CA(i,n){return Py(i,n)}function Py(i,n,r,s,l){At(Yl(),"useRoutes() may be used only in the context of a <Router> component.");let{navigator:c}=b.useContext(ya),{matches:u}=b.useContext(_s),d=u[u.length-1],g=d?d.params:{},m=d?d.pathname:"/",x=d?d.pathnameBase:"/",v=d&&d.route;{let E=v&&v.path||"";Uy(m,!v||E.endsWith("*")||E.endsWith("*?"),`You rendered descendant <Routes> (or called \`useRoutes()\`) at "${m}" (under <Route path="${E}">) but the parent route path has no trailing "*". This means if you navigate deeper, the parent won't match anymore and therefore the child routes will never render.
-
-Please change the parent <Route path="${E}"> to <Route path="${E==="/"?"*":`${E}/*`}">.`)}let S=Ss(),A;if(n){let E=typeof n=="string"?Bl(n):n;At(x==="/"||E.pathname?.startsWith(x),`When overriding the location using \`<Routes location>\` or \`useRoutes(routes, location)\`, the location pathname must begin with the portion of the URL pathname that was matched by all parent routes. The current pathname base is "${x}" but pathname "${E.pathname}" was given in the \`location\` prop.`),A=E}else A=S;let N=A.pathname||"/",_=N;if(x!=="/"){let E=x.replace(/^\//,"").split("/");_="/"+N.replace(/^\//,"").split("/").slice(E.length).join("/")}let T=Ny(i,{pathname:_});Ga(v||T!=null,`No routes matched location "${A.pathname}${A.search}${A.hash}" `),Ga(T==null||T[T.length-1].route.element!==void 0||T[T.length-1].route.Component!==void 0||T[T.length-1].route.lazy!==void 0,`Matched leaf route at location "${A.pathname}${A.search}${A.hash}" does not have an element or Component. This means it will render an <Outlet /> with a null value by default resulting in an "empty" page.`);let j=kA(T&&T.map(E=>Object.assign({},E,{params:Object.assign({},g,E.params),pathname:Zs([x,c.encodeLocation?c.encodeLocation(E.pathname.replace(/\?/g,"%3F").replace(/#/g,"%23")).pathname:E.pathname]),pathnameBase:E.pathnameBase==="/"?x:Zs([x,c.encodeLocation?c.encodeLocation(E.pathnameBase.replace(/\?/g,"%3F").replace(/#/g,"%23")).pathname:E.pathnameBase])})),u,r,s,l);return n&&j?b.createElement(bc.Provider,{value:{location:{pathname:"/",search:"",hash:"",state:null,key:"default",...A},navigationType:"POP"}},j):j}function zA(){let i=HA(),n=xA(i)?`${i.status} ${i.statusText}`:i instanceof Error?i.message:JSON.stringify(i),r=i instanceof Error?i.stack:null,s="rgba(200,200,200, 0.5)",l={padding:"0.5rem",backgroundColor:s},c={padding:"2px 4px",backgroundColor:s},u=null;return console.error("Error handled by React Router default ErrorBoundary:",i),u=b.createElement(b.Fragment,null,b.createElement("p",null,"💿 Hey developer 👋"),b.createElement("p",null,"You can provide a way better UX than this when your app throws errors by providing your own ",b.createElement("code",{style:c},"ErrorBoundary")," or"," ",b.createElement("code",{style:c},"errorElement")," prop on your route.")),b.createElement(b.Fragment,null,b.createElement("h2",null,"Unexpected Application Error!"),b.createElement("h3",{style:{fontStyle:"italic"}},n),r?b.createElement("pre",{style:l},r):null,u)}var RA=b.createElement(zA,null),Ly=class extends b.Component{constructor(i){super(i),this.state={location:i.location,revalidation:i.revalidation,error:i.error}}static getDerivedStateFromError(i){return{error:i}}static getDerivedStateFromProps(i,n){return n.location!==i.location||n.revalidation!=="idle"&&i.revalidation==="idle"?{error:i.error,location:i.location,revalidation:i.revalidation}:{error:i.error!==void 0?i.error:n.error,location:n.location,revalidation:i.revalidation||n.revalidation}}componentDidCatch(i,n){this.props.onError?this.props.onError(i,n):console.error("React Router caught the following error during render",i)}render(){let i=this.state.error;if(this.context&&typeof i=="object"&&i&&"digest"in i&&typeof i.digest=="string"){const r=NA(i.digest);r&&(i=r)}let n=i!==void 0?b.createElement(_s.Provider,{value:this.props.routeContext},b.createElement(Tm.Provider,{value:i,children:this.props.component})):this.props.children;return this.context?b.createElement(MA,{error:i},n):n}};Ly.contextType=bA;var op=new WeakMap;function MA({children:i,error:n}){let{basename:r}=b.useContext(ya);if(typeof n=="object"&&n&&"digest"in n&&typeof n.digest=="string"){let s=wA(n.digest);if(s){let l=op.get(n);if(l)throw l;let c=zy(s.location,r);if(Cy&&!op.get(n))if(c.isExternal||s.reloadDocument)window.location.href=c.absoluteURL||c.to;else{const u=Promise.resolve().then(()=>window.__reactRouterDataRouter.navigate(c.to,{replace:s.replace}));throw op.set(n,u),u}return b.createElement("meta",{httpEquiv:"refresh",content:`0;url=${c.absoluteURL||c.to}`})}}return i}function DA({routeContext:i,match:n,children:r}){let s=b.useContext(Fl);return s&&s.static&&s.staticContext&&(n.route.errorElement||n.route.ErrorBoundary)&&(s.staticContext._deepestRenderedBoundaryId=n.route.id),b.createElement(_s.Provider,{value:i},r)}function kA(i,n=[],r=null,s=null,l=null){if(i==null){if(!r)return null;if(r.errors)i=r.matches;else if(n.length===0&&!r.initialized&&r.matches.length>0)i=r.matches;else return null}let c=i,u=r?.errors;if(u!=null){let x=c.findIndex(v=>v.route.id&&u?.[v.route.id]!==void 0);At(x>=0,`Could not find a matching route for errors on route IDs: ${Object.keys(u).join(",")}`),c=c.slice(0,Math.min(c.length,x+1))}let d=!1,g=-1;if(r)for(let x=0;x<c.length;x++){let v=c[x];if((v.route.HydrateFallback||v.route.hydrateFallbackElement)&&(g=x),v.route.id){let{loaderData:S,errors:A}=r,N=v.route.loader&&!S.hasOwnProperty(v.route.id)&&(!A||A[v.route.id]===void 0);if(v.route.lazy||N){d=!0,g>=0?c=c.slice(0,g+1):c=[c[0]];break}}}let m=r&&s?(x,v)=>{s(x,{location:r.location,params:r.matches?.[0]?.params??{},unstable_pattern:vA(r.matches),errorInfo:v})}:void 0;return c.reduceRight((x,v,S)=>{let A,N=!1,_=null,T=null;r&&(A=u&&v.route.id?u[v.route.id]:void 0,_=v.route.errorElement||RA,d&&(g<0&&S===0?(Uy("route-fallback",!1,"No `HydrateFallback` element provided to render during initial hydration"),N=!0,T=null):g===S&&(N=!0,T=v.route.hydrateFallbackElement||null)));let j=n.concat(c.slice(0,S+1)),E=()=>{let M;return A?M=_:N?M=T:v.route.Component?M=b.createElement(v.route.Component,null):v.route.element?M=v.route.element:M=x,b.createElement(DA,{match:v,routeContext:{outlet:x,matches:j,isDataRoute:r!=null},children:M})};return r&&(v.route.ErrorBoundary||v.route.errorElement||S===0)?b.createElement(Ly,{location:r.location,revalidation:r.revalidation,component:_,error:A,children:E(),routeContext:{outlet:null,matches:j,isDataRoute:!0},onError:m}):E()},null)}function wm(i){return`${i} must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.`}function OA(i){let n=b.useContext(Fl);return At(n,wm(i)),n}function PA(i){let n=b.useContext(Pf);return At(n,wm(i)),n}function LA(i){let n=b.useContext(_s);return At(n,wm(i)),n}function Nm(i){let n=LA(i),r=n.matches[n.matches.length-1];return At(r.route.id,`${i} can only be used on routes that contain a unique "id"`),r.route.id}function UA(){return Nm("useRouteId")}function HA(){let i=b.useContext(Tm),n=PA("useRouteError"),r=Nm("useRouteError");return i!==void 0?i:n.errors?.[r]}function BA(){let{router:i}=OA("useNavigate"),n=Nm("useNavigate"),r=b.useRef(!1);return Oy(()=>{r.current=!0}),b.useCallback(async(l,c={})=>{Ga(r.current,ky),r.current&&(typeof l=="number"?await i.navigate(l):await i.navigate(l,{fromRouteId:n,...c}))},[i,n])}var hv={};function Uy(i,n,r){!n&&!hv[i]&&(hv[i]=!0,Ga(!1,r))}b.memo(FA);function FA({routes:i,future:n,state:r,onError:s}){return Py(i,void 0,r,s,n)}function Up({to:i,replace:n,state:r,relative:s}){At(Yl(),"<Navigate> may be used only in the context of a <Router> component.");let{static:l}=b.useContext(ya);Ga(!l,"<Navigate> must not be used on the initial render in a <StaticRouter>. This is a no-op, but you should modify your code so the <Navigate> is only ever rendered in response to some user interaction or state change.");let{matches:c}=b.useContext(_s),{pathname:u}=Ss(),d=Ei(),g=Am(i,Sm(c),u,s==="path"),m=JSON.stringify(g);return b.useEffect(()=>{d(JSON.parse(m),{replace:n,state:r,relative:s})},[d,m,s,n,r]),null}function xl(i){At(!1,"A <Route> is only ever to be used as the child of <Routes> element, never rendered directly. Please wrap your <Route> in a <Routes>.")}function YA({basename:i="/",children:n=null,location:r,navigationType:s="POP",navigator:l,static:c=!1,unstable_useTransitions:u}){At(!Yl(),"You cannot render a <Router> inside another <Router>. You should never have more than one in your app.");let d=i.replace(/^\/*/,"/"),g=b.useMemo(()=>({basename:d,navigator:l,static:c,unstable_useTransitions:u,future:{}}),[d,l,c,u]);typeof r=="string"&&(r=Bl(r));let{pathname:m="/",search:x="",hash:v="",state:S=null,key:A="default"}=r,N=b.useMemo(()=>{let _=Qs(m,d);return _==null?null:{location:{pathname:_,search:x,hash:v,state:S,key:A},navigationType:s}},[d,m,x,v,S,A,s]);return Ga(N!=null,`<Router basename="${d}"> is not able to match the URL "${m}${x}${v}" because it does not start with the basename, so the <Router> won't render anything.`),N==null?null:b.createElement(ya.Provider,{value:g},b.createElement(bc.Provider,{children:n,value:N}))}function qA({children:i,location:n}){return CA(Hp(i),n)}function Hp(i,n=[]){let r=[];return b.Children.forEach(i,(s,l)=>{if(!b.isValidElement(s))return;let c=[...n,l];if(s.type===b.Fragment){r.push.apply(r,Hp(s.props.children,c));return}At(s.type===xl,`[${typeof s.type=="string"?s.type:s.type.name}] is not a <Route> component. All component children of <Routes> must be a <Route> or <React.Fragment>`),At(!s.props.index||!s.props.children,"An index route cannot have child routes.");let u={id:s.props.id||c.join("-"),caseSensitive:s.props.caseSensitive,element:s.props.element,Component:s.props.Component,index:s.props.index,path:s.props.path,middleware:s.props.middleware,loader:s.props.loader,action:s.props.action,hydrateFallbackElement:s.props.hydrateFallbackElement,HydrateFallback:s.props.HydrateFallback,errorElement:s.props.errorElement,ErrorBoundary:s.props.ErrorBoundary,hasErrorBoundary:s.props.hasErrorBoundary===!0||s.props.ErrorBoundary!=null||s.props.errorElement!=null,shouldRevalidate:s.props.shouldRevalidate,handle:s.props.handle,lazy:s.props.lazy};s.props.children&&(u.children=Hp(s.props.children,c)),r.push(u)}),r}var rf="get",lf="application/x-www-form-urlencoded";function Lf(i){return typeof HTMLElement<"u"&&i instanceof HTMLElement}function GA(i){return Lf(i)&&i.tagName.toLowerCase()==="button"}function VA(i){return Lf(i)&&i.tagName.toLowerCase()==="form"}function XA(i){return Lf(i)&&i.tagName.toLowerCase()==="input"}function ZA(i){return!!(i.metaKey||i.altKey||i.ctrlKey||i.shiftKey)}function KA(i,n){return i.button===0&&(!n||n==="_self")&&!ZA(i)}function Bp(i=""){return new URLSearchParams(typeof i=="string"||Array.isArray(i)||i instanceof URLSearchParams?i:Object.keys(i).reduce((n,r)=>{let s=i[r];return n.concat(Array.isArray(s)?s.map(l=>[r,l]):[[r,s]])},[]))}function QA(i,n){let r=Bp(i);return n&&n.forEach((s,l)=>{r.has(l)||n.getAll(l).forEach(c=>{r.append(l,c)})}),r}var Uu=null;function $A(){if(Uu===null)try{new FormData(document.createElement("form"),0),Uu=!1}catch{Uu=!0}return Uu}var JA=new Set(["application/x-www-form-urlencoded","multipart/form-data","text/plain"]);function cp(i){return i!=null&&!JA.has(i)?(Ga(!1,`"${i}" is not a valid \`encType\` for \`<Form>\`/\`<fetcher.Form>\` and will default to "${lf}"`),null):i}function IA(i,n){let r,s,l,c,u;if(VA(i)){let d=i.getAttribute("action");s=d?Qs(d,n):null,r=i.getAttribute("method")||rf,l=cp(i.getAttribute("enctype"))||lf,c=new FormData(i)}else if(GA(i)||XA(i)&&(i.type==="submit"||i.type==="image")){let d=i.form;if(d==null)throw new Error('Cannot submit a <button> or <input type="submit"> without a <form>');let g=i.getAttribute("formaction")||d.getAttribute("action");if(s=g?Qs(g,n):null,r=i.getAttribute("formmethod")||d.getAttribute("method")||rf,l=cp(i.getAttribute("formenctype"))||cp(d.getAttribute("enctype"))||lf,c=new FormData(d,i),!$A()){let{name:m,type:x,value:v}=i;if(x==="image"){let S=m?`${m}.`:"";c.append(`${S}x`,"0"),c.append(`${S}y`,"0")}else m&&c.append(m,v)}}else{if(Lf(i))throw new Error('Cannot submit element that is not <form>, <button>, or <input type="submit|image">');r=rf,s=null,l=lf,u=i}return c&&l==="text/plain"&&(u=c,c=void 0),{action:s,method:r.toLowerCase(),encType:l,formData:c,body:u}}Object.getOwnPropertyNames(Object.prototype).sort().join("\0");function jm(i,n){if(i===!1||i===null||typeof i>"u")throw new Error(n)}function WA(i,n,r,s){let l=typeof i=="string"?new URL(i,typeof window>"u"?"server://singlefetch/":window.location.origin):i;return r?l.pathname.endsWith("/")?l.pathname=`${l.pathname}_.${s}`:l.pathname=`${l.pathname}.${s}`:l.pathname==="/"?l.pathname=`_root.${s}`:n&&Qs(l.pathname,n)==="/"?l.pathname=`${n.replace(/\/$/,"")}/_root.${s}`:l.pathname=`${l.pathname.replace(/\/$/,"")}.${s}`,l}async function eT(i,n){if(i.id in n)return n[i.id];try{let r=await import(i.module);return n[i.id]=r,r}catch(r){return console.error(`Error loading route module \`${i.module}\`, reloading page...`),console.error(r),window.__reactRouterContext&&window.__reactRouterContext.isSpaMode,window.location.reload(),new Promise(()=>{})}}function tT(i){return i==null?!1:i.href==null?i.rel==="preload"&&typeof i.imageSrcSet=="string"&&typeof i.imageSizes=="string":typeof i.rel=="string"&&typeof i.href=="string"}async function nT(i,n,r){let s=await Promise.all(i.map(async l=>{let c=n.routes[l.route.id];if(c){let u=await eT(c,r);return u.links?u.links():[]}return[]}));return iT(s.flat(1).filter(tT).filter(l=>l.rel==="stylesheet"||l.rel==="preload").map(l=>l.rel==="stylesheet"?{...l,rel:"prefetch",as:"style"}:{...l,rel:"prefetch"}))}function pv(i,n,r,s,l,c){let u=(g,m)=>r[m]?g.route.id!==r[m].route.id:!0,d=(g,m)=>r[m].pathname!==g.pathname||r[m].route.path?.endsWith("*")&&r[m].params["*"]!==g.params["*"];return c==="assets"?n.filter((g,m)=>u(g,m)||d(g,m)):c==="data"?n.filter((g,m)=>{let x=s.routes[g.route.id];if(!x||!x.hasLoader)return!1;if(u(g,m)||d(g,m))return!0;if(g.route.shouldRevalidate){let v=g.route.shouldRevalidate({currentUrl:new URL(l.pathname+l.search+l.hash,window.origin),currentParams:r[0]?.params||{},nextUrl:new URL(i,window.origin),nextParams:g.params,defaultShouldRevalidate:!0});if(typeof v=="boolean")return v}return!0}):[]}function aT(i,n,{includeHydrateFallback:r}={}){return sT(i.map(s=>{let l=n.routes[s.route.id];if(!l)return[];let c=[l.module];return l.clientActionModule&&(c=c.concat(l.clientActionModule)),l.clientLoaderModule&&(c=c.concat(l.clientLoaderModule)),r&&l.hydrateFallbackModule&&(c=c.concat(l.hydrateFallbackModule)),l.imports&&(c=c.concat(l.imports)),c}).flat(1))}function sT(i){return[...new Set(i)]}function rT(i){let n={},r=Object.keys(i).sort();for(let s of r)n[s]=i[s];return n}function iT(i,n){let r=new Set;return new Set(n),i.reduce((s,l)=>{let c=JSON.stringify(rT(l));return r.has(c)||(r.add(c),s.push({key:c,link:l})),s},[])}function Hy(){let i=b.useContext(Fl);return jm(i,"You must render this element inside a <DataRouterContext.Provider> element"),i}function lT(){let i=b.useContext(Pf);return jm(i,"You must render this element inside a <DataRouterStateContext.Provider> element"),i}var Em=b.createContext(void 0);Em.displayName="FrameworkContext";function By(){let i=b.useContext(Em);return jm(i,"You must render this element inside a <HydratedRouter> element"),i}function oT(i,n){let r=b.useContext(Em),[s,l]=b.useState(!1),[c,u]=b.useState(!1),{onFocus:d,onBlur:g,onMouseEnter:m,onMouseLeave:x,onTouchStart:v}=n,S=b.useRef(null);b.useEffect(()=>{if(i==="render"&&u(!0),i==="viewport"){let _=j=>{j.forEach(E=>{u(E.isIntersecting)})},T=new IntersectionObserver(_,{threshold:.5});return S.current&&T.observe(S.current),()=>{T.disconnect()}}},[i]),b.useEffect(()=>{if(s){let _=setTimeout(()=>{u(!0)},100);return()=>{clearTimeout(_)}}},[s]);let A=()=>{l(!0)},N=()=>{l(!1),u(!1)};return r?i!=="intent"?[c,S,{}]:[c,S,{onFocus:Oo(d,A),onBlur:Oo(g,N),onMouseEnter:Oo(m,A),onMouseLeave:Oo(x,N),onTouchStart:Oo(v,A)}]:[!1,S,{}]}function Oo(i,n){return r=>{i&&i(r),r.defaultPrevented||n(r)}}function cT({page:i,...n}){let{router:r}=Hy(),s=b.useMemo(()=>Ny(r.routes,i,r.basename),[r.routes,i,r.basename]);return s?b.createElement(fT,{page:i,matches:s,...n}):null}function uT(i){let{manifest:n,routeModules:r}=By(),[s,l]=b.useState([]);return b.useEffect(()=>{let c=!1;return nT(i,n,r).then(u=>{c||l(u)}),()=>{c=!0}},[i,n,r]),s}function fT({page:i,matches:n,...r}){let s=Ss(),{future:l,manifest:c,routeModules:u}=By(),{basename:d}=Hy(),{loaderData:g,matches:m}=lT(),x=b.useMemo(()=>pv(i,n,m,c,s,"data"),[i,n,m,c,s]),v=b.useMemo(()=>pv(i,n,m,c,s,"assets"),[i,n,m,c,s]),S=b.useMemo(()=>{if(i===s.pathname+s.search+s.hash)return[];let _=new Set,T=!1;if(n.forEach(E=>{let M=c.routes[E.route.id];!M||!M.hasLoader||(!x.some(R=>R.route.id===E.route.id)&&E.route.id in g&&u[E.route.id]?.shouldRevalidate||M.hasClientLoader?T=!0:_.add(E.route.id))}),_.size===0)return[];let j=WA(i,d,l.unstable_trailingSlashAwareDataRequests,"data");return T&&_.size>0&&j.searchParams.set("_routes",n.filter(E=>_.has(E.route.id)).map(E=>E.route.id).join(",")),[j.pathname+j.search]},[d,l.unstable_trailingSlashAwareDataRequests,g,s,c,x,n,i,u]),A=b.useMemo(()=>aT(v,c),[v,c]),N=uT(v);return b.createElement(b.Fragment,null,S.map(_=>b.createElement("link",{key:_,rel:"prefetch",as:"fetch",href:_,...r})),A.map(_=>b.createElement("link",{key:_,rel:"modulepreload",href:_,...r})),N.map(({key:_,link:T})=>b.createElement("link",{key:_,nonce:r.nonce,...T,crossOrigin:T.crossOrigin??r.crossOrigin})))}function dT(...i){return n=>{i.forEach(r=>{typeof r=="function"?r(n):r!=null&&(r.current=n)})}}var hT=typeof window<"u"&&typeof window.document<"u"&&typeof window.document.createElement<"u";try{hT&&(window.__reactRouterVersion="7.13.0")}catch{}function pT({basename:i,children:n,unstable_useTransitions:r,window:s}){let l=b.useRef();l.current==null&&(l.current=Z3({window:s,v5Compat:!0}));let c=l.current,[u,d]=b.useState({action:c.action,location:c.location}),g=b.useCallback(m=>{r===!1?d(m):b.startTransition(()=>d(m))},[r]);return b.useLayoutEffect(()=>c.listen(g),[c,g]),b.createElement(YA,{basename:i,children:n,location:u.location,navigationType:u.action,navigator:c,unstable_useTransitions:r})}var Fy=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i,di=b.forwardRef(function({onClick:n,discover:r="render",prefetch:s="none",relative:l,reloadDocument:c,replace:u,state:d,target:g,to:m,preventScrollReset:x,viewTransition:v,unstable_defaultShouldRevalidate:S,...A},N){let{basename:_,unstable_useTransitions:T}=b.useContext(ya),j=typeof m=="string"&&Fy.test(m),E=zy(m,_);m=E.to;let M=jA(m,{relative:l}),[R,O,P]=oT(s,A),z=vT(m,{replace:u,state:d,target:g,preventScrollReset:x,relative:l,viewTransition:v,unstable_defaultShouldRevalidate:S,unstable_useTransitions:T});function C(W){n&&n(W),W.defaultPrevented||z(W)}let G=b.createElement("a",{...A,...P,href:E.absoluteURL||M,onClick:E.isExternal||c?n:C,ref:dT(N,O),target:g,"data-discover":!j&&r==="render"?"true":void 0});return R&&!j?b.createElement(b.Fragment,null,G,b.createElement(cT,{page:M})):G});di.displayName="Link";var mT=b.forwardRef(function({"aria-current":n="page",caseSensitive:r=!1,className:s="",end:l=!1,style:c,to:u,viewTransition:d,children:g,...m},x){let v=_c(u,{relative:m.relative}),S=Ss(),A=b.useContext(Pf),{navigator:N,basename:_}=b.useContext(ya),T=A!=null&&TT(v)&&d===!0,j=N.encodeLocation?N.encodeLocation(v).pathname:v.pathname,E=S.pathname,M=A&&A.navigation&&A.navigation.location?A.navigation.location.pathname:null;r||(E=E.toLowerCase(),M=M?M.toLowerCase():null,j=j.toLowerCase()),M&&_&&(M=Qs(M,_)||M);const R=j!=="/"&&j.endsWith("/")?j.length-1:j.length;let O=E===j||!l&&E.startsWith(j)&&E.charAt(R)==="/",P=M!=null&&(M===j||!l&&M.startsWith(j)&&M.charAt(j.length)==="/"),z={isActive:O,isPending:P,isTransitioning:T},C=O?n:void 0,G;typeof s=="function"?G=s(z):G=[s,O?"active":null,P?"pending":null,T?"transitioning":null].filter(Boolean).join(" ");let W=typeof c=="function"?c(z):c;return b.createElement(di,{...m,"aria-current":C,className:G,ref:x,style:W,to:u,viewTransition:d},typeof g=="function"?g(z):g)});mT.displayName="NavLink";var gT=b.forwardRef(({discover:i="render",fetcherKey:n,navigate:r,reloadDocument:s,replace:l,state:c,method:u=rf,action:d,onSubmit:g,relative:m,preventScrollReset:x,viewTransition:v,unstable_defaultShouldRevalidate:S,...A},N)=>{let{unstable_useTransitions:_}=b.useContext(ya),T=ST(),j=AT(d,{relative:m}),E=u.toLowerCase()==="get"?"get":"post",M=typeof d=="string"&&Fy.test(d),R=O=>{if(g&&g(O),O.defaultPrevented)return;O.preventDefault();let P=O.nativeEvent.submitter,z=P?.getAttribute("formmethod")||u,C=()=>T(P||O.currentTarget,{fetcherKey:n,method:z,navigate:r,replace:l,state:c,relative:m,preventScrollReset:x,viewTransition:v,unstable_defaultShouldRevalidate:S});_&&r!==!1?b.startTransition(()=>C()):C()};return b.createElement("form",{ref:N,method:E,action:j,onSubmit:s?g:R,...A,"data-discover":!M&&i==="render"?"true":void 0})});gT.displayName="Form";function xT(i){return`${i} must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.`}function Yy(i){let n=b.useContext(Fl);return At(n,xT(i)),n}function vT(i,{target:n,replace:r,state:s,preventScrollReset:l,relative:c,viewTransition:u,unstable_defaultShouldRevalidate:d,unstable_useTransitions:g}={}){let m=Ei(),x=Ss(),v=_c(i,{relative:c});return b.useCallback(S=>{if(KA(S,n)){S.preventDefault();let A=r!==void 0?r:lc(x)===lc(v),N=()=>m(i,{replace:A,state:s,preventScrollReset:l,relative:c,viewTransition:u,unstable_defaultShouldRevalidate:d});g?b.startTransition(()=>N()):N()}},[x,m,v,r,s,n,i,l,c,u,d,g])}function yT(i){Ga(typeof URLSearchParams<"u","You cannot use the `useSearchParams` hook in a browser that does not support the URLSearchParams API. If you need to support Internet Explorer 11, we recommend you load a polyfill such as https://github.com/ungap/url-search-params.");let n=b.useRef(Bp(i)),r=b.useRef(!1),s=Ss(),l=b.useMemo(()=>QA(s.search,r.current?null:n.current),[s.search]),c=Ei(),u=b.useCallback((d,g)=>{const m=Bp(typeof d=="function"?d(new URLSearchParams(l)):d);r.current=!0,c("?"+m,g)},[c,l]);return[l,u]}var bT=0,_T=()=>`__${String(++bT)}__`;function ST(){let{router:i}=Yy("useSubmit"),{basename:n}=b.useContext(ya),r=UA(),s=i.fetch,l=i.navigate;return b.useCallback(async(c,u={})=>{let{action:d,method:g,encType:m,formData:x,body:v}=IA(c,n);if(u.navigate===!1){let S=u.fetcherKey||_T();await s(S,r,u.action||d,{unstable_defaultShouldRevalidate:u.unstable_defaultShouldRevalidate,preventScrollReset:u.preventScrollReset,formData:x,body:v,formMethod:u.method||g,formEncType:u.encType||m,flushSync:u.flushSync})}else await l(u.action||d,{unstable_defaultShouldRevalidate:u.unstable_defaultShouldRevalidate,preventScrollReset:u.preventScrollReset,formData:x,body:v,formMethod:u.method||g,formEncType:u.encType||m,replace:u.replace,state:u.state,fromRouteId:r,flushSync:u.flushSync,viewTransition:u.viewTransition})},[s,l,n,r])}function AT(i,{relative:n}={}){let{basename:r}=b.useContext(ya),s=b.useContext(_s);At(s,"useFormAction must be used inside a RouteContext");let[l]=s.matches.slice(-1),c={..._c(i||".",{relative:n})},u=Ss();if(i==null){c.search=u.search;let d=new URLSearchParams(c.search),g=d.getAll("index");if(g.some(x=>x==="")){d.delete("index"),g.filter(v=>v).forEach(v=>d.append("index",v));let x=d.toString();c.search=x?`?${x}`:""}}return(!i||i===".")&&l.route.index&&(c.search=c.search?c.search.replace(/^\?/,"?index&"):"?index"),r!=="/"&&(c.pathname=c.pathname==="/"?r:Zs([r,c.pathname])),lc(c)}function TT(i,{relative:n}={}){let r=b.useContext(My);At(r!=null,"`useViewTransitionState` must be used within `react-router-dom`'s `RouterProvider`.  Did you accidentally import `RouterProvider` from `react-router`?");let{basename:s}=Yy("useViewTransitionState"),l=_c(i,{relative:n});if(!r.isTransitioning)return!1;let c=Qs(r.currentLocation.pathname,s)||r.currentLocation.pathname,u=Qs(r.nextLocation.pathname,s)||r.nextLocation.pathname;return yf(l.pathname,u)!=null||yf(l.pathname,c)!=null}var qy=wy();const wT=Ty(qy);function qs(i){if(i===void 0)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return i}function Gy(i,n){i.prototype=Object.create(n.prototype),i.prototype.constructor=i,i.__proto__=n}var ga={autoSleep:120,force3D:"auto",nullTargetWarn:1,units:{lineHeight:""}},zl={duration:.5,overwrite:!1,delay:0},Cm,pn,St,Fa=1e8,ct=1/Fa,Fp=Math.PI*2,NT=Fp/4,jT=0,Vy=Math.sqrt,ET=Math.cos,CT=Math.sin,ln=function(n){return typeof n=="string"},Ot=function(n){return typeof n=="function"},$s=function(n){return typeof n=="number"},zm=function(n){return typeof n>"u"},ys=function(n){return typeof n=="object"},Zn=function(n){return n!==!1},Rm=function(){return typeof window<"u"},Hu=function(n){return Ot(n)||ln(n)},Xy=typeof ArrayBuffer=="function"&&ArrayBuffer.isView||function(){},wn=Array.isArray,zT=/random\([^)]+\)/g,RT=/,\s*/g,mv=/(?:-?\.?\d|\.)+/gi,Zy=/[-+=.]*\d+[.e\-+]*\d*[e\-+]*\d*/g,bl=/[-+=.]*\d+[.e-]*\d*[a-z%]*/g,up=/[-+=.]*\d+\.?\d*(?:e-|e\+)?\d*/gi,Ky=/[+-]=-?[.\d]+/,MT=/[^,'"\[\]\s]+/gi,DT=/^[+\-=e\s\d]*\d+[.\d]*([a-z]*|%)\s*$/i,Ct,ds,Yp,Mm,xa={},bf={},Qy,$y=function(n){return(bf=Rl(n,xa))&&Jn},Dm=function(n,r){return console.warn("Invalid property",n,"set to",r,"Missing plugin? gsap.registerPlugin()")},oc=function(n,r){return!r&&console.warn(n)},Jy=function(n,r){return n&&(xa[n]=r)&&bf&&(bf[n]=r)||xa},cc=function(){return 0},kT={suppressEvents:!0,isStart:!0,kill:!1},of={suppressEvents:!0,kill:!1},OT={suppressEvents:!0},km={},Dr=[],qp={},Iy,ua={},fp={},gv=30,cf=[],Om="",Pm=function(n){var r=n[0],s,l;if(ys(r)||Ot(r)||(n=[n]),!(s=(r._gsap||{}).harness)){for(l=cf.length;l--&&!cf[l].targetTest(r););s=cf[l]}for(l=n.length;l--;)n[l]&&(n[l]._gsap||(n[l]._gsap=new Sb(n[l],s)))||n.splice(l,1);return n},mi=function(n){return n._gsap||Pm(Ya(n))[0]._gsap},Wy=function(n,r,s){return(s=n[r])&&Ot(s)?n[r]():zm(s)&&n.getAttribute&&n.getAttribute(r)||s},Kn=function(n,r){return(n=n.split(",")).forEach(r)||n},Bt=function(n){return Math.round(n*1e5)/1e5||0},Et=function(n){return Math.round(n*1e7)/1e7||0},Al=function(n,r){var s=r.charAt(0),l=parseFloat(r.substr(2));return n=parseFloat(n),s==="+"?n+l:s==="-"?n-l:s==="*"?n*l:n/l},PT=function(n,r){for(var s=r.length,l=0;n.indexOf(r[l])<0&&++l<s;);return l<s},_f=function(){var n=Dr.length,r=Dr.slice(0),s,l;for(qp={},Dr.length=0,s=0;s<n;s++)l=r[s],l&&l._lazy&&(l.render(l._lazy[0],l._lazy[1],!0)._lazy=0)},Lm=function(n){return!!(n._initted||n._startAt||n.add)},eb=function(n,r,s,l){Dr.length&&!pn&&_f(),n.render(r,s,!!(pn&&r<0&&Lm(n))),Dr.length&&!pn&&_f()},tb=function(n){var r=parseFloat(n);return(r||r===0)&&(n+"").match(MT).length<2?r:ln(n)?n.trim():n},nb=function(n){return n},va=function(n,r){for(var s in r)s in n||(n[s]=r[s]);return n},LT=function(n){return function(r,s){for(var l in s)l in r||l==="duration"&&n||l==="ease"||(r[l]=s[l])}},Rl=function(n,r){for(var s in r)n[s]=r[s];return n},xv=function i(n,r){for(var s in r)s!=="__proto__"&&s!=="constructor"&&s!=="prototype"&&(n[s]=ys(r[s])?i(n[s]||(n[s]={}),r[s]):r[s]);return n},Sf=function(n,r){var s={},l;for(l in n)l in r||(s[l]=n[l]);return s},Zo=function(n){var r=n.parent||Ct,s=n.keyframes?LT(wn(n.keyframes)):va;if(Zn(n.inherit))for(;r;)s(n,r.vars.defaults),r=r.parent||r._dp;return n},UT=function(n,r){for(var s=n.length,l=s===r.length;l&&s--&&n[s]===r[s];);return s<0},ab=function(n,r,s,l,c){var u=n[l],d;if(c)for(d=r[c];u&&u[c]>d;)u=u._prev;return u?(r._next=u._next,u._next=r):(r._next=n[s],n[s]=r),r._next?r._next._prev=r:n[l]=r,r._prev=u,r.parent=r._dp=n,r},Uf=function(n,r,s,l){s===void 0&&(s="_first"),l===void 0&&(l="_last");var c=r._prev,u=r._next;c?c._next=u:n[s]===r&&(n[s]=u),u?u._prev=c:n[l]===r&&(n[l]=c),r._next=r._prev=r.parent=null},Lr=function(n,r){n.parent&&(!r||n.parent.autoRemoveChildren)&&n.parent.remove&&n.parent.remove(n),n._act=0},gi=function(n,r){if(n&&(!r||r._end>n._dur||r._start<0))for(var s=n;s;)s._dirty=1,s=s.parent;return n},HT=function(n){for(var r=n.parent;r&&r.parent;)r._dirty=1,r.totalDuration(),r=r.parent;return n},Gp=function(n,r,s,l){return n._startAt&&(pn?n._startAt.revert(of):n.vars.immediateRender&&!n.vars.autoRevert||n._startAt.render(r,!0,l))},BT=function i(n){return!n||n._ts&&i(n.parent)},vv=function(n){return n._repeat?Ml(n._tTime,n=n.duration()+n._rDelay)*n:0},Ml=function(n,r){var s=Math.floor(n=Et(n/r));return n&&s===n?s-1:s},Af=function(n,r){return(n-r._start)*r._ts+(r._ts>=0?0:r._dirty?r.totalDuration():r._tDur)},Hf=function(n){return n._end=Et(n._start+(n._tDur/Math.abs(n._ts||n._rts||ct)||0))},Bf=function(n,r){var s=n._dp;return s&&s.smoothChildTiming&&n._ts&&(n._start=Et(s._time-(n._ts>0?r/n._ts:((n._dirty?n.totalDuration():n._tDur)-r)/-n._ts)),Hf(n),s._dirty||gi(s,n)),n},sb=function(n,r){var s;if((r._time||!r._dur&&r._initted||r._start<n._time&&(r._dur||!r.add))&&(s=Af(n.rawTime(),r),(!r._dur||Sc(0,r.totalDuration(),s)-r._tTime>ct)&&r.render(s,!0)),gi(n,r)._dp&&n._initted&&n._time>=n._dur&&n._ts){if(n._dur<n.duration())for(s=n;s._dp;)s.rawTime()>=0&&s.totalTime(s._tTime),s=s._dp;n._zTime=-ct}},ps=function(n,r,s,l){return r.parent&&Lr(r),r._start=Et(($s(s)?s:s||n!==Ct?La(n,s,r):n._time)+r._delay),r._end=Et(r._start+(r.totalDuration()/Math.abs(r.timeScale())||0)),ab(n,r,"_first","_last",n._sort?"_start":0),Vp(r)||(n._recent=r),l||sb(n,r),n._ts<0&&Bf(n,n._tTime),n},rb=function(n,r){return(xa.ScrollTrigger||Dm("scrollTrigger",r))&&xa.ScrollTrigger.create(r,n)},ib=function(n,r,s,l,c){if(Hm(n,r,c),!n._initted)return 1;if(!s&&n._pt&&!pn&&(n._dur&&n.vars.lazy!==!1||!n._dur&&n.vars.lazy)&&Iy!==da.frame)return Dr.push(n),n._lazy=[c,l],1},FT=function i(n){var r=n.parent;return r&&r._ts&&r._initted&&!r._lock&&(r.rawTime()<0||i(r))},Vp=function(n){var r=n.data;return r==="isFromStart"||r==="isStart"},YT=function(n,r,s,l){var c=n.ratio,u=r<0||!r&&(!n._start&&FT(n)&&!(!n._initted&&Vp(n))||(n._ts<0||n._dp._ts<0)&&!Vp(n))?0:1,d=n._rDelay,g=0,m,x,v;if(d&&n._repeat&&(g=Sc(0,n._tDur,r),x=Ml(g,d),n._yoyo&&x&1&&(u=1-u),x!==Ml(n._tTime,d)&&(c=1-u,n.vars.repeatRefresh&&n._initted&&n.invalidate())),u!==c||pn||l||n._zTime===ct||!r&&n._zTime){if(!n._initted&&ib(n,r,l,s,g))return;for(v=n._zTime,n._zTime=r||(s?ct:0),s||(s=r&&!v),n.ratio=u,n._from&&(u=1-u),n._time=0,n._tTime=g,m=n._pt;m;)m.r(u,m.d),m=m._next;r<0&&Gp(n,r,s,!0),n._onUpdate&&!s&&pa(n,"onUpdate"),g&&n._repeat&&!s&&n.parent&&pa(n,"onRepeat"),(r>=n._tDur||r<0)&&n.ratio===u&&(u&&Lr(n,1),!s&&!pn&&(pa(n,u?"onComplete":"onReverseComplete",!0),n._prom&&n._prom()))}else n._zTime||(n._zTime=r)},qT=function(n,r,s){var l;if(s>r)for(l=n._first;l&&l._start<=s;){if(l.data==="isPause"&&l._start>r)return l;l=l._next}else for(l=n._last;l&&l._start>=s;){if(l.data==="isPause"&&l._start<r)return l;l=l._prev}},Dl=function(n,r,s,l){var c=n._repeat,u=Et(r)||0,d=n._tTime/n._tDur;return d&&!l&&(n._time*=u/n._dur),n._dur=u,n._tDur=c?c<0?1e10:Et(u*(c+1)+n._rDelay*c):u,d>0&&!l&&Bf(n,n._tTime=n._tDur*d),n.parent&&Hf(n),s||gi(n.parent,n),n},yv=function(n){return n instanceof On?gi(n):Dl(n,n._dur)},GT={_start:0,endTime:cc,totalDuration:cc},La=function i(n,r,s){var l=n.labels,c=n._recent||GT,u=n.duration()>=Fa?c.endTime(!1):n._dur,d,g,m;return ln(r)&&(isNaN(r)||r in l)?(g=r.charAt(0),m=r.substr(-1)==="%",d=r.indexOf("="),g==="<"||g===">"?(d>=0&&(r=r.replace(/=/,"")),(g==="<"?c._start:c.endTime(c._repeat>=0))+(parseFloat(r.substr(1))||0)*(m?(d<0?c:s).totalDuration()/100:1)):d<0?(r in l||(l[r]=u),l[r]):(g=parseFloat(r.charAt(d-1)+r.substr(d+1)),m&&s&&(g=g/100*(wn(s)?s[0]:s).totalDuration()),d>1?i(n,r.substr(0,d-1),s)+g:u+g)):r==null?u:+r},Ko=function(n,r,s){var l=$s(r[1]),c=(l?2:1)+(n<2?0:1),u=r[c],d,g;if(l&&(u.duration=r[1]),u.parent=s,n){for(d=u,g=s;g&&!("immediateRender"in d);)d=g.vars.defaults||{},g=Zn(g.vars.inherit)&&g.parent;u.immediateRender=Zn(d.immediateRender),n<2?u.runBackwards=1:u.startAt=r[c-1]}return new Qt(r[0],u,r[c+1])},Fr=function(n,r){return n||n===0?r(n):r},Sc=function(n,r,s){return s<n?n:s>r?r:s},An=function(n,r){return!ln(n)||!(r=DT.exec(n))?"":r[1]},VT=function(n,r,s){return Fr(s,function(l){return Sc(n,r,l)})},Xp=[].slice,lb=function(n,r){return n&&ys(n)&&"length"in n&&(!r&&!n.length||n.length-1 in n&&ys(n[0]))&&!n.nodeType&&n!==ds},XT=function(n,r,s){return s===void 0&&(s=[]),n.forEach(function(l){var c;return ln(l)&&!r||lb(l,1)?(c=s).push.apply(c,Ya(l)):s.push(l)})||s},Ya=function(n,r,s){return St&&!r&&St.selector?St.selector(n):ln(n)&&!s&&(Yp||!kl())?Xp.call((r||Mm).querySelectorAll(n),0):wn(n)?XT(n,s):lb(n)?Xp.call(n,0):n?[n]:[]},Zp=function(n){return n=Ya(n)[0]||oc("Invalid scope")||{},function(r){var s=n.current||n.nativeElement||n;return Ya(r,s.querySelectorAll?s:s===n?oc("Invalid scope")||Mm.createElement("div"):n)}},ob=function(n){return n.sort(function(){return .5-Math.random()})},cb=function(n){if(Ot(n))return n;var r=ys(n)?n:{each:n},s=xi(r.ease),l=r.from||0,c=parseFloat(r.base)||0,u={},d=l>0&&l<1,g=isNaN(l)||d,m=r.axis,x=l,v=l;return ln(l)?x=v={center:.5,edges:.5,end:1}[l]||0:!d&&g&&(x=l[0],v=l[1]),function(S,A,N){var _=(N||r).length,T=u[_],j,E,M,R,O,P,z,C,G;if(!T){if(G=r.grid==="auto"?0:(r.grid||[1,Fa])[1],!G){for(z=-Fa;z<(z=N[G++].getBoundingClientRect().left)&&G<_;);G<_&&G--}for(T=u[_]=[],j=g?Math.min(G,_)*x-.5:l%G,E=G===Fa?0:g?_*v/G-.5:l/G|0,z=0,C=Fa,P=0;P<_;P++)M=P%G-j,R=E-(P/G|0),T[P]=O=m?Math.abs(m==="y"?R:M):Vy(M*M+R*R),O>z&&(z=O),O<C&&(C=O);l==="random"&&ob(T),T.max=z-C,T.min=C,T.v=_=(parseFloat(r.amount)||parseFloat(r.each)*(G>_?_-1:m?m==="y"?_/G:G:Math.max(G,_/G))||0)*(l==="edges"?-1:1),T.b=_<0?c-_:c,T.u=An(r.amount||r.each)||0,s=s&&_<0?yb(s):s}return _=(T[S]-T.min)/T.max||0,Et(T.b+(s?s(_):_)*T.v)+T.u}},Kp=function(n){var r=Math.pow(10,((n+"").split(".")[1]||"").length);return function(s){var l=Et(Math.round(parseFloat(s)/n)*n*r);return(l-l%1)/r+($s(s)?0:An(s))}},ub=function(n,r){var s=wn(n),l,c;return!s&&ys(n)&&(l=s=n.radius||Fa,n.values?(n=Ya(n.values),(c=!$s(n[0]))&&(l*=l)):n=Kp(n.increment)),Fr(r,s?Ot(n)?function(u){return c=n(u),Math.abs(c-u)<=l?c:u}:function(u){for(var d=parseFloat(c?u.x:u),g=parseFloat(c?u.y:0),m=Fa,x=0,v=n.length,S,A;v--;)c?(S=n[v].x-d,A=n[v].y-g,S=S*S+A*A):S=Math.abs(n[v]-d),S<m&&(m=S,x=v);return x=!l||m<=l?n[x]:u,c||x===u||$s(u)?x:x+An(u)}:Kp(n))},fb=function(n,r,s,l){return Fr(wn(n)?!r:s===!0?!!(s=0):!l,function(){return wn(n)?n[~~(Math.random()*n.length)]:(s=s||1e-5)&&(l=s<1?Math.pow(10,(s+"").length-2):1)&&Math.floor(Math.round((n-s/2+Math.random()*(r-n+s*.99))/s)*s*l)/l})},ZT=function(){for(var n=arguments.length,r=new Array(n),s=0;s<n;s++)r[s]=arguments[s];return function(l){return r.reduce(function(c,u){return u(c)},l)}},KT=function(n,r){return function(s){return n(parseFloat(s))+(r||An(s))}},QT=function(n,r,s){return hb(n,r,0,1,s)},db=function(n,r,s){return Fr(s,function(l){return n[~~r(l)]})},$T=function i(n,r,s){var l=r-n;return wn(n)?db(n,i(0,n.length),r):Fr(s,function(c){return(l+(c-n)%l)%l+n})},JT=function i(n,r,s){var l=r-n,c=l*2;return wn(n)?db(n,i(0,n.length-1),r):Fr(s,function(u){return u=(c+(u-n)%c)%c||0,n+(u>l?c-u:u)})},uc=function(n){return n.replace(zT,function(r){var s=r.indexOf("[")+1,l=r.substring(s||7,s?r.indexOf("]"):r.length-1).split(RT);return fb(s?l:+l[0],s?0:+l[1],+l[2]||1e-5)})},hb=function(n,r,s,l,c){var u=r-n,d=l-s;return Fr(c,function(g){return s+((g-n)/u*d||0)})},IT=function i(n,r,s,l){var c=isNaN(n+r)?0:function(A){return(1-A)*n+A*r};if(!c){var u=ln(n),d={},g,m,x,v,S;if(s===!0&&(l=1)&&(s=null),u)n={p:n},r={p:r};else if(wn(n)&&!wn(r)){for(x=[],v=n.length,S=v-2,m=1;m<v;m++)x.push(i(n[m-1],n[m]));v--,c=function(N){N*=v;var _=Math.min(S,~~N);return x[_](N-_)},s=r}else l||(n=Rl(wn(n)?[]:{},n));if(!x){for(g in r)Um.call(d,n,g,"get",r[g]);c=function(N){return Ym(N,d)||(u?n.p:n)}}}return Fr(s,c)},bv=function(n,r,s){var l=n.labels,c=Fa,u,d,g;for(u in l)d=l[u]-r,d<0==!!s&&d&&c>(d=Math.abs(d))&&(g=u,c=d);return g},pa=function(n,r,s){var l=n.vars,c=l[r],u=St,d=n._ctx,g,m,x;if(c)return g=l[r+"Params"],m=l.callbackScope||n,s&&Dr.length&&_f(),d&&(St=d),x=g?c.apply(m,g):c.call(m),St=u,x},Bo=function(n){return Lr(n),n.scrollTrigger&&n.scrollTrigger.kill(!!pn),n.progress()<1&&pa(n,"onInterrupt"),n},_l,pb=[],mb=function(n){if(n)if(n=!n.name&&n.default||n,Rm()||n.headless){var r=n.name,s=Ot(n),l=r&&!s&&n.init?function(){this._props=[]}:n,c={init:cc,render:Ym,add:Um,kill:pw,modifier:hw,rawVars:0},u={targetTest:0,get:0,getSetter:Fm,aliases:{},register:0};if(kl(),n!==l){if(ua[r])return;va(l,va(Sf(n,c),u)),Rl(l.prototype,Rl(c,Sf(n,u))),ua[l.prop=r]=l,n.targetTest&&(cf.push(l),km[r]=1),r=(r==="css"?"CSS":r.charAt(0).toUpperCase()+r.substr(1))+"Plugin"}Jy(r,l),n.register&&n.register(Jn,l,Qn)}else pb.push(n)},ot=255,Fo={aqua:[0,ot,ot],lime:[0,ot,0],silver:[192,192,192],black:[0,0,0],maroon:[128,0,0],teal:[0,128,128],blue:[0,0,ot],navy:[0,0,128],white:[ot,ot,ot],olive:[128,128,0],yellow:[ot,ot,0],orange:[ot,165,0],gray:[128,128,128],purple:[128,0,128],green:[0,128,0],red:[ot,0,0],pink:[ot,192,203],cyan:[0,ot,ot],transparent:[ot,ot,ot,0]},dp=function(n,r,s){return n+=n<0?1:n>1?-1:0,(n*6<1?r+(s-r)*n*6:n<.5?s:n*3<2?r+(s-r)*(2/3-n)*6:r)*ot+.5|0},gb=function(n,r,s){var l=n?$s(n)?[n>>16,n>>8&ot,n&ot]:0:Fo.black,c,u,d,g,m,x,v,S,A,N;if(!l){if(n.substr(-1)===","&&(n=n.substr(0,n.length-1)),Fo[n])l=Fo[n];else if(n.charAt(0)==="#"){if(n.length<6&&(c=n.charAt(1),u=n.charAt(2),d=n.charAt(3),n="#"+c+c+u+u+d+d+(n.length===5?n.charAt(4)+n.charAt(4):"")),n.length===9)return l=parseInt(n.substr(1,6),16),[l>>16,l>>8&ot,l&ot,parseInt(n.substr(7),16)/255];n=parseInt(n.substr(1),16),l=[n>>16,n>>8&ot,n&ot]}else if(n.substr(0,3)==="hsl"){if(l=N=n.match(mv),!r)g=+l[0]%360/360,m=+l[1]/100,x=+l[2]/100,u=x<=.5?x*(m+1):x+m-x*m,c=x*2-u,l.length>3&&(l[3]*=1),l[0]=dp(g+1/3,c,u),l[1]=dp(g,c,u),l[2]=dp(g-1/3,c,u);else if(~n.indexOf("="))return l=n.match(Zy),s&&l.length<4&&(l[3]=1),l}else l=n.match(mv)||Fo.transparent;l=l.map(Number)}return r&&!N&&(c=l[0]/ot,u=l[1]/ot,d=l[2]/ot,v=Math.max(c,u,d),S=Math.min(c,u,d),x=(v+S)/2,v===S?g=m=0:(A=v-S,m=x>.5?A/(2-v-S):A/(v+S),g=v===c?(u-d)/A+(u<d?6:0):v===u?(d-c)/A+2:(c-u)/A+4,g*=60),l[0]=~~(g+.5),l[1]=~~(m*100+.5),l[2]=~~(x*100+.5)),s&&l.length<4&&(l[3]=1),l},xb=function(n){var r=[],s=[],l=-1;return n.split(kr).forEach(function(c){var u=c.match(bl)||[];r.push.apply(r,u),s.push(l+=u.length+1)}),r.c=s,r},_v=function(n,r,s){var l="",c=(n+l).match(kr),u=r?"hsla(":"rgba(",d=0,g,m,x,v;if(!c)return n;if(c=c.map(function(S){return(S=gb(S,r,1))&&u+(r?S[0]+","+S[1]+"%,"+S[2]+"%,"+S[3]:S.join(","))+")"}),s&&(x=xb(n),g=s.c,g.join(l)!==x.c.join(l)))for(m=n.replace(kr,"1").split(bl),v=m.length-1;d<v;d++)l+=m[d]+(~g.indexOf(d)?c.shift()||u+"0,0,0,0)":(x.length?x:c.length?c:s).shift());if(!m)for(m=n.split(kr),v=m.length-1;d<v;d++)l+=m[d]+c[d];return l+m[v]},kr=(function(){var i="(?:\\b(?:(?:rgb|rgba|hsl|hsla)\\(.+?\\))|\\B#(?:[0-9a-f]{3,4}){1,2}\\b",n;for(n in Fo)i+="|"+n+"\\b";return new RegExp(i+")","gi")})(),WT=/hsl[a]?\(/,vb=function(n){var r=n.join(" "),s;if(kr.lastIndex=0,kr.test(r))return s=WT.test(r),n[1]=_v(n[1],s),n[0]=_v(n[0],s,xb(n[1])),!0},fc,da=(function(){var i=Date.now,n=500,r=33,s=i(),l=s,c=1e3/240,u=c,d=[],g,m,x,v,S,A,N=function _(T){var j=i()-l,E=T===!0,M,R,O,P;if((j>n||j<0)&&(s+=j-r),l+=j,O=l-s,M=O-u,(M>0||E)&&(P=++v.frame,S=O-v.time*1e3,v.time=O=O/1e3,u+=M+(M>=c?4:c-M),R=1),E||(g=m(_)),R)for(A=0;A<d.length;A++)d[A](O,S,P,T)};return v={time:0,frame:0,tick:function(){N(!0)},deltaRatio:function(T){return S/(1e3/(T||60))},wake:function(){Qy&&(!Yp&&Rm()&&(ds=Yp=window,Mm=ds.document||{},xa.gsap=Jn,(ds.gsapVersions||(ds.gsapVersions=[])).push(Jn.version),$y(bf||ds.GreenSockGlobals||!ds.gsap&&ds||{}),pb.forEach(mb)),x=typeof requestAnimationFrame<"u"&&requestAnimationFrame,g&&v.sleep(),m=x||function(T){return setTimeout(T,u-v.time*1e3+1|0)},fc=1,N(2))},sleep:function(){(x?cancelAnimationFrame:clearTimeout)(g),fc=0,m=cc},lagSmoothing:function(T,j){n=T||1/0,r=Math.min(j||33,n)},fps:function(T){c=1e3/(T||240),u=v.time*1e3+c},add:function(T,j,E){var M=j?function(R,O,P,z){T(R,O,P,z),v.remove(M)}:T;return v.remove(T),d[E?"unshift":"push"](M),kl(),M},remove:function(T,j){~(j=d.indexOf(T))&&d.splice(j,1)&&A>=j&&A--},_listeners:d},v})(),kl=function(){return!fc&&da.wake()},Ze={},ew=/^[\d.\-M][\d.\-,\s]/,tw=/["']/g,nw=function(n){for(var r={},s=n.substr(1,n.length-3).split(":"),l=s[0],c=1,u=s.length,d,g,m;c<u;c++)g=s[c],d=c!==u-1?g.lastIndexOf(","):g.length,m=g.substr(0,d),r[l]=isNaN(m)?m.replace(tw,"").trim():+m,l=g.substr(d+1).trim();return r},aw=function(n){var r=n.indexOf("(")+1,s=n.indexOf(")"),l=n.indexOf("(",r);return n.substring(r,~l&&l<s?n.indexOf(")",s+1):s)},sw=function(n){var r=(n+"").split("("),s=Ze[r[0]];return s&&r.length>1&&s.config?s.config.apply(null,~n.indexOf("{")?[nw(r[1])]:aw(n).split(",").map(tb)):Ze._CE&&ew.test(n)?Ze._CE("",n):s},yb=function(n){return function(r){return 1-n(1-r)}},bb=function i(n,r){for(var s=n._first,l;s;)s instanceof On?i(s,r):s.vars.yoyoEase&&(!s._yoyo||!s._repeat)&&s._yoyo!==r&&(s.timeline?i(s.timeline,r):(l=s._ease,s._ease=s._yEase,s._yEase=l,s._yoyo=r)),s=s._next},xi=function(n,r){return n&&(Ot(n)?n:Ze[n]||sw(n))||r},Ci=function(n,r,s,l){s===void 0&&(s=function(g){return 1-r(1-g)}),l===void 0&&(l=function(g){return g<.5?r(g*2)/2:1-r((1-g)*2)/2});var c={easeIn:r,easeOut:s,easeInOut:l},u;return Kn(n,function(d){Ze[d]=xa[d]=c,Ze[u=d.toLowerCase()]=s;for(var g in c)Ze[u+(g==="easeIn"?".in":g==="easeOut"?".out":".inOut")]=Ze[d+"."+g]=c[g]}),c},_b=function(n){return function(r){return r<.5?(1-n(1-r*2))/2:.5+n((r-.5)*2)/2}},hp=function i(n,r,s){var l=r>=1?r:1,c=(s||(n?.3:.45))/(r<1?r:1),u=c/Fp*(Math.asin(1/l)||0),d=function(x){return x===1?1:l*Math.pow(2,-10*x)*CT((x-u)*c)+1},g=n==="out"?d:n==="in"?function(m){return 1-d(1-m)}:_b(d);return c=Fp/c,g.config=function(m,x){return i(n,m,x)},g},pp=function i(n,r){r===void 0&&(r=1.70158);var s=function(u){return u?--u*u*((r+1)*u+r)+1:0},l=n==="out"?s:n==="in"?function(c){return 1-s(1-c)}:_b(s);return l.config=function(c){return i(n,c)},l};Kn("Linear,Quad,Cubic,Quart,Quint,Strong",function(i,n){var r=n<5?n+1:n;Ci(i+",Power"+(r-1),n?function(s){return Math.pow(s,r)}:function(s){return s},function(s){return 1-Math.pow(1-s,r)},function(s){return s<.5?Math.pow(s*2,r)/2:1-Math.pow((1-s)*2,r)/2})});Ze.Linear.easeNone=Ze.none=Ze.Linear.easeIn;Ci("Elastic",hp("in"),hp("out"),hp());(function(i,n){var r=1/n,s=2*r,l=2.5*r,c=function(d){return d<r?i*d*d:d<s?i*Math.pow(d-1.5/n,2)+.75:d<l?i*(d-=2.25/n)*d+.9375:i*Math.pow(d-2.625/n,2)+.984375};Ci("Bounce",function(u){return 1-c(1-u)},c)})(7.5625,2.75);Ci("Expo",function(i){return Math.pow(2,10*(i-1))*i+i*i*i*i*i*i*(1-i)});Ci("Circ",function(i){return-(Vy(1-i*i)-1)});Ci("Sine",function(i){return i===1?1:-ET(i*NT)+1});Ci("Back",pp("in"),pp("out"),pp());Ze.SteppedEase=Ze.steps=xa.SteppedEase={config:function(n,r){n===void 0&&(n=1);var s=1/n,l=n+(r?0:1),c=r?1:0,u=1-ct;return function(d){return((l*Sc(0,u,d)|0)+c)*s}}};zl.ease=Ze["quad.out"];Kn("onComplete,onUpdate,onStart,onRepeat,onReverseComplete,onInterrupt",function(i){return Om+=i+","+i+"Params,"});var Sb=function(n,r){this.id=jT++,n._gsap=this,this.target=n,this.harness=r,this.get=r?r.get:Wy,this.set=r?r.getSetter:Fm},dc=(function(){function i(r){this.vars=r,this._delay=+r.delay||0,(this._repeat=r.repeat===1/0?-2:r.repeat||0)&&(this._rDelay=r.repeatDelay||0,this._yoyo=!!r.yoyo||!!r.yoyoEase),this._ts=1,Dl(this,+r.duration,1,1),this.data=r.data,St&&(this._ctx=St,St.data.push(this)),fc||da.wake()}var n=i.prototype;return n.delay=function(s){return s||s===0?(this.parent&&this.parent.smoothChildTiming&&this.startTime(this._start+s-this._delay),this._delay=s,this):this._delay},n.duration=function(s){return arguments.length?this.totalDuration(this._repeat>0?s+(s+this._rDelay)*this._repeat:s):this.totalDuration()&&this._dur},n.totalDuration=function(s){return arguments.length?(this._dirty=0,Dl(this,this._repeat<0?s:(s-this._repeat*this._rDelay)/(this._repeat+1))):this._tDur},n.totalTime=function(s,l){if(kl(),!arguments.length)return this._tTime;var c=this._dp;if(c&&c.smoothChildTiming&&this._ts){for(Bf(this,s),!c._dp||c.parent||sb(c,this);c&&c.parent;)c.parent._time!==c._start+(c._ts>=0?c._tTime/c._ts:(c.totalDuration()-c._tTime)/-c._ts)&&c.totalTime(c._tTime,!0),c=c.parent;!this.parent&&this._dp.autoRemoveChildren&&(this._ts>0&&s<this._tDur||this._ts<0&&s>0||!this._tDur&&!s)&&ps(this._dp,this,this._start-this._delay)}return(this._tTime!==s||!this._dur&&!l||this._initted&&Math.abs(this._zTime)===ct||!this._initted&&this._dur&&s||!s&&!this._initted&&(this.add||this._ptLookup))&&(this._ts||(this._pTime=s),eb(this,s,l)),this},n.time=function(s,l){return arguments.length?this.totalTime(Math.min(this.totalDuration(),s+vv(this))%(this._dur+this._rDelay)||(s?this._dur:0),l):this._time},n.totalProgress=function(s,l){return arguments.length?this.totalTime(this.totalDuration()*s,l):this.totalDuration()?Math.min(1,this._tTime/this._tDur):this.rawTime()>=0&&this._initted?1:0},n.progress=function(s,l){return arguments.length?this.totalTime(this.duration()*(this._yoyo&&!(this.iteration()&1)?1-s:s)+vv(this),l):this.duration()?Math.min(1,this._time/this._dur):this.rawTime()>0?1:0},n.iteration=function(s,l){var c=this.duration()+this._rDelay;return arguments.length?this.totalTime(this._time+(s-1)*c,l):this._repeat?Ml(this._tTime,c)+1:1},n.timeScale=function(s,l){if(!arguments.length)return this._rts===-ct?0:this._rts;if(this._rts===s)return this;var c=this.parent&&this._ts?Af(this.parent._time,this):this._tTime;return this._rts=+s||0,this._ts=this._ps||s===-ct?0:this._rts,this.totalTime(Sc(-Math.abs(this._delay),this.totalDuration(),c),l!==!1),Hf(this),HT(this)},n.paused=function(s){return arguments.length?(this._ps!==s&&(this._ps=s,s?(this._pTime=this._tTime||Math.max(-this._delay,this.rawTime()),this._ts=this._act=0):(kl(),this._ts=this._rts,this.totalTime(this.parent&&!this.parent.smoothChildTiming?this.rawTime():this._tTime||this._pTime,this.progress()===1&&Math.abs(this._zTime)!==ct&&(this._tTime-=ct)))),this):this._ps},n.startTime=function(s){if(arguments.length){this._start=Et(s);var l=this.parent||this._dp;return l&&(l._sort||!this.parent)&&ps(l,this,this._start-this._delay),this}return this._start},n.endTime=function(s){return this._start+(Zn(s)?this.totalDuration():this.duration())/Math.abs(this._ts||1)},n.rawTime=function(s){var l=this.parent||this._dp;return l?s&&(!this._ts||this._repeat&&this._time&&this.totalProgress()<1)?this._tTime%(this._dur+this._rDelay):this._ts?Af(l.rawTime(s),this):this._tTime:this._tTime},n.revert=function(s){s===void 0&&(s=OT);var l=pn;return pn=s,Lm(this)&&(this.timeline&&this.timeline.revert(s),this.totalTime(-.01,s.suppressEvents)),this.data!=="nested"&&s.kill!==!1&&this.kill(),pn=l,this},n.globalTime=function(s){for(var l=this,c=arguments.length?s:l.rawTime();l;)c=l._start+c/(Math.abs(l._ts)||1),l=l._dp;return!this.parent&&this._sat?this._sat.globalTime(s):c},n.repeat=function(s){return arguments.length?(this._repeat=s===1/0?-2:s,yv(this)):this._repeat===-2?1/0:this._repeat},n.repeatDelay=function(s){if(arguments.length){var l=this._time;return this._rDelay=s,yv(this),l?this.time(l):this}return this._rDelay},n.yoyo=function(s){return arguments.length?(this._yoyo=s,this):this._yoyo},n.seek=function(s,l){return this.totalTime(La(this,s),Zn(l))},n.restart=function(s,l){return this.play().totalTime(s?-this._delay:0,Zn(l)),this._dur||(this._zTime=-ct),this},n.play=function(s,l){return s!=null&&this.seek(s,l),this.reversed(!1).paused(!1)},n.reverse=function(s,l){return s!=null&&this.seek(s||this.totalDuration(),l),this.reversed(!0).paused(!1)},n.pause=function(s,l){return s!=null&&this.seek(s,l),this.paused(!0)},n.resume=function(){return this.paused(!1)},n.reversed=function(s){return arguments.length?(!!s!==this.reversed()&&this.timeScale(-this._rts||(s?-ct:0)),this):this._rts<0},n.invalidate=function(){return this._initted=this._act=0,this._zTime=-ct,this},n.isActive=function(){var s=this.parent||this._dp,l=this._start,c;return!!(!s||this._ts&&this._initted&&s.isActive()&&(c=s.rawTime(!0))>=l&&c<this.endTime(!0)-ct)},n.eventCallback=function(s,l,c){var u=this.vars;return arguments.length>1?(l?(u[s]=l,c&&(u[s+"Params"]=c),s==="onUpdate"&&(this._onUpdate=l)):delete u[s],this):u[s]},n.then=function(s){var l=this,c=l._prom;return new Promise(function(u){var d=Ot(s)?s:nb,g=function(){var x=l.then;l.then=null,c&&c(),Ot(d)&&(d=d(l))&&(d.then||d===l)&&(l.then=x),u(d),l.then=x};l._initted&&l.totalProgress()===1&&l._ts>=0||!l._tTime&&l._ts<0?g():l._prom=g})},n.kill=function(){Bo(this)},i})();va(dc.prototype,{_time:0,_start:0,_end:0,_tTime:0,_tDur:0,_dirty:0,_repeat:0,_yoyo:!1,parent:null,_initted:!1,_rDelay:0,_ts:1,_dp:0,ratio:0,_zTime:-ct,_prom:0,_ps:!1,_rts:1});var On=(function(i){Gy(n,i);function n(s,l){var c;return s===void 0&&(s={}),c=i.call(this,s)||this,c.labels={},c.smoothChildTiming=!!s.smoothChildTiming,c.autoRemoveChildren=!!s.autoRemoveChildren,c._sort=Zn(s.sortChildren),Ct&&ps(s.parent||Ct,qs(c),l),s.reversed&&c.reverse(),s.paused&&c.paused(!0),s.scrollTrigger&&rb(qs(c),s.scrollTrigger),c}var r=n.prototype;return r.to=function(l,c,u){return Ko(0,arguments,this),this},r.from=function(l,c,u){return Ko(1,arguments,this),this},r.fromTo=function(l,c,u,d){return Ko(2,arguments,this),this},r.set=function(l,c,u){return c.duration=0,c.parent=this,Zo(c).repeatDelay||(c.repeat=0),c.immediateRender=!!c.immediateRender,new Qt(l,c,La(this,u),1),this},r.call=function(l,c,u){return ps(this,Qt.delayedCall(0,l,c),u)},r.staggerTo=function(l,c,u,d,g,m,x){return u.duration=c,u.stagger=u.stagger||d,u.onComplete=m,u.onCompleteParams=x,u.parent=this,new Qt(l,u,La(this,g)),this},r.staggerFrom=function(l,c,u,d,g,m,x){return u.runBackwards=1,Zo(u).immediateRender=Zn(u.immediateRender),this.staggerTo(l,c,u,d,g,m,x)},r.staggerFromTo=function(l,c,u,d,g,m,x,v){return d.startAt=u,Zo(d).immediateRender=Zn(d.immediateRender),this.staggerTo(l,c,d,g,m,x,v)},r.render=function(l,c,u){var d=this._time,g=this._dirty?this.totalDuration():this._tDur,m=this._dur,x=l<=0?0:Et(l),v=this._zTime<0!=l<0&&(this._initted||!m),S,A,N,_,T,j,E,M,R,O,P,z;if(this!==Ct&&x>g&&l>=0&&(x=g),x!==this._tTime||u||v){if(d!==this._time&&m&&(x+=this._time-d,l+=this._time-d),S=x,R=this._start,M=this._ts,j=!M,v&&(m||(d=this._zTime),(l||!c)&&(this._zTime=l)),this._repeat){if(P=this._yoyo,T=m+this._rDelay,this._repeat<-1&&l<0)return this.totalTime(T*100+l,c,u);if(S=Et(x%T),x===g?(_=this._repeat,S=m):(O=Et(x/T),_=~~O,_&&_===O&&(S=m,_--),S>m&&(S=m)),O=Ml(this._tTime,T),!d&&this._tTime&&O!==_&&this._tTime-O*T-this._dur<=0&&(O=_),P&&_&1&&(S=m-S,z=1),_!==O&&!this._lock){var C=P&&O&1,G=C===(P&&_&1);if(_<O&&(C=!C),d=C?0:x%m?m:x,this._lock=1,this.render(d||(z?0:Et(_*T)),c,!m)._lock=0,this._tTime=x,!c&&this.parent&&pa(this,"onRepeat"),this.vars.repeatRefresh&&!z&&(this.invalidate()._lock=1,O=_),d&&d!==this._time||j!==!this._ts||this.vars.onRepeat&&!this.parent&&!this._act)return this;if(m=this._dur,g=this._tDur,G&&(this._lock=2,d=C?m:-1e-4,this.render(d,!0),this.vars.repeatRefresh&&!z&&this.invalidate()),this._lock=0,!this._ts&&!j)return this;bb(this,z)}}if(this._hasPause&&!this._forcing&&this._lock<2&&(E=qT(this,Et(d),Et(S)),E&&(x-=S-(S=E._start))),this._tTime=x,this._time=S,this._act=!M,this._initted||(this._onUpdate=this.vars.onUpdate,this._initted=1,this._zTime=l,d=0),!d&&x&&m&&!c&&!O&&(pa(this,"onStart"),this._tTime!==x))return this;if(S>=d&&l>=0)for(A=this._first;A;){if(N=A._next,(A._act||S>=A._start)&&A._ts&&E!==A){if(A.parent!==this)return this.render(l,c,u);if(A.render(A._ts>0?(S-A._start)*A._ts:(A._dirty?A.totalDuration():A._tDur)+(S-A._start)*A._ts,c,u),S!==this._time||!this._ts&&!j){E=0,N&&(x+=this._zTime=-ct);break}}A=N}else{A=this._last;for(var W=l<0?l:S;A;){if(N=A._prev,(A._act||W<=A._end)&&A._ts&&E!==A){if(A.parent!==this)return this.render(l,c,u);if(A.render(A._ts>0?(W-A._start)*A._ts:(A._dirty?A.totalDuration():A._tDur)+(W-A._start)*A._ts,c,u||pn&&Lm(A)),S!==this._time||!this._ts&&!j){E=0,N&&(x+=this._zTime=W?-ct:ct);break}}A=N}}if(E&&!c&&(this.pause(),E.render(S>=d?0:-ct)._zTime=S>=d?1:-1,this._ts))return this._start=R,Hf(this),this.render(l,c,u);this._onUpdate&&!c&&pa(this,"onUpdate",!0),(x===g&&this._tTime>=this.totalDuration()||!x&&d)&&(R===this._start||Math.abs(M)!==Math.abs(this._ts))&&(this._lock||((l||!m)&&(x===g&&this._ts>0||!x&&this._ts<0)&&Lr(this,1),!c&&!(l<0&&!d)&&(x||d||!g)&&(pa(this,x===g&&l>=0?"onComplete":"onReverseComplete",!0),this._prom&&!(x<g&&this.timeScale()>0)&&this._prom())))}return this},r.add=function(l,c){var u=this;if($s(c)||(c=La(this,c,l)),!(l instanceof dc)){if(wn(l))return l.forEach(function(d){return u.add(d,c)}),this;if(ln(l))return this.addLabel(l,c);if(Ot(l))l=Qt.delayedCall(0,l);else return this}return this!==l?ps(this,l,c):this},r.getChildren=function(l,c,u,d){l===void 0&&(l=!0),c===void 0&&(c=!0),u===void 0&&(u=!0),d===void 0&&(d=-Fa);for(var g=[],m=this._first;m;)m._start>=d&&(m instanceof Qt?c&&g.push(m):(u&&g.push(m),l&&g.push.apply(g,m.getChildren(!0,c,u)))),m=m._next;return g},r.getById=function(l){for(var c=this.getChildren(1,1,1),u=c.length;u--;)if(c[u].vars.id===l)return c[u]},r.remove=function(l){return ln(l)?this.removeLabel(l):Ot(l)?this.killTweensOf(l):(l.parent===this&&Uf(this,l),l===this._recent&&(this._recent=this._last),gi(this))},r.totalTime=function(l,c){return arguments.length?(this._forcing=1,!this._dp&&this._ts&&(this._start=Et(da.time-(this._ts>0?l/this._ts:(this.totalDuration()-l)/-this._ts))),i.prototype.totalTime.call(this,l,c),this._forcing=0,this):this._tTime},r.addLabel=function(l,c){return this.labels[l]=La(this,c),this},r.removeLabel=function(l){return delete this.labels[l],this},r.addPause=function(l,c,u){var d=Qt.delayedCall(0,c||cc,u);return d.data="isPause",this._hasPause=1,ps(this,d,La(this,l))},r.removePause=function(l){var c=this._first;for(l=La(this,l);c;)c._start===l&&c.data==="isPause"&&Lr(c),c=c._next},r.killTweensOf=function(l,c,u){for(var d=this.getTweensOf(l,u),g=d.length;g--;)Er!==d[g]&&d[g].kill(l,c);return this},r.getTweensOf=function(l,c){for(var u=[],d=Ya(l),g=this._first,m=$s(c),x;g;)g instanceof Qt?PT(g._targets,d)&&(m?(!Er||g._initted&&g._ts)&&g.globalTime(0)<=c&&g.globalTime(g.totalDuration())>c:!c||g.isActive())&&u.push(g):(x=g.getTweensOf(d,c)).length&&u.push.apply(u,x),g=g._next;return u},r.tweenTo=function(l,c){c=c||{};var u=this,d=La(u,l),g=c,m=g.startAt,x=g.onStart,v=g.onStartParams,S=g.immediateRender,A,N=Qt.to(u,va({ease:c.ease||"none",lazy:!1,immediateRender:!1,time:d,overwrite:"auto",duration:c.duration||Math.abs((d-(m&&"time"in m?m.time:u._time))/u.timeScale())||ct,onStart:function(){if(u.pause(),!A){var T=c.duration||Math.abs((d-(m&&"time"in m?m.time:u._time))/u.timeScale());N._dur!==T&&Dl(N,T,0,1).render(N._time,!0,!0),A=1}x&&x.apply(N,v||[])}},c));return S?N.render(0):N},r.tweenFromTo=function(l,c,u){return this.tweenTo(c,va({startAt:{time:La(this,l)}},u))},r.recent=function(){return this._recent},r.nextLabel=function(l){return l===void 0&&(l=this._time),bv(this,La(this,l))},r.previousLabel=function(l){return l===void 0&&(l=this._time),bv(this,La(this,l),1)},r.currentLabel=function(l){return arguments.length?this.seek(l,!0):this.previousLabel(this._time+ct)},r.shiftChildren=function(l,c,u){u===void 0&&(u=0);var d=this._first,g=this.labels,m;for(l=Et(l);d;)d._start>=u&&(d._start+=l,d._end+=l),d=d._next;if(c)for(m in g)g[m]>=u&&(g[m]+=l);return gi(this)},r.invalidate=function(l){var c=this._first;for(this._lock=0;c;)c.invalidate(l),c=c._next;return i.prototype.invalidate.call(this,l)},r.clear=function(l){l===void 0&&(l=!0);for(var c=this._first,u;c;)u=c._next,this.remove(c),c=u;return this._dp&&(this._time=this._tTime=this._pTime=0),l&&(this.labels={}),gi(this)},r.totalDuration=function(l){var c=0,u=this,d=u._last,g=Fa,m,x,v;if(arguments.length)return u.timeScale((u._repeat<0?u.duration():u.totalDuration())/(u.reversed()?-l:l));if(u._dirty){for(v=u.parent;d;)m=d._prev,d._dirty&&d.totalDuration(),x=d._start,x>g&&u._sort&&d._ts&&!u._lock?(u._lock=1,ps(u,d,x-d._delay,1)._lock=0):g=x,x<0&&d._ts&&(c-=x,(!v&&!u._dp||v&&v.smoothChildTiming)&&(u._start+=Et(x/u._ts),u._time-=x,u._tTime-=x),u.shiftChildren(-x,!1,-1/0),g=0),d._end>c&&d._ts&&(c=d._end),d=m;Dl(u,u===Ct&&u._time>c?u._time:c,1,1),u._dirty=0}return u._tDur},n.updateRoot=function(l){if(Ct._ts&&(eb(Ct,Af(l,Ct)),Iy=da.frame),da.frame>=gv){gv+=ga.autoSleep||120;var c=Ct._first;if((!c||!c._ts)&&ga.autoSleep&&da._listeners.length<2){for(;c&&!c._ts;)c=c._next;c||da.sleep()}}},n})(dc);va(On.prototype,{_lock:0,_hasPause:0,_forcing:0});var rw=function(n,r,s,l,c,u,d){var g=new Qn(this._pt,n,r,0,1,Eb,null,c),m=0,x=0,v,S,A,N,_,T,j,E;for(g.b=s,g.e=l,s+="",l+="",(j=~l.indexOf("random("))&&(l=uc(l)),u&&(E=[s,l],u(E,n,r),s=E[0],l=E[1]),S=s.match(up)||[];v=up.exec(l);)N=v[0],_=l.substring(m,v.index),A?A=(A+1)%5:_.substr(-5)==="rgba("&&(A=1),N!==S[x++]&&(T=parseFloat(S[x-1])||0,g._pt={_next:g._pt,p:_||x===1?_:",",s:T,c:N.charAt(1)==="="?Al(T,N)-T:parseFloat(N)-T,m:A&&A<4?Math.round:0},m=up.lastIndex);return g.c=m<l.length?l.substring(m,l.length):"",g.fp=d,(Ky.test(l)||j)&&(g.e=0),this._pt=g,g},Um=function(n,r,s,l,c,u,d,g,m,x){Ot(l)&&(l=l(c||0,n,u));var v=n[r],S=s!=="get"?s:Ot(v)?m?n[r.indexOf("set")||!Ot(n["get"+r.substr(3)])?r:"get"+r.substr(3)](m):n[r]():v,A=Ot(v)?m?uw:Nb:Bm,N;if(ln(l)&&(~l.indexOf("random(")&&(l=uc(l)),l.charAt(1)==="="&&(N=Al(S,l)+(An(S)||0),(N||N===0)&&(l=N))),!x||S!==l||Qp)return!isNaN(S*l)&&l!==""?(N=new Qn(this._pt,n,r,+S||0,l-(S||0),typeof v=="boolean"?dw:jb,0,A),m&&(N.fp=m),d&&N.modifier(d,this,n),this._pt=N):(!v&&!(r in n)&&Dm(r,l),rw.call(this,n,r,S,l,A,g||ga.stringFilter,m))},iw=function(n,r,s,l,c){if(Ot(n)&&(n=Qo(n,c,r,s,l)),!ys(n)||n.style&&n.nodeType||wn(n)||Xy(n))return ln(n)?Qo(n,c,r,s,l):n;var u={},d;for(d in n)u[d]=Qo(n[d],c,r,s,l);return u},Ab=function(n,r,s,l,c,u){var d,g,m,x;if(ua[n]&&(d=new ua[n]).init(c,d.rawVars?r[n]:iw(r[n],l,c,u,s),s,l,u)!==!1&&(s._pt=g=new Qn(s._pt,c,n,0,1,d.render,d,0,d.priority),s!==_l))for(m=s._ptLookup[s._targets.indexOf(c)],x=d._props.length;x--;)m[d._props[x]]=g;return d},Er,Qp,Hm=function i(n,r,s){var l=n.vars,c=l.ease,u=l.startAt,d=l.immediateRender,g=l.lazy,m=l.onUpdate,x=l.runBackwards,v=l.yoyoEase,S=l.keyframes,A=l.autoRevert,N=n._dur,_=n._startAt,T=n._targets,j=n.parent,E=j&&j.data==="nested"?j.vars.targets:T,M=n._overwrite==="auto"&&!Cm,R=n.timeline,O,P,z,C,G,W,re,Z,se,le,Q,H,K;if(R&&(!S||!c)&&(c="none"),n._ease=xi(c,zl.ease),n._yEase=v?yb(xi(v===!0?c:v,zl.ease)):0,v&&n._yoyo&&!n._repeat&&(v=n._yEase,n._yEase=n._ease,n._ease=v),n._from=!R&&!!l.runBackwards,!R||S&&!l.stagger){if(Z=T[0]?mi(T[0]).harness:0,H=Z&&l[Z.prop],O=Sf(l,km),_&&(_._zTime<0&&_.progress(1),r<0&&x&&d&&!A?_.render(-1,!0):_.revert(x&&N?of:kT),_._lazy=0),u){if(Lr(n._startAt=Qt.set(T,va({data:"isStart",overwrite:!1,parent:j,immediateRender:!0,lazy:!_&&Zn(g),startAt:null,delay:0,onUpdate:m&&function(){return pa(n,"onUpdate")},stagger:0},u))),n._startAt._dp=0,n._startAt._sat=n,r<0&&(pn||!d&&!A)&&n._startAt.revert(of),d&&N&&r<=0&&s<=0){r&&(n._zTime=r);return}}else if(x&&N&&!_){if(r&&(d=!1),z=va({overwrite:!1,data:"isFromStart",lazy:d&&!_&&Zn(g),immediateRender:d,stagger:0,parent:j},O),H&&(z[Z.prop]=H),Lr(n._startAt=Qt.set(T,z)),n._startAt._dp=0,n._startAt._sat=n,r<0&&(pn?n._startAt.revert(of):n._startAt.render(-1,!0)),n._zTime=r,!d)i(n._startAt,ct,ct);else if(!r)return}for(n._pt=n._ptCache=0,g=N&&Zn(g)||g&&!N,P=0;P<T.length;P++){if(G=T[P],re=G._gsap||Pm(T)[P]._gsap,n._ptLookup[P]=le={},qp[re.id]&&Dr.length&&_f(),Q=E===T?P:E.indexOf(G),Z&&(se=new Z).init(G,H||O,n,Q,E)!==!1&&(n._pt=C=new Qn(n._pt,G,se.name,0,1,se.render,se,0,se.priority),se._props.forEach(function(J){le[J]=C}),se.priority&&(W=1)),!Z||H)for(z in O)ua[z]&&(se=Ab(z,O,n,Q,G,E))?se.priority&&(W=1):le[z]=C=Um.call(n,G,z,"get",O[z],Q,E,0,l.stringFilter);n._op&&n._op[P]&&n.kill(G,n._op[P]),M&&n._pt&&(Er=n,Ct.killTweensOf(G,le,n.globalTime(r)),K=!n.parent,Er=0),n._pt&&g&&(qp[re.id]=1)}W&&Cb(n),n._onInit&&n._onInit(n)}n._onUpdate=m,n._initted=(!n._op||n._pt)&&!K,S&&r<=0&&R.render(Fa,!0,!0)},lw=function(n,r,s,l,c,u,d,g){var m=(n._pt&&n._ptCache||(n._ptCache={}))[r],x,v,S,A;if(!m)for(m=n._ptCache[r]=[],S=n._ptLookup,A=n._targets.length;A--;){if(x=S[A][r],x&&x.d&&x.d._pt)for(x=x.d._pt;x&&x.p!==r&&x.fp!==r;)x=x._next;if(!x)return Qp=1,n.vars[r]="+=0",Hm(n,d),Qp=0,g?oc(r+" not eligible for reset"):1;m.push(x)}for(A=m.length;A--;)v=m[A],x=v._pt||v,x.s=(l||l===0)&&!c?l:x.s+(l||0)+u*x.c,x.c=s-x.s,v.e&&(v.e=Bt(s)+An(v.e)),v.b&&(v.b=x.s+An(v.b))},ow=function(n,r){var s=n[0]?mi(n[0]).harness:0,l=s&&s.aliases,c,u,d,g;if(!l)return r;c=Rl({},r);for(u in l)if(u in c)for(g=l[u].split(","),d=g.length;d--;)c[g[d]]=c[u];return c},cw=function(n,r,s,l){var c=r.ease||l||"power1.inOut",u,d;if(wn(r))d=s[n]||(s[n]=[]),r.forEach(function(g,m){return d.push({t:m/(r.length-1)*100,v:g,e:c})});else for(u in r)d=s[u]||(s[u]=[]),u==="ease"||d.push({t:parseFloat(n),v:r[u],e:c})},Qo=function(n,r,s,l,c){return Ot(n)?n.call(r,s,l,c):ln(n)&&~n.indexOf("random(")?uc(n):n},Tb=Om+"repeat,repeatDelay,yoyo,repeatRefresh,yoyoEase,autoRevert",wb={};Kn(Tb+",id,stagger,delay,duration,paused,scrollTrigger",function(i){return wb[i]=1});var Qt=(function(i){Gy(n,i);function n(s,l,c,u){var d;typeof l=="number"&&(c.duration=l,l=c,c=null),d=i.call(this,u?l:Zo(l))||this;var g=d.vars,m=g.duration,x=g.delay,v=g.immediateRender,S=g.stagger,A=g.overwrite,N=g.keyframes,_=g.defaults,T=g.scrollTrigger,j=g.yoyoEase,E=l.parent||Ct,M=(wn(s)||Xy(s)?$s(s[0]):"length"in l)?[s]:Ya(s),R,O,P,z,C,G,W,re;if(d._targets=M.length?Pm(M):oc("GSAP target "+s+" not found. https://gsap.com",!ga.nullTargetWarn)||[],d._ptLookup=[],d._overwrite=A,N||S||Hu(m)||Hu(x)){if(l=d.vars,R=d.timeline=new On({data:"nested",defaults:_||{},targets:E&&E.data==="nested"?E.vars.targets:M}),R.kill(),R.parent=R._dp=qs(d),R._start=0,S||Hu(m)||Hu(x)){if(z=M.length,W=S&&cb(S),ys(S))for(C in S)~Tb.indexOf(C)&&(re||(re={}),re[C]=S[C]);for(O=0;O<z;O++)P=Sf(l,wb),P.stagger=0,j&&(P.yoyoEase=j),re&&Rl(P,re),G=M[O],P.duration=+Qo(m,qs(d),O,G,M),P.delay=(+Qo(x,qs(d),O,G,M)||0)-d._delay,!S&&z===1&&P.delay&&(d._delay=x=P.delay,d._start+=x,P.delay=0),R.to(G,P,W?W(O,G,M):0),R._ease=Ze.none;R.duration()?m=x=0:d.timeline=0}else if(N){Zo(va(R.vars.defaults,{ease:"none"})),R._ease=xi(N.ease||l.ease||"none");var Z=0,se,le,Q;if(wn(N))N.forEach(function(H){return R.to(M,H,">")}),R.duration();else{P={};for(C in N)C==="ease"||C==="easeEach"||cw(C,N[C],P,N.easeEach);for(C in P)for(se=P[C].sort(function(H,K){return H.t-K.t}),Z=0,O=0;O<se.length;O++)le=se[O],Q={ease:le.e,duration:(le.t-(O?se[O-1].t:0))/100*m},Q[C]=le.v,R.to(M,Q,Z),Z+=Q.duration;R.duration()<m&&R.to({},{duration:m-R.duration()})}}m||d.duration(m=R.duration())}else d.timeline=0;return A===!0&&!Cm&&(Er=qs(d),Ct.killTweensOf(M),Er=0),ps(E,qs(d),c),l.reversed&&d.reverse(),l.paused&&d.paused(!0),(v||!m&&!N&&d._start===Et(E._time)&&Zn(v)&&BT(qs(d))&&E.data!=="nested")&&(d._tTime=-ct,d.render(Math.max(0,-x)||0)),T&&rb(qs(d),T),d}var r=n.prototype;return r.render=function(l,c,u){var d=this._time,g=this._tDur,m=this._dur,x=l<0,v=l>g-ct&&!x?g:l<ct?0:l,S,A,N,_,T,j,E,M,R;if(!m)YT(this,l,c,u);else if(v!==this._tTime||!l||u||!this._initted&&this._tTime||this._startAt&&this._zTime<0!==x||this._lazy){if(S=v,M=this.timeline,this._repeat){if(_=m+this._rDelay,this._repeat<-1&&x)return this.totalTime(_*100+l,c,u);if(S=Et(v%_),v===g?(N=this._repeat,S=m):(T=Et(v/_),N=~~T,N&&N===T?(S=m,N--):S>m&&(S=m)),j=this._yoyo&&N&1,j&&(R=this._yEase,S=m-S),T=Ml(this._tTime,_),S===d&&!u&&this._initted&&N===T)return this._tTime=v,this;N!==T&&(M&&this._yEase&&bb(M,j),this.vars.repeatRefresh&&!j&&!this._lock&&S!==_&&this._initted&&(this._lock=u=1,this.render(Et(_*N),!0).invalidate()._lock=0))}if(!this._initted){if(ib(this,x?l:S,u,c,v))return this._tTime=0,this;if(d!==this._time&&!(u&&this.vars.repeatRefresh&&N!==T))return this;if(m!==this._dur)return this.render(l,c,u)}if(this._tTime=v,this._time=S,!this._act&&this._ts&&(this._act=1,this._lazy=0),this.ratio=E=(R||this._ease)(S/m),this._from&&(this.ratio=E=1-E),!d&&v&&!c&&!T&&(pa(this,"onStart"),this._tTime!==v))return this;for(A=this._pt;A;)A.r(E,A.d),A=A._next;M&&M.render(l<0?l:M._dur*M._ease(S/this._dur),c,u)||this._startAt&&(this._zTime=l),this._onUpdate&&!c&&(x&&Gp(this,l,c,u),pa(this,"onUpdate")),this._repeat&&N!==T&&this.vars.onRepeat&&!c&&this.parent&&pa(this,"onRepeat"),(v===this._tDur||!v)&&this._tTime===v&&(x&&!this._onUpdate&&Gp(this,l,!0,!0),(l||!m)&&(v===this._tDur&&this._ts>0||!v&&this._ts<0)&&Lr(this,1),!c&&!(x&&!d)&&(v||d||j)&&(pa(this,v===g?"onComplete":"onReverseComplete",!0),this._prom&&!(v<g&&this.timeScale()>0)&&this._prom()))}return this},r.targets=function(){return this._targets},r.invalidate=function(l){return(!l||!this.vars.runBackwards)&&(this._startAt=0),this._pt=this._op=this._onUpdate=this._lazy=this.ratio=0,this._ptLookup=[],this.timeline&&this.timeline.invalidate(l),i.prototype.invalidate.call(this,l)},r.resetTo=function(l,c,u,d,g){fc||da.wake(),this._ts||this.play();var m=Math.min(this._dur,(this._dp._time-this._start)*this._ts),x;return this._initted||Hm(this,m),x=this._ease(m/this._dur),lw(this,l,c,u,d,x,m,g)?this.resetTo(l,c,u,d,1):(Bf(this,0),this.parent||ab(this._dp,this,"_first","_last",this._dp._sort?"_start":0),this.render(0))},r.kill=function(l,c){if(c===void 0&&(c="all"),!l&&(!c||c==="all"))return this._lazy=this._pt=0,this.parent?Bo(this):this.scrollTrigger&&this.scrollTrigger.kill(!!pn),this;if(this.timeline){var u=this.timeline.totalDuration();return this.timeline.killTweensOf(l,c,Er&&Er.vars.overwrite!==!0)._first||Bo(this),this.parent&&u!==this.timeline.totalDuration()&&Dl(this,this._dur*this.timeline._tDur/u,0,1),this}var d=this._targets,g=l?Ya(l):d,m=this._ptLookup,x=this._pt,v,S,A,N,_,T,j;if((!c||c==="all")&&UT(d,g))return c==="all"&&(this._pt=0),Bo(this);for(v=this._op=this._op||[],c!=="all"&&(ln(c)&&(_={},Kn(c,function(E){return _[E]=1}),c=_),c=ow(d,c)),j=d.length;j--;)if(~g.indexOf(d[j])){S=m[j],c==="all"?(v[j]=c,N=S,A={}):(A=v[j]=v[j]||{},N=c);for(_ in N)T=S&&S[_],T&&((!("kill"in T.d)||T.d.kill(_)===!0)&&Uf(this,T,"_pt"),delete S[_]),A!=="all"&&(A[_]=1)}return this._initted&&!this._pt&&x&&Bo(this),this},n.to=function(l,c){return new n(l,c,arguments[2])},n.from=function(l,c){return Ko(1,arguments)},n.delayedCall=function(l,c,u,d){return new n(c,0,{immediateRender:!1,lazy:!1,overwrite:!1,delay:l,onComplete:c,onReverseComplete:c,onCompleteParams:u,onReverseCompleteParams:u,callbackScope:d})},n.fromTo=function(l,c,u){return Ko(2,arguments)},n.set=function(l,c){return c.duration=0,c.repeatDelay||(c.repeat=0),new n(l,c)},n.killTweensOf=function(l,c,u){return Ct.killTweensOf(l,c,u)},n})(dc);va(Qt.prototype,{_targets:[],_lazy:0,_startAt:0,_op:0,_onInit:0});Kn("staggerTo,staggerFrom,staggerFromTo",function(i){Qt[i]=function(){var n=new On,r=Xp.call(arguments,0);return r.splice(i==="staggerFromTo"?5:4,0,0),n[i].apply(n,r)}});var Bm=function(n,r,s){return n[r]=s},Nb=function(n,r,s){return n[r](s)},uw=function(n,r,s,l){return n[r](l.fp,s)},fw=function(n,r,s){return n.setAttribute(r,s)},Fm=function(n,r){return Ot(n[r])?Nb:zm(n[r])&&n.setAttribute?fw:Bm},jb=function(n,r){return r.set(r.t,r.p,Math.round((r.s+r.c*n)*1e6)/1e6,r)},dw=function(n,r){return r.set(r.t,r.p,!!(r.s+r.c*n),r)},Eb=function(n,r){var s=r._pt,l="";if(!n&&r.b)l=r.b;else if(n===1&&r.e)l=r.e;else{for(;s;)l=s.p+(s.m?s.m(s.s+s.c*n):Math.round((s.s+s.c*n)*1e4)/1e4)+l,s=s._next;l+=r.c}r.set(r.t,r.p,l,r)},Ym=function(n,r){for(var s=r._pt;s;)s.r(n,s.d),s=s._next},hw=function(n,r,s,l){for(var c=this._pt,u;c;)u=c._next,c.p===l&&c.modifier(n,r,s),c=u},pw=function(n){for(var r=this._pt,s,l;r;)l=r._next,r.p===n&&!r.op||r.op===n?Uf(this,r,"_pt"):r.dep||(s=1),r=l;return!s},mw=function(n,r,s,l){l.mSet(n,r,l.m.call(l.tween,s,l.mt),l)},Cb=function(n){for(var r=n._pt,s,l,c,u;r;){for(s=r._next,l=c;l&&l.pr>r.pr;)l=l._next;(r._prev=l?l._prev:u)?r._prev._next=r:c=r,(r._next=l)?l._prev=r:u=r,r=s}n._pt=c},Qn=(function(){function i(r,s,l,c,u,d,g,m,x){this.t=s,this.s=c,this.c=u,this.p=l,this.r=d||jb,this.d=g||this,this.set=m||Bm,this.pr=x||0,this._next=r,r&&(r._prev=this)}var n=i.prototype;return n.modifier=function(s,l,c){this.mSet=this.mSet||this.set,this.set=mw,this.m=s,this.mt=c,this.tween=l},i})();Kn(Om+"parent,duration,ease,delay,overwrite,runBackwards,startAt,yoyo,immediateRender,repeat,repeatDelay,data,paused,reversed,lazy,callbackScope,stringFilter,id,yoyoEase,stagger,inherit,repeatRefresh,keyframes,autoRevert,scrollTrigger",function(i){return km[i]=1});xa.TweenMax=xa.TweenLite=Qt;xa.TimelineLite=xa.TimelineMax=On;Ct=new On({sortChildren:!1,defaults:zl,autoRemoveChildren:!0,id:"root",smoothChildTiming:!0});ga.stringFilter=vb;var vi=[],uf={},gw=[],Sv=0,xw=0,mp=function(n){return(uf[n]||gw).map(function(r){return r()})},$p=function(){var n=Date.now(),r=[];n-Sv>2&&(mp("matchMediaInit"),vi.forEach(function(s){var l=s.queries,c=s.conditions,u,d,g,m;for(d in l)u=ds.matchMedia(l[d]).matches,u&&(g=1),u!==c[d]&&(c[d]=u,m=1);m&&(s.revert(),g&&r.push(s))}),mp("matchMediaRevert"),r.forEach(function(s){return s.onMatch(s,function(l){return s.add(null,l)})}),Sv=n,mp("matchMedia"))},zb=(function(){function i(r,s){this.selector=s&&Zp(s),this.data=[],this._r=[],this.isReverted=!1,this.id=xw++,r&&this.add(r)}var n=i.prototype;return n.add=function(s,l,c){Ot(s)&&(c=l,l=s,s=Ot);var u=this,d=function(){var m=St,x=u.selector,v;return m&&m!==u&&m.data.push(u),c&&(u.selector=Zp(c)),St=u,v=l.apply(u,arguments),Ot(v)&&u._r.push(v),St=m,u.selector=x,u.isReverted=!1,v};return u.last=d,s===Ot?d(u,function(g){return u.add(null,g)}):s?u[s]=d:d},n.ignore=function(s){var l=St;St=null,s(this),St=l},n.getTweens=function(){var s=[];return this.data.forEach(function(l){return l instanceof i?s.push.apply(s,l.getTweens()):l instanceof Qt&&!(l.parent&&l.parent.data==="nested")&&s.push(l)}),s},n.clear=function(){this._r.length=this.data.length=0},n.kill=function(s,l){var c=this;if(s?(function(){for(var d=c.getTweens(),g=c.data.length,m;g--;)m=c.data[g],m.data==="isFlip"&&(m.revert(),m.getChildren(!0,!0,!1).forEach(function(x){return d.splice(d.indexOf(x),1)}));for(d.map(function(x){return{g:x._dur||x._delay||x._sat&&!x._sat.vars.immediateRender?x.globalTime(0):-1/0,t:x}}).sort(function(x,v){return v.g-x.g||-1/0}).forEach(function(x){return x.t.revert(s)}),g=c.data.length;g--;)m=c.data[g],m instanceof On?m.data!=="nested"&&(m.scrollTrigger&&m.scrollTrigger.revert(),m.kill()):!(m instanceof Qt)&&m.revert&&m.revert(s);c._r.forEach(function(x){return x(s,c)}),c.isReverted=!0})():this.data.forEach(function(d){return d.kill&&d.kill()}),this.clear(),l)for(var u=vi.length;u--;)vi[u].id===this.id&&vi.splice(u,1)},n.revert=function(s){this.kill(s||{})},i})(),vw=(function(){function i(r){this.contexts=[],this.scope=r,St&&St.data.push(this)}var n=i.prototype;return n.add=function(s,l,c){ys(s)||(s={matches:s});var u=new zb(0,c||this.scope),d=u.conditions={},g,m,x;St&&!u.selector&&(u.selector=St.selector),this.contexts.push(u),l=u.add("onMatch",l),u.queries=s;for(m in s)m==="all"?x=1:(g=ds.matchMedia(s[m]),g&&(vi.indexOf(u)<0&&vi.push(u),(d[m]=g.matches)&&(x=1),g.addListener?g.addListener($p):g.addEventListener("change",$p)));return x&&l(u,function(v){return u.add(null,v)}),this},n.revert=function(s){this.kill(s||{})},n.kill=function(s){this.contexts.forEach(function(l){return l.kill(s,!0)})},i})(),Tf={registerPlugin:function(){for(var n=arguments.length,r=new Array(n),s=0;s<n;s++)r[s]=arguments[s];r.forEach(function(l){return mb(l)})},timeline:function(n){return new On(n)},getTweensOf:function(n,r){return Ct.getTweensOf(n,r)},getProperty:function(n,r,s,l){ln(n)&&(n=Ya(n)[0]);var c=mi(n||{}).get,u=s?nb:tb;return s==="native"&&(s=""),n&&(r?u((ua[r]&&ua[r].get||c)(n,r,s,l)):function(d,g,m){return u((ua[d]&&ua[d].get||c)(n,d,g,m))})},quickSetter:function(n,r,s){if(n=Ya(n),n.length>1){var l=n.map(function(x){return Jn.quickSetter(x,r,s)}),c=l.length;return function(x){for(var v=c;v--;)l[v](x)}}n=n[0]||{};var u=ua[r],d=mi(n),g=d.harness&&(d.harness.aliases||{})[r]||r,m=u?function(x){var v=new u;_l._pt=0,v.init(n,s?x+s:x,_l,0,[n]),v.render(1,v),_l._pt&&Ym(1,_l)}:d.set(n,g);return u?m:function(x){return m(n,g,s?x+s:x,d,1)}},quickTo:function(n,r,s){var l,c=Jn.to(n,va((l={},l[r]="+=0.1",l.paused=!0,l.stagger=0,l),s||{})),u=function(g,m,x){return c.resetTo(r,g,m,x)};return u.tween=c,u},isTweening:function(n){return Ct.getTweensOf(n,!0).length>0},defaults:function(n){return n&&n.ease&&(n.ease=xi(n.ease,zl.ease)),xv(zl,n||{})},config:function(n){return xv(ga,n||{})},registerEffect:function(n){var r=n.name,s=n.effect,l=n.plugins,c=n.defaults,u=n.extendTimeline;(l||"").split(",").forEach(function(d){return d&&!ua[d]&&!xa[d]&&oc(r+" effect requires "+d+" plugin.")}),fp[r]=function(d,g,m){return s(Ya(d),va(g||{},c),m)},u&&(On.prototype[r]=function(d,g,m){return this.add(fp[r](d,ys(g)?g:(m=g)&&{},this),m)})},registerEase:function(n,r){Ze[n]=xi(r)},parseEase:function(n,r){return arguments.length?xi(n,r):Ze},getById:function(n){return Ct.getById(n)},exportRoot:function(n,r){n===void 0&&(n={});var s=new On(n),l,c;for(s.smoothChildTiming=Zn(n.smoothChildTiming),Ct.remove(s),s._dp=0,s._time=s._tTime=Ct._time,l=Ct._first;l;)c=l._next,(r||!(!l._dur&&l instanceof Qt&&l.vars.onComplete===l._targets[0]))&&ps(s,l,l._start-l._delay),l=c;return ps(Ct,s,0),s},context:function(n,r){return n?new zb(n,r):St},matchMedia:function(n){return new vw(n)},matchMediaRefresh:function(){return vi.forEach(function(n){var r=n.conditions,s,l;for(l in r)r[l]&&(r[l]=!1,s=1);s&&n.revert()})||$p()},addEventListener:function(n,r){var s=uf[n]||(uf[n]=[]);~s.indexOf(r)||s.push(r)},removeEventListener:function(n,r){var s=uf[n],l=s&&s.indexOf(r);l>=0&&s.splice(l,1)},utils:{wrap:$T,wrapYoyo:JT,distribute:cb,random:fb,snap:ub,normalize:QT,getUnit:An,clamp:VT,splitColor:gb,toArray:Ya,selector:Zp,mapRange:hb,pipe:ZT,unitize:KT,interpolate:IT,shuffle:ob},install:$y,effects:fp,ticker:da,updateRoot:On.updateRoot,plugins:ua,globalTimeline:Ct,core:{PropTween:Qn,globals:Jy,Tween:Qt,Timeline:On,Animation:dc,getCache:mi,_removeLinkedListItem:Uf,reverting:function(){return pn},context:function(n){return n&&St&&(St.data.push(n),n._ctx=St),St},suppressOverwrites:function(n){return Cm=n}}};Kn("to,from,fromTo,delayedCall,set,killTweensOf",function(i){return Tf[i]=Qt[i]});da.add(On.updateRoot);_l=Tf.to({},{duration:0});var yw=function(n,r){for(var s=n._pt;s&&s.p!==r&&s.op!==r&&s.fp!==r;)s=s._next;return s},bw=function(n,r){var s=n._targets,l,c,u;for(l in r)for(c=s.length;c--;)u=n._ptLookup[c][l],u&&(u=u.d)&&(u._pt&&(u=yw(u,l)),u&&u.modifier&&u.modifier(r[l],n,s[c],l))},gp=function(n,r){return{name:n,headless:1,rawVars:1,init:function(l,c,u){u._onInit=function(d){var g,m;if(ln(c)&&(g={},Kn(c,function(x){return g[x]=1}),c=g),r){g={};for(m in c)g[m]=r(c[m]);c=g}bw(d,c)}}}},Jn=Tf.registerPlugin({name:"attr",init:function(n,r,s,l,c){var u,d,g;this.tween=s;for(u in r)g=n.getAttribute(u)||"",d=this.add(n,"setAttribute",(g||0)+"",r[u],l,c,0,0,u),d.op=u,d.b=g,this._props.push(u)},render:function(n,r){for(var s=r._pt;s;)pn?s.set(s.t,s.p,s.b,s):s.r(n,s.d),s=s._next}},{name:"endArray",headless:1,init:function(n,r){for(var s=r.length;s--;)this.add(n,s,n[s]||0,r[s],0,0,0,0,0,1)}},gp("roundProps",Kp),gp("modifiers"),gp("snap",ub))||Tf;Qt.version=On.version=Jn.version="3.14.2";Qy=1;Rm()&&kl();Ze.Power0;Ze.Power1;Ze.Power2;Ze.Power3;Ze.Power4;Ze.Linear;Ze.Quad;Ze.Cubic;Ze.Quart;Ze.Quint;Ze.Strong;Ze.Elastic;Ze.Back;Ze.SteppedEase;Ze.Bounce;Ze.Sine;Ze.Expo;Ze.Circ;var Av,Cr,Tl,qm,hi,Tv,Gm,_w=function(){return typeof window<"u"},Js={},ci=180/Math.PI,wl=Math.PI/180,ul=Math.atan2,wv=1e8,Vm=/([A-Z])/g,Sw=/(left|right|width|margin|padding|x)/i,Aw=/[\s,\(]\S/,gs={autoAlpha:"opacity,visibility",scale:"scaleX,scaleY",alpha:"opacity"},Jp=function(n,r){return r.set(r.t,r.p,Math.round((r.s+r.c*n)*1e4)/1e4+r.u,r)},Tw=function(n,r){return r.set(r.t,r.p,n===1?r.e:Math.round((r.s+r.c*n)*1e4)/1e4+r.u,r)},ww=function(n,r){return r.set(r.t,r.p,n?Math.round((r.s+r.c*n)*1e4)/1e4+r.u:r.b,r)},Nw=function(n,r){return r.set(r.t,r.p,n===1?r.e:n?Math.round((r.s+r.c*n)*1e4)/1e4+r.u:r.b,r)},jw=function(n,r){var s=r.s+r.c*n;r.set(r.t,r.p,~~(s+(s<0?-.5:.5))+r.u,r)},Rb=function(n,r){return r.set(r.t,r.p,n?r.e:r.b,r)},Mb=function(n,r){return r.set(r.t,r.p,n!==1?r.b:r.e,r)},Ew=function(n,r,s){return n.style[r]=s},Cw=function(n,r,s){return n.style.setProperty(r,s)},zw=function(n,r,s){return n._gsap[r]=s},Rw=function(n,r,s){return n._gsap.scaleX=n._gsap.scaleY=s},Mw=function(n,r,s,l,c){var u=n._gsap;u.scaleX=u.scaleY=s,u.renderTransform(c,u)},Dw=function(n,r,s,l,c){var u=n._gsap;u[r]=s,u.renderTransform(c,u)},zt="transform",$n=zt+"Origin",kw=function i(n,r){var s=this,l=this.target,c=l.style,u=l._gsap;if(n in Js&&c){if(this.tfm=this.tfm||{},n!=="transform")n=gs[n]||n,~n.indexOf(",")?n.split(",").forEach(function(d){return s.tfm[d]=Gs(l,d)}):this.tfm[n]=u.x?u[n]:Gs(l,n),n===$n&&(this.tfm.zOrigin=u.zOrigin);else return gs.transform.split(",").forEach(function(d){return i.call(s,d,r)});if(this.props.indexOf(zt)>=0)return;u.svg&&(this.svgo=l.getAttribute("data-svg-origin"),this.props.push($n,r,"")),n=zt}(c||r)&&this.props.push(n,r,c[n])},Db=function(n){n.translate&&(n.removeProperty("translate"),n.removeProperty("scale"),n.removeProperty("rotate"))},Ow=function(){var n=this.props,r=this.target,s=r.style,l=r._gsap,c,u;for(c=0;c<n.length;c+=3)n[c+1]?n[c+1]===2?r[n[c]](n[c+2]):r[n[c]]=n[c+2]:n[c+2]?s[n[c]]=n[c+2]:s.removeProperty(n[c].substr(0,2)==="--"?n[c]:n[c].replace(Vm,"-$1").toLowerCase());if(this.tfm){for(u in this.tfm)l[u]=this.tfm[u];l.svg&&(l.renderTransform(),r.setAttribute("data-svg-origin",this.svgo||"")),c=Gm(),(!c||!c.isStart)&&!s[zt]&&(Db(s),l.zOrigin&&s[$n]&&(s[$n]+=" "+l.zOrigin+"px",l.zOrigin=0,l.renderTransform()),l.uncache=1)}},kb=function(n,r){var s={target:n,props:[],revert:Ow,save:kw};return n._gsap||Jn.core.getCache(n),r&&n.style&&n.nodeType&&r.split(",").forEach(function(l){return s.save(l)}),s},Ob,Ip=function(n,r){var s=Cr.createElementNS?Cr.createElementNS((r||"http://www.w3.org/1999/xhtml").replace(/^https/,"http"),n):Cr.createElement(n);return s&&s.style?s:Cr.createElement(n)},ma=function i(n,r,s){var l=getComputedStyle(n);return l[r]||l.getPropertyValue(r.replace(Vm,"-$1").toLowerCase())||l.getPropertyValue(r)||!s&&i(n,Ol(r)||r,1)||""},Nv="O,Moz,ms,Ms,Webkit".split(","),Ol=function(n,r,s){var l=r||hi,c=l.style,u=5;if(n in c&&!s)return n;for(n=n.charAt(0).toUpperCase()+n.substr(1);u--&&!(Nv[u]+n in c););return u<0?null:(u===3?"ms":u>=0?Nv[u]:"")+n},Wp=function(){_w()&&window.document&&(Av=window,Cr=Av.document,Tl=Cr.documentElement,hi=Ip("div")||{style:{}},Ip("div"),zt=Ol(zt),$n=zt+"Origin",hi.style.cssText="border-width:0;line-height:0;position:absolute;padding:0",Ob=!!Ol("perspective"),Gm=Jn.core.reverting,qm=1)},jv=function(n){var r=n.ownerSVGElement,s=Ip("svg",r&&r.getAttribute("xmlns")||"http://www.w3.org/2000/svg"),l=n.cloneNode(!0),c;l.style.display="block",s.appendChild(l),Tl.appendChild(s);try{c=l.getBBox()}catch{}return s.removeChild(l),Tl.removeChild(s),c},Ev=function(n,r){for(var s=r.length;s--;)if(n.hasAttribute(r[s]))return n.getAttribute(r[s])},Pb=function(n){var r,s;try{r=n.getBBox()}catch{r=jv(n),s=1}return r&&(r.width||r.height)||s||(r=jv(n)),r&&!r.width&&!r.x&&!r.y?{x:+Ev(n,["x","cx","x1"])||0,y:+Ev(n,["y","cy","y1"])||0,width:0,height:0}:r},Lb=function(n){return!!(n.getCTM&&(!n.parentNode||n.ownerSVGElement)&&Pb(n))},Ur=function(n,r){if(r){var s=n.style,l;r in Js&&r!==$n&&(r=zt),s.removeProperty?(l=r.substr(0,2),(l==="ms"||r.substr(0,6)==="webkit")&&(r="-"+r),s.removeProperty(l==="--"?r:r.replace(Vm,"-$1").toLowerCase())):s.removeAttribute(r)}},zr=function(n,r,s,l,c,u){var d=new Qn(n._pt,r,s,0,1,u?Mb:Rb);return n._pt=d,d.b=l,d.e=c,n._props.push(s),d},Cv={deg:1,rad:1,turn:1},Pw={grid:1,flex:1},Hr=function i(n,r,s,l){var c=parseFloat(s)||0,u=(s+"").trim().substr((c+"").length)||"px",d=hi.style,g=Sw.test(r),m=n.tagName.toLowerCase()==="svg",x=(m?"client":"offset")+(g?"Width":"Height"),v=100,S=l==="px",A=l==="%",N,_,T,j;if(l===u||!c||Cv[l]||Cv[u])return c;if(u!=="px"&&!S&&(c=i(n,r,s,"px")),j=n.getCTM&&Lb(n),(A||u==="%")&&(Js[r]||~r.indexOf("adius")))return N=j?n.getBBox()[g?"width":"height"]:n[x],Bt(A?c/N*v:c/100*N);if(d[g?"width":"height"]=v+(S?u:l),_=l!=="rem"&&~r.indexOf("adius")||l==="em"&&n.appendChild&&!m?n:n.parentNode,j&&(_=(n.ownerSVGElement||{}).parentNode),(!_||_===Cr||!_.appendChild)&&(_=Cr.body),T=_._gsap,T&&A&&T.width&&g&&T.time===da.time&&!T.uncache)return Bt(c/T.width*v);if(A&&(r==="height"||r==="width")){var E=n.style[r];n.style[r]=v+l,N=n[x],E?n.style[r]=E:Ur(n,r)}else(A||u==="%")&&!Pw[ma(_,"display")]&&(d.position=ma(n,"position")),_===n&&(d.position="static"),_.appendChild(hi),N=hi[x],_.removeChild(hi),d.position="absolute";return g&&A&&(T=mi(_),T.time=da.time,T.width=_[x]),Bt(S?N*c/v:N&&c?v/N*c:0)},Gs=function(n,r,s,l){var c;return qm||Wp(),r in gs&&r!=="transform"&&(r=gs[r],~r.indexOf(",")&&(r=r.split(",")[0])),Js[r]&&r!=="transform"?(c=pc(n,l),c=r!=="transformOrigin"?c[r]:c.svg?c.origin:Nf(ma(n,$n))+" "+c.zOrigin+"px"):(c=n.style[r],(!c||c==="auto"||l||~(c+"").indexOf("calc("))&&(c=wf[r]&&wf[r](n,r,s)||ma(n,r)||Wy(n,r)||(r==="opacity"?1:0))),s&&!~(c+"").trim().indexOf(" ")?Hr(n,r,c,s)+s:c},Lw=function(n,r,s,l){if(!s||s==="none"){var c=Ol(r,n,1),u=c&&ma(n,c,1);u&&u!==s?(r=c,s=u):r==="borderColor"&&(s=ma(n,"borderTopColor"))}var d=new Qn(this._pt,n.style,r,0,1,Eb),g=0,m=0,x,v,S,A,N,_,T,j,E,M,R,O;if(d.b=s,d.e=l,s+="",l+="",l.substring(0,6)==="var(--"&&(l=ma(n,l.substring(4,l.indexOf(")")))),l==="auto"&&(_=n.style[r],n.style[r]=l,l=ma(n,r)||l,_?n.style[r]=_:Ur(n,r)),x=[s,l],vb(x),s=x[0],l=x[1],S=s.match(bl)||[],O=l.match(bl)||[],O.length){for(;v=bl.exec(l);)T=v[0],E=l.substring(g,v.index),N?N=(N+1)%5:(E.substr(-5)==="rgba("||E.substr(-5)==="hsla(")&&(N=1),T!==(_=S[m++]||"")&&(A=parseFloat(_)||0,R=_.substr((A+"").length),T.charAt(1)==="="&&(T=Al(A,T)+R),j=parseFloat(T),M=T.substr((j+"").length),g=bl.lastIndex-M.length,M||(M=M||ga.units[r]||R,g===l.length&&(l+=M,d.e+=M)),R!==M&&(A=Hr(n,r,_,M)||0),d._pt={_next:d._pt,p:E||m===1?E:",",s:A,c:j-A,m:N&&N<4||r==="zIndex"?Math.round:0});d.c=g<l.length?l.substring(g,l.length):""}else d.r=r==="display"&&l==="none"?Mb:Rb;return Ky.test(l)&&(d.e=0),this._pt=d,d},zv={top:"0%",bottom:"100%",left:"0%",right:"100%",center:"50%"},Uw=function(n){var r=n.split(" "),s=r[0],l=r[1]||"50%";return(s==="top"||s==="bottom"||l==="left"||l==="right")&&(n=s,s=l,l=n),r[0]=zv[s]||s,r[1]=zv[l]||l,r.join(" ")},Hw=function(n,r){if(r.tween&&r.tween._time===r.tween._dur){var s=r.t,l=s.style,c=r.u,u=s._gsap,d,g,m;if(c==="all"||c===!0)l.cssText="",g=1;else for(c=c.split(","),m=c.length;--m>-1;)d=c[m],Js[d]&&(g=1,d=d==="transformOrigin"?$n:zt),Ur(s,d);g&&(Ur(s,zt),u&&(u.svg&&s.removeAttribute("transform"),l.scale=l.rotate=l.translate="none",pc(s,1),u.uncache=1,Db(l)))}},wf={clearProps:function(n,r,s,l,c){if(c.data!=="isFromStart"){var u=n._pt=new Qn(n._pt,r,s,0,0,Hw);return u.u=l,u.pr=-10,u.tween=c,n._props.push(s),1}}},hc=[1,0,0,1,0,0],Ub={},Hb=function(n){return n==="matrix(1, 0, 0, 1, 0, 0)"||n==="none"||!n},Rv=function(n){var r=ma(n,zt);return Hb(r)?hc:r.substr(7).match(Zy).map(Bt)},Xm=function(n,r){var s=n._gsap||mi(n),l=n.style,c=Rv(n),u,d,g,m;return s.svg&&n.getAttribute("transform")?(g=n.transform.baseVal.consolidate().matrix,c=[g.a,g.b,g.c,g.d,g.e,g.f],c.join(",")==="1,0,0,1,0,0"?hc:c):(c===hc&&!n.offsetParent&&n!==Tl&&!s.svg&&(g=l.display,l.display="block",u=n.parentNode,(!u||!n.offsetParent&&!n.getBoundingClientRect().width)&&(m=1,d=n.nextElementSibling,Tl.appendChild(n)),c=Rv(n),g?l.display=g:Ur(n,"display"),m&&(d?u.insertBefore(n,d):u?u.appendChild(n):Tl.removeChild(n))),r&&c.length>6?[c[0],c[1],c[4],c[5],c[12],c[13]]:c)},em=function(n,r,s,l,c,u){var d=n._gsap,g=c||Xm(n,!0),m=d.xOrigin||0,x=d.yOrigin||0,v=d.xOffset||0,S=d.yOffset||0,A=g[0],N=g[1],_=g[2],T=g[3],j=g[4],E=g[5],M=r.split(" "),R=parseFloat(M[0])||0,O=parseFloat(M[1])||0,P,z,C,G;s?g!==hc&&(z=A*T-N*_)&&(C=R*(T/z)+O*(-_/z)+(_*E-T*j)/z,G=R*(-N/z)+O*(A/z)-(A*E-N*j)/z,R=C,O=G):(P=Pb(n),R=P.x+(~M[0].indexOf("%")?R/100*P.width:R),O=P.y+(~(M[1]||M[0]).indexOf("%")?O/100*P.height:O)),l||l!==!1&&d.smooth?(j=R-m,E=O-x,d.xOffset=v+(j*A+E*_)-j,d.yOffset=S+(j*N+E*T)-E):d.xOffset=d.yOffset=0,d.xOrigin=R,d.yOrigin=O,d.smooth=!!l,d.origin=r,d.originIsAbsolute=!!s,n.style[$n]="0px 0px",u&&(zr(u,d,"xOrigin",m,R),zr(u,d,"yOrigin",x,O),zr(u,d,"xOffset",v,d.xOffset),zr(u,d,"yOffset",S,d.yOffset)),n.setAttribute("data-svg-origin",R+" "+O)},pc=function(n,r){var s=n._gsap||new Sb(n);if("x"in s&&!r&&!s.uncache)return s;var l=n.style,c=s.scaleX<0,u="px",d="deg",g=getComputedStyle(n),m=ma(n,$n)||"0",x,v,S,A,N,_,T,j,E,M,R,O,P,z,C,G,W,re,Z,se,le,Q,H,K,J,me,U,k,I,F,ae,ce;return x=v=S=_=T=j=E=M=R=0,A=N=1,s.svg=!!(n.getCTM&&Lb(n)),g.translate&&((g.translate!=="none"||g.scale!=="none"||g.rotate!=="none")&&(l[zt]=(g.translate!=="none"?"translate3d("+(g.translate+" 0 0").split(" ").slice(0,3).join(", ")+") ":"")+(g.rotate!=="none"?"rotate("+g.rotate+") ":"")+(g.scale!=="none"?"scale("+g.scale.split(" ").join(",")+") ":"")+(g[zt]!=="none"?g[zt]:"")),l.scale=l.rotate=l.translate="none"),z=Xm(n,s.svg),s.svg&&(s.uncache?(J=n.getBBox(),m=s.xOrigin-J.x+"px "+(s.yOrigin-J.y)+"px",K=""):K=!r&&n.getAttribute("data-svg-origin"),em(n,K||m,!!K||s.originIsAbsolute,s.smooth!==!1,z)),O=s.xOrigin||0,P=s.yOrigin||0,z!==hc&&(re=z[0],Z=z[1],se=z[2],le=z[3],x=Q=z[4],v=H=z[5],z.length===6?(A=Math.sqrt(re*re+Z*Z),N=Math.sqrt(le*le+se*se),_=re||Z?ul(Z,re)*ci:0,E=se||le?ul(se,le)*ci+_:0,E&&(N*=Math.abs(Math.cos(E*wl))),s.svg&&(x-=O-(O*re+P*se),v-=P-(O*Z+P*le))):(ce=z[6],F=z[7],U=z[8],k=z[9],I=z[10],ae=z[11],x=z[12],v=z[13],S=z[14],C=ul(ce,I),T=C*ci,C&&(G=Math.cos(-C),W=Math.sin(-C),K=Q*G+U*W,J=H*G+k*W,me=ce*G+I*W,U=Q*-W+U*G,k=H*-W+k*G,I=ce*-W+I*G,ae=F*-W+ae*G,Q=K,H=J,ce=me),C=ul(-se,I),j=C*ci,C&&(G=Math.cos(-C),W=Math.sin(-C),K=re*G-U*W,J=Z*G-k*W,me=se*G-I*W,ae=le*W+ae*G,re=K,Z=J,se=me),C=ul(Z,re),_=C*ci,C&&(G=Math.cos(C),W=Math.sin(C),K=re*G+Z*W,J=Q*G+H*W,Z=Z*G-re*W,H=H*G-Q*W,re=K,Q=J),T&&Math.abs(T)+Math.abs(_)>359.9&&(T=_=0,j=180-j),A=Bt(Math.sqrt(re*re+Z*Z+se*se)),N=Bt(Math.sqrt(H*H+ce*ce)),C=ul(Q,H),E=Math.abs(C)>2e-4?C*ci:0,R=ae?1/(ae<0?-ae:ae):0),s.svg&&(K=n.getAttribute("transform"),s.forceCSS=n.setAttribute("transform","")||!Hb(ma(n,zt)),K&&n.setAttribute("transform",K))),Math.abs(E)>90&&Math.abs(E)<270&&(c?(A*=-1,E+=_<=0?180:-180,_+=_<=0?180:-180):(N*=-1,E+=E<=0?180:-180)),r=r||s.uncache,s.x=x-((s.xPercent=x&&(!r&&s.xPercent||(Math.round(n.offsetWidth/2)===Math.round(-x)?-50:0)))?n.offsetWidth*s.xPercent/100:0)+u,s.y=v-((s.yPercent=v&&(!r&&s.yPercent||(Math.round(n.offsetHeight/2)===Math.round(-v)?-50:0)))?n.offsetHeight*s.yPercent/100:0)+u,s.z=S+u,s.scaleX=Bt(A),s.scaleY=Bt(N),s.rotation=Bt(_)+d,s.rotationX=Bt(T)+d,s.rotationY=Bt(j)+d,s.skewX=E+d,s.skewY=M+d,s.transformPerspective=R+u,(s.zOrigin=parseFloat(m.split(" ")[2])||!r&&s.zOrigin||0)&&(l[$n]=Nf(m)),s.xOffset=s.yOffset=0,s.force3D=ga.force3D,s.renderTransform=s.svg?Fw:Ob?Bb:Bw,s.uncache=0,s},Nf=function(n){return(n=n.split(" "))[0]+" "+n[1]},xp=function(n,r,s){var l=An(r);return Bt(parseFloat(r)+parseFloat(Hr(n,"x",s+"px",l)))+l},Bw=function(n,r){r.z="0px",r.rotationY=r.rotationX="0deg",r.force3D=0,Bb(n,r)},ii="0deg",Po="0px",li=") ",Bb=function(n,r){var s=r||this,l=s.xPercent,c=s.yPercent,u=s.x,d=s.y,g=s.z,m=s.rotation,x=s.rotationY,v=s.rotationX,S=s.skewX,A=s.skewY,N=s.scaleX,_=s.scaleY,T=s.transformPerspective,j=s.force3D,E=s.target,M=s.zOrigin,R="",O=j==="auto"&&n&&n!==1||j===!0;if(M&&(v!==ii||x!==ii)){var P=parseFloat(x)*wl,z=Math.sin(P),C=Math.cos(P),G;P=parseFloat(v)*wl,G=Math.cos(P),u=xp(E,u,z*G*-M),d=xp(E,d,-Math.sin(P)*-M),g=xp(E,g,C*G*-M+M)}T!==Po&&(R+="perspective("+T+li),(l||c)&&(R+="translate("+l+"%, "+c+"%) "),(O||u!==Po||d!==Po||g!==Po)&&(R+=g!==Po||O?"translate3d("+u+", "+d+", "+g+") ":"translate("+u+", "+d+li),m!==ii&&(R+="rotate("+m+li),x!==ii&&(R+="rotateY("+x+li),v!==ii&&(R+="rotateX("+v+li),(S!==ii||A!==ii)&&(R+="skew("+S+", "+A+li),(N!==1||_!==1)&&(R+="scale("+N+", "+_+li),E.style[zt]=R||"translate(0, 0)"},Fw=function(n,r){var s=r||this,l=s.xPercent,c=s.yPercent,u=s.x,d=s.y,g=s.rotation,m=s.skewX,x=s.skewY,v=s.scaleX,S=s.scaleY,A=s.target,N=s.xOrigin,_=s.yOrigin,T=s.xOffset,j=s.yOffset,E=s.forceCSS,M=parseFloat(u),R=parseFloat(d),O,P,z,C,G;g=parseFloat(g),m=parseFloat(m),x=parseFloat(x),x&&(x=parseFloat(x),m+=x,g+=x),g||m?(g*=wl,m*=wl,O=Math.cos(g)*v,P=Math.sin(g)*v,z=Math.sin(g-m)*-S,C=Math.cos(g-m)*S,m&&(x*=wl,G=Math.tan(m-x),G=Math.sqrt(1+G*G),z*=G,C*=G,x&&(G=Math.tan(x),G=Math.sqrt(1+G*G),O*=G,P*=G)),O=Bt(O),P=Bt(P),z=Bt(z),C=Bt(C)):(O=v,C=S,P=z=0),(M&&!~(u+"").indexOf("px")||R&&!~(d+"").indexOf("px"))&&(M=Hr(A,"x",u,"px"),R=Hr(A,"y",d,"px")),(N||_||T||j)&&(M=Bt(M+N-(N*O+_*z)+T),R=Bt(R+_-(N*P+_*C)+j)),(l||c)&&(G=A.getBBox(),M=Bt(M+l/100*G.width),R=Bt(R+c/100*G.height)),G="matrix("+O+","+P+","+z+","+C+","+M+","+R+")",A.setAttribute("transform",G),E&&(A.style[zt]=G)},Yw=function(n,r,s,l,c){var u=360,d=ln(c),g=parseFloat(c)*(d&&~c.indexOf("rad")?ci:1),m=g-l,x=l+m+"deg",v,S;return d&&(v=c.split("_")[1],v==="short"&&(m%=u,m!==m%(u/2)&&(m+=m<0?u:-u)),v==="cw"&&m<0?m=(m+u*wv)%u-~~(m/u)*u:v==="ccw"&&m>0&&(m=(m-u*wv)%u-~~(m/u)*u)),n._pt=S=new Qn(n._pt,r,s,l,m,Tw),S.e=x,S.u="deg",n._props.push(s),S},Mv=function(n,r){for(var s in r)n[s]=r[s];return n},qw=function(n,r,s){var l=Mv({},s._gsap),c="perspective,force3D,transformOrigin,svgOrigin",u=s.style,d,g,m,x,v,S,A,N;l.svg?(m=s.getAttribute("transform"),s.setAttribute("transform",""),u[zt]=r,d=pc(s,1),Ur(s,zt),s.setAttribute("transform",m)):(m=getComputedStyle(s)[zt],u[zt]=r,d=pc(s,1),u[zt]=m);for(g in Js)m=l[g],x=d[g],m!==x&&c.indexOf(g)<0&&(A=An(m),N=An(x),v=A!==N?Hr(s,g,m,N):parseFloat(m),S=parseFloat(x),n._pt=new Qn(n._pt,d,g,v,S-v,Jp),n._pt.u=N||0,n._props.push(g));Mv(d,l)};Kn("padding,margin,Width,Radius",function(i,n){var r="Top",s="Right",l="Bottom",c="Left",u=(n<3?[r,s,l,c]:[r+c,r+s,l+s,l+c]).map(function(d){return n<2?i+d:"border"+d+i});wf[n>1?"border"+i:i]=function(d,g,m,x,v){var S,A;if(arguments.length<4)return S=u.map(function(N){return Gs(d,N,m)}),A=S.join(" "),A.split(S[0]).length===5?S[0]:A;S=(x+"").split(" "),A={},u.forEach(function(N,_){return A[N]=S[_]=S[_]||S[(_-1)/2|0]}),d.init(g,A,v)}});var Fb={name:"css",register:Wp,targetTest:function(n){return n.style&&n.nodeType},init:function(n,r,s,l,c){var u=this._props,d=n.style,g=s.vars.startAt,m,x,v,S,A,N,_,T,j,E,M,R,O,P,z,C,G;qm||Wp(),this.styles=this.styles||kb(n),C=this.styles.props,this.tween=s;for(_ in r)if(_!=="autoRound"&&(x=r[_],!(ua[_]&&Ab(_,r,s,l,n,c)))){if(A=typeof x,N=wf[_],A==="function"&&(x=x.call(s,l,n,c),A=typeof x),A==="string"&&~x.indexOf("random(")&&(x=uc(x)),N)N(this,n,_,x,s)&&(z=1);else if(_.substr(0,2)==="--")m=(getComputedStyle(n).getPropertyValue(_)+"").trim(),x+="",kr.lastIndex=0,kr.test(m)||(T=An(m),j=An(x),j?T!==j&&(m=Hr(n,_,m,j)+j):T&&(x+=T)),this.add(d,"setProperty",m,x,l,c,0,0,_),u.push(_),C.push(_,0,d[_]);else if(A!=="undefined"){if(g&&_ in g?(m=typeof g[_]=="function"?g[_].call(s,l,n,c):g[_],ln(m)&&~m.indexOf("random(")&&(m=uc(m)),An(m+"")||m==="auto"||(m+=ga.units[_]||An(Gs(n,_))||""),(m+"").charAt(1)==="="&&(m=Gs(n,_))):m=Gs(n,_),S=parseFloat(m),E=A==="string"&&x.charAt(1)==="="&&x.substr(0,2),E&&(x=x.substr(2)),v=parseFloat(x),_ in gs&&(_==="autoAlpha"&&(S===1&&Gs(n,"visibility")==="hidden"&&v&&(S=0),C.push("visibility",0,d.visibility),zr(this,d,"visibility",S?"inherit":"hidden",v?"inherit":"hidden",!v)),_!=="scale"&&_!=="transform"&&(_=gs[_],~_.indexOf(",")&&(_=_.split(",")[0]))),M=_ in Js,M){if(this.styles.save(_),G=x,A==="string"&&x.substring(0,6)==="var(--"){if(x=ma(n,x.substring(4,x.indexOf(")"))),x.substring(0,5)==="calc("){var W=n.style.perspective;n.style.perspective=x,x=ma(n,"perspective"),W?n.style.perspective=W:Ur(n,"perspective")}v=parseFloat(x)}if(R||(O=n._gsap,O.renderTransform&&!r.parseTransform||pc(n,r.parseTransform),P=r.smoothOrigin!==!1&&O.smooth,R=this._pt=new Qn(this._pt,d,zt,0,1,O.renderTransform,O,0,-1),R.dep=1),_==="scale")this._pt=new Qn(this._pt,O,"scaleY",O.scaleY,(E?Al(O.scaleY,E+v):v)-O.scaleY||0,Jp),this._pt.u=0,u.push("scaleY",_),_+="X";else if(_==="transformOrigin"){C.push($n,0,d[$n]),x=Uw(x),O.svg?em(n,x,0,P,0,this):(j=parseFloat(x.split(" ")[2])||0,j!==O.zOrigin&&zr(this,O,"zOrigin",O.zOrigin,j),zr(this,d,_,Nf(m),Nf(x)));continue}else if(_==="svgOrigin"){em(n,x,1,P,0,this);continue}else if(_ in Ub){Yw(this,O,_,S,E?Al(S,E+x):x);continue}else if(_==="smoothOrigin"){zr(this,O,"smooth",O.smooth,x);continue}else if(_==="force3D"){O[_]=x;continue}else if(_==="transform"){qw(this,x,n);continue}}else _ in d||(_=Ol(_)||_);if(M||(v||v===0)&&(S||S===0)&&!Aw.test(x)&&_ in d)T=(m+"").substr((S+"").length),v||(v=0),j=An(x)||(_ in ga.units?ga.units[_]:T),T!==j&&(S=Hr(n,_,m,j)),this._pt=new Qn(this._pt,M?O:d,_,S,(E?Al(S,E+v):v)-S,!M&&(j==="px"||_==="zIndex")&&r.autoRound!==!1?jw:Jp),this._pt.u=j||0,M&&G!==x?(this._pt.b=m,this._pt.e=G,this._pt.r=Nw):T!==j&&j!=="%"&&(this._pt.b=m,this._pt.r=ww);else if(_ in d)Lw.call(this,n,_,m,E?E+x:x);else if(_ in n)this.add(n,_,m||n[_],E?E+x:x,l,c);else if(_!=="parseTransform"){Dm(_,x);continue}M||(_ in d?C.push(_,0,d[_]):typeof n[_]=="function"?C.push(_,2,n[_]()):C.push(_,1,m||n[_])),u.push(_)}}z&&Cb(this)},render:function(n,r){if(r.tween._time||!Gm())for(var s=r._pt;s;)s.r(n,s.d),s=s._next;else r.styles.revert()},get:Gs,aliases:gs,getSetter:function(n,r,s){var l=gs[r];return l&&l.indexOf(",")<0&&(r=l),r in Js&&r!==$n&&(n._gsap.x||Gs(n,"x"))?s&&Tv===s?r==="scale"?Rw:zw:(Tv=s||{})&&(r==="scale"?Mw:Dw):n.style&&!zm(n.style[r])?Ew:~r.indexOf("-")?Cw:Fm(n,r)},core:{_removeProperty:Ur,_getMatrix:Xm}};Jn.utils.checkPrefix=Ol;Jn.core.getStyleSaver=kb;(function(i,n,r,s){var l=Kn(i+","+n+","+r,function(c){Js[c]=1});Kn(n,function(c){ga.units[c]="deg",Ub[c]=1}),gs[l[13]]=i+","+n,Kn(s,function(c){var u=c.split(":");gs[u[1]]=l[u[0]]})})("x,y,z,scale,scaleX,scaleY,xPercent,yPercent","rotation,rotationX,rotationY,skewX,skewY","transform,transformOrigin,svgOrigin,force3D,smoothOrigin,transformPerspective","0:translateX,1:translateY,2:translateZ,8:rotate,8:rotationZ,8:rotateZ,9:rotateX,10:rotateY");Kn("x,y,z,top,right,bottom,left,width,height,fontSize,padding,margin,perspective",function(i){ga.units[i]="px"});Jn.registerPlugin(Fb);var Ye=Jn.registerPlugin(Fb)||Jn;Ye.core.Tween;function Gw(i,n){for(var r=0;r<n.length;r++){var s=n[r];s.enumerable=s.enumerable||!1,s.configurable=!0,"value"in s&&(s.writable=!0),Object.defineProperty(i,s.key,s)}}function Vw(i,n,r){return n&&Gw(i.prototype,n),i}var hn,ff,ha,Rr,Mr,Nl,Yb,ui,$o,qb,Xs,Ia,Gb,Vb=function(){return hn||typeof window<"u"&&(hn=window.gsap)&&hn.registerPlugin&&hn},Xb=1,Sl=[],Ue=[],vs=[],Jo=Date.now,tm=function(n,r){return r},Xw=function(){var n=$o.core,r=n.bridge||{},s=n._scrollers,l=n._proxies;s.push.apply(s,Ue),l.push.apply(l,vs),Ue=s,vs=l,tm=function(u,d){return r[u](d)}},Or=function(n,r){return~vs.indexOf(n)&&vs[vs.indexOf(n)+1][r]},Io=function(n){return!!~qb.indexOf(n)},Rn=function(n,r,s,l,c){return n.addEventListener(r,s,{passive:l!==!1,capture:!!c})},zn=function(n,r,s,l){return n.removeEventListener(r,s,!!l)},Bu="scrollLeft",Fu="scrollTop",nm=function(){return Xs&&Xs.isPressed||Ue.cache++},jf=function(n,r){var s=function l(c){if(c||c===0){Xb&&(ha.history.scrollRestoration="manual");var u=Xs&&Xs.isPressed;c=l.v=Math.round(c)||(Xs&&Xs.iOS?1:0),n(c),l.cacheID=Ue.cache,u&&tm("ss",c)}else(r||Ue.cache!==l.cacheID||tm("ref"))&&(l.cacheID=Ue.cache,l.v=n());return l.v+l.offset};return s.offset=0,n&&s},Pn={s:Bu,p:"left",p2:"Left",os:"right",os2:"Right",d:"width",d2:"Width",a:"x",sc:jf(function(i){return arguments.length?ha.scrollTo(i,tn.sc()):ha.pageXOffset||Rr[Bu]||Mr[Bu]||Nl[Bu]||0})},tn={s:Fu,p:"top",p2:"Top",os:"bottom",os2:"Bottom",d:"height",d2:"Height",a:"y",op:Pn,sc:jf(function(i){return arguments.length?ha.scrollTo(Pn.sc(),i):ha.pageYOffset||Rr[Fu]||Mr[Fu]||Nl[Fu]||0})},Xn=function(n,r){return(r&&r._ctx&&r._ctx.selector||hn.utils.toArray)(n)[0]||(typeof n=="string"&&hn.config().nullTargetWarn!==!1?console.warn("Element not found:",n):null)},Zw=function(n,r){for(var s=r.length;s--;)if(r[s]===n||r[s].contains(n))return!0;return!1},Br=function(n,r){var s=r.s,l=r.sc;Io(n)&&(n=Rr.scrollingElement||Mr);var c=Ue.indexOf(n),u=l===tn.sc?1:2;!~c&&(c=Ue.push(n)-1),Ue[c+u]||Rn(n,"scroll",nm);var d=Ue[c+u],g=d||(Ue[c+u]=jf(Or(n,s),!0)||(Io(n)?l:jf(function(m){return arguments.length?n[s]=m:n[s]})));return g.target=n,d||(g.smooth=hn.getProperty(n,"scrollBehavior")==="smooth"),g},am=function(n,r,s){var l=n,c=n,u=Jo(),d=u,g=r||50,m=Math.max(500,g*3),x=function(N,_){var T=Jo();_||T-u>g?(c=l,l=N,d=u,u=T):s?l+=N:l=c+(N-c)/(T-d)*(u-d)},v=function(){c=l=s?0:l,d=u=0},S=function(N){var _=d,T=c,j=Jo();return(N||N===0)&&N!==l&&x(N),u===d||j-d>m?0:(l+(s?T:-T))/((s?j:u)-_)*1e3};return{update:x,reset:v,getVelocity:S}},Lo=function(n,r){return r&&!n._gsapAllow&&n.preventDefault(),n.changedTouches?n.changedTouches[0]:n},Dv=function(n){var r=Math.max.apply(Math,n),s=Math.min.apply(Math,n);return Math.abs(r)>=Math.abs(s)?r:s},Zb=function(){$o=hn.core.globals().ScrollTrigger,$o&&$o.core&&Xw()},Kb=function(n){return hn=n||Vb(),!ff&&hn&&typeof document<"u"&&document.body&&(ha=window,Rr=document,Mr=Rr.documentElement,Nl=Rr.body,qb=[ha,Rr,Mr,Nl],hn.utils.clamp,Gb=hn.core.context||function(){},ui="onpointerenter"in Nl?"pointer":"mouse",Yb=Ft.isTouch=ha.matchMedia&&ha.matchMedia("(hover: none), (pointer: coarse)").matches?1:"ontouchstart"in ha||navigator.maxTouchPoints>0||navigator.msMaxTouchPoints>0?2:0,Ia=Ft.eventTypes=("ontouchstart"in Mr?"touchstart,touchmove,touchcancel,touchend":"onpointerdown"in Mr?"pointerdown,pointermove,pointercancel,pointerup":"mousedown,mousemove,mouseup,mouseup").split(","),setTimeout(function(){return Xb=0},500),Zb(),ff=1),ff};Pn.op=tn;Ue.cache=0;var Ft=(function(){function i(r){this.init(r)}var n=i.prototype;return n.init=function(s){ff||Kb(hn)||console.warn("Please gsap.registerPlugin(Observer)"),$o||Zb();var l=s.tolerance,c=s.dragMinimum,u=s.type,d=s.target,g=s.lineHeight,m=s.debounce,x=s.preventDefault,v=s.onStop,S=s.onStopDelay,A=s.ignore,N=s.wheelSpeed,_=s.event,T=s.onDragStart,j=s.onDragEnd,E=s.onDrag,M=s.onPress,R=s.onRelease,O=s.onRight,P=s.onLeft,z=s.onUp,C=s.onDown,G=s.onChangeX,W=s.onChangeY,re=s.onChange,Z=s.onToggleX,se=s.onToggleY,le=s.onHover,Q=s.onHoverEnd,H=s.onMove,K=s.ignoreCheck,J=s.isNormalizer,me=s.onGestureStart,U=s.onGestureEnd,k=s.onWheel,I=s.onEnable,F=s.onDisable,ae=s.onClick,ce=s.scrollSpeed,ge=s.capture,oe=s.allowClicks,Ke=s.lockAxis,Ne=s.onLockAxis;this.target=d=Xn(d)||Mr,this.vars=s,A&&(A=hn.utils.toArray(A)),l=l||1e-9,c=c||0,N=N||1,ce=ce||1,u=u||"wheel,touch,pointer",m=m!==!1,g||(g=parseFloat(ha.getComputedStyle(Nl).lineHeight)||22);var $t,xt,vt,qe,tt,nn,on,$=this,gn=0,In=0,ba=s.passive||!x&&s.passive!==!1,ut=Br(d,Pn),Xa=Br(d,tn),ts=ut(),Pt=Xa(),Yt=~u.indexOf("touch")&&!~u.indexOf("pointer")&&Ia[0]==="pointerdown",Za=Io(d),yt=d.ownerDocument||Rr,xn=[0,0,0],Un=[0,0,0],_a=0,Yr=function(){return _a=Jo()},Rt=function(xe,$e){return($.event=xe)&&A&&Zw(xe.target,A)||$e&&Yt&&xe.pointerType!=="touch"||K&&K(xe,$e)},ns=function(){$._vx.reset(),$._vy.reset(),xt.pause(),v&&v($)},Tt=function(){var xe=$.deltaX=Dv(xn),$e=$.deltaY=Dv(Un),ie=Math.abs(xe)>=l,Te=Math.abs($e)>=l;re&&(ie||Te)&&re($,xe,$e,xn,Un),ie&&(O&&$.deltaX>0&&O($),P&&$.deltaX<0&&P($),G&&G($),Z&&$.deltaX<0!=gn<0&&Z($),gn=$.deltaX,xn[0]=xn[1]=xn[2]=0),Te&&(C&&$.deltaY>0&&C($),z&&$.deltaY<0&&z($),W&&W($),se&&$.deltaY<0!=In<0&&se($),In=$.deltaY,Un[0]=Un[1]=Un[2]=0),(qe||vt)&&(H&&H($),vt&&(T&&vt===1&&T($),E&&E($),vt=0),qe=!1),nn&&!(nn=!1)&&Ne&&Ne($),tt&&(k($),tt=!1),$t=0},Nn=function(xe,$e,ie){xn[ie]+=xe,Un[ie]+=$e,$._vx.update(xe),$._vy.update($e),m?$t||($t=requestAnimationFrame(Tt)):Tt()},qt=function(xe,$e){Ke&&!on&&($.axis=on=Math.abs(xe)>Math.abs($e)?"x":"y",nn=!0),on!=="y"&&(xn[2]+=xe,$._vx.update(xe,!0)),on!=="x"&&(Un[2]+=$e,$._vy.update($e,!0)),m?$t||($t=requestAnimationFrame(Tt)):Tt()},as=function(xe){if(!Rt(xe,1)){xe=Lo(xe,x);var $e=xe.clientX,ie=xe.clientY,Te=$e-$.x,ve=ie-$.y,Se=$.isDragging;$.x=$e,$.y=ie,(Se||(Te||ve)&&(Math.abs($.startX-$e)>=c||Math.abs($.startY-ie)>=c))&&(vt||(vt=Se?2:1),Se||($.isDragging=!0),qt(Te,ve))}},As=$.onPress=function(Ae){Rt(Ae,1)||Ae&&Ae.button||($.axis=on=null,xt.pause(),$.isPressed=!0,Ae=Lo(Ae),gn=In=0,$.startX=$.x=Ae.clientX,$.startY=$.y=Ae.clientY,$._vx.reset(),$._vy.reset(),Rn(J?d:yt,Ia[1],as,ba,!0),$.deltaX=$.deltaY=0,M&&M($))},Re=$.onRelease=function(Ae){if(!Rt(Ae,1)){zn(J?d:yt,Ia[1],as,!0);var xe=!isNaN($.y-$.startY),$e=$.isDragging,ie=$e&&(Math.abs($.x-$.startX)>3||Math.abs($.y-$.startY)>3),Te=Lo(Ae);!ie&&xe&&($._vx.reset(),$._vy.reset(),x&&oe&&hn.delayedCall(.08,function(){if(Jo()-_a>300&&!Ae.defaultPrevented){if(Ae.target.click)Ae.target.click();else if(yt.createEvent){var ve=yt.createEvent("MouseEvents");ve.initMouseEvent("click",!0,!0,ha,1,Te.screenX,Te.screenY,Te.clientX,Te.clientY,!1,!1,!1,!1,0,null),Ae.target.dispatchEvent(ve)}}})),$.isDragging=$.isGesturing=$.isPressed=!1,v&&$e&&!J&&xt.restart(!0),vt&&Tt(),j&&$e&&j($),R&&R($,ie)}},Sa=function(xe){return xe.touches&&xe.touches.length>1&&($.isGesturing=!0)&&me(xe,$.isDragging)},vn=function(){return($.isGesturing=!1)||U($)},yn=function(xe){if(!Rt(xe)){var $e=ut(),ie=Xa();Nn(($e-ts)*ce,(ie-Pt)*ce,1),ts=$e,Pt=ie,v&&xt.restart(!0)}},Jt=function(xe){if(!Rt(xe)){xe=Lo(xe,x),k&&(tt=!0);var $e=(xe.deltaMode===1?g:xe.deltaMode===2?ha.innerHeight:1)*N;Nn(xe.deltaX*$e,xe.deltaY*$e,0),v&&!J&&xt.restart(!0)}},Aa=function(xe){if(!Rt(xe)){var $e=xe.clientX,ie=xe.clientY,Te=$e-$.x,ve=ie-$.y;$.x=$e,$.y=ie,qe=!0,v&&xt.restart(!0),(Te||ve)&&qt(Te,ve)}},Ta=function(xe){$.event=xe,le($)},Ka=function(xe){$.event=xe,Q($)},er=function(xe){return Rt(xe)||Lo(xe,x)&&ae($)};xt=$._dc=hn.delayedCall(S||.25,ns).pause(),$.deltaX=$.deltaY=0,$._vx=am(0,50,!0),$._vy=am(0,50,!0),$.scrollX=ut,$.scrollY=Xa,$.isDragging=$.isGesturing=$.isPressed=!1,Gb(this),$.enable=function(Ae){return $.isEnabled||(Rn(Za?yt:d,"scroll",nm),u.indexOf("scroll")>=0&&Rn(Za?yt:d,"scroll",yn,ba,ge),u.indexOf("wheel")>=0&&Rn(d,"wheel",Jt,ba,ge),(u.indexOf("touch")>=0&&Yb||u.indexOf("pointer")>=0)&&(Rn(d,Ia[0],As,ba,ge),Rn(yt,Ia[2],Re),Rn(yt,Ia[3],Re),oe&&Rn(d,"click",Yr,!0,!0),ae&&Rn(d,"click",er),me&&Rn(yt,"gesturestart",Sa),U&&Rn(yt,"gestureend",vn),le&&Rn(d,ui+"enter",Ta),Q&&Rn(d,ui+"leave",Ka),H&&Rn(d,ui+"move",Aa)),$.isEnabled=!0,$.isDragging=$.isGesturing=$.isPressed=qe=vt=!1,$._vx.reset(),$._vy.reset(),ts=ut(),Pt=Xa(),Ae&&Ae.type&&As(Ae),I&&I($)),$},$.disable=function(){$.isEnabled&&(Sl.filter(function(Ae){return Ae!==$&&Io(Ae.target)}).length||zn(Za?yt:d,"scroll",nm),$.isPressed&&($._vx.reset(),$._vy.reset(),zn(J?d:yt,Ia[1],as,!0)),zn(Za?yt:d,"scroll",yn,ge),zn(d,"wheel",Jt,ge),zn(d,Ia[0],As,ge),zn(yt,Ia[2],Re),zn(yt,Ia[3],Re),zn(d,"click",Yr,!0),zn(d,"click",er),zn(yt,"gesturestart",Sa),zn(yt,"gestureend",vn),zn(d,ui+"enter",Ta),zn(d,ui+"leave",Ka),zn(d,ui+"move",Aa),$.isEnabled=$.isPressed=$.isDragging=!1,F&&F($))},$.kill=$.revert=function(){$.disable();var Ae=Sl.indexOf($);Ae>=0&&Sl.splice(Ae,1),Xs===$&&(Xs=0)},Sl.push($),J&&Io(d)&&(Xs=$),$.enable(_)},Vw(i,[{key:"velocityX",get:function(){return this._vx.getVelocity()}},{key:"velocityY",get:function(){return this._vy.getVelocity()}}]),i})();Ft.version="3.14.2";Ft.create=function(i){return new Ft(i)};Ft.register=Kb;Ft.getAll=function(){return Sl.slice()};Ft.getById=function(i){return Sl.filter(function(n){return n.vars.id===i})[0]};Vb()&&hn.registerPlugin(Ft);var fe,vl,Le,ft,fa,et,Zm,Ef,mc,Wo,Yo,Yu,_n,Ff,sm,Dn,kv,Ov,yl,Qb,vp,$b,Mn,rm,Jb,Ib,Nr,im,Km,jl,Qm,ec,lm,yp,qu=1,Sn=Date.now,bp=Sn(),qa=0,qo=0,Pv=function(n,r,s){var l=ca(n)&&(n.substr(0,6)==="clamp("||n.indexOf("max")>-1);return s["_"+r+"Clamp"]=l,l?n.substr(6,n.length-7):n},Lv=function(n,r){return r&&(!ca(n)||n.substr(0,6)!=="clamp(")?"clamp("+n+")":n},Kw=function i(){return qo&&requestAnimationFrame(i)},Uv=function(){return Ff=1},Hv=function(){return Ff=0},hs=function(n){return n},Go=function(n){return Math.round(n*1e5)/1e5||0},Wb=function(){return typeof window<"u"},e_=function(){return fe||Wb()&&(fe=window.gsap)&&fe.registerPlugin&&fe},Si=function(n){return!!~Zm.indexOf(n)},t_=function(n){return(n==="Height"?Qm:Le["inner"+n])||fa["client"+n]||et["client"+n]},n_=function(n){return Or(n,"getBoundingClientRect")||(Si(n)?function(){return gf.width=Le.innerWidth,gf.height=Qm,gf}:function(){return Vs(n)})},Qw=function(n,r,s){var l=s.d,c=s.d2,u=s.a;return(u=Or(n,"getBoundingClientRect"))?function(){return u()[l]}:function(){return(r?t_(c):n["client"+c])||0}},$w=function(n,r){return!r||~vs.indexOf(n)?n_(n):function(){return gf}},xs=function(n,r){var s=r.s,l=r.d2,c=r.d,u=r.a;return Math.max(0,(s="scroll"+l)&&(u=Or(n,s))?u()-n_(n)()[c]:Si(n)?(fa[s]||et[s])-t_(l):n[s]-n["offset"+l])},Gu=function(n,r){for(var s=0;s<yl.length;s+=3)(!r||~r.indexOf(yl[s+1]))&&n(yl[s],yl[s+1],yl[s+2])},ca=function(n){return typeof n=="string"},Tn=function(n){return typeof n=="function"},Vo=function(n){return typeof n=="number"},fi=function(n){return typeof n=="object"},Uo=function(n,r,s){return n&&n.progress(r?0:1)&&s&&n.pause()},_p=function(n,r){if(n.enabled){var s=n._ctx?n._ctx.add(function(){return r(n)}):r(n);s&&s.totalTime&&(n.callbackAnimation=s)}},fl=Math.abs,a_="left",s_="top",$m="right",Jm="bottom",yi="width",bi="height",tc="Right",nc="Left",ac="Top",sc="Bottom",Kt="padding",Ha="margin",Pl="Width",Im="Height",en="px",Ba=function(n){return Le.getComputedStyle(n)},Jw=function(n){var r=Ba(n).position;n.style.position=r==="absolute"||r==="fixed"?r:"relative"},Bv=function(n,r){for(var s in r)s in n||(n[s]=r[s]);return n},Vs=function(n,r){var s=r&&Ba(n)[sm]!=="matrix(1, 0, 0, 1, 0, 0)"&&fe.to(n,{x:0,y:0,xPercent:0,yPercent:0,rotation:0,rotationX:0,rotationY:0,scale:1,skewX:0,skewY:0}).progress(1),l=n.getBoundingClientRect();return s&&s.progress(0).kill(),l},Cf=function(n,r){var s=r.d2;return n["offset"+s]||n["client"+s]||0},r_=function(n){var r=[],s=n.labels,l=n.duration(),c;for(c in s)r.push(s[c]/l);return r},Iw=function(n){return function(r){return fe.utils.snap(r_(n),r)}},Wm=function(n){var r=fe.utils.snap(n),s=Array.isArray(n)&&n.slice(0).sort(function(l,c){return l-c});return s?function(l,c,u){u===void 0&&(u=.001);var d;if(!c)return r(l);if(c>0){for(l-=u,d=0;d<s.length;d++)if(s[d]>=l)return s[d];return s[d-1]}else for(d=s.length,l+=u;d--;)if(s[d]<=l)return s[d];return s[0]}:function(l,c,u){u===void 0&&(u=.001);var d=r(l);return!c||Math.abs(d-l)<u||d-l<0==c<0?d:r(c<0?l-n:l+n)}},Ww=function(n){return function(r,s){return Wm(r_(n))(r,s.direction)}},Vu=function(n,r,s,l){return s.split(",").forEach(function(c){return n(r,c,l)})},rn=function(n,r,s,l,c){return n.addEventListener(r,s,{passive:!l,capture:!!c})},sn=function(n,r,s,l){return n.removeEventListener(r,s,!!l)},Xu=function(n,r,s){s=s&&s.wheelHandler,s&&(n(r,"wheel",s),n(r,"touchmove",s))},Fv={startColor:"green",endColor:"red",indent:0,fontSize:"16px",fontWeight:"normal"},Zu={toggleActions:"play",anticipatePin:0},zf={top:0,left:0,center:.5,bottom:1,right:1},df=function(n,r){if(ca(n)){var s=n.indexOf("="),l=~s?+(n.charAt(s-1)+1)*parseFloat(n.substr(s+1)):0;~s&&(n.indexOf("%")>s&&(l*=r/100),n=n.substr(0,s-1)),n=l+(n in zf?zf[n]*r:~n.indexOf("%")?parseFloat(n)*r/100:parseFloat(n)||0)}return n},Ku=function(n,r,s,l,c,u,d,g){var m=c.startColor,x=c.endColor,v=c.fontSize,S=c.indent,A=c.fontWeight,N=ft.createElement("div"),_=Si(s)||Or(s,"pinType")==="fixed",T=n.indexOf("scroller")!==-1,j=_?et:s,E=n.indexOf("start")!==-1,M=E?m:x,R="border-color:"+M+";font-size:"+v+";color:"+M+";font-weight:"+A+";pointer-events:none;white-space:nowrap;font-family:sans-serif,Arial;z-index:1000;padding:4px 8px;border-width:0;border-style:solid;";return R+="position:"+((T||g)&&_?"fixed;":"absolute;"),(T||g||!_)&&(R+=(l===tn?$m:Jm)+":"+(u+parseFloat(S))+"px;"),d&&(R+="box-sizing:border-box;text-align:left;width:"+d.offsetWidth+"px;"),N._isStart=E,N.setAttribute("class","gsap-marker-"+n+(r?" marker-"+r:"")),N.style.cssText=R,N.innerText=r||r===0?n+"-"+r:n,j.children[0]?j.insertBefore(N,j.children[0]):j.appendChild(N),N._offset=N["offset"+l.op.d2],hf(N,0,l,E),N},hf=function(n,r,s,l){var c={display:"block"},u=s[l?"os2":"p2"],d=s[l?"p2":"os2"];n._isFlipped=l,c[s.a+"Percent"]=l?-100:0,c[s.a]=l?"1px":0,c["border"+u+Pl]=1,c["border"+d+Pl]=0,c[s.p]=r+"px",fe.set(n,c)},ke=[],om={},gc,Yv=function(){return Sn()-qa>34&&(gc||(gc=requestAnimationFrame(Ks)))},dl=function(){(!Mn||!Mn.isPressed||Mn.startX>et.clientWidth)&&(Ue.cache++,Mn?gc||(gc=requestAnimationFrame(Ks)):Ks(),qa||Ti("scrollStart"),qa=Sn())},Sp=function(){Ib=Le.innerWidth,Jb=Le.innerHeight},Xo=function(n){Ue.cache++,(n===!0||!_n&&!$b&&!ft.fullscreenElement&&!ft.webkitFullscreenElement&&(!rm||Ib!==Le.innerWidth||Math.abs(Le.innerHeight-Jb)>Le.innerHeight*.25))&&Ef.restart(!0)},Ai={},eN=[],i_=function i(){return sn(_e,"scrollEnd",i)||pi(!0)},Ti=function(n){return Ai[n]&&Ai[n].map(function(r){return r()})||eN},oa=[],l_=function(n){for(var r=0;r<oa.length;r+=5)(!n||oa[r+4]&&oa[r+4].query===n)&&(oa[r].style.cssText=oa[r+1],oa[r].getBBox&&oa[r].setAttribute("transform",oa[r+2]||""),oa[r+3].uncache=1)},o_=function(){return Ue.forEach(function(n){return Tn(n)&&++n.cacheID&&(n.rec=n())})},eg=function(n,r){var s;for(Dn=0;Dn<ke.length;Dn++)s=ke[Dn],s&&(!r||s._ctx===r)&&(n?s.kill(1):s.revert(!0,!0));ec=!0,r&&l_(r),r||Ti("revert")},c_=function(n,r){Ue.cache++,(r||!kn)&&Ue.forEach(function(s){return Tn(s)&&s.cacheID++&&(s.rec=0)}),ca(n)&&(Le.history.scrollRestoration=Km=n)},kn,_i=0,qv,tN=function(){if(qv!==_i){var n=qv=_i;requestAnimationFrame(function(){return n===_i&&pi(!0)})}},u_=function(){et.appendChild(jl),Qm=!Mn&&jl.offsetHeight||Le.innerHeight,et.removeChild(jl)},Gv=function(n){return mc(".gsap-marker-start, .gsap-marker-end, .gsap-marker-scroller-start, .gsap-marker-scroller-end").forEach(function(r){return r.style.display=n?"none":"block"})},pi=function(n,r){if(fa=ft.documentElement,et=ft.body,Zm=[Le,ft,fa,et],qa&&!n&&!ec){rn(_e,"scrollEnd",i_);return}u_(),kn=_e.isRefreshing=!0,ec||o_();var s=Ti("refreshInit");Qb&&_e.sort(),r||eg(),Ue.forEach(function(l){Tn(l)&&(l.smooth&&(l.target.style.scrollBehavior="auto"),l(0))}),ke.slice(0).forEach(function(l){return l.refresh()}),ec=!1,ke.forEach(function(l){if(l._subPinOffset&&l.pin){var c=l.vars.horizontal?"offsetWidth":"offsetHeight",u=l.pin[c];l.revert(!0,1),l.adjustPinSpacing(l.pin[c]-u),l.refresh()}}),lm=1,Gv(!0),ke.forEach(function(l){var c=xs(l.scroller,l._dir),u=l.vars.end==="max"||l._endClamp&&l.end>c,d=l._startClamp&&l.start>=c;(u||d)&&l.setPositions(d?c-1:l.start,u?Math.max(d?c:l.start+1,c):l.end,!0)}),Gv(!1),lm=0,s.forEach(function(l){return l&&l.render&&l.render(-1)}),Ue.forEach(function(l){Tn(l)&&(l.smooth&&requestAnimationFrame(function(){return l.target.style.scrollBehavior="smooth"}),l.rec&&l(l.rec))}),c_(Km,1),Ef.pause(),_i++,kn=2,Ks(2),ke.forEach(function(l){return Tn(l.vars.onRefresh)&&l.vars.onRefresh(l)}),kn=_e.isRefreshing=!1,Ti("refresh")},cm=0,pf=1,rc,Ks=function(n){if(n===2||!kn&&!ec){_e.isUpdating=!0,rc&&rc.update(0);var r=ke.length,s=Sn(),l=s-bp>=50,c=r&&ke[0].scroll();if(pf=cm>c?-1:1,kn||(cm=c),l&&(qa&&!Ff&&s-qa>200&&(qa=0,Ti("scrollEnd")),Yo=bp,bp=s),pf<0){for(Dn=r;Dn-- >0;)ke[Dn]&&ke[Dn].update(0,l);pf=1}else for(Dn=0;Dn<r;Dn++)ke[Dn]&&ke[Dn].update(0,l);_e.isUpdating=!1}gc=0},um=[a_,s_,Jm,$m,Ha+sc,Ha+tc,Ha+ac,Ha+nc,"display","flexShrink","float","zIndex","gridColumnStart","gridColumnEnd","gridRowStart","gridRowEnd","gridArea","justifySelf","alignSelf","placeSelf","order"],mf=um.concat([yi,bi,"boxSizing","max"+Pl,"max"+Im,"position",Ha,Kt,Kt+ac,Kt+tc,Kt+sc,Kt+nc]),nN=function(n,r,s){El(s);var l=n._gsap;if(l.spacerIsNative)El(l.spacerState);else if(n._gsap.swappedIn){var c=r.parentNode;c&&(c.insertBefore(n,r),c.removeChild(r))}n._gsap.swappedIn=!1},Ap=function(n,r,s,l){if(!n._gsap.swappedIn){for(var c=um.length,u=r.style,d=n.style,g;c--;)g=um[c],u[g]=s[g];u.position=s.position==="absolute"?"absolute":"relative",s.display==="inline"&&(u.display="inline-block"),d[Jm]=d[$m]="auto",u.flexBasis=s.flexBasis||"auto",u.overflow="visible",u.boxSizing="border-box",u[yi]=Cf(n,Pn)+en,u[bi]=Cf(n,tn)+en,u[Kt]=d[Ha]=d[s_]=d[a_]="0",El(l),d[yi]=d["max"+Pl]=s[yi],d[bi]=d["max"+Im]=s[bi],d[Kt]=s[Kt],n.parentNode!==r&&(n.parentNode.insertBefore(r,n),r.appendChild(n)),n._gsap.swappedIn=!0}},aN=/([A-Z])/g,El=function(n){if(n){var r=n.t.style,s=n.length,l=0,c,u;for((n.t._gsap||fe.core.getCache(n.t)).uncache=1;l<s;l+=2)u=n[l+1],c=n[l],u?r[c]=u:r[c]&&r.removeProperty(c.replace(aN,"-$1").toLowerCase())}},Qu=function(n){for(var r=mf.length,s=n.style,l=[],c=0;c<r;c++)l.push(mf[c],s[mf[c]]);return l.t=n,l},sN=function(n,r,s){for(var l=[],c=n.length,u=s?8:0,d;u<c;u+=2)d=n[u],l.push(d,d in r?r[d]:n[u+1]);return l.t=n.t,l},gf={left:0,top:0},Vv=function(n,r,s,l,c,u,d,g,m,x,v,S,A,N){Tn(n)&&(n=n(g)),ca(n)&&n.substr(0,3)==="max"&&(n=S+(n.charAt(4)==="="?df("0"+n.substr(3),s):0));var _=A?A.time():0,T,j,E;if(A&&A.seek(0),isNaN(n)||(n=+n),Vo(n))A&&(n=fe.utils.mapRange(A.scrollTrigger.start,A.scrollTrigger.end,0,S,n)),d&&hf(d,s,l,!0);else{Tn(r)&&(r=r(g));var M=(n||"0").split(" "),R,O,P,z;E=Xn(r,g)||et,R=Vs(E)||{},(!R||!R.left&&!R.top)&&Ba(E).display==="none"&&(z=E.style.display,E.style.display="block",R=Vs(E),z?E.style.display=z:E.style.removeProperty("display")),O=df(M[0],R[l.d]),P=df(M[1]||"0",s),n=R[l.p]-m[l.p]-x+O+c-P,d&&hf(d,P,l,s-P<20||d._isStart&&P>20),s-=s-P}if(N&&(g[N]=n||-.001,n<0&&(n=0)),u){var C=n+s,G=u._isStart;T="scroll"+l.d2,hf(u,C,l,G&&C>20||!G&&(v?Math.max(et[T],fa[T]):u.parentNode[T])<=C+1),v&&(m=Vs(d),v&&(u.style[l.op.p]=m[l.op.p]-l.op.m-u._offset+en))}return A&&E&&(T=Vs(E),A.seek(S),j=Vs(E),A._caScrollDist=T[l.p]-j[l.p],n=n/A._caScrollDist*S),A&&A.seek(_),A?n:Math.round(n)},rN=/(webkit|moz|length|cssText|inset)/i,Xv=function(n,r,s,l){if(n.parentNode!==r){var c=n.style,u,d;if(r===et){n._stOrig=c.cssText,d=Ba(n);for(u in d)!+u&&!rN.test(u)&&d[u]&&typeof c[u]=="string"&&u!=="0"&&(c[u]=d[u]);c.top=s,c.left=l}else c.cssText=n._stOrig;fe.core.getCache(n).uncache=1,r.appendChild(n)}},f_=function(n,r,s){var l=r,c=l;return function(u){var d=Math.round(n());return d!==l&&d!==c&&Math.abs(d-l)>3&&Math.abs(d-c)>3&&(u=d,s&&s()),c=l,l=Math.round(u),l}},$u=function(n,r,s){var l={};l[r.p]="+="+s,fe.set(n,l)},Zv=function(n,r){var s=Br(n,r),l="_scroll"+r.p2,c=function u(d,g,m,x,v){var S=u.tween,A=g.onComplete,N={};m=m||s();var _=f_(s,m,function(){S.kill(),u.tween=0});return v=x&&v||0,x=x||d-m,S&&S.kill(),g[l]=d,g.inherit=!1,g.modifiers=N,N[l]=function(){return _(m+x*S.ratio+v*S.ratio*S.ratio)},g.onUpdate=function(){Ue.cache++,u.tween&&Ks()},g.onComplete=function(){u.tween=0,A&&A.call(S)},S=u.tween=fe.to(n,g),S};return n[l]=s,s.wheelHandler=function(){return c.tween&&c.tween.kill()&&(c.tween=0)},rn(n,"wheel",s.wheelHandler),_e.isTouch&&rn(n,"touchmove",s.wheelHandler),c},_e=(function(){function i(r,s){vl||i.register(fe)||console.warn("Please gsap.registerPlugin(ScrollTrigger)"),im(this),this.init(r,s)}var n=i.prototype;return n.init=function(s,l){if(this.progress=this.start=0,this.vars&&this.kill(!0,!0),!qo){this.update=this.refresh=this.kill=hs;return}s=Bv(ca(s)||Vo(s)||s.nodeType?{trigger:s}:s,Zu);var c=s,u=c.onUpdate,d=c.toggleClass,g=c.id,m=c.onToggle,x=c.onRefresh,v=c.scrub,S=c.trigger,A=c.pin,N=c.pinSpacing,_=c.invalidateOnRefresh,T=c.anticipatePin,j=c.onScrubComplete,E=c.onSnapComplete,M=c.once,R=c.snap,O=c.pinReparent,P=c.pinSpacer,z=c.containerAnimation,C=c.fastScrollEnd,G=c.preventOverlaps,W=s.horizontal||s.containerAnimation&&s.horizontal!==!1?Pn:tn,re=!v&&v!==0,Z=Xn(s.scroller||Le),se=fe.core.getCache(Z),le=Si(Z),Q=("pinType"in s?s.pinType:Or(Z,"pinType")||le&&"fixed")==="fixed",H=[s.onEnter,s.onLeave,s.onEnterBack,s.onLeaveBack],K=re&&s.toggleActions.split(" "),J="markers"in s?s.markers:Zu.markers,me=le?0:parseFloat(Ba(Z)["border"+W.p2+Pl])||0,U=this,k=s.onRefreshInit&&function(){return s.onRefreshInit(U)},I=Qw(Z,le,W),F=$w(Z,le),ae=0,ce=0,ge=0,oe=Br(Z,W),Ke,Ne,$t,xt,vt,qe,tt,nn,on,$,gn,In,ba,ut,Xa,ts,Pt,Yt,Za,yt,xn,Un,_a,Yr,Rt,ns,Tt,Nn,qt,as,As,Re,Sa,vn,yn,Jt,Aa,Ta,Ka;if(U._startClamp=U._endClamp=!1,U._dir=W,T*=45,U.scroller=Z,U.scroll=z?z.time.bind(z):oe,xt=oe(),U.vars=s,l=l||s.animation,"refreshPriority"in s&&(Qb=1,s.refreshPriority===-9999&&(rc=U)),se.tweenScroll=se.tweenScroll||{top:Zv(Z,tn),left:Zv(Z,Pn)},U.tweenTo=Ke=se.tweenScroll[W.p],U.scrubDuration=function(ie){Sa=Vo(ie)&&ie,Sa?Re?Re.duration(ie):Re=fe.to(l,{ease:"expo",totalProgress:"+=0",inherit:!1,duration:Sa,paused:!0,onComplete:function(){return j&&j(U)}}):(Re&&Re.progress(1).kill(),Re=0)},l&&(l.vars.lazy=!1,l._initted&&!U.isReverted||l.vars.immediateRender!==!1&&s.immediateRender!==!1&&l.duration()&&l.render(0,!0,!0),U.animation=l.pause(),l.scrollTrigger=U,U.scrubDuration(v),as=0,g||(g=l.vars.id)),R&&((!fi(R)||R.push)&&(R={snapTo:R}),"scrollBehavior"in et.style&&fe.set(le?[et,fa]:Z,{scrollBehavior:"auto"}),Ue.forEach(function(ie){return Tn(ie)&&ie.target===(le?ft.scrollingElement||fa:Z)&&(ie.smooth=!1)}),$t=Tn(R.snapTo)?R.snapTo:R.snapTo==="labels"?Iw(l):R.snapTo==="labelsDirectional"?Ww(l):R.directional!==!1?function(ie,Te){return Wm(R.snapTo)(ie,Sn()-ce<500?0:Te.direction)}:fe.utils.snap(R.snapTo),vn=R.duration||{min:.1,max:2},vn=fi(vn)?Wo(vn.min,vn.max):Wo(vn,vn),yn=fe.delayedCall(R.delay||Sa/2||.1,function(){var ie=oe(),Te=Sn()-ce<500,ve=Ke.tween;if((Te||Math.abs(U.getVelocity())<10)&&!ve&&!Ff&&ae!==ie){var Se=(ie-qe)/ut,Mt=l&&!re?l.totalProgress():Se,Oe=Te?0:(Mt-As)/(Sn()-Yo)*1e3||0,bt=fe.utils.clamp(-Se,1-Se,fl(Oe/2)*Oe/.185),dt=Se+(R.inertia===!1?0:bt),ze,Me,Qe=R,jn=Qe.onStart,ht=Qe.onInterrupt,En=Qe.onComplete;if(ze=$t(dt,U),Vo(ze)||(ze=dt),Me=Math.max(0,Math.round(qe+ze*ut)),ie<=tt&&ie>=qe&&Me!==ie){if(ve&&!ve._initted&&ve.data<=fl(Me-ie))return;R.inertia===!1&&(bt=ze-Se),Ke(Me,{duration:vn(fl(Math.max(fl(dt-Mt),fl(ze-Mt))*.185/Oe/.05||0)),ease:R.ease||"power3",data:fl(Me-ie),onInterrupt:function(){return yn.restart(!0)&&ht&&ht(U)},onComplete:function(){U.update(),ae=oe(),l&&!re&&(Re?Re.resetTo("totalProgress",ze,l._tTime/l._tDur):l.progress(ze)),as=As=l&&!re?l.totalProgress():U.progress,E&&E(U),En&&En(U)}},ie,bt*ut,Me-ie-bt*ut),jn&&jn(U,Ke.tween)}}else U.isActive&&ae!==ie&&yn.restart(!0)}).pause()),g&&(om[g]=U),S=U.trigger=Xn(S||A!==!0&&A),Ka=S&&S._gsap&&S._gsap.stRevert,Ka&&(Ka=Ka(U)),A=A===!0?S:Xn(A),ca(d)&&(d={targets:S,className:d}),A&&(N===!1||N===Ha||(N=!N&&A.parentNode&&A.parentNode.style&&Ba(A.parentNode).display==="flex"?!1:Kt),U.pin=A,Ne=fe.core.getCache(A),Ne.spacer?Xa=Ne.pinState:(P&&(P=Xn(P),P&&!P.nodeType&&(P=P.current||P.nativeElement),Ne.spacerIsNative=!!P,P&&(Ne.spacerState=Qu(P))),Ne.spacer=Yt=P||ft.createElement("div"),Yt.classList.add("pin-spacer"),g&&Yt.classList.add("pin-spacer-"+g),Ne.pinState=Xa=Qu(A)),s.force3D!==!1&&fe.set(A,{force3D:!0}),U.spacer=Yt=Ne.spacer,qt=Ba(A),Yr=qt[N+W.os2],yt=fe.getProperty(A),xn=fe.quickSetter(A,W.a,en),Ap(A,Yt,qt),Pt=Qu(A)),J){In=fi(J)?Bv(J,Fv):Fv,$=Ku("scroller-start",g,Z,W,In,0),gn=Ku("scroller-end",g,Z,W,In,0,$),Za=$["offset"+W.op.d2];var er=Xn(Or(Z,"content")||Z);nn=this.markerStart=Ku("start",g,er,W,In,Za,0,z),on=this.markerEnd=Ku("end",g,er,W,In,Za,0,z),z&&(Ta=fe.quickSetter([nn,on],W.a,en)),!Q&&!(vs.length&&Or(Z,"fixedMarkers")===!0)&&(Jw(le?et:Z),fe.set([$,gn],{force3D:!0}),ns=fe.quickSetter($,W.a,en),Nn=fe.quickSetter(gn,W.a,en))}if(z){var Ae=z.vars.onUpdate,xe=z.vars.onUpdateParams;z.eventCallback("onUpdate",function(){U.update(0,0,1),Ae&&Ae.apply(z,xe||[])})}if(U.previous=function(){return ke[ke.indexOf(U)-1]},U.next=function(){return ke[ke.indexOf(U)+1]},U.revert=function(ie,Te){if(!Te)return U.kill(!0);var ve=ie!==!1||!U.enabled,Se=_n;ve!==U.isReverted&&(ve&&(Jt=Math.max(oe(),U.scroll.rec||0),ge=U.progress,Aa=l&&l.progress()),nn&&[nn,on,$,gn].forEach(function(Mt){return Mt.style.display=ve?"none":"block"}),ve&&(_n=U,U.update(ve)),A&&(!O||!U.isActive)&&(ve?nN(A,Yt,Xa):Ap(A,Yt,Ba(A),Rt)),ve||U.update(ve),_n=Se,U.isReverted=ve)},U.refresh=function(ie,Te,ve,Se){if(!((_n||!U.enabled)&&!Te)){if(A&&ie&&qa){rn(i,"scrollEnd",i_);return}!kn&&k&&k(U),_n=U,Ke.tween&&!ve&&(Ke.tween.kill(),Ke.tween=0),Re&&Re.pause(),_&&l&&(l.revert({kill:!1}).invalidate(),l.getChildren?l.getChildren(!0,!0,!1).forEach(function(is){return is.vars.immediateRender&&is.render(0,!0,!0)}):l.vars.immediateRender&&l.render(0,!0,!0)),U.isReverted||U.revert(!0,!0),U._subPinOffset=!1;var Mt=I(),Oe=F(),bt=z?z.duration():xs(Z,W),dt=ut<=.01||!ut,ze=0,Me=Se||0,Qe=fi(ve)?ve.end:s.end,jn=s.endTrigger||S,ht=fi(ve)?ve.start:s.start||(s.start===0||!S?0:A?"0 0":"0 100%"),En=U.pinnedContainer=s.pinnedContainer&&Xn(s.pinnedContainer,U),Wn=S&&Math.max(0,ke.indexOf(U))||0,wt=Wn,Lt,Nt,Hn,ss,jt,Pe,ea,zi,rs,wa,Na,tr,qr;for(J&&fi(ve)&&(tr=fe.getProperty($,W.p),qr=fe.getProperty(gn,W.p));wt-- >0;)Pe=ke[wt],Pe.end||Pe.refresh(0,1)||(_n=U),ea=Pe.pin,ea&&(ea===S||ea===A||ea===En)&&!Pe.isReverted&&(wa||(wa=[]),wa.unshift(Pe),Pe.revert(!0,!0)),Pe!==ke[wt]&&(Wn--,wt--);for(Tn(ht)&&(ht=ht(U)),ht=Pv(ht,"start",U),qe=Vv(ht,S,Mt,W,oe(),nn,$,U,Oe,me,Q,bt,z,U._startClamp&&"_startClamp")||(A?-.001:0),Tn(Qe)&&(Qe=Qe(U)),ca(Qe)&&!Qe.indexOf("+=")&&(~Qe.indexOf(" ")?Qe=(ca(ht)?ht.split(" ")[0]:"")+Qe:(ze=df(Qe.substr(2),Mt),Qe=ca(ht)?ht:(z?fe.utils.mapRange(0,z.duration(),z.scrollTrigger.start,z.scrollTrigger.end,qe):qe)+ze,jn=S)),Qe=Pv(Qe,"end",U),tt=Math.max(qe,Vv(Qe||(jn?"100% 0":bt),jn,Mt,W,oe()+ze,on,gn,U,Oe,me,Q,bt,z,U._endClamp&&"_endClamp"))||-.001,ze=0,wt=Wn;wt--;)Pe=ke[wt]||{},ea=Pe.pin,ea&&Pe.start-Pe._pinPush<=qe&&!z&&Pe.end>0&&(Lt=Pe.end-(U._startClamp?Math.max(0,Pe.start):Pe.start),(ea===S&&Pe.start-Pe._pinPush<qe||ea===En)&&isNaN(ht)&&(ze+=Lt*(1-Pe.progress)),ea===A&&(Me+=Lt));if(qe+=ze,tt+=ze,U._startClamp&&(U._startClamp+=ze),U._endClamp&&!kn&&(U._endClamp=tt||-.001,tt=Math.min(tt,xs(Z,W))),ut=tt-qe||(qe-=.01)&&.001,dt&&(ge=fe.utils.clamp(0,1,fe.utils.normalize(qe,tt,Jt))),U._pinPush=Me,nn&&ze&&(Lt={},Lt[W.a]="+="+ze,En&&(Lt[W.p]="-="+oe()),fe.set([nn,on],Lt)),A&&!(lm&&U.end>=xs(Z,W)))Lt=Ba(A),ss=W===tn,Hn=oe(),Un=parseFloat(yt(W.a))+Me,!bt&&tt>1&&(Na=(le?ft.scrollingElement||fa:Z).style,Na={style:Na,value:Na["overflow"+W.a.toUpperCase()]},le&&Ba(et)["overflow"+W.a.toUpperCase()]!=="scroll"&&(Na.style["overflow"+W.a.toUpperCase()]="scroll")),Ap(A,Yt,Lt),Pt=Qu(A),Nt=Vs(A,!0),zi=Q&&Br(Z,ss?Pn:tn)(),N?(Rt=[N+W.os2,ut+Me+en],Rt.t=Yt,wt=N===Kt?Cf(A,W)+ut+Me:0,wt&&(Rt.push(W.d,wt+en),Yt.style.flexBasis!=="auto"&&(Yt.style.flexBasis=wt+en)),El(Rt),En&&ke.forEach(function(is){is.pin===En&&is.vars.pinSpacing!==!1&&(is._subPinOffset=!0)}),Q&&oe(Jt)):(wt=Cf(A,W),wt&&Yt.style.flexBasis!=="auto"&&(Yt.style.flexBasis=wt+en)),Q&&(jt={top:Nt.top+(ss?Hn-qe:zi)+en,left:Nt.left+(ss?zi:Hn-qe)+en,boxSizing:"border-box",position:"fixed"},jt[yi]=jt["max"+Pl]=Math.ceil(Nt.width)+en,jt[bi]=jt["max"+Im]=Math.ceil(Nt.height)+en,jt[Ha]=jt[Ha+ac]=jt[Ha+tc]=jt[Ha+sc]=jt[Ha+nc]="0",jt[Kt]=Lt[Kt],jt[Kt+ac]=Lt[Kt+ac],jt[Kt+tc]=Lt[Kt+tc],jt[Kt+sc]=Lt[Kt+sc],jt[Kt+nc]=Lt[Kt+nc],ts=sN(Xa,jt,O),kn&&oe(0)),l?(rs=l._initted,vp(1),l.render(l.duration(),!0,!0),_a=yt(W.a)-Un+ut+Me,Tt=Math.abs(ut-_a)>1,Q&&Tt&&ts.splice(ts.length-2,2),l.render(0,!0,!0),rs||l.invalidate(!0),l.parent||l.totalTime(l.totalTime()),vp(0)):_a=ut,Na&&(Na.value?Na.style["overflow"+W.a.toUpperCase()]=Na.value:Na.style.removeProperty("overflow-"+W.a));else if(S&&oe()&&!z)for(Nt=S.parentNode;Nt&&Nt!==et;)Nt._pinOffset&&(qe-=Nt._pinOffset,tt-=Nt._pinOffset),Nt=Nt.parentNode;wa&&wa.forEach(function(is){return is.revert(!1,!0)}),U.start=qe,U.end=tt,xt=vt=kn?Jt:oe(),!z&&!kn&&(xt<Jt&&oe(Jt),U.scroll.rec=0),U.revert(!1,!0),ce=Sn(),yn&&(ae=-1,yn.restart(!0)),_n=0,l&&re&&(l._initted||Aa)&&l.progress()!==Aa&&l.progress(Aa||0,!0).render(l.time(),!0,!0),(dt||ge!==U.progress||z||_||l&&!l._initted)&&(l&&!re&&(l._initted||ge||l.vars.immediateRender!==!1)&&l.totalProgress(z&&qe<-.001&&!ge?fe.utils.normalize(qe,tt,0):ge,!0),U.progress=dt||(xt-qe)/ut===ge?0:ge),A&&N&&(Yt._pinOffset=Math.round(U.progress*_a)),Re&&Re.invalidate(),isNaN(tr)||(tr-=fe.getProperty($,W.p),qr-=fe.getProperty(gn,W.p),$u($,W,tr),$u(nn,W,tr-(Se||0)),$u(gn,W,qr),$u(on,W,qr-(Se||0))),dt&&!kn&&U.update(),x&&!kn&&!ba&&(ba=!0,x(U),ba=!1)}},U.getVelocity=function(){return(oe()-vt)/(Sn()-Yo)*1e3||0},U.endAnimation=function(){Uo(U.callbackAnimation),l&&(Re?Re.progress(1):l.paused()?re||Uo(l,U.direction<0,1):Uo(l,l.reversed()))},U.labelToScroll=function(ie){return l&&l.labels&&(qe||U.refresh()||qe)+l.labels[ie]/l.duration()*ut||0},U.getTrailing=function(ie){var Te=ke.indexOf(U),ve=U.direction>0?ke.slice(0,Te).reverse():ke.slice(Te+1);return(ca(ie)?ve.filter(function(Se){return Se.vars.preventOverlaps===ie}):ve).filter(function(Se){return U.direction>0?Se.end<=qe:Se.start>=tt})},U.update=function(ie,Te,ve){if(!(z&&!ve&&!ie)){var Se=kn===!0?Jt:U.scroll(),Mt=ie?0:(Se-qe)/ut,Oe=Mt<0?0:Mt>1?1:Mt||0,bt=U.progress,dt,ze,Me,Qe,jn,ht,En,Wn;if(Te&&(vt=xt,xt=z?oe():Se,R&&(As=as,as=l&&!re?l.totalProgress():Oe)),T&&A&&!_n&&!qu&&qa&&(!Oe&&qe<Se+(Se-vt)/(Sn()-Yo)*T?Oe=1e-4:Oe===1&&tt>Se+(Se-vt)/(Sn()-Yo)*T&&(Oe=.9999)),Oe!==bt&&U.enabled){if(dt=U.isActive=!!Oe&&Oe<1,ze=!!bt&&bt<1,ht=dt!==ze,jn=ht||!!Oe!=!!bt,U.direction=Oe>bt?1:-1,U.progress=Oe,jn&&!_n&&(Me=Oe&&!bt?0:Oe===1?1:bt===1?2:3,re&&(Qe=!ht&&K[Me+1]!=="none"&&K[Me+1]||K[Me],Wn=l&&(Qe==="complete"||Qe==="reset"||Qe in l))),G&&(ht||Wn)&&(Wn||v||!l)&&(Tn(G)?G(U):U.getTrailing(G).forEach(function(Hn){return Hn.endAnimation()})),re||(Re&&!_n&&!qu?(Re._dp._time-Re._start!==Re._time&&Re.render(Re._dp._time-Re._start),Re.resetTo?Re.resetTo("totalProgress",Oe,l._tTime/l._tDur):(Re.vars.totalProgress=Oe,Re.invalidate().restart())):l&&l.totalProgress(Oe,!!(_n&&(ce||ie)))),A){if(ie&&N&&(Yt.style[N+W.os2]=Yr),!Q)xn(Go(Un+_a*Oe));else if(jn){if(En=!ie&&Oe>bt&&tt+1>Se&&Se+1>=xs(Z,W),O)if(!ie&&(dt||En)){var wt=Vs(A,!0),Lt=Se-qe;Xv(A,et,wt.top+(W===tn?Lt:0)+en,wt.left+(W===tn?0:Lt)+en)}else Xv(A,Yt);El(dt||En?ts:Pt),Tt&&Oe<1&&dt||xn(Un+(Oe===1&&!En?_a:0))}}R&&!Ke.tween&&!_n&&!qu&&yn.restart(!0),d&&(ht||M&&Oe&&(Oe<1||!yp))&&mc(d.targets).forEach(function(Hn){return Hn.classList[dt||M?"add":"remove"](d.className)}),u&&!re&&!ie&&u(U),jn&&!_n?(re&&(Wn&&(Qe==="complete"?l.pause().totalProgress(1):Qe==="reset"?l.restart(!0).pause():Qe==="restart"?l.restart(!0):l[Qe]()),u&&u(U)),(ht||!yp)&&(m&&ht&&_p(U,m),H[Me]&&_p(U,H[Me]),M&&(Oe===1?U.kill(!1,1):H[Me]=0),ht||(Me=Oe===1?1:3,H[Me]&&_p(U,H[Me]))),C&&!dt&&Math.abs(U.getVelocity())>(Vo(C)?C:2500)&&(Uo(U.callbackAnimation),Re?Re.progress(1):Uo(l,Qe==="reverse"?1:!Oe,1))):re&&u&&!_n&&u(U)}if(Nn){var Nt=z?Se/z.duration()*(z._caScrollDist||0):Se;ns(Nt+($._isFlipped?1:0)),Nn(Nt)}Ta&&Ta(-Se/z.duration()*(z._caScrollDist||0))}},U.enable=function(ie,Te){U.enabled||(U.enabled=!0,rn(Z,"resize",Xo),le||rn(Z,"scroll",dl),k&&rn(i,"refreshInit",k),ie!==!1&&(U.progress=ge=0,xt=vt=ae=oe()),Te!==!1&&U.refresh())},U.getTween=function(ie){return ie&&Ke?Ke.tween:Re},U.setPositions=function(ie,Te,ve,Se){if(z){var Mt=z.scrollTrigger,Oe=z.duration(),bt=Mt.end-Mt.start;ie=Mt.start+bt*ie/Oe,Te=Mt.start+bt*Te/Oe}U.refresh(!1,!1,{start:Lv(ie,ve&&!!U._startClamp),end:Lv(Te,ve&&!!U._endClamp)},Se),U.update()},U.adjustPinSpacing=function(ie){if(Rt&&ie){var Te=Rt.indexOf(W.d)+1;Rt[Te]=parseFloat(Rt[Te])+ie+en,Rt[1]=parseFloat(Rt[1])+ie+en,El(Rt)}},U.disable=function(ie,Te){if(ie!==!1&&U.revert(!0,!0),U.enabled&&(U.enabled=U.isActive=!1,Te||Re&&Re.pause(),Jt=0,Ne&&(Ne.uncache=1),k&&sn(i,"refreshInit",k),yn&&(yn.pause(),Ke.tween&&Ke.tween.kill()&&(Ke.tween=0)),!le)){for(var ve=ke.length;ve--;)if(ke[ve].scroller===Z&&ke[ve]!==U)return;sn(Z,"resize",Xo),le||sn(Z,"scroll",dl)}},U.kill=function(ie,Te){U.disable(ie,Te),Re&&!Te&&Re.kill(),g&&delete om[g];var ve=ke.indexOf(U);ve>=0&&ke.splice(ve,1),ve===Dn&&pf>0&&Dn--,ve=0,ke.forEach(function(Se){return Se.scroller===U.scroller&&(ve=1)}),ve||kn||(U.scroll.rec=0),l&&(l.scrollTrigger=null,ie&&l.revert({kill:!1}),Te||l.kill()),nn&&[nn,on,$,gn].forEach(function(Se){return Se.parentNode&&Se.parentNode.removeChild(Se)}),rc===U&&(rc=0),A&&(Ne&&(Ne.uncache=1),ve=0,ke.forEach(function(Se){return Se.pin===A&&ve++}),ve||(Ne.spacer=0)),s.onKill&&s.onKill(U)},ke.push(U),U.enable(!1,!1),Ka&&Ka(U),l&&l.add&&!ut){var $e=U.update;U.update=function(){U.update=$e,Ue.cache++,qe||tt||U.refresh()},fe.delayedCall(.01,U.update),ut=.01,qe=tt=0}else U.refresh();A&&tN()},i.register=function(s){return vl||(fe=s||e_(),Wb()&&window.document&&i.enable(),vl=qo),vl},i.defaults=function(s){if(s)for(var l in s)Zu[l]=s[l];return Zu},i.disable=function(s,l){qo=0,ke.forEach(function(u){return u[l?"kill":"disable"](s)}),sn(Le,"wheel",dl),sn(ft,"scroll",dl),clearInterval(Yu),sn(ft,"touchcancel",hs),sn(et,"touchstart",hs),Vu(sn,ft,"pointerdown,touchstart,mousedown",Uv),Vu(sn,ft,"pointerup,touchend,mouseup",Hv),Ef.kill(),Gu(sn);for(var c=0;c<Ue.length;c+=3)Xu(sn,Ue[c],Ue[c+1]),Xu(sn,Ue[c],Ue[c+2])},i.enable=function(){if(Le=window,ft=document,fa=ft.documentElement,et=ft.body,fe&&(mc=fe.utils.toArray,Wo=fe.utils.clamp,im=fe.core.context||hs,vp=fe.core.suppressOverwrites||hs,Km=Le.history.scrollRestoration||"auto",cm=Le.pageYOffset||0,fe.core.globals("ScrollTrigger",i),et)){qo=1,jl=document.createElement("div"),jl.style.height="100vh",jl.style.position="absolute",u_(),Kw(),Ft.register(fe),i.isTouch=Ft.isTouch,Nr=Ft.isTouch&&/(iPad|iPhone|iPod|Mac)/g.test(navigator.userAgent),rm=Ft.isTouch===1,rn(Le,"wheel",dl),Zm=[Le,ft,fa,et],fe.matchMedia?(i.matchMedia=function(m){var x=fe.matchMedia(),v;for(v in m)x.add(v,m[v]);return x},fe.addEventListener("matchMediaInit",function(){o_(),eg()}),fe.addEventListener("matchMediaRevert",function(){return l_()}),fe.addEventListener("matchMedia",function(){pi(0,1),Ti("matchMedia")}),fe.matchMedia().add("(orientation: portrait)",function(){return Sp(),Sp})):console.warn("Requires GSAP 3.11.0 or later"),Sp(),rn(ft,"scroll",dl);var s=et.hasAttribute("style"),l=et.style,c=l.borderTopStyle,u=fe.core.Animation.prototype,d,g;for(u.revert||Object.defineProperty(u,"revert",{value:function(){return this.time(-.01,!0)}}),l.borderTopStyle="solid",d=Vs(et),tn.m=Math.round(d.top+tn.sc())||0,Pn.m=Math.round(d.left+Pn.sc())||0,c?l.borderTopStyle=c:l.removeProperty("border-top-style"),s||(et.setAttribute("style",""),et.removeAttribute("style")),Yu=setInterval(Yv,250),fe.delayedCall(.5,function(){return qu=0}),rn(ft,"touchcancel",hs),rn(et,"touchstart",hs),Vu(rn,ft,"pointerdown,touchstart,mousedown",Uv),Vu(rn,ft,"pointerup,touchend,mouseup",Hv),sm=fe.utils.checkPrefix("transform"),mf.push(sm),vl=Sn(),Ef=fe.delayedCall(.2,pi).pause(),yl=[ft,"visibilitychange",function(){var m=Le.innerWidth,x=Le.innerHeight;ft.hidden?(kv=m,Ov=x):(kv!==m||Ov!==x)&&Xo()},ft,"DOMContentLoaded",pi,Le,"load",pi,Le,"resize",Xo],Gu(rn),ke.forEach(function(m){return m.enable(0,1)}),g=0;g<Ue.length;g+=3)Xu(sn,Ue[g],Ue[g+1]),Xu(sn,Ue[g],Ue[g+2])}},i.config=function(s){"limitCallbacks"in s&&(yp=!!s.limitCallbacks);var l=s.syncInterval;l&&clearInterval(Yu)||(Yu=l)&&setInterval(Yv,l),"ignoreMobileResize"in s&&(rm=i.isTouch===1&&s.ignoreMobileResize),"autoRefreshEvents"in s&&(Gu(sn)||Gu(rn,s.autoRefreshEvents||"none"),$b=(s.autoRefreshEvents+"").indexOf("resize")===-1)},i.scrollerProxy=function(s,l){var c=Xn(s),u=Ue.indexOf(c),d=Si(c);~u&&Ue.splice(u,d?6:2),l&&(d?vs.unshift(Le,l,et,l,fa,l):vs.unshift(c,l))},i.clearMatchMedia=function(s){ke.forEach(function(l){return l._ctx&&l._ctx.query===s&&l._ctx.kill(!0,!0)})},i.isInViewport=function(s,l,c){var u=(ca(s)?Xn(s):s).getBoundingClientRect(),d=u[c?yi:bi]*l||0;return c?u.right-d>0&&u.left+d<Le.innerWidth:u.bottom-d>0&&u.top+d<Le.innerHeight},i.positionInViewport=function(s,l,c){ca(s)&&(s=Xn(s));var u=s.getBoundingClientRect(),d=u[c?yi:bi],g=l==null?d/2:l in zf?zf[l]*d:~l.indexOf("%")?parseFloat(l)*d/100:parseFloat(l)||0;return c?(u.left+g)/Le.innerWidth:(u.top+g)/Le.innerHeight},i.killAll=function(s){if(ke.slice(0).forEach(function(c){return c.vars.id!=="ScrollSmoother"&&c.kill()}),s!==!0){var l=Ai.killAll||[];Ai={},l.forEach(function(c){return c()})}},i})();_e.version="3.14.2";_e.saveStyles=function(i){return i?mc(i).forEach(function(n){if(n&&n.style){var r=oa.indexOf(n);r>=0&&oa.splice(r,5),oa.push(n,n.style.cssText,n.getBBox&&n.getAttribute("transform"),fe.core.getCache(n),im())}}):oa};_e.revert=function(i,n){return eg(!i,n)};_e.create=function(i,n){return new _e(i,n)};_e.refresh=function(i){return i?Xo(!0):(vl||_e.register())&&pi(!0)};_e.update=function(i){return++Ue.cache&&Ks(i===!0?2:0)};_e.clearScrollMemory=c_;_e.maxScroll=function(i,n){return xs(i,n?Pn:tn)};_e.getScrollFunc=function(i,n){return Br(Xn(i),n?Pn:tn)};_e.getById=function(i){return om[i]};_e.getAll=function(){return ke.filter(function(i){return i.vars.id!=="ScrollSmoother"})};_e.isScrolling=function(){return!!qa};_e.snapDirectional=Wm;_e.addEventListener=function(i,n){var r=Ai[i]||(Ai[i]=[]);~r.indexOf(n)||r.push(n)};_e.removeEventListener=function(i,n){var r=Ai[i],s=r&&r.indexOf(n);s>=0&&r.splice(s,1)};_e.batch=function(i,n){var r=[],s={},l=n.interval||.016,c=n.batchMax||1e9,u=function(m,x){var v=[],S=[],A=fe.delayedCall(l,function(){x(v,S),v=[],S=[]}).pause();return function(N){v.length||A.restart(!0),v.push(N.trigger),S.push(N),c<=v.length&&A.progress(1)}},d;for(d in n)s[d]=d.substr(0,2)==="on"&&Tn(n[d])&&d!=="onRefreshInit"?u(d,n[d]):n[d];return Tn(c)&&(c=c(),rn(_e,"refresh",function(){return c=n.batchMax()})),mc(i).forEach(function(g){var m={};for(d in s)m[d]=s[d];m.trigger=g,r.push(_e.create(m))}),r};var Kv=function(n,r,s,l){return r>l?n(l):r<0&&n(0),s>l?(l-r)/(s-r):s<0?r/(r-s):1},Tp=function i(n,r){r===!0?n.style.removeProperty("touch-action"):n.style.touchAction=r===!0?"auto":r?"pan-"+r+(Ft.isTouch?" pinch-zoom":""):"none",n===fa&&i(et,r)},Ju={auto:1,scroll:1},iN=function(n){var r=n.event,s=n.target,l=n.axis,c=(r.changedTouches?r.changedTouches[0]:r).target,u=c._gsap||fe.core.getCache(c),d=Sn(),g;if(!u._isScrollT||d-u._isScrollT>2e3){for(;c&&c!==et&&(c.scrollHeight<=c.clientHeight&&c.scrollWidth<=c.clientWidth||!(Ju[(g=Ba(c)).overflowY]||Ju[g.overflowX]));)c=c.parentNode;u._isScroll=c&&c!==s&&!Si(c)&&(Ju[(g=Ba(c)).overflowY]||Ju[g.overflowX]),u._isScrollT=d}(u._isScroll||l==="x")&&(r.stopPropagation(),r._gsapAllow=!0)},d_=function(n,r,s,l){return Ft.create({target:n,capture:!0,debounce:!1,lockAxis:!0,type:r,onWheel:l=l&&iN,onPress:l,onDrag:l,onScroll:l,onEnable:function(){return s&&rn(ft,Ft.eventTypes[0],$v,!1,!0)},onDisable:function(){return sn(ft,Ft.eventTypes[0],$v,!0)}})},lN=/(input|label|select|textarea)/i,Qv,$v=function(n){var r=lN.test(n.target.tagName);(r||Qv)&&(n._gsapAllow=!0,Qv=r)},oN=function(n){fi(n)||(n={}),n.preventDefault=n.isNormalizer=n.allowClicks=!0,n.type||(n.type="wheel,touch"),n.debounce=!!n.debounce,n.id=n.id||"normalizer";var r=n,s=r.normalizeScrollX,l=r.momentum,c=r.allowNestedScroll,u=r.onRelease,d,g,m=Xn(n.target)||fa,x=fe.core.globals().ScrollSmoother,v=x&&x.get(),S=Nr&&(n.content&&Xn(n.content)||v&&n.content!==!1&&!v.smooth()&&v.content()),A=Br(m,tn),N=Br(m,Pn),_=1,T=(Ft.isTouch&&Le.visualViewport?Le.visualViewport.scale*Le.visualViewport.width:Le.outerWidth)/Le.innerWidth,j=0,E=Tn(l)?function(){return l(d)}:function(){return l||2.8},M,R,O=d_(m,n.type,!0,c),P=function(){return R=!1},z=hs,C=hs,G=function(){g=xs(m,tn),C=Wo(Nr?1:0,g),s&&(z=Wo(0,xs(m,Pn))),M=_i},W=function(){S._gsap.y=Go(parseFloat(S._gsap.y)+A.offset)+"px",S.style.transform="matrix3d(1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, "+parseFloat(S._gsap.y)+", 0, 1)",A.offset=A.cacheID=0},re=function(){if(R){requestAnimationFrame(P);var J=Go(d.deltaY/2),me=C(A.v-J);if(S&&me!==A.v+A.offset){A.offset=me-A.v;var U=Go((parseFloat(S&&S._gsap.y)||0)-A.offset);S.style.transform="matrix3d(1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, "+U+", 0, 1)",S._gsap.y=U+"px",A.cacheID=Ue.cache,Ks()}return!0}A.offset&&W(),R=!0},Z,se,le,Q,H=function(){G(),Z.isActive()&&Z.vars.scrollY>g&&(A()>g?Z.progress(1)&&A(g):Z.resetTo("scrollY",g))};return S&&fe.set(S,{y:"+=0"}),n.ignoreCheck=function(K){return Nr&&K.type==="touchmove"&&re()||_>1.05&&K.type!=="touchstart"||d.isGesturing||K.touches&&K.touches.length>1},n.onPress=function(){R=!1;var K=_;_=Go((Le.visualViewport&&Le.visualViewport.scale||1)/T),Z.pause(),K!==_&&Tp(m,_>1.01?!0:s?!1:"x"),se=N(),le=A(),G(),M=_i},n.onRelease=n.onGestureStart=function(K,J){if(A.offset&&W(),!J)Q.restart(!0);else{Ue.cache++;var me=E(),U,k;s&&(U=N(),k=U+me*.05*-K.velocityX/.227,me*=Kv(N,U,k,xs(m,Pn)),Z.vars.scrollX=z(k)),U=A(),k=U+me*.05*-K.velocityY/.227,me*=Kv(A,U,k,xs(m,tn)),Z.vars.scrollY=C(k),Z.invalidate().duration(me).play(.01),(Nr&&Z.vars.scrollY>=g||U>=g-1)&&fe.to({},{onUpdate:H,duration:me})}u&&u(K)},n.onWheel=function(){Z._ts&&Z.pause(),Sn()-j>1e3&&(M=0,j=Sn())},n.onChange=function(K,J,me,U,k){if(_i!==M&&G(),J&&s&&N(z(U[2]===J?se+(K.startX-K.x):N()+J-U[1])),me){A.offset&&W();var I=k[2]===me,F=I?le+K.startY-K.y:A()+me-k[1],ae=C(F);I&&F!==ae&&(le+=ae-F),A(ae)}(me||J)&&Ks()},n.onEnable=function(){Tp(m,s?!1:"x"),_e.addEventListener("refresh",H),rn(Le,"resize",H),A.smooth&&(A.target.style.scrollBehavior="auto",A.smooth=N.smooth=!1),O.enable()},n.onDisable=function(){Tp(m,!0),sn(Le,"resize",H),_e.removeEventListener("refresh",H),O.kill()},n.lockAxis=n.lockAxis!==!1,d=new Ft(n),d.iOS=Nr,Nr&&!A()&&A(1),Nr&&fe.ticker.add(hs),Q=d._dc,Z=fe.to(d,{ease:"power4",paused:!0,inherit:!1,scrollX:s?"+=0.1":"+=0",scrollY:"+=0.1",modifiers:{scrollY:f_(A,A(),function(){return Z.pause()})},onUpdate:Ks,onComplete:Q.vars.onComplete}),d};_e.sort=function(i){if(Tn(i))return ke.sort(i);var n=Le.pageYOffset||0;return _e.getAll().forEach(function(r){return r._sortY=r.trigger?n+r.trigger.getBoundingClientRect().top:r.start+Le.innerHeight}),ke.sort(i||function(r,s){return(r.vars.refreshPriority||0)*-1e6+(r.vars.containerAnimation?1e6:r._sortY)-((s.vars.containerAnimation?1e6:s._sortY)+(s.vars.refreshPriority||0)*-1e6)})};_e.observe=function(i){return new Ft(i)};_e.normalizeScroll=function(i){if(typeof i>"u")return Mn;if(i===!0&&Mn)return Mn.enable();if(i===!1){Mn&&Mn.kill(),Mn=i;return}var n=i instanceof Ft?i:oN(i);return Mn&&Mn.target===n.target&&Mn.kill(),Si(n.target)&&(Mn=n),n};_e.core={_getVelocityProp:am,_inputObserver:d_,_scrollers:Ue,_proxies:vs,bridge:{ss:function(){qa||Ti("scrollStart"),qa=Sn()},ref:function(){return _n}}};e_()&&fe.registerPlugin(_e);const cN=i=>i.replace(/([a-z0-9])([A-Z])/g,"$1-$2").toLowerCase(),uN=i=>i.replace(/^([A-Z])|[\s-_]+(\w)/g,(n,r,s)=>s?s.toUpperCase():r.toLowerCase()),Jv=i=>{const n=uN(i);return n.charAt(0).toUpperCase()+n.slice(1)},h_=(...i)=>i.filter((n,r,s)=>!!n&&n.trim()!==""&&s.indexOf(n)===r).join(" ").trim(),fN=i=>{for(const n in i)if(n.startsWith("aria-")||n==="role"||n==="title")return!0};var dN={xmlns:"http://www.w3.org/2000/svg",width:24,height:24,viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:2,strokeLinecap:"round",strokeLinejoin:"round"};const hN=b.forwardRef(({color:i="currentColor",size:n=24,strokeWidth:r=2,absoluteStrokeWidth:s,className:l="",children:c,iconNode:u,...d},g)=>b.createElement("svg",{ref:g,...dN,width:n,height:n,stroke:i,strokeWidth:s?Number(r)*24/Number(n):r,className:h_("lucide",l),...!c&&!fN(d)&&{"aria-hidden":"true"},...d},[...u.map(([m,x])=>b.createElement(m,x)),...Array.isArray(c)?c:[c]]));const je=(i,n)=>{const r=b.forwardRef(({className:s,...l},c)=>b.createElement(hN,{ref:c,iconNode:n,className:h_(`lucide-${cN(Jv(i))}`,`lucide-${i}`,s),...l}));return r.displayName=Jv(i),r};const pN=[["path",{d:"m12 19-7-7 7-7",key:"1l729n"}],["path",{d:"M19 12H5",key:"x3x0zl"}]],mN=je("arrow-left",pN);const gN=[["path",{d:"M5 12h14",key:"1ays0h"}],["path",{d:"m12 5 7 7-7 7",key:"xquz4c"}]],xN=je("arrow-right",gN);const vN=[["path",{d:"M7 7h10v10",key:"1tivn9"}],["path",{d:"M7 17 17 7",key:"1vkiza"}]],tg=je("arrow-up-right",vN);const yN=[["path",{d:"M8 2v4",key:"1cmpym"}],["path",{d:"M16 2v4",key:"4m81vk"}],["rect",{width:"18",height:"18",x:"3",y:"4",rx:"2",key:"1hopcy"}],["path",{d:"M3 10h18",key:"8toen8"}]],bN=je("calendar",yN);const _N=[["path",{d:"M20 6 9 17l-5-5",key:"1gmf2c"}]],fm=je("check",_N);const SN=[["path",{d:"m15 18-6-6 6-6",key:"1wnfg3"}]],AN=je("chevron-left",SN);const TN=[["path",{d:"m9 18 6-6-6-6",key:"mthhwq"}]],wN=je("chevron-right",TN);const NN=[["circle",{cx:"12",cy:"12",r:"10",key:"1mglay"}],["line",{x1:"12",x2:"12",y1:"8",y2:"12",key:"1pkeuh"}],["line",{x1:"12",x2:"12.01",y1:"16",y2:"16",key:"4dfq90"}]],dm=je("circle-alert",NN);const jN=[["path",{d:"M21.801 10A10 10 0 1 1 17 3.335",key:"yps3ct"}],["path",{d:"m9 11 3 3L22 4",key:"1pflzl"}]],Yf=je("circle-check-big",jN);const EN=[["circle",{cx:"12",cy:"12",r:"10",key:"1mglay"}],["path",{d:"m15 9-6 6",key:"1uzhvr"}],["path",{d:"m9 9 6 6",key:"z0biqf"}]],CN=je("circle-x",EN);const zN=[["path",{d:"M12 6v6l4 2",key:"mmk7yg"}],["circle",{cx:"12",cy:"12",r:"10",key:"1mglay"}]],hm=je("clock",zN);const RN=[["rect",{width:"20",height:"14",x:"2",y:"5",rx:"2",key:"ynyp8z"}],["line",{x1:"2",x2:"22",y1:"10",y2:"10",key:"1b3vmo"}]],MN=je("credit-card",RN);const DN=[["line",{x1:"12",x2:"12",y1:"2",y2:"22",key:"7eqyqh"}],["path",{d:"M17 5H9.5a3.5 3.5 0 0 0 0 7h5a3.5 3.5 0 0 1 0 7H6",key:"1b0p4s"}]],kN=je("dollar-sign",DN);const ON=[["path",{d:"M10.733 5.076a10.744 10.744 0 0 1 11.205 6.575 1 1 0 0 1 0 .696 10.747 10.747 0 0 1-1.444 2.49",key:"ct8e1f"}],["path",{d:"M14.084 14.158a3 3 0 0 1-4.242-4.242",key:"151rxh"}],["path",{d:"M17.479 17.499a10.75 10.75 0 0 1-15.417-5.151 1 1 0 0 1 0-.696 10.75 10.75 0 0 1 4.446-5.143",key:"13bj9a"}],["path",{d:"m2 2 20 20",key:"1ooewy"}]],Iv=je("eye-off",ON);const PN=[["path",{d:"M2.062 12.348a1 1 0 0 1 0-.696 10.75 10.75 0 0 1 19.876 0 1 1 0 0 1 0 .696 10.75 10.75 0 0 1-19.876 0",key:"1nclc0"}],["circle",{cx:"12",cy:"12",r:"3",key:"1v7zrd"}]],xc=je("eye",PN);const LN=[["path",{d:"M6 22a2 2 0 0 1-2-2V4a2 2 0 0 1 2-2h8a2.4 2.4 0 0 1 1.704.706l3.588 3.588A2.4 2.4 0 0 1 20 8v12a2 2 0 0 1-2 2z",key:"1oefj6"}],["path",{d:"M14 2v5a1 1 0 0 0 1 1h5",key:"wfsgrz"}],["path",{d:"M10 9H8",key:"b1mrlr"}],["path",{d:"M16 13H8",key:"t4e002"}],["path",{d:"M16 17H8",key:"z1uh3a"}]],UN=je("file-text",LN);const HN=[["path",{d:"M10 20a1 1 0 0 0 .553.895l2 1A1 1 0 0 0 14 21v-7a2 2 0 0 1 .517-1.341L21.74 4.67A1 1 0 0 0 21 3H3a1 1 0 0 0-.742 1.67l7.225 7.989A2 2 0 0 1 10 14z",key:"sc7q7i"}]],BN=je("funnel",HN);const FN=[["path",{d:"M5 22h14",key:"ehvnwv"}],["path",{d:"M5 2h14",key:"pdyrp9"}],["path",{d:"M17 22v-4.172a2 2 0 0 0-.586-1.414L12 12l-4.414 4.414A2 2 0 0 0 7 17.828V22",key:"1d314k"}],["path",{d:"M7 2v4.172a2 2 0 0 0 .586 1.414L12 12l4.414-4.414A2 2 0 0 0 17 6.172V2",key:"1vvvr6"}]],YN=je("hourglass",FN);const qN=[["circle",{cx:"12",cy:"12",r:"10",key:"1mglay"}],["path",{d:"M12 16v-4",key:"1dtifu"}],["path",{d:"M12 8h.01",key:"e9boi3"}]],GN=je("info",qN);const VN=[["path",{d:"M21 12a9 9 0 1 1-6.219-8.56",key:"13zald"}]],vc=je("loader-circle",VN);const XN=[["path",{d:"m16 17 5-5-5-5",key:"1bji2h"}],["path",{d:"M21 12H9",key:"dn1m92"}],["path",{d:"M9 21H5a2 2 0 0 1-2-2V5a2 2 0 0 1 2-2h4",key:"1uf3rs"}]],Wv=je("log-out",XN);const ZN=[["path",{d:"m22 7-8.991 5.727a2 2 0 0 1-2.009 0L2 7",key:"132q7q"}],["rect",{x:"2",y:"4",width:"20",height:"16",rx:"2",key:"izxlao"}]],ng=je("mail",ZN);const KN=[["path",{d:"M20 10c0 4.993-5.539 10.193-7.399 11.799a1 1 0 0 1-1.202 0C9.539 20.193 4 14.993 4 10a8 8 0 0 1 16 0",key:"1r0f0z"}],["circle",{cx:"12",cy:"10",r:"3",key:"ilqhr7"}]],qf=je("map-pin",KN);const QN=[["path",{d:"M4 5h16",key:"1tepv9"}],["path",{d:"M4 12h16",key:"1lakjw"}],["path",{d:"M4 19h16",key:"1djgab"}]],$N=je("menu",QN);const JN=[["path",{d:"M2.992 16.342a2 2 0 0 1 .094 1.167l-1.065 3.29a1 1 0 0 0 1.236 1.168l3.413-.998a2 2 0 0 1 1.099.092 10 10 0 1 0-4.777-4.719",key:"1sd12s"}]],ag=je("message-circle",JN);const IN=[["path",{d:"M22 17a2 2 0 0 1-2 2H6.828a2 2 0 0 0-1.414.586l-2.202 2.202A.71.71 0 0 1 2 21.286V5a2 2 0 0 1 2-2h16a2 2 0 0 1 2 2z",key:"18887p"}]],WN=je("message-square",IN);const ej=[["rect",{width:"20",height:"14",x:"2",y:"3",rx:"2",key:"48i651"}],["line",{x1:"8",x2:"16",y1:"21",y2:"21",key:"1svkeh"}],["line",{x1:"12",x2:"12",y1:"17",y2:"21",key:"vw1qmm"}]],tj=je("monitor",ej);const nj=[["path",{d:"M9 18V5l12-2v13",key:"1jmyc2"}],["circle",{cx:"6",cy:"18",r:"3",key:"fqmcym"}],["circle",{cx:"18",cy:"16",r:"3",key:"1hluhg"}]],pm=je("music",nj);const aj=[["path",{d:"M13.832 16.568a1 1 0 0 0 1.213-.303l.355-.465A2 2 0 0 1 17 15h3a2 2 0 0 1 2 2v3a2 2 0 0 1-2 2A18 18 0 0 1 2 4a2 2 0 0 1 2-2h3a2 2 0 0 1 2 2v3a2 2 0 0 1-.8 1.6l-.468.351a1 1 0 0 0-.292 1.233 14 14 0 0 0 6.392 6.384",key:"9njp5v"}]],p_=je("phone",aj);const sj=[["path",{d:"M5 12h14",key:"1ays0h"}],["path",{d:"M12 5v14",key:"s699le"}]],m_=je("plus",sj);const rj=[["path",{d:"M16 3a2 2 0 0 0-2 2v6a2 2 0 0 0 2 2 1 1 0 0 1 1 1v1a2 2 0 0 1-2 2 1 1 0 0 0-1 1v2a1 1 0 0 0 1 1 6 6 0 0 0 6-6V5a2 2 0 0 0-2-2z",key:"rib7q0"}],["path",{d:"M5 3a2 2 0 0 0-2 2v6a2 2 0 0 0 2 2 1 1 0 0 1 1 1v1a2 2 0 0 1-2 2 1 1 0 0 0-1 1v2a1 1 0 0 0 1 1 6 6 0 0 0 6-6V5a2 2 0 0 0-2-2z",key:"1ymkrd"}]],ij=je("quote",rj);const lj=[["path",{d:"M3 12a9 9 0 0 1 9-9 9.75 9.75 0 0 1 6.74 2.74L21 8",key:"v9h5vc"}],["path",{d:"M21 3v5h-5",key:"1q7to0"}],["path",{d:"M21 12a9 9 0 0 1-9 9 9.75 9.75 0 0 1-6.74-2.74L3 16",key:"3uifl3"}],["path",{d:"M8 16H3v5",key:"1cv678"}]],oj=je("refresh-cw",lj);const cj=[["path",{d:"M15.2 3a2 2 0 0 1 1.4.6l3.8 3.8a2 2 0 0 1 .6 1.4V19a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2V5a2 2 0 0 1 2-2z",key:"1c8476"}],["path",{d:"M17 21v-7a1 1 0 0 0-1-1H8a1 1 0 0 0-1 1v7",key:"1ydtos"}],["path",{d:"M7 3v4a1 1 0 0 0 1 1h7",key:"t51u73"}]],uj=je("save",cj);const fj=[["path",{d:"m21 21-4.34-4.34",key:"14j7rj"}],["circle",{cx:"11",cy:"11",r:"8",key:"4ej97u"}]],sg=je("search",fj);const dj=[["path",{d:"M9.671 4.136a2.34 2.34 0 0 1 4.659 0 2.34 2.34 0 0 0 3.319 1.915 2.34 2.34 0 0 1 2.33 4.033 2.34 2.34 0 0 0 0 3.831 2.34 2.34 0 0 1-2.33 4.033 2.34 2.34 0 0 0-3.319 1.915 2.34 2.34 0 0 1-4.659 0 2.34 2.34 0 0 0-3.32-1.915 2.34 2.34 0 0 1-2.33-4.033 2.34 2.34 0 0 0 0-3.831A2.34 2.34 0 0 1 6.35 6.051a2.34 2.34 0 0 0 3.319-1.915",key:"1i5ecw"}],["circle",{cx:"12",cy:"12",r:"3",key:"1v7zrd"}]],hj=je("settings",dj);const pj=[["path",{d:"M20 13c0 5-3.5 7.5-7.66 8.95a1 1 0 0 1-.67-.01C7.5 20.5 4 18 4 13V6a1 1 0 0 1 1-1c2 0 4.5-1.2 6.24-2.72a1.17 1.17 0 0 1 1.52 0C14.51 3.81 17 5 19 5a1 1 0 0 1 1 1z",key:"oel41y"}]],ey=je("shield",pj);const mj=[["path",{d:"M11.017 2.814a1 1 0 0 1 1.966 0l1.051 5.558a2 2 0 0 0 1.594 1.594l5.558 1.051a1 1 0 0 1 0 1.966l-5.558 1.051a2 2 0 0 0-1.594 1.594l-1.051 5.558a1 1 0 0 1-1.966 0l-1.051-5.558a2 2 0 0 0-1.594-1.594l-5.558-1.051a1 1 0 0 1 0-1.966l5.558-1.051a2 2 0 0 0 1.594-1.594z",key:"1s2grr"}],["path",{d:"M20 2v4",key:"1rf3ol"}],["path",{d:"M22 4h-4",key:"gwowj6"}],["circle",{cx:"4",cy:"20",r:"2",key:"6kqj1y"}]],gj=je("sparkles",mj);const xj=[["path",{d:"M12 3H5a2 2 0 0 0-2 2v14a2 2 0 0 0 2 2h14a2 2 0 0 0 2-2v-7",key:"1m0v6g"}],["path",{d:"M18.375 2.625a1 1 0 0 1 3 3l-9.013 9.014a2 2 0 0 1-.853.505l-2.873.84a.5.5 0 0 1-.62-.62l.84-2.873a2 2 0 0 1 .506-.852z",key:"ohrbg2"}]],vj=je("square-pen",xj);const yj=[["path",{d:"M11.525 2.295a.53.53 0 0 1 .95 0l2.31 4.679a2.123 2.123 0 0 0 1.595 1.16l5.166.756a.53.53 0 0 1 .294.904l-3.736 3.638a2.123 2.123 0 0 0-.611 1.878l.882 5.14a.53.53 0 0 1-.771.56l-4.618-2.428a2.122 2.122 0 0 0-1.973 0L6.396 21.01a.53.53 0 0 1-.77-.56l.881-5.139a2.122 2.122 0 0 0-.611-1.879L2.16 9.795a.53.53 0 0 1 .294-.906l5.165-.755a2.122 2.122 0 0 0 1.597-1.16z",key:"r04s7s"}]],bj=je("star",yj);const _j=[["path",{d:"M10 11v6",key:"nco0om"}],["path",{d:"M14 11v6",key:"outv1u"}],["path",{d:"M19 6v14a2 2 0 0 1-2 2H7a2 2 0 0 1-2-2V6",key:"miytrc"}],["path",{d:"M3 6h18",key:"d0wm0j"}],["path",{d:"M8 6V4a2 2 0 0 1 2-2h4a2 2 0 0 1 2 2v2",key:"e791ji"}]],Sj=je("trash-2",_j);const Aj=[["path",{d:"M19 21v-2a4 4 0 0 0-4-4H9a4 4 0 0 0-4 4v2",key:"975kel"}],["circle",{cx:"12",cy:"7",r:"4",key:"17ys0d"}]],Rf=je("user",Aj);const Tj=[["path",{d:"M16 21v-2a4 4 0 0 0-4-4H6a4 4 0 0 0-4 4v2",key:"1yyitq"}],["path",{d:"M16 3.128a4 4 0 0 1 0 7.744",key:"16gr8j"}],["path",{d:"M22 21v-2a4 4 0 0 0-3-3.87",key:"kshegd"}],["circle",{cx:"9",cy:"7",r:"4",key:"nufk8"}]],g_=je("users",Tj);const wj=[["path",{d:"M18 6 6 18",key:"1bl5f8"}],["path",{d:"m6 6 12 12",key:"d8bk6v"}]],x_=je("x",wj),ty=i=>{let n;const r=new Set,s=(m,x)=>{const v=typeof m=="function"?m(n):m;if(!Object.is(v,n)){const S=n;n=x??(typeof v!="object"||v===null)?v:Object.assign({},n,v),r.forEach(A=>A(n,S))}},l=()=>n,d={setState:s,getState:l,getInitialState:()=>g,subscribe:m=>(r.add(m),()=>r.delete(m))},g=n=i(s,l,d);return d},Nj=(i=>i?ty(i):ty),jj=i=>i;function Ej(i,n=jj){const r=Ua.useSyncExternalStore(i.subscribe,Ua.useCallback(()=>n(i.getState()),[i,n]),Ua.useCallback(()=>n(i.getInitialState()),[i,n]));return Ua.useDebugValue(r),r}const Cj=i=>{const n=Nj(i),r=s=>Ej(n,s);return Object.assign(r,n),r},zj=(i=>Cj);function Rj(i,n){let r;try{r=i()}catch{return}return{getItem:l=>{var c;const u=g=>g===null?null:JSON.parse(g,void 0),d=(c=r.getItem(l))!=null?c:null;return d instanceof Promise?d.then(u):u(d)},setItem:(l,c)=>r.setItem(l,JSON.stringify(c,void 0)),removeItem:l=>r.removeItem(l)}}const mm=i=>n=>{try{const r=i(n);return r instanceof Promise?r:{then(s){return mm(s)(r)},catch(s){return this}}}catch(r){return{then(s){return this},catch(s){return mm(s)(r)}}}},Mj=(i,n)=>(r,s,l)=>{let c={storage:Rj(()=>localStorage),partialize:T=>T,version:0,merge:(T,j)=>({...j,...T}),...n},u=!1,d=0;const g=new Set,m=new Set;let x=c.storage;if(!x)return i((...T)=>{console.warn(`[zustand persist middleware] Unable to update item '${c.name}', the given storage is currently unavailable.`),r(...T)},s,l);const v=()=>{const T=c.partialize({...s()});return x.setItem(c.name,{state:T,version:c.version})},S=l.setState;l.setState=(T,j)=>(S(T,j),v());const A=i((...T)=>(r(...T),v()),s,l);l.getInitialState=()=>A;let N;const _=()=>{var T,j;if(!x)return;const E=++d;u=!1,g.forEach(R=>{var O;return R((O=s())!=null?O:A)});const M=((j=c.onRehydrateStorage)==null?void 0:j.call(c,(T=s())!=null?T:A))||void 0;return mm(x.getItem.bind(x))(c.name).then(R=>{if(R)if(typeof R.version=="number"&&R.version!==c.version){if(c.migrate){const O=c.migrate(R.state,R.version);return O instanceof Promise?O.then(P=>[!0,P]):[!0,O]}console.error("State loaded from storage couldn't be migrated since no migrate function was provided")}else return[!1,R.state];return[!1,void 0]}).then(R=>{var O;if(E!==d)return;const[P,z]=R;if(N=c.merge(z,(O=s())!=null?O:A),r(N,!0),P)return v()}).then(()=>{E===d&&(M?.(N,void 0),N=s(),u=!0,m.forEach(R=>R(N)))}).catch(R=>{E===d&&M?.(void 0,R)})};return l.persist={setOptions:T=>{c={...c,...T},T.storage&&(x=T.storage)},clearStorage:()=>{x?.removeItem(c.name)},getOptions:()=>c,rehydrate:()=>_(),hasHydrated:()=>u,onHydrate:T=>(g.add(T),()=>{g.delete(T)}),onFinishHydration:T=>(m.add(T),()=>{m.delete(T)})},c.skipHydration||_(),N||A},Dj=Mj,wp="http://localhost:8000/api",Wa=zj()(Dj((i,n)=>({user:null,token:null,isAuthenticated:!1,login:async(r,s)=>{try{const l=new URLSearchParams;l.append("username",r),l.append("password",s);const c=await fetch(`${wp}/auth/login`,{method:"POST",headers:{"Content-Type":"application/x-www-form-urlencoded"},body:l});if(!c.ok)return{success:!1,error:(await c.json()).detail||"Login failed"};const u=await c.json(),d=await fetch(`${wp}/auth/me`,{headers:{Authorization:`Bearer ${u.access_token}`}});if(d.ok){const g=await d.json();return i({user:g,token:u.access_token,isAuthenticated:!0}),{success:!0}}return{success:!1,error:"Failed to get user info"}}catch{return{success:!1,error:"Network error"}}},register:async r=>{try{const s=await fetch(`${wp}/auth/register`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(r)});return s.ok?(await s.json(),await n().login(r.email,r.password)):{success:!1,error:(await s.json()).detail||"Registration failed"}}catch{return{success:!1,error:"Network error"}}},logout:()=>{i({user:null,token:null,isAuthenticated:!1})},setUser:(r,s)=>{i({user:r,token:s,isAuthenticated:!0})}}),{name:"auth-storage"}));function mn(i,n,{checkForDefaultPrevented:r=!0}={}){return function(l){if(i?.(l),r===!1||!l.defaultPrevented)return n?.(l)}}function ny(i,n){if(typeof i=="function")return i(n);i!=null&&(i.current=n)}function Ac(...i){return n=>{let r=!1;const s=i.map(l=>{const c=ny(l,n);return!r&&typeof c=="function"&&(r=!0),c});if(r)return()=>{for(let l=0;l<s.length;l++){const c=s[l];typeof c=="function"?c():ny(i[l],null)}}}}function bs(...i){return b.useCallback(Ac(...i),i)}function kj(i,n){const r=b.createContext(n),s=c=>{const{children:u,...d}=c,g=b.useMemo(()=>d,Object.values(d));return h.jsx(r.Provider,{value:g,children:u})};s.displayName=i+"Provider";function l(c){const u=b.useContext(r);if(u)return u;if(n!==void 0)return n;throw new Error(`\`${c}\` must be used within \`${i}\``)}return[s,l]}function Gf(i,n=[]){let r=[];function s(c,u){const d=b.createContext(u),g=r.length;r=[...r,u];const m=v=>{const{scope:S,children:A,...N}=v,_=S?.[i]?.[g]||d,T=b.useMemo(()=>N,Object.values(N));return h.jsx(_.Provider,{value:T,children:A})};m.displayName=c+"Provider";function x(v,S){const A=S?.[i]?.[g]||d,N=b.useContext(A);if(N)return N;if(u!==void 0)return u;throw new Error(`\`${v}\` must be used within \`${c}\``)}return[m,x]}const l=()=>{const c=r.map(u=>b.createContext(u));return function(d){const g=d?.[i]||c;return b.useMemo(()=>({[`__scope${i}`]:{...d,[i]:g}}),[d,g])}};return l.scopeName=i,[s,Oj(l,...n)]}function Oj(...i){const n=i[0];if(i.length===1)return n;const r=()=>{const s=i.map(l=>({useScope:l(),scopeName:l.scopeName}));return function(c){const u=s.reduce((d,{useScope:g,scopeName:m})=>{const v=g(c)[`__scope${m}`];return{...d,...v}},{});return b.useMemo(()=>({[`__scope${n.scopeName}`]:u}),[u])}};return r.scopeName=n.scopeName,r}var yc=globalThis?.document?b.useLayoutEffect:()=>{},Pj=_m[" useId ".trim().toString()]||(()=>{}),Lj=0;function ic(i){const[n,r]=b.useState(Pj());return yc(()=>{r(s=>s??String(Lj++))},[i]),i||(n?`radix-${n}`:"")}var Uj=_m[" useInsertionEffect ".trim().toString()]||yc;function rg({prop:i,defaultProp:n,onChange:r=()=>{},caller:s}){const[l,c,u]=Hj({defaultProp:n,onChange:r}),d=i!==void 0,g=d?i:l;{const x=b.useRef(i!==void 0);b.useEffect(()=>{const v=x.current;v!==d&&console.warn(`${s} is changing from ${v?"controlled":"uncontrolled"} to ${d?"controlled":"uncontrolled"}. Components should not switch from controlled to uncontrolled (or vice versa). Decide between using a controlled or uncontrolled value for the lifetime of the component.`),x.current=d},[d,s])}const m=b.useCallback(x=>{if(d){const v=Bj(x)?x(i):x;v!==i&&u.current?.(v)}else c(x)},[d,i,c,u]);return[g,m]}function Hj({defaultProp:i,onChange:n}){const[r,s]=b.useState(i),l=b.useRef(r),c=b.useRef(n);return Uj(()=>{c.current=n},[n]),b.useEffect(()=>{l.current!==r&&(c.current?.(r),l.current=r)},[r,l]),[r,s,c]}function Bj(i){return typeof i=="function"}function Fj(i){const n=Yj(i),r=b.forwardRef((s,l)=>{const{children:c,...u}=s,d=b.Children.toArray(c),g=d.find(Gj);if(g){const m=g.props.children,x=d.map(v=>v===g?b.Children.count(m)>1?b.Children.only(null):b.isValidElement(m)?m.props.children:null:v);return h.jsx(n,{...u,ref:l,children:b.isValidElement(m)?b.cloneElement(m,void 0,x):null})}return h.jsx(n,{...u,ref:l,children:c})});return r.displayName=`${i}.Slot`,r}function Yj(i){const n=b.forwardRef((r,s)=>{const{children:l,...c}=r;if(b.isValidElement(l)){const u=Xj(l),d=Vj(c,l.props);return l.type!==b.Fragment&&(d.ref=s?Ac(s,u):u),b.cloneElement(l,d)}return b.Children.count(l)>1?b.Children.only(null):null});return n.displayName=`${i}.SlotClone`,n}var qj=Symbol("radix.slottable");function Gj(i){return b.isValidElement(i)&&typeof i.type=="function"&&"__radixId"in i.type&&i.type.__radixId===qj}function Vj(i,n){const r={...n};for(const s in n){const l=i[s],c=n[s];/^on[A-Z]/.test(s)?l&&c?r[s]=(...d)=>{const g=c(...d);return l(...d),g}:l&&(r[s]=l):s==="style"?r[s]={...l,...c}:s==="className"&&(r[s]=[l,c].filter(Boolean).join(" "))}return{...i,...r}}function Xj(i){let n=Object.getOwnPropertyDescriptor(i.props,"ref")?.get,r=n&&"isReactWarning"in n&&n.isReactWarning;return r?i.ref:(n=Object.getOwnPropertyDescriptor(i,"ref")?.get,r=n&&"isReactWarning"in n&&n.isReactWarning,r?i.props.ref:i.props.ref||i.ref)}var Zj=["a","button","div","form","h2","h3","img","input","label","li","nav","ol","p","select","span","svg","ul"],Ln=Zj.reduce((i,n)=>{const r=Fj(`Primitive.${n}`),s=b.forwardRef((l,c)=>{const{asChild:u,...d}=l,g=u?r:n;return typeof window<"u"&&(window[Symbol.for("radix-ui")]=!0),h.jsx(g,{...d,ref:c})});return s.displayName=`Primitive.${n}`,{...i,[n]:s}},{});function Kj(i,n){i&&qy.flushSync(()=>i.dispatchEvent(n))}function Ll(i){const n=b.useRef(i);return b.useEffect(()=>{n.current=i}),b.useMemo(()=>(...r)=>n.current?.(...r),[])}function Qj(i,n=globalThis?.document){const r=Ll(i);b.useEffect(()=>{const s=l=>{l.key==="Escape"&&r(l)};return n.addEventListener("keydown",s,{capture:!0}),()=>n.removeEventListener("keydown",s,{capture:!0})},[r,n])}var $j="DismissableLayer",gm="dismissableLayer.update",Jj="dismissableLayer.pointerDownOutside",Ij="dismissableLayer.focusOutside",ay,v_=b.createContext({layers:new Set,layersWithOutsidePointerEventsDisabled:new Set,branches:new Set}),y_=b.forwardRef((i,n)=>{const{disableOutsidePointerEvents:r=!1,onEscapeKeyDown:s,onPointerDownOutside:l,onFocusOutside:c,onInteractOutside:u,onDismiss:d,...g}=i,m=b.useContext(v_),[x,v]=b.useState(null),S=x?.ownerDocument??globalThis?.document,[,A]=b.useState({}),N=bs(n,z=>v(z)),_=Array.from(m.layers),[T]=[...m.layersWithOutsidePointerEventsDisabled].slice(-1),j=_.indexOf(T),E=x?_.indexOf(x):-1,M=m.layersWithOutsidePointerEventsDisabled.size>0,R=E>=j,O=tE(z=>{const C=z.target,G=[...m.branches].some(W=>W.contains(C));!R||G||(l?.(z),u?.(z),z.defaultPrevented||d?.())},S),P=nE(z=>{const C=z.target;[...m.branches].some(W=>W.contains(C))||(c?.(z),u?.(z),z.defaultPrevented||d?.())},S);return Qj(z=>{E===m.layers.size-1&&(s?.(z),!z.defaultPrevented&&d&&(z.preventDefault(),d()))},S),b.useEffect(()=>{if(x)return r&&(m.layersWithOutsidePointerEventsDisabled.size===0&&(ay=S.body.style.pointerEvents,S.body.style.pointerEvents="none"),m.layersWithOutsidePointerEventsDisabled.add(x)),m.layers.add(x),sy(),()=>{r&&m.layersWithOutsidePointerEventsDisabled.size===1&&(S.body.style.pointerEvents=ay)}},[x,S,r,m]),b.useEffect(()=>()=>{x&&(m.layers.delete(x),m.layersWithOutsidePointerEventsDisabled.delete(x),sy())},[x,m]),b.useEffect(()=>{const z=()=>A({});return document.addEventListener(gm,z),()=>document.removeEventListener(gm,z)},[]),h.jsx(Ln.div,{...g,ref:N,style:{pointerEvents:M?R?"auto":"none":void 0,...i.style},onFocusCapture:mn(i.onFocusCapture,P.onFocusCapture),onBlurCapture:mn(i.onBlurCapture,P.onBlurCapture),onPointerDownCapture:mn(i.onPointerDownCapture,O.onPointerDownCapture)})});y_.displayName=$j;var Wj="DismissableLayerBranch",eE=b.forwardRef((i,n)=>{const r=b.useContext(v_),s=b.useRef(null),l=bs(n,s);return b.useEffect(()=>{const c=s.current;if(c)return r.branches.add(c),()=>{r.branches.delete(c)}},[r.branches]),h.jsx(Ln.div,{...i,ref:l})});eE.displayName=Wj;function tE(i,n=globalThis?.document){const r=Ll(i),s=b.useRef(!1),l=b.useRef(()=>{});return b.useEffect(()=>{const c=d=>{if(d.target&&!s.current){let g=function(){b_(Jj,r,m,{discrete:!0})};const m={originalEvent:d};d.pointerType==="touch"?(n.removeEventListener("click",l.current),l.current=g,n.addEventListener("click",l.current,{once:!0})):g()}else n.removeEventListener("click",l.current);s.current=!1},u=window.setTimeout(()=>{n.addEventListener("pointerdown",c)},0);return()=>{window.clearTimeout(u),n.removeEventListener("pointerdown",c),n.removeEventListener("click",l.current)}},[n,r]),{onPointerDownCapture:()=>s.current=!0}}function nE(i,n=globalThis?.document){const r=Ll(i),s=b.useRef(!1);return b.useEffect(()=>{const l=c=>{c.target&&!s.current&&b_(Ij,r,{originalEvent:c},{discrete:!1})};return n.addEventListener("focusin",l),()=>n.removeEventListener("focusin",l)},[n,r]),{onFocusCapture:()=>s.current=!0,onBlurCapture:()=>s.current=!1}}function sy(){const i=new CustomEvent(gm);document.dispatchEvent(i)}function b_(i,n,r,{discrete:s}){const l=r.originalEvent.target,c=new CustomEvent(i,{bubbles:!1,cancelable:!0,detail:r});n&&l.addEventListener(i,n,{once:!0}),s?Kj(l,c):l.dispatchEvent(c)}var Np="focusScope.autoFocusOnMount",jp="focusScope.autoFocusOnUnmount",ry={bubbles:!1,cancelable:!0},aE="FocusScope",__=b.forwardRef((i,n)=>{const{loop:r=!1,trapped:s=!1,onMountAutoFocus:l,onUnmountAutoFocus:c,...u}=i,[d,g]=b.useState(null),m=Ll(l),x=Ll(c),v=b.useRef(null),S=bs(n,_=>g(_)),A=b.useRef({paused:!1,pause(){this.paused=!0},resume(){this.paused=!1}}).current;b.useEffect(()=>{if(s){let _=function(M){if(A.paused||!d)return;const R=M.target;d.contains(R)?v.current=R:jr(v.current,{select:!0})},T=function(M){if(A.paused||!d)return;const R=M.relatedTarget;R!==null&&(d.contains(R)||jr(v.current,{select:!0}))},j=function(M){if(document.activeElement===document.body)for(const O of M)O.removedNodes.length>0&&jr(d)};document.addEventListener("focusin",_),document.addEventListener("focusout",T);const E=new MutationObserver(j);return d&&E.observe(d,{childList:!0,subtree:!0}),()=>{document.removeEventListener("focusin",_),document.removeEventListener("focusout",T),E.disconnect()}}},[s,d,A.paused]),b.useEffect(()=>{if(d){ly.add(A);const _=document.activeElement;if(!d.contains(_)){const j=new CustomEvent(Np,ry);d.addEventListener(Np,m),d.dispatchEvent(j),j.defaultPrevented||(sE(cE(S_(d)),{select:!0}),document.activeElement===_&&jr(d))}return()=>{d.removeEventListener(Np,m),setTimeout(()=>{const j=new CustomEvent(jp,ry);d.addEventListener(jp,x),d.dispatchEvent(j),j.defaultPrevented||jr(_??document.body,{select:!0}),d.removeEventListener(jp,x),ly.remove(A)},0)}}},[d,m,x,A]);const N=b.useCallback(_=>{if(!r&&!s||A.paused)return;const T=_.key==="Tab"&&!_.altKey&&!_.ctrlKey&&!_.metaKey,j=document.activeElement;if(T&&j){const E=_.currentTarget,[M,R]=rE(E);M&&R?!_.shiftKey&&j===R?(_.preventDefault(),r&&jr(M,{select:!0})):_.shiftKey&&j===M&&(_.preventDefault(),r&&jr(R,{select:!0})):j===E&&_.preventDefault()}},[r,s,A.paused]);return h.jsx(Ln.div,{tabIndex:-1,...u,ref:S,onKeyDown:N})});__.displayName=aE;function sE(i,{select:n=!1}={}){const r=document.activeElement;for(const s of i)if(jr(s,{select:n}),document.activeElement!==r)return}function rE(i){const n=S_(i),r=iy(n,i),s=iy(n.reverse(),i);return[r,s]}function S_(i){const n=[],r=document.createTreeWalker(i,NodeFilter.SHOW_ELEMENT,{acceptNode:s=>{const l=s.tagName==="INPUT"&&s.type==="hidden";return s.disabled||s.hidden||l?NodeFilter.FILTER_SKIP:s.tabIndex>=0?NodeFilter.FILTER_ACCEPT:NodeFilter.FILTER_SKIP}});for(;r.nextNode();)n.push(r.currentNode);return n}function iy(i,n){for(const r of i)if(!iE(r,{upTo:n}))return r}function iE(i,{upTo:n}){if(getComputedStyle(i).visibility==="hidden")return!0;for(;i;){if(n!==void 0&&i===n)return!1;if(getComputedStyle(i).display==="none")return!0;i=i.parentElement}return!1}function lE(i){return i instanceof HTMLInputElement&&"select"in i}function jr(i,{select:n=!1}={}){if(i&&i.focus){const r=document.activeElement;i.focus({preventScroll:!0}),i!==r&&lE(i)&&n&&i.select()}}var ly=oE();function oE(){let i=[];return{add(n){const r=i[0];n!==r&&r?.pause(),i=oy(i,n),i.unshift(n)},remove(n){i=oy(i,n),i[0]?.resume()}}}function oy(i,n){const r=[...i],s=r.indexOf(n);return s!==-1&&r.splice(s,1),r}function cE(i){return i.filter(n=>n.tagName!=="A")}var uE="Portal",A_=b.forwardRef((i,n)=>{const{container:r,...s}=i,[l,c]=b.useState(!1);yc(()=>c(!0),[]);const u=r||l&&globalThis?.document?.body;return u?wT.createPortal(h.jsx(Ln.div,{...s,ref:n}),u):null});A_.displayName=uE;function fE(i,n){return b.useReducer((r,s)=>n[r][s]??r,i)}var Tc=i=>{const{present:n,children:r}=i,s=dE(n),l=typeof r=="function"?r({present:s.isPresent}):b.Children.only(r),c=bs(s.ref,hE(l));return typeof r=="function"||s.isPresent?b.cloneElement(l,{ref:c}):null};Tc.displayName="Presence";function dE(i){const[n,r]=b.useState(),s=b.useRef(null),l=b.useRef(i),c=b.useRef("none"),u=i?"mounted":"unmounted",[d,g]=fE(u,{mounted:{UNMOUNT:"unmounted",ANIMATION_OUT:"unmountSuspended"},unmountSuspended:{MOUNT:"mounted",ANIMATION_END:"unmounted"},unmounted:{MOUNT:"mounted"}});return b.useEffect(()=>{const m=Iu(s.current);c.current=d==="mounted"?m:"none"},[d]),yc(()=>{const m=s.current,x=l.current;if(x!==i){const S=c.current,A=Iu(m);i?g("MOUNT"):A==="none"||m?.display==="none"?g("UNMOUNT"):g(x&&S!==A?"ANIMATION_OUT":"UNMOUNT"),l.current=i}},[i,g]),yc(()=>{if(n){let m;const x=n.ownerDocument.defaultView??window,v=A=>{const _=Iu(s.current).includes(CSS.escape(A.animationName));if(A.target===n&&_&&(g("ANIMATION_END"),!l.current)){const T=n.style.animationFillMode;n.style.animationFillMode="forwards",m=x.setTimeout(()=>{n.style.animationFillMode==="forwards"&&(n.style.animationFillMode=T)})}},S=A=>{A.target===n&&(c.current=Iu(s.current))};return n.addEventListener("animationstart",S),n.addEventListener("animationcancel",v),n.addEventListener("animationend",v),()=>{x.clearTimeout(m),n.removeEventListener("animationstart",S),n.removeEventListener("animationcancel",v),n.removeEventListener("animationend",v)}}else g("ANIMATION_END")},[n,g]),{isPresent:["mounted","unmountSuspended"].includes(d),ref:b.useCallback(m=>{s.current=m?getComputedStyle(m):null,r(m)},[])}}function Iu(i){return i?.animationName||"none"}function hE(i){let n=Object.getOwnPropertyDescriptor(i.props,"ref")?.get,r=n&&"isReactWarning"in n&&n.isReactWarning;return r?i.ref:(n=Object.getOwnPropertyDescriptor(i,"ref")?.get,r=n&&"isReactWarning"in n&&n.isReactWarning,r?i.props.ref:i.props.ref||i.ref)}var Ep=0;function pE(){b.useEffect(()=>{const i=document.querySelectorAll("[data-radix-focus-guard]");return document.body.insertAdjacentElement("afterbegin",i[0]??cy()),document.body.insertAdjacentElement("beforeend",i[1]??cy()),Ep++,()=>{Ep===1&&document.querySelectorAll("[data-radix-focus-guard]").forEach(n=>n.remove()),Ep--}},[])}function cy(){const i=document.createElement("span");return i.setAttribute("data-radix-focus-guard",""),i.tabIndex=0,i.style.outline="none",i.style.opacity="0",i.style.position="fixed",i.style.pointerEvents="none",i}var ms=function(){return ms=Object.assign||function(n){for(var r,s=1,l=arguments.length;s<l;s++){r=arguments[s];for(var c in r)Object.prototype.hasOwnProperty.call(r,c)&&(n[c]=r[c])}return n},ms.apply(this,arguments)};function T_(i,n){var r={};for(var s in i)Object.prototype.hasOwnProperty.call(i,s)&&n.indexOf(s)<0&&(r[s]=i[s]);if(i!=null&&typeof Object.getOwnPropertySymbols=="function")for(var l=0,s=Object.getOwnPropertySymbols(i);l<s.length;l++)n.indexOf(s[l])<0&&Object.prototype.propertyIsEnumerable.call(i,s[l])&&(r[s[l]]=i[s[l]]);return r}function mE(i,n,r){if(r||arguments.length===2)for(var s=0,l=n.length,c;s<l;s++)(c||!(s in n))&&(c||(c=Array.prototype.slice.call(n,0,s)),c[s]=n[s]);return i.concat(c||Array.prototype.slice.call(n))}var xf="right-scroll-bar-position",vf="width-before-scroll-bar",gE="with-scroll-bars-hidden",xE="--removed-body-scroll-bar-size";function Cp(i,n){return typeof i=="function"?i(n):i&&(i.current=n),i}function vE(i,n){var r=b.useState(function(){return{value:i,callback:n,facade:{get current(){return r.value},set current(s){var l=r.value;l!==s&&(r.value=s,r.callback(s,l))}}}})[0];return r.callback=n,r.facade}var yE=typeof window<"u"?b.useLayoutEffect:b.useEffect,uy=new WeakMap;function bE(i,n){var r=vE(null,function(s){return i.forEach(function(l){return Cp(l,s)})});return yE(function(){var s=uy.get(r);if(s){var l=new Set(s),c=new Set(i),u=r.current;l.forEach(function(d){c.has(d)||Cp(d,null)}),c.forEach(function(d){l.has(d)||Cp(d,u)})}uy.set(r,i)},[i]),r}function _E(i){return i}function SE(i,n){n===void 0&&(n=_E);var r=[],s=!1,l={read:function(){if(s)throw new Error("Sidecar: could not `read` from an `assigned` medium. `read` could be used only with `useMedium`.");return r.length?r[r.length-1]:i},useMedium:function(c){var u=n(c,s);return r.push(u),function(){r=r.filter(function(d){return d!==u})}},assignSyncMedium:function(c){for(s=!0;r.length;){var u=r;r=[],u.forEach(c)}r={push:function(d){return c(d)},filter:function(){return r}}},assignMedium:function(c){s=!0;var u=[];if(r.length){var d=r;r=[],d.forEach(c),u=r}var g=function(){var x=u;u=[],x.forEach(c)},m=function(){return Promise.resolve().then(g)};m(),r={push:function(x){u.push(x),m()},filter:function(x){return u=u.filter(x),r}}}};return l}function AE(i){i===void 0&&(i={});var n=SE(null);return n.options=ms({async:!0,ssr:!1},i),n}var w_=function(i){var n=i.sideCar,r=T_(i,["sideCar"]);if(!n)throw new Error("Sidecar: please provide `sideCar` property to import the right car");var s=n.read();if(!s)throw new Error("Sidecar medium not found");return b.createElement(s,ms({},r))};w_.isSideCarExport=!0;function TE(i,n){return i.useMedium(n),w_}var N_=AE(),zp=function(){},Vf=b.forwardRef(function(i,n){var r=b.useRef(null),s=b.useState({onScrollCapture:zp,onWheelCapture:zp,onTouchMoveCapture:zp}),l=s[0],c=s[1],u=i.forwardProps,d=i.children,g=i.className,m=i.removeScrollBar,x=i.enabled,v=i.shards,S=i.sideCar,A=i.noRelative,N=i.noIsolation,_=i.inert,T=i.allowPinchZoom,j=i.as,E=j===void 0?"div":j,M=i.gapMode,R=T_(i,["forwardProps","children","className","removeScrollBar","enabled","shards","sideCar","noRelative","noIsolation","inert","allowPinchZoom","as","gapMode"]),O=S,P=bE([r,n]),z=ms(ms({},R),l);return b.createElement(b.Fragment,null,x&&b.createElement(O,{sideCar:N_,removeScrollBar:m,shards:v,noRelative:A,noIsolation:N,inert:_,setCallbacks:c,allowPinchZoom:!!T,lockRef:r,gapMode:M}),u?b.cloneElement(b.Children.only(d),ms(ms({},z),{ref:P})):b.createElement(E,ms({},z,{className:g,ref:P}),d))});Vf.defaultProps={enabled:!0,removeScrollBar:!0,inert:!1};Vf.classNames={fullWidth:vf,zeroRight:xf};var wE=function(){if(typeof __webpack_nonce__<"u")return __webpack_nonce__};function NE(){if(!document)return null;var i=document.createElement("style");i.type="text/css";var n=wE();return n&&i.setAttribute("nonce",n),i}function jE(i,n){i.styleSheet?i.styleSheet.cssText=n:i.appendChild(document.createTextNode(n))}function EE(i){var n=document.head||document.getElementsByTagName("head")[0];n.appendChild(i)}var CE=function(){var i=0,n=null;return{add:function(r){i==0&&(n=NE())&&(jE(n,r),EE(n)),i++},remove:function(){i--,!i&&n&&(n.parentNode&&n.parentNode.removeChild(n),n=null)}}},zE=function(){var i=CE();return function(n,r){b.useEffect(function(){return i.add(n),function(){i.remove()}},[n&&r])}},j_=function(){var i=zE(),n=function(r){var s=r.styles,l=r.dynamic;return i(s,l),null};return n},RE={left:0,top:0,right:0,gap:0},Rp=function(i){return parseInt(i||"",10)||0},ME=function(i){var n=window.getComputedStyle(document.body),r=n[i==="padding"?"paddingLeft":"marginLeft"],s=n[i==="padding"?"paddingTop":"marginTop"],l=n[i==="padding"?"paddingRight":"marginRight"];return[Rp(r),Rp(s),Rp(l)]},DE=function(i){if(i===void 0&&(i="margin"),typeof window>"u")return RE;var n=ME(i),r=document.documentElement.clientWidth,s=window.innerWidth;return{left:n[0],top:n[1],right:n[2],gap:Math.max(0,s-r+n[2]-n[0])}},kE=j_(),Cl="data-scroll-locked",OE=function(i,n,r,s){var l=i.left,c=i.top,u=i.right,d=i.gap;return r===void 0&&(r="margin"),`
-  .`.concat(gE,` {
-   overflow: hidden `).concat(s,`;
-   padding-right: `).concat(d,"px ").concat(s,`;
-  }
-  body[`).concat(Cl,`] {
-    overflow: hidden `).concat(s,`;
-    overscroll-behavior: contain;
-    `).concat([n&&"position: relative ".concat(s,";"),r==="margin"&&`
-    padding-left: `.concat(l,`px;
-    padding-top: `).concat(c,`px;
-    padding-right: `).concat(u,`px;
-    margin-left:0;
-    margin-top:0;
-    margin-right: `).concat(d,"px ").concat(s,`;
-    `),r==="padding"&&"padding-right: ".concat(d,"px ").concat(s,";")].filter(Boolean).join(""),`
-  }
-  
-  .`).concat(xf,` {
-    right: `).concat(d,"px ").concat(s,`;
-  }
-  
-  .`).concat(vf,` {
-    margin-right: `).concat(d,"px ").concat(s,`;
-  }
-  
-  .`).concat(xf," .").concat(xf,` {
-    right: 0 `).concat(s,`;
-  }
-  
-  .`).concat(vf," .").concat(vf,` {
-    margin-right: 0 `).concat(s,`;
-  }
-  
-  body[`).concat(Cl,`] {
-    `).concat(xE,": ").concat(d,`px;
-  }
-`)},fy=function(){var i=parseInt(document.body.getAttribute(Cl)||"0",10);return isFinite(i)?i:0},PE=function(){b.useEffect(function(){return document.body.setAttribute(Cl,(fy()+1).toString()),function(){var i=fy()-1;i<=0?document.body.removeAttribute(Cl):document.body.setAttribute(Cl,i.toString())}},[])},LE=function(i){var n=i.noRelative,r=i.noImportant,s=i.gapMode,l=s===void 0?"margin":s;PE();var c=b.useMemo(function(){return DE(l)},[l]);return b.createElement(kE,{styles:OE(c,!n,l,r?"":"!important")})},xm=!1;if(typeof window<"u")try{var Wu=Object.defineProperty({},"passive",{get:function(){return xm=!0,!0}});window.addEventListener("test",Wu,Wu),window.removeEventListener("test",Wu,Wu)}catch{xm=!1}var hl=xm?{passive:!1}:!1,UE=function(i){return i.tagName==="TEXTAREA"},E_=function(i,n){if(!(i instanceof Element))return!1;var r=window.getComputedStyle(i);return r[n]!=="hidden"&&!(r.overflowY===r.overflowX&&!UE(i)&&r[n]==="visible")},HE=function(i){return E_(i,"overflowY")},BE=function(i){return E_(i,"overflowX")},dy=function(i,n){var r=n.ownerDocument,s=n;do{typeof ShadowRoot<"u"&&s instanceof ShadowRoot&&(s=s.host);var l=C_(i,s);if(l){var c=z_(i,s),u=c[1],d=c[2];if(u>d)return!0}s=s.parentNode}while(s&&s!==r.body);return!1},FE=function(i){var n=i.scrollTop,r=i.scrollHeight,s=i.clientHeight;return[n,r,s]},YE=function(i){var n=i.scrollLeft,r=i.scrollWidth,s=i.clientWidth;return[n,r,s]},C_=function(i,n){return i==="v"?HE(n):BE(n)},z_=function(i,n){return i==="v"?FE(n):YE(n)},qE=function(i,n){return i==="h"&&n==="rtl"?-1:1},GE=function(i,n,r,s,l){var c=qE(i,window.getComputedStyle(n).direction),u=c*s,d=r.target,g=n.contains(d),m=!1,x=u>0,v=0,S=0;do{if(!d)break;var A=z_(i,d),N=A[0],_=A[1],T=A[2],j=_-T-c*N;(N||j)&&C_(i,d)&&(v+=j,S+=N);var E=d.parentNode;d=E&&E.nodeType===Node.DOCUMENT_FRAGMENT_NODE?E.host:E}while(!g&&d!==document.body||g&&(n.contains(d)||n===d));return(x&&Math.abs(v)<1||!x&&Math.abs(S)<1)&&(m=!0),m},ef=function(i){return"changedTouches"in i?[i.changedTouches[0].clientX,i.changedTouches[0].clientY]:[0,0]},hy=function(i){return[i.deltaX,i.deltaY]},py=function(i){return i&&"current"in i?i.current:i},VE=function(i,n){return i[0]===n[0]&&i[1]===n[1]},XE=function(i){return`
-  .block-interactivity-`.concat(i,` {pointer-events: none;}
-  .allow-interactivity-`).concat(i,` {pointer-events: all;}
-`)},ZE=0,pl=[];function KE(i){var n=b.useRef([]),r=b.useRef([0,0]),s=b.useRef(),l=b.useState(ZE++)[0],c=b.useState(j_)[0],u=b.useRef(i);b.useEffect(function(){u.current=i},[i]),b.useEffect(function(){if(i.inert){document.body.classList.add("block-interactivity-".concat(l));var _=mE([i.lockRef.current],(i.shards||[]).map(py),!0).filter(Boolean);return _.forEach(function(T){return T.classList.add("allow-interactivity-".concat(l))}),function(){document.body.classList.remove("block-interactivity-".concat(l)),_.forEach(function(T){return T.classList.remove("allow-interactivity-".concat(l))})}}},[i.inert,i.lockRef.current,i.shards]);var d=b.useCallback(function(_,T){if("touches"in _&&_.touches.length===2||_.type==="wheel"&&_.ctrlKey)return!u.current.allowPinchZoom;var j=ef(_),E=r.current,M="deltaX"in _?_.deltaX:E[0]-j[0],R="deltaY"in _?_.deltaY:E[1]-j[1],O,P=_.target,z=Math.abs(M)>Math.abs(R)?"h":"v";if("touches"in _&&z==="h"&&P.type==="range")return!1;var C=window.getSelection(),G=C&&C.anchorNode,W=G?G===P||G.contains(P):!1;if(W)return!1;var re=dy(z,P);if(!re)return!0;if(re?O=z:(O=z==="v"?"h":"v",re=dy(z,P)),!re)return!1;if(!s.current&&"changedTouches"in _&&(M||R)&&(s.current=O),!O)return!0;var Z=s.current||O;return GE(Z,T,_,Z==="h"?M:R)},[]),g=b.useCallback(function(_){var T=_;if(!(!pl.length||pl[pl.length-1]!==c)){var j="deltaY"in T?hy(T):ef(T),E=n.current.filter(function(O){return O.name===T.type&&(O.target===T.target||T.target===O.shadowParent)&&VE(O.delta,j)})[0];if(E&&E.should){T.cancelable&&T.preventDefault();return}if(!E){var M=(u.current.shards||[]).map(py).filter(Boolean).filter(function(O){return O.contains(T.target)}),R=M.length>0?d(T,M[0]):!u.current.noIsolation;R&&T.cancelable&&T.preventDefault()}}},[]),m=b.useCallback(function(_,T,j,E){var M={name:_,delta:T,target:j,should:E,shadowParent:QE(j)};n.current.push(M),setTimeout(function(){n.current=n.current.filter(function(R){return R!==M})},1)},[]),x=b.useCallback(function(_){r.current=ef(_),s.current=void 0},[]),v=b.useCallback(function(_){m(_.type,hy(_),_.target,d(_,i.lockRef.current))},[]),S=b.useCallback(function(_){m(_.type,ef(_),_.target,d(_,i.lockRef.current))},[]);b.useEffect(function(){return pl.push(c),i.setCallbacks({onScrollCapture:v,onWheelCapture:v,onTouchMoveCapture:S}),document.addEventListener("wheel",g,hl),document.addEventListener("touchmove",g,hl),document.addEventListener("touchstart",x,hl),function(){pl=pl.filter(function(_){return _!==c}),document.removeEventListener("wheel",g,hl),document.removeEventListener("touchmove",g,hl),document.removeEventListener("touchstart",x,hl)}},[]);var A=i.removeScrollBar,N=i.inert;return b.createElement(b.Fragment,null,N?b.createElement(c,{styles:XE(l)}):null,A?b.createElement(LE,{noRelative:i.noRelative,gapMode:i.gapMode}):null)}function QE(i){for(var n=null;i!==null;)i instanceof ShadowRoot&&(n=i.host,i=i.host),i=i.parentNode;return n}const $E=TE(N_,KE);var R_=b.forwardRef(function(i,n){return b.createElement(Vf,ms({},i,{ref:n,sideCar:$E}))});R_.classNames=Vf.classNames;var JE=function(i){if(typeof document>"u")return null;var n=Array.isArray(i)?i[0]:i;return n.ownerDocument.body},ml=new WeakMap,tf=new WeakMap,nf={},Mp=0,M_=function(i){return i&&(i.host||M_(i.parentNode))},IE=function(i,n){return n.map(function(r){if(i.contains(r))return r;var s=M_(r);return s&&i.contains(s)?s:(console.error("aria-hidden",r,"in not contained inside",i,". Doing nothing"),null)}).filter(function(r){return!!r})},WE=function(i,n,r,s){var l=IE(n,Array.isArray(i)?i:[i]);nf[r]||(nf[r]=new WeakMap);var c=nf[r],u=[],d=new Set,g=new Set(l),m=function(v){!v||d.has(v)||(d.add(v),m(v.parentNode))};l.forEach(m);var x=function(v){!v||g.has(v)||Array.prototype.forEach.call(v.children,function(S){if(d.has(S))x(S);else try{var A=S.getAttribute(s),N=A!==null&&A!=="false",_=(ml.get(S)||0)+1,T=(c.get(S)||0)+1;ml.set(S,_),c.set(S,T),u.push(S),_===1&&N&&tf.set(S,!0),T===1&&S.setAttribute(r,"true"),N||S.setAttribute(s,"true")}catch(j){console.error("aria-hidden: cannot operate on ",S,j)}})};return x(n),d.clear(),Mp++,function(){u.forEach(function(v){var S=ml.get(v)-1,A=c.get(v)-1;ml.set(v,S),c.set(v,A),S||(tf.has(v)||v.removeAttribute(s),tf.delete(v)),A||v.removeAttribute(r)}),Mp--,Mp||(ml=new WeakMap,ml=new WeakMap,tf=new WeakMap,nf={})}},eC=function(i,n,r){r===void 0&&(r="data-aria-hidden");var s=Array.from(Array.isArray(i)?i:[i]),l=JE(i);return l?(s.push.apply(s,Array.from(l.querySelectorAll("[aria-live], script"))),WE(s,l,r,"aria-hidden")):function(){return null}};function tC(i){const n=nC(i),r=b.forwardRef((s,l)=>{const{children:c,...u}=s,d=b.Children.toArray(c),g=d.find(sC);if(g){const m=g.props.children,x=d.map(v=>v===g?b.Children.count(m)>1?b.Children.only(null):b.isValidElement(m)?m.props.children:null:v);return h.jsx(n,{...u,ref:l,children:b.isValidElement(m)?b.cloneElement(m,void 0,x):null})}return h.jsx(n,{...u,ref:l,children:c})});return r.displayName=`${i}.Slot`,r}function nC(i){const n=b.forwardRef((r,s)=>{const{children:l,...c}=r;if(b.isValidElement(l)){const u=iC(l),d=rC(c,l.props);return l.type!==b.Fragment&&(d.ref=s?Ac(s,u):u),b.cloneElement(l,d)}return b.Children.count(l)>1?b.Children.only(null):null});return n.displayName=`${i}.SlotClone`,n}var aC=Symbol("radix.slottable");function sC(i){return b.isValidElement(i)&&typeof i.type=="function"&&"__radixId"in i.type&&i.type.__radixId===aC}function rC(i,n){const r={...n};for(const s in n){const l=i[s],c=n[s];/^on[A-Z]/.test(s)?l&&c?r[s]=(...d)=>{const g=c(...d);return l(...d),g}:l&&(r[s]=l):s==="style"?r[s]={...l,...c}:s==="className"&&(r[s]=[l,c].filter(Boolean).join(" "))}return{...i,...r}}function iC(i){let n=Object.getOwnPropertyDescriptor(i.props,"ref")?.get,r=n&&"isReactWarning"in n&&n.isReactWarning;return r?i.ref:(n=Object.getOwnPropertyDescriptor(i,"ref")?.get,r=n&&"isReactWarning"in n&&n.isReactWarning,r?i.props.ref:i.props.ref||i.ref)}var Xf="Dialog",[D_]=Gf(Xf),[lC,es]=D_(Xf),k_=i=>{const{__scopeDialog:n,children:r,open:s,defaultOpen:l,onOpenChange:c,modal:u=!0}=i,d=b.useRef(null),g=b.useRef(null),[m,x]=rg({prop:s,defaultProp:l??!1,onChange:c,caller:Xf});return h.jsx(lC,{scope:n,triggerRef:d,contentRef:g,contentId:ic(),titleId:ic(),descriptionId:ic(),open:m,onOpenChange:x,onOpenToggle:b.useCallback(()=>x(v=>!v),[x]),modal:u,children:r})};k_.displayName=Xf;var O_="DialogTrigger",oC=b.forwardRef((i,n)=>{const{__scopeDialog:r,...s}=i,l=es(O_,r),c=bs(n,l.triggerRef);return h.jsx(Ln.button,{type:"button","aria-haspopup":"dialog","aria-expanded":l.open,"aria-controls":l.contentId,"data-state":og(l.open),...s,ref:c,onClick:mn(i.onClick,l.onOpenToggle)})});oC.displayName=O_;var ig="DialogPortal",[cC,P_]=D_(ig,{forceMount:void 0}),L_=i=>{const{__scopeDialog:n,forceMount:r,children:s,container:l}=i,c=es(ig,n);return h.jsx(cC,{scope:n,forceMount:r,children:b.Children.map(s,u=>h.jsx(Tc,{present:r||c.open,children:h.jsx(A_,{asChild:!0,container:l,children:u})}))})};L_.displayName=ig;var Mf="DialogOverlay",U_=b.forwardRef((i,n)=>{const r=P_(Mf,i.__scopeDialog),{forceMount:s=r.forceMount,...l}=i,c=es(Mf,i.__scopeDialog);return c.modal?h.jsx(Tc,{present:s||c.open,children:h.jsx(fC,{...l,ref:n})}):null});U_.displayName=Mf;var uC=tC("DialogOverlay.RemoveScroll"),fC=b.forwardRef((i,n)=>{const{__scopeDialog:r,...s}=i,l=es(Mf,r);return h.jsx(R_,{as:uC,allowPinchZoom:!0,shards:[l.contentRef],children:h.jsx(Ln.div,{"data-state":og(l.open),...s,ref:n,style:{pointerEvents:"auto",...s.style}})})}),wi="DialogContent",H_=b.forwardRef((i,n)=>{const r=P_(wi,i.__scopeDialog),{forceMount:s=r.forceMount,...l}=i,c=es(wi,i.__scopeDialog);return h.jsx(Tc,{present:s||c.open,children:c.modal?h.jsx(dC,{...l,ref:n}):h.jsx(hC,{...l,ref:n})})});H_.displayName=wi;var dC=b.forwardRef((i,n)=>{const r=es(wi,i.__scopeDialog),s=b.useRef(null),l=bs(n,r.contentRef,s);return b.useEffect(()=>{const c=s.current;if(c)return eC(c)},[]),h.jsx(B_,{...i,ref:l,trapFocus:r.open,disableOutsidePointerEvents:!0,onCloseAutoFocus:mn(i.onCloseAutoFocus,c=>{c.preventDefault(),r.triggerRef.current?.focus()}),onPointerDownOutside:mn(i.onPointerDownOutside,c=>{const u=c.detail.originalEvent,d=u.button===0&&u.ctrlKey===!0;(u.button===2||d)&&c.preventDefault()}),onFocusOutside:mn(i.onFocusOutside,c=>c.preventDefault())})}),hC=b.forwardRef((i,n)=>{const r=es(wi,i.__scopeDialog),s=b.useRef(!1),l=b.useRef(!1);return h.jsx(B_,{...i,ref:n,trapFocus:!1,disableOutsidePointerEvents:!1,onCloseAutoFocus:c=>{i.onCloseAutoFocus?.(c),c.defaultPrevented||(s.current||r.triggerRef.current?.focus(),c.preventDefault()),s.current=!1,l.current=!1},onInteractOutside:c=>{i.onInteractOutside?.(c),c.defaultPrevented||(s.current=!0,c.detail.originalEvent.type==="pointerdown"&&(l.current=!0));const u=c.target;r.triggerRef.current?.contains(u)&&c.preventDefault(),c.detail.originalEvent.type==="focusin"&&l.current&&c.preventDefault()}})}),B_=b.forwardRef((i,n)=>{const{__scopeDialog:r,trapFocus:s,onOpenAutoFocus:l,onCloseAutoFocus:c,...u}=i,d=es(wi,r),g=b.useRef(null),m=bs(n,g);return pE(),h.jsxs(h.Fragment,{children:[h.jsx(__,{asChild:!0,loop:!0,trapped:s,onMountAutoFocus:l,onUnmountAutoFocus:c,children:h.jsx(y_,{role:"dialog",id:d.contentId,"aria-describedby":d.descriptionId,"aria-labelledby":d.titleId,"data-state":og(d.open),...u,ref:m,onDismiss:()=>d.onOpenChange(!1)})}),h.jsxs(h.Fragment,{children:[h.jsx(mC,{titleId:d.titleId}),h.jsx(xC,{contentRef:g,descriptionId:d.descriptionId})]})]})}),lg="DialogTitle",F_=b.forwardRef((i,n)=>{const{__scopeDialog:r,...s}=i,l=es(lg,r);return h.jsx(Ln.h2,{id:l.titleId,...s,ref:n})});F_.displayName=lg;var Y_="DialogDescription",pC=b.forwardRef((i,n)=>{const{__scopeDialog:r,...s}=i,l=es(Y_,r);return h.jsx(Ln.p,{id:l.descriptionId,...s,ref:n})});pC.displayName=Y_;var q_="DialogClose",G_=b.forwardRef((i,n)=>{const{__scopeDialog:r,...s}=i,l=es(q_,r);return h.jsx(Ln.button,{type:"button",...s,ref:n,onClick:mn(i.onClick,()=>l.onOpenChange(!1))})});G_.displayName=q_;function og(i){return i?"open":"closed"}var V_="DialogTitleWarning",[A5,X_]=kj(V_,{contentName:wi,titleName:lg,docsSlug:"dialog"}),mC=({titleId:i})=>{const n=X_(V_),r=`\`${n.contentName}\` requires a \`${n.titleName}\` for the component to be accessible for screen reader users.
-
-If you want to hide the \`${n.titleName}\`, you can wrap it with our VisuallyHidden component.
-
-For more information, see https://radix-ui.com/primitives/docs/components/${n.docsSlug}`;return b.useEffect(()=>{i&&(document.getElementById(i)||console.error(r))},[r,i]),null},gC="DialogDescriptionWarning",xC=({contentRef:i,descriptionId:n})=>{const s=`Warning: Missing \`Description\` or \`aria-describedby={undefined}\` for {${X_(gC).contentName}}.`;return b.useEffect(()=>{const l=i.current?.getAttribute("aria-describedby");n&&l&&(document.getElementById(n)||console.warn(s))},[s,i,n]),null},vC=k_,yC=L_,bC=U_,_C=H_,SC=F_,AC=G_;function Z_(i){var n,r,s="";if(typeof i=="string"||typeof i=="number")s+=i;else if(typeof i=="object")if(Array.isArray(i)){var l=i.length;for(n=0;n<l;n++)i[n]&&(r=Z_(i[n]))&&(s&&(s+=" "),s+=r)}else for(r in i)i[r]&&(s&&(s+=" "),s+=r);return s}function K_(){for(var i,n,r=0,s="",l=arguments.length;r<l;r++)(i=arguments[r])&&(n=Z_(i))&&(s&&(s+=" "),s+=n);return s}const TC=(i,n)=>{const r=new Array(i.length+n.length);for(let s=0;s<i.length;s++)r[s]=i[s];for(let s=0;s<n.length;s++)r[i.length+s]=n[s];return r},wC=(i,n)=>({classGroupId:i,validator:n}),Q_=(i=new Map,n=null,r)=>({nextPart:i,validators:n,classGroupId:r}),Df="-",my=[],NC="arbitrary..",jC=i=>{const n=CC(i),{conflictingClassGroups:r,conflictingClassGroupModifiers:s}=i;return{getClassGroupId:u=>{if(u.startsWith("[")&&u.endsWith("]"))return EC(u);const d=u.split(Df),g=d[0]===""&&d.length>1?1:0;return $_(d,g,n)},getConflictingClassGroupIds:(u,d)=>{if(d){const g=s[u],m=r[u];return g?m?TC(m,g):g:m||my}return r[u]||my}}},$_=(i,n,r)=>{if(i.length-n===0)return r.classGroupId;const l=i[n],c=r.nextPart.get(l);if(c){const m=$_(i,n+1,c);if(m)return m}const u=r.validators;if(u===null)return;const d=n===0?i.join(Df):i.slice(n).join(Df),g=u.length;for(let m=0;m<g;m++){const x=u[m];if(x.validator(d))return x.classGroupId}},EC=i=>i.slice(1,-1).indexOf(":")===-1?void 0:(()=>{const n=i.slice(1,-1),r=n.indexOf(":"),s=n.slice(0,r);return s?NC+s:void 0})(),CC=i=>{const{theme:n,classGroups:r}=i;return zC(r,n)},zC=(i,n)=>{const r=Q_();for(const s in i){const l=i[s];cg(l,r,s,n)}return r},cg=(i,n,r,s)=>{const l=i.length;for(let c=0;c<l;c++){const u=i[c];RC(u,n,r,s)}},RC=(i,n,r,s)=>{if(typeof i=="string"){MC(i,n,r);return}if(typeof i=="function"){DC(i,n,r,s);return}kC(i,n,r,s)},MC=(i,n,r)=>{const s=i===""?n:J_(n,i);s.classGroupId=r},DC=(i,n,r,s)=>{if(OC(i)){cg(i(s),n,r,s);return}n.validators===null&&(n.validators=[]),n.validators.push(wC(r,i))},kC=(i,n,r,s)=>{const l=Object.entries(i),c=l.length;for(let u=0;u<c;u++){const[d,g]=l[u];cg(g,J_(n,d),r,s)}},J_=(i,n)=>{let r=i;const s=n.split(Df),l=s.length;for(let c=0;c<l;c++){const u=s[c];let d=r.nextPart.get(u);d||(d=Q_(),r.nextPart.set(u,d)),r=d}return r},OC=i=>"isThemeGetter"in i&&i.isThemeGetter===!0,PC=i=>{if(i<1)return{get:()=>{},set:()=>{}};let n=0,r=Object.create(null),s=Object.create(null);const l=(c,u)=>{r[c]=u,n++,n>i&&(n=0,s=r,r=Object.create(null))};return{get(c){let u=r[c];if(u!==void 0)return u;if((u=s[c])!==void 0)return l(c,u),u},set(c,u){c in r?r[c]=u:l(c,u)}}},vm="!",gy=":",LC=[],xy=(i,n,r,s,l)=>({modifiers:i,hasImportantModifier:n,baseClassName:r,maybePostfixModifierPosition:s,isExternal:l}),UC=i=>{const{prefix:n,experimentalParseClassName:r}=i;let s=l=>{const c=[];let u=0,d=0,g=0,m;const x=l.length;for(let _=0;_<x;_++){const T=l[_];if(u===0&&d===0){if(T===gy){c.push(l.slice(g,_)),g=_+1;continue}if(T==="/"){m=_;continue}}T==="["?u++:T==="]"?u--:T==="("?d++:T===")"&&d--}const v=c.length===0?l:l.slice(g);let S=v,A=!1;v.endsWith(vm)?(S=v.slice(0,-1),A=!0):v.startsWith(vm)&&(S=v.slice(1),A=!0);const N=m&&m>g?m-g:void 0;return xy(c,A,S,N)};if(n){const l=n+gy,c=s;s=u=>u.startsWith(l)?c(u.slice(l.length)):xy(LC,!1,u,void 0,!0)}if(r){const l=s;s=c=>r({className:c,parseClassName:l})}return s},HC=i=>{const n=new Map;return i.orderSensitiveModifiers.forEach((r,s)=>{n.set(r,1e6+s)}),r=>{const s=[];let l=[];for(let c=0;c<r.length;c++){const u=r[c],d=u[0]==="[",g=n.has(u);d||g?(l.length>0&&(l.sort(),s.push(...l),l=[]),s.push(u)):l.push(u)}return l.length>0&&(l.sort(),s.push(...l)),s}},BC=i=>({cache:PC(i.cacheSize),parseClassName:UC(i),sortModifiers:HC(i),...jC(i)}),FC=/\s+/,YC=(i,n)=>{const{parseClassName:r,getClassGroupId:s,getConflictingClassGroupIds:l,sortModifiers:c}=n,u=[],d=i.trim().split(FC);let g="";for(let m=d.length-1;m>=0;m-=1){const x=d[m],{isExternal:v,modifiers:S,hasImportantModifier:A,baseClassName:N,maybePostfixModifierPosition:_}=r(x);if(v){g=x+(g.length>0?" "+g:g);continue}let T=!!_,j=s(T?N.substring(0,_):N);if(!j){if(!T){g=x+(g.length>0?" "+g:g);continue}if(j=s(N),!j){g=x+(g.length>0?" "+g:g);continue}T=!1}const E=S.length===0?"":S.length===1?S[0]:c(S).join(":"),M=A?E+vm:E,R=M+j;if(u.indexOf(R)>-1)continue;u.push(R);const O=l(j,T);for(let P=0;P<O.length;++P){const z=O[P];u.push(M+z)}g=x+(g.length>0?" "+g:g)}return g},qC=(...i)=>{let n=0,r,s,l="";for(;n<i.length;)(r=i[n++])&&(s=I_(r))&&(l&&(l+=" "),l+=s);return l},I_=i=>{if(typeof i=="string")return i;let n,r="";for(let s=0;s<i.length;s++)i[s]&&(n=I_(i[s]))&&(r&&(r+=" "),r+=n);return r},GC=(i,...n)=>{let r,s,l,c;const u=g=>{const m=n.reduce((x,v)=>v(x),i());return r=BC(m),s=r.cache.get,l=r.cache.set,c=d,d(g)},d=g=>{const m=s(g);if(m)return m;const x=YC(g,r);return l(g,x),x};return c=u,(...g)=>c(qC(...g))},VC=[],Wt=i=>{const n=r=>r[i]||VC;return n.isThemeGetter=!0,n},W_=/^\[(?:(\w[\w-]*):)?(.+)\]$/i,e2=/^\((?:(\w[\w-]*):)?(.+)\)$/i,XC=/^\d+\/\d+$/,ZC=/^(\d+(\.\d+)?)?(xs|sm|md|lg|xl)$/,KC=/\d+(%|px|r?em|[sdl]?v([hwib]|min|max)|pt|pc|in|cm|mm|cap|ch|ex|r?lh|cq(w|h|i|b|min|max))|\b(calc|min|max|clamp)\(.+\)|^0$/,QC=/^(rgba?|hsla?|hwb|(ok)?(lab|lch)|color-mix)\(.+\)$/,$C=/^(inset_)?-?((\d+)?\.?(\d+)[a-z]+|0)_-?((\d+)?\.?(\d+)[a-z]+|0)/,JC=/^(url|image|image-set|cross-fade|element|(repeating-)?(linear|radial|conic)-gradient)\(.+\)$/,gl=i=>XC.test(i),De=i=>!!i&&!Number.isNaN(Number(i)),wr=i=>!!i&&Number.isInteger(Number(i)),Dp=i=>i.endsWith("%")&&De(i.slice(0,-1)),Ys=i=>ZC.test(i),IC=()=>!0,WC=i=>KC.test(i)&&!QC.test(i),t2=()=>!1,e4=i=>$C.test(i),t4=i=>JC.test(i),n4=i=>!de(i)&&!he(i),a4=i=>ql(i,s2,t2),de=i=>W_.test(i),oi=i=>ql(i,r2,WC),kp=i=>ql(i,o4,De),vy=i=>ql(i,n2,t2),s4=i=>ql(i,a2,t4),af=i=>ql(i,i2,e4),he=i=>e2.test(i),Ho=i=>Gl(i,r2),r4=i=>Gl(i,c4),yy=i=>Gl(i,n2),i4=i=>Gl(i,s2),l4=i=>Gl(i,a2),sf=i=>Gl(i,i2,!0),ql=(i,n,r)=>{const s=W_.exec(i);return s?s[1]?n(s[1]):r(s[2]):!1},Gl=(i,n,r=!1)=>{const s=e2.exec(i);return s?s[1]?n(s[1]):r:!1},n2=i=>i==="position"||i==="percentage",a2=i=>i==="image"||i==="url",s2=i=>i==="length"||i==="size"||i==="bg-size",r2=i=>i==="length",o4=i=>i==="number",c4=i=>i==="family-name",i2=i=>i==="shadow",u4=()=>{const i=Wt("color"),n=Wt("font"),r=Wt("text"),s=Wt("font-weight"),l=Wt("tracking"),c=Wt("leading"),u=Wt("breakpoint"),d=Wt("container"),g=Wt("spacing"),m=Wt("radius"),x=Wt("shadow"),v=Wt("inset-shadow"),S=Wt("text-shadow"),A=Wt("drop-shadow"),N=Wt("blur"),_=Wt("perspective"),T=Wt("aspect"),j=Wt("ease"),E=Wt("animate"),M=()=>["auto","avoid","all","avoid-page","page","left","right","column"],R=()=>["center","top","bottom","left","right","top-left","left-top","top-right","right-top","bottom-right","right-bottom","bottom-left","left-bottom"],O=()=>[...R(),he,de],P=()=>["auto","hidden","clip","visible","scroll"],z=()=>["auto","contain","none"],C=()=>[he,de,g],G=()=>[gl,"full","auto",...C()],W=()=>[wr,"none","subgrid",he,de],re=()=>["auto",{span:["full",wr,he,de]},wr,he,de],Z=()=>[wr,"auto",he,de],se=()=>["auto","min","max","fr",he,de],le=()=>["start","end","center","between","around","evenly","stretch","baseline","center-safe","end-safe"],Q=()=>["start","end","center","stretch","center-safe","end-safe"],H=()=>["auto",...C()],K=()=>[gl,"auto","full","dvw","dvh","lvw","lvh","svw","svh","min","max","fit",...C()],J=()=>[i,he,de],me=()=>[...R(),yy,vy,{position:[he,de]}],U=()=>["no-repeat",{repeat:["","x","y","space","round"]}],k=()=>["auto","cover","contain",i4,a4,{size:[he,de]}],I=()=>[Dp,Ho,oi],F=()=>["","none","full",m,he,de],ae=()=>["",De,Ho,oi],ce=()=>["solid","dashed","dotted","double"],ge=()=>["normal","multiply","screen","overlay","darken","lighten","color-dodge","color-burn","hard-light","soft-light","difference","exclusion","hue","saturation","color","luminosity"],oe=()=>[De,Dp,yy,vy],Ke=()=>["","none",N,he,de],Ne=()=>["none",De,he,de],$t=()=>["none",De,he,de],xt=()=>[De,he,de],vt=()=>[gl,"full",...C()];return{cacheSize:500,theme:{animate:["spin","ping","pulse","bounce"],aspect:["video"],blur:[Ys],breakpoint:[Ys],color:[IC],container:[Ys],"drop-shadow":[Ys],ease:["in","out","in-out"],font:[n4],"font-weight":["thin","extralight","light","normal","medium","semibold","bold","extrabold","black"],"inset-shadow":[Ys],leading:["none","tight","snug","normal","relaxed","loose"],perspective:["dramatic","near","normal","midrange","distant","none"],radius:[Ys],shadow:[Ys],spacing:["px",De],text:[Ys],"text-shadow":[Ys],tracking:["tighter","tight","normal","wide","wider","widest"]},classGroups:{aspect:[{aspect:["auto","square",gl,de,he,T]}],container:["container"],columns:[{columns:[De,de,he,d]}],"break-after":[{"break-after":M()}],"break-before":[{"break-before":M()}],"break-inside":[{"break-inside":["auto","avoid","avoid-page","avoid-column"]}],"box-decoration":[{"box-decoration":["slice","clone"]}],box:[{box:["border","content"]}],display:["block","inline-block","inline","flex","inline-flex","table","inline-table","table-caption","table-cell","table-column","table-column-group","table-footer-group","table-header-group","table-row-group","table-row","flow-root","grid","inline-grid","contents","list-item","hidden"],sr:["sr-only","not-sr-only"],float:[{float:["right","left","none","start","end"]}],clear:[{clear:["left","right","both","none","start","end"]}],isolation:["isolate","isolation-auto"],"object-fit":[{object:["contain","cover","fill","none","scale-down"]}],"object-position":[{object:O()}],overflow:[{overflow:P()}],"overflow-x":[{"overflow-x":P()}],"overflow-y":[{"overflow-y":P()}],overscroll:[{overscroll:z()}],"overscroll-x":[{"overscroll-x":z()}],"overscroll-y":[{"overscroll-y":z()}],position:["static","fixed","absolute","relative","sticky"],inset:[{inset:G()}],"inset-x":[{"inset-x":G()}],"inset-y":[{"inset-y":G()}],start:[{start:G()}],end:[{end:G()}],top:[{top:G()}],right:[{right:G()}],bottom:[{bottom:G()}],left:[{left:G()}],visibility:["visible","invisible","collapse"],z:[{z:[wr,"auto",he,de]}],basis:[{basis:[gl,"full","auto",d,...C()]}],"flex-direction":[{flex:["row","row-reverse","col","col-reverse"]}],"flex-wrap":[{flex:["nowrap","wrap","wrap-reverse"]}],flex:[{flex:[De,gl,"auto","initial","none",de]}],grow:[{grow:["",De,he,de]}],shrink:[{shrink:["",De,he,de]}],order:[{order:[wr,"first","last","none",he,de]}],"grid-cols":[{"grid-cols":W()}],"col-start-end":[{col:re()}],"col-start":[{"col-start":Z()}],"col-end":[{"col-end":Z()}],"grid-rows":[{"grid-rows":W()}],"row-start-end":[{row:re()}],"row-start":[{"row-start":Z()}],"row-end":[{"row-end":Z()}],"grid-flow":[{"grid-flow":["row","col","dense","row-dense","col-dense"]}],"auto-cols":[{"auto-cols":se()}],"auto-rows":[{"auto-rows":se()}],gap:[{gap:C()}],"gap-x":[{"gap-x":C()}],"gap-y":[{"gap-y":C()}],"justify-content":[{justify:[...le(),"normal"]}],"justify-items":[{"justify-items":[...Q(),"normal"]}],"justify-self":[{"justify-self":["auto",...Q()]}],"align-content":[{content:["normal",...le()]}],"align-items":[{items:[...Q(),{baseline:["","last"]}]}],"align-self":[{self:["auto",...Q(),{baseline:["","last"]}]}],"place-content":[{"place-content":le()}],"place-items":[{"place-items":[...Q(),"baseline"]}],"place-self":[{"place-self":["auto",...Q()]}],p:[{p:C()}],px:[{px:C()}],py:[{py:C()}],ps:[{ps:C()}],pe:[{pe:C()}],pt:[{pt:C()}],pr:[{pr:C()}],pb:[{pb:C()}],pl:[{pl:C()}],m:[{m:H()}],mx:[{mx:H()}],my:[{my:H()}],ms:[{ms:H()}],me:[{me:H()}],mt:[{mt:H()}],mr:[{mr:H()}],mb:[{mb:H()}],ml:[{ml:H()}],"space-x":[{"space-x":C()}],"space-x-reverse":["space-x-reverse"],"space-y":[{"space-y":C()}],"space-y-reverse":["space-y-reverse"],size:[{size:K()}],w:[{w:[d,"screen",...K()]}],"min-w":[{"min-w":[d,"screen","none",...K()]}],"max-w":[{"max-w":[d,"screen","none","prose",{screen:[u]},...K()]}],h:[{h:["screen","lh",...K()]}],"min-h":[{"min-h":["screen","lh","none",...K()]}],"max-h":[{"max-h":["screen","lh",...K()]}],"font-size":[{text:["base",r,Ho,oi]}],"font-smoothing":["antialiased","subpixel-antialiased"],"font-style":["italic","not-italic"],"font-weight":[{font:[s,he,kp]}],"font-stretch":[{"font-stretch":["ultra-condensed","extra-condensed","condensed","semi-condensed","normal","semi-expanded","expanded","extra-expanded","ultra-expanded",Dp,de]}],"font-family":[{font:[r4,de,n]}],"fvn-normal":["normal-nums"],"fvn-ordinal":["ordinal"],"fvn-slashed-zero":["slashed-zero"],"fvn-figure":["lining-nums","oldstyle-nums"],"fvn-spacing":["proportional-nums","tabular-nums"],"fvn-fraction":["diagonal-fractions","stacked-fractions"],tracking:[{tracking:[l,he,de]}],"line-clamp":[{"line-clamp":[De,"none",he,kp]}],leading:[{leading:[c,...C()]}],"list-image":[{"list-image":["none",he,de]}],"list-style-position":[{list:["inside","outside"]}],"list-style-type":[{list:["disc","decimal","none",he,de]}],"text-alignment":[{text:["left","center","right","justify","start","end"]}],"placeholder-color":[{placeholder:J()}],"text-color":[{text:J()}],"text-decoration":["underline","overline","line-through","no-underline"],"text-decoration-style":[{decoration:[...ce(),"wavy"]}],"text-decoration-thickness":[{decoration:[De,"from-font","auto",he,oi]}],"text-decoration-color":[{decoration:J()}],"underline-offset":[{"underline-offset":[De,"auto",he,de]}],"text-transform":["uppercase","lowercase","capitalize","normal-case"],"text-overflow":["truncate","text-ellipsis","text-clip"],"text-wrap":[{text:["wrap","nowrap","balance","pretty"]}],indent:[{indent:C()}],"vertical-align":[{align:["baseline","top","middle","bottom","text-top","text-bottom","sub","super",he,de]}],whitespace:[{whitespace:["normal","nowrap","pre","pre-line","pre-wrap","break-spaces"]}],break:[{break:["normal","words","all","keep"]}],wrap:[{wrap:["break-word","anywhere","normal"]}],hyphens:[{hyphens:["none","manual","auto"]}],content:[{content:["none",he,de]}],"bg-attachment":[{bg:["fixed","local","scroll"]}],"bg-clip":[{"bg-clip":["border","padding","content","text"]}],"bg-origin":[{"bg-origin":["border","padding","content"]}],"bg-position":[{bg:me()}],"bg-repeat":[{bg:U()}],"bg-size":[{bg:k()}],"bg-image":[{bg:["none",{linear:[{to:["t","tr","r","br","b","bl","l","tl"]},wr,he,de],radial:["",he,de],conic:[wr,he,de]},l4,s4]}],"bg-color":[{bg:J()}],"gradient-from-pos":[{from:I()}],"gradient-via-pos":[{via:I()}],"gradient-to-pos":[{to:I()}],"gradient-from":[{from:J()}],"gradient-via":[{via:J()}],"gradient-to":[{to:J()}],rounded:[{rounded:F()}],"rounded-s":[{"rounded-s":F()}],"rounded-e":[{"rounded-e":F()}],"rounded-t":[{"rounded-t":F()}],"rounded-r":[{"rounded-r":F()}],"rounded-b":[{"rounded-b":F()}],"rounded-l":[{"rounded-l":F()}],"rounded-ss":[{"rounded-ss":F()}],"rounded-se":[{"rounded-se":F()}],"rounded-ee":[{"rounded-ee":F()}],"rounded-es":[{"rounded-es":F()}],"rounded-tl":[{"rounded-tl":F()}],"rounded-tr":[{"rounded-tr":F()}],"rounded-br":[{"rounded-br":F()}],"rounded-bl":[{"rounded-bl":F()}],"border-w":[{border:ae()}],"border-w-x":[{"border-x":ae()}],"border-w-y":[{"border-y":ae()}],"border-w-s":[{"border-s":ae()}],"border-w-e":[{"border-e":ae()}],"border-w-t":[{"border-t":ae()}],"border-w-r":[{"border-r":ae()}],"border-w-b":[{"border-b":ae()}],"border-w-l":[{"border-l":ae()}],"divide-x":[{"divide-x":ae()}],"divide-x-reverse":["divide-x-reverse"],"divide-y":[{"divide-y":ae()}],"divide-y-reverse":["divide-y-reverse"],"border-style":[{border:[...ce(),"hidden","none"]}],"divide-style":[{divide:[...ce(),"hidden","none"]}],"border-color":[{border:J()}],"border-color-x":[{"border-x":J()}],"border-color-y":[{"border-y":J()}],"border-color-s":[{"border-s":J()}],"border-color-e":[{"border-e":J()}],"border-color-t":[{"border-t":J()}],"border-color-r":[{"border-r":J()}],"border-color-b":[{"border-b":J()}],"border-color-l":[{"border-l":J()}],"divide-color":[{divide:J()}],"outline-style":[{outline:[...ce(),"none","hidden"]}],"outline-offset":[{"outline-offset":[De,he,de]}],"outline-w":[{outline:["",De,Ho,oi]}],"outline-color":[{outline:J()}],shadow:[{shadow:["","none",x,sf,af]}],"shadow-color":[{shadow:J()}],"inset-shadow":[{"inset-shadow":["none",v,sf,af]}],"inset-shadow-color":[{"inset-shadow":J()}],"ring-w":[{ring:ae()}],"ring-w-inset":["ring-inset"],"ring-color":[{ring:J()}],"ring-offset-w":[{"ring-offset":[De,oi]}],"ring-offset-color":[{"ring-offset":J()}],"inset-ring-w":[{"inset-ring":ae()}],"inset-ring-color":[{"inset-ring":J()}],"text-shadow":[{"text-shadow":["none",S,sf,af]}],"text-shadow-color":[{"text-shadow":J()}],opacity:[{opacity:[De,he,de]}],"mix-blend":[{"mix-blend":[...ge(),"plus-darker","plus-lighter"]}],"bg-blend":[{"bg-blend":ge()}],"mask-clip":[{"mask-clip":["border","padding","content","fill","stroke","view"]},"mask-no-clip"],"mask-composite":[{mask:["add","subtract","intersect","exclude"]}],"mask-image-linear-pos":[{"mask-linear":[De]}],"mask-image-linear-from-pos":[{"mask-linear-from":oe()}],"mask-image-linear-to-pos":[{"mask-linear-to":oe()}],"mask-image-linear-from-color":[{"mask-linear-from":J()}],"mask-image-linear-to-color":[{"mask-linear-to":J()}],"mask-image-t-from-pos":[{"mask-t-from":oe()}],"mask-image-t-to-pos":[{"mask-t-to":oe()}],"mask-image-t-from-color":[{"mask-t-from":J()}],"mask-image-t-to-color":[{"mask-t-to":J()}],"mask-image-r-from-pos":[{"mask-r-from":oe()}],"mask-image-r-to-pos":[{"mask-r-to":oe()}],"mask-image-r-from-color":[{"mask-r-from":J()}],"mask-image-r-to-color":[{"mask-r-to":J()}],"mask-image-b-from-pos":[{"mask-b-from":oe()}],"mask-image-b-to-pos":[{"mask-b-to":oe()}],"mask-image-b-from-color":[{"mask-b-from":J()}],"mask-image-b-to-color":[{"mask-b-to":J()}],"mask-image-l-from-pos":[{"mask-l-from":oe()}],"mask-image-l-to-pos":[{"mask-l-to":oe()}],"mask-image-l-from-color":[{"mask-l-from":J()}],"mask-image-l-to-color":[{"mask-l-to":J()}],"mask-image-x-from-pos":[{"mask-x-from":oe()}],"mask-image-x-to-pos":[{"mask-x-to":oe()}],"mask-image-x-from-color":[{"mask-x-from":J()}],"mask-image-x-to-color":[{"mask-x-to":J()}],"mask-image-y-from-pos":[{"mask-y-from":oe()}],"mask-image-y-to-pos":[{"mask-y-to":oe()}],"mask-image-y-from-color":[{"mask-y-from":J()}],"mask-image-y-to-color":[{"mask-y-to":J()}],"mask-image-radial":[{"mask-radial":[he,de]}],"mask-image-radial-from-pos":[{"mask-radial-from":oe()}],"mask-image-radial-to-pos":[{"mask-radial-to":oe()}],"mask-image-radial-from-color":[{"mask-radial-from":J()}],"mask-image-radial-to-color":[{"mask-radial-to":J()}],"mask-image-radial-shape":[{"mask-radial":["circle","ellipse"]}],"mask-image-radial-size":[{"mask-radial":[{closest:["side","corner"],farthest:["side","corner"]}]}],"mask-image-radial-pos":[{"mask-radial-at":R()}],"mask-image-conic-pos":[{"mask-conic":[De]}],"mask-image-conic-from-pos":[{"mask-conic-from":oe()}],"mask-image-conic-to-pos":[{"mask-conic-to":oe()}],"mask-image-conic-from-color":[{"mask-conic-from":J()}],"mask-image-conic-to-color":[{"mask-conic-to":J()}],"mask-mode":[{mask:["alpha","luminance","match"]}],"mask-origin":[{"mask-origin":["border","padding","content","fill","stroke","view"]}],"mask-position":[{mask:me()}],"mask-repeat":[{mask:U()}],"mask-size":[{mask:k()}],"mask-type":[{"mask-type":["alpha","luminance"]}],"mask-image":[{mask:["none",he,de]}],filter:[{filter:["","none",he,de]}],blur:[{blur:Ke()}],brightness:[{brightness:[De,he,de]}],contrast:[{contrast:[De,he,de]}],"drop-shadow":[{"drop-shadow":["","none",A,sf,af]}],"drop-shadow-color":[{"drop-shadow":J()}],grayscale:[{grayscale:["",De,he,de]}],"hue-rotate":[{"hue-rotate":[De,he,de]}],invert:[{invert:["",De,he,de]}],saturate:[{saturate:[De,he,de]}],sepia:[{sepia:["",De,he,de]}],"backdrop-filter":[{"backdrop-filter":["","none",he,de]}],"backdrop-blur":[{"backdrop-blur":Ke()}],"backdrop-brightness":[{"backdrop-brightness":[De,he,de]}],"backdrop-contrast":[{"backdrop-contrast":[De,he,de]}],"backdrop-grayscale":[{"backdrop-grayscale":["",De,he,de]}],"backdrop-hue-rotate":[{"backdrop-hue-rotate":[De,he,de]}],"backdrop-invert":[{"backdrop-invert":["",De,he,de]}],"backdrop-opacity":[{"backdrop-opacity":[De,he,de]}],"backdrop-saturate":[{"backdrop-saturate":[De,he,de]}],"backdrop-sepia":[{"backdrop-sepia":["",De,he,de]}],"border-collapse":[{border:["collapse","separate"]}],"border-spacing":[{"border-spacing":C()}],"border-spacing-x":[{"border-spacing-x":C()}],"border-spacing-y":[{"border-spacing-y":C()}],"table-layout":[{table:["auto","fixed"]}],caption:[{caption:["top","bottom"]}],transition:[{transition:["","all","colors","opacity","shadow","transform","none",he,de]}],"transition-behavior":[{transition:["normal","discrete"]}],duration:[{duration:[De,"initial",he,de]}],ease:[{ease:["linear","initial",j,he,de]}],delay:[{delay:[De,he,de]}],animate:[{animate:["none",E,he,de]}],backface:[{backface:["hidden","visible"]}],perspective:[{perspective:[_,he,de]}],"perspective-origin":[{"perspective-origin":O()}],rotate:[{rotate:Ne()}],"rotate-x":[{"rotate-x":Ne()}],"rotate-y":[{"rotate-y":Ne()}],"rotate-z":[{"rotate-z":Ne()}],scale:[{scale:$t()}],"scale-x":[{"scale-x":$t()}],"scale-y":[{"scale-y":$t()}],"scale-z":[{"scale-z":$t()}],"scale-3d":["scale-3d"],skew:[{skew:xt()}],"skew-x":[{"skew-x":xt()}],"skew-y":[{"skew-y":xt()}],transform:[{transform:[he,de,"","none","gpu","cpu"]}],"transform-origin":[{origin:O()}],"transform-style":[{transform:["3d","flat"]}],translate:[{translate:vt()}],"translate-x":[{"translate-x":vt()}],"translate-y":[{"translate-y":vt()}],"translate-z":[{"translate-z":vt()}],"translate-none":["translate-none"],accent:[{accent:J()}],appearance:[{appearance:["none","auto"]}],"caret-color":[{caret:J()}],"color-scheme":[{scheme:["normal","dark","light","light-dark","only-dark","only-light"]}],cursor:[{cursor:["auto","default","pointer","wait","text","move","help","not-allowed","none","context-menu","progress","cell","crosshair","vertical-text","alias","copy","no-drop","grab","grabbing","all-scroll","col-resize","row-resize","n-resize","e-resize","s-resize","w-resize","ne-resize","nw-resize","se-resize","sw-resize","ew-resize","ns-resize","nesw-resize","nwse-resize","zoom-in","zoom-out",he,de]}],"field-sizing":[{"field-sizing":["fixed","content"]}],"pointer-events":[{"pointer-events":["auto","none"]}],resize:[{resize:["none","","y","x"]}],"scroll-behavior":[{scroll:["auto","smooth"]}],"scroll-m":[{"scroll-m":C()}],"scroll-mx":[{"scroll-mx":C()}],"scroll-my":[{"scroll-my":C()}],"scroll-ms":[{"scroll-ms":C()}],"scroll-me":[{"scroll-me":C()}],"scroll-mt":[{"scroll-mt":C()}],"scroll-mr":[{"scroll-mr":C()}],"scroll-mb":[{"scroll-mb":C()}],"scroll-ml":[{"scroll-ml":C()}],"scroll-p":[{"scroll-p":C()}],"scroll-px":[{"scroll-px":C()}],"scroll-py":[{"scroll-py":C()}],"scroll-ps":[{"scroll-ps":C()}],"scroll-pe":[{"scroll-pe":C()}],"scroll-pt":[{"scroll-pt":C()}],"scroll-pr":[{"scroll-pr":C()}],"scroll-pb":[{"scroll-pb":C()}],"scroll-pl":[{"scroll-pl":C()}],"snap-align":[{snap:["start","end","center","align-none"]}],"snap-stop":[{snap:["normal","always"]}],"snap-type":[{snap:["none","x","y","both"]}],"snap-strictness":[{snap:["mandatory","proximity"]}],touch:[{touch:["auto","none","manipulation"]}],"touch-x":[{"touch-pan":["x","left","right"]}],"touch-y":[{"touch-pan":["y","up","down"]}],"touch-pz":["touch-pinch-zoom"],select:[{select:["none","text","all","auto"]}],"will-change":[{"will-change":["auto","scroll","contents","transform",he,de]}],fill:[{fill:["none",...J()]}],"stroke-w":[{stroke:[De,Ho,oi,kp]}],stroke:[{stroke:["none",...J()]}],"forced-color-adjust":[{"forced-color-adjust":["auto","none"]}]},conflictingClassGroups:{overflow:["overflow-x","overflow-y"],overscroll:["overscroll-x","overscroll-y"],inset:["inset-x","inset-y","start","end","top","right","bottom","left"],"inset-x":["right","left"],"inset-y":["top","bottom"],flex:["basis","grow","shrink"],gap:["gap-x","gap-y"],p:["px","py","ps","pe","pt","pr","pb","pl"],px:["pr","pl"],py:["pt","pb"],m:["mx","my","ms","me","mt","mr","mb","ml"],mx:["mr","ml"],my:["mt","mb"],size:["w","h"],"font-size":["leading"],"fvn-normal":["fvn-ordinal","fvn-slashed-zero","fvn-figure","fvn-spacing","fvn-fraction"],"fvn-ordinal":["fvn-normal"],"fvn-slashed-zero":["fvn-normal"],"fvn-figure":["fvn-normal"],"fvn-spacing":["fvn-normal"],"fvn-fraction":["fvn-normal"],"line-clamp":["display","overflow"],rounded:["rounded-s","rounded-e","rounded-t","rounded-r","rounded-b","rounded-l","rounded-ss","rounded-se","rounded-ee","rounded-es","rounded-tl","rounded-tr","rounded-br","rounded-bl"],"rounded-s":["rounded-ss","rounded-es"],"rounded-e":["rounded-se","rounded-ee"],"rounded-t":["rounded-tl","rounded-tr"],"rounded-r":["rounded-tr","rounded-br"],"rounded-b":["rounded-br","rounded-bl"],"rounded-l":["rounded-tl","rounded-bl"],"border-spacing":["border-spacing-x","border-spacing-y"],"border-w":["border-w-x","border-w-y","border-w-s","border-w-e","border-w-t","border-w-r","border-w-b","border-w-l"],"border-w-x":["border-w-r","border-w-l"],"border-w-y":["border-w-t","border-w-b"],"border-color":["border-color-x","border-color-y","border-color-s","border-color-e","border-color-t","border-color-r","border-color-b","border-color-l"],"border-color-x":["border-color-r","border-color-l"],"border-color-y":["border-color-t","border-color-b"],translate:["translate-x","translate-y","translate-none"],"translate-none":["translate","translate-x","translate-y","translate-z"],"scroll-m":["scroll-mx","scroll-my","scroll-ms","scroll-me","scroll-mt","scroll-mr","scroll-mb","scroll-ml"],"scroll-mx":["scroll-mr","scroll-ml"],"scroll-my":["scroll-mt","scroll-mb"],"scroll-p":["scroll-px","scroll-py","scroll-ps","scroll-pe","scroll-pt","scroll-pr","scroll-pb","scroll-pl"],"scroll-px":["scroll-pr","scroll-pl"],"scroll-py":["scroll-pt","scroll-pb"],touch:["touch-x","touch-y","touch-pz"],"touch-x":["touch"],"touch-y":["touch"],"touch-pz":["touch"]},conflictingClassGroupModifiers:{"font-size":["leading"]},orderSensitiveModifiers:["*","**","after","backdrop","before","details-content","file","first-letter","first-line","marker","placeholder","selection"]}},f4=GC(u4);function Va(...i){return f4(K_(i))}function Is({...i}){return h.jsx(vC,{"code-path":"src/components/ui/dialog.tsx:10:10","data-slot":"dialog",...i})}function d4({...i}){return h.jsx(yC,{"code-path":"src/components/ui/dialog.tsx:22:10","data-slot":"dialog-portal",...i})}function h4({className:i,...n}){return h.jsx(bC,{"code-path":"src/components/ui/dialog.tsx:36:5","data-slot":"dialog-overlay",className:Va("data-[state=open]:animate-in data-[state=closed]:animate-out data-[state=closed]:fade-out-0 data-[state=open]:fade-in-0 fixed inset-0 z-50 bg-black/50",i),...n})}function Ws({className:i,children:n,showCloseButton:r=!0,...s}){return h.jsxs(d4,{"code-path":"src/components/ui/dialog.tsx:56:5","data-slot":"dialog-portal",children:[h.jsx(h4,{"code-path":"src/components/ui/dialog.tsx:57:7"}),h.jsxs(_C,{"code-path":"src/components/ui/dialog.tsx:58:7","data-slot":"dialog-content",className:Va("bg-background data-[state=open]:animate-in data-[state=closed]:animate-out data-[state=closed]:fade-out-0 data-[state=open]:fade-in-0 data-[state=closed]:zoom-out-95 data-[state=open]:zoom-in-95 fixed top-[50%] left-[50%] z-50 grid w-full max-w-[calc(100%-2rem)] translate-x-[-50%] translate-y-[-50%] gap-4 rounded-lg border p-6 shadow-lg duration-200 outline-none sm:max-w-lg",i),...s,children:[n,r&&h.jsxs(AC,{"code-path":"src/components/ui/dialog.tsx:68:11","data-slot":"dialog-close",className:"ring-offset-background focus:ring-ring data-[state=open]:bg-accent data-[state=open]:text-muted-foreground absolute top-4 right-4 rounded-xs opacity-70 transition-opacity hover:opacity-100 focus:ring-2 focus:ring-offset-2 focus:outline-hidden disabled:pointer-events-none [&_svg]:pointer-events-none [&_svg]:shrink-0 [&_svg:not([class*='size-'])]:size-4",children:[h.jsx(x_,{"code-path":"src/components/ui/dialog.tsx:72:13"}),h.jsx("span",{"code-path":"src/components/ui/dialog.tsx:73:13",className:"sr-only",children:"Close"})]})]})]})}function Ni({className:i,...n}){return h.jsx("div",{"code-path":"src/components/ui/dialog.tsx:83:5","data-slot":"dialog-header",className:Va("flex flex-col gap-2 text-center sm:text-left",i),...n})}function ji({className:i,...n}){return h.jsx(SC,{"code-path":"src/components/ui/dialog.tsx:109:5","data-slot":"dialog-title",className:Va("text-lg leading-none font-semibold",i),...n})}function by(i){const n=p4(i),r=b.forwardRef((s,l)=>{const{children:c,...u}=s,d=b.Children.toArray(c),g=d.find(g4);if(g){const m=g.props.children,x=d.map(v=>v===g?b.Children.count(m)>1?b.Children.only(null):b.isValidElement(m)?m.props.children:null:v);return h.jsx(n,{...u,ref:l,children:b.isValidElement(m)?b.cloneElement(m,void 0,x):null})}return h.jsx(n,{...u,ref:l,children:c})});return r.displayName=`${i}.Slot`,r}function p4(i){const n=b.forwardRef((r,s)=>{const{children:l,...c}=r;if(b.isValidElement(l)){const u=v4(l),d=x4(c,l.props);return l.type!==b.Fragment&&(d.ref=s?Ac(s,u):u),b.cloneElement(l,d)}return b.Children.count(l)>1?b.Children.only(null):null});return n.displayName=`${i}.SlotClone`,n}var m4=Symbol("radix.slottable");function g4(i){return b.isValidElement(i)&&typeof i.type=="function"&&"__radixId"in i.type&&i.type.__radixId===m4}function x4(i,n){const r={...n};for(const s in n){const l=i[s],c=n[s];/^on[A-Z]/.test(s)?l&&c?r[s]=(...d)=>{const g=c(...d);return l(...d),g}:l&&(r[s]=l):s==="style"?r[s]={...l,...c}:s==="className"&&(r[s]=[l,c].filter(Boolean).join(" "))}return{...i,...r}}function v4(i){let n=Object.getOwnPropertyDescriptor(i.props,"ref")?.get,r=n&&"isReactWarning"in n&&n.isReactWarning;return r?i.ref:(n=Object.getOwnPropertyDescriptor(i,"ref")?.get,r=n&&"isReactWarning"in n&&n.isReactWarning,r?i.props.ref:i.props.ref||i.ref)}function y4(i){const n=i+"CollectionProvider",[r,s]=Gf(n),[l,c]=r(n,{collectionRef:{current:null},itemMap:new Map}),u=_=>{const{scope:T,children:j}=_,E=Ua.useRef(null),M=Ua.useRef(new Map).current;return h.jsx(l,{scope:T,itemMap:M,collectionRef:E,children:j})};u.displayName=n;const d=i+"CollectionSlot",g=by(d),m=Ua.forwardRef((_,T)=>{const{scope:j,children:E}=_,M=c(d,j),R=bs(T,M.collectionRef);return h.jsx(g,{ref:R,children:E})});m.displayName=d;const x=i+"CollectionItemSlot",v="data-radix-collection-item",S=by(x),A=Ua.forwardRef((_,T)=>{const{scope:j,children:E,...M}=_,R=Ua.useRef(null),O=bs(T,R),P=c(x,j);return Ua.useEffect(()=>(P.itemMap.set(R,{ref:R,...M}),()=>{P.itemMap.delete(R)})),h.jsx(S,{[v]:"",ref:O,children:E})});A.displayName=x;function N(_){const T=c(i+"CollectionConsumer",_);return Ua.useCallback(()=>{const E=T.collectionRef.current;if(!E)return[];const M=Array.from(E.querySelectorAll(`[${v}]`));return Array.from(T.itemMap.values()).sort((P,z)=>M.indexOf(P.ref.current)-M.indexOf(z.ref.current))},[T.collectionRef,T.itemMap])}return[{Provider:u,Slot:m,ItemSlot:A},N,s]}var b4=b.createContext(void 0);function l2(i){const n=b.useContext(b4);return i||n||"ltr"}var Op="rovingFocusGroup.onEntryFocus",_4={bubbles:!1,cancelable:!0},wc="RovingFocusGroup",[ym,o2,S4]=y4(wc),[A4,c2]=Gf(wc,[S4]),[T4,w4]=A4(wc),u2=b.forwardRef((i,n)=>h.jsx(ym.Provider,{scope:i.__scopeRovingFocusGroup,children:h.jsx(ym.Slot,{scope:i.__scopeRovingFocusGroup,children:h.jsx(N4,{...i,ref:n})})}));u2.displayName=wc;var N4=b.forwardRef((i,n)=>{const{__scopeRovingFocusGroup:r,orientation:s,loop:l=!1,dir:c,currentTabStopId:u,defaultCurrentTabStopId:d,onCurrentTabStopIdChange:g,onEntryFocus:m,preventScrollOnEntryFocus:x=!1,...v}=i,S=b.useRef(null),A=bs(n,S),N=l2(c),[_,T]=rg({prop:u,defaultProp:d??null,onChange:g,caller:wc}),[j,E]=b.useState(!1),M=Ll(m),R=o2(r),O=b.useRef(!1),[P,z]=b.useState(0);return b.useEffect(()=>{const C=S.current;if(C)return C.addEventListener(Op,M),()=>C.removeEventListener(Op,M)},[M]),h.jsx(T4,{scope:r,orientation:s,dir:N,loop:l,currentTabStopId:_,onItemFocus:b.useCallback(C=>T(C),[T]),onItemShiftTab:b.useCallback(()=>E(!0),[]),onFocusableItemAdd:b.useCallback(()=>z(C=>C+1),[]),onFocusableItemRemove:b.useCallback(()=>z(C=>C-1),[]),children:h.jsx(Ln.div,{tabIndex:j||P===0?-1:0,"data-orientation":s,...v,ref:A,style:{outline:"none",...i.style},onMouseDown:mn(i.onMouseDown,()=>{O.current=!0}),onFocus:mn(i.onFocus,C=>{const G=!O.current;if(C.target===C.currentTarget&&G&&!j){const W=new CustomEvent(Op,_4);if(C.currentTarget.dispatchEvent(W),!W.defaultPrevented){const re=R().filter(H=>H.focusable),Z=re.find(H=>H.active),se=re.find(H=>H.id===_),Q=[Z,se,...re].filter(Boolean).map(H=>H.ref.current);h2(Q,x)}}O.current=!1}),onBlur:mn(i.onBlur,()=>E(!1))})})}),f2="RovingFocusGroupItem",d2=b.forwardRef((i,n)=>{const{__scopeRovingFocusGroup:r,focusable:s=!0,active:l=!1,tabStopId:c,children:u,...d}=i,g=ic(),m=c||g,x=w4(f2,r),v=x.currentTabStopId===m,S=o2(r),{onFocusableItemAdd:A,onFocusableItemRemove:N,currentTabStopId:_}=x;return b.useEffect(()=>{if(s)return A(),()=>N()},[s,A,N]),h.jsx(ym.ItemSlot,{scope:r,id:m,focusable:s,active:l,children:h.jsx(Ln.span,{tabIndex:v?0:-1,"data-orientation":x.orientation,...d,ref:n,onMouseDown:mn(i.onMouseDown,T=>{s?x.onItemFocus(m):T.preventDefault()}),onFocus:mn(i.onFocus,()=>x.onItemFocus(m)),onKeyDown:mn(i.onKeyDown,T=>{if(T.key==="Tab"&&T.shiftKey){x.onItemShiftTab();return}if(T.target!==T.currentTarget)return;const j=C4(T,x.orientation,x.dir);if(j!==void 0){if(T.metaKey||T.ctrlKey||T.altKey||T.shiftKey)return;T.preventDefault();let M=S().filter(R=>R.focusable).map(R=>R.ref.current);if(j==="last")M.reverse();else if(j==="prev"||j==="next"){j==="prev"&&M.reverse();const R=M.indexOf(T.currentTarget);M=x.loop?z4(M,R+1):M.slice(R+1)}setTimeout(()=>h2(M))}}),children:typeof u=="function"?u({isCurrentTabStop:v,hasTabStop:_!=null}):u})})});d2.displayName=f2;var j4={ArrowLeft:"prev",ArrowUp:"prev",ArrowRight:"next",ArrowDown:"next",PageUp:"first",Home:"first",PageDown:"last",End:"last"};function E4(i,n){return n!=="rtl"?i:i==="ArrowLeft"?"ArrowRight":i==="ArrowRight"?"ArrowLeft":i}function C4(i,n,r){const s=E4(i.key,r);if(!(n==="vertical"&&["ArrowLeft","ArrowRight"].includes(s))&&!(n==="horizontal"&&["ArrowUp","ArrowDown"].includes(s)))return j4[s]}function h2(i,n=!1){const r=document.activeElement;for(const s of i)if(s===r||(s.focus({preventScroll:n}),document.activeElement!==r))return}function z4(i,n){return i.map((r,s)=>i[(n+s)%i.length])}var R4=u2,M4=d2,Zf="Tabs",[D4]=Gf(Zf,[c2]),p2=c2(),[k4,ug]=D4(Zf),m2=b.forwardRef((i,n)=>{const{__scopeTabs:r,value:s,onValueChange:l,defaultValue:c,orientation:u="horizontal",dir:d,activationMode:g="automatic",...m}=i,x=l2(d),[v,S]=rg({prop:s,onChange:l,defaultProp:c??"",caller:Zf});return h.jsx(k4,{scope:r,baseId:ic(),value:v,onValueChange:S,orientation:u,dir:x,activationMode:g,children:h.jsx(Ln.div,{dir:x,"data-orientation":u,...m,ref:n})})});m2.displayName=Zf;var g2="TabsList",x2=b.forwardRef((i,n)=>{const{__scopeTabs:r,loop:s=!0,...l}=i,c=ug(g2,r),u=p2(r);return h.jsx(R4,{asChild:!0,...u,orientation:c.orientation,dir:c.dir,loop:s,children:h.jsx(Ln.div,{role:"tablist","aria-orientation":c.orientation,...l,ref:n})})});x2.displayName=g2;var v2="TabsTrigger",y2=b.forwardRef((i,n)=>{const{__scopeTabs:r,value:s,disabled:l=!1,...c}=i,u=ug(v2,r),d=p2(r),g=S2(u.baseId,s),m=A2(u.baseId,s),x=s===u.value;return h.jsx(M4,{asChild:!0,...d,focusable:!l,active:x,children:h.jsx(Ln.button,{type:"button",role:"tab","aria-selected":x,"aria-controls":m,"data-state":x?"active":"inactive","data-disabled":l?"":void 0,disabled:l,id:g,...c,ref:n,onMouseDown:mn(i.onMouseDown,v=>{!l&&v.button===0&&v.ctrlKey===!1?u.onValueChange(s):v.preventDefault()}),onKeyDown:mn(i.onKeyDown,v=>{[" ","Enter"].includes(v.key)&&u.onValueChange(s)}),onFocus:mn(i.onFocus,()=>{const v=u.activationMode!=="manual";!x&&!l&&v&&u.onValueChange(s)})})})});y2.displayName=v2;var b2="TabsContent",_2=b.forwardRef((i,n)=>{const{__scopeTabs:r,value:s,forceMount:l,children:c,...u}=i,d=ug(b2,r),g=S2(d.baseId,s),m=A2(d.baseId,s),x=s===d.value,v=b.useRef(x);return b.useEffect(()=>{const S=requestAnimationFrame(()=>v.current=!1);return()=>cancelAnimationFrame(S)},[]),h.jsx(Tc,{present:l||x,children:({present:S})=>h.jsx(Ln.div,{"data-state":x?"active":"inactive","data-orientation":d.orientation,role:"tabpanel","aria-labelledby":g,hidden:!S,id:m,tabIndex:0,...u,ref:n,style:{...i.style,animationDuration:v.current?"0s":void 0},children:S&&c})})});_2.displayName=b2;function S2(i,n){return`${i}-trigger-${n}`}function A2(i,n){return`${i}-content-${n}`}var O4=m2,P4=x2,L4=y2,U4=_2;function fg({className:i,...n}){return h.jsx(O4,{"code-path":"src/components/ui/tabs.tsx:13:5","data-slot":"tabs",className:Va("flex flex-col gap-2",i),...n})}function dg({className:i,...n}){return h.jsx(P4,{"code-path":"src/components/ui/tabs.tsx:26:5","data-slot":"tabs-list",className:Va("bg-muted text-muted-foreground inline-flex h-9 w-fit items-center justify-center rounded-lg p-[3px]",i),...n})}function Ul({className:i,...n}){return h.jsx(L4,{"code-path":"src/components/ui/tabs.tsx:42:5","data-slot":"tabs-trigger",className:Va("data-[state=active]:bg-background dark:data-[state=active]:text-foreground focus-visible:border-ring focus-visible:ring-ring/50 focus-visible:outline-ring dark:data-[state=active]:border-input dark:data-[state=active]:bg-input/30 text-foreground dark:text-muted-foreground inline-flex h-[calc(100%-1px)] flex-1 items-center justify-center gap-1.5 rounded-md border border-transparent px-2 py-1 text-sm font-medium whitespace-nowrap transition-[color,box-shadow] focus-visible:ring-[3px] focus-visible:outline-1 disabled:pointer-events-none disabled:opacity-50 data-[state=active]:shadow-sm [&_svg]:pointer-events-none [&_svg]:shrink-0 [&_svg:not([class*='size-'])]:size-4",i),...n})}function Hl({className:i,...n}){return h.jsx(U4,{"code-path":"src/components/ui/tabs.tsx:58:5","data-slot":"tabs-content",className:Va("flex-1 outline-none",i),...n})}function gt({className:i,type:n,...r}){return h.jsx("input",{"code-path":"src/components/ui/input.tsx:7:5",type:n,"data-slot":"input",className:Va("file:text-foreground placeholder:text-muted-foreground selection:bg-primary selection:text-primary-foreground dark:bg-input/30 border-input h-9 w-full min-w-0 rounded-md border bg-transparent px-3 py-1 text-base shadow-xs transition-[color,box-shadow] outline-none file:inline-flex file:h-7 file:border-0 file:bg-transparent file:text-sm file:font-medium disabled:pointer-events-none disabled:cursor-not-allowed disabled:opacity-50 md:text-sm","focus-visible:border-ring focus-visible:ring-ring/50 focus-visible:ring-[3px]","aria-invalid:ring-destructive/20 dark:aria-invalid:ring-destructive/40 aria-invalid:border-destructive",i),...r})}var H4=Symbol.for("react.lazy"),kf=_m[" use ".trim().toString()];function B4(i){return typeof i=="object"&&i!==null&&"then"in i}function T2(i){return i!=null&&typeof i=="object"&&"$$typeof"in i&&i.$$typeof===H4&&"_payload"in i&&B4(i._payload)}function w2(i){const n=Y4(i),r=b.forwardRef((s,l)=>{let{children:c,...u}=s;T2(c)&&typeof kf=="function"&&(c=kf(c._payload));const d=b.Children.toArray(c),g=d.find(G4);if(g){const m=g.props.children,x=d.map(v=>v===g?b.Children.count(m)>1?b.Children.only(null):b.isValidElement(m)?m.props.children:null:v);return h.jsx(n,{...u,ref:l,children:b.isValidElement(m)?b.cloneElement(m,void 0,x):null})}return h.jsx(n,{...u,ref:l,children:c})});return r.displayName=`${i}.Slot`,r}var F4=w2("Slot");function Y4(i){const n=b.forwardRef((r,s)=>{let{children:l,...c}=r;if(T2(l)&&typeof kf=="function"&&(l=kf(l._payload)),b.isValidElement(l)){const u=X4(l),d=V4(c,l.props);return l.type!==b.Fragment&&(d.ref=s?Ac(s,u):u),b.cloneElement(l,d)}return b.Children.count(l)>1?b.Children.only(null):null});return n.displayName=`${i}.SlotClone`,n}var q4=Symbol("radix.slottable");function G4(i){return b.isValidElement(i)&&typeof i.type=="function"&&"__radixId"in i.type&&i.type.__radixId===q4}function V4(i,n){const r={...n};for(const s in n){const l=i[s],c=n[s];/^on[A-Z]/.test(s)?l&&c?r[s]=(...d)=>{const g=c(...d);return l(...d),g}:l&&(r[s]=l):s==="style"?r[s]={...l,...c}:s==="className"&&(r[s]=[l,c].filter(Boolean).join(" "))}return{...i,...r}}function X4(i){let n=Object.getOwnPropertyDescriptor(i.props,"ref")?.get,r=n&&"isReactWarning"in n&&n.isReactWarning;return r?i.ref:(n=Object.getOwnPropertyDescriptor(i,"ref")?.get,r=n&&"isReactWarning"in n&&n.isReactWarning,r?i.props.ref:i.props.ref||i.ref)}var Z4=["a","button","div","form","h2","h3","img","input","label","li","nav","ol","p","select","span","svg","ul"],K4=Z4.reduce((i,n)=>{const r=w2(`Primitive.${n}`),s=b.forwardRef((l,c)=>{const{asChild:u,...d}=l,g=u?r:n;return typeof window<"u"&&(window[Symbol.for("radix-ui")]=!0),h.jsx(g,{...d,ref:c})});return s.displayName=`Primitive.${n}`,{...i,[n]:s}},{}),Q4="Label",N2=b.forwardRef((i,n)=>h.jsx(K4.label,{...i,ref:n,onMouseDown:r=>{r.target.closest("button, input, select, textarea")||(i.onMouseDown?.(r),!r.defaultPrevented&&r.detail>1&&r.preventDefault())}}));N2.displayName=Q4;var $4=N2;function He({className:i,...n}){return h.jsx($4,{"code-path":"src/components/ui/label.tsx:13:5","data-slot":"label",className:Va("flex items-center gap-2 text-sm leading-none font-medium select-none group-data-[disabled=true]:pointer-events-none group-data-[disabled=true]:opacity-50 peer-disabled:cursor-not-allowed peer-disabled:opacity-50",i),...n})}const _y=i=>typeof i=="boolean"?`${i}`:i===0?"0":i,Sy=K_,J4=(i,n)=>r=>{var s;if(n?.variants==null)return Sy(i,r?.class,r?.className);const{variants:l,defaultVariants:c}=n,u=Object.keys(l).map(m=>{const x=r?.[m],v=c?.[m];if(x===null)return null;const S=_y(x)||_y(v);return l[m][S]}),d=r&&Object.entries(r).reduce((m,x)=>{let[v,S]=x;return S===void 0||(m[v]=S),m},{}),g=n==null||(s=n.compoundVariants)===null||s===void 0?void 0:s.reduce((m,x)=>{let{class:v,className:S,...A}=x;return Object.entries(A).every(N=>{let[_,T]=N;return Array.isArray(T)?T.includes({...c,...d}[_]):{...c,...d}[_]===T})?[...m,v,S]:m},[]);return Sy(i,u,g,r?.class,r?.className)},I4=J4("inline-flex items-center justify-center gap-2 whitespace-nowrap rounded-md text-sm font-medium transition-all disabled:pointer-events-none disabled:opacity-50 [&_svg]:pointer-events-none [&_svg:not([class*='size-'])]:size-4 shrink-0 [&_svg]:shrink-0 outline-none focus-visible:border-ring focus-visible:ring-ring/50 focus-visible:ring-[3px] aria-invalid:ring-destructive/20 dark:aria-invalid:ring-destructive/40 aria-invalid:border-destructive",{variants:{variant:{default:"bg-primary text-primary-foreground hover:bg-primary/90",destructive:"bg-destructive text-white hover:bg-destructive/90 focus-visible:ring-destructive/20 dark:focus-visible:ring-destructive/40 dark:bg-destructive/60",outline:"border bg-background shadow-xs hover:bg-accent hover:text-accent-foreground dark:bg-input/30 dark:border-input dark:hover:bg-input/50",secondary:"bg-secondary text-secondary-foreground hover:bg-secondary/80",ghost:"hover:bg-accent hover:text-accent-foreground dark:hover:bg-accent/50",link:"text-primary underline-offset-4 hover:underline"},size:{default:"h-9 px-4 py-2 has-[>svg]:px-3",sm:"h-8 rounded-md gap-1.5 px-3 has-[>svg]:px-2.5",lg:"h-10 rounded-md px-6 has-[>svg]:px-4",icon:"size-9","icon-sm":"size-8","icon-lg":"size-10"}},defaultVariants:{variant:"default",size:"default"}});function Pr({className:i,variant:n="default",size:r="default",asChild:s=!1,...l}){const c=s?F4:"button";return h.jsx(c,{"code-path":"src/components/ui/button.tsx:52:5","data-slot":"button","data-variant":n,"data-size":r,className:Va(I4({variant:n,size:r,className:i})),...l})}const j2=({open:i,onOpenChange:n,defaultTab:r="login"})=>{const[s,l]=b.useState(r),[c,u]=b.useState(!1),[d,g]=b.useState(!1),[m,x]=b.useState(""),{login:v,register:S}=Wa(),[A,N]=b.useState(""),[_,T]=b.useState(""),[j,E]=b.useState(""),[M,R]=b.useState(""),[O,P]=b.useState(""),[z,C]=b.useState(""),[G,W]=b.useState(""),[re,Z]=b.useState("student"),se=async Q=>{Q.preventDefault(),g(!0),x("");const H=await v(A,_);g(!1),H.success?(n(!1),N(""),T("")):x(H.error||"Bejelentkezés sikertelen")},le=async Q=>{Q.preventDefault(),g(!0),x("");const H=await S({email:j,password:M,first_name:O,last_name:z,phone:G,role:re});g(!1),H.success?(n(!1),E(""),R(""),P(""),C(""),W("")):x(H.error||"Regisztráció sikertelen")};return h.jsx(Is,{"code-path":"src/components/AuthModal.tsx:84:5",open:i,onOpenChange:n,children:h.jsxs(Ws,{"code-path":"src/components/AuthModal.tsx:85:7",className:"sm:max-w-md max-h-[90vh] overflow-y-auto",children:[h.jsx(Ni,{"code-path":"src/components/AuthModal.tsx:86:9",children:h.jsx(ji,{"code-path":"src/components/AuthModal.tsx:87:11",className:"text-2xl text-center",style:{fontFamily:"Cormorant Garamond, serif"},children:"ZeneTanár.hu"})}),h.jsxs(fg,{"code-path":"src/components/AuthModal.tsx:92:9",value:s,onValueChange:Q=>l(Q),children:[h.jsxs(dg,{"code-path":"src/components/AuthModal.tsx:93:11",className:"grid w-full grid-cols-2",children:[h.jsx(Ul,{"code-path":"src/components/AuthModal.tsx:94:13",value:"login",children:"Bejelentkezés"}),h.jsx(Ul,{"code-path":"src/components/AuthModal.tsx:95:13",value:"register",children:"Regisztráció"})]}),m&&h.jsx("div",{"code-path":"src/components/AuthModal.tsx:99:13",className:"mt-4 p-3 bg-red-50 text-red-600 text-sm rounded-lg",children:m}),h.jsx(Hl,{"code-path":"src/components/AuthModal.tsx:104:11",value:"login",children:h.jsxs("form",{"code-path":"src/components/AuthModal.tsx:105:13",onSubmit:se,className:"space-y-4 mt-4",children:[h.jsxs("div",{"code-path":"src/components/AuthModal.tsx:106:15",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/components/AuthModal.tsx:107:17",htmlFor:"login-email",children:"Email"}),h.jsx(gt,{"code-path":"src/components/AuthModal.tsx:108:17",id:"login-email",type:"email",placeholder:"pelda@email.com",value:A,onChange:Q=>N(Q.target.value),required:!0})]}),h.jsxs("div",{"code-path":"src/components/AuthModal.tsx:118:15",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/components/AuthModal.tsx:119:17",htmlFor:"login-password",children:"Jelszó"}),h.jsxs("div",{"code-path":"src/components/AuthModal.tsx:120:17",className:"relative",children:[h.jsx(gt,{"code-path":"src/components/AuthModal.tsx:121:19",id:"login-password",type:c?"text":"password",placeholder:"••••••••",value:_,onChange:Q=>T(Q.target.value),required:!0}),h.jsx("button",{"code-path":"src/components/AuthModal.tsx:129:19",type:"button",onClick:()=>u(!c),className:"absolute right-3 top-1/2 -translate-y-1/2 text-gray-400 hover:text-gray-600",children:c?h.jsx(Iv,{"code-path":"src/components/AuthModal.tsx:134:37",size:18}):h.jsx(xc,{"code-path":"src/components/AuthModal.tsx:134:60",size:18})})]})]}),h.jsx(Pr,{"code-path":"src/components/AuthModal.tsx:139:15",type:"submit",className:"w-full btn-primary",disabled:d,children:d?h.jsxs(h.Fragment,{children:[h.jsx(vc,{"code-path":"src/components/AuthModal.tsx:146:21",size:18,className:"mr-2 animate-spin"}),"Bejelentkezés..."]}):"Bejelentkezés"})]})}),h.jsx(Hl,{"code-path":"src/components/AuthModal.tsx:156:11",value:"register",children:h.jsxs("form",{"code-path":"src/components/AuthModal.tsx:157:13",onSubmit:le,className:"space-y-4 mt-4",children:[h.jsxs("div",{"code-path":"src/components/AuthModal.tsx:158:15",className:"grid grid-cols-2 gap-4",children:[h.jsxs("div",{"code-path":"src/components/AuthModal.tsx:159:17",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/components/AuthModal.tsx:160:19",htmlFor:"reg-firstname",children:"Keresztnév"}),h.jsx(gt,{"code-path":"src/components/AuthModal.tsx:161:19",id:"reg-firstname",placeholder:"János",value:O,onChange:Q=>P(Q.target.value),required:!0})]}),h.jsxs("div",{"code-path":"src/components/AuthModal.tsx:169:17",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/components/AuthModal.tsx:170:19",htmlFor:"reg-lastname",children:"Vezetéknév"}),h.jsx(gt,{"code-path":"src/components/AuthModal.tsx:171:19",id:"reg-lastname",placeholder:"Kovács",value:z,onChange:Q=>C(Q.target.value),required:!0})]})]}),h.jsxs("div",{"code-path":"src/components/AuthModal.tsx:181:15",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/components/AuthModal.tsx:182:17",htmlFor:"reg-email",children:"Email"}),h.jsx(gt,{"code-path":"src/components/AuthModal.tsx:183:17",id:"reg-email",type:"email",placeholder:"pelda@email.com",value:j,onChange:Q=>E(Q.target.value),required:!0})]}),h.jsxs("div",{"code-path":"src/components/AuthModal.tsx:193:15",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/components/AuthModal.tsx:194:17",htmlFor:"reg-phone",children:"Telefonszám (opcionális)"}),h.jsx(gt,{"code-path":"src/components/AuthModal.tsx:195:17",id:"reg-phone",type:"tel",placeholder:"+36 30 123 4567",value:G,onChange:Q=>W(Q.target.value)})]}),h.jsxs("div",{"code-path":"src/components/AuthModal.tsx:204:15",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/components/AuthModal.tsx:205:17",htmlFor:"reg-password",children:"Jelszó"}),h.jsxs("div",{"code-path":"src/components/AuthModal.tsx:206:17",className:"relative",children:[h.jsx(gt,{"code-path":"src/components/AuthModal.tsx:207:19",id:"reg-password",type:c?"text":"password",placeholder:"••••••••",value:M,onChange:Q=>R(Q.target.value),required:!0,minLength:6}),h.jsx("button",{"code-path":"src/components/AuthModal.tsx:216:19",type:"button",onClick:()=>u(!c),className:"absolute right-3 top-1/2 -translate-y-1/2 text-gray-400 hover:text-gray-600",children:c?h.jsx(Iv,{"code-path":"src/components/AuthModal.tsx:221:37",size:18}):h.jsx(xc,{"code-path":"src/components/AuthModal.tsx:221:60",size:18})})]})]}),h.jsxs("div",{"code-path":"src/components/AuthModal.tsx:226:15",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/components/AuthModal.tsx:227:17",children:"Szerepkör"}),h.jsxs("div",{"code-path":"src/components/AuthModal.tsx:228:17",className:"flex gap-4",children:[h.jsxs("label",{"code-path":"src/components/AuthModal.tsx:229:19",className:"flex items-center gap-2 cursor-pointer",children:[h.jsx("input",{"code-path":"src/components/AuthModal.tsx:230:21",type:"radio",name:"role",value:"student",checked:re==="student",onChange:()=>Z("student"),className:"accent-[#D7A04D]"}),h.jsx("span",{"code-path":"src/components/AuthModal.tsx:238:21",children:"Diák vagyok"})]}),h.jsxs("label",{"code-path":"src/components/AuthModal.tsx:240:19",className:"flex items-center gap-2 cursor-pointer",children:[h.jsx("input",{"code-path":"src/components/AuthModal.tsx:241:21",type:"radio",name:"role",value:"teacher",checked:re==="teacher",onChange:()=>Z("teacher"),className:"accent-[#D7A04D]"}),h.jsx("span",{"code-path":"src/components/AuthModal.tsx:249:21",children:"Tanár vagyok"})]})]})]}),h.jsx(Pr,{"code-path":"src/components/AuthModal.tsx:254:15",type:"submit",className:"w-full btn-primary",disabled:d,children:d?h.jsxs(h.Fragment,{children:[h.jsx(vc,{"code-path":"src/components/AuthModal.tsx:261:21",size:18,className:"mr-2 animate-spin"}),"Regisztráció..."]}):"Regisztráció"})]})})]})]})})};function Of({className:i,...n}){return h.jsx("textarea",{"code-path":"src/components/ui/textarea.tsx:7:5","data-slot":"textarea",className:Va("border-input placeholder:text-muted-foreground focus-visible:border-ring focus-visible:ring-ring/50 aria-invalid:ring-destructive/20 dark:aria-invalid:ring-destructive/40 aria-invalid:border-destructive dark:bg-input/30 flex field-sizing-content min-h-16 w-full rounded-md border bg-transparent px-3 py-2 text-base shadow-xs transition-[color,box-shadow] outline-none focus-visible:ring-[3px] disabled:cursor-not-allowed disabled:opacity-50 md:text-sm",i),...n})}const W4=[{id:1,name_hu:"Zongora"},{id:2,name_hu:"Gitár"},{id:3,name_hu:"Hegedű"},{id:4,name_hu:"Ének"},{id:5,name_hu:"Dob"},{id:6,name_hu:"Basszusgitár"},{id:7,name_hu:"Szaxofon"},{id:8,name_hu:"Fuvola"},{id:9,name_hu:"Cselló"},{id:10,name_hu:"Ukulele"}],e5=[{id:1,city:"Budapest"},{id:11,city:"Debrecen"},{id:12,city:"Szeged"},{id:13,city:"Pécs"},{id:14,city:"Győr"},{id:15,city:"Miskolc"}],hg=({open:i,onOpenChange:n})=>{const{user:r,token:s}=Wa(),[l,c]=b.useState(!1),[u,d]=b.useState(""),[g,m]=b.useState(!1),[x,v]=b.useState(""),[S,A]=b.useState(""),[N,_]=b.useState(""),[T,j]=b.useState(""),[E,M]=b.useState(""),[R,O]=b.useState(""),[P,z]=b.useState(!1),[C,G]=b.useState(!1),[W,re]=b.useState(!1),Z=async se=>{if(se.preventDefault(),c(!0),d(""),!s){d("Kérjük, jelentkezzen be a hirdetés feladásához"),c(!1);return}try{const Q=await fetch("http://localhost:8000/api/advertisements",{method:"POST",headers:{"Content-Type":"application/json",Authorization:`Bearer ${s}`},body:JSON.stringify({title:x,short_description:S,long_description:N,instrument_id:parseInt(T),location_id:parseInt(E)})});if(!Q.ok){const H=await Q.json();throw new Error(H.detail||"Hirdetés feladása sikertelen")}m(!0),setTimeout(()=>{v(""),A(""),_(""),j(""),M(""),O(""),z(!1),G(!1),re(!1),m(!1),n(!1)},2e3)}catch(le){d(le.message||"Hiba történt a hirdetés feladása közben")}finally{c(!1)}};return g?h.jsx(Is,{"code-path":"src/components/PostAdModal.tsx:113:7",open:i,onOpenChange:n,children:h.jsx(Ws,{"code-path":"src/components/PostAdModal.tsx:114:9",className:"sm:max-w-md",children:h.jsxs("div",{"code-path":"src/components/PostAdModal.tsx:115:11",className:"flex flex-col items-center justify-center py-8",children:[h.jsx(Yf,{"code-path":"src/components/PostAdModal.tsx:116:13",size:64,className:"text-green-500 mb-4"}),h.jsx("h3",{"code-path":"src/components/PostAdModal.tsx:117:13",className:"text-xl font-semibold mb-2",children:"Sikeres hirdetés!"}),h.jsx("p",{"code-path":"src/components/PostAdModal.tsx:118:13",className:"text-gray-600 text-center",children:"A hirdetésedet sikeresen feladtuk. Hamarosan megjelenik a keresésekben."})]})})}):h.jsx(Is,{"code-path":"src/components/PostAdModal.tsx:128:5",open:i,onOpenChange:n,children:h.jsxs(Ws,{"code-path":"src/components/PostAdModal.tsx:129:7",className:"sm:max-w-lg max-h-[90vh] overflow-y-auto",children:[h.jsx(Ni,{"code-path":"src/components/PostAdModal.tsx:130:9",children:h.jsx(ji,{"code-path":"src/components/PostAdModal.tsx:131:11",className:"text-2xl",style:{fontFamily:"Cormorant Garamond, serif"},children:"Hirdetés feladása"})}),r?r.role!=="teacher"?h.jsxs("div",{"code-path":"src/components/PostAdModal.tsx:146:11",className:"py-8 text-center",children:[h.jsx("p",{"code-path":"src/components/PostAdModal.tsx:147:13",className:"text-gray-600 mb-4",children:"Csak tanárok adhatnak fel hirdetést."}),h.jsx(Pr,{"code-path":"src/components/PostAdModal.tsx:150:13",onClick:()=>n(!1),className:"btn-primary",children:"Értem"})]}):h.jsxs("form",{"code-path":"src/components/PostAdModal.tsx:155:11",onSubmit:Z,className:"space-y-4 mt-4",children:[u&&h.jsx("div",{"code-path":"src/components/PostAdModal.tsx:157:15",className:"p-3 bg-red-50 text-red-600 text-sm rounded-lg",children:u}),h.jsxs("div",{"code-path":"src/components/PostAdModal.tsx:162:13",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/components/PostAdModal.tsx:163:15",htmlFor:"ad-title",children:"Hirdetés címe *"}),h.jsx(gt,{"code-path":"src/components/PostAdModal.tsx:164:15",id:"ad-title",placeholder:"Pl.: Zongora oktatás Budapesten",value:x,onChange:se=>v(se.target.value),required:!0,maxLength:200})]}),h.jsxs("div",{"code-path":"src/components/PostAdModal.tsx:174:13",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/components/PostAdModal.tsx:175:15",htmlFor:"ad-instrument",children:"Hangszer *"}),h.jsxs("select",{"code-path":"src/components/PostAdModal.tsx:176:15",id:"ad-instrument",value:T,onChange:se=>j(se.target.value),required:!0,className:"w-full px-4 py-3 rounded-xl border border-gray-200 bg-white focus:outline-none focus:border-[#D7A04D] focus:ring-2 focus:ring-[#D7A04D]/10",children:[h.jsx("option",{"code-path":"src/components/PostAdModal.tsx:183:17",value:"",children:"Válassz hangszert"}),W4.map(se=>h.jsx("option",{"code-path":"src/components/PostAdModal.tsx:185:19",value:se.id,children:se.name_hu},se.id))]})]}),h.jsxs("div",{"code-path":"src/components/PostAdModal.tsx:192:13",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/components/PostAdModal.tsx:193:15",htmlFor:"ad-location",children:"Város *"}),h.jsxs("select",{"code-path":"src/components/PostAdModal.tsx:194:15",id:"ad-location",value:E,onChange:se=>M(se.target.value),required:!0,className:"w-full px-4 py-3 rounded-xl border border-gray-200 bg-white focus:outline-none focus:border-[#D7A04D] focus:ring-2 focus:ring-[#D7A04D]/10",children:[h.jsx("option",{"code-path":"src/components/PostAdModal.tsx:201:17",value:"",children:"Válassz várost"}),e5.map(se=>h.jsx("option",{"code-path":"src/components/PostAdModal.tsx:203:19",value:se.id,children:se.city},se.id))]})]}),h.jsxs("div",{"code-path":"src/components/PostAdModal.tsx:210:13",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/components/PostAdModal.tsx:211:15",htmlFor:"ad-price",children:"Óradíj (Ft/óra)"}),h.jsx(gt,{"code-path":"src/components/PostAdModal.tsx:212:15",id:"ad-price",type:"number",placeholder:"Pl.: 8000",value:R,onChange:se=>O(se.target.value)})]}),h.jsxs("div",{"code-path":"src/components/PostAdModal.tsx:221:13",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/components/PostAdModal.tsx:222:15",children:"Oktatás módja"}),h.jsxs("div",{"code-path":"src/components/PostAdModal.tsx:223:15",className:"flex flex-wrap gap-4",children:[h.jsxs("label",{"code-path":"src/components/PostAdModal.tsx:224:17",className:"flex items-center gap-2 cursor-pointer",children:[h.jsx("input",{"code-path":"src/components/PostAdModal.tsx:225:19",type:"checkbox",checked:P,onChange:se=>z(se.target.checked),className:"accent-[#D7A04D] w-4 h-4"}),h.jsx("span",{"code-path":"src/components/PostAdModal.tsx:231:19",children:"Online"})]}),h.jsxs("label",{"code-path":"src/components/PostAdModal.tsx:233:17",className:"flex items-center gap-2 cursor-pointer",children:[h.jsx("input",{"code-path":"src/components/PostAdModal.tsx:234:19",type:"checkbox",checked:C,onChange:se=>G(se.target.checked),className:"accent-[#D7A04D] w-4 h-4"}),h.jsx("span",{"code-path":"src/components/PostAdModal.tsx:240:19",children:"Diáknál"})]}),h.jsxs("label",{"code-path":"src/components/PostAdModal.tsx:242:17",className:"flex items-center gap-2 cursor-pointer",children:[h.jsx("input",{"code-path":"src/components/PostAdModal.tsx:243:19",type:"checkbox",checked:W,onChange:se=>re(se.target.checked),className:"accent-[#D7A04D] w-4 h-4"}),h.jsx("span",{"code-path":"src/components/PostAdModal.tsx:249:19",children:"Tanárnál"})]})]})]}),h.jsxs("div",{"code-path":"src/components/PostAdModal.tsx:254:13",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/components/PostAdModal.tsx:255:15",htmlFor:"ad-short",children:"Rövid leírás *"}),h.jsx(Of,{"code-path":"src/components/PostAdModal.tsx:256:15",id:"ad-short",placeholder:"Pl.: 10 éves tapasztalattal várom kezdő és haladó zongorázni vágyókat.",value:S,onChange:se=>A(se.target.value),required:!0,maxLength:500,rows:2}),h.jsxs("p",{"code-path":"src/components/PostAdModal.tsx:265:15",className:"text-xs text-gray-500",children:[S.length,"/500 karakter"]})]}),h.jsxs("div",{"code-path":"src/components/PostAdModal.tsx:270:13",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/components/PostAdModal.tsx:271:15",htmlFor:"ad-long",children:"Részletes leírás"}),h.jsx(Of,{"code-path":"src/components/PostAdModal.tsx:272:15",id:"ad-long",placeholder:"Írd le részletesen, mit kínálsz, milyen szinten, milyen időpontokban...",value:N,onChange:se=>_(se.target.value),rows:4})]}),h.jsx(Pr,{"code-path":"src/components/PostAdModal.tsx:281:13",type:"submit",className:"w-full btn-primary",disabled:l,children:l?h.jsxs(h.Fragment,{children:[h.jsx(vc,{"code-path":"src/components/PostAdModal.tsx:288:19",size:18,className:"mr-2 animate-spin"}),"Hirdetés feladása..."]}):"Hirdetés feladása"})]}):h.jsxs("div",{"code-path":"src/components/PostAdModal.tsx:137:11",className:"py-8 text-center",children:[h.jsx("p",{"code-path":"src/components/PostAdModal.tsx:138:13",className:"text-gray-600 mb-4",children:"A hirdetés feladásához be kell jelentkezned."}),h.jsx(Pr,{"code-path":"src/components/PostAdModal.tsx:141:13",onClick:()=>n(!1),className:"btn-primary",children:"Bejelentkezés"})]})]})})},t5=()=>{const[i,n]=b.useState(!1),[r,s]=b.useState(!1),[l,c]=b.useState(!1),[u,d]=b.useState(!1),[g,m]=b.useState("login"),x=Ss(),v=Ei(),{user:S,isAuthenticated:A,logout:N}=Wa(),_=x.pathname==="/",T=S?.role==="admin";b.useEffect(()=>{const z=()=>{n(window.scrollY>100)};return window.addEventListener("scroll",z,{passive:!0}),()=>window.removeEventListener("scroll",z)},[]);const j=[{label:"Tanárok",href:"#teachers"},{label:"Hangszer",href:"#instruments"},{label:"Hogyan működik?",href:"#how-it-works"},{label:"Árak",href:"#pricing"}],E=z=>{if(!_)v("/"),setTimeout(()=>{const C=document.querySelector(z);C&&C.scrollIntoView({behavior:"smooth"})},100);else{const C=document.querySelector(z);C&&C.scrollIntoView({behavior:"smooth"})}s(!1)},M=()=>{m("login"),c(!0),s(!1)},R=()=>{m("register"),c(!0),s(!1)},O=()=>{A?d(!0):(m("login"),c(!0)),s(!1)},P=()=>{N(),v("/"),s(!1)};return h.jsxs(h.Fragment,{children:[h.jsxs("nav",{"code-path":"src/components/Navigation.tsx:82:7",className:`nav-fixed transition-all duration-300 ${i||!_?"nav-scrolled py-3":"py-5"}`,children:[h.jsxs("div",{"code-path":"src/components/Navigation.tsx:83:9",className:"w-full px-6 lg:px-12 flex items-center justify-between",children:[h.jsx(di,{"code-path":"src/components/Navigation.tsx:85:11",to:"/",className:"text-xl font-semibold tracking-tight",style:{fontFamily:"Cormorant Garamond, serif"},children:"ZeneTanár.hu"}),h.jsx("div",{"code-path":"src/components/Navigation.tsx:94:11",className:"hidden lg:flex items-center gap-8",children:_&&j.map(z=>h.jsx("a",{"code-path":"src/components/Navigation.tsx:96:15",href:z.href,onClick:C=>{C.preventDefault(),E(z.href)},className:"text-sm font-medium hover:text-[#D7A04D] transition-colors",children:z.label},z.href))}),h.jsx("div",{"code-path":"src/components/Navigation.tsx:108:11",className:"hidden lg:flex items-center gap-4",children:A?h.jsxs(h.Fragment,{children:[T&&h.jsxs(di,{"code-path":"src/components/Navigation.tsx:112:19",to:"/admin",className:"flex items-center gap-2 text-sm font-medium text-purple-600 hover:text-purple-700",children:[h.jsx(ey,{"code-path":"src/components/Navigation.tsx:116:21",size:16}),"Admin"]}),h.jsxs(di,{"code-path":"src/components/Navigation.tsx:120:17",to:"/profil",className:"flex items-center gap-2 text-sm font-medium hover:text-[#D7A04D] transition-colors",children:[h.jsx(Rf,{"code-path":"src/components/Navigation.tsx:124:19",size:16}),S?.first_name]}),h.jsx("button",{"code-path":"src/components/Navigation.tsx:127:17",onClick:P,className:"p-2 hover:bg-gray-100 rounded-full transition-colors",title:"Kijelentkezés",children:h.jsx(Wv,{"code-path":"src/components/Navigation.tsx:132:19",size:18})}),h.jsx("button",{"code-path":"src/components/Navigation.tsx:134:17",onClick:O,className:"btn-primary text-sm",children:"Hirdetés feladása"})]}):h.jsxs(h.Fragment,{children:[h.jsx("button",{"code-path":"src/components/Navigation.tsx:143:17",onClick:M,className:"btn-ghost text-sm",children:"Bejelentkezés"}),h.jsx("button",{"code-path":"src/components/Navigation.tsx:149:17",onClick:O,className:"btn-primary text-sm",children:"Hirdetés feladása"})]})}),h.jsx("button",{"code-path":"src/components/Navigation.tsx:160:11",className:"lg:hidden p-2",onClick:()=>s(!r),children:r?h.jsx(x_,{"code-path":"src/components/Navigation.tsx:164:31",size:24}):h.jsx($N,{"code-path":"src/components/Navigation.tsx:164:49",size:24})})]}),r&&h.jsx("div",{"code-path":"src/components/Navigation.tsx:170:11",className:"lg:hidden absolute top-full left-0 right-0 bg-[#F4F2EE] border-t border-gray-200 py-6 px-6 shadow-lg",children:h.jsxs("div",{"code-path":"src/components/Navigation.tsx:171:13",className:"flex flex-col gap-4",children:[_&&j.map(z=>h.jsx("a",{"code-path":"src/components/Navigation.tsx:173:17",href:z.href,onClick:C=>{C.preventDefault(),E(z.href)},className:"text-lg font-medium py-2",children:z.label},z.href)),A&&h.jsxs(h.Fragment,{children:[h.jsx("hr",{"code-path":"src/components/Navigation.tsx:185:19",className:"my-2"}),h.jsxs(di,{"code-path":"src/components/Navigation.tsx:186:19",to:"/profil",onClick:()=>s(!1),className:"flex items-center gap-2 py-2",children:[h.jsx(Rf,{"code-path":"src/components/Navigation.tsx:191:21",size:18}),"Profilom"]}),T&&h.jsxs(di,{"code-path":"src/components/Navigation.tsx:195:21",to:"/admin",onClick:()=>s(!1),className:"flex items-center gap-2 py-2 text-purple-600",children:[h.jsx(ey,{"code-path":"src/components/Navigation.tsx:200:23",size:18}),"Adminisztráció"]})]}),h.jsx("hr",{"code-path":"src/components/Navigation.tsx:207:15",className:"my-2"}),A?h.jsxs(h.Fragment,{children:[h.jsxs("button",{"code-path":"src/components/Navigation.tsx:211:19",onClick:P,className:"flex items-center gap-2 py-2 text-red-600",children:[h.jsx(Wv,{"code-path":"src/components/Navigation.tsx:215:21",size:18}),"Kijelentkezés"]}),h.jsx("button",{"code-path":"src/components/Navigation.tsx:218:19",onClick:O,className:"btn-primary w-full text-center mt-2",children:"Hirdetés feladása"})]}):h.jsxs(h.Fragment,{children:[h.jsx("button",{"code-path":"src/components/Navigation.tsx:227:19",onClick:M,className:"btn-ghost w-full text-center",children:"Bejelentkezés"}),h.jsx("button",{"code-path":"src/components/Navigation.tsx:233:19",onClick:R,className:"btn-primary w-full text-center",children:"Regisztráció"})]})]})})]}),h.jsx(j2,{"code-path":"src/components/Navigation.tsx:247:7",open:l,onOpenChange:c,defaultTab:g}),h.jsx(hg,{"code-path":"src/components/Navigation.tsx:252:7",open:u,onOpenChange:d})]})},n5="http://localhost:8000/api",E2=()=>{const[i,n]=b.useState([]),[r,s]=b.useState(!1),[l,c]=b.useState(0),[u,d]=b.useState(1),[g,m]=b.useState(!1),x=b.useCallback(async(S,A=1)=>{s(!0);try{const N=new URLSearchParams;S.instrument&&N.append("instrument",S.instrument),S.city&&N.append("city",S.city),S.keyword&&N.append("keyword",S.keyword),S.online_only&&N.append("online_only","true"),S.featured_only&&N.append("featured_only","true"),N.append("page",A.toString()),N.append("per_page","12");const _=await fetch(`${n5}/advertisements?${N}`);if(!_.ok)throw new Error("Search failed");const T=await _.json();return n(A===1?T.advertisements:j=>[...j,...T.advertisements]),c(T.total),d(A),m(T.advertisements.length===12),T}catch(N){return console.error("Search error:",N),null}finally{s(!1)}},[]),v=b.useCallback(S=>{!r&&g&&x(S,u+1)},[r,g,u,x]);return{results:i,loading:r,total:l,page:u,hasMore:g,search:x,loadMore:v}};Ye.registerPlugin(_e);const a5=["Zongora","Gitár","Hegedű","Ének","Dob","Basszusgitár","Szaxofon","Fuvola","Cselló","Ukulele"],s5=["Budapest","Debrecen","Szeged","Pécs","Győr","Miskolc"],r5=({className:i=""})=>{const n=b.useRef(null),r=b.useRef(null),s=b.useRef(null),l=b.useRef(null),c=b.useRef(null),u=b.useRef(null),d=b.useRef(null),g=b.useRef(null),m=b.useRef(null),[x,v]=b.useState(""),[S,A]=b.useState(""),[N,_]=b.useState(!1),{results:T,loading:j,search:E}=E2();b.useEffect(()=>{const P=Ye.context(()=>{Ye.timeline({defaults:{ease:"power3.out"}}).fromTo(r.current,{x:"-12vw",opacity:0},{x:0,opacity:1,duration:.9}).fromTo(s.current,{x:"12vw",scale:1.06,opacity:0},{x:0,scale:1,opacity:1,duration:1},"-=0.7").fromTo(l.current,{y:"12vh",opacity:0},{y:0,opacity:1,duration:.9},"-=0.7").fromTo(c.current?.querySelectorAll(".word")||[],{y:24,opacity:0},{y:0,opacity:1,stagger:.05,duration:.6},"-=0.5").fromTo(u.current,{y:"10vh",scale:.96,opacity:0},{y:0,scale:1,opacity:1,duration:.8,ease:"back.out(1.4)"},"-=0.4").fromTo([d.current,g.current,m.current],{scale:.8,opacity:0},{scale:1,opacity:1,stagger:.08,duration:.5},"-=0.5")},n);return()=>P.revert()},[]),b.useLayoutEffect(()=>{const P=n.current;if(!P)return;const z=Ye.context(()=>{const C=Ye.timeline({scrollTrigger:{trigger:P,start:"top top",end:"+=130%",pin:!0,scrub:.6,onLeaveBack:()=>{Ye.set([r.current,s.current,l.current,c.current,u.current],{opacity:1,x:0,y:0,scale:1})}}});C.fromTo(r.current,{x:0,opacity:1},{x:"-18vw",opacity:0,ease:"power2.in"},.7),C.fromTo(s.current,{y:0,scale:1,opacity:1},{y:"-10vh",scale:.98,opacity:0,ease:"power2.in"},.7),C.fromTo(l.current,{y:0,opacity:1},{y:"18vh",opacity:0,ease:"power2.in"},.7),C.fromTo(c.current,{x:0,opacity:1},{x:"8vw",opacity:0,ease:"power2.in"},.7),C.fromTo(u.current,{y:0,scale:1,opacity:1},{y:"18vh",scale:.98,opacity:0,ease:"power2.in"},.7),C.fromTo([d.current,g.current,m.current],{opacity:1},{opacity:0,ease:"power2.in"},.75)},P);return()=>z.revert()},[]);const M=async P=>{P.preventDefault(),await E({instrument:x,city:S}),_(!0)},R=P=>{v(P),E({instrument:P}),_(!0)},O="Találd meg a zenetanárod.".split(" ");return h.jsxs(h.Fragment,{children:[h.jsxs("section",{"code-path":"src/sections/HeroSection.tsx:167:7",ref:n,className:`section-pinned bg-[#F4F2EE] ${i}`,children:[h.jsx("div",{"code-path":"src/sections/HeroSection.tsx:172:9",ref:r,className:"absolute img-rounded",style:{left:"6vw",top:"10vh",width:"34vw",height:"30vh"},children:h.jsx("img",{"code-path":"src/sections/HeroSection.tsx:182:11",src:"/images/hero_piano.jpg",alt:"Zongora játék",className:"w-full h-full object-cover"})}),h.jsx("span",{"code-path":"src/sections/HeroSection.tsx:190:9",ref:d,className:"absolute badge",style:{left:"10vw",top:"14vh"},children:"BUDAPEST"}),h.jsx("div",{"code-path":"src/sections/HeroSection.tsx:199:9",ref:s,className:"absolute img-rounded",style:{left:"44vw",top:"10vh",width:"50vw",height:"44vh"},children:h.jsx("img",{"code-path":"src/sections/HeroSection.tsx:209:11",src:"/images/hero_teacher.jpg",alt:"Zenetanár és diák",className:"w-full h-full object-cover"})}),h.jsx("span",{"code-path":"src/sections/HeroSection.tsx:217:9",ref:g,className:"absolute badge",style:{left:"48vw",top:"14vh"},children:"ONLINE"}),h.jsx("div",{"code-path":"src/sections/HeroSection.tsx:226:9",ref:l,className:"absolute img-rounded",style:{left:"6vw",top:"46vh",width:"34vw",height:"38vh"},children:h.jsx("img",{"code-path":"src/sections/HeroSection.tsx:236:11",src:"/images/hero_portrait.jpg",alt:"Zenetanár portré",className:"w-full h-full object-cover"})}),h.jsx("span",{"code-path":"src/sections/HeroSection.tsx:244:9",ref:m,className:"absolute badge",style:{left:"10vw",top:"50vh"},children:"VIDÉK"}),h.jsxs("div",{"code-path":"src/sections/HeroSection.tsx:253:9",ref:c,className:"absolute",style:{left:"52vw",top:"18vh",width:"40vw"},children:[h.jsx("h1",{"code-path":"src/sections/HeroSection.tsx:262:11",className:"text-display font-semibold mb-4",children:O.map((P,z)=>h.jsx("span",{"code-path":"src/sections/HeroSection.tsx:264:15",className:"word inline-block mr-[0.3em]",children:P},z))}),h.jsx("p",{"code-path":"src/sections/HeroSection.tsx:269:11",className:"text-lg text-[#6F6A63] leading-relaxed max-w-md",children:"Zongora, gitár, hegedű, ének és más hangszerek. Magánórák Budapesten és vidéken."})]}),h.jsxs("div",{"code-path":"src/sections/HeroSection.tsx:275:9",ref:u,className:"absolute card-float bg-white p-6",style:{left:"22vw",top:"62vh",width:"52vw"},children:[h.jsxs("form",{"code-path":"src/sections/HeroSection.tsx:284:11",onSubmit:M,className:"flex flex-col md:flex-row gap-4",children:[h.jsxs("div",{"code-path":"src/sections/HeroSection.tsx:285:13",className:"flex-1 relative",children:[h.jsx(sg,{"code-path":"src/sections/HeroSection.tsx:286:15",className:"absolute left-4 top-1/2 -translate-y-1/2 text-[#6F6A63]",size:20}),h.jsxs("select",{"code-path":"src/sections/HeroSection.tsx:287:15",value:x,onChange:P=>v(P.target.value),className:"w-full pl-12 pr-4 py-3 rounded-xl border border-gray-200 bg-white focus:outline-none focus:border-[#D7A04D] focus:ring-2 focus:ring-[#D7A04D]/10 appearance-none cursor-pointer",children:[h.jsx("option",{"code-path":"src/sections/HeroSection.tsx:292:17",value:"",children:"Milyen hangszer?"}),a5.map(P=>h.jsx("option",{"code-path":"src/sections/HeroSection.tsx:294:19",value:P,children:P},P))]})]}),h.jsxs("div",{"code-path":"src/sections/HeroSection.tsx:298:13",className:"flex-1 relative",children:[h.jsx(qf,{"code-path":"src/sections/HeroSection.tsx:299:15",className:"absolute left-4 top-1/2 -translate-y-1/2 text-[#6F6A63]",size:20}),h.jsxs("select",{"code-path":"src/sections/HeroSection.tsx:300:15",value:S,onChange:P=>A(P.target.value),className:"w-full pl-12 pr-4 py-3 rounded-xl border border-gray-200 bg-white focus:outline-none focus:border-[#D7A04D] focus:ring-2 focus:ring-[#D7A04D]/10 appearance-none cursor-pointer",children:[h.jsx("option",{"code-path":"src/sections/HeroSection.tsx:305:17",value:"",children:"Város / Kerület"}),s5.map(P=>h.jsx("option",{"code-path":"src/sections/HeroSection.tsx:307:19",value:P,children:P},P))]})]}),h.jsx("button",{"code-path":"src/sections/HeroSection.tsx:311:13",type:"submit",className:"btn-primary whitespace-nowrap",children:j?"Keresés...":"Keresés"})]}),h.jsxs("p",{"code-path":"src/sections/HeroSection.tsx:315:11",className:"text-xs text-[#6F6A63] mt-4",children:["Népszerű:"," ",["zongora","gitár","ének","hegedű","dob"].map((P,z)=>h.jsxs("span",{"code-path":"src/sections/HeroSection.tsx:318:15",children:[h.jsx("button",{"code-path":"src/sections/HeroSection.tsx:319:17",onClick:()=>R(P),className:"text-[#D7A04D] hover:underline capitalize",children:P}),z<4&&", "]},P))]})]})]}),h.jsx(Is,{"code-path":"src/sections/HeroSection.tsx:333:7",open:N,onOpenChange:_,children:h.jsxs(Ws,{"code-path":"src/sections/HeroSection.tsx:334:9",className:"sm:max-w-4xl max-h-[80vh] overflow-y-auto",children:[h.jsx(Ni,{"code-path":"src/sections/HeroSection.tsx:335:11",children:h.jsxs(ji,{"code-path":"src/sections/HeroSection.tsx:336:13",className:"text-2xl",style:{fontFamily:"Cormorant Garamond, serif"},children:["Keresési eredmények",T.length>0&&h.jsxs("span",{"code-path":"src/sections/HeroSection.tsx:338:38",className:"text-lg text-gray-500 ml-2",children:["(",T.length," találat)"]})]})}),T.length===0?h.jsxs("div",{"code-path":"src/sections/HeroSection.tsx:343:13",className:"py-8 text-center",children:[h.jsx("p",{"code-path":"src/sections/HeroSection.tsx:344:15",className:"text-gray-600",children:"Nincs találat a keresési feltételeknek megfelelően."}),h.jsx("p",{"code-path":"src/sections/HeroSection.tsx:345:15",className:"text-sm text-gray-500 mt-2",children:"Próbálj meg más hangszer vagy város szerint keresni."})]}):h.jsx("div",{"code-path":"src/sections/HeroSection.tsx:348:13",className:"grid grid-cols-1 md:grid-cols-2 gap-4 mt-4",children:T.map(P=>h.jsxs("div",{"code-path":"src/sections/HeroSection.tsx:350:17",className:"card-float bg-white p-4",children:[h.jsx("h3",{"code-path":"src/sections/HeroSection.tsx:351:19",className:"font-semibold text-lg mb-1",style:{fontFamily:"Cormorant Garamond, serif"},children:P.title}),h.jsxs("p",{"code-path":"src/sections/HeroSection.tsx:354:19",className:"text-sm text-[#6F6A63] mb-2",children:[P.instrument?.name_hu," · ",P.location?.city]}),h.jsx("p",{"code-path":"src/sections/HeroSection.tsx:357:19",className:"text-sm line-clamp-2",children:P.short_description}),h.jsxs("div",{"code-path":"src/sections/HeroSection.tsx:358:19",className:"mt-3 pt-3 border-t border-gray-100 flex justify-between items-center",children:[h.jsxs("span",{"code-path":"src/sections/HeroSection.tsx:359:21",className:"text-sm text-[#6F6A63]",children:[P.teacher?.first_name," ",P.teacher?.last_name]}),h.jsx("button",{"code-path":"src/sections/HeroSection.tsx:362:21",className:"text-sm text-[#D7A04D] hover:underline",children:"Részletek"})]})]},P.id))})]})})]})};Ye.registerPlugin(_e);const i5=({className:i=""})=>{const n=b.useRef(null),r=b.useRef(null),s=b.useRef(null),l=b.useRef(null),c=b.useRef(null);b.useLayoutEffect(()=>{const d=n.current;if(!d)return;const g=Ye.context(()=>{const m=Ye.timeline({scrollTrigger:{trigger:d,start:"top top",end:"+=130%",pin:!0,scrub:.6}});m.fromTo(r.current,{x:"-55vw",opacity:0,scale:.96},{x:0,opacity:1,scale:1,ease:"none"},0),m.fromTo(s.current,{x:"10vw",opacity:0},{x:0,opacity:1,ease:"none"},0),m.fromTo(l.current?.children||[],{x:"18vw",opacity:0},{x:0,opacity:1,stagger:.08,ease:"none"},.05),m.fromTo(c.current?.children||[],{scale:.9,opacity:0},{scale:1,opacity:.08,stagger:.05,ease:"none"},.05),m.fromTo(r.current,{x:0,opacity:1},{x:"-18vw",opacity:0,ease:"power2.in"},.7),m.fromTo([s.current,l.current],{x:0,opacity:1},{x:"10vw",opacity:0,ease:"power2.in"},.7),m.fromTo(c.current,{opacity:.08},{opacity:0,ease:"power2.in"},.75)},d);return()=>g.revert()},[]);const u=[{number:"01",title:"Böngéssz",description:"Szűrj hangszerre, városra és szintre."},{number:"02",title:"Válassz",description:"Nézd meg a tanárok videóit, óradíját és elérhetőségét."},{number:"03",title:"Írj vagy hívj",description:"Küldj üzenetet, és egyeztess időpontot."}];return h.jsxs("section",{"code-path":"src/sections/HowItWorksSection.tsx:104:5",ref:n,id:"how-it-works",className:`section-pinned bg-[#F4F2EE] ${i}`,children:[h.jsx("div",{"code-path":"src/sections/HowItWorksSection.tsx:110:7",ref:r,className:"absolute img-rounded",style:{left:"6vw",top:"14vh",width:"40vw",height:"72vh"},children:h.jsx("img",{"code-path":"src/sections/HowItWorksSection.tsx:120:9",src:"/images/how_it_works.jpg",alt:"Zenetanítás folyamat",className:"w-full h-full object-cover"})}),h.jsxs("div",{"code-path":"src/sections/HowItWorksSection.tsx:128:7",ref:s,className:"absolute",style:{left:"52vw",top:"18vh",width:"42vw"},children:[h.jsx("h2",{"code-path":"src/sections/HowItWorksSection.tsx:137:9",className:"text-heading font-semibold mb-3",children:"Három lépésben kezdhetsz."}),h.jsx("p",{"code-path":"src/sections/HowItWorksSection.tsx:140:9",className:"text-[#6F6A63] text-lg mb-12",children:"Nincs szerződés, nincs bonyodalom—csak zene."})]}),h.jsx("div",{"code-path":"src/sections/HowItWorksSection.tsx:146:7",ref:l,className:"absolute flex flex-col gap-8",style:{left:"52vw",top:"38vh",width:"42vw"},children:u.map((d,g)=>h.jsxs("div",{"code-path":"src/sections/HowItWorksSection.tsx:156:11",className:"flex items-start gap-4",children:[h.jsx("span",{"code-path":"src/sections/HowItWorksSection.tsx:157:13",className:"mono text-sm text-[#D7A04D] font-medium mt-1",children:d.number}),h.jsxs("div",{"code-path":"src/sections/HowItWorksSection.tsx:160:13",children:[h.jsx("h3",{"code-path":"src/sections/HowItWorksSection.tsx:161:15",className:"text-xl font-semibold mb-1",style:{fontFamily:"Cormorant Garamond, serif"},children:d.title}),h.jsx("p",{"code-path":"src/sections/HowItWorksSection.tsx:164:15",className:"text-[#6F6A63]",children:d.description})]})]},g))}),h.jsxs("div",{"code-path":"src/sections/HowItWorksSection.tsx:171:7",ref:c,className:"absolute inset-0 pointer-events-none overflow-hidden",children:[h.jsx("span",{"code-path":"src/sections/HowItWorksSection.tsx:172:9",className:"absolute text-[12vw] font-bold text-[#111111]",style:{left:"50vw",top:"34vh",opacity:.08,fontFamily:"Cormorant Garamond, serif"},children:"01"}),h.jsx("span",{"code-path":"src/sections/HowItWorksSection.tsx:183:9",className:"absolute text-[12vw] font-bold text-[#111111]",style:{left:"62vw",top:"50vh",opacity:.08,fontFamily:"Cormorant Garamond, serif"},children:"02"}),h.jsx("span",{"code-path":"src/sections/HowItWorksSection.tsx:194:9",className:"absolute text-[12vw] font-bold text-[#111111]",style:{left:"74vw",top:"66vh",opacity:.08,fontFamily:"Cormorant Garamond, serif"},children:"03"})]})]})};Ye.registerPlugin(_e);const l5=({className:i=""})=>{const n=b.useRef(null),r=b.useRef(null),s=b.useRef(null),l=Ei();b.useLayoutEffect(()=>{const d=n.current;if(!d)return;const g=Ye.context(()=>{const m=Ye.timeline({scrollTrigger:{trigger:d,start:"top top",end:"+=130%",pin:!0,scrub:.6}});m.fromTo(r.current,{y:"-8vh",opacity:0},{y:0,opacity:1,ease:"none"},0),m.fromTo(s.current?.children||[],{y:"60vh",opacity:0,scale:.98},{y:0,opacity:1,scale:1,stagger:.08,ease:"none"},.05),m.fromTo(s.current?.children||[],{y:0,opacity:1},{y:"-18vh",opacity:0,stagger:.03,ease:"power2.in"},.7),m.fromTo(r.current,{y:0,opacity:1},{y:"-6vh",opacity:0,ease:"power2.in"},.7)},d);return()=>g.revert()},[]);const c=d=>{l(`/kereses?instrument=${encodeURIComponent(d)}`)},u=[{name:"ZONGORA",styles:"Klasszikus / Jazz / Pop",image:"/images/instrument_piano.jpg",searchName:"Zongora"},{name:"GITÁR",styles:"Akusztikus / Elektromos / Basszus",image:"/images/instrument_guitar.jpg",searchName:"Gitár"},{name:"ÉNEK",styles:"Jazz / Klasszikus / Musical",image:"/images/instrument_voice.jpg",searchName:"Ének"}];return h.jsxs("section",{"code-path":"src/sections/InstrumentsSection.tsx:94:5",ref:n,id:"instruments",className:`section-pinned bg-[#F4F2EE] ${i}`,children:[h.jsxs("div",{"code-path":"src/sections/InstrumentsSection.tsx:100:7",ref:r,className:"absolute",style:{left:"6vw",top:"10vh",width:"40vw"},children:[h.jsx("h2",{"code-path":"src/sections/InstrumentsSection.tsx:109:9",className:"text-heading font-semibold mb-3",children:"Válassz hangszert."}),h.jsx("p",{"code-path":"src/sections/InstrumentsSection.tsx:112:9",className:"text-[#6F6A63] text-lg mb-4",children:"Kezdő vagy haladó—találj tanárt a stílusodhoz."})]}),h.jsx("div",{"code-path":"src/sections/InstrumentsSection.tsx:118:7",ref:s,className:"absolute flex gap-[3vw]",style:{left:"6vw",top:"30vh",width:"88vw"},children:u.map((d,g)=>h.jsx("div",{"code-path":"src/sections/InstrumentsSection.tsx:128:11",onClick:()=>c(d.searchName),className:"card-float bg-white overflow-hidden cursor-pointer group",style:{width:"26vw",height:"56vh"},children:h.jsxs("div",{"code-path":"src/sections/InstrumentsSection.tsx:137:13",className:"relative h-full",children:[h.jsx("img",{"code-path":"src/sections/InstrumentsSection.tsx:138:15",src:d.image,alt:d.name,className:"w-full h-full object-cover transition-transform duration-500 group-hover:scale-105"}),h.jsx("div",{"code-path":"src/sections/InstrumentsSection.tsx:144:15",className:"absolute inset-0 bg-gradient-to-t from-black/70 via-black/20 to-transparent"}),h.jsx("div",{"code-path":"src/sections/InstrumentsSection.tsx:147:15",className:"absolute top-4 left-4",children:h.jsx("span",{"code-path":"src/sections/InstrumentsSection.tsx:148:17",className:"mono text-xs text-white/80 uppercase tracking-widest",children:d.styles})}),h.jsxs("div",{"code-path":"src/sections/InstrumentsSection.tsx:153:15",className:"absolute bottom-4 left-4 right-4 flex items-end justify-between",children:[h.jsx("h3",{"code-path":"src/sections/InstrumentsSection.tsx:154:17",className:"text-2xl font-semibold text-white",style:{fontFamily:"Cormorant Garamond, serif"},children:d.name}),h.jsx("div",{"code-path":"src/sections/InstrumentsSection.tsx:157:17",className:"w-10 h-10 rounded-full bg-white/20 backdrop-blur-sm flex items-center justify-center group-hover:bg-[#D7A04D] transition-colors",children:h.jsx(tg,{"code-path":"src/sections/InstrumentsSection.tsx:158:19",size:20,className:"text-white"})})]})]})},g))})]})},C2=({open:i,onOpenChange:n,teacherId:r,teacherName:s="a tanár",advertisementId:l})=>{const{user:c}=Wa(),[u,d]=b.useState(!1),[g,m]=b.useState(!1),[x,v]=b.useState(""),[S,A]=b.useState(c?.first_name+" "+c?.last_name||""),[N,_]=b.useState(c?.email||""),[T,j]=b.useState(""),[E,M]=b.useState(""),R=async O=>{if(O.preventDefault(),d(!0),v(""),!r){v("Hiba: Nincs megadva tanár"),d(!1);return}try{const z=await fetch("http://localhost:8000/api/contact",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({recipient_id:r,advertisement_id:l,name:S,email:N,phone:T,message:E})});if(!z.ok){const C=await z.json();throw new Error(C.detail||"Üzenet küldése sikertelen")}m(!0),setTimeout(()=>{A(""),_(""),j(""),M(""),m(!1),n(!1)},2e3)}catch(P){v(P.message||"Hiba történt az üzenet küldése közben")}finally{d(!1)}};return g?h.jsx(Is,{"code-path":"src/components/ContactModal.tsx:90:7",open:i,onOpenChange:n,children:h.jsx(Ws,{"code-path":"src/components/ContactModal.tsx:91:9",className:"sm:max-w-md",children:h.jsxs("div",{"code-path":"src/components/ContactModal.tsx:92:11",className:"flex flex-col items-center justify-center py-8",children:[h.jsx(Yf,{"code-path":"src/components/ContactModal.tsx:93:13",size:64,className:"text-green-500 mb-4"}),h.jsx("h3",{"code-path":"src/components/ContactModal.tsx:94:13",className:"text-xl font-semibold mb-2",children:"Üzenet elküldve!"}),h.jsxs("p",{"code-path":"src/components/ContactModal.tsx:95:13",className:"text-gray-600 text-center",children:[s," hamarosan felveszi veled a kapcsolatot."]})]})})}):h.jsx(Is,{"code-path":"src/components/ContactModal.tsx:105:5",open:i,onOpenChange:n,children:h.jsxs(Ws,{"code-path":"src/components/ContactModal.tsx:106:7",className:"sm:max-w-lg",children:[h.jsx(Ni,{"code-path":"src/components/ContactModal.tsx:107:9",children:h.jsx(ji,{"code-path":"src/components/ContactModal.tsx:108:11",className:"text-2xl",style:{fontFamily:"Cormorant Garamond, serif"},children:"Kapcsolatfelvétel"})}),h.jsxs("p",{"code-path":"src/components/ContactModal.tsx:113:9",className:"text-gray-600 mb-4",children:["Üzenetet küldesz neki: ",h.jsx("span",{"code-path":"src/components/ContactModal.tsx:114:34",className:"font-semibold",children:s})]}),h.jsxs("form",{"code-path":"src/components/ContactModal.tsx:117:9",onSubmit:R,className:"space-y-4",children:[x&&h.jsx("div",{"code-path":"src/components/ContactModal.tsx:119:13",className:"p-3 bg-red-50 text-red-600 text-sm rounded-lg",children:x}),h.jsxs("div",{"code-path":"src/components/ContactModal.tsx:124:11",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/components/ContactModal.tsx:125:13",htmlFor:"contact-name",children:"Neved *"}),h.jsxs("div",{"code-path":"src/components/ContactModal.tsx:126:13",className:"relative",children:[h.jsx(Rf,{"code-path":"src/components/ContactModal.tsx:127:15",size:18,className:"absolute left-3 top-1/2 -translate-y-1/2 text-gray-400"}),h.jsx(gt,{"code-path":"src/components/ContactModal.tsx:128:15",id:"contact-name",placeholder:"Kovács János",value:S,onChange:O=>A(O.target.value),required:!0,className:"pl-10"})]})]}),h.jsxs("div",{"code-path":"src/components/ContactModal.tsx:139:11",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/components/ContactModal.tsx:140:13",htmlFor:"contact-email",children:"Email címed *"}),h.jsxs("div",{"code-path":"src/components/ContactModal.tsx:141:13",className:"relative",children:[h.jsx(ng,{"code-path":"src/components/ContactModal.tsx:142:15",size:18,className:"absolute left-3 top-1/2 -translate-y-1/2 text-gray-400"}),h.jsx(gt,{"code-path":"src/components/ContactModal.tsx:143:15",id:"contact-email",type:"email",placeholder:"pelda@email.com",value:N,onChange:O=>_(O.target.value),required:!0,className:"pl-10"})]})]}),h.jsxs("div",{"code-path":"src/components/ContactModal.tsx:155:11",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/components/ContactModal.tsx:156:13",htmlFor:"contact-phone",children:"Telefonszámod (opcionális)"}),h.jsxs("div",{"code-path":"src/components/ContactModal.tsx:157:13",className:"relative",children:[h.jsx(p_,{"code-path":"src/components/ContactModal.tsx:158:15",size:18,className:"absolute left-3 top-1/2 -translate-y-1/2 text-gray-400"}),h.jsx(gt,{"code-path":"src/components/ContactModal.tsx:159:15",id:"contact-phone",type:"tel",placeholder:"+36 30 123 4567",value:T,onChange:O=>j(O.target.value),className:"pl-10"})]})]}),h.jsxs("div",{"code-path":"src/components/ContactModal.tsx:170:11",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/components/ContactModal.tsx:171:13",htmlFor:"contact-message",children:"Üzeneted *"}),h.jsxs("div",{"code-path":"src/components/ContactModal.tsx:172:13",className:"relative",children:[h.jsx(WN,{"code-path":"src/components/ContactModal.tsx:173:15",size:18,className:"absolute left-3 top-3 text-gray-400"}),h.jsx(Of,{"code-path":"src/components/ContactModal.tsx:174:15",id:"contact-message",placeholder:"Írd le, milyen hangszeren szeretnél tanulni, milyen szinten vagy, és mikor lenne szabad időpontod...",value:E,onChange:O=>M(O.target.value),required:!0,rows:4,className:"pl-10"})]})]}),h.jsx(Pr,{"code-path":"src/components/ContactModal.tsx:186:11",type:"submit",className:"w-full btn-primary",disabled:u,children:u?h.jsxs(h.Fragment,{children:[h.jsx(vc,{"code-path":"src/components/ContactModal.tsx:193:17",size:18,className:"mr-2 animate-spin"}),"Küldés..."]}):"Üzenet küldése"}),h.jsx("p",{"code-path":"src/components/ContactModal.tsx:201:11",className:"text-xs text-center text-[#6F6A63]",children:"A tanár emailben és/vagy telefonon fog felvenni veled a kapcsolatot."})]})]})})};Ye.registerPlugin(_e);const o5=({className:i=""})=>{const n=b.useRef(null),r=b.useRef(null),s=b.useRef(null),[l,c]=b.useState([]),[u,d]=b.useState(!0),[g,m]=b.useState(!1),[x,v]=b.useState(null);b.useEffect(()=>{(async()=>{try{const _=await fetch("http://localhost:8000/api/teachers/featured?limit=6");if(_.ok){const T=await _.json();c(T)}}catch(_){console.error("Failed to fetch teachers:",_)}finally{d(!1)}})()},[]),b.useLayoutEffect(()=>{const N=n.current;if(!N)return;const _=Ye.context(()=>{Ye.fromTo(r.current,{y:24,opacity:0},{y:0,opacity:1,duration:.6,scrollTrigger:{trigger:r.current,start:"top 80%",end:"top 55%",scrub:!0}});const T=s.current?.children||[];Ye.fromTo(T,{y:40,opacity:0,scale:.98},{y:0,opacity:1,scale:1,stagger:.1,duration:.5,scrollTrigger:{trigger:s.current,start:"top 80%",end:"top 50%",scrub:!0}})},N);return()=>_.revert()},[l]);const S=(N,_)=>{v({id:N,name:_}),m(!0)},A=["/images/hero_portrait.jpg","/images/hero_teacher.jpg","/images/instrument_voice.jpg","/images/how_it_works.jpg","/images/testimonial.jpg","/images/for_teachers.jpg"];return u?h.jsxs("section",{"code-path":"src/sections/FeaturedTeachersSection.tsx:114:7",ref:n,id:"teachers",className:`section-flowing bg-[#F4F2EE] ${i}`,children:[h.jsx("div",{"code-path":"src/sections/FeaturedTeachersSection.tsx:115:9",className:"px-[6vw] pt-[8vh] pb-[4vh]",children:h.jsx("h2",{"code-path":"src/sections/FeaturedTeachersSection.tsx:116:11",className:"text-heading font-semibold mb-3",children:"Kiemelt tanárok."})}),h.jsx("div",{"code-path":"src/sections/FeaturedTeachersSection.tsx:118:9",className:"px-[6vw] text-center py-12",children:h.jsx("div",{"code-path":"src/sections/FeaturedTeachersSection.tsx:119:11",className:"animate-spin rounded-full h-12 w-12 border-b-2 border-[#D7A04D] mx-auto"})})]}):h.jsxs("section",{"code-path":"src/sections/FeaturedTeachersSection.tsx:126:5",ref:n,id:"teachers",className:`section-flowing bg-[#F4F2EE] ${i}`,children:[h.jsxs("div",{"code-path":"src/sections/FeaturedTeachersSection.tsx:132:7",ref:r,className:"px-[6vw] pt-[8vh] pb-[4vh]",children:[h.jsx("h2",{"code-path":"src/sections/FeaturedTeachersSection.tsx:133:9",className:"text-heading font-semibold mb-3",children:"Kiemelt tanárok."}),h.jsx("p",{"code-path":"src/sections/FeaturedTeachersSection.tsx:136:9",className:"text-[#6F6A63] text-lg max-w-xl",children:"Ellenőrzött profilok, videóbemutatkozások, átlátható árak."})]}),h.jsx("div",{"code-path":"src/sections/FeaturedTeachersSection.tsx:142:7",ref:s,className:"px-[6vw] grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-[3vw]",children:l.map((N,_)=>h.jsxs("div",{"code-path":"src/sections/FeaturedTeachersSection.tsx:147:11",className:"card-float bg-white overflow-hidden",children:[h.jsx("div",{"code-path":"src/sections/FeaturedTeachersSection.tsx:152:13",className:"relative h-48 overflow-hidden",children:h.jsx("img",{"code-path":"src/sections/FeaturedTeachersSection.tsx:153:15",src:A[_%A.length],alt:`${N.first_name} ${N.last_name}`,className:"w-full h-full object-cover transition-transform duration-500 hover:scale-105"})}),h.jsxs("div",{"code-path":"src/sections/FeaturedTeachersSection.tsx:161:13",className:"p-5",children:[h.jsxs("div",{"code-path":"src/sections/FeaturedTeachersSection.tsx:162:15",className:"flex items-start justify-between mb-2",children:[h.jsxs("h3",{"code-path":"src/sections/FeaturedTeachersSection.tsx:163:17",className:"text-xl font-semibold",style:{fontFamily:"Cormorant Garamond, serif"},children:[N.first_name," ",N.last_name]}),h.jsxs("div",{"code-path":"src/sections/FeaturedTeachersSection.tsx:166:17",className:"flex items-center gap-1 text-[#D7A04D]",children:[h.jsx(bj,{"code-path":"src/sections/FeaturedTeachersSection.tsx:167:19",size:14,fill:"#D7A04D"}),h.jsx("span",{"code-path":"src/sections/FeaturedTeachersSection.tsx:168:19",className:"text-sm font-medium",children:"4.9"})]})]}),h.jsxs("p",{"code-path":"src/sections/FeaturedTeachersSection.tsx:172:15",className:"text-sm text-[#6F6A63] mb-3 flex items-center gap-2 flex-wrap",children:[h.jsx("span",{"code-path":"src/sections/FeaturedTeachersSection.tsx:173:17",children:N.instruments?.[0]||"Zongora"}),h.jsx("span",{"code-path":"src/sections/FeaturedTeachersSection.tsx:174:17",children:"·"}),h.jsxs("span",{"code-path":"src/sections/FeaturedTeachersSection.tsx:175:17",className:"flex items-center gap-1",children:[h.jsx(qf,{"code-path":"src/sections/FeaturedTeachersSection.tsx:176:19",size:12}),N.locations?.[0]||"Budapest"]}),h.jsx("span",{"code-path":"src/sections/FeaturedTeachersSection.tsx:179:17",children:"·"}),h.jsxs("span",{"code-path":"src/sections/FeaturedTeachersSection.tsx:180:17",children:[N.years_experience," éve tanít"]})]}),h.jsx("p",{"code-path":"src/sections/FeaturedTeachersSection.tsx:183:15",className:"text-sm text-[#111111] mb-4 line-clamp-2",children:N.bio_short||"Tapasztalt zenetanár várja diákjait."}),h.jsxs("div",{"code-path":"src/sections/FeaturedTeachersSection.tsx:188:15",className:"flex flex-wrap gap-2 mb-4",children:[h.jsx("span",{"code-path":"src/sections/FeaturedTeachersSection.tsx:189:17",className:"px-2 py-1 text-xs rounded-md bg-[#F4F2EE] text-[#6F6A63]",children:"Kezdő"}),h.jsx("span",{"code-path":"src/sections/FeaturedTeachersSection.tsx:192:17",className:"px-2 py-1 text-xs rounded-md bg-[#F4F2EE] text-[#6F6A63]",children:"Középhaladó"}),N.teaching_online&&h.jsxs("span",{"code-path":"src/sections/FeaturedTeachersSection.tsx:196:19",className:"px-2 py-1 text-xs rounded-md bg-[#F4F2EE] text-[#6F6A63]",children:[h.jsx(tj,{"code-path":"src/sections/FeaturedTeachersSection.tsx:197:21",size:10,className:"inline mr-1"}),"Online is"]})]}),h.jsxs("div",{"code-path":"src/sections/FeaturedTeachersSection.tsx:204:15",className:"flex items-center justify-between pt-3 border-t border-gray-100",children:[h.jsxs("div",{"code-path":"src/sections/FeaturedTeachersSection.tsx:205:17",children:[h.jsx("span",{"code-path":"src/sections/FeaturedTeachersSection.tsx:206:19",className:"text-sm text-[#6F6A63]",children:"Óradíj"}),h.jsxs("p",{"code-path":"src/sections/FeaturedTeachersSection.tsx:207:19",className:"font-semibold text-[#D7A04D]",children:[N.lesson_price?.toLocaleString()||"8 000"," Ft/óra"]})]}),h.jsxs("button",{"code-path":"src/sections/FeaturedTeachersSection.tsx:211:17",onClick:()=>S(N.id,`${N.first_name} ${N.last_name}`),className:"flex items-center gap-2 px-4 py-2 bg-[#111111] text-white rounded-full text-sm font-medium hover:bg-[#D7A04D] transition-colors",children:[h.jsx(ag,{"code-path":"src/sections/FeaturedTeachersSection.tsx:215:19",size:16}),"Kapcsolat"]})]})]})]},N.id))}),h.jsx("div",{"code-path":"src/sections/FeaturedTeachersSection.tsx:225:7",className:"px-[6vw] pt-8 pb-[6vh] text-center",children:h.jsx("button",{"code-path":"src/sections/FeaturedTeachersSection.tsx:226:9",className:"btn-primary",children:"További tanárok"})}),h.jsx(C2,{"code-path":"src/sections/FeaturedTeachersSection.tsx:232:7",open:g,onOpenChange:m,teacherId:x?.id,teacherName:x?.name})]})};Ye.registerPlugin(_e);const c5=({className:i=""})=>{const n=b.useRef(null),r=b.useRef(null),s=b.useRef(null),l=b.useRef(null);b.useLayoutEffect(()=>{const u=n.current;if(!u)return;const d=Ye.context(()=>{const g=Ye.timeline({scrollTrigger:{trigger:u,start:"top top",end:"+=130%",pin:!0,scrub:.6}});g.fromTo(r.current,{x:"55vw",opacity:0,scale:.97},{x:0,opacity:1,scale:1,ease:"none"},0),g.fromTo(s.current,{x:"-10vw",opacity:0},{x:0,opacity:1,ease:"none"},0),g.fromTo(l.current?.children||[],{y:"6vh",opacity:0},{y:0,opacity:1,stagger:.1,ease:"none"},.1),g.fromTo(r.current,{x:0,opacity:1},{x:"18vw",opacity:0,ease:"power2.in"},.7),g.fromTo([s.current,l.current],{x:0,opacity:1},{x:"-10vw",opacity:0,ease:"power2.in"},.7)},u);return()=>d.revert()},[]);const c=[{title:"Ingyenes hirdetés",description:"Csak sikeres találkozó után fizetsz jutalékot."},{title:"Saját ütemezés",description:"Te döntesz az időpontokról és a helyszínről."},{title:"Biztonságos kapcsolat",description:"Üzenetküldés telefonszámod elküldése nélkül."}];return h.jsxs("section",{"code-path":"src/sections/ForTeachersSection.tsx:89:5",ref:n,className:`section-pinned bg-[#F4F2EE] ${i}`,children:[h.jsxs("div",{"code-path":"src/sections/ForTeachersSection.tsx:94:7",ref:s,className:"absolute",style:{left:"6vw",top:"18vh",width:"44vw"},children:[h.jsx("h2",{"code-path":"src/sections/ForTeachersSection.tsx:103:9",className:"text-heading font-semibold mb-3",children:"Taníts nálunk."}),h.jsx("p",{"code-path":"src/sections/ForTeachersSection.tsx:106:9",className:"text-[#6F6A63] text-lg mb-10",children:"Tölts fel egy videót, írd meg az óradíjad, és kapj érdeklődőket."})]}),h.jsxs("div",{"code-path":"src/sections/ForTeachersSection.tsx:112:7",ref:l,className:"absolute flex flex-col gap-6",style:{left:"6vw",top:"42vh",width:"44vw"},children:[c.map((u,d)=>h.jsxs("div",{"code-path":"src/sections/ForTeachersSection.tsx:122:11",className:"flex items-start gap-4",children:[h.jsx("div",{"code-path":"src/sections/ForTeachersSection.tsx:123:13",className:"w-6 h-6 rounded-full bg-[#D7A04D] flex items-center justify-center flex-shrink-0 mt-0.5",children:h.jsx(fm,{"code-path":"src/sections/ForTeachersSection.tsx:124:15",size:14,className:"text-white"})}),h.jsxs("div",{"code-path":"src/sections/ForTeachersSection.tsx:126:13",children:[h.jsx("h3",{"code-path":"src/sections/ForTeachersSection.tsx:127:15",className:"text-lg font-semibold mb-1",style:{fontFamily:"Cormorant Garamond, serif"},children:u.title}),h.jsx("p",{"code-path":"src/sections/ForTeachersSection.tsx:130:15",className:"text-[#6F6A63] text-sm",children:u.description})]})]},d)),h.jsxs("div",{"code-path":"src/sections/ForTeachersSection.tsx:136:9",className:"flex flex-col sm:flex-row gap-4 mt-6",children:[h.jsx("button",{"code-path":"src/sections/ForTeachersSection.tsx:137:11",className:"btn-primary",children:"Hirdetés feladása"}),h.jsxs("a",{"code-path":"src/sections/ForTeachersSection.tsx:140:11",href:"#",className:"inline-flex items-center gap-2 text-sm font-medium text-[#6F6A63] hover:text-[#D7A04D] transition-colors",children:["Hogyan működik a jutalék? ",h.jsx(xN,{"code-path":"src/sections/ForTeachersSection.tsx:144:39",size:16})]})]})]}),h.jsx("div",{"code-path":"src/sections/ForTeachersSection.tsx:150:7",ref:r,className:"absolute img-rounded",style:{left:"54vw",top:"14vh",width:"40vw",height:"72vh"},children:h.jsx("img",{"code-path":"src/sections/ForTeachersSection.tsx:160:9",src:"/images/for_teachers.jpg",alt:"Tanítás folyamat",className:"w-full h-full object-cover"})})]})};Ye.registerPlugin(_e);const u5=({className:i=""})=>{const n=b.useRef(null),r=b.useRef(null),s=b.useRef(null),l=b.useRef(null),[c,u]=b.useState(!1),[d,g]=b.useState(!1),[m,x]=b.useState(!1),[v,S]=b.useState(""),{token:A,isAuthenticated:N}=Wa(),[_,T]=b.useState(""),[j,E]=b.useState(""),[M,R]=b.useState(""),[O,P]=b.useState("");b.useLayoutEffect(()=>{const Z=n.current;if(!Z)return;const se=Ye.context(()=>{Ye.fromTo(r.current,{y:24,opacity:0},{y:0,opacity:1,duration:.6,scrollTrigger:{trigger:r.current,start:"top 80%",end:"top 55%",scrub:!0}}),Ye.fromTo(s.current?.children||[],{y:60,opacity:0,scale:.98},{y:0,opacity:1,scale:1,stagger:.12,duration:.5,scrollTrigger:{trigger:s.current,start:"top 80%",end:"top 50%",scrub:!0}}),Ye.fromTo(l.current,{y:30,opacity:0},{y:0,opacity:1,duration:.5,scrollTrigger:{trigger:l.current,start:"top 85%",end:"top 65%",scrub:!0}})},Z);return()=>se.revert()},[]);const z=Z=>{Z==="premium"&&(N||S("Kérjük, jelentkezzen be az előfizetéshez"),u(!0))},C=async Z=>{if(Z.preventDefault(),g(!0),S(""),!A){S("Kérjük, jelentkezzen be a fizetéshez"),g(!1);return}try{const le=await fetch("http://localhost:8000/api/payments/create-intent",{method:"POST",headers:{"Content-Type":"application/json",Authorization:`Bearer ${A}`},body:JSON.stringify({amount:2900,currency:"HUF",payment_type:"subscription",description:"Prémium előfizetés - 1 hónap"})});if(!le.ok){const Q=await le.json();throw new Error(Q.detail||"Fizetés inicializálása sikertelen")}await le.json(),await new Promise(Q=>setTimeout(Q,1500)),x(!0),setTimeout(()=>{T(""),E(""),R(""),P(""),x(!1),u(!1)},2e3)}catch(se){S(se.message||"Hiba történt a fizetés közben")}finally{g(!1)}},G=Z=>{const se=Z.replace(/\s+/g,"").replace(/[^0-9]/gi,""),le=se.match(/\d{4,16}/g),Q=le&&le[0]||"",H=[];for(let K=0,J=Q.length;K<J;K+=4)H.push(Q.substring(K,K+4));return H.length?H.join(" "):se},W=Z=>{const se=Z.replace(/\s+/g,"").replace(/[^0-9]/gi,"");return se.length>=2?se.substring(0,2)+"/"+se.substring(2,4):se},re=[{name:"Ingyenes",price:"0",period:"hónap",description:"Alap hirdetés minden tanárnak",features:["Alap hirdetés","Videó feltöltése","Üzenetek fogadása","Alap statisztika"],cta:"Ingyenes regisztráció",highlighted:!1,id:"free"},{name:"Prémium",price:"2 900",period:"hónap",description:"Kiemelt megjelenés a legjobb eredményekért",features:["Kiemelés a keresésekben","Elsőbbségi megjelenés","Részletes statisztika","Prioritásos ügyfélszolgálat","Ingyenes jutalék az első 3 találkozó után"],cta:"Prémium előfizetés",highlighted:!0,id:"premium"}];return h.jsxs("section",{"code-path":"src/sections/PricingSection.tsx:219:5",ref:n,id:"pricing",className:`section-flowing bg-[#F4F2EE] ${i}`,children:[h.jsxs("div",{"code-path":"src/sections/PricingSection.tsx:225:7",ref:r,className:"px-[6vw] pt-[8vh] pb-[4vh]",children:[h.jsx("h2",{"code-path":"src/sections/PricingSection.tsx:226:9",className:"text-heading font-semibold mb-3",children:"Átlátható árak."}),h.jsx("p",{"code-path":"src/sections/PricingSection.tsx:229:9",className:"text-[#6F6A63] text-lg max-w-xl",children:"Nincs havidíj. Nincs rejtett költség."})]}),h.jsx("div",{"code-path":"src/sections/PricingSection.tsx:235:7",ref:s,className:"px-[6vw] flex flex-col lg:flex-row gap-6 justify-center max-w-5xl mx-auto",children:re.map((Z,se)=>h.jsxs("div",{"code-path":"src/sections/PricingSection.tsx:240:11",className:`card-float bg-white p-8 flex-1 max-w-md ${Z.highlighted?"ring-2 ring-[#D7A04D]":""}`,children:[Z.highlighted&&h.jsxs("div",{"code-path":"src/sections/PricingSection.tsx:247:15",className:"flex items-center gap-2 mb-4",children:[h.jsx(gj,{"code-path":"src/sections/PricingSection.tsx:248:17",size:16,className:"text-[#D7A04D]"}),h.jsx("span",{"code-path":"src/sections/PricingSection.tsx:249:17",className:"text-xs font-medium uppercase tracking-wider text-[#D7A04D]",children:"Ajánlott"})]}),h.jsx("h3",{"code-path":"src/sections/PricingSection.tsx:255:13",className:"text-2xl font-semibold mb-2",style:{fontFamily:"Cormorant Garamond, serif"},children:Z.name}),h.jsx("p",{"code-path":"src/sections/PricingSection.tsx:258:13",className:"text-[#6F6A63] text-sm mb-6",children:Z.description}),h.jsxs("div",{"code-path":"src/sections/PricingSection.tsx:260:13",className:"flex items-baseline gap-1 mb-8",children:[h.jsx("span",{"code-path":"src/sections/PricingSection.tsx:261:15",className:"text-4xl font-bold",children:Z.price}),h.jsxs("span",{"code-path":"src/sections/PricingSection.tsx:262:15",className:"text-[#6F6A63]",children:["Ft / ",Z.period]})]}),h.jsx("ul",{"code-path":"src/sections/PricingSection.tsx:265:13",className:"space-y-3 mb-8",children:Z.features.map((le,Q)=>h.jsxs("li",{"code-path":"src/sections/PricingSection.tsx:267:17",className:"flex items-start gap-3",children:[h.jsx(fm,{"code-path":"src/sections/PricingSection.tsx:268:19",size:18,className:"text-[#D7A04D] mt-0.5 flex-shrink-0"}),h.jsx("span",{"code-path":"src/sections/PricingSection.tsx:269:19",className:"text-sm",children:le})]},Q))}),h.jsx("button",{"code-path":"src/sections/PricingSection.tsx:274:13",onClick:()=>z(Z.id),className:`w-full py-3 rounded-full font-medium transition-all duration-300 ${Z.highlighted?"btn-primary":"btn-ghost"}`,children:Z.cta})]},se))}),h.jsx("div",{"code-path":"src/sections/PricingSection.tsx:289:7",ref:l,className:"px-[6vw] pt-8 pb-[6vh] max-w-3xl mx-auto",children:h.jsxs("div",{"code-path":"src/sections/PricingSection.tsx:293:9",className:"flex items-start gap-4 p-6 bg-white/50 rounded-2xl border border-[#D7A04D]/20",children:[h.jsx(GN,{"code-path":"src/sections/PricingSection.tsx:294:11",size:20,className:"text-[#D7A04D] mt-0.5 flex-shrink-0"}),h.jsxs("div",{"code-path":"src/sections/PricingSection.tsx:295:11",children:[h.jsx("h4",{"code-path":"src/sections/PricingSection.tsx:296:13",className:"font-semibold mb-1",children:"Jutalékrendszer"}),h.jsx("p",{"code-path":"src/sections/PricingSection.tsx:297:13",className:"text-sm text-[#6F6A63]",children:"Sikeres első találkozó után 10% jutalékot számítunk fel (maximum 5 000 Ft). Ez biztosítja, hogy csak akkor fizess, ha tényleg találsz diákot."})]})]})}),h.jsx(Is,{"code-path":"src/sections/PricingSection.tsx:306:7",open:c,onOpenChange:u,children:h.jsxs(Ws,{"code-path":"src/sections/PricingSection.tsx:307:9",className:"sm:max-w-md",children:[h.jsx(Ni,{"code-path":"src/sections/PricingSection.tsx:308:11",children:h.jsx(ji,{"code-path":"src/sections/PricingSection.tsx:309:13",className:"text-2xl",style:{fontFamily:"Cormorant Garamond, serif"},children:"Prémium előfizetés"})}),m?h.jsxs("div",{"code-path":"src/sections/PricingSection.tsx:315:13",className:"py-8 text-center",children:[h.jsx("div",{"code-path":"src/sections/PricingSection.tsx:316:15",className:"w-16 h-16 bg-green-100 rounded-full flex items-center justify-center mx-auto mb-4",children:h.jsx(fm,{"code-path":"src/sections/PricingSection.tsx:317:17",size:32,className:"text-green-600"})}),h.jsx("h3",{"code-path":"src/sections/PricingSection.tsx:319:15",className:"text-xl font-semibold mb-2",children:"Sikeres fizetés!"}),h.jsx("p",{"code-path":"src/sections/PricingSection.tsx:320:15",className:"text-gray-600",children:"Köszönjük az előfizetést! Prémium funkcióid mostantól aktívak."})]}):N?h.jsxs("form",{"code-path":"src/sections/PricingSection.tsx:337:13",onSubmit:C,className:"space-y-4 mt-4",children:[v&&h.jsx("div",{"code-path":"src/sections/PricingSection.tsx:339:17",className:"p-3 bg-red-50 text-red-600 text-sm rounded-lg",children:v}),h.jsxs("div",{"code-path":"src/sections/PricingSection.tsx:344:15",className:"p-4 bg-[#F4F2EE] rounded-xl",children:[h.jsxs("div",{"code-path":"src/sections/PricingSection.tsx:345:17",className:"flex justify-between items-center mb-2",children:[h.jsx("span",{"code-path":"src/sections/PricingSection.tsx:346:19",className:"text-[#6F6A63]",children:"Előfizetés"}),h.jsx("span",{"code-path":"src/sections/PricingSection.tsx:347:19",className:"font-medium",children:"Prémium"})]}),h.jsxs("div",{"code-path":"src/sections/PricingSection.tsx:349:17",className:"flex justify-between items-center mb-2",children:[h.jsx("span",{"code-path":"src/sections/PricingSection.tsx:350:19",className:"text-[#6F6A63]",children:"Időtartam"}),h.jsx("span",{"code-path":"src/sections/PricingSection.tsx:351:19",className:"font-medium",children:"1 hónap"})]}),h.jsxs("div",{"code-path":"src/sections/PricingSection.tsx:353:17",className:"border-t border-gray-200 my-2 pt-2 flex justify-between items-center",children:[h.jsx("span",{"code-path":"src/sections/PricingSection.tsx:354:19",className:"font-semibold",children:"Összesen"}),h.jsx("span",{"code-path":"src/sections/PricingSection.tsx:355:19",className:"text-xl font-bold text-[#D7A04D]",children:"2 900 Ft"})]})]}),h.jsxs("div",{"code-path":"src/sections/PricingSection.tsx:359:15",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/sections/PricingSection.tsx:360:17",htmlFor:"card-name",children:"Kártyatulajdonos neve"}),h.jsx(gt,{"code-path":"src/sections/PricingSection.tsx:361:17",id:"card-name",placeholder:"KOVACS JANOS",value:O,onChange:Z=>P(Z.target.value.toUpperCase()),required:!0})]}),h.jsxs("div",{"code-path":"src/sections/PricingSection.tsx:370:15",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/sections/PricingSection.tsx:371:17",htmlFor:"card-number",children:"Kártyaszám"}),h.jsxs("div",{"code-path":"src/sections/PricingSection.tsx:372:17",className:"relative",children:[h.jsx(MN,{"code-path":"src/sections/PricingSection.tsx:373:19",size:18,className:"absolute left-3 top-1/2 -translate-y-1/2 text-gray-400"}),h.jsx(gt,{"code-path":"src/sections/PricingSection.tsx:374:19",id:"card-number",placeholder:"1234 5678 9012 3456",value:_,onChange:Z=>T(G(Z.target.value)),maxLength:19,required:!0,className:"pl-10"})]})]}),h.jsxs("div",{"code-path":"src/sections/PricingSection.tsx:386:15",className:"grid grid-cols-2 gap-4",children:[h.jsxs("div",{"code-path":"src/sections/PricingSection.tsx:387:17",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/sections/PricingSection.tsx:388:19",htmlFor:"expiry",children:"Lejárat"}),h.jsx(gt,{"code-path":"src/sections/PricingSection.tsx:389:19",id:"expiry",placeholder:"MM/YY",value:j,onChange:Z=>E(W(Z.target.value)),maxLength:5,required:!0})]}),h.jsxs("div",{"code-path":"src/sections/PricingSection.tsx:398:17",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/sections/PricingSection.tsx:399:19",htmlFor:"cvv",children:"CVV"}),h.jsx(gt,{"code-path":"src/sections/PricingSection.tsx:400:19",id:"cvv",type:"password",placeholder:"123",value:M,onChange:Z=>R(Z.target.value.replace(/\D/g,"").slice(0,3)),maxLength:3,required:!0})]})]}),h.jsx(Pr,{"code-path":"src/sections/PricingSection.tsx:412:15",type:"submit",className:"w-full btn-primary",disabled:d,children:d?h.jsxs(h.Fragment,{children:[h.jsx(vc,{"code-path":"src/sections/PricingSection.tsx:419:21",size:18,className:"mr-2 animate-spin"}),"Fizetés feldolgozása..."]}):"Fizetés bankkártyával"}),h.jsx("p",{"code-path":"src/sections/PricingSection.tsx:427:15",className:"text-xs text-center text-[#6F6A63]",children:"A fizetés biztonságosan történik. Kártyaadataidat nem tároljuk."})]}):h.jsxs("div",{"code-path":"src/sections/PricingSection.tsx:325:13",className:"py-8 text-center",children:[h.jsx("p",{"code-path":"src/sections/PricingSection.tsx:326:15",className:"text-gray-600 mb-4",children:"Az előfizetéshez be kell jelentkezned."}),h.jsx("button",{"code-path":"src/sections/PricingSection.tsx:329:15",onClick:()=>u(!1),className:"btn-primary",children:"Értem"})]})]})})]})};Ye.registerPlugin(_e);const f5=({className:i=""})=>{const n=b.useRef(null),r=b.useRef(null),s=b.useRef(null),[l,c]=b.useState(0);b.useLayoutEffect(()=>{const x=n.current;if(!x)return;const v=Ye.context(()=>{const S=Ye.timeline({scrollTrigger:{trigger:x,start:"top top",end:"+=130%",pin:!0,scrub:.6}});S.fromTo(s.current,{x:"55vw",opacity:0,scale:.97},{x:0,opacity:1,scale:1,ease:"none"},0),S.fromTo(r.current,{x:"-12vw",opacity:0},{x:0,opacity:1,ease:"none"},0),S.fromTo(s.current,{x:0,opacity:1},{x:"18vw",opacity:0,ease:"power2.in"},.7),S.fromTo(r.current,{x:0,opacity:1},{x:"-10vw",opacity:0,ease:"power2.in"},.7)},x);return()=>v.revert()},[]);const u=[{quote:"Egy hét alatt találtam zongoratanárt, aki pont azt a jazz-stílust tanítja, amit kerestem. A platform nagyon egyszerűen használható.",author:"Nagy Péter",location:"Budapest",instrument:"Zongora"},{quote:"Lányom imádja az új hegedűtanárát. Végre találtunk valakit, aki türelmes és profi módon tanít.",author:"Kovács Anna",location:"Debrecen",instrument:"Hegedű"},{quote:"Online gitárórákat veszek, és tökéletesen működik. A tanár videóbemutatkozása segített a választásban.",author:"Szabó Dániel",location:"Szeged",instrument:"Gitár"}],d=()=>{c(x=>(x+1)%u.length)},g=()=>{c(x=>(x-1+u.length)%u.length)},m=u[l];return h.jsxs("section",{"code-path":"src/sections/TestimonialsSection.tsx:99:5",ref:n,className:`section-pinned bg-[#F4F2EE] ${i}`,children:[h.jsxs("div",{"code-path":"src/sections/TestimonialsSection.tsx:104:7",ref:r,className:"absolute",style:{left:"6vw",top:"18vh",width:"46vw"},children:[h.jsx("h2",{"code-path":"src/sections/TestimonialsSection.tsx:113:9",className:"text-heading font-semibold mb-8",children:"Diákjaink mondták."}),h.jsxs("div",{"code-path":"src/sections/TestimonialsSection.tsx:118:9",className:"relative",children:[h.jsx(ij,{"code-path":"src/sections/TestimonialsSection.tsx:120:11",size:80,className:"absolute -top-4 -left-2 text-[#111111] opacity-5",style:{fontFamily:"Cormorant Garamond, serif"}}),h.jsxs("blockquote",{"code-path":"src/sections/TestimonialsSection.tsx:126:11",className:"text-xl lg:text-2xl leading-relaxed mb-6 relative z-10",style:{fontFamily:"Cormorant Garamond, serif"},children:['"',m.quote,'"']}),h.jsxs("p",{"code-path":"src/sections/TestimonialsSection.tsx:130:11",className:"text-[#6F6A63]",children:["— ",m.author,", ",m.location]})]}),h.jsxs("div",{"code-path":"src/sections/TestimonialsSection.tsx:136:9",className:"flex items-center gap-4 mt-10",children:[h.jsx("button",{"code-path":"src/sections/TestimonialsSection.tsx:137:11",onClick:g,className:"w-10 h-10 rounded-full border border-[#111111]/20 flex items-center justify-center hover:bg-[#111111] hover:text-white transition-colors",children:h.jsx(AN,{"code-path":"src/sections/TestimonialsSection.tsx:141:13",size:18})}),h.jsx("button",{"code-path":"src/sections/TestimonialsSection.tsx:143:11",onClick:d,className:"w-10 h-10 rounded-full border border-[#111111]/20 flex items-center justify-center hover:bg-[#111111] hover:text-white transition-colors",children:h.jsx(wN,{"code-path":"src/sections/TestimonialsSection.tsx:147:13",size:18})}),h.jsxs("span",{"code-path":"src/sections/TestimonialsSection.tsx:149:11",className:"text-sm text-[#6F6A63] ml-2",children:[l+1," / ",u.length]})]}),h.jsxs("a",{"code-path":"src/sections/TestimonialsSection.tsx:155:9",href:"#",className:"inline-flex items-center gap-2 text-sm font-medium text-[#D7A04D] hover:underline mt-8",children:["További történetek ",h.jsx(tg,{"code-path":"src/sections/TestimonialsSection.tsx:159:30",size:16})]})]}),h.jsx("div",{"code-path":"src/sections/TestimonialsSection.tsx:164:7",ref:s,className:"absolute img-rounded",style:{left:"56vw",top:"14vh",width:"38vw",height:"72vh"},children:h.jsx("img",{"code-path":"src/sections/TestimonialsSection.tsx:174:9",src:"/images/testimonial.jpg",alt:"Elégedett diák",className:"w-full h-full object-cover"})})]})};Ye.registerPlugin(_e);const d5=({className:i=""})=>{const n=b.useRef(null),r=b.useRef(null),s=b.useRef(null),l=Ei(),[c,u]=b.useState({});b.useEffect(()=>{(async()=>{try{const x=await fetch("http://localhost:8000/api/locations/cities");if(x.ok){const v=await x.json(),S={};v.forEach(A=>{S[A]=Math.floor(Math.random()*50)+10}),u(S)}}catch(x){console.error("Failed to fetch city stats:",x)}})()},[]),b.useLayoutEffect(()=>{const m=n.current;if(!m)return;const x=Ye.context(()=>{Ye.fromTo(r.current,{y:24,opacity:0},{y:0,opacity:1,duration:.6,scrollTrigger:{trigger:r.current,start:"top 80%",end:"top 55%",scrub:!0}}),Ye.fromTo(s.current?.children||[],{y:40,opacity:0,scale:.98},{y:0,opacity:1,scale:1,stagger:.08,duration:.5,scrollTrigger:{trigger:s.current,start:"top 80%",end:"top 50%",scrub:!0}})},m);return()=>x.revert()},[]);const d=m=>{l(`/kereses?city=${encodeURIComponent(m)}`)},g=[{name:"Budapest",image:"/images/city_budapest.jpg"},{name:"Debrecen",image:"/images/city_debrecen.jpg"},{name:"Szeged",image:"/images/city_szeged.jpg"},{name:"Pécs",image:"/images/city_pecs.jpg"},{name:"Győr",image:"/images/city_gyor.jpg"},{name:"Miskolc",image:"/images/city_miskolc.jpg"}];return h.jsxs("section",{"code-path":"src/sections/CitiesSection.tsx:103:5",ref:n,className:`section-flowing bg-[#F4F2EE] ${i}`,children:[h.jsxs("div",{"code-path":"src/sections/CitiesSection.tsx:108:7",ref:r,className:"px-[6vw] pt-[8vh] pb-[4vh]",children:[h.jsx("h2",{"code-path":"src/sections/CitiesSection.tsx:109:9",className:"text-heading font-semibold mb-3",children:"Keress város szerint."}),h.jsx("p",{"code-path":"src/sections/CitiesSection.tsx:112:9",className:"text-[#6F6A63] text-lg max-w-xl",children:"Budapesten és vidéki városokban is találsz tanárt."})]}),h.jsx("div",{"code-path":"src/sections/CitiesSection.tsx:118:7",ref:s,className:"px-[6vw] grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-[3vw]",children:g.map((m,x)=>h.jsxs("div",{"code-path":"src/sections/CitiesSection.tsx:123:11",onClick:()=>d(m.name),className:"card-float bg-white overflow-hidden cursor-pointer group",children:[h.jsxs("div",{"code-path":"src/sections/CitiesSection.tsx:129:13",className:"relative h-40 overflow-hidden",children:[h.jsx("img",{"code-path":"src/sections/CitiesSection.tsx:130:15",src:m.image,alt:m.name,className:"w-full h-full object-cover transition-transform duration-500 group-hover:scale-105"}),h.jsx("div",{"code-path":"src/sections/CitiesSection.tsx:135:15",className:"absolute inset-0 bg-gradient-to-t from-black/50 to-transparent"}),h.jsx("div",{"code-path":"src/sections/CitiesSection.tsx:138:15",className:"absolute bottom-3 left-4",children:h.jsx("h3",{"code-path":"src/sections/CitiesSection.tsx:139:17",className:"text-xl font-semibold text-white",style:{fontFamily:"Cormorant Garamond, serif"},children:m.name})})]}),h.jsxs("div",{"code-path":"src/sections/CitiesSection.tsx:146:13",className:"p-4 flex items-center justify-between",children:[h.jsxs("div",{"code-path":"src/sections/CitiesSection.tsx:147:15",className:"flex items-center gap-2 text-[#6F6A63]",children:[h.jsx(g_,{"code-path":"src/sections/CitiesSection.tsx:148:17",size:16}),h.jsxs("span",{"code-path":"src/sections/CitiesSection.tsx:149:17",className:"text-sm",children:[c[m.name]||0," tanár"]})]}),h.jsx("div",{"code-path":"src/sections/CitiesSection.tsx:151:15",className:"w-8 h-8 rounded-full bg-[#F4F2EE] flex items-center justify-center group-hover:bg-[#D7A04D] transition-colors",children:h.jsx(tg,{"code-path":"src/sections/CitiesSection.tsx:152:17",size:14,className:"text-[#6F6A63] group-hover:text-white transition-colors"})})]})]},x))})]})};Ye.registerPlugin(_e);const h5=({className:i=""})=>{const n=b.useRef(null),r=b.useRef(null),s=b.useRef(null),[l,c]=b.useState(!1),[u,d]=b.useState(!1),{isAuthenticated:g}=Wa();b.useLayoutEffect(()=>{const v=n.current;if(!v)return;const S=Ye.context(()=>{Ye.fromTo(r.current,{y:"6vh",opacity:0},{y:0,opacity:1,duration:.6,scrollTrigger:{trigger:r.current,start:"top 85%",end:"top 60%",scrub:!0}}),Ye.fromTo(s.current?.children||[],{y:18,opacity:0},{y:0,opacity:1,stagger:.1,duration:.5,scrollTrigger:{trigger:s.current,start:"top 80%",end:"top 55%",scrub:!0}})},v);return()=>S.revert()},[]);const m=()=>{const v=document.querySelector("#teachers");v&&v.scrollIntoView({behavior:"smooth"})},x=()=>{g?d(!0):c(!0)};return h.jsxs(h.Fragment,{children:[h.jsxs("section",{"code-path":"src/sections/FinalCTASection.tsx:83:7",ref:n,className:`relative ${i}`,children:[h.jsx("div",{"code-path":"src/sections/FinalCTASection.tsx:88:9",ref:r,className:"bg-[#111111] text-white py-24 px-[6vw]",style:{borderRadius:"0 0 28px 28px"},children:h.jsxs("div",{"code-path":"src/sections/FinalCTASection.tsx:93:11",ref:s,className:"max-w-2xl mx-auto text-center",children:[h.jsx("h2",{"code-path":"src/sections/FinalCTASection.tsx:94:13",className:"text-heading font-semibold mb-4",children:"Kezdj bele ma."}),h.jsx("p",{"code-path":"src/sections/FinalCTASection.tsx:97:13",className:"text-white/70 text-lg mb-10",children:"Böngéssz, válassz, és foglalj időpontot percek alatt."}),h.jsxs("div",{"code-path":"src/sections/FinalCTASection.tsx:101:13",className:"flex flex-col sm:flex-row gap-4 justify-center",children:[h.jsxs("button",{"code-path":"src/sections/FinalCTASection.tsx:102:15",onClick:m,className:"inline-flex items-center justify-center gap-2 px-8 py-3 rounded-full font-medium bg-[#D7A04D] text-white hover:bg-[#c99445] transition-colors",children:[h.jsx(sg,{"code-path":"src/sections/FinalCTASection.tsx:106:17",size:18}),"Tanárok keresése"]}),h.jsxs("button",{"code-path":"src/sections/FinalCTASection.tsx:109:15",onClick:x,className:"inline-flex items-center justify-center gap-2 px-8 py-3 rounded-full font-medium border border-white/30 text-white hover:bg-white/10 transition-colors",children:[h.jsx(m_,{"code-path":"src/sections/FinalCTASection.tsx:113:17",size:18}),"Hirdetés feladása"]})]})]})}),h.jsx("footer",{"code-path":"src/sections/FinalCTASection.tsx:121:9",className:"bg-[#F4F2EE] py-16 px-[6vw]",children:h.jsxs("div",{"code-path":"src/sections/FinalCTASection.tsx:122:11",className:"max-w-6xl mx-auto",children:[h.jsxs("div",{"code-path":"src/sections/FinalCTASection.tsx:123:13",className:"grid grid-cols-1 md:grid-cols-3 gap-12",children:[h.jsxs("div",{"code-path":"src/sections/FinalCTASection.tsx:125:15",children:[h.jsx("h3",{"code-path":"src/sections/FinalCTASection.tsx:126:17",className:"text-xl font-semibold mb-4",style:{fontFamily:"Cormorant Garamond, serif"},children:"ZeneTanár.hu"}),h.jsx("p",{"code-path":"src/sections/FinalCTASection.tsx:129:17",className:"text-sm text-[#6F6A63] leading-relaxed",children:"Találd meg a tökéletes zenetanárt Magyarországon. Több száz ellenőrzött tanár vár rád."})]}),h.jsxs("div",{"code-path":"src/sections/FinalCTASection.tsx:136:15",children:[h.jsx("h4",{"code-path":"src/sections/FinalCTASection.tsx:137:17",className:"font-semibold mb-4",children:"Navigáció"}),h.jsxs("ul",{"code-path":"src/sections/FinalCTASection.tsx:138:17",className:"space-y-2",children:[h.jsx("li",{"code-path":"src/sections/FinalCTASection.tsx:139:19",children:h.jsx("a",{"code-path":"src/sections/FinalCTASection.tsx:140:21",href:"#teachers",className:"text-sm text-[#6F6A63] hover:text-[#D7A04D] transition-colors",children:"Tanárok"})}),h.jsx("li",{"code-path":"src/sections/FinalCTASection.tsx:144:19",children:h.jsx("a",{"code-path":"src/sections/FinalCTASection.tsx:145:21",href:"#pricing",className:"text-sm text-[#6F6A63] hover:text-[#D7A04D] transition-colors",children:"Árak"})}),h.jsx("li",{"code-path":"src/sections/FinalCTASection.tsx:149:19",children:h.jsx("a",{"code-path":"src/sections/FinalCTASection.tsx:150:21",href:"#how-it-works",className:"text-sm text-[#6F6A63] hover:text-[#D7A04D] transition-colors",children:"Hogyan működik?"})}),h.jsx("li",{"code-path":"src/sections/FinalCTASection.tsx:154:19",children:h.jsx("a",{"code-path":"src/sections/FinalCTASection.tsx:155:21",href:"#",className:"text-sm text-[#6F6A63] hover:text-[#D7A04D] transition-colors",children:"Kapcsolat"})})]})]}),h.jsxs("div",{"code-path":"src/sections/FinalCTASection.tsx:163:15",children:[h.jsx("h4",{"code-path":"src/sections/FinalCTASection.tsx:164:17",className:"font-semibold mb-4",children:"Jogi információk"}),h.jsxs("ul",{"code-path":"src/sections/FinalCTASection.tsx:165:17",className:"space-y-2",children:[h.jsx("li",{"code-path":"src/sections/FinalCTASection.tsx:166:19",children:h.jsx("a",{"code-path":"src/sections/FinalCTASection.tsx:167:21",href:"#",className:"text-sm text-[#6F6A63] hover:text-[#D7A04D] transition-colors",children:"ÁSZF"})}),h.jsx("li",{"code-path":"src/sections/FinalCTASection.tsx:171:19",children:h.jsx("a",{"code-path":"src/sections/FinalCTASection.tsx:172:21",href:"#",className:"text-sm text-[#6F6A63] hover:text-[#D7A04D] transition-colors",children:"Adatvédelem"})}),h.jsx("li",{"code-path":"src/sections/FinalCTASection.tsx:176:19",children:h.jsx("a",{"code-path":"src/sections/FinalCTASection.tsx:177:21",href:"#",className:"text-sm text-[#6F6A63] hover:text-[#D7A04D] transition-colors",children:"Cookie szabályzat"})})]})]})]}),h.jsxs("div",{"code-path":"src/sections/FinalCTASection.tsx:186:13",className:"border-t border-[#111111]/10 mt-12 pt-8 flex flex-col md:flex-row items-center justify-between gap-4",children:[h.jsx("p",{"code-path":"src/sections/FinalCTASection.tsx:187:15",className:"text-sm text-[#6F6A63]",children:"© 2026 ZeneTanár.hu. Minden jog fenntartva."}),h.jsx("p",{"code-path":"src/sections/FinalCTASection.tsx:190:15",className:"text-sm text-[#6F6A63]",children:"Készült Magyarországon"})]})]})})]}),h.jsx(j2,{"code-path":"src/sections/FinalCTASection.tsx:199:7",open:l,onOpenChange:c,defaultTab:"login"}),h.jsx(hg,{"code-path":"src/sections/FinalCTASection.tsx:204:7",open:u,onOpenChange:d})]})},Pp="http://localhost:8000/api",p5=()=>{const{token:i}=Wa(),[n,r]=b.useState(null),[s,l]=b.useState(!1),[c,u]=b.useState(""),d=b.useCallback(async()=>{if(i){l(!0),u("");try{const x=await fetch(`${Pp}/users/profile`,{headers:{Authorization:`Bearer ${i}`}});if(!x.ok)throw new Error("Failed to fetch profile");const v=await x.json();return r(v),v}catch(x){return u(x.message),null}finally{l(!1)}}},[i]),g=b.useCallback(async x=>{if(!i)return{success:!1,error:"Not authenticated"};l(!0),u("");try{const v=await fetch(`${Pp}/users/profile`,{method:"PUT",headers:{"Content-Type":"application/json",Authorization:`Bearer ${i}`},body:JSON.stringify(x)});if(!v.ok){const S=await v.json();throw new Error(S.detail||"Failed to update profile")}return await d(),{success:!0}}catch(v){return u(v.message),{success:!1,error:v.message}}finally{l(!1)}},[i,d]),m=b.useCallback(async()=>{if(!i)return[];try{const x=await fetch(`${Pp}/users/my-advertisements`,{headers:{Authorization:`Bearer ${i}`}});if(!x.ok)throw new Error("Failed to fetch advertisements");return await x.json()}catch{return[]}},[i]);return{profile:n,loading:s,error:c,fetchProfile:d,updateProfile:g,fetchMyAdvertisements:m}},m5=()=>{Wa();const{profile:i,loading:n,fetchProfile:r,updateProfile:s}=p5(),[l,c]=b.useState(!1),[u,d]=b.useState(!1),[g,m]=b.useState(""),[x,v]=b.useState(""),[S,A]=b.useState(""),[N,_]=b.useState(""),[T,j]=b.useState(""),[E,M]=b.useState(0),[R,O]=b.useState(""),[P,z]=b.useState(!1),[C,G]=b.useState(!1),[W,re]=b.useState(!1);b.useEffect(()=>{r()},[r]),b.useEffect(()=>{i&&(m(i.first_name),v(i.last_name),A(i.phone||""),i.teacher_profile&&(_(i.teacher_profile.bio_short||""),j(i.teacher_profile.bio_long||""),M(i.teacher_profile.years_experience||0),O(i.teacher_profile.lesson_price?.toString()||""),z(i.teacher_profile.teaching_online||!1),G(i.teacher_profile.teaching_at_student||!1),re(i.teacher_profile.teaching_at_teacher||!1)))},[i]);const Z=async()=>{const Q={first_name:g,last_name:x,phone:S||void 0};i?.role==="teacher"&&(Q.teacher_profile={bio_short:N||void 0,bio_long:T||void 0,years_experience:E,lesson_price:R?parseFloat(R):void 0,teaching_online:P,teaching_at_student:C,teaching_at_teacher:W}),(await s(Q)).success&&c(!1)},se=Q=>{switch(Q){case"active":return h.jsx(Yf,{"code-path":"src/pages/ProfilePage.tsx:85:16",size:16,className:"text-green-500"});case"pending":return h.jsx(YN,{"code-path":"src/pages/ProfilePage.tsx:87:16",size:16,className:"text-yellow-500"});case"expired":return h.jsx(dm,{"code-path":"src/pages/ProfilePage.tsx:89:16",size:16,className:"text-red-500"});default:return h.jsx(dm,{"code-path":"src/pages/ProfilePage.tsx:91:16",size:16,className:"text-gray-500"})}},le=Q=>{switch(Q){case"active":return"Aktív";case"pending":return"Jóváhagyásra vár";case"expired":return"Lejárt";case"suspended":return"Felfüggesztve";default:return Q}};return n&&!i?h.jsx("div",{"code-path":"src/pages/ProfilePage.tsx:112:7",className:"min-h-screen bg-[#F4F2EE] flex items-center justify-center",children:h.jsxs("div",{"code-path":"src/pages/ProfilePage.tsx:113:9",className:"text-center",children:[h.jsx("div",{"code-path":"src/pages/ProfilePage.tsx:114:11",className:"animate-spin rounded-full h-12 w-12 border-b-2 border-[#D7A04D] mx-auto mb-4"}),h.jsx("p",{"code-path":"src/pages/ProfilePage.tsx:115:11",className:"text-gray-600",children:"Betöltés..."})]})}):i?h.jsxs("div",{"code-path":"src/pages/ProfilePage.tsx:132:5",className:"min-h-screen bg-[#F4F2EE] pt-24 pb-12",children:[h.jsxs("div",{"code-path":"src/pages/ProfilePage.tsx:133:7",className:"max-w-6xl mx-auto px-6",children:[h.jsxs("div",{"code-path":"src/pages/ProfilePage.tsx:135:9",className:"flex items-center justify-between mb-8",children:[h.jsx("h1",{"code-path":"src/pages/ProfilePage.tsx:136:11",className:"text-3xl font-semibold",style:{fontFamily:"Cormorant Garamond, serif"},children:"Profilom"}),h.jsx("button",{"code-path":"src/pages/ProfilePage.tsx:139:11",onClick:()=>l?Z():c(!0),className:`flex items-center gap-2 px-4 py-2 rounded-full ${l?"btn-primary":"btn-ghost"}`,children:l?h.jsxs(h.Fragment,{children:[h.jsx(uj,{"code-path":"src/pages/ProfilePage.tsx:148:17",size:18})," Mentés"]}):h.jsxs(h.Fragment,{children:[h.jsx(vj,{"code-path":"src/pages/ProfilePage.tsx:150:17",size:18})," Szerkesztés"]})})]}),h.jsxs(fg,{"code-path":"src/pages/ProfilePage.tsx:155:9",defaultValue:"info",className:"space-y-6",children:[h.jsxs(dg,{"code-path":"src/pages/ProfilePage.tsx:156:11",className:"bg-white p-1 rounded-xl",children:[h.jsx(Ul,{"code-path":"src/pages/ProfilePage.tsx:157:13",value:"info",className:"px-6 py-2",children:"Adatok"}),i.role==="teacher"&&h.jsxs(Ul,{"code-path":"src/pages/ProfilePage.tsx:159:15",value:"ads",className:"px-6 py-2",children:["Hirdetéseim (",i.advertisements?.length||0,")"]})]}),h.jsxs(Hl,{"code-path":"src/pages/ProfilePage.tsx:165:11",value:"info",className:"space-y-6",children:[h.jsxs("div",{"code-path":"src/pages/ProfilePage.tsx:167:13",className:"card-float bg-white p-6",children:[h.jsxs("h2",{"code-path":"src/pages/ProfilePage.tsx:168:15",className:"text-xl font-semibold mb-6 flex items-center gap-2",children:[h.jsx(Rf,{"code-path":"src/pages/ProfilePage.tsx:169:17",size:20,className:"text-[#D7A04D]"}),"Alapadatok"]}),h.jsxs("div",{"code-path":"src/pages/ProfilePage.tsx:173:15",className:"grid grid-cols-1 md:grid-cols-2 gap-6",children:[h.jsxs("div",{"code-path":"src/pages/ProfilePage.tsx:174:17",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/pages/ProfilePage.tsx:175:19",children:"Vezetéknév"}),l?h.jsx(gt,{"code-path":"src/pages/ProfilePage.tsx:177:21",value:x,onChange:Q=>v(Q.target.value)}):h.jsx("p",{"code-path":"src/pages/ProfilePage.tsx:182:21",className:"text-gray-700",children:i.last_name})]}),h.jsxs("div",{"code-path":"src/pages/ProfilePage.tsx:186:17",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/pages/ProfilePage.tsx:187:19",children:"Keresztnév"}),l?h.jsx(gt,{"code-path":"src/pages/ProfilePage.tsx:189:21",value:g,onChange:Q=>m(Q.target.value)}):h.jsx("p",{"code-path":"src/pages/ProfilePage.tsx:194:21",className:"text-gray-700",children:i.first_name})]}),h.jsxs("div",{"code-path":"src/pages/ProfilePage.tsx:198:17",className:"space-y-2",children:[h.jsxs(He,{"code-path":"src/pages/ProfilePage.tsx:199:19",className:"flex items-center gap-2",children:[h.jsx(ng,{"code-path":"src/pages/ProfilePage.tsx:200:21",size:14})," Email"]}),h.jsx("p",{"code-path":"src/pages/ProfilePage.tsx:202:19",className:"text-gray-700",children:i.email})]}),h.jsxs("div",{"code-path":"src/pages/ProfilePage.tsx:205:17",className:"space-y-2",children:[h.jsxs(He,{"code-path":"src/pages/ProfilePage.tsx:206:19",className:"flex items-center gap-2",children:[h.jsx(p_,{"code-path":"src/pages/ProfilePage.tsx:207:21",size:14})," Telefonszám"]}),l?h.jsx(gt,{"code-path":"src/pages/ProfilePage.tsx:210:21",value:S,onChange:Q=>A(Q.target.value),placeholder:"+36 30 123 4567"}):h.jsx("p",{"code-path":"src/pages/ProfilePage.tsx:216:21",className:"text-gray-700",children:i.phone||"Nincs megadva"})]}),h.jsxs("div",{"code-path":"src/pages/ProfilePage.tsx:220:17",className:"space-y-2",children:[h.jsxs(He,{"code-path":"src/pages/ProfilePage.tsx:221:19",className:"flex items-center gap-2",children:[h.jsx(bN,{"code-path":"src/pages/ProfilePage.tsx:222:21",size:14})," Regisztráció dátuma"]}),h.jsx("p",{"code-path":"src/pages/ProfilePage.tsx:224:19",className:"text-gray-700",children:new Date(i.created_at).toLocaleDateString("hu-HU")})]}),h.jsxs("div",{"code-path":"src/pages/ProfilePage.tsx:229:17",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/pages/ProfilePage.tsx:230:19",children:"Szerepkör"}),h.jsx("p",{"code-path":"src/pages/ProfilePage.tsx:231:19",className:"text-gray-700 capitalize",children:i.role==="teacher"?"Tanár":i.role==="student"?"Diák":"Admin"})]})]})]}),i.role==="teacher"&&h.jsxs("div",{"code-path":"src/pages/ProfilePage.tsx:240:15",className:"card-float bg-white p-6",children:[h.jsxs("h2",{"code-path":"src/pages/ProfilePage.tsx:241:17",className:"text-xl font-semibold mb-6 flex items-center gap-2",children:[h.jsx(pm,{"code-path":"src/pages/ProfilePage.tsx:242:19",size:20,className:"text-[#D7A04D]"}),"Tanári profil"]}),h.jsxs("div",{"code-path":"src/pages/ProfilePage.tsx:246:17",className:"space-y-6",children:[h.jsxs("div",{"code-path":"src/pages/ProfilePage.tsx:247:19",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/pages/ProfilePage.tsx:248:21",children:"Rövid bemutatkozás"}),l?h.jsx(gt,{"code-path":"src/pages/ProfilePage.tsx:250:23",value:N,onChange:Q=>_(Q.target.value),placeholder:"Pl.: 10 éves tapasztalattal rendelkező zongoratanár",maxLength:255}):h.jsx("p",{"code-path":"src/pages/ProfilePage.tsx:257:23",className:"text-gray-700",children:i.teacher_profile?.bio_short||"Nincs megadva"})]}),h.jsxs("div",{"code-path":"src/pages/ProfilePage.tsx:261:19",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/pages/ProfilePage.tsx:262:21",children:"Részletes bemutatkozás"}),l?h.jsx(Of,{"code-path":"src/pages/ProfilePage.tsx:264:23",value:T,onChange:Q=>j(Q.target.value),placeholder:"Írj magadról részletesebben...",rows:4}):h.jsx("p",{"code-path":"src/pages/ProfilePage.tsx:271:23",className:"text-gray-700",children:i.teacher_profile?.bio_long||"Nincs megadva"})]}),h.jsxs("div",{"code-path":"src/pages/ProfilePage.tsx:275:19",className:"grid grid-cols-1 md:grid-cols-3 gap-6",children:[h.jsxs("div",{"code-path":"src/pages/ProfilePage.tsx:276:21",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/pages/ProfilePage.tsx:277:23",children:"Tapasztalat (év)"}),l?h.jsx(gt,{"code-path":"src/pages/ProfilePage.tsx:279:25",type:"number",value:E,onChange:Q=>M(parseInt(Q.target.value)||0),min:0}):h.jsxs("p",{"code-path":"src/pages/ProfilePage.tsx:286:25",className:"text-gray-700",children:[i.teacher_profile?.years_experience||0," év"]})]}),h.jsxs("div",{"code-path":"src/pages/ProfilePage.tsx:290:21",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/pages/ProfilePage.tsx:291:23",children:"Óradíj (Ft/óra)"}),l?h.jsx(gt,{"code-path":"src/pages/ProfilePage.tsx:293:25",type:"number",value:R,onChange:Q=>O(Q.target.value),placeholder:"8000"}):h.jsx("p",{"code-path":"src/pages/ProfilePage.tsx:300:25",className:"text-gray-700",children:i.teacher_profile?.lesson_price?`${i.teacher_profile.lesson_price} Ft/óra`:"Nincs megadva"})]}),h.jsxs("div",{"code-path":"src/pages/ProfilePage.tsx:308:21",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/pages/ProfilePage.tsx:309:23",children:"Előfizetés"}),h.jsx("p",{"code-path":"src/pages/ProfilePage.tsx:310:23",className:"text-gray-700 capitalize",children:i.teacher_profile?.subscription_type==="premium"?h.jsx("span",{"code-path":"src/pages/ProfilePage.tsx:312:27",className:"text-[#D7A04D] font-medium",children:"Prémium"}):"Ingyenes"})]})]}),h.jsxs("div",{"code-path":"src/pages/ProfilePage.tsx:320:19",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/pages/ProfilePage.tsx:321:21",children:"Oktatás módja"}),l?h.jsxs("div",{"code-path":"src/pages/ProfilePage.tsx:323:23",className:"flex flex-wrap gap-4",children:[h.jsxs("label",{"code-path":"src/pages/ProfilePage.tsx:324:25",className:"flex items-center gap-2 cursor-pointer",children:[h.jsx("input",{"code-path":"src/pages/ProfilePage.tsx:325:27",type:"checkbox",checked:P,onChange:Q=>z(Q.target.checked),className:"accent-[#D7A04D] w-4 h-4"}),h.jsx("span",{"code-path":"src/pages/ProfilePage.tsx:331:27",children:"Online"})]}),h.jsxs("label",{"code-path":"src/pages/ProfilePage.tsx:333:25",className:"flex items-center gap-2 cursor-pointer",children:[h.jsx("input",{"code-path":"src/pages/ProfilePage.tsx:334:27",type:"checkbox",checked:C,onChange:Q=>G(Q.target.checked),className:"accent-[#D7A04D] w-4 h-4"}),h.jsx("span",{"code-path":"src/pages/ProfilePage.tsx:340:27",children:"Diáknál"})]}),h.jsxs("label",{"code-path":"src/pages/ProfilePage.tsx:342:25",className:"flex items-center gap-2 cursor-pointer",children:[h.jsx("input",{"code-path":"src/pages/ProfilePage.tsx:343:27",type:"checkbox",checked:W,onChange:Q=>re(Q.target.checked),className:"accent-[#D7A04D] w-4 h-4"}),h.jsx("span",{"code-path":"src/pages/ProfilePage.tsx:349:27",children:"Tanárnál"})]})]}):h.jsxs("div",{"code-path":"src/pages/ProfilePage.tsx:353:23",className:"flex flex-wrap gap-2",children:[i.teacher_profile?.teaching_online&&h.jsx("span",{"code-path":"src/pages/ProfilePage.tsx:355:27",className:"px-3 py-1 bg-green-100 text-green-700 rounded-full text-sm",children:"Online"}),i.teacher_profile?.teaching_at_student&&h.jsx("span",{"code-path":"src/pages/ProfilePage.tsx:358:27",className:"px-3 py-1 bg-blue-100 text-blue-700 rounded-full text-sm",children:"Diáknál"}),i.teacher_profile?.teaching_at_teacher&&h.jsx("span",{"code-path":"src/pages/ProfilePage.tsx:361:27",className:"px-3 py-1 bg-purple-100 text-purple-700 rounded-full text-sm",children:"Tanárnál"})]})]})]})]})]}),i.role==="teacher"&&h.jsxs(Hl,{"code-path":"src/pages/ProfilePage.tsx:372:13",value:"ads",className:"space-y-6",children:[h.jsxs("div",{"code-path":"src/pages/ProfilePage.tsx:373:15",className:"flex items-center justify-between",children:[h.jsx("h2",{"code-path":"src/pages/ProfilePage.tsx:374:17",className:"text-xl font-semibold",children:"Hirdetéseim"}),h.jsxs("button",{"code-path":"src/pages/ProfilePage.tsx:375:17",onClick:()=>d(!0),className:"btn-primary flex items-center gap-2",children:[h.jsx(m_,{"code-path":"src/pages/ProfilePage.tsx:379:19",size:18}),"Új hirdetés"]})]}),i.advertisements?.length===0?h.jsxs("div",{"code-path":"src/pages/ProfilePage.tsx:385:17",className:"card-float bg-white p-8 text-center",children:[h.jsx("p",{"code-path":"src/pages/ProfilePage.tsx:386:19",className:"text-gray-600 mb-4",children:"Még nincs hirdetésed."}),h.jsx("button",{"code-path":"src/pages/ProfilePage.tsx:387:19",onClick:()=>d(!0),className:"btn-primary",children:"Hirdetés feladása"})]}):h.jsx("div",{"code-path":"src/pages/ProfilePage.tsx:395:17",className:"grid grid-cols-1 md:grid-cols-2 gap-4",children:i.advertisements?.map(Q=>h.jsxs("div",{"code-path":"src/pages/ProfilePage.tsx:397:21",className:"card-float bg-white p-5",children:[h.jsxs("div",{"code-path":"src/pages/ProfilePage.tsx:398:23",className:"flex items-start justify-between mb-3",children:[h.jsx("h3",{"code-path":"src/pages/ProfilePage.tsx:399:25",className:"font-semibold text-lg",children:Q.title}),h.jsxs("div",{"code-path":"src/pages/ProfilePage.tsx:400:25",className:"flex items-center gap-1 px-2 py-1 bg-gray-100 rounded-full text-sm",children:[se(Q.status),h.jsx("span",{"code-path":"src/pages/ProfilePage.tsx:402:27",children:le(Q.status)})]})]}),h.jsxs("p",{"code-path":"src/pages/ProfilePage.tsx:406:23",className:"text-sm text-gray-600 mb-3 flex items-center gap-2",children:[h.jsx(pm,{"code-path":"src/pages/ProfilePage.tsx:407:25",size:14})," ",Q.instrument,h.jsx("span",{"code-path":"src/pages/ProfilePage.tsx:408:25",className:"mx-1",children:"·"}),h.jsx(qf,{"code-path":"src/pages/ProfilePage.tsx:409:25",size:14})," ",Q.location]}),h.jsx("p",{"code-path":"src/pages/ProfilePage.tsx:412:23",className:"text-sm text-gray-700 mb-4 line-clamp-2",children:Q.short_description}),h.jsxs("div",{"code-path":"src/pages/ProfilePage.tsx:416:23",className:"flex items-center justify-between text-sm text-gray-500 pt-3 border-t border-gray-100",children:[h.jsxs("div",{"code-path":"src/pages/ProfilePage.tsx:417:25",className:"flex items-center gap-4",children:[h.jsxs("span",{"code-path":"src/pages/ProfilePage.tsx:418:27",className:"flex items-center gap-1",children:[h.jsx(xc,{"code-path":"src/pages/ProfilePage.tsx:419:29",size:14})," ",Q.views]}),h.jsxs("span",{"code-path":"src/pages/ProfilePage.tsx:421:27",className:"flex items-center gap-1",children:[h.jsx(ag,{"code-path":"src/pages/ProfilePage.tsx:422:29",size:14})," ",Q.contacts]})]}),Q.days_remaining!==void 0&&Q.days_remaining>0&&h.jsxs("span",{"code-path":"src/pages/ProfilePage.tsx:427:27",className:"flex items-center gap-1 text-[#D7A04D]",children:[h.jsx(hm,{"code-path":"src/pages/ProfilePage.tsx:428:29",size:14}),Q.days_remaining," nap hátravan"]})]})]},Q.id))})]})]})]}),h.jsx(hg,{"code-path":"src/pages/ProfilePage.tsx:442:7",open:u,onOpenChange:d})]}):h.jsx("div",{"code-path":"src/pages/ProfilePage.tsx:123:7",className:"min-h-screen bg-[#F4F2EE] flex items-center justify-center",children:h.jsx("div",{"code-path":"src/pages/ProfilePage.tsx:124:9",className:"text-center",children:h.jsx("p",{"code-path":"src/pages/ProfilePage.tsx:125:11",className:"text-gray-600",children:"Kérjük, jelentkezzen be a profil megtekintéséhez."})})})},fs="http://localhost:8000/api",g5=()=>{const{token:i,user:n}=Wa(),[r,s]=b.useState(!1),[l,c]=b.useState(""),u=n?.role==="admin",d=b.useCallback(async()=>{if(!i||!u)return null;try{const T=await fetch(`${fs}/admin/stats`,{headers:{Authorization:`Bearer ${i}`}});if(!T.ok)throw new Error("Failed to fetch stats");return await T.json()}catch(T){return c(T.message),null}},[i,u]),g=b.useCallback(async()=>{if(!i||!u)return[];s(!0);try{const T=await fetch(`${fs}/admin/users`,{headers:{Authorization:`Bearer ${i}`}});if(!T.ok)throw new Error("Failed to fetch users");return await T.json()}catch(T){return c(T.message),[]}finally{s(!1)}},[i,u]),m=b.useCallback(async()=>{if(!i||!u)return[];try{const T=await fetch(`${fs}/admin/users/emails`,{headers:{Authorization:`Bearer ${i}`}});if(!T.ok)throw new Error("Failed to fetch emails");return await T.json()}catch(T){return c(T.message),[]}},[i,u]),x=b.useCallback(async T=>{if(!i||!u)return[];s(!0);try{const j=T?`${fs}/admin/advertisements?status=${T}`:`${fs}/admin/advertisements`,E=await fetch(j,{headers:{Authorization:`Bearer ${i}`}});if(!E.ok)throw new Error("Failed to fetch advertisements");return await E.json()}catch(j){return c(j.message),[]}finally{s(!1)}},[i,u]),v=b.useCallback(async T=>{if(!i||!u)return{success:!1};try{const j=await fetch(`${fs}/admin/advertisements/${T}/approve`,{method:"PUT",headers:{Authorization:`Bearer ${i}`}});if(!j.ok)throw new Error("Failed to approve");return{success:!0,data:await j.json()}}catch(j){return c(j.message),{success:!1,error:j.message}}},[i,u]),S=b.useCallback(async(T,j)=>{if(!i||!u)return{success:!1};try{if(!(await fetch(`${fs}/admin/advertisements/${T}/reject`,{method:"PUT",headers:{Authorization:`Bearer ${i}`,"Content-Type":"application/json"},body:JSON.stringify({reason:j})})).ok)throw new Error("Failed to reject");return{success:!0}}catch(E){return c(E.message),{success:!1,error:E.message}}},[i,u]),A=b.useCallback(async(T,j=30)=>{if(!i||!u)return{success:!1};try{const E=await fetch(`${fs}/admin/advertisements/${T}/extend?days=${j}`,{method:"PUT",headers:{Authorization:`Bearer ${i}`}});if(!E.ok)throw new Error("Failed to extend");return{success:!0,data:await E.json()}}catch(E){return c(E.message),{success:!1,error:E.message}}},[i,u]),N=b.useCallback(async T=>{if(!i||!u)return{success:!1};try{if(!(await fetch(`${fs}/admin/advertisements/${T}`,{method:"DELETE",headers:{Authorization:`Bearer ${i}`}})).ok)throw new Error("Failed to delete");return{success:!0}}catch(j){return c(j.message),{success:!1,error:j.message}}},[i,u]),_=b.useCallback(async T=>{if(!i||!u)return{success:!1};try{const j=await fetch(`${fs}/admin/pricing`,{method:"PUT",headers:{Authorization:`Bearer ${i}`,"Content-Type":"application/json"},body:JSON.stringify(T)});if(!j.ok)throw new Error("Failed to update pricing");return{success:!0,data:await j.json()}}catch(j){return c(j.message),{success:!1,error:j.message}}},[i,u]);return{isAdmin:u,loading:r,error:l,fetchStats:d,fetchUsers:g,fetchUserEmails:m,fetchAdvertisements:x,approveAdvertisement:v,rejectAdvertisement:S,extendAdvertisement:A,deleteAdvertisement:N,updatePricing:_}},x5=()=>{Wa();const{isAdmin:i,loading:n,fetchStats:r,fetchUsers:s,fetchUserEmails:l,fetchAdvertisements:c,approveAdvertisement:u,rejectAdvertisement:d,extendAdvertisement:g,deleteAdvertisement:m,updatePricing:x}=g5(),[v,S]=b.useState(null),[A,N]=b.useState([]),[_,T]=b.useState([]),[j,E]=b.useState([]),[M,R]=b.useState("all"),[O,P]=b.useState(!1),[z,C]=b.useState(!1),[G,W]=b.useState(2900),[re,Z]=b.useState(10),[se,le]=b.useState(5e3);b.useEffect(()=>{i&&Q()},[i]);const Q=async()=>{const[F,ae,ce]=await Promise.all([r(),s(),c()]);F&&S(F),ae&&N(ae),ce&&T(ce)},H=async F=>{(await u(F)).success&&Q()},K=async F=>{(await d(F)).success&&Q()},J=async F=>{(await g(F,30)).success&&Q()},me=async F=>{confirm("Biztosan törölni szeretnéd ezt a hirdetést?")&&(await m(F)).success&&Q()},U=async()=>{const F=await l();E(F),C(!0)},k=async()=>{(await x({premium_monthly:G,commission_percent:re,commission_max:se})).success&&P(!1)},I=M==="all"?_:_.filter(F=>F.status===M);return i?h.jsxs("div",{"code-path":"src/pages/AdminPage.tsx:120:5",className:"min-h-screen bg-[#F4F2EE] pt-24 pb-12",children:[h.jsxs("div",{"code-path":"src/pages/AdminPage.tsx:121:7",className:"max-w-7xl mx-auto px-6",children:[h.jsxs("div",{"code-path":"src/pages/AdminPage.tsx:123:9",className:"flex items-center justify-between mb-8",children:[h.jsx("h1",{"code-path":"src/pages/AdminPage.tsx:124:11",className:"text-3xl font-semibold",style:{fontFamily:"Cormorant Garamond, serif"},children:"Adminisztrációs felület"}),h.jsxs("div",{"code-path":"src/pages/AdminPage.tsx:127:11",className:"flex items-center gap-3",children:[h.jsxs("button",{"code-path":"src/pages/AdminPage.tsx:128:13",onClick:U,className:"btn-ghost flex items-center gap-2",children:[h.jsx(ng,{"code-path":"src/pages/AdminPage.tsx:132:15",size:18}),"Email export"]}),h.jsxs("button",{"code-path":"src/pages/AdminPage.tsx:135:13",onClick:()=>P(!0),className:"btn-ghost flex items-center gap-2",children:[h.jsx(hj,{"code-path":"src/pages/AdminPage.tsx:139:15",size:18}),"Árak"]}),h.jsxs("button",{"code-path":"src/pages/AdminPage.tsx:142:13",onClick:Q,className:"btn-primary flex items-center gap-2",disabled:n,children:[h.jsx(oj,{"code-path":"src/pages/AdminPage.tsx:147:15",size:18,className:n?"animate-spin":""}),"Frissítés"]})]})]}),v&&h.jsxs("div",{"code-path":"src/pages/AdminPage.tsx:155:11",className:"grid grid-cols-1 md:grid-cols-4 gap-4 mb-8",children:[h.jsxs("div",{"code-path":"src/pages/AdminPage.tsx:156:13",className:"card-float bg-white p-5",children:[h.jsxs("div",{"code-path":"src/pages/AdminPage.tsx:157:15",className:"flex items-center justify-between mb-2",children:[h.jsx("span",{"code-path":"src/pages/AdminPage.tsx:158:17",className:"text-gray-500 text-sm",children:"Felhasználók"}),h.jsx(g_,{"code-path":"src/pages/AdminPage.tsx:159:17",size:20,className:"text-[#D7A04D]"})]}),h.jsx("p",{"code-path":"src/pages/AdminPage.tsx:161:15",className:"text-3xl font-bold",children:v.users.total}),h.jsxs("p",{"code-path":"src/pages/AdminPage.tsx:162:15",className:"text-sm text-gray-500",children:[v.users.teachers," tanár, ",v.users.students," diák"]})]}),h.jsxs("div",{"code-path":"src/pages/AdminPage.tsx:167:13",className:"card-float bg-white p-5",children:[h.jsxs("div",{"code-path":"src/pages/AdminPage.tsx:168:15",className:"flex items-center justify-between mb-2",children:[h.jsx("span",{"code-path":"src/pages/AdminPage.tsx:169:17",className:"text-gray-500 text-sm",children:"Hirdetések"}),h.jsx(UN,{"code-path":"src/pages/AdminPage.tsx:170:17",size:20,className:"text-blue-500"})]}),h.jsx("p",{"code-path":"src/pages/AdminPage.tsx:172:15",className:"text-3xl font-bold",children:v.advertisements.total}),h.jsxs("p",{"code-path":"src/pages/AdminPage.tsx:173:15",className:"text-sm text-gray-500",children:[v.advertisements.active," aktív, ",v.advertisements.pending," függőben"]})]}),h.jsxs("div",{"code-path":"src/pages/AdminPage.tsx:178:13",className:"card-float bg-white p-5",children:[h.jsxs("div",{"code-path":"src/pages/AdminPage.tsx:179:15",className:"flex items-center justify-between mb-2",children:[h.jsx("span",{"code-path":"src/pages/AdminPage.tsx:180:17",className:"text-gray-500 text-sm",children:"Bevétel"}),h.jsx(kN,{"code-path":"src/pages/AdminPage.tsx:181:17",size:20,className:"text-green-500"})]}),h.jsxs("p",{"code-path":"src/pages/AdminPage.tsx:183:15",className:"text-3xl font-bold",children:[v.revenue.toLocaleString()," Ft"]}),h.jsx("p",{"code-path":"src/pages/AdminPage.tsx:184:15",className:"text-sm text-gray-500",children:"Összes bevétel"})]}),h.jsxs("div",{"code-path":"src/pages/AdminPage.tsx:187:13",className:"card-float bg-white p-5",children:[h.jsxs("div",{"code-path":"src/pages/AdminPage.tsx:188:15",className:"flex items-center justify-between mb-2",children:[h.jsx("span",{"code-path":"src/pages/AdminPage.tsx:189:17",className:"text-gray-500 text-sm",children:"Lejáró hirdetések"}),h.jsx(hm,{"code-path":"src/pages/AdminPage.tsx:190:17",size:20,className:"text-red-500"})]}),h.jsx("p",{"code-path":"src/pages/AdminPage.tsx:192:15",className:"text-3xl font-bold",children:v.advertisements.expiring_soon}),h.jsx("p",{"code-path":"src/pages/AdminPage.tsx:193:15",className:"text-sm text-gray-500",children:"Következő 7 napban"})]})]}),h.jsxs(fg,{"code-path":"src/pages/AdminPage.tsx:198:9",defaultValue:"advertisements",className:"space-y-6",children:[h.jsxs(dg,{"code-path":"src/pages/AdminPage.tsx:199:11",className:"bg-white p-1 rounded-xl",children:[h.jsx(Ul,{"code-path":"src/pages/AdminPage.tsx:200:13",value:"advertisements",className:"px-6 py-2",children:"Hirdetések"}),h.jsx(Ul,{"code-path":"src/pages/AdminPage.tsx:203:13",value:"users",className:"px-6 py-2",children:"Felhasználók"})]}),h.jsxs(Hl,{"code-path":"src/pages/AdminPage.tsx:209:11",value:"advertisements",className:"space-y-4",children:[h.jsxs("div",{"code-path":"src/pages/AdminPage.tsx:210:13",className:"flex items-center gap-3 mb-4",children:[h.jsx("span",{"code-path":"src/pages/AdminPage.tsx:211:15",className:"text-sm text-gray-500",children:"Szűrés:"}),[{key:"all",label:"Összes"},{key:"pending",label:"Jóváhagyásra vár"},{key:"active",label:"Aktív"},{key:"expired",label:"Lejárt"}].map(F=>h.jsx("button",{"code-path":"src/pages/AdminPage.tsx:218:17",onClick:()=>R(F.key),className:`px-3 py-1 rounded-full text-sm ${M===F.key?"bg-[#D7A04D] text-white":"bg-gray-100 text-gray-600 hover:bg-gray-200"}`,children:F.label},F.key))]}),h.jsx("div",{"code-path":"src/pages/AdminPage.tsx:232:13",className:"bg-white rounded-2xl overflow-hidden shadow-sm",children:h.jsxs("table",{"code-path":"src/pages/AdminPage.tsx:233:15",className:"w-full",children:[h.jsx("thead",{"code-path":"src/pages/AdminPage.tsx:234:17",className:"bg-gray-50",children:h.jsxs("tr",{"code-path":"src/pages/AdminPage.tsx:235:19",children:[h.jsx("th",{"code-path":"src/pages/AdminPage.tsx:236:21",className:"text-left p-4 text-sm font-medium text-gray-500",children:"Hirdetés"}),h.jsx("th",{"code-path":"src/pages/AdminPage.tsx:237:21",className:"text-left p-4 text-sm font-medium text-gray-500",children:"Tanár"}),h.jsx("th",{"code-path":"src/pages/AdminPage.tsx:238:21",className:"text-left p-4 text-sm font-medium text-gray-500",children:"Státusz"}),h.jsx("th",{"code-path":"src/pages/AdminPage.tsx:239:21",className:"text-left p-4 text-sm font-medium text-gray-500",children:"Lejárat"}),h.jsx("th",{"code-path":"src/pages/AdminPage.tsx:240:21",className:"text-left p-4 text-sm font-medium text-gray-500",children:"Statisztika"}),h.jsx("th",{"code-path":"src/pages/AdminPage.tsx:241:21",className:"text-left p-4 text-sm font-medium text-gray-500",children:"Műveletek"})]})}),h.jsx("tbody",{"code-path":"src/pages/AdminPage.tsx:244:17",children:I.map(F=>h.jsxs("tr",{"code-path":"src/pages/AdminPage.tsx:246:21",className:"border-t border-gray-100",children:[h.jsxs("td",{"code-path":"src/pages/AdminPage.tsx:247:23",className:"p-4",children:[h.jsx("p",{"code-path":"src/pages/AdminPage.tsx:248:25",className:"font-medium",children:F.title}),h.jsxs("p",{"code-path":"src/pages/AdminPage.tsx:249:25",className:"text-sm text-gray-500",children:[F.instrument," · ",F.location]})]}),h.jsxs("td",{"code-path":"src/pages/AdminPage.tsx:253:23",className:"p-4",children:[h.jsx("p",{"code-path":"src/pages/AdminPage.tsx:254:25",className:"text-sm",children:F.teacher.name}),h.jsx("p",{"code-path":"src/pages/AdminPage.tsx:255:25",className:"text-xs text-gray-500",children:F.teacher.email})]}),h.jsx("td",{"code-path":"src/pages/AdminPage.tsx:257:23",className:"p-4",children:h.jsx("span",{"code-path":"src/pages/AdminPage.tsx:258:25",className:`px-2 py-1 rounded-full text-xs ${F.status==="active"?"bg-green-100 text-green-700":F.status==="pending"?"bg-yellow-100 text-yellow-700":F.status==="expired"?"bg-red-100 text-red-700":"bg-gray-100 text-gray-700"}`,children:F.status==="active"?"Aktív":F.status==="pending"?"Függőben":F.status==="expired"?"Lejárt":F.status})}),h.jsx("td",{"code-path":"src/pages/AdminPage.tsx:269:23",className:"p-4 text-sm",children:F.expires_at?new Date(F.expires_at).toLocaleDateString("hu-HU"):"Nincs"}),h.jsx("td",{"code-path":"src/pages/AdminPage.tsx:275:23",className:"p-4 text-sm",children:h.jsxs("span",{"code-path":"src/pages/AdminPage.tsx:276:25",className:"flex items-center gap-1",children:[h.jsx(xc,{"code-path":"src/pages/AdminPage.tsx:277:27",size:14})," ",F.views]})}),h.jsx("td",{"code-path":"src/pages/AdminPage.tsx:280:23",className:"p-4",children:h.jsxs("div",{"code-path":"src/pages/AdminPage.tsx:281:25",className:"flex items-center gap-2",children:[F.status==="pending"&&h.jsxs(h.Fragment,{children:[h.jsx("button",{"code-path":"src/pages/AdminPage.tsx:284:31",onClick:()=>H(F.id),className:"p-2 text-green-600 hover:bg-green-50 rounded-lg",title:"Jóváhagyás",children:h.jsx(Yf,{"code-path":"src/pages/AdminPage.tsx:289:33",size:18})}),h.jsx("button",{"code-path":"src/pages/AdminPage.tsx:291:31",onClick:()=>K(F.id),className:"p-2 text-red-600 hover:bg-red-50 rounded-lg",title:"Elutasítás",children:h.jsx(CN,{"code-path":"src/pages/AdminPage.tsx:296:33",size:18})})]}),F.status==="active"&&h.jsx("button",{"code-path":"src/pages/AdminPage.tsx:301:29",onClick:()=>J(F.id),className:"p-2 text-blue-600 hover:bg-blue-50 rounded-lg",title:"Meghosszabbítás (+30 nap)",children:h.jsx(hm,{"code-path":"src/pages/AdminPage.tsx:306:31",size:18})}),h.jsx("button",{"code-path":"src/pages/AdminPage.tsx:309:27",onClick:()=>me(F.id),className:"p-2 text-red-600 hover:bg-red-50 rounded-lg",title:"Törlés",children:h.jsx(Sj,{"code-path":"src/pages/AdminPage.tsx:314:29",size:18})})]})})]},F.id))})]})})]}),h.jsx(Hl,{"code-path":"src/pages/AdminPage.tsx:326:11",value:"users",className:"space-y-4",children:h.jsx("div",{"code-path":"src/pages/AdminPage.tsx:327:13",className:"bg-white rounded-2xl overflow-hidden shadow-sm",children:h.jsxs("table",{"code-path":"src/pages/AdminPage.tsx:328:15",className:"w-full",children:[h.jsx("thead",{"code-path":"src/pages/AdminPage.tsx:329:17",className:"bg-gray-50",children:h.jsxs("tr",{"code-path":"src/pages/AdminPage.tsx:330:19",children:[h.jsx("th",{"code-path":"src/pages/AdminPage.tsx:331:21",className:"text-left p-4 text-sm font-medium text-gray-500",children:"Név"}),h.jsx("th",{"code-path":"src/pages/AdminPage.tsx:332:21",className:"text-left p-4 text-sm font-medium text-gray-500",children:"Email"}),h.jsx("th",{"code-path":"src/pages/AdminPage.tsx:333:21",className:"text-left p-4 text-sm font-medium text-gray-500",children:"Szerepkör"}),h.jsx("th",{"code-path":"src/pages/AdminPage.tsx:334:21",className:"text-left p-4 text-sm font-medium text-gray-500",children:"Regisztráció"}),h.jsx("th",{"code-path":"src/pages/AdminPage.tsx:335:21",className:"text-left p-4 text-sm font-medium text-gray-500",children:"Hirdetések"})]})}),h.jsx("tbody",{"code-path":"src/pages/AdminPage.tsx:338:17",children:A.map(F=>h.jsxs("tr",{"code-path":"src/pages/AdminPage.tsx:340:21",className:"border-t border-gray-100",children:[h.jsxs("td",{"code-path":"src/pages/AdminPage.tsx:341:23",className:"p-4",children:[h.jsxs("p",{"code-path":"src/pages/AdminPage.tsx:342:25",className:"font-medium",children:[F.last_name," ",F.first_name]}),h.jsx("p",{"code-path":"src/pages/AdminPage.tsx:343:25",className:"text-sm text-gray-500",children:F.phone||"Nincs telefon"})]}),h.jsx("td",{"code-path":"src/pages/AdminPage.tsx:345:23",className:"p-4 text-sm",children:F.email}),h.jsx("td",{"code-path":"src/pages/AdminPage.tsx:346:23",className:"p-4",children:h.jsx("span",{"code-path":"src/pages/AdminPage.tsx:347:25",className:`px-2 py-1 rounded-full text-xs ${F.role==="teacher"?"bg-blue-100 text-blue-700":F.role==="admin"?"bg-purple-100 text-purple-700":"bg-green-100 text-green-700"}`,children:F.role==="teacher"?"Tanár":F.role==="admin"?"Admin":"Diák"})}),h.jsx("td",{"code-path":"src/pages/AdminPage.tsx:356:23",className:"p-4 text-sm",children:new Date(F.created_at).toLocaleDateString("hu-HU")}),h.jsx("td",{"code-path":"src/pages/AdminPage.tsx:359:23",className:"p-4 text-sm",children:F.advertisement_count})]},F.id))})]})})})]})]}),h.jsx(Is,{"code-path":"src/pages/AdminPage.tsx:372:7",open:O,onOpenChange:P,children:h.jsxs(Ws,{"code-path":"src/pages/AdminPage.tsx:373:9",className:"sm:max-w-md",children:[h.jsx(Ni,{"code-path":"src/pages/AdminPage.tsx:374:11",children:h.jsx(ji,{"code-path":"src/pages/AdminPage.tsx:375:13",children:"Árak beállítása"})}),h.jsxs("div",{"code-path":"src/pages/AdminPage.tsx:377:11",className:"space-y-4 mt-4",children:[h.jsxs("div",{"code-path":"src/pages/AdminPage.tsx:378:13",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/pages/AdminPage.tsx:379:15",children:"Prémium havi díj (Ft)"}),h.jsx(gt,{"code-path":"src/pages/AdminPage.tsx:380:15",type:"number",value:G,onChange:F=>W(parseInt(F.target.value))})]}),h.jsxs("div",{"code-path":"src/pages/AdminPage.tsx:386:13",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/pages/AdminPage.tsx:387:15",children:"Jutalék százalék (%)"}),h.jsx(gt,{"code-path":"src/pages/AdminPage.tsx:388:15",type:"number",value:re,onChange:F=>Z(parseInt(F.target.value)),min:0,max:100})]}),h.jsxs("div",{"code-path":"src/pages/AdminPage.tsx:396:13",className:"space-y-2",children:[h.jsx(He,{"code-path":"src/pages/AdminPage.tsx:397:15",children:"Jutalék maximum (Ft)"}),h.jsx(gt,{"code-path":"src/pages/AdminPage.tsx:398:15",type:"number",value:se,onChange:F=>le(parseInt(F.target.value))})]}),h.jsx(Pr,{"code-path":"src/pages/AdminPage.tsx:404:13",onClick:k,className:"w-full btn-primary",children:"Mentés"})]})]})}),h.jsx(Is,{"code-path":"src/pages/AdminPage.tsx:412:7",open:z,onOpenChange:C,children:h.jsxs(Ws,{"code-path":"src/pages/AdminPage.tsx:413:9",className:"sm:max-w-2xl max-h-[80vh] overflow-y-auto",children:[h.jsx(Ni,{"code-path":"src/pages/AdminPage.tsx:414:11",children:h.jsx(ji,{"code-path":"src/pages/AdminPage.tsx:415:13",children:"Felhasználói email címek"})}),h.jsxs("div",{"code-path":"src/pages/AdminPage.tsx:417:11",className:"mt-4",children:[h.jsx("textarea",{"code-path":"src/pages/AdminPage.tsx:418:13",readOnly:!0,value:j.map(F=>`${F.email} (${F.name})`).join(`
-`),className:"w-full h-64 p-4 bg-gray-50 rounded-lg text-sm font-mono"}),h.jsxs("div",{"code-path":"src/pages/AdminPage.tsx:423:13",className:"flex justify-between items-center mt-4",children:[h.jsxs("span",{"code-path":"src/pages/AdminPage.tsx:424:15",className:"text-sm text-gray-500",children:[j.length," email cím"]}),h.jsx("button",{"code-path":"src/pages/AdminPage.tsx:425:15",onClick:()=>{navigator.clipboard.writeText(j.map(F=>F.email).join(", "))},className:"btn-ghost text-sm",children:"Másolás vágólapra"})]})]})]})})]}):h.jsx("div",{"code-path":"src/pages/AdminPage.tsx:109:7",className:"min-h-screen bg-[#F4F2EE] flex items-center justify-center",children:h.jsxs("div",{"code-path":"src/pages/AdminPage.tsx:110:9",className:"text-center",children:[h.jsx(dm,{"code-path":"src/pages/AdminPage.tsx:111:11",size:48,className:"text-red-500 mx-auto mb-4"}),h.jsx("h1",{"code-path":"src/pages/AdminPage.tsx:112:11",className:"text-2xl font-semibold mb-2",children:"Hozzáférés megtagadva"}),h.jsx("p",{"code-path":"src/pages/AdminPage.tsx:113:11",className:"text-gray-600",children:"Ez az oldal csak adminisztrátorok számára érhető el."})]})})},v5=["Zongora","Gitár","Hegedű","Ének","Dob","Basszusgitár","Szaxofon","Fuvola","Cselló","Ukulele"],y5=["Budapest","Debrecen","Szeged","Pécs","Győr","Miskolc"],b5=()=>{const[i,n]=yT(),r=Ei(),{results:s,loading:l,search:c}=E2(),[u,d]=b.useState(!1),[g,m]=b.useState(null),x=i.get("instrument")||"",v=i.get("city")||"",S=i.get("keyword")||"",[A,N]=b.useState(x),[_,T]=b.useState(v),[j,E]=b.useState(S);b.useEffect(()=>{c({instrument:x,city:v,keyword:S})},[x,v,S,c]);const M=()=>{const C={};A&&(C.instrument=A),_&&(C.city=_),j&&(C.keyword=j),n(C)},R=(C,G)=>{m({id:C,name:G}),d(!0)},O=()=>{const C=[];return x&&C.push({type:"instrument",value:x}),v&&C.push({type:"city",value:v}),S&&C.push({type:"keyword",value:S}),C},P=C=>{const G=new URLSearchParams(i);G.delete(C),n(G)},z=O();return h.jsxs("div",{"code-path":"src/pages/SearchResultsPage.tsx:70:5",className:"min-h-screen bg-[#F4F2EE] pt-24 pb-12",children:[h.jsxs("div",{"code-path":"src/pages/SearchResultsPage.tsx:71:7",className:"max-w-6xl mx-auto px-6",children:[h.jsxs("button",{"code-path":"src/pages/SearchResultsPage.tsx:73:9",onClick:()=>r("/"),className:"flex items-center gap-2 text-gray-600 hover:text-[#D7A04D] mb-6",children:[h.jsx(mN,{"code-path":"src/pages/SearchResultsPage.tsx:77:11",size:18}),"Vissza a főoldalra"]}),h.jsx("h1",{"code-path":"src/pages/SearchResultsPage.tsx:81:9",className:"text-3xl font-semibold mb-6",style:{fontFamily:"Cormorant Garamond, serif"},children:"Keresési eredmények"}),h.jsxs("div",{"code-path":"src/pages/SearchResultsPage.tsx:86:9",className:"card-float bg-white p-6 mb-8",children:[h.jsxs("div",{"code-path":"src/pages/SearchResultsPage.tsx:87:11",className:"grid grid-cols-1 md:grid-cols-4 gap-4",children:[h.jsxs("div",{"code-path":"src/pages/SearchResultsPage.tsx:88:13",children:[h.jsx("label",{"code-path":"src/pages/SearchResultsPage.tsx:89:15",className:"block text-sm text-gray-500 mb-1",children:"Hangszer"}),h.jsxs("select",{"code-path":"src/pages/SearchResultsPage.tsx:90:15",value:A,onChange:C=>N(C.target.value),className:"w-full px-4 py-3 rounded-xl border border-gray-200 bg-white focus:outline-none focus:border-[#D7A04D]",children:[h.jsx("option",{"code-path":"src/pages/SearchResultsPage.tsx:95:17",value:"",children:"Összes hangszer"}),v5.map(C=>h.jsx("option",{"code-path":"src/pages/SearchResultsPage.tsx:97:19",value:C,children:C},C))]})]}),h.jsxs("div",{"code-path":"src/pages/SearchResultsPage.tsx:102:13",children:[h.jsx("label",{"code-path":"src/pages/SearchResultsPage.tsx:103:15",className:"block text-sm text-gray-500 mb-1",children:"Város"}),h.jsxs("select",{"code-path":"src/pages/SearchResultsPage.tsx:104:15",value:_,onChange:C=>T(C.target.value),className:"w-full px-4 py-3 rounded-xl border border-gray-200 bg-white focus:outline-none focus:border-[#D7A04D]",children:[h.jsx("option",{"code-path":"src/pages/SearchResultsPage.tsx:109:17",value:"",children:"Összes város"}),y5.map(C=>h.jsx("option",{"code-path":"src/pages/SearchResultsPage.tsx:111:19",value:C,children:C},C))]})]}),h.jsxs("div",{"code-path":"src/pages/SearchResultsPage.tsx:116:13",children:[h.jsx("label",{"code-path":"src/pages/SearchResultsPage.tsx:117:15",className:"block text-sm text-gray-500 mb-1",children:"Kulcsszó"}),h.jsx("input",{"code-path":"src/pages/SearchResultsPage.tsx:118:15",type:"text",value:j,onChange:C=>E(C.target.value),placeholder:"Keresés címben...",className:"w-full px-4 py-3 rounded-xl border border-gray-200 bg-white focus:outline-none focus:border-[#D7A04D]"})]}),h.jsx("div",{"code-path":"src/pages/SearchResultsPage.tsx:127:13",className:"flex items-end",children:h.jsxs("button",{"code-path":"src/pages/SearchResultsPage.tsx:128:15",onClick:M,className:"w-full btn-primary flex items-center justify-center gap-2",children:[h.jsx(sg,{"code-path":"src/pages/SearchResultsPage.tsx:132:17",size:18}),"Keresés"]})})]}),z.length>0&&h.jsxs("div",{"code-path":"src/pages/SearchResultsPage.tsx:140:13",className:"flex items-center gap-2 mt-4 pt-4 border-t border-gray-100",children:[h.jsx(BN,{"code-path":"src/pages/SearchResultsPage.tsx:141:15",size:16,className:"text-gray-400"}),h.jsx("span",{"code-path":"src/pages/SearchResultsPage.tsx:142:15",className:"text-sm text-gray-500",children:"Aktív szűrők:"}),z.map(C=>h.jsxs("span",{"code-path":"src/pages/SearchResultsPage.tsx:144:17",className:"inline-flex items-center gap-1 px-3 py-1 bg-[#D7A04D]/10 text-[#D7A04D] rounded-full text-sm",children:[C.value,h.jsx("button",{"code-path":"src/pages/SearchResultsPage.tsx:149:19",onClick:()=>P(C.type),className:"hover:text-[#D7A04D]/70",children:"×"})]},C.type))]})]}),h.jsx("div",{"code-path":"src/pages/SearchResultsPage.tsx:162:9",className:"mb-6",children:h.jsx("p",{"code-path":"src/pages/SearchResultsPage.tsx:163:11",className:"text-gray-600",children:l?"Keresés...":`${s.length} találat`})}),l?h.jsxs("div",{"code-path":"src/pages/SearchResultsPage.tsx:170:11",className:"text-center py-12",children:[h.jsx("div",{"code-path":"src/pages/SearchResultsPage.tsx:171:13",className:"animate-spin rounded-full h-12 w-12 border-b-2 border-[#D7A04D] mx-auto mb-4"}),h.jsx("p",{"code-path":"src/pages/SearchResultsPage.tsx:172:13",className:"text-gray-600",children:"Keresés folyamatban..."})]}):s.length===0?h.jsxs("div",{"code-path":"src/pages/SearchResultsPage.tsx:175:11",className:"text-center py-12 bg-white rounded-2xl",children:[h.jsx("p",{"code-path":"src/pages/SearchResultsPage.tsx:176:13",className:"text-gray-600 mb-2",children:"Nincs találat a megadott feltételeknek megfelelően."}),h.jsx("p",{"code-path":"src/pages/SearchResultsPage.tsx:177:13",className:"text-sm text-gray-500",children:"Próbálj meg más szűrőfeltételeket."})]}):h.jsx("div",{"code-path":"src/pages/SearchResultsPage.tsx:180:11",className:"grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6",children:s.map(C=>h.jsx("div",{"code-path":"src/pages/SearchResultsPage.tsx:182:15",className:"card-float bg-white overflow-hidden",children:h.jsxs("div",{"code-path":"src/pages/SearchResultsPage.tsx:183:17",className:"p-5",children:[h.jsx("h3",{"code-path":"src/pages/SearchResultsPage.tsx:184:19",className:"text-xl font-semibold mb-2",style:{fontFamily:"Cormorant Garamond, serif"},children:C.title}),h.jsxs("p",{"code-path":"src/pages/SearchResultsPage.tsx:188:19",className:"text-sm text-gray-500 mb-3 flex items-center gap-2",children:[h.jsx(pm,{"code-path":"src/pages/SearchResultsPage.tsx:189:21",size:14})," ",typeof C.instrument=="object"?C.instrument?.name_hu:C.instrument,h.jsx("span",{"code-path":"src/pages/SearchResultsPage.tsx:190:21",className:"mx-1",children:"·"}),h.jsx(qf,{"code-path":"src/pages/SearchResultsPage.tsx:191:21",size:14})," ",typeof C.location=="object"?C.location?.city:C.location]}),h.jsx("p",{"code-path":"src/pages/SearchResultsPage.tsx:194:19",className:"text-sm text-gray-700 mb-4 line-clamp-3",children:C.short_description}),h.jsxs("div",{"code-path":"src/pages/SearchResultsPage.tsx:198:19",className:"flex items-center justify-between pt-4 border-t border-gray-100",children:[h.jsxs("div",{"code-path":"src/pages/SearchResultsPage.tsx:199:21",className:"flex items-center gap-4 text-sm text-gray-500",children:[h.jsxs("span",{"code-path":"src/pages/SearchResultsPage.tsx:200:23",className:"flex items-center gap-1",children:[h.jsx(xc,{"code-path":"src/pages/SearchResultsPage.tsx:201:25",size:14})," ",C.views]}),h.jsxs("span",{"code-path":"src/pages/SearchResultsPage.tsx:203:23",className:"flex items-center gap-1",children:[h.jsx(ag,{"code-path":"src/pages/SearchResultsPage.tsx:204:25",size:14})," ",C.contacts]})]}),h.jsx("button",{"code-path":"src/pages/SearchResultsPage.tsx:208:21",onClick:()=>R(C.teacher_id,`${C.teacher?.first_name} ${C.teacher?.last_name}`),className:"px-4 py-2 bg-[#111111] text-white rounded-full text-sm hover:bg-[#D7A04D] transition-colors",children:"Kapcsolat"})]})]})},C.id))})]}),h.jsx(C2,{"code-path":"src/pages/SearchResultsPage.tsx:222:7",open:u,onOpenChange:d,teacherId:g?.id,teacherName:g?.name})]})};Ye.registerPlugin(_e);const _5=()=>{const i=b.useRef(null);return b.useEffect(()=>{const n=setTimeout(()=>{const r=_e.getAll().filter(c=>c.vars.pin).sort((c,u)=>c.start-u.start),s=_e.maxScroll(window);if(!s||r.length===0)return;const l=r.map(c=>({start:c.start/s,end:(c.end??c.start)/s,center:(c.start+((c.end??c.start)-c.start)*.5)/s}));_e.create({snap:{snapTo:c=>l.some(g=>c>=g.start-.02&&c<=g.end+.02)?l.reduce((g,m)=>Math.abs(m.center-c)<Math.abs(g-c)?m.center:g,l[0]?.center??0):c,duration:{min:.15,max:.35},delay:0,ease:"power2.out"}})},500);return()=>{clearTimeout(n)}},[]),h.jsxs("main",{"code-path":"src/App.tsx:73:5",ref:i,className:"relative",children:[h.jsx(r5,{"code-path":"src/App.tsx:74:7",className:"z-10"}),h.jsx(i5,{"code-path":"src/App.tsx:75:7",className:"z-20"}),h.jsx(l5,{"code-path":"src/App.tsx:76:7",className:"z-30"}),h.jsx(o5,{"code-path":"src/App.tsx:77:7",className:"z-40"}),h.jsx(c5,{"code-path":"src/App.tsx:78:7",className:"z-50"}),h.jsx(u5,{"code-path":"src/App.tsx:79:7",className:"z-60"}),h.jsx(f5,{"code-path":"src/App.tsx:80:7",className:"z-70"}),h.jsx(d5,{"code-path":"src/App.tsx:81:7",className:"z-80"}),h.jsx(h5,{"code-path":"src/App.tsx:82:7",className:"z-90"})]})},Ay=({children:i,requireAdmin:n=!1})=>{const{isAuthenticated:r,user:s}=Wa();return r?n&&s?.role!=="admin"?h.jsx(Up,{"code-path":"src/App.tsx:96:12",to:"/",replace:!0}):h.jsx(h.Fragment,{children:i}):h.jsx(Up,{"code-path":"src/App.tsx:92:12",to:"/",replace:!0})};function S5(){return h.jsx(pT,{"code-path":"src/App.tsx:105:5",children:h.jsxs("div",{"code-path":"src/App.tsx:106:7",className:"relative",children:[h.jsx("div",{"code-path":"src/App.tsx:108:9",className:"grain-overlay"}),h.jsx(t5,{"code-path":"src/App.tsx:111:9"}),h.jsxs(qA,{"code-path":"src/App.tsx:114:9",children:[h.jsx(xl,{"code-path":"src/App.tsx:115:11",path:"/",element:h.jsx(_5,{"code-path":"src/App.tsx:115:36"})}),h.jsx(xl,{"code-path":"src/App.tsx:116:11",path:"/profil",element:h.jsx(Ay,{"code-path":"src/App.tsx:119:15",children:h.jsx(m5,{"code-path":"src/App.tsx:120:17"})})}),h.jsx(xl,{"code-path":"src/App.tsx:124:11",path:"/admin",element:h.jsx(Ay,{"code-path":"src/App.tsx:127:15",requireAdmin:!0,children:h.jsx(x5,{"code-path":"src/App.tsx:128:17"})})}),h.jsx(xl,{"code-path":"src/App.tsx:132:11",path:"/kereses",element:h.jsx(b5,{"code-path":"src/App.tsx:132:43"})}),h.jsx(xl,{"code-path":"src/App.tsx:133:11",path:"*",element:h.jsx(Up,{"code-path":"src/App.tsx:133:36",to:"/",replace:!0})})]})]})})}X3.createRoot(document.getElementById("root")).render(h.jsx(b.StrictMode,{"code-path":"src/main.tsx:7:3",children:h.jsx(S5,{"code-path":"src/main.tsx:8:5"})}));
@@ -130,6 +130,8 @@ function App() {
             } 
           />
           <Route path="/kereses" element={<SearchResultsPage />} />
+          <Route path="/varos/:city" element={<SearchResultsPage />} />
+          <Route path="/hangszer/:instrument" element={<SearchResultsPage />} />
           <Route path="*" element={<Navigate to="/" replace />} />
         </Routes>
       </div>
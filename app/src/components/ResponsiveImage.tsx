@@ -0,0 +1,42 @@
+import type { ImgHTMLAttributes } from 'react';
+import { imageManifest } from '@/lib/imageManifest';
+
+// Variants of one image: the JPEG fallback plus a srcset per modern format
+export interface ImageSources {
+  src: string;
+  width: number;
+  height: number;
+  sources: { type: string; srcset: string }[];
+}
+
+interface ResponsiveImageProps extends Omit<ImgHTMLAttributes<HTMLImageElement>, 'src'> {
+  // A path under /public (looked up in the generated manifest) or API photo sources
+  src: string | ImageSources;
+  // Rendered width, so the browser picks the smallest sufficient variant
+  sizes?: string;
+}
+
+const ResponsiveImage = ({ src, sizes = '100vw', loading = 'lazy', ...props }: ResponsiveImageProps) => {
+  const image = typeof src === 'string' ? imageManifest[src] : src;
+  if (!image) {
+    return <img src={src as string} loading={loading} {...props} />;
+  }
+
+  return (
+    <picture style={{ display: 'contents' }}>
+      {image.sources.map((source) => (
+        <source key={source.type} type={source.type} srcSet={source.srcset} sizes={sizes} />
+      ))}
+      <img
+        src={image.src}
+        width={image.width}
+        height={image.height}
+        loading={loading}
+        decoding="async"
+        {...props}
+      />
+    </picture>
+  );
+};
+
+export default ResponsiveImage;
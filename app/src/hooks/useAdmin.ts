@@ -48,6 +48,52 @@ export interface DashboardStats {
   revenue: number;
 }
 
+export interface BulkModerationResult {
+  action: string;
+  processed: number;
+  results: { id: number; outcome: string }[];
+}
+
+export interface StatsDelta {
+  users?: Partial<DashboardStats['users']>;
+  advertisements?: Partial<DashboardStats['advertisements']>;
+  revenue?: number;
+}
+
+// Pushed by /admin/events; every change carries its effect on the stats
+export type AdminEvent =
+  | { type: 'ready' }
+  | { type: 'ad.created'; advertisement: AdminAdvertisement; delta: StatsDelta }
+  | { type: 'ad.updated'; advertisements: { id: number; status: string; expires_at?: string }[]; delta: StatsDelta }
+  | { type: 'ad.deleted'; ids: number[]; delta: StatsDelta }
+  | { type: 'user.created' | 'user.updated'; user: AdminUser; delta: StatsDelta }
+  | { type: 'user.deleted'; id: number; delta: StatsDelta }
+  | { type: 'payment.updated'; payment: { id: number; amount: number; status: string }; delta: StatsDelta };
+
+const ADMIN_EVENT_TYPES = [
+  'ready', 'ad.created', 'ad.updated', 'ad.deleted',
+  'user.created', 'user.updated', 'user.deleted', 'payment.updated',
+];
+
+export const applyStatsDelta = (stats: DashboardStats, delta: StatsDelta): DashboardStats => {
+  const add = <T extends object>(values: T, changes?: Partial<T>): T => {
+    const result = { ...values } as Record<string, number>;
+    for (const [key, change] of Object.entries(changes || {})) {
+      result[key] = (result[key] || 0) + (change as number);
+    }
+    return result as T;
+  };
+  return {
+    users: add(stats.users, delta.users),
+    advertisements: add(stats.advertisements, delta.advertisements),
+    revenue: stats.revenue + (delta.revenue || 0),
+  };
+};
+
+export type BulkModerationTarget =
+  | { ids: number[] }
+  | { filter: { status?: string; older_than_days?: number } };
+
 const API_URL = 'http://localhost:8000/api';
 
 export const useAdmin = () => {
@@ -203,6 +249,31 @@ export const useAdmin = () => {
     }
   }, [token, isAdmin]);
 
+  const bulkModerate = useCallback(async (
+    action: 'approve' | 'reject' | 'extend' | 'delete',
+    target: BulkModerationTarget,
+    options: { days?: number; reason?: string } = {}
+  ): Promise<{ success: boolean; data?: BulkModerationResult; error?: string }> => {
+    if (!token || !isAdmin) return { success: false };
+    
+    try {
+      const response = await fetch(`${API_URL}/admin/advertisements/bulk`, {
+        method: 'POST',
+        headers: {
+          'Authorization': `Bearer ${token}`,
+          'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({ action, ...target, ...options }),
+      });
+      
+      if (!response.ok) throw new Error('Bulk moderation failed');
+      return { success: true, data: await response.json() };
+    } catch (err: any) {
+      setError(err.message);
+      return { success: false, error: err.message };
+    }
+  }, [token, isAdmin]);
+
   const updatePricing = useCallback(async (pricing: {
     premium_monthly?: number;
     commission_percent?: number;
@@ -229,6 +300,17 @@ export const useAdmin = () => {
     }
   }, [token, isAdmin]);
 
+  // Live dashboard events; returns a function that closes the stream.
+  // EventSource reconnects by itself and each connection starts with "ready".
+  const subscribeEvents = useCallback((onEvent: (event: AdminEvent) => void) => {
+    if (!token || !isAdmin) return () => {};
+    
+    const source = new EventSource(`${API_URL}/admin/events?token=${encodeURIComponent(token)}`);
+    const listener = (message: MessageEvent) => onEvent(JSON.parse(message.data));
+    ADMIN_EVENT_TYPES.forEach((type) => source.addEventListener(type, listener));
+    return () => source.close();
+  }, [token, isAdmin]);
+
   return {
     isAdmin,
     loading,
@@ -241,6 +323,8 @@ export const useAdmin = () => {
     rejectAdvertisement,
     extendAdvertisement,
     deleteAdvertisement,
+    bulkModerate,
     updatePricing,
+    subscribeEvents,
   };
 };
@@ -1,5 +1,6 @@
 import { useState, useCallback } from 'react';
 import { useAuth } from './useAuth';
+import type { ImageSources } from '@/components/ResponsiveImage';
 
 export interface Advertisement {
   id: number;
@@ -29,6 +30,12 @@ export interface TeacherProfile {
   teaching_at_teacher: boolean;
   subscription_type: 'free' | 'premium';
   subscription_expires?: string;
+  photo?: TeacherPhoto | null;
+}
+
+export interface TeacherPhoto extends Partial<ImageSources> {
+  id: number;
+  status: 'processing' | 'ready' | 'failed';
 }
 
 export interface UserProfile {
@@ -41,6 +48,21 @@ export interface UserProfile {
   created_at: string;
   teacher_profile?: TeacherProfile;
   advertisements: Advertisement[];
+  stats?: { days: number; advertisements: Record<string, AdStats> };
+  unread_messages?: number;
+}
+
+export interface AdStats {
+  views: number;
+  contacts: number;
+  impressions: number;
+}
+
+// Parts of GET /users/profile; all of them unless a subset is asked for
+export type ProfileField = 'user' | 'teacher_profile' | 'advertisements' | 'stats' | 'unread_messages';
+
+export interface AdStatsBucket extends AdStats {
+  bucket: string;
 }
 
 const API_URL = 'http://localhost:8000/api';
@@ -51,6 +73,7 @@ export const useProfile = () => {
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState('');
 
+  // One request for the whole profile page: user, teacher profile, ads, their stats and unread messages
   const fetchProfile = useCallback(async () => {
     if (!token) return;
     
@@ -110,32 +133,119 @@ export const useProfile = () => {
     }
   }, [token, fetchProfile]);
 
+  // Selected parts of the profile, without touching the page's state
+  const fetchProfileFields = useCallback(async (fields: ProfileField[]): Promise<Partial<UserProfile> | null> => {
+    if (!token) return null;
+    
+    try {
+      const response = await fetch(`${API_URL}/users/profile?fields=${fields.join(',')}`, {
+        headers: {
+          'Authorization': `Bearer ${token}`,
+        },
+      });
+      
+      if (!response.ok) {
+        throw new Error('Failed to fetch profile');
+      }
+      
+      return await response.json();
+    } catch (err) {
+      return null;
+    }
+  }, [token]);
+
   const fetchMyAdvertisements = useCallback(async () => {
+    const data = await fetchProfileFields(['advertisements']);
+    return data?.advertisements ?? [];
+  }, [fetchProfileFields]);
+
+  const fetchAdStats = useCallback(async (days = 30): Promise<Record<string, AdStats>> => {
+    if (!token) return {};
+    
+    try {
+      const response = await fetch(`${API_URL}/analytics/my-advertisements?days=${days}`, {
+        headers: {
+          'Authorization': `Bearer ${token}`,
+        },
+      });
+      
+      if (!response.ok) {
+        throw new Error('Failed to fetch advertisement stats');
+      }
+      
+      const data = await response.json();
+      return data.advertisements;
+    } catch (err) {
+      return {};
+    }
+  }, [token]);
+
+  const fetchAdSeries = useCallback(async (adId: number, granularity: 'hour' | 'day' = 'day', periods = 30): Promise<AdStatsBucket[]> => {
     if (!token) return [];
     
     try {
-      const response = await fetch(`${API_URL}/users/my-advertisements`, {
+      const response = await fetch(`${API_URL}/analytics/advertisements/${adId}?granularity=${granularity}&periods=${periods}`, {
         headers: {
           'Authorization': `Bearer ${token}`,
         },
       });
       
       if (!response.ok) {
-        throw new Error('Failed to fetch advertisements');
+        throw new Error('Failed to fetch advertisement stats');
       }
       
-      return await response.json();
+      const data = await response.json();
+      return data.series;
     } catch (err) {
       return [];
     }
   }, [token]);
 
+  // Upload a teacher photo and wait until its variants are rendered
+  const uploadPhoto = useCallback(async (file: File): Promise<{ success: boolean; photo?: TeacherPhoto; error?: string }> => {
+    if (!token) return { success: false, error: 'Not authenticated' };
+    
+    try {
+      const body = new FormData();
+      body.append('file', file);
+      const response = await fetch(`${API_URL}/users/profile/photo`, {
+        method: 'POST',
+        headers: { 'Authorization': `Bearer ${token}` },
+        body,
+      });
+      if (!response.ok) {
+        const error = await response.json();
+        throw new Error(error.detail || 'Failed to upload photo');
+      }
+      
+      let photo: TeacherPhoto = await response.json();
+      for (let attempt = 0; photo.status === 'processing' && attempt < 30; attempt++) {
+        await new Promise((resolve) => setTimeout(resolve, 1000));
+        const status = await fetch(`${API_URL}/users/profile/photo/${photo.id}`, {
+          headers: { 'Authorization': `Bearer ${token}` },
+        });
+        if (status.ok) photo = await status.json();
+      }
+      if (photo.status !== 'ready') throw new Error('Photo processing failed');
+      
+      await fetchProfile();
+      return { success: true, photo };
+    } catch (err: any) {
+      setError(err.message);
+      return { success: false, error: err.message };
+    }
+  }, [token, fetchProfile]);
+
   return {
     profile,
     loading,
     error,
     fetchProfile,
+    fetchProfileFields,
     updateProfile,
     fetchMyAdvertisements,
+    fetchAdStats,
+    fetchAdSeries,
+    uploadPhoto,
   };
 };
@@ -39,7 +39,7 @@ export interface SearchFilters {
   featured_only?: boolean;
 }
 
-interface SearchResult {
+export interface SearchResult {
   advertisements: Advertisement[];
   total: number;
   page: number;
@@ -55,6 +55,23 @@ export const useSearch = () => {
   const [page, setPage] = useState(1);
   const [hasMore, setHasMore] = useState(false);
 
+  const apply = useCallback((data: SearchResult, pageNum: number) => {
+    if (pageNum === 1) {
+      setResults(data.advertisements);
+    } else {
+      setResults(prev => [...prev, ...data.advertisements]);
+    }
+    
+    setTotal(data.total);
+    setPage(pageNum);
+    setHasMore(data.advertisements.length === 12);
+  }, []);
+
+  // Show a first page that is already at hand (e.g. inlined in a prerendered page)
+  const seed = useCallback((data: SearchResult) => {
+    apply(data, 1);
+  }, [apply]);
+
   const search = useCallback(async (filters: SearchFilters, pageNum: number = 1) => {
     setLoading(true);
     
@@ -76,17 +93,7 @@ export const useSearch = () => {
       }
 
       const data: SearchResult = await response.json();
-      
-      if (pageNum === 1) {
-        setResults(data.advertisements);
-      } else {
-        setResults(prev => [...prev, ...data.advertisements]);
-      }
-      
-      setTotal(data.total);
-      setPage(pageNum);
-      setHasMore(data.advertisements.length === 12);
-      
+      apply(data, pageNum);
       return data;
     } catch (error) {
       console.error('Search error:', error);
@@ -94,7 +101,7 @@ export const useSearch = () => {
     } finally {
       setLoading(false);
     }
-  }, []);
+  }, [apply]);
 
   const loadMore = useCallback((filters: SearchFilters) => {
     if (!loading && hasMore) {
@@ -109,6 +116,7 @@ export const useSearch = () => {
     page,
     hasMore,
     search,
+    seed,
     loadMore,
   };
 };
@@ -0,0 +1,245 @@
+// Generated by `python backend/images.py assets`; do not edit.
+import type { ImageSources } from '@/components/ResponsiveImage';
+
+export const imageManifest: Record<string, ImageSources> = {
+  "/images/IMG_20241228_141149572_HDR_crop.jpg": {
+    "src": "/images/optimized/IMG_20241228_141149572_HDR_crop-960.9d852a0465.jpg",
+    "width": 960,
+    "height": 654,
+    "sources": [
+      {
+        "type": "image/avif",
+        "srcset": "/images/optimized/IMG_20241228_141149572_HDR_crop-320.9be3c03013.avif 320w, /images/optimized/IMG_20241228_141149572_HDR_crop-640.fc03bbcc1b.avif 640w, /images/optimized/IMG_20241228_141149572_HDR_crop-960.3526d44d4e.avif 960w, /images/optimized/IMG_20241228_141149572_HDR_crop-1280.04819ba443.avif 1280w, /images/optimized/IMG_20241228_141149572_HDR_crop-1920.312bc94e07.avif 1920w"
+      },
+      {
+        "type": "image/webp",
+        "srcset": "/images/optimized/IMG_20241228_141149572_HDR_crop-320.dbb3b2afbe.webp 320w, /images/optimized/IMG_20241228_141149572_HDR_crop-640.6e996fe2e0.webp 640w, /images/optimized/IMG_20241228_141149572_HDR_crop-960.c8287d2bab.webp 960w, /images/optimized/IMG_20241228_141149572_HDR_crop-1280.1db9b2ed45.webp 1280w, /images/optimized/IMG_20241228_141149572_HDR_crop-1920.99516b12d3.webp 1920w"
+      }
+    ]
+  },
+  "/images/city_budapest.jpg": {
+    "src": "/images/optimized/city_budapest-960.0080a56087.jpg",
+    "width": 960,
+    "height": 549,
+    "sources": [
+      {
+        "type": "image/avif",
+        "srcset": "/images/optimized/city_budapest-320.06347789bb.avif 320w, /images/optimized/city_budapest-640.785673a2bc.avif 640w, /images/optimized/city_budapest-960.a11b341cd8.avif 960w, /images/optimized/city_budapest-1280.e23ebe166f.avif 1280w"
+      },
+      {
+        "type": "image/webp",
+        "srcset": "/images/optimized/city_budapest-320.b7a2aa578d.webp 320w, /images/optimized/city_budapest-640.24cf0c0370.webp 640w, /images/optimized/city_budapest-960.22d5570472.webp 960w, /images/optimized/city_budapest-1280.748a83b562.webp 1280w"
+      }
+    ]
+  },
+  "/images/city_debrecen.jpg": {
+    "src": "/images/optimized/city_debrecen-960.8149340c3f.jpg",
+    "width": 960,
+    "height": 549,
+    "sources": [
+      {
+        "type": "image/avif",
+        "srcset": "/images/optimized/city_debrecen-320.72af4313c6.avif 320w, /images/optimized/city_debrecen-640.7c1621d23d.avif 640w, /images/optimized/city_debrecen-960.46cca13a10.avif 960w, /images/optimized/city_debrecen-1280.31c4825c4c.avif 1280w"
+      },
+      {
+        "type": "image/webp",
+        "srcset": "/images/optimized/city_debrecen-320.0fa6209a87.webp 320w, /images/optimized/city_debrecen-640.02f83710f4.webp 640w, /images/optimized/city_debrecen-960.b25b94b4d0.webp 960w, /images/optimized/city_debrecen-1280.d4451d5e75.webp 1280w"
+      }
+    ]
+  },
+  "/images/city_gyor.jpg": {
+    "src": "/images/optimized/city_gyor-960.d9d819eb59.jpg",
+    "width": 960,
+    "height": 549,
+    "sources": [
+      {
+        "type": "image/avif",
+        "srcset": "/images/optimized/city_gyor-320.7c7226df78.avif 320w, /images/optimized/city_gyor-640.13abcd1e40.avif 640w, /images/optimized/city_gyor-960.23e623bb66.avif 960w, /images/optimized/city_gyor-1280.d12e395f76.avif 1280w"
+      },
+      {
+        "type": "image/webp",
+        "srcset": "/images/optimized/city_gyor-320.e4ea92b292.webp 320w, /images/optimized/city_gyor-640.807dbf2097.webp 640w, /images/optimized/city_gyor-960.096dd90d60.webp 960w, /images/optimized/city_gyor-1280.711e3168f2.webp 1280w"
+      }
+    ]
+  },
+  "/images/city_miskolc.jpg": {
+    "src": "/images/optimized/city_miskolc-960.7eb8f453b9.jpg",
+    "width": 960,
+    "height": 549,
+    "sources": [
+      {
+        "type": "image/avif",
+        "srcset": "/images/optimized/city_miskolc-320.5d4e1fc347.avif 320w, /images/optimized/city_miskolc-640.4638aac459.avif 640w, /images/optimized/city_miskolc-960.fb50c93b66.avif 960w, /images/optimized/city_miskolc-1280.6c152f1afa.avif 1280w"
+      },
+      {
+        "type": "image/webp",
+        "srcset": "/images/optimized/city_miskolc-320.39844f0fd5.webp 320w, /images/optimized/city_miskolc-640.d3b8d48345.webp 640w, /images/optimized/city_miskolc-960.a44cb84775.webp 960w, /images/optimized/city_miskolc-1280.4952e30f66.webp 1280w"
+      }
+    ]
+  },
+  "/images/city_pecs.jpg": {
+    "src": "/images/optimized/city_pecs-960.eefe2edd95.jpg",
+    "width": 960,
+    "height": 549,
+    "sources": [
+      {
+        "type": "image/avif",
+        "srcset": "/images/optimized/city_pecs-320.4ef85904b7.avif 320w, /images/optimized/city_pecs-640.b56c993662.avif 640w, /images/optimized/city_pecs-960.d912fc65f0.avif 960w, /images/optimized/city_pecs-1280.0cb7115528.avif 1280w"
+      },
+      {
+        "type": "image/webp",
+        "srcset": "/images/optimized/city_pecs-320.5afca0d221.webp 320w, /images/optimized/city_pecs-640.1f04e7fee2.webp 640w, /images/optimized/city_pecs-960.94d4b5f77c.webp 960w, /images/optimized/city_pecs-1280.01c4343104.webp 1280w"
+      }
+    ]
+  },
+  "/images/city_szeged.jpg": {
+    "src": "/images/optimized/city_szeged-960.60810ef3e3.jpg",
+    "width": 960,
+    "height": 549,
+    "sources": [
+      {
+        "type": "image/avif",
+        "srcset": "/images/optimized/city_szeged-320.4a06cadacb.avif 320w, /images/optimized/city_szeged-640.f5defc7a4c.avif 640w, /images/optimized/city_szeged-960.1dacbb4a7c.avif 960w, /images/optimized/city_szeged-1280.f278f8a9c6.avif 1280w"
+      },
+      {
+        "type": "image/webp",
+        "srcset": "/images/optimized/city_szeged-320.5c643d3f3a.webp 320w, /images/optimized/city_szeged-640.2be8c07f6a.webp 640w, /images/optimized/city_szeged-960.e36b64fe10.webp 960w, /images/optimized/city_szeged-1280.f8151c4149.webp 1280w"
+      }
+    ]
+  },
+  "/images/for_teachers.jpg": {
+    "src": "/images/optimized/for_teachers-864.8d07da502c.jpg",
+    "width": 864,
+    "height": 1184,
+    "sources": [
+      {
+        "type": "image/avif",
+        "srcset": "/images/optimized/for_teachers-320.8104f2b542.avif 320w, /images/optimized/for_teachers-640.06073b4055.avif 640w, /images/optimized/for_teachers-864.f37c7f8048.avif 864w"
+      },
+      {
+        "type": "image/webp",
+        "srcset": "/images/optimized/for_teachers-320.20312cbd23.webp 320w, /images/optimized/for_teachers-640.59e23fa495.webp 640w, /images/optimized/for_teachers-864.ec6d0b161f.webp 864w"
+      }
+    ]
+  },
+  "/images/hero_piano.jpg": {
+    "src": "/images/optimized/hero_piano-960.2f3aaef4ca.jpg",
+    "width": 960,
+    "height": 549,
+    "sources": [
+      {
+        "type": "image/avif",
+        "srcset": "/images/optimized/hero_piano-320.ebb005a58d.avif 320w, /images/optimized/hero_piano-640.ced11dca29.avif 640w, /images/optimized/hero_piano-960.7d7dafd1ff.avif 960w, /images/optimized/hero_piano-1280.f0c56cc0b5.avif 1280w"
+      },
+      {
+        "type": "image/webp",
+        "srcset": "/images/optimized/hero_piano-320.93a00a1fe0.webp 320w, /images/optimized/hero_piano-640.be800a7cf4.webp 640w, /images/optimized/hero_piano-960.065bdb4312.webp 960w, /images/optimized/hero_piano-1280.bedd7ea372.webp 1280w"
+      }
+    ]
+  },
+  "/images/hero_portrait.jpg": {
+    "src": "/images/optimized/hero_portrait-960.77cb963baf.jpg",
+    "width": 960,
+    "height": 701,
+    "sources": [
+      {
+        "type": "image/avif",
+        "srcset": "/images/optimized/hero_portrait-320.22751f098b.avif 320w, /images/optimized/hero_portrait-640.de7482bd06.avif 640w, /images/optimized/hero_portrait-960.d16fe1d0fb.avif 960w, /images/optimized/hero_portrait-1184.6391d297fc.avif 1184w"
+      },
+      {
+        "type": "image/webp",
+        "srcset": "/images/optimized/hero_portrait-320.d2d39e802c.webp 320w, /images/optimized/hero_portrait-640.b4b1e9dbf3.webp 640w, /images/optimized/hero_portrait-960.cc51e209bd.webp 960w, /images/optimized/hero_portrait-1184.9e27d9a706.webp 1184w"
+      }
+    ]
+  },
+  "/images/hero_teacher.jpg": {
+    "src": "/images/optimized/hero_teacher-960.7f1a52306c.jpg",
+    "width": 960,
+    "height": 549,
+    "sources": [
+      {
+        "type": "image/avif",
+        "srcset": "/images/optimized/hero_teacher-320.2775d579ab.avif 320w, /images/optimized/hero_teacher-640.899c830b23.avif 640w, /images/optimized/hero_teacher-960.d3b48f95d7.avif 960w, /images/optimized/hero_teacher-1280.f2c4198797.avif 1280w"
+      },
+      {
+        "type": "image/webp",
+        "srcset": "/images/optimized/hero_teacher-320.335739baab.webp 320w, /images/optimized/hero_teacher-640.a06e9648e7.webp 640w, /images/optimized/hero_teacher-960.7a8eaa5ebe.webp 960w, /images/optimized/hero_teacher-1280.8abf27c6e1.webp 1280w"
+      }
+    ]
+  },
+  "/images/how_it_works.jpg": {
+    "src": "/images/optimized/how_it_works-864.6346f3a98d.jpg",
+    "width": 864,
+    "height": 1184,
+    "sources": [
+      {
+        "type": "image/avif",
+        "srcset": "/images/optimized/how_it_works-320.0e34c45976.avif 320w, /images/optimized/how_it_works-640.18ba6dbe86.avif 640w, /images/optimized/how_it_works-864.da4f315232.avif 864w"
+      },
+      {
+        "type": "image/webp",
+        "srcset": "/images/optimized/how_it_works-320.f6f68d1c9d.webp 320w, /images/optimized/how_it_works-640.f29ed69e22.webp 640w, /images/optimized/how_it_works-864.10d131c587.webp 864w"
+      }
+    ]
+  },
+  "/images/instrument_guitar.jpg": {
+    "src": "/images/optimized/instrument_guitar-864.b153f1a3a9.jpg",
+    "width": 864,
+    "height": 1184,
+    "sources": [
+      {
+        "type": "image/avif",
+        "srcset": "/images/optimized/instrument_guitar-320.d00c21808f.avif 320w, /images/optimized/instrument_guitar-640.aefce9c97d.avif 640w, /images/optimized/instrument_guitar-864.6245ef8d48.avif 864w"
+      },
+      {
+        "type": "image/webp",
+        "srcset": "/images/optimized/instrument_guitar-320.0c9ea5c040.webp 320w, /images/optimized/instrument_guitar-640.6487916c23.webp 640w, /images/optimized/instrument_guitar-864.69e769f154.webp 864w"
+      }
+    ]
+  },
+  "/images/instrument_piano.jpg": {
+    "src": "/images/optimized/instrument_piano-864.b50ccb4620.jpg",
+    "width": 864,
+    "height": 1184,
+    "sources": [
+      {
+        "type": "image/avif",
+        "srcset": "/images/optimized/instrument_piano-320.54fc6e9716.avif 320w, /images/optimized/instrument_piano-640.f8c0b9be18.avif 640w, /images/optimized/instrument_piano-864.66cc04352e.avif 864w"
+      },
+      {
+        "type": "image/webp",
+        "srcset": "/images/optimized/instrument_piano-320.9f4a932157.webp 320w, /images/optimized/instrument_piano-640.295fc2617b.webp 640w, /images/optimized/instrument_piano-864.a0c43214f4.webp 864w"
+      }
+    ]
+  },
+  "/images/instrument_voice.jpg": {
+    "src": "/images/optimized/instrument_voice-864.baa40717cd.jpg",
+    "width": 864,
+    "height": 1184,
+    "sources": [
+      {
+        "type": "image/avif",
+        "srcset": "/images/optimized/instrument_voice-320.5a40a36f48.avif 320w, /images/optimized/instrument_voice-640.7a4a079efc.avif 640w, /images/optimized/instrument_voice-864.b1d05df6e1.avif 864w"
+      },
+      {
+        "type": "image/webp",
+        "srcset": "/images/optimized/instrument_voice-320.d5e5652818.webp 320w, /images/optimized/instrument_voice-640.57c528fd1e.webp 640w, /images/optimized/instrument_voice-864.37c611d006.webp 864w"
+      }
+    ]
+  },
+  "/images/testimonial.jpg": {
+    "src": "/images/optimized/testimonial-864.a3e52720ba.jpg",
+    "width": 864,
+    "height": 1184,
+    "sources": [
+      {
+        "type": "image/avif",
+        "srcset": "/images/optimized/testimonial-320.23f16d9030.avif 320w, /images/optimized/testimonial-640.06575b4c88.avif 640w, /images/optimized/testimonial-864.aee0df0edc.avif 864w"
+      },
+      {
+        "type": "image/webp",
+        "srcset": "/images/optimized/testimonial-320.98664b80dd.webp 320w, /images/optimized/testimonial-640.6e979a1881.webp 640w, /images/optimized/testimonial-864.b4ebb7fb39.webp 864w"
+      }
+    ]
+  }
+};
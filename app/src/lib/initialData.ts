@@ -0,0 +1,29 @@
+// Data inlined into prerendered pages by backend/prerender.py, so the first
+// render doesn't wait for the API. Each key is used once and only on the
+// page it was rendered for; components mounted later fetch as usual.
+export interface InitialData {
+  path: string;
+  cities?: string[];
+  instruments?: { id: number; name: string; name_hu: string; category?: string; icon?: string }[];
+  featured?: unknown[];
+  search?: {
+    filters: { city?: string; instrument?: string };
+    result: { advertisements: unknown[]; total: number; page: number; per_page: number };
+  };
+}
+
+declare global {
+  interface Window {
+    __INITIAL_DATA__?: InitialData;
+  }
+}
+
+export function takeInitialData<K extends Exclude<keyof InitialData, 'path'>>(key: K): InitialData[K] | undefined {
+  const data = window.__INITIAL_DATA__;
+  if (!data || decodeURIComponent(window.location.pathname) !== data.path) {
+    return undefined;
+  }
+  const value = data[key];
+  delete data[key];
+  return value;
+}
@@ -1,5 +1,5 @@
 import { useEffect, useState } from 'react';
-import { useAdmin, type DashboardStats, type AdminUser, type AdminAdvertisement } from '@/hooks/useAdmin';
+import { useAdmin, applyStatsDelta, type DashboardStats, type AdminUser, type AdminAdvertisement, type AdminEvent } from '@/hooks/useAdmin';
 import { useAuth } from '@/hooks/useAuth';
 import { 
   Users, FileText, DollarSign, 
@@ -18,7 +18,7 @@ const AdminPage = () => {
   const { 
     isAdmin, loading, fetchStats, fetchUsers, fetchUserEmails, 
     fetchAdvertisements, approveAdvertisement, rejectAdvertisement,
-    extendAdvertisement, deleteAdvertisement, updatePricing
+    extendAdvertisement, deleteAdvertisement, updatePricing, subscribeEvents
   } = useAdmin();
   
   const [stats, setStats] = useState<DashboardStats | null>(null);
@@ -35,11 +35,49 @@ const AdminPage = () => {
   const [commissionPercent, setCommissionPercent] = useState(10);
   const [commissionMax, setCommissionMax] = useState(5000);
 
+  // The event stream keeps the dashboard current; everything is (re)loaded
+  // only when it connects, so nothing missed while offline is lost
   useEffect(() => {
-    if (isAdmin) {
-      loadData();
+    if (!isAdmin) return;
+    return subscribeEvents((event) => {
+      if (event.type === 'ready') {
+        loadData();
+      } else {
+        applyEvent(event);
+      }
+    });
+  }, [isAdmin, subscribeEvents]);
+
+  const applyEvent = (event: Exclude<AdminEvent, { type: 'ready' }>) => {
+    setStats((current) => current && applyStatsDelta(current, event.delta));
+    switch (event.type) {
+      case 'ad.created':
+        setAdvertisements((ads) => [event.advertisement, ...ads.filter((ad) => ad.id !== event.advertisement.id)]);
+        break;
+      case 'ad.updated': {
+        const changes = new Map(event.advertisements.map((change) => [change.id, change]));
+        setAdvertisements((ads) => ads.map((ad) => {
+          const change = changes.get(ad.id);
+          return change ? { ...ad, status: change.status, expires_at: change.expires_at } : ad;
+        }));
+        break;
+      }
+      case 'ad.deleted': {
+        const deleted = new Set(event.ids);
+        setAdvertisements((ads) => ads.filter((ad) => !deleted.has(ad.id)));
+        break;
+      }
+      case 'user.created':
+        setUsers((current) => [...current.filter((user) => user.id !== event.user.id), event.user]);
+        break;
+      case 'user.updated':
+        setUsers((current) => current.map((user) => user.id === event.user.id ? event.user : user));
+        break;
+      case 'user.deleted':
+        setUsers((current) => current.filter((user) => user.id !== event.id));
+        break;
     }
-  }, [isAdmin]);
+  };
 
   const loadData = async () => {
     const [statsData, usersData, adsData] = await Promise.all([
@@ -54,32 +92,20 @@ const AdminPage = () => {
   };
 
   const handleApprove = async (adId: number) => {
-    const result = await approveAdvertisement(adId);
-    if (result.success) {
-      loadData();
-    }
+    await approveAdvertisement(adId);
   };
 
   const handleReject = async (adId: number) => {
-    const result = await rejectAdvertisement(adId);
-    if (result.success) {
-      loadData();
-    }
+    await rejectAdvertisement(adId);
   };
 
   const handleExtend = async (adId: number) => {
-    const result = await extendAdvertisement(adId, 30);
-    if (result.success) {
-      loadData();
-    }
+    await extendAdvertisement(adId, 30);
   };
 
   const handleDelete = async (adId: number) => {
     if (confirm('Biztosan törölni szeretnéd ezt a hirdetést?')) {
-      const result = await deleteAdvertisement(adId);
-      if (result.success) {
-        loadData();
-      }
+      await deleteAdvertisement(adId);
     }
   };
 
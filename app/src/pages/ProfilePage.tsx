@@ -1,10 +1,10 @@
 import { useEffect, useState } from 'react';
-import { useProfile } from '@/hooks/useProfile';
+import { useProfile, type AdStats } from '@/hooks/useProfile';
 import { useAuth } from '@/hooks/useAuth';
 import { 
   User, Mail, Phone, Calendar, Edit, Save, 
   Plus, Clock, Eye, MessageCircle, CheckCircle, 
-  AlertCircle, Hourglass, MapPin, Music
+  AlertCircle, Hourglass, MapPin, Music, Camera
 } from 'lucide-react';
 
 import { Input } from '@/components/ui/input';
@@ -13,13 +13,17 @@ import { Textarea } from '@/components/ui/textarea';
 
 import { Tabs, TabsContent, TabsList, TabsTrigger } from '@/components/ui/tabs';
 import PostAdModal from '@/components/PostAdModal';
+import ResponsiveImage, { type ImageSources } from '@/components/ResponsiveImage';
 
 const ProfilePage = () => {
   useAuth();
-  const { profile, loading, fetchProfile, updateProfile } = useProfile();
+  const { profile, loading, error, fetchProfile, updateProfile, uploadPhoto } = useProfile();
+  // Last 30 days per ad, part of the profile response
+  const adStats: Record<string, AdStats> = profile?.stats?.advertisements ?? {};
   
   const [isEditing, setIsEditing] = useState(false);
   const [postAdOpen, setPostAdOpen] = useState(false);
+  const [photoUploading, setPhotoUploading] = useState(false);
   
   // Edit form state
   const [firstName, setFirstName] = useState('');
@@ -37,6 +41,15 @@ const ProfilePage = () => {
     fetchProfile();
   }, [fetchProfile]);
 
+  const handlePhotoChange = async (e: React.ChangeEvent<HTMLInputElement>) => {
+    const file = e.target.files?.[0];
+    e.target.value = '';
+    if (!file) return;
+    setPhotoUploading(true);
+    await uploadPhoto(file);
+    setPhotoUploading(false);
+  };
+
   useEffect(() => {
     if (profile) {
       setFirstName(profile.first_name);
@@ -244,6 +257,35 @@ const ProfilePage = () => {
                 </h2>
                 
                 <div className="space-y-6">
+                  <div className="flex items-center gap-4">
+                    <div className="w-24 h-24 rounded-full overflow-hidden bg-gray-100 flex items-center justify-center">
+                      {profile.teacher_profile?.photo?.status === 'ready' ? (
+                        <ResponsiveImage
+                          src={profile.teacher_profile.photo as ImageSources}
+                          sizes="96px"
+                          alt="Profilkép"
+                          className="w-full h-full object-cover"
+                        />
+                      ) : (
+                        <User size={32} className="text-gray-400" />
+                      )}
+                    </div>
+                    <div className="space-y-1">
+                      <label className="btn-ghost inline-flex items-center gap-2 px-4 py-2 rounded-full cursor-pointer">
+                        <Camera size={16} />
+                        {photoUploading ? 'Feldolgozás...' : 'Profilkép feltöltése'}
+                        <input
+                          type="file"
+                          accept="image/jpeg,image/png,image/webp,image/avif"
+                          className="hidden"
+                          disabled={photoUploading}
+                          onChange={handlePhotoChange}
+                        />
+                      </label>
+                      {error && !photoUploading && <p className="text-sm text-red-500">{error}</p>}
+                    </div>
+                  </div>
+                  
                   <div className="space-y-2">
                     <Label>Rövid bemutatkozás</Label>
                     {isEditing ? (
@@ -421,6 +463,11 @@ const ProfilePage = () => {
                           <span className="flex items-center gap-1">
                             <MessageCircle size={14} /> {ad.contacts}
                           </span>
+                          {adStats[ad.id] && (
+                            <span className="text-xs text-gray-400" title="Az elmúlt 30 napban: megtekintés / megkeresés / megjelenés a keresésben">
+                              30 nap: {adStats[ad.id].views} / {adStats[ad.id].contacts} / {adStats[ad.id].impressions}
+                            </span>
+                          )}
                         </div>
                         
                         {ad.days_remaining !== undefined && ad.days_remaining > 0 && (
@@ -1,6 +1,7 @@
-import { useEffect, useState } from 'react';
-import { useSearchParams, useNavigate } from 'react-router-dom';
-import { useSearch } from '@/hooks/useSearch';
+import { useEffect, useRef, useState } from 'react';
+import { useSearchParams, useNavigate, useParams } from 'react-router-dom';
+import { useSearch, type SearchResult } from '@/hooks/useSearch';
+import { takeInitialData } from '@/lib/initialData';
 import { Search, MapPin, Music, ArrowLeft, Eye, MessageCircle, Filter } from 'lucide-react';
 import ContactModal from '@/components/ContactModal';
 
@@ -16,13 +17,16 @@ const CITIES = [
 const SearchResultsPage = () => {
   const [searchParams, setSearchParams] = useSearchParams();
   const navigate = useNavigate();
-  const { results, loading, search } = useSearch();
+  // Landing pages (/varos/:city, /hangszer/:instrument) preset one filter
+  const routeParams = useParams();
+  const { results, loading, search, seed } = useSearch();
+  const initialSearch = useRef(takeInitialData('search'));
   
   const [contactModalOpen, setContactModalOpen] = useState(false);
   const [selectedTeacher, setSelectedTeacher] = useState<{id: number, name: string} | null>(null);
   
-  const instrumentParam = searchParams.get('instrument') || '';
-  const cityParam = searchParams.get('city') || '';
+  const instrumentParam = searchParams.get('instrument') || routeParams.instrument || '';
+  const cityParam = searchParams.get('city') || routeParams.city || '';
   const keywordParam = searchParams.get('keyword') || '';
 
   const [instrument, setInstrument] = useState(instrumentParam);
@@ -30,12 +34,23 @@ const SearchResultsPage = () => {
   const [keyword, setKeyword] = useState(keywordParam);
 
   useEffect(() => {
+    // A prerendered landing page already holds the first page of its results
+    const initial = initialSearch.current;
+    initialSearch.current = undefined;
+    if (
+      initial && !keywordParam &&
+      (initial.filters.instrument || '') === instrumentParam &&
+      (initial.filters.city || '') === cityParam
+    ) {
+      seed(initial.result as SearchResult);
+      return;
+    }
     search({ 
       instrument: instrumentParam, 
       city: cityParam,
       keyword: keywordParam 
     });
-  }, [instrumentParam, cityParam, keywordParam, search]);
+  }, [instrumentParam, cityParam, keywordParam, search, seed]);
 
   const handleSearch = () => {
     const params: Record<string, string> = {};
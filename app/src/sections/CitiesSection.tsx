@@ -3,6 +3,8 @@ import { useNavigate } from 'react-router-dom';
 import { gsap } from 'gsap';
 import { ScrollTrigger } from 'gsap/ScrollTrigger';
 import { ArrowUpRight, Users } from 'lucide-react';
+import ResponsiveImage from '@/components/ResponsiveImage';
+import { takeInitialData } from '@/lib/initialData';
 
 gsap.registerPlugin(ScrollTrigger);
 
@@ -25,9 +27,13 @@ const CitiesSection = ({ className = '' }: CitiesSectionProps) => {
   useEffect(() => {
     const fetchStats = async () => {
       try {
-        const response = await fetch('http://localhost:8000/api/locations/cities');
-        if (response.ok) {
-          const cities = await response.json();
+        // Prerendered pages carry the city list inline
+        let cities = takeInitialData('cities');
+        if (!cities) {
+          const response = await fetch('http://localhost:8000/api/locations/cities');
+          cities = response.ok ? await response.json() : undefined;
+        }
+        if (cities) {
           // For now, we'll use placeholder counts - in production these would come from the backend
           const stats: CityStats = {};
           cities.forEach((city: string) => {
@@ -87,7 +93,7 @@ const CitiesSection = ({ className = '' }: CitiesSectionProps) => {
   }, []);
 
   const handleCityClick = (cityName: string) => {
-    navigate(`/kereses?city=${encodeURIComponent(cityName)}`);
+    navigate(`/varos/${encodeURIComponent(cityName)}`);
   };
 
   const cities = [
@@ -127,8 +133,9 @@ const CitiesSection = ({ className = '' }: CitiesSectionProps) => {
           >
             {/* Image */}
             <div className="relative h-40 overflow-hidden">
-              <img
+              <ResponsiveImage
                 src={city.image}
+                sizes="(min-width: 1024px) 29vw, (min-width: 768px) 44vw, 88vw"
                 alt={city.name}
                 className="w-full h-full object-cover transition-transform duration-500 group-hover:scale-105"
               />
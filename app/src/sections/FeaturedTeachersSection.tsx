@@ -3,6 +3,8 @@ import { gsap } from 'gsap';
 import { ScrollTrigger } from 'gsap/ScrollTrigger';
 import { Star, MapPin, Monitor, MessageCircle } from 'lucide-react';
 import ContactModal from '@/components/ContactModal';
+import ResponsiveImage, { type ImageSources } from '@/components/ResponsiveImage';
+import { takeInitialData } from '@/lib/initialData';
 
 gsap.registerPlugin(ScrollTrigger);
 
@@ -16,6 +18,7 @@ interface Teacher {
   instruments: string[];
   locations: string[];
   teaching_online: boolean;
+  photo?: (ImageSources & { status: string }) | null;
 }
 
 interface FeaturedTeachersSectionProps {
@@ -27,13 +30,16 @@ const FeaturedTeachersSection = ({ className = '' }: FeaturedTeachersSectionProp
   const headlineRef = useRef<HTMLDivElement>(null);
   const cardsRef = useRef<HTMLDivElement>(null);
   
-  const [teachers, setTeachers] = useState<Teacher[]>([]);
-  const [loading, setLoading] = useState(true);
+  // Prerendered pages carry the featured teachers inline
+  const [initialTeachers] = useState(() => takeInitialData('featured') as Teacher[] | undefined);
+  const [teachers, setTeachers] = useState<Teacher[]>(initialTeachers ?? []);
+  const [loading, setLoading] = useState(!initialTeachers);
   const [contactModalOpen, setContactModalOpen] = useState(false);
   const [selectedTeacher, setSelectedTeacher] = useState<{id: number, name: string} | null>(null);
 
   // Fetch featured teachers
   useEffect(() => {
+    if (initialTeachers) return;
     const fetchTeachers = async () => {
       try {
         const response = await fetch('http://localhost:8000/api/teachers/featured?limit=6');
@@ -48,7 +54,7 @@ const FeaturedTeachersSection = ({ className = '' }: FeaturedTeachersSectionProp
       }
     };
     fetchTeachers();
-  }, []);
+  }, [initialTeachers]);
 
   useLayoutEffect(() => {
     const section = sectionRef.current;
@@ -151,8 +157,9 @@ const FeaturedTeachersSection = ({ className = '' }: FeaturedTeachersSectionProp
           >
             {/* Image */}
             <div className="relative h-48 overflow-hidden">
-              <img
-                src={fallbackImages[index % fallbackImages.length]}
+              <ResponsiveImage
+                src={teacher.photo ?? fallbackImages[index % fallbackImages.length]}
+                sizes="(min-width: 1024px) 29vw, (min-width: 768px) 44vw, 88vw"
                 alt={`${teacher.first_name} ${teacher.last_name}`}
                 className="w-full h-full object-cover transition-transform duration-500 hover:scale-105"
               />
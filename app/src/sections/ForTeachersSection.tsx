@@ -2,6 +2,7 @@ import { useRef, useLayoutEffect } from 'react';
 import { gsap } from 'gsap';
 import { ScrollTrigger } from 'gsap/ScrollTrigger';
 import { Check, ArrowRight } from 'lucide-react';
+import ResponsiveImage from '@/components/ResponsiveImage';
 
 gsap.registerPlugin(ScrollTrigger);
 
@@ -157,8 +158,9 @@ const ForTeachersSection = ({ className = '' }: ForTeachersSectionProps) => {
           height: '72vh',
         }}
       >
-        <img
+        <ResponsiveImage
           src="/images/for_teachers.jpg"
+          sizes="40vw"
           alt="Tanítás folyamat"
           className="w-full h-full object-cover"
         />
@@ -4,6 +4,7 @@ import { ScrollTrigger } from 'gsap/ScrollTrigger';
 import { Search, MapPin } from 'lucide-react';
 import { useSearch } from '@/hooks/useSearch';
 import { Dialog, DialogContent, DialogHeader, DialogTitle } from '@/components/ui/dialog';
+import ResponsiveImage from '@/components/ResponsiveImage';
 
 gsap.registerPlugin(ScrollTrigger);
 
@@ -179,8 +180,10 @@ const HeroSection = ({ className = '' }: HeroSectionProps) => {
             height: '30vh',
           }}
         >
-          <img
+          <ResponsiveImage
             src="/images/hero_piano.jpg"
+            sizes="34vw"
+            loading="eager"
             alt="Zongora játék"
             className="w-full h-full object-cover"
           />
@@ -206,8 +209,10 @@ const HeroSection = ({ className = '' }: HeroSectionProps) => {
             height: '44vh',
           }}
         >
-          <img
+          <ResponsiveImage
             src="/images/hero_teacher.jpg"
+            sizes="50vw"
+            loading="eager"
             alt="Zenetanár és diák"
             className="w-full h-full object-cover"
           />
@@ -233,8 +238,10 @@ const HeroSection = ({ className = '' }: HeroSectionProps) => {
             height: '38vh',
           }}
         >
-          <img
+          <ResponsiveImage
             src="/images/hero_portrait.jpg"
+            sizes="34vw"
+            loading="eager"
             alt="Zenetanár portré"
             className="w-full h-full object-cover"
           />
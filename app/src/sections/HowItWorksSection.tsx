@@ -1,6 +1,7 @@
 import { useRef, useLayoutEffect } from 'react';
 import { gsap } from 'gsap';
 import { ScrollTrigger } from 'gsap/ScrollTrigger';
+import ResponsiveImage from '@/components/ResponsiveImage';
 
 gsap.registerPlugin(ScrollTrigger);
 
@@ -117,8 +118,9 @@ const HowItWorksSection = ({ className = '' }: HowItWorksSectionProps) => {
           height: '72vh',
         }}
       >
-        <img
+        <ResponsiveImage
           src="/images/how_it_works.jpg"
+          sizes="40vw"
           alt="Zenetanítás folyamat"
           className="w-full h-full object-cover"
         />
@@ -3,6 +3,7 @@ import { useNavigate } from 'react-router-dom';
 import { gsap } from 'gsap';
 import { ScrollTrigger } from 'gsap/ScrollTrigger';
 import { ArrowUpRight } from 'lucide-react';
+import ResponsiveImage from '@/components/ResponsiveImage';
 
 gsap.registerPlugin(ScrollTrigger);
 
@@ -66,7 +67,7 @@ const InstrumentsSection = ({ className = '' }: InstrumentsSectionProps) => {
   }, []);
 
   const handleInstrumentClick = (instrumentName: string) => {
-    navigate(`/kereses?instrument=${encodeURIComponent(instrumentName)}`);
+    navigate(`/hangszer/${encodeURIComponent(instrumentName)}`);
   };
 
   const instruments = [
@@ -135,8 +136,9 @@ const InstrumentsSection = ({ className = '' }: InstrumentsSectionProps) => {
             }}
           >
             <div className="relative h-full">
-              <img
+              <ResponsiveImage
                 src={instrument.image}
+                sizes="26vw"
                 alt={instrument.name}
                 className="w-full h-full object-cover transition-transform duration-500 group-hover:scale-105"
               />
@@ -120,6 +120,8 @@ const PricingSection = ({ className = '' }: PricingSectionProps) => {
         headers: {
           'Content-Type': 'application/json',
           'Authorization': `Bearer ${token}`,
+          // Lets the backend retry against Stripe without creating a second intent
+          'Idempotency-Key': crypto.randomUUID(),
         },
         body: JSON.stringify({
           amount: 2900,
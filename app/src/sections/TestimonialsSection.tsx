@@ -2,6 +2,7 @@ import { useRef, useLayoutEffect, useState } from 'react';
 import { gsap } from 'gsap';
 import { ScrollTrigger } from 'gsap/ScrollTrigger';
 import { Quote, ChevronLeft, ChevronRight, ArrowUpRight } from 'lucide-react';
+import ResponsiveImage from '@/components/ResponsiveImage';
 
 gsap.registerPlugin(ScrollTrigger);
 
@@ -171,8 +172,9 @@ const TestimonialsSection = ({ className = '' }: TestimonialsSectionProps) => {
           height: '72vh',
         }}
       >
-        <img
+        <ResponsiveImage
           src="/images/testimonial.jpg"
+          sizes="38vw"
           alt="Elégedett diák"
           className="w-full h-full object-cover"
         />
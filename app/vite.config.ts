@@ -5,7 +5,8 @@ import { inspectAttr } from 'kimi-plugin-inspect-react'
 
 // https://vite.dev/config/
 export default defineConfig({
-  base: './',
+  // Absolute, so nested routes like /varos/:city load the same assets
+  base: '/',
   plugins: [inspectAttr(), react()],
   resolve: {
     alias: {
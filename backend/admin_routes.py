@@ -1,13 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, select, update, delete
+from typing import List, Literal, Optional
 from datetime import datetime, timedelta
 
-from database import get_db
-from models import User, Advertisement, Payment, Instrument, Location, TeacherProfile, AdStatus, UserRole
-from schemas import UserResponse, AdvertisementResponse
-from auth import get_current_user
+from database import get_db, SessionLocal
+from models import User, Advertisement, ContactMessage, Payment, Instrument, Location, TeacherProfile, Job, AdStatus, UserRole
+from schemas import UserResponse, AdvertisementResponse, BulkModerationRequest, BulkModerationResponse, ProfilingConfig, ArchiveRunRequest, ArchiveRestoreRequest
+from bulk import chunked, add_days, BULK_CHUNK_SIZE
+import versions
+import archive
+import analytics
+import jobs
+import dashboard
+import catalog
+import images
+import profiling
+import pubsub
+from auth import get_current_user, get_user_from_token
+from serializers import FastJSONResponse
+import metrics
 
 router = APIRouter(prefix="/api/admin", tags=["admin"])
 
@@ -61,6 +75,33 @@ def get_dashboard_stats(
         "revenue": float(total_revenue)
     }
 
+@router.get("/events")
+async def stream_admin_events(request: Request, token: str):
+    """Server-sent events for the live dashboard: new and moderated ads, users
+    and payments, each with its change to the /stats counters.
+    
+    EventSource can't send headers, so the access token comes as a query parameter.
+    A "ready" event opens every connection; clients reload /stats on it so
+    nothing missed while disconnected is lost.
+    """
+    def is_admin():
+        db = SessionLocal()
+        try:
+            user = get_user_from_token(db, token)
+            return user is not None and user.role == UserRole.ADMIN
+        finally:
+            db.close()
+    
+    if not await run_in_threadpool(is_admin):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
+    
+    async def events():
+        async with pubsub.subscribe(dashboard.CHANNEL) as queue:
+            async for chunk in pubsub.sse_stream(request, queue, [{"type": "ready"}]):
+                yield chunk
+    
+    return StreamingResponse(events(), media_type="text/event-stream", headers=pubsub.SSE_HEADERS)
+
 # ==================== USER MANAGEMENT ====================
 
 @router.get("/users", response_model=List[dict])
@@ -71,24 +112,15 @@ def get_all_users(
     db: Session = Depends(get_db)
 ):
     """Get all users with their details"""
-    users = db.query(User).offset(skip).limit(limit).all()
-    
-    result = []
-    for user in users:
-        ad_count = db.query(Advertisement).filter(Advertisement.teacher_id == user.id).count()
-        result.append({
-            "id": user.id,
-            "email": user.email,
-            "first_name": user.first_name,
-            "last_name": user.last_name,
-            "phone": user.phone,
-            "role": user.role.value,
-            "is_active": user.is_active,
-            "created_at": user.created_at.isoformat() if user.created_at else None,
-            "advertisement_count": ad_count
-        })
-    
-    return result
+    ad_counts = db.query(
+        Advertisement.teacher_id,
+        func.count(Advertisement.id).label("ad_count")
+    ).group_by(Advertisement.teacher_id).subquery()
+    users = db.query(User, func.coalesce(ad_counts.c.ad_count, 0)).outerjoin(
+        ad_counts, ad_counts.c.teacher_id == User.id
+    ).order_by(User.id).offset(skip).limit(limit).all()
+    
+    return [dashboard.user_summary(user, ad_count) for user, ad_count in users]
 
 @router.get("/users/emails")
 def get_all_user_emails(
@@ -119,6 +151,7 @@ def update_user(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
+    old_role = user.role
     # Update allowed fields
     if "first_name" in user_data:
         user.first_name = user_data["first_name"]
@@ -131,6 +164,8 @@ def update_user(
     if "role" in user_data:
         user.role = UserRole(user_data["role"])
     
+    ad_count = db.query(Advertisement).filter(Advertisement.teacher_id == user.id).count()
+    dashboard.user_updated(db, user, old_role, ad_count)
     db.commit()
     db.refresh(user)
     
@@ -147,6 +182,8 @@ def delete_user(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
+    dashboard.user_deleted(db, user)
+    images.delete_photos(db, [user.id])
     db.delete(user)
     db.commit()
     
@@ -168,30 +205,13 @@ def get_all_advertisements(
     if status:
         query = query.filter(Advertisement.status == status)
     
-    ads = query.order_by(Advertisement.created_at.desc()).offset(skip).limit(limit).all()
-    
-    result = []
-    for ad in ads:
-        result.append({
-            "id": ad.id,
-            "title": ad.title,
-            "short_description": ad.short_description,
-            "status": ad.status.value,
-            "featured": ad.featured,
-            "views": ad.views,
-            "contacts": ad.contacts,
-            "created_at": ad.created_at.isoformat() if ad.created_at else None,
-            "expires_at": ad.expires_at.isoformat() if ad.expires_at else None,
-            "teacher": {
-                "id": ad.teacher.id,
-                "name": f"{ad.teacher.first_name} {ad.teacher.last_name}",
-                "email": ad.teacher.email
-            },
-            "instrument": ad.instrument.name_hu if ad.instrument else None,
-            "location": ad.location.city if ad.location else None
-        })
-    
-    return result
+    ads = query.options(
+        joinedload(Advertisement.teacher),
+        joinedload(Advertisement.instrument),
+        joinedload(Advertisement.location)
+    ).order_by(Advertisement.created_at.desc()).offset(skip).limit(limit).all()
+    
+    return FastJSONResponse([dashboard.ad_summary(ad) for ad in ads])
 
 @router.put("/advertisements/{ad_id}/approve")
 def approve_advertisement(
@@ -204,8 +224,11 @@ def approve_advertisement(
     if not ad:
         raise HTTPException(status_code=404, detail="Advertisement not found")
     
+    old_status = ad.status
     ad.status = AdStatus.ACTIVE
     ad.expires_at = datetime.utcnow() + timedelta(days=30)  # 30 days from approval
+    jobs.enqueue(db, "ad.moderated", {"ad_id": ad.id, "action": "approve"})
+    dashboard.ads_changed(db, [ad], {ad.id: old_status})
     
     db.commit()
     db.refresh(ad)
@@ -224,7 +247,10 @@ def reject_advertisement(
     if not ad:
         raise HTTPException(status_code=404, detail="Advertisement not found")
     
+    old_status = ad.status
     ad.status = AdStatus.SUSPENDED
+    jobs.enqueue(db, "ad.moderated", {"ad_id": ad.id, "action": "reject", "reason": reason})
+    dashboard.ads_changed(db, [ad], {ad.id: old_status})
     
     db.commit()
     
@@ -246,6 +272,7 @@ def extend_advertisement(
         ad.expires_at = ad.expires_at + timedelta(days=days)
     else:
         ad.expires_at = datetime.utcnow() + timedelta(days=days)
+    dashboard.ads_changed(db, [ad], {ad.id: ad.status})
     
     db.commit()
     
@@ -262,11 +289,177 @@ def delete_advertisement(
     if not ad:
         raise HTTPException(status_code=404, detail="Advertisement not found")
     
+    dashboard.ads_deleted(db, {ad.id: ad.status})
     db.delete(ad)
     db.commit()
     
     return {"message": "Advertisement deleted"}
 
+BULK_OUTCOMES = {"approve": "approved", "reject": "rejected", "extend": "extended", "delete": "deleted"}
+
+def _bulk_targets(db: Session, request: BulkModerationRequest):
+    """Yield chunks of (id, teacher_id, status) rows selected by ids or by filter."""
+    if request.ids is not None:
+        for chunk in chunked(dict.fromkeys(request.ids)):
+            rows = db.execute(
+                select(Advertisement.id, Advertisement.teacher_id, Advertisement.status).where(Advertisement.id.in_(chunk))
+            ).all()
+            yield chunk, rows
+        return
+    
+    conditions = []
+    if request.filter.status:
+        conditions.append(Advertisement.status == request.filter.status)
+    if request.filter.older_than_days is not None:
+        cutoff = datetime.utcnow() - timedelta(days=request.filter.older_than_days)
+        conditions.append(Advertisement.created_at < cutoff)
+    last_id = 0
+    while True:
+        rows = db.execute(
+            select(Advertisement.id, Advertisement.teacher_id, Advertisement.status)
+            .where(Advertisement.id > last_id, *conditions)
+            .order_by(Advertisement.id)
+            .limit(BULK_CHUNK_SIZE)
+        ).all()
+        if not rows:
+            return
+        last_id = rows[-1].id
+        yield [row.id for row in rows], rows
+
+@router.post("/advertisements/bulk", response_model=BulkModerationResponse)
+def bulk_moderate_advertisements(
+    request: BulkModerationRequest,
+    admin: User = Depends(require_admin),
+    db: Session = Depends(get_db)
+):
+    """Approve, reject, extend or delete many advertisements at once.
+    
+    Targets are given as ids or as a filter (e.g. all pending older than N days)
+    and processed in chunks, one set-based statement and transaction per chunk.
+    """
+    if (request.ids is None) == (request.filter is None):
+        raise HTTPException(status_code=400, detail="Provide either ids or filter")
+    if request.filter is not None and request.filter.status is None and request.filter.older_than_days is None:
+        # An empty filter would match every advertisement
+        raise HTTPException(status_code=400, detail="The filter needs status or older_than_days")
+    
+    now = datetime.utcnow()
+    dialect = db.get_bind().dialect.name
+    outcome = BULK_OUTCOMES[request.action]
+    results = []
+    processed = 0
+    
+    for requested_ids, rows in _bulk_targets(db, request):
+        found = [row.id for row in rows]
+        if found:
+            matching = Advertisement.id.in_(found)
+            if request.action == "approve":
+                db.execute(update(Advertisement).where(matching).values(
+                    status=AdStatus.ACTIVE, expires_at=now + timedelta(days=30)
+                ), execution_options={"synchronize_session": False})
+            elif request.action == "reject":
+                db.execute(update(Advertisement).where(matching).values(
+                    status=AdStatus.SUSPENDED
+                ), execution_options={"synchronize_session": False})
+            elif request.action == "extend":
+                db.execute(update(Advertisement).where(matching).values(
+                    expires_at=func.coalesce(
+                        add_days(Advertisement.expires_at, request.days, dialect),
+                        now + timedelta(days=request.days)
+                    )
+                ), execution_options={"synchronize_session": False})
+            else:
+                # Keep the messages in the teacher's inbox, just unlink them
+                db.execute(update(ContactMessage).where(
+                    ContactMessage.advertisement_id.in_(found)
+                ).values(advertisement_id=None), execution_options={"synchronize_session": False})
+                db.execute(delete(Advertisement).where(matching), execution_options={"synchronize_session": False})
+            
+            old_statuses = {row.id: row.status for row in rows}
+            if request.action == "delete":
+                dashboard.ads_deleted(db, old_statuses)
+            else:
+                dashboard.ads_changed(db, db.execute(
+                    select(Advertisement.id, Advertisement.status, Advertisement.expires_at).where(matching)
+                ).all(), old_statuses)
+            
+            if request.action in ("approve", "reject"):
+                jobs.enqueue_many(db, "ad.moderated", (
+                    {"ad_id": ad_id, "action": request.action, "reason": request.reason} for ad_id in found
+                ), priority=jobs.PRIORITY_LOW)
+            
+            # Invalidate cached ads and teacher profiles in one statement
+            scopes = {"catalog"}
+            for row in rows:
+                scopes.add(f"ad:{row.id}")
+                scopes.add(f"teacher:{row.teacher_id}")
+            versions.touch(db.connection(), scopes)
+            db.commit()
+            processed += len(found)
+        
+        found_set = set(found)
+        results.extend(
+            {"id": ad_id, "outcome": outcome if ad_id in found_set else "not_found"}
+            for ad_id in requested_ids
+        )
+    
+    return {"action": request.action, "processed": processed, "results": results}
+
+# ==================== ARCHIVE ====================
+
+@router.get("/archive/stats")
+def get_archive_stats(
+    admin: User = Depends(require_admin),
+    db: Session = Depends(get_db)
+):
+    """Hot and archived row counts for ads and messages"""
+    return archive.stats(db)
+
+@router.post("/archive/run")
+def run_archive(
+    request: ArchiveRunRequest,
+    admin: User = Depends(require_admin),
+    db: Session = Depends(get_db)
+):
+    """Archive expired/suspended ads and old messages in batches"""
+    return archive.run(
+        db,
+        ads_days=archive.ARCHIVE_ADS_AFTER_DAYS if request.ads_days is None else request.ads_days,
+        messages_days=archive.ARCHIVE_MESSAGES_AFTER_DAYS if request.messages_days is None else request.messages_days,
+        dry_run=request.dry_run
+    )
+
+@router.post("/archive/restore")
+def restore_archived(
+    request: ArchiveRestoreRequest,
+    admin: User = Depends(require_admin),
+    db: Session = Depends(get_db)
+):
+    """Move archived ads or messages back to the live tables"""
+    return archive.restore(db, request.kind, request.ids)
+
+@router.get("/archive/export")
+def export_archive(
+    kind: Literal["ads", "messages"],
+    since: Optional[datetime] = None,
+    admin: User = Depends(require_admin)
+):
+    """Download archived ads or messages as gzipped JSON Lines"""
+    def stream():
+        # The request's session is closed before the body is streamed, so use our own
+        db = SessionLocal()
+        try:
+            yield from archive.export_gzip(db, kind, since)
+        finally:
+            db.close()
+    
+    filename = f"{kind}-archive-{datetime.utcnow():%Y%m%d}.jsonl.gz"
+    return StreamingResponse(
+        stream(),
+        media_type="application/gzip",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
 # ==================== PRICING MANAGEMENT ====================
 
 @router.get("/pricing")
@@ -344,3 +537,156 @@ def get_location_stats(
         }
         for s in stats
     ]
+
+# ==================== ENGAGEMENT ANALYTICS ====================
+
+@router.get("/analytics/segments")
+def get_segment_stats(
+    instrument_id: Optional[int] = None,
+    city: Optional[str] = None,
+    granularity: str = Query("day", pattern="^(hour|day)$"),
+    periods: int = Query(30, ge=1, le=744),
+    admin: User = Depends(require_admin),
+    db: Session = Depends(get_db)
+):
+    """Views, contacts and impressions per hour or day for an instrument and/or city"""
+    return {
+        "instrument_id": instrument_id,
+        "city": city,
+        "granularity": granularity,
+        "series": analytics.segment_series(db, instrument_id, city, granularity, periods)
+    }
+
+# ==================== BACKGROUND JOBS ====================
+
+@router.get("/jobs/stats")
+def get_job_stats(
+    admin: User = Depends(require_admin),
+    db: Session = Depends(get_db)
+):
+    """Job counts by status and, for queued and dead jobs, by kind"""
+    return jobs.stats(db)
+
+@router.get("/jobs")
+def get_jobs(
+    status: str = Query("dead", pattern="^(queued|running|done|dead)$"),
+    kind: Optional[str] = None,
+    skip: int = 0,
+    limit: int = Query(50, le=200),
+    admin: User = Depends(require_admin),
+    db: Session = Depends(get_db)
+):
+    """List jobs by status; defaults to the dead-letter queue"""
+    query = db.query(Job).filter(Job.status == status)
+    if kind:
+        query = query.filter(Job.kind == kind)
+    rows = query.order_by(Job.id.desc()).offset(skip).limit(limit).all()
+    return FastJSONResponse([
+        {
+            "id": job.id,
+            "kind": job.kind,
+            "payload": job.payload,
+            "priority": job.priority,
+            "status": job.status,
+            "attempts": job.attempts,
+            "max_attempts": job.max_attempts,
+            "run_at": job.run_at,
+            "last_error": job.last_error,
+            "created_at": job.created_at,
+            "finished_at": job.finished_at,
+        }
+        for job in rows
+    ])
+
+@router.post("/jobs/{job_id}/retry")
+def retry_job(
+    job_id: int,
+    admin: User = Depends(require_admin),
+    db: Session = Depends(get_db)
+):
+    """Requeue a dead job"""
+    if not jobs.retry(db, job_id):
+        raise HTTPException(status_code=404, detail="Dead job not found")
+    return {"message": "Job requeued"}
+
+@router.delete("/jobs/{job_id}")
+def delete_job(
+    job_id: int,
+    admin: User = Depends(require_admin),
+    db: Session = Depends(get_db)
+):
+    """Discard a job that is not running"""
+    job = db.query(Job).filter(Job.id == job_id, Job.status != "running").first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    db.delete(job)
+    db.commit()
+    return {"message": "Job deleted"}
+
+# ==================== SERVICE METRICS ====================
+
+@router.get("/metrics")
+def get_service_metrics(
+    admin: User = Depends(require_admin)
+):
+    """Request, cache, pool and Stripe metrics merged across workers"""
+    return metrics.series()
+
+# ==================== CATALOG ====================
+
+@router.get("/catalog")
+def get_catalog_status(
+    check: bool = False,
+    admin: User = Depends(require_admin),
+    db: Session = Depends(get_db)
+):
+    """State of this worker's in-memory ad catalog; ?check=true compares it with the database"""
+    if check:
+        if not catalog.active_ads.ready:
+            raise HTTPException(status_code=409, detail="The catalog is not loaded on this worker")
+        catalog.active_ads.check(db)
+    return catalog.active_ads.status()
+
+
+# ==================== PROFILES ====================
+
+@router.get("/profiles")
+def list_profiles(admin: User = Depends(require_admin)):
+    """This worker's profiling settings and captured request profiles, newest first"""
+    return {**profiling.profiler.status(), "captured": profiling.profiler.summaries()}
+
+
+@router.put("/profiles/config")
+def configure_profiling(config: ProfilingConfig, admin: User = Depends(require_admin)):
+    """Change this worker's sampling rate or routes until it restarts"""
+    if not profiling.PROFILE_ENABLED:
+        raise HTTPException(status_code=409, detail="Profiling is disabled with PROFILE_ENABLED=0")
+    profiling.profiler.configure(sample_rate=config.sample_rate, routes=config.routes)
+    return profiling.profiler.status()
+
+
+@router.get("/profiles/{profile_id}")
+def download_profile(
+    profile_id: int,
+    format: Literal["pstats", "text"] = "pstats",
+    sort: Literal["cumulative", "tottime", "calls"] = "cumulative",
+    limit: int = Query(50, ge=1, le=1000),
+    admin: User = Depends(require_admin)
+):
+    """A captured profile as a pstats file, or its top functions as text"""
+    profile = profiling.profiler.get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Profile not found on this worker")
+    if format == "text":
+        return PlainTextResponse(profiling.text(profile, sort, limit))
+    return Response(
+        profiling.dump(profile),
+        media_type="application/octet-stream",
+        headers={"Content-Disposition": f'attachment; filename="profile-{profile.id}.prof"'},
+    )
+
+
+@router.delete("/profiles")
+def clear_profiles(admin: User = Depends(require_admin)):
+    """Drop this worker's captured profiles"""
+    return {"cleared": profiling.profiler.clear()}
@@ -0,0 +1,342 @@
+"""Engagement analytics for advertisements.
+
+Views, contacts and search impressions are recorded as append-only
+`engagement_events`. Requests only append to an in-memory buffer; a
+background thread writes the buffer in one transaction every
+ANALYTICS_FLUSH_INTERVAL seconds (or as soon as ANALYTICS_FLUSH_SIZE events
+are waiting), which:
+
+- bulk inserts the events,
+- adds them to the hourly and daily rollups per ad and per instrument/city
+  with one upsert per table (count = count + n), and
+- adds views and contacts to the lifetime counters on `advertisements`.
+
+Time series are then read from the rollups only, one primary-key range scan
+per ad or segment, and zero-filled in Python.
+
+A batch that fails to write is retried on its own with the next flushes
+and dropped after ANALYTICS_MAX_ATTEMPTS failures. At most
+ANALYTICS_MAX_PENDING events wait in the buffer; past that the oldest are
+dropped, so a database outage can't exhaust the API's memory.
+"""
+import logging
+import os
+import threading
+from collections import Counter
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert, select, update, delete, func, or_
+
+from database import SessionLocal, upsert
+from models import EngagementEvent, AdStatsRollup, SegmentStatsRollup, Advertisement
+import metrics
+
+logger = logging.getLogger("analytics")
+
+FLUSH_INTERVAL = float(os.getenv("ANALYTICS_FLUSH_INTERVAL", "2"))
+FLUSH_SIZE = int(os.getenv("ANALYTICS_FLUSH_SIZE", "500"))
+MAX_PENDING = int(os.getenv("ANALYTICS_MAX_PENDING", "100000"))
+MAX_ATTEMPTS = int(os.getenv("ANALYTICS_MAX_ATTEMPTS", "5"))
+
+EVENTS_DROPPED = metrics.Counter("analytics_events_dropped_total", "Engagement events dropped unwritten", ("reason",))
+
+EVENT_TYPES = ("view", "contact", "impression")
+# Rollup column per event type
+EVENT_COLUMNS = {"view": "views", "contact": "contacts", "impression": "impressions"}
+
+GRANULARITIES = {
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+}
+
+
+def bucket_start(moment: datetime, granularity: str) -> datetime:
+    """Start of the hour or day that contains `moment`."""
+    if granularity == "hour":
+        return moment.replace(minute=0, second=0, microsecond=0)
+    return moment.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+# ==================== WRITER ====================
+
+def targets(ads) -> list:
+    """The event fields of ads, as plain dicts that outlive their session."""
+    return [
+        {
+            "advertisement_id": ad.id,
+            "teacher_id": ad.teacher_id,
+            "instrument_id": ad.instrument_id,
+            "city": ad.location.city if ad.location else None,
+        }
+        for ad in ads
+    ]
+
+
+class EventWriter:
+    """Buffer engagement events and write them in batches."""
+
+    def __init__(self, session_factory=SessionLocal, flush_size: int = FLUSH_SIZE,
+                 flush_interval: float = FLUSH_INTERVAL, max_pending: int = MAX_PENDING,
+                 max_attempts: int = MAX_ATTEMPTS):
+        self.session_factory = session_factory
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_attempts = max_attempts
+        self._pending = []
+        self._failed = None  # (events, attempts) of the batch that last failed
+        self._lock = threading.Lock()
+        # Serializes flushes, so batches are applied one at a time
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def __len__(self):
+        return len(self._pending) + (len(self._failed[0]) if self._failed else 0)
+
+    def record(self, event_type: str, ad, at: datetime = None):
+        """Queue one event for an ad (an Advertisement with its location loaded)."""
+        self.record_many(event_type, [ad], at)
+
+    def record_many(self, event_type: str, ads, at: datetime = None):
+        self.record_targets(event_type, targets(ads), at)
+
+    def record_targets(self, event_type: str, ad_targets, at: datetime = None):
+        """Queue events for ads described by targets()."""
+        at = at or datetime.utcnow()
+        events = [dict(target, event_type=event_type, occurred_at=at) for target in ad_targets]
+        if not events:
+            return
+        with self._lock:
+            self._pending.extend(events)
+            overflow = len(self._pending) - self.max_pending
+            if overflow > 0:
+                del self._pending[:overflow]
+            full = len(self._pending) >= self.flush_size
+        if overflow > 0:
+            EVENTS_DROPPED.inc(overflow, reason="overflow")
+        if full:
+            if self._thread is not None:
+                self._wakeup.set()
+            else:
+                self.flush()
+
+    def flush(self) -> int:
+        """Write the batch that failed last, then all buffered events. Returns the number written."""
+        with self._flush_lock:
+            written = 0
+            if self._failed is not None:
+                events, attempts = self._failed
+                self._failed = None
+                written += self._write(events, attempts)
+            with self._lock:
+                events, self._pending = self._pending, []
+            return written + self._write(events, 0)
+
+    def _write(self, events, attempts: int) -> int:
+        if not events:
+            return 0
+        db = self.session_factory()
+        try:
+            apply_events(db, events)
+            db.commit()
+        except Exception:
+            db.rollback()
+            attempts += 1
+            if attempts >= self.max_attempts:
+                EVENTS_DROPPED.inc(len(events), reason="failed")
+                logger.error("Dropping %s engagement events after %s failed writes", len(events), attempts)
+            else:
+                # Retried on its own with the next flush
+                self._failed = (events, attempts)
+            raise
+        finally:
+            db.close()
+        return len(events)
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Writing engagement events failed")
+
+    def start(self):
+        """Flush in a background thread from now on."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="analytics-flush", daemon=True)
+            self._thread.start()
+
+
+def apply_events(db, events):
+    """Insert raw events and fold them into the rollups and lifetime counters."""
+    db.execute(insert(EngagementEvent.__table__), events)
+
+    ad_counts = Counter()
+    segment_counts = Counter()
+    lifetime = Counter()
+    for event in events:
+        column = EVENT_COLUMNS[event["event_type"]]
+        for granularity in GRANULARITIES:
+            bucket = bucket_start(event["occurred_at"], granularity)
+            ad_counts[(granularity, event["advertisement_id"], bucket, column)] += 1
+            segment_counts[(granularity, event["instrument_id"] or 0, event["city"] or "", bucket, column)] += 1
+        if column != "impressions":
+            lifetime[(event["advertisement_id"], column)] += 1
+
+    connection = db.connection()
+    _increment(connection, AdStatsRollup.__table__, ["granularity", "advertisement_id", "bucket"], ad_counts)
+    _increment(connection, SegmentStatsRollup.__table__, ["granularity", "instrument_id", "city", "bucket"], segment_counts)
+
+    for ad_id in {ad_id for ad_id, _ in lifetime}:
+        views, contacts = lifetime[(ad_id, "views")], lifetime[(ad_id, "contacts")]
+        db.execute(
+            update(Advertisement)
+            .where(Advertisement.id == ad_id)
+            .values(views=Advertisement.views + views, contacts=Advertisement.contacts + contacts),
+            execution_options={"synchronize_session": False},
+        )
+
+
+def _increment(connection, table, key, counts):
+    """Upsert rollup rows, adding the counted events to existing buckets."""
+    rows = {}
+    for (*key_values, column), count in counts.items():
+        row = rows.setdefault(tuple(key_values), {
+            **dict(zip(key, key_values)), "views": 0, "contacts": 0, "impressions": 0,
+        })
+        row[column] = count
+    upsert(
+        connection, table, list(rows.values()), key=key,
+        update=lambda table, incoming: {
+            column: table.c[column] + incoming[column] for column in ("views", "contacts", "impressions")
+        },
+    )
+
+
+writer = EventWriter()
+metrics.register_backlog("analytics", lambda: len(writer))
+
+
+def record_view(ad):
+    writer.record("view", ad)
+
+
+def record_contact(ad):
+    writer.record("contact", ad)
+
+
+def record_impressions(ads):
+    writer.record_many("impression", ads)
+
+
+def record_impression_targets(ad_targets):
+    """Impressions of a cached search page (see targets())."""
+    writer.record_targets("impression", ad_targets)
+
+
+def forget(db, teacher_ids, ad_ids) -> int:
+    """Delete the events and per-ad rollups of deleted teachers and their ads; the caller commits.
+
+    Segment rollups only hold totals per instrument and city, so they stay.
+    Returns the number of events deleted.
+    """
+    teacher_ids, ad_ids = list(teacher_ids), list(ad_ids)
+    deleted = db.execute(delete(EngagementEvent).where(or_(
+        EngagementEvent.teacher_id.in_(teacher_ids), EngagementEvent.advertisement_id.in_(ad_ids)
+    ))).rowcount
+    if ad_ids:
+        db.execute(delete(AdStatsRollup).where(AdStatsRollup.advertisement_id.in_(ad_ids)))
+    return deleted
+
+
+# ==================== QUERIES ====================
+
+def _range(granularity: str, periods: int, until: datetime = None):
+    step = GRANULARITIES[granularity]
+    end = bucket_start(until or datetime.utcnow(), granularity)
+    start = end - step * (periods - 1)
+    return start, end, step
+
+
+def _series(rows, start, end, step) -> list:
+    found = {row.bucket: row for row in rows}
+    series = []
+    bucket = start
+    while bucket <= end:
+        row = found.get(bucket)
+        series.append({
+            "bucket": bucket,
+            "views": int(row.views) if row else 0,
+            "contacts": int(row.contacts) if row else 0,
+            "impressions": int(row.impressions) if row else 0,
+        })
+        bucket += step
+    return series
+
+
+def ad_series(db, ad_id: int, granularity: str = "day", periods: int = 30) -> list:
+    """Per-bucket counts of one ad, oldest first, zero-filled."""
+    start, end, step = _range(granularity, periods)
+    rows = db.execute(
+        select(AdStatsRollup).where(
+            AdStatsRollup.granularity == granularity,
+            AdStatsRollup.advertisement_id == ad_id,
+            AdStatsRollup.bucket.between(start, end),
+        )
+    ).scalars()
+    return _series(rows, start, end, step)
+
+
+def segment_series(db, instrument_id: int = None, city: str = None,
+                   granularity: str = "day", periods: int = 30) -> list:
+    """Per-bucket counts of an instrument and/or city, oldest first, zero-filled.
+
+    With only one of the two given, the buckets are summed over the other.
+    """
+    start, end, step = _range(granularity, periods)
+    conditions = [
+        SegmentStatsRollup.granularity == granularity,
+        SegmentStatsRollup.bucket.between(start, end),
+    ]
+    if instrument_id is not None:
+        conditions.append(SegmentStatsRollup.instrument_id == instrument_id)
+    if city is not None:
+        conditions.append(SegmentStatsRollup.city == city)
+    rows = db.execute(
+        select(
+            SegmentStatsRollup.bucket,
+            func.sum(SegmentStatsRollup.views).label("views"),
+            func.sum(SegmentStatsRollup.contacts).label("contacts"),
+            func.sum(SegmentStatsRollup.impressions).label("impressions"),
+        ).where(*conditions).group_by(SegmentStatsRollup.bucket)
+    ).all()
+    return _series(rows, start, end, step)
+
+
+def ad_totals(db, ad_ids, days: int = 30) -> dict:
+    """Views, contacts and impressions per ad over the last `days` days."""
+    ad_ids = list(ad_ids)
+    totals = {ad_id: {"views": 0, "contacts": 0, "impressions": 0} for ad_id in ad_ids}
+    if not ad_ids:
+        return totals
+    start, _, _ = _range("day", days)
+    rows = db.execute(
+        select(
+            AdStatsRollup.advertisement_id,
+            func.sum(AdStatsRollup.views).label("views"),
+            func.sum(AdStatsRollup.contacts).label("contacts"),
+            func.sum(AdStatsRollup.impressions).label("impressions"),
+        ).where(
+            AdStatsRollup.granularity == "day",
+            AdStatsRollup.advertisement_id.in_(ad_ids),
+            AdStatsRollup.bucket >= start,
+        ).group_by(AdStatsRollup.advertisement_id)
+    ).all()
+    for row in rows:
+        totals[row.advertisement_id] = {
+            "views": int(row.views), "contacts": int(row.contacts), "impressions": int(row.impressions)
+        }
+    return totals
@@ -0,0 +1,341 @@
+"""Archival of expired advertisements and old contact messages.
+
+Ads that have been expired or suspended for longer than ARCHIVE_ADS_AFTER_DAYS
+and messages older than ARCHIVE_MESSAGES_AFTER_DAYS are moved, in bounded
+batches, into the advertisements_archive and contact_messages_archive tables.
+Rows keep their ids, so they can be restored exactly, and the archive can be
+exported as gzipped JSON Lines.
+
+This relies on the hot tables never reusing an id: they are declared with
+AUTOINCREMENT on SQLite (tables created before that must be recreated), and
+MySQL must be 8.0 or newer, since older versions reset the AUTO_INCREMENT
+counter to MAX(id) + 1 on restart. An archived row whose id is taken in the
+hot table anyway is reported as a conflict and left in the archive.
+
+An ad that still has messages in the hot table is kept until those messages
+are archived as well, so archived messages never point at a hot ad that has
+disappeared and restored messages can bring their ad back with them.
+
+Usage (from the backend directory):
+    python archive.py run [--dry-run] [--ads-days N] [--messages-days N]
+    python archive.py restore ads|messages <id> [<id> ...]
+    python archive.py export ads|messages <file.jsonl.gz>
+    python archive.py stats
+"""
+import argparse
+import os
+import sys
+import zlib
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, insert, delete, exists, case, func, literal
+
+from database import SessionLocal, engine, Base
+from models import (
+    User, Advertisement, ContactMessage, ArchivedAdvertisement, ArchivedContactMessage, AdStatus
+)
+from bulk import chunked, BULK_CHUNK_SIZE
+from serializers import dumps
+import versions
+import inbox
+
+ARCHIVE_ADS_AFTER_DAYS = int(os.getenv("ARCHIVE_ADS_AFTER_DAYS", "90"))
+ARCHIVE_MESSAGES_AFTER_DAYS = int(os.getenv("ARCHIVE_MESSAGES_AFTER_DAYS", "365"))
+
+ARCHIVABLE_STATUSES = (AdStatus.EXPIRED, AdStatus.SUSPENDED)
+
+# kind -> (hot model, archive model)
+KINDS = {
+    "ads": (Advertisement, ArchivedAdvertisement),
+    "messages": (ContactMessage, ArchivedContactMessage),
+}
+
+
+def _columns(archive_model) -> list:
+    """Names of the columns shared by a hot table and its archive."""
+    return [column.name for column in archive_model.__table__.columns if column.name != "archived_at"]
+
+
+def _move(db, hot_model, archive_model, ids, now):
+    """Copy rows to the archive and delete them from the hot table."""
+    names = _columns(archive_model)
+    hot_table = hot_model.__table__
+    db.execute(
+        insert(archive_model.__table__).from_select(
+            names + ["archived_at"],
+            select(*[hot_table.c[name] for name in names], literal(now)).where(hot_table.c.id.in_(ids)),
+        )
+    )
+    db.execute(delete(hot_table).where(hot_table.c.id.in_(ids)))
+
+
+# ==================== ARCHIVE ====================
+
+def archive_messages(db, older_than_days: int = ARCHIVE_MESSAGES_AFTER_DAYS,
+                     batch_size: int = BULK_CHUNK_SIZE, dry_run: bool = False) -> int:
+    """Move messages older than `older_than_days` to the archive, one transaction per batch."""
+    cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+    condition = ContactMessage.created_at < cutoff
+    if dry_run:
+        return db.query(func.count(ContactMessage.id)).filter(condition).scalar()
+
+    moved = 0
+    while True:
+        ids = list(db.execute(
+            select(ContactMessage.id).where(condition).order_by(ContactMessage.id).limit(batch_size)
+        ).scalars())
+        if not ids:
+            return moved
+        unread = inbox.unread_by_recipient(db, ids)
+        inbox.ensure(db, unread)
+        _move(db, ContactMessage, ArchivedContactMessage, ids, datetime.utcnow())
+        inbox.adjust(db, {user_id: -count for user_id, count in unread.items()})
+        db.commit()
+        moved += len(ids)
+
+
+def archive_advertisements(db, older_than_days: int = ARCHIVE_ADS_AFTER_DAYS,
+                           batch_size: int = BULK_CHUNK_SIZE, dry_run: bool = False) -> int:
+    """Move ads expired or suspended for longer than `older_than_days` to the archive.
+
+    There is no status timestamp, so the expiry date (or the creation date
+    for ads that never went live) is used as the start of the period.
+    """
+    cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+    conditions = [
+        Advertisement.status.in_(ARCHIVABLE_STATUSES),
+        func.coalesce(Advertisement.expires_at, Advertisement.created_at) < cutoff,
+        ~exists().where(ContactMessage.advertisement_id == Advertisement.id),
+    ]
+    if dry_run:
+        return db.query(func.count(Advertisement.id)).filter(*conditions).scalar()
+
+    moved = 0
+    last_id = 0
+    while True:
+        rows = db.execute(
+            select(Advertisement.id, Advertisement.teacher_id)
+            .where(Advertisement.id > last_id, *conditions)
+            .order_by(Advertisement.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            return moved
+        last_id = rows[-1].id
+        ids = [row.id for row in rows]
+        _move(db, Advertisement, ArchivedAdvertisement, ids, datetime.utcnow())
+        scopes = {"catalog"}
+        for row in rows:
+            scopes.add(f"ad:{row.id}")
+            scopes.add(f"teacher:{row.teacher_id}")
+        versions.touch(db.connection(), scopes)
+        db.commit()
+        moved += len(ids)
+
+
+def run(db, ads_days: int = ARCHIVE_ADS_AFTER_DAYS, messages_days: int = ARCHIVE_MESSAGES_AFTER_DAYS,
+        batch_size: int = BULK_CHUNK_SIZE, dry_run: bool = False) -> dict:
+    """Archive old messages, then the ads they no longer hold back."""
+    messages = archive_messages(db, messages_days, batch_size, dry_run)
+    ads = archive_advertisements(db, ads_days, batch_size, dry_run)
+    return {"messages": messages, "advertisements": ads, "dry_run": dry_run}
+
+
+# ==================== RESTORE ====================
+
+def _taken(db, hot_model, ids) -> list:
+    """Ids that are already in use in the hot table."""
+    return list(db.execute(select(hot_model.id).where(hot_model.id.in_(ids))).scalars())
+
+
+def _result(ids, restored, conflicts) -> dict:
+    done = set(restored) | set(conflicts)
+    return {
+        "restored": restored,
+        "conflicts": conflicts,
+        "skipped": [row_id for row_id in dict.fromkeys(ids) if row_id not in done],
+    }
+
+
+def restore_advertisements(db, ids) -> dict:
+    """Move archived ads back to the hot table.
+
+    Ads whose teacher is gone are skipped; ads whose id is in use in the hot
+    table are reported as conflicts and stay archived.
+    """
+    restored = []
+    conflicts = []
+    for chunk in chunked(dict.fromkeys(ids)):
+        taken = _taken(db, Advertisement, chunk)
+        conflicts.extend(ad_id for ad_id in taken if db.get(ArchivedAdvertisement, ad_id) is not None)
+        rows = db.execute(
+            select(ArchivedAdvertisement.id, ArchivedAdvertisement.teacher_id)
+            .join(User, User.id == ArchivedAdvertisement.teacher_id)
+            .where(ArchivedAdvertisement.id.in_(chunk), ArchivedAdvertisement.id.notin_(taken))
+        ).all()
+        if not rows:
+            continue
+        found = [row.id for row in rows]
+        names = _columns(ArchivedAdvertisement)
+        db.execute(
+            insert(Advertisement.__table__).from_select(
+                names,
+                select(*[ArchivedAdvertisement.__table__.c[name] for name in names])
+                .where(ArchivedAdvertisement.id.in_(found)),
+            )
+        )
+        db.execute(delete(ArchivedAdvertisement).where(ArchivedAdvertisement.id.in_(found)))
+        scopes = {"catalog"}
+        for row in rows:
+            scopes.add(f"ad:{row.id}")
+            scopes.add(f"teacher:{row.teacher_id}")
+        versions.touch(db.connection(), scopes)
+        db.commit()
+        restored.extend(found)
+
+    return _result(ids, restored, conflicts)
+
+
+def restore_messages(db, ids) -> dict:
+    """Move archived messages back to the inbox, restoring their archived ads first.
+
+    Messages whose recipient is gone are skipped and messages whose id is in
+    use are reported as conflicts. A deleted sender or ad is unlinked, as
+    when it is deleted from the hot table, and so is an archived ad that
+    could not be restored because a newer ad has its id.
+    """
+    restored = []
+    conflicts = []
+    for chunk in chunked(dict.fromkeys(ids)):
+        ad_ids = list(db.execute(
+            select(ArchivedContactMessage.advertisement_id)
+            .where(ArchivedContactMessage.id.in_(chunk), ArchivedContactMessage.advertisement_id.isnot(None))
+            .distinct()
+        ).scalars())
+        other_ads = restore_advertisements(db, ad_ids)["conflicts"] if ad_ids else []
+
+        taken = _taken(db, ContactMessage, chunk)
+        conflicts.extend(message_id for message_id in taken if db.get(ArchivedContactMessage, message_id) is not None)
+        found = list(db.execute(
+            select(ArchivedContactMessage.id)
+            .join(User, User.id == ArchivedContactMessage.recipient_id)
+            .where(ArchivedContactMessage.id.in_(chunk), ArchivedContactMessage.id.notin_(taken))
+        ).scalars())
+        if not found:
+            continue
+        unread = inbox.unread_by_recipient(db, found, ArchivedContactMessage)
+        inbox.ensure(db, unread)
+        archived = ArchivedContactMessage.__table__.c
+        columns = []
+        for name in _columns(ArchivedContactMessage):
+            if name == "sender_id":
+                columns.append(case((exists().where(User.id == archived.sender_id), archived.sender_id), else_=None))
+            elif name == "advertisement_id":
+                columns.append(case(
+                    (archived.advertisement_id.in_(other_ads), None),
+                    (exists().where(Advertisement.id == archived.advertisement_id), archived.advertisement_id),
+                    else_=None,
+                ))
+            else:
+                columns.append(archived[name])
+        db.execute(
+            insert(ContactMessage.__table__).from_select(
+                _columns(ArchivedContactMessage), select(*columns).where(archived.id.in_(found))
+            )
+        )
+        db.execute(delete(ArchivedContactMessage).where(ArchivedContactMessage.id.in_(found)))
+        inbox.adjust(db, unread)
+        db.commit()
+        restored.extend(found)
+
+    return _result(ids, restored, conflicts)
+
+
+def restore(db, kind: str, ids) -> dict:
+    if kind == "ads":
+        return restore_advertisements(db, ids)
+    return restore_messages(db, ids)
+
+
+# ==================== EXPORT ====================
+
+def stats(db) -> dict:
+    """Row counts of the hot and archive tables."""
+    return {
+        kind: {
+            "hot": db.query(func.count(hot_model.id)).scalar(),
+            "archived": db.query(func.count(archive_model.id)).scalar(),
+        }
+        for kind, (hot_model, archive_model) in KINDS.items()
+    }
+
+
+def export_lines(db, kind: str, since: datetime = None):
+    """Yield archived rows of one kind as JSON Lines, streamed from the database."""
+    archive_model = KINDS[kind][1]
+    table = archive_model.__table__
+    query = select(table).order_by(table.c.id)
+    if since is not None:
+        query = query.where(table.c.archived_at >= since)
+    result = db.execute(query.execution_options(yield_per=BULK_CHUNK_SIZE))
+    for partition in result.mappings().partitions():
+        yield b"".join(dumps(dict(row)) + b"\n" for row in partition)
+
+
+def export_gzip(db, kind: str, since: datetime = None):
+    """Yield the JSON Lines export as a gzip stream."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in export_lines(db, kind, since):
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+# ==================== CLI ====================
+
+def main():
+    parser = argparse.ArgumentParser(description="Archive, restore and export old ads and messages")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="Archive old ads and messages")
+    run_parser.add_argument("--ads-days", type=int, default=ARCHIVE_ADS_AFTER_DAYS)
+    run_parser.add_argument("--messages-days", type=int, default=ARCHIVE_MESSAGES_AFTER_DAYS)
+    run_parser.add_argument("--batch-size", type=int, default=BULK_CHUNK_SIZE)
+    run_parser.add_argument("--dry-run", action="store_true", help="Only count what would be archived")
+    restore_parser = commands.add_parser("restore", help="Move archived rows back")
+    restore_parser.add_argument("kind", choices=sorted(KINDS))
+    restore_parser.add_argument("ids", type=int, nargs="+")
+    export_parser = commands.add_parser("export", help="Write archived rows to a .jsonl.gz file")
+    export_parser.add_argument("kind", choices=sorted(KINDS))
+    export_parser.add_argument("path")
+    commands.add_parser("stats", help="Show hot and archived row counts")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        if args.command == "run":
+            result = run(db, args.ads_days, args.messages_days, args.batch_size, args.dry_run)
+            verb = "Would archive" if args.dry_run else "Archived"
+            print(f"✅ {verb} {result['advertisements']} advertisements and {result['messages']} messages")
+        elif args.command == "restore":
+            result = restore(db, args.kind, args.ids)
+            print(f"✅ Restored {len(result['restored'])} {args.kind}")
+            if result["conflicts"]:
+                print(f"   ⚠️ Left archived (id in use by a newer row): {result['conflicts']}")
+            if result["skipped"]:
+                print(f"   ⚠️ Skipped (not archived or owner deleted): {result['skipped']}")
+        elif args.command == "export":
+            with open(args.path, "wb") as f:
+                for data in export_gzip(db, args.kind):
+                    f.write(data)
+            print(f"✅ Exported archived {args.kind} to {args.path}")
+        else:
+            for kind, counts in stats(db).items():
+                print(f"  {kind}: {counts['hot']} hot, {counts['archived']} archived")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
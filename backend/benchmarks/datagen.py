@@ -0,0 +1,239 @@
+"""Synthetic data for benchmarks.
+
+Extends the reference dataset (fixtures.py) with N teachers, their
+profiles, instrument/location links, advertisements, students and contact
+messages, using realistic Hungarian names and text. Rows are written with
+bulk INSERTs and explicit ids in batches, so hundreds of thousands of ads
+load in seconds. `python fixtures.py synthetic --ads N` sizes the run by
+ads instead. Every generated account uses the password BENCH_PASSWORD.
+
+Usage (from the backend directory):
+    DATABASE_URL=sqlite:///benchmarks/bench.db python -m benchmarks.datagen --teachers 1000
+"""
+import argparse
+import random
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, insert
+
+from database import SessionLocal, engine, Base
+from models import (
+    User, TeacherProfile, Instrument, Location, TeacherInstrument, TeacherLocation,
+    Advertisement, ContactMessage, UserRole, AdStatus, SubscriptionType
+)
+from auth import get_password_hash
+from versions import SITEMAP_SHARD_SIZE, shard_scope, touch
+
+BENCH_PASSWORD = "benchmark123"
+ADMIN_EMAIL = "admin@bench.zenetanar.hu"
+# Teachers written and committed per round
+TEACHER_BATCH = 5000
+
+LAST_NAMES = [
+    "Nagy", "Kovács", "Tóth", "Szabó", "Horváth", "Varga", "Kiss", "Molnár", "Németh", "Farkas",
+    "Balogh", "Papp", "Takács", "Juhász", "Lakatos", "Mészáros", "Oláh", "Simon", "Rácz", "Fekete",
+]
+FIRST_NAMES = [
+    "Anna", "Eszter", "Sára", "Zsófia", "Katalin", "Réka", "Dóra", "Júlia", "Lilla", "Noémi",
+    "Bence", "Máté", "Levente", "Dávid", "Péter", "Gábor", "Ádám", "Balázs", "Tamás", "Zoltán",
+]
+SCHOOLS = [
+    "a Liszt Ferenc Zeneművészeti Egyetemen", "a Bartók Béla Konzervatóriumban",
+    "a Debreceni Egyetem Zeneművészeti Karán", "a Szegedi Tudományegyetem Zeneművészeti Karán",
+    "a Kodály Intézetben",
+]
+TITLE_TEMPLATES = [
+    "{instrument}órák kezdőknek és haladóknak",
+    "{instrument} oktatás gyerekeknek és felnőtteknek",
+    "Egyéni {instrument_lower}órák {city} területén",
+    "Tapasztalt {instrument_lower}tanár vállal tanítványokat",
+    "{instrument} felvételi felkészítés",
+]
+SHORT_TEMPLATES = [
+    "Türelmes, tapasztalt tanár vár mindenkit szeretettel, aki {instrument_lower} tanulna.",
+    "{years} év oktatási tapasztalat, egyéni tempó, játékos módszerek.",
+    "Kottaolvasás, technika és repertoár építése {city}ban vagy online.",
+]
+LONG_PARAGRAPHS = [
+    "Egyéni órákat tartok kezdőknek és haladóknak egyaránt, az órák menetét mindig a tanítvány céljaihoz igazítom.",
+    "Foglalkozunk helyes testtartással, technikai gyakorlatokkal, kottaolvasással és a kedvenc darabjaiddal.",
+    "Zeneiskolai és konzervatóriumi felvételire is felkészítek, valamint versenyekre és vizsgákra.",
+    "Az első próbaóra ingyenes, ahol megbeszéljük, milyen zenét szeretnél játszani.",
+    "Online és személyes órák is elérhetőek, rugalmas időbeosztással, hétvégén is.",
+]
+MESSAGES = [
+    "Jó napot! Érdeklődnék, hogy van-e még szabad időpont hétköznap délután?",
+    "Szia! A lányom szeretne tanulni, 9 éves. Mikor tudnánk egy próbaórát egyeztetni?",
+    "Kezdő felnőtt vagyok, lehetséges heti egy alkalom online?",
+]
+
+
+def _chunks(rows, size=1000):
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def _bulk_insert(db, model, rows):
+    for chunk in _chunks(rows):
+        db.execute(insert(model.__table__), chunk)
+
+
+def ensure_reference_data(db):
+    """Load the reference instruments and locations unless they are current."""
+    import fixtures
+    fixtures.load(db)
+
+
+def _teacher_rows(rng, user_id, profile_id, next_ad_id, instruments, locations, student_ids,
+                  ads_per_teacher, password_hash, now):
+    """Rows for one teacher: (user, profile, instrument links, location links, ads, messages)."""
+    created = now - timedelta(days=rng.randint(0, 720))
+    years = rng.randint(1, 35)
+    teacher_instruments_ = rng.sample(instruments, rng.randint(1, 3))
+    teacher_locations_ = rng.sample(locations, rng.randint(1, 2))
+    user = {
+        "id": user_id, "email": f"tanar{user_id}@bench.zenetanar.hu", "hashed_password": password_hash,
+        "first_name": rng.choice(LAST_NAMES), "last_name": rng.choice(FIRST_NAMES),
+        "phone": f"+3630{rng.randint(1000000, 9999999)}", "role": UserRole.TEACHER,
+        "is_active": rng.random() > 0.03, "created_at": created, "updated_at": created,
+    }
+    profile = {
+        "id": profile_id, "user_id": user_id,
+        "bio_short": f"{teacher_instruments_[0].name_hu}tanár {years} év tapasztalattal",
+        "bio_long": f"Zenei tanulmányaimat {rng.choice(SCHOOLS)} végeztem. " + " ".join(rng.sample(LONG_PARAGRAPHS, 3)),
+        "years_experience": years, "lesson_price": rng.choice([4000, 5000, 6000, 7000, 8000, 9000, 12000]),
+        "price_currency": "HUF", "teaching_online": rng.random() < 0.5,
+        "teaching_at_student": rng.random() < 0.3, "teaching_at_teacher": rng.random() < 0.7,
+        "subscription_type": SubscriptionType.PREMIUM if rng.random() < 0.1 else SubscriptionType.FREE,
+    }
+    teacher_instruments = [
+        {"teacher_id": profile_id, "instrument_id": instrument.id, "level": "all"}
+        for instrument in teacher_instruments_
+    ]
+    teacher_locations = [{"teacher_id": profile_id, "location_id": location.id} for location in teacher_locations_]
+    ads, messages = [], []
+    for ad_id in range(next_ad_id, next_ad_id + ads_per_teacher):
+        instrument = rng.choice(teacher_instruments_)
+        location = rng.choice(teacher_locations_)
+        words = {
+            "instrument": instrument.name_hu, "instrument_lower": instrument.name_hu.lower(),
+            "city": location.city, "years": years,
+        }
+        ad_created = created + timedelta(days=rng.randint(0, 60))
+        status = rng.choices(
+            [AdStatus.ACTIVE, AdStatus.PENDING, AdStatus.EXPIRED, AdStatus.SUSPENDED], [75, 10, 12, 3]
+        )[0]
+        ads.append({
+            "id": ad_id, "teacher_id": user_id,
+            "title": rng.choice(TITLE_TEMPLATES).format(**words),
+            "short_description": rng.choice(SHORT_TEMPLATES).format(**words),
+            "long_description": "\n\n".join(rng.sample(LONG_PARAGRAPHS, 4)),
+            "instrument_id": instrument.id, "location_id": location.id, "status": status,
+            "featured": rng.random() < 0.08, "views": rng.randint(0, 5000), "contacts": rng.randint(0, 80),
+            "created_at": ad_created, "expires_at": ad_created + timedelta(days=30),
+        })
+        if student_ids and rng.random() < 0.5:
+            for _ in range(rng.randint(1, 4)):
+                sender_id = rng.choice(student_ids)
+                messages.append({
+                    "sender_id": sender_id, "recipient_id": user_id, "advertisement_id": ad_id,
+                    "name": "Érdeklődő", "email": f"diak{sender_id}@bench.zenetanar.hu",
+                    "message": rng.choice(MESSAGES), "is_read": rng.random() < 0.6,
+                    "created_at": ad_created + timedelta(hours=rng.randint(1, 500)),
+                })
+    return user, profile, teacher_instruments, teacher_locations, ads, messages
+
+
+def generate(db, teachers: int, ads_per_teacher: int = 2, students: int = None, seed: int = 42) -> dict:
+    """Generate a synthetic dataset on top of the reference data.
+
+    Rows are written and committed every TEACHER_BATCH teachers, so memory
+    stays flat for a million ads. Returns the number of rows written per table.
+    """
+    rng = random.Random(seed)
+    ensure_reference_data(db)
+    instruments = db.query(Instrument).all()
+    locations = db.query(Location).all()
+    students = teachers * 2 if students is None else students
+    password_hash = get_password_hash(BENCH_PASSWORD)
+    now = datetime.utcnow()
+    summary = dict.fromkeys(
+        ["users", "teacher_profiles", "teacher_instruments", "teacher_locations", "advertisements", "contact_messages"], 0
+    )
+
+    next_user_id = (db.query(func.max(User.id)).scalar() or 0) + 1
+    next_profile_id = (db.query(func.max(TeacherProfile.id)).scalar() or 0) + 1
+    next_ad_id = (db.query(func.max(Advertisement.id)).scalar() or 0) + 1
+    first_user_id, first_ad_id = next_user_id, next_ad_id
+
+    users = []
+    if not db.query(User.id).filter(User.email == ADMIN_EMAIL).first():
+        users.append({
+            "id": next_user_id, "email": ADMIN_EMAIL, "hashed_password": password_hash,
+            "first_name": "Admin", "last_name": "Benchmark", "role": UserRole.ADMIN,
+            "is_active": True, "created_at": now, "updated_at": now,
+        })
+        next_user_id += 1
+
+    student_ids = list(range(next_user_id, next_user_id + students))
+    for user_id in student_ids:
+        users.append({
+            "id": user_id, "email": f"diak{user_id}@bench.zenetanar.hu", "hashed_password": password_hash,
+            "first_name": rng.choice(LAST_NAMES), "last_name": rng.choice(FIRST_NAMES),
+            "role": UserRole.STUDENT, "is_active": True, "created_at": now, "updated_at": now,
+        })
+    next_user_id += students
+    _bulk_insert(db, User, users)
+    summary["users"] += len(users)
+    db.commit()
+
+    for batch_start in range(0, teachers, TEACHER_BATCH):
+        tables = {model: [] for model in (User, TeacherProfile, TeacherInstrument, TeacherLocation, Advertisement, ContactMessage)}
+        for i in range(batch_start, min(teachers, batch_start + TEACHER_BATCH)):
+            user, profile, links, places, ads, messages = _teacher_rows(
+                rng, next_user_id + i, next_profile_id + i, next_ad_id, instruments, locations,
+                student_ids, ads_per_teacher, password_hash, now,
+            )
+            next_ad_id += ads_per_teacher
+            tables[User].append(user)
+            tables[TeacherProfile].append(profile)
+            tables[TeacherInstrument].extend(links)
+            tables[TeacherLocation].extend(places)
+            tables[Advertisement].extend(ads)
+            tables[ContactMessage].extend(messages)
+        for model, rows in tables.items():
+            _bulk_insert(db, model, rows)
+            summary[model.__tablename__] += len(rows)
+        db.commit()
+
+    # Bulk inserts skip the flush hooks: invalidate the catalog and the new sitemap shards
+    last_user_id, last_ad_id = next_user_id + teachers - 1, next_ad_id - 1
+    scopes = {"catalog"}
+    for kind, first, last in (("teacher", first_user_id, last_user_id), ("ad", first_ad_id, last_ad_id)):
+        for shard in range(first // SITEMAP_SHARD_SIZE, last // SITEMAP_SHARD_SIZE + 1):
+            scopes.add(shard_scope(kind, shard * SITEMAP_SHARD_SIZE))
+    touch(db.connection(), scopes)
+    db.commit()
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic benchmark data")
+    parser.add_argument("--teachers", type=int, default=1000)
+    parser.add_argument("--ads-per-teacher", type=int, default=2)
+    parser.add_argument("--students", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        summary = generate(db, args.teachers, args.ads_per_teacher, args.students, args.seed)
+    finally:
+        db.close()
+    for table, count in summary.items():
+        print(f"  {table}: {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+"""API load test and benchmark runner.
+
+Starts the app under uvicorn in-process against a SQLite file (or any
+DATABASE_URL, e.g. a local MySQL), generates a synthetic dataset if the
+database is empty, and runs scripted scenarios with concurrent clients.
+For each scenario it reports p50/p95/p99 latency, throughput, error count
+and SQL queries per HTTP request, and writes everything to a JSON file so
+runs can be compared across commits.
+
+Usage (from the backend directory):
+    python -m benchmarks.run [--teachers 1000] [--requests 300] [--concurrency 8]
+    python -m benchmarks.run --database-url mysql+mysqlconnector://user:pw@localhost/zenetanar_bench
+    python -m benchmarks.run compare benchmarks/results/old.json benchmarks/results/new.json
+
+The rate limiter (ratelimit.py) is off during runs, since every simulated
+client shares one address and would soon be answered with 429s. To measure
+it as well, run with RATE_LIMIT_ENABLED=1 and budgets raised past the
+load, e.g. RATE_LIMIT_SEARCH=100000/60; 429s then count as errors.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+DEFAULT_DATABASE_URL = f"sqlite:///{BENCH_DIR / 'bench.db'}"
+SCENARIOS = ["search", "ad_detail", "teacher_profile", "profile_page", "admin_dashboard", "login_burst"]
+
+
+# ==================== SCENARIOS ====================
+
+async def scenario_search(client, ctx, rng):
+    params = {"page": rng.choice([1, 1, 1, 2, 3])}
+    if rng.random() < 0.6:
+        params["instrument"] = rng.choice(ctx["instruments"])
+    if rng.random() < 0.5:
+        params["city"] = rng.choice(ctx["cities"])
+    if rng.random() < 0.2:
+        params["keyword"] = rng.choice(["kezdő", "online", "felvételi", "gyerek"])
+    if rng.random() < 0.2:
+        params["online_only"] = "true"
+    if rng.random() < 0.1:
+        params["featured_only"] = "true"
+    return [await client.get("/api/advertisements", params=params)]
+
+
+async def scenario_ad_detail(client, ctx, rng):
+    return [await client.get(f"/api/advertisements/{rng.choice(ctx['ad_ids'])}")]
+
+
+async def scenario_teacher_profile(client, ctx, rng):
+    return [await client.get(f"/api/teachers/{rng.choice(ctx['teacher_ids'])}")]
+
+
+async def scenario_profile_page(client, ctx, rng):
+    headers = {"Authorization": f"Bearer {rng.choice(ctx['teacher_tokens'])}"}
+    return [
+        await client.get("/api/users/profile", headers=headers),
+        await client.get("/api/users/my-advertisements", headers=headers),
+    ]
+
+
+async def scenario_admin_dashboard(client, ctx, rng):
+    headers = {"Authorization": f"Bearer {ctx['admin_token']}"}
+    return [
+        await client.get("/api/admin/stats", headers=headers),
+        await client.get("/api/admin/users", headers=headers),
+        await client.get("/api/admin/advertisements", params={"status": "pending"}, headers=headers),
+        await client.get("/api/admin/stats/instruments", headers=headers),
+        await client.get("/api/admin/stats/locations", headers=headers),
+    ]
+
+
+async def scenario_login_burst(client, ctx, rng):
+    from benchmarks.datagen import BENCH_PASSWORD
+    data = {"username": rng.choice(ctx["teacher_emails"]), "password": BENCH_PASSWORD}
+    return [await client.post("/api/auth/login", data=data)]
+
+
+# ==================== RUNNER ====================
+
+class QueryCounter:
+    """Counts SQL statements executed on the engine."""
+
+    def __init__(self, engine):
+        from sqlalchemy import event
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args):
+        self.count += 1
+
+
+def percentile(values, pct):
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(app):
+    import uvicorn
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning", access_log=False))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    return server, thread, f"http://127.0.0.1:{port}"
+
+
+def prepare_dataset(args):
+    from database import SessionLocal, engine, Base
+    from models import User
+    from benchmarks.datagen import generate
+
+    if args.fresh:
+        Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        if not db.query(User.id).first():
+            print(f"Generating dataset: {args.teachers} teachers, {args.ads_per_teacher} ads each...")
+            started = time.perf_counter()
+            summary = generate(db, args.teachers, args.ads_per_teacher, seed=args.seed)
+            print(f"  done in {time.perf_counter() - started:.1f}s: {summary}")
+    finally:
+        db.close()
+
+
+def load_context(rng, sample=200):
+    from database import SessionLocal
+    from models import User, Instrument, Location, Advertisement, UserRole, AdStatus
+    from auth import create_access_token
+    from benchmarks.datagen import ADMIN_EMAIL
+
+    db = SessionLocal()
+    try:
+        teachers = db.query(User.id, User.email).filter(
+            User.role == UserRole.TEACHER, User.is_active == True
+        ).limit(5000).all()
+        ad_ids = [ad_id for (ad_id,) in db.query(Advertisement.id).filter(
+            Advertisement.status == AdStatus.ACTIVE
+        ).limit(5000)]
+        counts = {
+            "users": db.query(User).count(),
+            "advertisements": db.query(Advertisement).count(),
+        }
+        sampled = rng.sample(teachers, min(sample, len(teachers)))
+        return {
+            "instruments": [name for (name,) in db.query(Instrument.name_hu)],
+            "cities": sorted({city for (city,) in db.query(Location.city)}),
+            "ad_ids": ad_ids,
+            "teacher_ids": [t.id for t in teachers],
+            "teacher_emails": [t.email for t in sampled],
+            "teacher_tokens": [create_access_token({"sub": t.email}) for t in sampled],
+            "admin_token": create_access_token({"sub": ADMIN_EMAIL}),
+            "dataset": counts,
+        }
+    finally:
+        db.close()
+
+
+async def run_scenario(base_url, name, ctx, total, concurrency, seed, counter):
+    import httpx
+
+    fn = globals()[f"scenario_{name}"]
+    latencies, statuses = [], {}
+    http_requests = 0
+    remaining = iter(range(total))
+
+    async def worker(worker_id, client):
+        nonlocal http_requests
+        rng = random.Random(f"{seed}-{name}-{worker_id}")
+        for _ in remaining:
+            started = time.perf_counter()
+            try:
+                responses = await fn(client, ctx, rng)
+            except httpx.HTTPError as exc:
+                statuses[type(exc).__name__] = statuses.get(type(exc).__name__, 0) + 1
+                continue
+            latencies.append(time.perf_counter() - started)
+            http_requests += len(responses)
+            for response in responses:
+                statuses[str(response.status_code)] = statuses.get(str(response.status_code), 0) + 1
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        # Warm up connections and caches before measuring
+        await fn(client, ctx, random.Random(seed))
+        queries_before = counter.count
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(i, client) for i in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        queries = counter.count - queries_before
+
+    errors = sum(count for status, count in statuses.items() if not status.startswith(("2", "3")))
+    ms = lambda value: round(value * 1000, 2) if value is not None else None
+    return {
+        "operations": len(latencies),
+        "http_requests": http_requests,
+        "concurrency": concurrency,
+        "duration_s": round(elapsed, 3),
+        "throughput_ops": round(len(latencies) / elapsed, 1) if elapsed else None,
+        "latency_ms": {
+            "p50": ms(percentile(latencies, 50)),
+            "p95": ms(percentile(latencies, 95)),
+            "p99": ms(percentile(latencies, 99)),
+            "max": ms(max(latencies) if latencies else None),
+        },
+        "queries_per_request": round(queries / http_requests, 2) if http_requests else None,
+        "statuses": statuses,
+        "errors": errors,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BENCH_DIR, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run(args):
+    os.environ["DATABASE_URL"] = args.database_url
+    # Read when ratelimit is imported, so it has to be set before main is
+    os.environ.setdefault("RATE_LIMIT_ENABLED", "0")
+    sys.path.insert(0, str(BENCH_DIR.parent))
+    prepare_dataset(args)
+
+    import main
+    from database import engine
+
+    rng = random.Random(args.seed)
+    ctx = load_context(rng)
+    counter = QueryCounter(engine)
+    server, thread, base_url = start_server(main.app)
+
+    commit = git_commit()
+    report = {
+        "commit": commit,
+        "timestamp": datetime.utcnow().isoformat(timespec="seconds"),
+        "database": engine.url.render_as_string(hide_password=True),
+        "python": platform.python_version(),
+        "rate_limit": os.environ["RATE_LIMIT_ENABLED"] == "1",
+        "dataset": ctx["dataset"],
+        "scenarios": {},
+    }
+    try:
+        for name in args.scenarios:
+            total = args.login_requests if name == "login_burst" else args.requests
+            result = asyncio.run(run_scenario(base_url, name, ctx, total, args.concurrency, args.seed, counter))
+            report["scenarios"][name] = result
+            latency = result["latency_ms"]
+            print(
+                f"{name:<16} {result['throughput_ops']:>8} ops/s  p50 {latency['p50']:>8} ms  "
+                f"p95 {latency['p95']:>8} ms  p99 {latency['p99']:>8} ms  "
+                f"{result['queries_per_request']:>6} q/req  {result['errors']} errors"
+            )
+    finally:
+        server.should_exit = True
+        thread.join(timeout=10)
+
+    output = Path(args.output) if args.output else BENCH_DIR / "results" / f"{report['timestamp'].replace(':', '')}-{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+    print(f"\nResults written to {output}")
+
+
+def compare(base_path, new_path):
+    base = json.loads(Path(base_path).read_text())
+    new = json.loads(Path(new_path).read_text())
+    print(f"{'scenario':<16} {'metric':<20} {base['commit']:>12} {new['commit']:>12} {'change':>9}")
+    for name, new_result in new["scenarios"].items():
+        base_result = base["scenarios"].get(name)
+        if not base_result:
+            continue
+        rows = [
+            ("throughput ops/s", base_result["throughput_ops"], new_result["throughput_ops"]),
+            ("p50 ms", base_result["latency_ms"]["p50"], new_result["latency_ms"]["p50"]),
+            ("p95 ms", base_result["latency_ms"]["p95"], new_result["latency_ms"]["p95"]),
+            ("p99 ms", base_result["latency_ms"]["p99"], new_result["latency_ms"]["p99"]),
+            ("queries/request", base_result["queries_per_request"], new_result["queries_per_request"]),
+        ]
+        for metric, old, current in rows:
+            change = f"{(current - old) / old * 100:+.1f}%" if old and current is not None else "n/a"
+            print(f"{name:<16} {metric:<20} {old!s:>12} {current!s:>12} {change:>9}")
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "compare":
+        if len(sys.argv) != 4:
+            print("Usage: python -m benchmarks.run compare <base.json> <new.json>")
+            sys.exit(1)
+        compare(sys.argv[2], sys.argv[3])
+        return
+
+    parser = argparse.ArgumentParser(description="Run the API benchmark suite")
+    parser.add_argument("--database-url", default=os.getenv("BENCH_DATABASE_URL", DEFAULT_DATABASE_URL))
+    parser.add_argument("--teachers", type=int, default=1000)
+    parser.add_argument("--ads-per-teacher", type=int, default=2)
+    parser.add_argument("--fresh", action="store_true", help="drop and regenerate the dataset")
+    parser.add_argument("--requests", type=int, default=300, help="operations per scenario")
+    parser.add_argument("--login-requests", type=int, default=50, help="operations for login_burst (bcrypt is slow)")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="result file (default: benchmarks/results/<time>-<commit>.json)")
+    run(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
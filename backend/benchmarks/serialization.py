@@ -0,0 +1,73 @@
+"""Microbenchmark: cost of serializing one search result page.
+
+Compares the old path (SearchResponse validation + json.dumps, which is what
+FastAPI does for response_model endpoints) with the precompiled serializers
+in serializers.py. Needs no database - the page is built from transient
+ORM objects.
+
+Usage (from the backend directory):
+    python -m benchmarks.serialization [page_size] [repeat]
+"""
+import json
+import sys
+import timeit
+from datetime import datetime, timedelta
+
+from models import User, Instrument, Location, Advertisement, UserRole, AdStatus
+from schemas import SearchResponse
+from serializers import FastJSONResponse, serialize_search_page, orjson
+
+
+def build_page(size: int):
+    """Build a page of transient advertisements with their related rows."""
+    now = datetime(2026, 1, 15, 10, 30)
+    instrument = Instrument(id=1, name="piano", name_hu="Zongora", category="billentyűs", icon=None)
+    location = Location(id=1, city="Budapest", district="V. kerület", country="Hungary")
+    ads = []
+    for i in range(size):
+        teacher = User(
+            id=i + 1, email=f"tanar{i}@example.com", first_name="Kovács", last_name=f"Anna {i}",
+            phone="+36301234567", role=UserRole.TEACHER, is_active=True, created_at=now
+        )
+        ads.append(Advertisement(
+            id=i + 1, teacher_id=teacher.id, title=f"Zongoraórák kezdőknek és haladóknak #{i}",
+            short_description="Tapasztalt zongoratanár vár mindenkit szeretettel.",
+            long_description="Egyéni zongoraórákat tartok kezdőknek és haladóknak egyaránt. " * 8,
+            instrument_id=instrument.id, location_id=location.id, status=AdStatus.ACTIVE,
+            featured=i % 5 == 0, views=100 + i, contacts=i, created_at=now,
+            expires_at=now + timedelta(days=30),
+            teacher=teacher, instrument=instrument, location=location
+        ))
+    return ads
+
+
+def pydantic_path(ads):
+    page = SearchResponse.model_validate(
+        {"advertisements": ads, "total": 1000, "page": 1, "per_page": len(ads)},
+        from_attributes=True
+    )
+    return json.dumps(page.model_dump(mode="json"), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def fast_path(ads):
+    return FastJSONResponse(serialize_search_page(ads, 1000, 1, len(ads))).body
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    ads = build_page(size)
+    assert json.loads(pydantic_path(ads)) == json.loads(fast_path(ads)), "serializers disagree"
+
+    print(f"Serializing a {size}-item search page, best of 5 x {repeat} runs")
+    print(f"  encoder: {'orjson' if orjson else 'json (install orjson for the fast encoder)'}")
+    results = {}
+    for name, fn in (("pydantic", pydantic_path), ("fast", fast_path)):
+        best = min(timeit.repeat(lambda: fn(ads), number=repeat, repeat=5)) / repeat
+        results[name] = best
+        print(f"  {name:<9} {best * 1e6:9.1f} µs/page")
+    print(f"  speedup   {results['pydantic'] / results['fast']:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Helpers for set-based bulk operations."""
+from itertools import islice
+
+BULK_CHUNK_SIZE = 500
+
+
+def chunked(iterable, size: int = BULK_CHUNK_SIZE):
+    """Yield lists of at most `size` items from iterable."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def add_days(column, days: int, dialect: str):
+    """SQL expression for `column + days` on MySQL or SQLite."""
+    from sqlalchemy import func, text
+    if dialect == "mysql":
+        return func.date_add(column, text(f"INTERVAL {int(days)} DAY"))
+    return func.datetime(column, f"{int(days):+d} days")
+
+
+def resolve_teachers(db, emails):
+    """Look up users by email in one IN query per chunk.
+
+    Returns {email: row} with row.user_id, row.role and row.profile_id
+    (None when the user has no teacher profile).
+    """
+    from sqlalchemy import select
+    from models import User, TeacherProfile
+
+    found = {}
+    for chunk in chunked(dict.fromkeys(emails)):
+        rows = db.execute(
+            select(User.email, User.id.label("user_id"), User.role, TeacherProfile.id.label("profile_id"))
+            .outerjoin(TeacherProfile, TeacherProfile.user_id == User.id)
+            .where(User.email.in_(chunk))
+        ).all()
+        found.update((row.email, row) for row in rows)
+    return found
+
+
+def update_rows(db, table, changes):
+    """Apply per-row column changes with as few statements as possible.
+
+    `changes` maps row id to a dict of column values. Rows getting identical
+    values share one UPDATE ... WHERE id IN (...); the rest are grouped by
+    the set of columns they touch and sent as one executemany per group.
+    """
+    from sqlalchemy import bindparam, update
+
+    by_columns = {}
+    for row_id, values in changes.items():
+        if values:
+            by_columns.setdefault(tuple(sorted(values)), []).append((row_id, values))
+
+    for columns, rows in by_columns.items():
+        distinct = {tuple(values[column] for column in columns) for _, values in rows}
+        if len(distinct) == 1:
+            db.execute(
+                update(table).where(table.c.id.in_([row_id for row_id, _ in rows])).values(rows[0][1])
+            )
+        else:
+            stmt = update(table).where(table.c.id == bindparam("_id")).values(
+                {column: bindparam(f"_{column}") for column in columns}
+            )
+            db.execute(stmt, [
+                {"_id": row_id, **{f"_{column}": values[column] for column in columns}}
+                for row_id, values in rows
+            ])
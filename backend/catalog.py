@@ -0,0 +1,490 @@
+"""In-memory catalog of the active ads.
+
+With CATALOG_ENABLED=1, every API process keeps all AdStatus.ACTIVE ads in
+columnar arrays indexed by ad id (teacher, instrument, location, views,
+contacts), the JSON of each ad without its counters, and bitmaps of the
+active, featured and online-teaching ads and of the ads per instrument and
+per location. A search without a keyword is then a few big-int ANDs, a
+popcount for the total and a scan of the result bitmap for the page, with
+no query besides the catalog version the endpoint reads anyway. Keyword
+searches still go to the database.
+
+The catalog is an outbox subscriber (outbox.py): it reloads just the ads
+and teachers named in new events, and everything on instrument, location
+or id-less bulk events and whenever the dispatcher resets it. A search
+that sees a newer catalog version than the last one it caught up to polls
+the outbox first, and goes to the database if that didn't reach the newest
+event (another thread is delivering, or a gap holds delivery back). View
+and contact counts are re-read every CATALOG_COUNTER_INTERVAL seconds, and
+every CATALOG_CHECK_INTERVAL seconds the filter columns are compared with
+the database; any difference is logged and triggers a full reload.
+
+Memory is roughly the size of the ads' JSON plus a few bytes per ad id.
+"""
+import logging
+import os
+import re
+import string
+import threading
+import time
+import unicodedata
+from array import array
+from datetime import datetime
+
+from sqlalchemy import or_, select
+from sqlalchemy.orm import joinedload
+
+from database import SessionLocal
+from models import Advertisement, AdStatus, Instrument, Location, TeacherProfile
+from serializers import dumps, serialize_advertisement
+import metrics
+import outbox
+
+logger = logging.getLogger("catalog")
+
+CATALOG_ENABLED = os.getenv("CATALOG_ENABLED", "0") == "1"
+CATALOG_INTERVAL = float(os.getenv("CATALOG_INTERVAL", "1"))
+CATALOG_COUNTER_INTERVAL = float(os.getenv("CATALOG_COUNTER_INTERVAL", "60"))
+CATALOG_CHECK_INTERVAL = float(os.getenv("CATALOG_CHECK_INTERVAL", "600"))
+
+YIELD_PER = 2000
+IN_CHUNK = 1000
+PAGE_CHUNK_BYTES = 256
+MAX_MATCHES = 1024
+
+CHECK_FAILURES = metrics.Counter("catalog_check_failures_total", "Catalog consistency checks that found differences")
+ACTIVE_ADS = metrics.Gauge("catalog_active_ads", "Active ads held by the in-memory catalog")
+
+ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+# ==================== BITMAPS ====================
+
+class Bitmap:
+    """Set of ad ids, mutable as a bytearray and read as one int."""
+
+    __slots__ = ("_bytes", "_int")
+
+    def __init__(self):
+        self._bytes = bytearray()
+        self._int = 0
+
+    def add(self, ad_id: int):
+        index = ad_id >> 3
+        if index >= len(self._bytes):
+            self._bytes.extend(bytes(index + 1 - len(self._bytes) + len(self._bytes) // 2))
+        self._bytes[index] |= 1 << (ad_id & 7)
+        self._int = None
+
+    def discard(self, ad_id: int):
+        index = ad_id >> 3
+        if index < len(self._bytes):
+            self._bytes[index] &= ~(1 << (ad_id & 7)) & 0xFF
+            self._int = None
+
+    def __contains__(self, ad_id: int) -> bool:
+        index = ad_id >> 3
+        return index < len(self._bytes) and bool(self._bytes[index] >> (ad_id & 7) & 1)
+
+    @property
+    def value(self) -> int:
+        if self._int is None:
+            self._int = int.from_bytes(self._bytes, "little")
+        return self._int
+
+
+def page_of(bits: int, offset: int, limit: int) -> list:
+    """The ids of set bits offset..offset+limit, lowest first."""
+    data = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+    ids = []
+    for start in range(0, len(data), PAGE_CHUNK_BYTES):
+        chunk = int.from_bytes(data[start:start + PAGE_CHUNK_BYTES], "little")
+        count = chunk.bit_count()
+        if offset >= count:
+            offset -= count
+            continue
+        base = start * 8
+        while chunk and len(ids) < limit:
+            low = chunk & -chunk
+            if offset:
+                offset -= 1
+            else:
+                ids.append(base + low.bit_length() - 1)
+            chunk ^= low
+        if len(ids) >= limit:
+            break
+    return ids
+
+
+def _fold_accents(text: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+
+def _fold_ascii(text: str) -> str:
+    return text.translate(ASCII_LOWER)
+
+
+def like_matcher(dialect: str, value: str):
+    """`column ILIKE '%value%'` evaluated the way the database would."""
+    # MySQL's default _ci collations ignore case and accents, SQLite's lower() only folds ASCII
+    fold = _fold_accents if dialect == "mysql" else _fold_ascii
+    pattern = "".join(
+        ".*" if char == "%" else "." if char == "_" else re.escape(char) for char in fold(value)
+    )
+    regex = re.compile(pattern, re.DOTALL)
+    return lambda text: text is not None and regex.search(fold(text)) is not None
+
+
+# ==================== COLUMNS ====================
+
+class _Columns:
+    """The active ads as columns and bitmaps indexed by ad id."""
+
+    def __init__(self, instruments: dict, cities: dict):
+        self.instrument_names = instruments  # instrument id -> name_hu
+        self.cities = cities  # location id -> city
+        self.active = Bitmap()
+        self.online = Bitmap()
+        self.featured = Bitmap()
+        self.by_instrument = {}
+        self.by_location = {}
+        self.teacher = array("l")
+        self.instrument = array("l")
+        self.location = array("l")
+        self.views = array("l")
+        self.contacts = array("l")
+        self.by_teacher = {}  # teacher id -> set of ad ids
+        self.payloads = {}  # ad id -> JSON object without views/contacts
+        self.matches = {}  # (kind, value) -> matching instrument/location ids
+
+    def _columns(self):
+        return self.teacher, self.instrument, self.location, self.views, self.contacts
+
+    def _grow(self, ad_id: int):
+        missing = ad_id + 1 - len(self.teacher)
+        if missing > 0:
+            zeros = array("l", [0]) * max(missing, len(self.teacher) // 2)
+            for column in self._columns():
+                column.extend(zeros)
+
+    def add(self, ad, online: bool):
+        ad_id = ad.id
+        self._grow(ad_id)
+        self.teacher[ad_id] = ad.teacher_id or 0
+        self.instrument[ad_id] = ad.instrument_id or 0
+        self.location[ad_id] = ad.location_id or 0
+        self.views[ad_id] = ad.views or 0
+        self.contacts[ad_id] = ad.contacts or 0
+        self.active.add(ad_id)
+        if online:
+            self.online.add(ad_id)
+        if ad.featured:
+            self.featured.add(ad_id)
+        self.by_instrument.setdefault(ad.instrument_id, Bitmap()).add(ad_id)
+        self.by_location.setdefault(ad.location_id, Bitmap()).add(ad_id)
+        self.by_teacher.setdefault(ad.teacher_id, set()).add(ad_id)
+        payload = serialize_advertisement(ad)
+        del payload["views"], payload["contacts"]
+        self.payloads[ad_id] = dumps(payload)
+
+    def remove(self, ad_id: int):
+        if self.payloads.pop(ad_id, None) is None:
+            return
+        for bitmap in (
+            self.active, self.online, self.featured,
+            self.by_instrument.get(self.instrument[ad_id] or None),
+            self.by_location.get(self.location[ad_id] or None),
+        ):
+            if bitmap is not None:
+                bitmap.discard(ad_id)
+        teacher_ads = self.by_teacher.get(self.teacher[ad_id] or None)
+        if teacher_ads is not None:
+            teacher_ads.discard(ad_id)
+            if not teacher_ads:
+                del self.by_teacher[self.teacher[ad_id] or None]
+        for column in self._columns():
+            column[ad_id] = 0
+
+    def matching(self, kind: str, value: str, dialect: str) -> int:
+        """Bitmap of the ads whose instrument name or city matches like search_page's ILIKE."""
+        key = (kind, value)
+        ids = self.matches.get(key)
+        if ids is None:
+            names = self.instrument_names if kind == "instrument" else self.cities
+            match = like_matcher(dialect, value)
+            ids = [entity_id for entity_id, name in names.items() if match(name)]
+            if len(self.matches) >= MAX_MATCHES:
+                self.matches.clear()
+            self.matches[key] = ids
+        bitmaps = self.by_instrument if kind == "instrument" else self.by_location
+        bits = 0
+        for entity_id in ids:
+            if entity_id in bitmaps:
+                bits |= bitmaps[entity_id].value
+        return bits
+
+
+def _ads_query():
+    return select(Advertisement).options(
+        joinedload(Advertisement.teacher),
+        joinedload(Advertisement.instrument),
+        joinedload(Advertisement.location)
+    ).where(Advertisement.status == AdStatus.ACTIVE)
+
+
+def _online_teachers(db, teacher_ids=None) -> set:
+    query = select(TeacherProfile.user_id).where(TeacherProfile.teaching_online == True)
+    if teacher_ids is None:
+        return set(db.scalars(query))
+    online = set()
+    teacher_ids = sorted(teacher_ids)
+    for start in range(0, len(teacher_ids), IN_CHUNK):
+        online.update(db.scalars(query.where(TeacherProfile.user_id.in_(teacher_ids[start:start + IN_CHUNK]))))
+    return online
+
+
+# ==================== CATALOG ====================
+
+class ActiveAds:
+    """The active-ad catalog of this process, kept current from the outbox."""
+
+    def __init__(self):
+        self.ready = False
+        self.last_check = None
+        self._columns = _Columns({}, {})
+        self._version = None  # catalog version the outbox was last caught up to
+        self._stale = True  # events may have been missed, a full load is due
+        self._dialect = None
+        self._lock = threading.RLock()
+        self._thread = None
+        self._stop = threading.Event()
+
+    def __len__(self) -> int:
+        return len(self._columns.payloads)
+
+    def _load(self, db) -> _Columns:
+        columns = _Columns(
+            dict(db.execute(select(Instrument.id, Instrument.name_hu)).all()),
+            dict(db.execute(select(Location.id, Location.city)).all()),
+        )
+        online = _online_teachers(db)
+        ads = db.execute(_ads_query().order_by(Advertisement.id).execution_options(yield_per=YIELD_PER)).scalars()
+        for ad in ads:
+            columns.add(ad, ad.teacher_id in online)
+        return columns
+
+    def _apply(self, db, ad_ids: set, teacher_ids: set) -> int:
+        """Reload the given ads and every ad of the given teachers."""
+        columns = self._columns
+        for teacher_id in teacher_ids:
+            ad_ids |= columns.by_teacher.get(teacher_id, set())
+        ad_ids, teacher_ids = sorted(ad_ids), sorted(teacher_ids)
+        loaded = {}
+        for start in range(0, max(len(ad_ids), len(teacher_ids)), IN_CHUNK):
+            condition = or_(
+                Advertisement.id.in_(ad_ids[start:start + IN_CHUNK]),
+                Advertisement.teacher_id.in_(teacher_ids[start:start + IN_CHUNK]),
+            )
+            for ad in db.execute(_ads_query().where(condition)).unique().scalars():
+                loaded[ad.id] = ad
+        online = _online_teachers(db, {ad.teacher_id for ad in loaded.values()})
+        for ad_id in ad_ids:
+            columns.remove(ad_id)
+        for ad_id in sorted(loaded):
+            columns.remove(ad_id)
+            columns.add(loaded[ad_id], loaded[ad_id].teacher_id in online)
+        return len(set(ad_ids) | set(loaded))
+
+    def load(self, db) -> int:
+        """Load every active ad; returns how many."""
+        with self._lock:
+            if self._dialect is None:
+                self._dialect = db.get_bind().dialect.name
+            self._stale = False
+            self._columns = self._load(db)
+            self.ready = True
+            return len(self._columns.payloads)
+
+    def reset(self):
+        """Outbox subscriber reset: reload everything on the next round."""
+        self._stale = True
+
+    def apply(self, db, events):
+        """Outbox subscriber: reload the ads and teachers the events name."""
+        with self._lock:
+            if not self.ready or self._stale:
+                return  # the pending full load reads the committed state
+            ad_ids, teacher_ids = set(), set()
+            for event in events:
+                if event.entity == "ad":
+                    ad_ids.add(event.entity_id)
+                elif event.entity == "teacher":
+                    teacher_ids.add(event.entity_id)
+                else:
+                    # Instruments, locations or a bulk write without ids
+                    self.load(db)
+                    return
+            self._apply(db, ad_ids, teacher_ids)
+
+    def refresh_counters(self, db) -> int:
+        """Re-read the view and contact counts, which change without an event."""
+        rows = db.execute(
+            select(Advertisement.id, Advertisement.views, Advertisement.contacts)
+            .where(Advertisement.status == AdStatus.ACTIVE)
+        ).all()
+        with self._lock:
+            columns = self._columns
+            updated = 0
+            for ad_id, views, contacts in rows:
+                if ad_id in columns.payloads:
+                    columns.views[ad_id] = views or 0
+                    columns.contacts[ad_id] = contacts or 0
+                    updated += 1
+            return updated
+
+    def search(self, db, version: int, instrument=None, city=None, online_only=False,
+               featured_only=False, page: int = 1, per_page: int = 12):
+        """(JSON body, impression targets) like listings.search_page, or None
+        if the catalog can't answer right now (not loaded, or reloading)."""
+        if not self.ready or not self._lock.acquire(blocking=False):
+            return None
+        try:
+            if version != self._version:
+                # Catch up unless the dispatcher thread is delivering right now;
+                # until the outbox head is reached, the database answers
+                outbox.dispatcher.poll(db, blocking=False)
+                if not outbox.dispatcher.caught_up(db):
+                    return None
+                self._version = version
+            if self._stale:
+                return None
+            columns = self._columns
+            bits = columns.active.value
+            if instrument:
+                bits &= columns.matching("instrument", instrument, self._dialect)
+            if city:
+                bits &= columns.matching("city", city, self._dialect)
+            if online_only:
+                bits &= columns.online.value
+            if featured_only:
+                bits &= columns.featured.value
+            total = bits.bit_count()
+            ids = page_of(bits, (page - 1) * per_page, per_page)
+
+            items = b",".join(
+                columns.payloads[ad_id][:-1]
+                + b',"views":%d,"contacts":%d}' % (columns.views[ad_id], columns.contacts[ad_id])
+                for ad_id in ids
+            )
+            body = b'{"advertisements":[%s],"total":%d,"page":%d,"per_page":%d}' % (items, total, page, per_page)
+            impressions = [
+                {
+                    "advertisement_id": ad_id,
+                    "teacher_id": columns.teacher[ad_id],
+                    "instrument_id": columns.instrument[ad_id] or None,
+                    "city": columns.cities.get(columns.location[ad_id]),
+                }
+                for ad_id in ids
+            ]
+            return body, impressions
+        finally:
+            self._lock.release()
+
+    def check(self, db) -> dict:
+        """Compare the filter columns with the database; reload on any difference."""
+        # Outside our lock: the dispatcher thread takes its own lock first
+        outbox.dispatcher.poll(db)
+        with self._lock:
+            columns = self._columns
+            online = _online_teachers(db)
+            rows = db.execute(
+                select(
+                    Advertisement.id, Advertisement.teacher_id, Advertisement.instrument_id,
+                    Advertisement.location_id, Advertisement.featured
+                ).where(Advertisement.status == AdStatus.ACTIVE).execution_options(yield_per=YIELD_PER)
+            )
+            active = missing = mismatched = 0
+            for row in rows:
+                active += 1
+                if row.id not in columns.payloads:
+                    missing += 1
+                elif (
+                    (columns.teacher[row.id], columns.instrument[row.id], columns.location[row.id])
+                    != (row.teacher_id or 0, row.instrument_id or 0, row.location_id or 0)
+                    or (row.id in columns.featured) != bool(row.featured)
+                    or (row.id in columns.online) != (row.teacher_id in online)
+                ):
+                    mismatched += 1
+            extra = len(columns.payloads) - (active - missing)
+            result = {
+                "ok": not (missing or extra or mismatched),
+                "active": active,
+                "missing": missing,
+                "extra": extra,
+                "mismatched": mismatched,
+                "checked_at": datetime.utcnow().isoformat(),
+            }
+            if not result["ok"]:
+                CHECK_FAILURES.inc()
+                logger.warning("Catalog differs from the database, reloading: %s", result)
+                self.load(db)
+            self.last_check = result
+            return result
+
+    def status(self) -> dict:
+        return {
+            "enabled": CATALOG_ENABLED,
+            "ready": self.ready,
+            "stale": self._stale,
+            "active_ads": len(self),
+            "version": self._version,
+            "outbox": outbox.dispatcher.status(),
+            "last_check": self.last_check,
+        }
+
+    def _run(self):
+        next_counters = time.monotonic() + CATALOG_COUNTER_INTERVAL
+        next_check = time.monotonic() + CATALOG_CHECK_INTERVAL
+        while not self._stop.is_set():
+            db = SessionLocal()
+            try:
+                if self._stale:
+                    count = self.load(db)
+                    logger.info("Loaded %d active ads", count)
+                now = time.monotonic()
+                if now >= next_counters:
+                    db.rollback()
+                    self.refresh_counters(db)
+                    next_counters = now + CATALOG_COUNTER_INTERVAL
+                if now >= next_check:
+                    db.rollback()
+                    self.check(db)
+                    next_check = now + CATALOG_CHECK_INTERVAL
+            except Exception:
+                logger.exception("Catalog maintenance failed")
+            finally:
+                db.close()
+            self._stop.wait(CATALOG_INTERVAL)
+
+    def start(self):
+        """Load the catalog and keep its counters and consistency in check."""
+        if not CATALOG_ENABLED or self._thread is not None:
+            return
+        if not outbox.OUTBOX_ENABLED:
+            logger.warning("The catalog follows the outbox; set OUTBOX_ENABLED=1 to use it")
+            return
+        self._thread = threading.Thread(target=self._run, name="catalog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+
+active_ads = ActiveAds()
+ACTIVE_ADS.set_function(lambda: len(active_ads))
+if CATALOG_ENABLED:
+    outbox.subscribe(
+        "catalog", active_ads.apply,
+        entities={"ad", "teacher", "instrument", "location", "catalog"}, on_reset=active_ads.reset,
+    )
@@ -0,0 +1,126 @@
+"""Request coalescing for expensive public reads.
+
+cached() keeps results in a small per-worker TTL cache and lets only one
+thread compute a missing entry: concurrent identical requests wait for
+that computation and share its result (or its exception) instead of
+each running the same queries.
+
+Keys should include the version of the data they're built from (see
+versions.py), so a write elsewhere is picked up by the next request on
+every worker and the TTL only bounds memory, not staleness.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+import metrics
+
+COALESCED = metrics.Counter("coalesced_requests_total", "Requests that shared another request's result", ("cache",))
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Run a function once per key at a time; concurrent callers share the outcome."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            COALESCED.inc(cache=self.name)
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire after `ttl` seconds."""
+
+    def __init__(self, name: str, ttl: float, maxsize: int = 1024):
+        self.name = name
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = OrderedDict()  # key -> (expires, value)
+        self._lock = threading.Lock()
+        self._flight = SingleFlight(name)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_or_load(self, key, loader):
+        """Cached value for key, computing it with loader() once on a miss."""
+        value = self.get(key)
+        if value is not None:
+            metrics.cache_hit(self.name)
+            return value
+        metrics.cache_miss(self.name)
+
+        def load():
+            # A caller that waited on another thread may find it filled already
+            value = self.get(key)
+            if value is None:
+                value = loader()
+                self.set(key, value)
+            return value
+
+        return self._flight.do(key, load)
+
+
+def cached(db, cache: TTLCache, key, loader):
+    """get_or_load() for request handlers holding a session.
+
+    The session's connection goes back to the pool before waiting, so
+    requests queued behind a slow query don't pin connections; the loader
+    can keep using `db`, which checks one out again.
+    """
+    value = cache.get(key)
+    if value is not None:
+        metrics.cache_hit(cache.name)
+        return value
+    db.rollback()
+    return cache.get_or_load(key, loader)
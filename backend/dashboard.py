@@ -0,0 +1,168 @@
+"""Live events for the admin dashboard.
+
+Writes that change what the admin dashboard shows publish an event on the
+"admin" pubsub channel once their transaction commits. Every event carries
+`delta`, the change it makes to the /api/admin/stats counters, so the
+dashboard can update in place instead of re-running the aggregate queries.
+`expiring_soon` moves with the clock and isn't part of the deltas; the
+dashboard reloads it whenever the stream (re)connects.
+"""
+from models import AdStatus, UserRole
+import pubsub
+
+CHANNEL = "admin"
+
+# Ad statuses counted separately on the dashboard
+_STATUS_KEYS = {AdStatus.PENDING: "pending", AdStatus.ACTIVE: "active", AdStatus.EXPIRED: "expired"}
+_ROLE_KEYS = {UserRole.TEACHER: "teachers", UserRole.STUDENT: "students"}
+
+
+def _status(value) -> AdStatus:
+    return AdStatus(value) if value is not None else None
+
+
+def _add(counts: dict, key, n: int):
+    if key is not None and n:
+        counts[key] = counts.get(key, 0) + n
+
+
+def ad_summary(ad) -> dict:
+    """An advertisement as listed in the admin moderation table."""
+    return {
+        "id": ad.id,
+        "title": ad.title,
+        "short_description": ad.short_description,
+        "status": ad.status,
+        "featured": ad.featured,
+        "views": ad.views,
+        "contacts": ad.contacts,
+        "created_at": ad.created_at,
+        "expires_at": ad.expires_at,
+        "teacher": {
+            "id": ad.teacher.id,
+            "name": f"{ad.teacher.first_name} {ad.teacher.last_name}",
+            "email": ad.teacher.email
+        },
+        "instrument": ad.instrument.name_hu if ad.instrument else None,
+        "location": ad.location.city if ad.location else None
+    }
+
+
+def user_summary(user, advertisement_count: int = 0) -> dict:
+    """A user as listed in the admin user table."""
+    return {
+        "id": user.id,
+        "email": user.email,
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "phone": user.phone,
+        "role": user.role.value,
+        "is_active": user.is_active,
+        "created_at": user.created_at.isoformat() if user.created_at else None,
+        "advertisement_count": advertisement_count
+    }
+
+
+# ==================== ADVERTISEMENTS ====================
+
+def ad_created(db, ad):
+    """A new advertisement; `ad` must be flushed."""
+    pubsub.publish_after_commit(db, CHANNEL, {
+        "type": "ad.created",
+        "advertisement": ad_summary(ad),
+        "delta": {"advertisements": _ad_counts(added=[ad.status], total=1)},
+    })
+
+
+def ads_changed(db, rows, old_statuses: dict):
+    """Advertisements whose status or expiry changed.
+
+    rows have id, status and expires_at (ORM objects or result rows);
+    old_statuses maps id -> status before the change.
+    """
+    rows = list(rows)
+    if not rows:
+        return
+    pubsub.publish_after_commit(db, CHANNEL, {
+        "type": "ad.updated",
+        "advertisements": [
+            {"id": row.id, "status": row.status, "expires_at": row.expires_at} for row in rows
+        ],
+        "delta": {"advertisements": _ad_counts(
+            removed=[old_statuses.get(row.id) for row in rows], added=[row.status for row in rows],
+        )},
+    })
+
+
+def ads_deleted(db, old_statuses: dict):
+    """Deleted advertisements; old_statuses maps id -> status."""
+    if not old_statuses:
+        return
+    pubsub.publish_after_commit(db, CHANNEL, {
+        "type": "ad.deleted",
+        "ids": list(old_statuses),
+        "delta": {"advertisements": _ad_counts(removed=old_statuses.values(), total=-len(old_statuses))},
+    })
+
+
+def _ad_counts(removed=(), added=(), total: int = 0) -> dict:
+    counts = {}
+    _add(counts, "total", total)
+    for status in removed:
+        _add(counts, _STATUS_KEYS.get(_status(status)), -1)
+    for status in added:
+        _add(counts, _STATUS_KEYS.get(_status(status)), 1)
+    return {key: n for key, n in counts.items() if n}
+
+
+# ==================== USERS ====================
+
+def user_created(db, user):
+    """A new user; `user` must be flushed."""
+    counts = {"total": 1}
+    _add(counts, _ROLE_KEYS.get(user.role), 1)
+    pubsub.publish_after_commit(db, CHANNEL, {
+        "type": "user.created", "user": user_summary(user), "delta": {"users": counts},
+    })
+
+
+def user_updated(db, user, old_role, advertisement_count: int = 0):
+    counts = {}
+    _add(counts, _ROLE_KEYS.get(old_role), -1)
+    _add(counts, _ROLE_KEYS.get(user.role), 1)
+    pubsub.publish_after_commit(db, CHANNEL, {
+        "type": "user.updated",
+        "user": user_summary(user, advertisement_count),
+        "delta": {"users": {key: n for key, n in counts.items() if n}},
+    })
+
+
+def user_deleted(db, user):
+    users_deleted(db, {user.id: user.role})
+
+
+def users_deleted(db, roles: dict):
+    """Deleted users; roles maps id -> role."""
+    for user_id, role in roles.items():
+        counts = {"total": -1}
+        _add(counts, _ROLE_KEYS.get(role), -1)
+        pubsub.publish_after_commit(db, CHANNEL, {"type": "user.deleted", "id": user_id, "delta": {"users": counts}})
+
+
+# ==================== PAYMENTS ====================
+
+def payment_status_changed(db, payment, old_status: str):
+    """Revenue counts completed payments only."""
+    revenue = 0.0
+    if payment.status == "completed":
+        revenue += float(payment.amount)
+    if old_status == "completed":
+        revenue -= float(payment.amount)
+    pubsub.publish_after_commit(db, CHANNEL, {
+        "type": "payment.updated",
+        "payment": {
+            "id": payment.id, "user_id": payment.user_id, "amount": float(payment.amount),
+            "currency": payment.currency, "status": payment.status, "payment_type": payment.payment_type,
+        },
+        "delta": {"revenue": revenue} if revenue else {},
+    })
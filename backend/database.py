@@ -13,9 +13,11 @@ DB_HOST = os.getenv("DB_HOST", "localhost")
 DB_PORT = os.getenv("DB_PORT", "3306")
 DB_NAME = os.getenv("DB_NAME", "zenetanar")
 
-SQLALCHEMY_DATABASE_URL = f"mysql+mysqlconnector://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+# DATABASE_URL overrides the MySQL settings, e.g. sqlite:///bench.db for benchmarks
+SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL") or f"mysql+mysqlconnector://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+connect_args = {"check_same_thread": False} if SQLALCHEMY_DATABASE_URL.startswith("sqlite") else {}
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args=connect_args)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -26,3 +28,22 @@ def get_db():
         yield db
     finally:
         db.close()
+
+def upsert(connection, table, rows, key, update):
+    """Insert rows, updating the ones whose key already exists.
+
+    Uses INSERT ... ON DUPLICATE KEY UPDATE on MySQL and INSERT ... ON CONFLICT
+    DO UPDATE on SQLite. `update(table, incoming)` returns the SET clause,
+    where `incoming` refers to the values of the row being inserted.
+    """
+    if not rows:
+        return
+    if connection.dialect.name == "mysql":
+        from sqlalchemy.dialects.mysql import insert
+        stmt = insert(table)
+        stmt = stmt.on_duplicate_key_update(update(table, stmt.inserted))
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+        stmt = insert(table)
+        stmt = stmt.on_conflict_do_update(index_elements=key, set_=update(table, stmt.excluded))
+    connection.execute(stmt, rows)
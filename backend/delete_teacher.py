@@ -1,5 +1,16 @@
 from database import SessionLocal, engine, Base
-from models import User, TeacherProfile, Advertisement, TeacherInstrument, TeacherLocation, UserRole
+from models import (
+    User, TeacherProfile, Advertisement, ContactMessage, Payment, TeacherInstrument, TeacherLocation, UserRole,
+    ArchivedAdvertisement, ArchivedContactMessage, InboxCounter
+)
+from sqlalchemy import select, update, delete
+from pathlib import Path
+from bulk import chunked, resolve_teachers
+from import_teachers import read_records
+import analytics
+import dashboard
+import images
+import versions
 import sys
 
 def delete_teacher_by_email(email: str):
@@ -19,8 +30,15 @@ def delete_teacher_by_email(email: str):
         user_id = user.id
         user_name = f"{user.first_name} {user.last_name}"
         
-        # Delete advertisements
+        # Delete photo rows; their files are removed by a background job
+        photos_deleted = images.delete_photos(db, [user_id])
+        
+        # Delete advertisements and their engagement analytics
+        ad_statuses = dict(db.query(Advertisement.id, Advertisement.status).filter(Advertisement.teacher_id == user_id).all())
+        archived_ads = [ad_id for (ad_id,) in db.query(ArchivedAdvertisement.id).filter(ArchivedAdvertisement.teacher_id == user_id)]
+        analytics.forget(db, [user_id], list(ad_statuses) + archived_ads)
         ads_deleted = db.query(Advertisement).filter(Advertisement.teacher_id == user_id).delete()
+        dashboard.ads_deleted(db, ad_statuses)
         
         # Get teacher profile
         profile = db.query(TeacherProfile).filter(TeacherProfile.user_id == user_id).first()
@@ -39,11 +57,13 @@ def delete_teacher_by_email(email: str):
             db.delete(profile)
         
         # Delete user
+        dashboard.user_deleted(db, user)
         db.delete(user)
         
         db.commit()
         print(f"✅ Successfully deleted teacher: {user_name} ({email})")
         print(f"   - Advertisements deleted: {ads_deleted}")
+        print(f"   - Photos deleted: {photos_deleted}")
         if profile:
             print(f"   - Instrument links deleted: {instruments_deleted}")
             print(f"   - Location links deleted: {locations_deleted}")
@@ -105,12 +125,125 @@ def list_teachers():
         db.close()
 
 
+def read_emails(path: str):
+    """Emails from a .txt file (one per line) or a CSV/JSON Lines file with an email field."""
+    path = Path(path)
+    if path.suffix.lower() == ".txt":
+        with path.open(encoding="utf-8") as f:
+            for line in f:
+                if line.strip() and not line.startswith("#"):
+                    yield line.strip().lower()
+        return
+    for record in read_records(path):
+        yield (record.get("email") or "").strip().lower()
+
+
+def batch_delete_teachers(path: str, chunk_size: int = 500):
+    """Delete many teachers and all related data using one session.
+    
+    Emails are resolved with one IN query per chunk, and ads, photos,
+    engagement analytics, instrument and location links, profiles, received
+    messages and users are removed with set-based DELETEs, one transaction
+    per chunk. Teachers with payments are kept, since payment records must
+    not be deleted. A chunk that fails is rolled back and its emails listed
+    under errors.
+    """
+    summary = {"deleted": 0, "ads": 0, "messages": 0, "not_found": [], "not_teacher": [], "has_payments": [],
+               "errors": []}
+    db = SessionLocal()
+    try:
+        for chunk in chunked(read_emails(path), chunk_size):
+            teachers = resolve_teachers(db, chunk)
+            for email in dict.fromkeys(chunk):
+                if email not in teachers:
+                    summary["not_found"].append(email)
+                elif teachers[email].role != UserRole.TEACHER:
+                    summary["not_teacher"].append(email)
+            candidates = {row.user_id: row for row in teachers.values() if row.role == UserRole.TEACHER}
+            if not candidates:
+                continue
+            
+            paying = set(db.execute(
+                select(Payment.user_id).where(Payment.user_id.in_(list(candidates))).distinct()
+            ).scalars())
+            summary["has_payments"].extend(candidates[user_id].email for user_id in paying)
+            user_ids = [user_id for user_id in candidates if user_id not in paying]
+            profile_ids = [candidates[user_id].profile_id for user_id in user_ids if candidates[user_id].profile_id]
+            if not user_ids:
+                continue
+            
+            try:
+                ad_statuses = dict(db.execute(
+                    select(Advertisement.id, Advertisement.status).where(Advertisement.teacher_id.in_(user_ids))
+                ).all())
+                ad_ids = list(ad_statuses)
+                archived_ad_ids = list(db.execute(
+                    select(ArchivedAdvertisement.id).where(ArchivedAdvertisement.teacher_id.in_(user_ids))
+                ).scalars())
+                analytics.forget(db, user_ids, ad_ids + archived_ad_ids)
+                messages = db.execute(
+                    delete(ContactMessage).where(ContactMessage.recipient_id.in_(user_ids))
+                ).rowcount
+                if ad_ids:
+                    db.execute(update(ContactMessage).where(
+                        ContactMessage.advertisement_id.in_(ad_ids)
+                    ).values(advertisement_id=None))
+                db.execute(update(ContactMessage).where(
+                    ContactMessage.sender_id.in_(user_ids)
+                ).values(sender_id=None))
+                ads = db.execute(
+                    delete(Advertisement).where(Advertisement.teacher_id.in_(user_ids))
+                ).rowcount
+                images.delete_photos(db, user_ids)
+                if profile_ids:
+                    db.execute(delete(TeacherInstrument).where(TeacherInstrument.teacher_id.in_(profile_ids)))
+                    db.execute(delete(TeacherLocation).where(TeacherLocation.teacher_id.in_(profile_ids)))
+                    db.execute(delete(TeacherProfile).where(TeacherProfile.id.in_(profile_ids)))
+                db.execute(delete(ArchivedContactMessage).where(ArchivedContactMessage.recipient_id.in_(user_ids)))
+                db.execute(delete(ArchivedAdvertisement).where(ArchivedAdvertisement.teacher_id.in_(user_ids)))
+                db.execute(delete(InboxCounter).where(InboxCounter.user_id.in_(user_ids)))
+                db.execute(delete(User).where(User.id.in_(user_ids)))
+                dashboard.ads_deleted(db, ad_statuses)
+                dashboard.users_deleted(db, {user_id: UserRole.TEACHER for user_id in user_ids})
+                
+                scopes = {"catalog"} | {f"ad:{ad_id}" for ad_id in ad_ids}
+                for user_id in user_ids:
+                    scopes |= {f"user:{user_id}", f"teacher:{user_id}"}
+                versions.touch(db.connection(), scopes)
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                summary["errors"].extend(f"{candidates[user_id].email}: {e}" for user_id in user_ids)
+                continue
+            summary["deleted"] += len(user_ids)
+            summary["ads"] += ads
+            summary["messages"] += messages
+    finally:
+        db.close()
+    
+    print(f"✅ Batch delete finished: {summary['deleted']} teachers deleted")
+    print(f"   - Advertisements deleted: {summary['ads']}")
+    print(f"   - Messages deleted: {summary['messages']}")
+    if summary["not_found"]:
+        print(f"   - Not found: {len(summary['not_found'])} ({', '.join(summary['not_found'][:10])})")
+    if summary["not_teacher"]:
+        print(f"   - Not teachers: {len(summary['not_teacher'])} ({', '.join(summary['not_teacher'][:10])})")
+    if summary["errors"]:
+        print(f"   ❌ Not deleted (chunk failed): {len(summary['errors'])}")
+        for error in summary["errors"][:10]:
+            print(f"   ❌ {error}")
+    if summary["has_payments"]:
+        print(f"   ⚠️ Kept (have payments): {len(summary['has_payments'])} ({', '.join(summary['has_payments'][:10])})")
+    return summary
+
+
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Usage:")
         print("  python delete_teacher.py list                  - List all teachers")
         print("  python delete_teacher.py email <email>         - Delete by email")
         print("  python delete_teacher.py id <user_id>          - Delete by user ID")
+        print("  python delete_teacher.py batch <file>          - Delete every email in a .txt/.csv/.jsonl file")
         sys.exit(1)
     
     command = sys.argv[1].lower()
@@ -121,5 +254,7 @@ if __name__ == "__main__":
         delete_teacher_by_email(sys.argv[2])
     elif command == "id" and len(sys.argv) >= 3:
         delete_teacher_by_id(int(sys.argv[2]))
+    elif command == "batch" and len(sys.argv) >= 3:
+        batch_delete_teachers(sys.argv[2])
     else:
-        print("Invalid command. Use 'list', 'email <email>', or 'id <user_id>'")
+        print("Invalid command. Use 'list', 'email <email>', 'id <user_id>' or 'batch <file>'")
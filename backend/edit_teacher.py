@@ -2,6 +2,10 @@ from database import SessionLocal, engine, Base
 from models import User, TeacherProfile, Advertisement, Instrument, Location, TeacherInstrument, TeacherLocation, UserRole, AdStatus
 from auth import get_password_hash
 from datetime import datetime, timedelta
+from pathlib import Path
+from bulk import chunked, resolve_teachers, update_rows
+from import_teachers import read_records
+import versions
 import sys
 
 def edit_teacher_by_email(
@@ -276,6 +280,97 @@ def update_advertisement(
         db.close()
 
 
+# Batch file columns/keys and the table they live in
+BATCH_USER_FIELDS = {"new_email": "email", "new_password": "hashed_password", "first_name": "first_name",
+                     "last_name": "last_name", "phone": "phone", "is_active": "is_active"}
+BATCH_PROFILE_FIELDS = {"bio_short", "bio_long", "video_url", "years_experience", "lesson_price",
+                        "teaching_online", "teaching_at_student", "teaching_at_teacher"}
+BOOL_FIELDS = {"is_active", "teaching_online", "teaching_at_student", "teaching_at_teacher"}
+
+
+def _convert(key, value):
+    if key == "years_experience":
+        return int(value)
+    if key == "lesson_price":
+        return float(value)
+    if key in BOOL_FIELDS and not isinstance(value, bool):
+        return str(value).lower() in ["true", "1", "yes"]
+    if key == "new_password":
+        return get_password_hash(value)
+    return value
+
+
+def batch_edit_teachers(path: str, chunk_size: int = 500):
+    """Apply edits from a CSV/JSON Lines file using one session.
+    
+    Each record has an `email` plus any of the edit fields; empty CSV cells
+    are left unchanged. Emails are resolved with one IN query per chunk and
+    changes are written with set-based UPDATEs, one transaction per chunk;
+    a chunk that fails is rolled back and its emails listed under errors.
+    """
+    summary = {"updated": 0, "not_found": [], "not_teacher": [], "invalid": [], "errors": []}
+    db = SessionLocal()
+    try:
+        for chunk in chunked(read_records(Path(path)), chunk_size):
+            teachers = resolve_teachers(db, [(op.get("email") or "").strip().lower() for op in chunk])
+            user_changes, profile_changes, scopes, updated = {}, {}, set(), []
+            for op in chunk:
+                email = (op.get("email") or "").strip().lower()
+                teacher = teachers.get(email)
+                if not teacher:
+                    summary["not_found"].append(email)
+                    continue
+                if teacher.role != UserRole.TEACHER:
+                    summary["not_teacher"].append(email)
+                    continue
+                try:
+                    fields = {key: _convert(key, value) for key, value in op.items()
+                              if key != "email" and value not in (None, "")}
+                except ValueError as e:
+                    summary["invalid"].append(f"{email}: {e}")
+                    continue
+                unknown = set(fields) - set(BATCH_USER_FIELDS) - BATCH_PROFILE_FIELDS
+                if unknown:
+                    summary["invalid"].append(f"{email}: unknown fields {', '.join(sorted(unknown))}")
+                    continue
+                user_values = {BATCH_USER_FIELDS[key]: value for key, value in fields.items() if key in BATCH_USER_FIELDS}
+                profile_values = {key: value for key, value in fields.items() if key in BATCH_PROFILE_FIELDS}
+                if user_values:
+                    user_values["updated_at"] = datetime.utcnow()
+                    user_changes[teacher.user_id] = user_values
+                if profile_values and teacher.profile_id:
+                    profile_changes[teacher.profile_id] = profile_values
+                scopes |= {f"user:{teacher.user_id}", f"teacher:{teacher.user_id}", "catalog"}
+                updated.append(email)
+            
+            try:
+                update_rows(db, User.__table__, user_changes)
+                update_rows(db, TeacherProfile.__table__, profile_changes)
+                if scopes:
+                    versions.touch(db.connection(), scopes)
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                summary["errors"].extend(f"{email}: {e}" for email in updated)
+                continue
+            summary["updated"] += len(updated)
+    finally:
+        db.close()
+    
+    print(f"✅ Batch edit finished: {summary['updated']} teachers updated")
+    if summary["errors"]:
+        print(f"   ❌ Not updated (chunk failed): {len(summary['errors'])}")
+        for error in summary["errors"][:10]:
+            print(f"   ❌ {error}")
+    if summary["not_found"]:
+        print(f"   - Not found: {len(summary['not_found'])} ({', '.join(summary['not_found'][:10])})")
+    if summary["not_teacher"]:
+        print(f"   - Not teachers: {len(summary['not_teacher'])} ({', '.join(summary['not_teacher'][:10])})")
+    for error in summary["invalid"][:10]:
+        print(f"   ❌ {error}")
+    return summary
+
+
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Usage:")
@@ -283,6 +378,7 @@ if __name__ == "__main__":
         print("  python edit_teacher.py edit <email> [field=value ...]  - Edit teacher")
         print("  python edit_teacher.py add-instrument <email> <name>   - Add instrument")
         print("  python edit_teacher.py add-location <email> <city>     - Add location")
+        print("  python edit_teacher.py batch <file.csv|file.jsonl>     - Apply many edits")
         print("\nExample:")
         print("  python edit_teacher.py edit balogh.sara@example.com years_experience=10 lesson_price=9000")
         sys.exit(1)
@@ -324,5 +420,8 @@ if __name__ == "__main__":
         district = sys.argv[4] if len(sys.argv) >= 5 else None
         add_location_to_teacher(email, city, district)
         
+    elif command == "batch" and len(sys.argv) >= 3:
+        batch_edit_teachers(sys.argv[2])
+        
     else:
         print("Invalid command or missing arguments.")
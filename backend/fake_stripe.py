@@ -0,0 +1,135 @@
+"""A small local stand-in for the Stripe PaymentIntent API.
+
+Implements just what payments.py uses, with Idempotency-Key replay, plus
+helpers to settle intents (optionally sending a signed webhook) and to
+inject failures for retry testing.
+
+Usage (from the backend directory):
+    FAKE_STRIPE_WEBHOOK_URL=http://localhost:8000/api/payments/webhook \\
+    STRIPE_WEBHOOK_SECRET=whsec_dev uvicorn fake_stripe:app --port 12111
+
+then start the API with STRIPE_API_BASE=http://localhost:12111 and the same
+STRIPE_WEBHOOK_SECRET.
+
+Test helpers:
+    POST /_test/payment_intents/{id}/succeed   (or /fail, /refund)
+    POST /_test/fail_next?count=2&status=503   next N API calls fail
+    POST /_test/fail_next?count=1&delay=3      next N API calls stall first
+"""
+import asyncio
+import json
+import os
+import secrets
+import time
+
+import httpx
+from fastapi import FastAPI, Request, Header, HTTPException
+from fastapi.responses import JSONResponse
+
+from payments import sign_payload
+
+WEBHOOK_URL = os.getenv("FAKE_STRIPE_WEBHOOK_URL")
+WEBHOOK_SECRET = os.getenv("STRIPE_WEBHOOK_SECRET", "whsec_dev")
+
+app = FastAPI(title="Fake Stripe")
+
+intents = {}
+idempotent_responses = {}
+failures = {"count": 0, "status": 503, "delay": 0.0}
+
+
+def _error(status_code: int, message: str) -> JSONResponse:
+    return JSONResponse({"error": {"type": "api_error", "message": message}}, status_code=status_code)
+
+
+@app.middleware("http")
+async def inject_failures(request: Request, call_next):
+    if request.url.path.startswith("/v1/") and failures["count"] > 0:
+        failures["count"] -= 1
+        if failures["delay"]:
+            # Handled normally, but only after the client has given up
+            await asyncio.sleep(failures["delay"])
+            return await call_next(request)
+        return _error(failures["status"], "Injected failure")
+    return await call_next(request)
+
+
+@app.post("/v1/payment_intents")
+async def create_payment_intent(request: Request, idempotency_key: str = Header(None)):
+    if idempotency_key and idempotency_key in idempotent_responses:
+        return idempotent_responses[idempotency_key]
+    form = await request.form()
+    if not form.get("amount") or not form.get("currency"):
+        return _error(400, "Missing required param: amount or currency")
+    intent_id = f"pi_{secrets.token_hex(12)}"
+    intent = {
+        "id": intent_id,
+        "object": "payment_intent",
+        "amount": int(form["amount"]),
+        "currency": form["currency"],
+        "status": "requires_payment_method",
+        "client_secret": f"{intent_id}_secret_{secrets.token_hex(8)}",
+        "metadata": {key[9:-1]: value for key, value in form.items() if key.startswith("metadata[")},
+        "last_payment_error": None,
+        "created": int(time.time()),
+    }
+    intents[intent_id] = intent
+    if idempotency_key:
+        idempotent_responses[idempotency_key] = intent
+    return intent
+
+
+@app.get("/v1/payment_intents/{intent_id}")
+def retrieve_payment_intent(intent_id: str):
+    if intent_id not in intents:
+        return _error(404, f"No such payment_intent: '{intent_id}'")
+    return intents[intent_id]
+
+
+# ==================== TEST HELPERS ====================
+
+async def _send_webhook(event_type: str, obj: dict):
+    if not WEBHOOK_URL:
+        return None
+    payload = json.dumps({
+        "id": f"evt_{secrets.token_hex(12)}",
+        "object": "event",
+        "type": event_type,
+        "created": int(time.time()),
+        "data": {"object": obj},
+    }).encode()
+    async with httpx.AsyncClient(timeout=10) as client:
+        response = await client.post(WEBHOOK_URL, content=payload, headers={
+            "Content-Type": "application/json",
+            "Stripe-Signature": sign_payload(payload, WEBHOOK_SECRET),
+        })
+    return response.status_code
+
+
+@app.post("/_test/payment_intents/{intent_id}/{outcome}")
+async def settle_payment_intent(intent_id: str, outcome: str):
+    intent = intents.get(intent_id)
+    if intent is None:
+        raise HTTPException(status_code=404, detail="Unknown intent")
+    if outcome == "succeed":
+        intent["status"] = "succeeded"
+        webhook = await _send_webhook("payment_intent.succeeded", intent)
+    elif outcome == "fail":
+        intent["status"] = "requires_payment_method"
+        intent["last_payment_error"] = {"code": "card_declined", "message": "Your card was declined."}
+        webhook = await _send_webhook("payment_intent.payment_failed", intent)
+    elif outcome == "refund":
+        webhook = await _send_webhook("charge.refunded", {
+            "id": f"ch_{secrets.token_hex(12)}", "object": "charge", "payment_intent": intent_id, "refunded": True,
+        })
+    else:
+        raise HTTPException(status_code=400, detail="Outcome must be succeed, fail or refund")
+    return {"intent": intent, "webhook_status": webhook}
+
+
+@app.post("/_test/fail_next")
+def fail_next(count: int = 1, status: int = 503, delay: float = 0):
+    failures["count"] = count
+    failures["status"] = status
+    failures["delay"] = delay
+    return failures
@@ -0,0 +1,266 @@
+"""Versioned fixture datasets and synthetic load-test data.
+
+A dataset is a JSON (or, with PyYAML installed, YAML) file under
+FIXTURES_DIR:
+
+    version: 1
+    tables:
+      instruments:
+        key: [name]          # unique columns to match on, default [id]
+        rows:
+          - {name: piano, name_hu: Zongora, category: billentyűs}
+
+Tables are loaded in the order they are listed, with one bulk
+INSERT ... ON DUPLICATE KEY UPDATE (ON CONFLICT DO UPDATE on SQLite) per
+1000 rows, so loading a dataset again updates rows in place instead of
+duplicating them. Enum columns take their values ("teacher"), DateTime
+columns ISO strings, and users rows may give a plain `password` that is
+hashed on load.
+
+The checksum of every loaded dataset is kept in `fixture_datasets`; a
+dataset whose contents haven't changed since is skipped without touching
+its tables. Loading bumps the versions of the scopes it wrote to, so cached
+pages and lists pick the new rows up.
+
+Usage (from the backend directory):
+    python fixtures.py load [reference ...] [--file PATH] [--force]
+    python fixtures.py status
+    python fixtures.py synthetic --ads 100000 [--ads-per-teacher 2] [--seed 42]
+"""
+import argparse
+import hashlib
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy import DateTime, Enum
+
+from database import SessionLocal, engine, Base, upsert
+from models import FixtureDataset
+import versions
+
+try:
+    import yaml
+except ImportError:  # YAML datasets are optional, JSON always works
+    yaml = None
+
+FIXTURES_DIR = Path(os.getenv("FIXTURES_DIR", Path(__file__).resolve().parent / "datasets"))
+DEFAULT_DATASETS = ["reference"]
+BATCH_SIZE = 1000
+
+# Cached lists that every write to these tables invalidates
+TABLE_SCOPES = {
+    "instruments": {"instruments", "catalog"},
+    "locations": {"locations", "catalog"},
+}
+
+
+class FixtureError(Exception):
+    pass
+
+
+# ==================== DATASETS ====================
+
+def dataset_path(name: str) -> Path:
+    for suffix in (".json", ".yaml", ".yml"):
+        path = FIXTURES_DIR / f"{name}{suffix}"
+        if path.is_file():
+            return path
+    raise FixtureError(f"No dataset named {name!r} in {FIXTURES_DIR}")
+
+
+def read_dataset(path: Path) -> dict:
+    """The parsed dataset; raises FixtureError when it is malformed."""
+    text = Path(path).read_text(encoding="utf-8")
+    if Path(path).suffix in (".yaml", ".yml"):
+        if yaml is None:
+            raise FixtureError(f"{path} is YAML but PyYAML is not installed")
+        data = yaml.safe_load(text)
+    else:
+        data = json.loads(text)
+    if not isinstance(data, dict) or not isinstance(data.get("version"), int) or not isinstance(data.get("tables"), dict):
+        raise FixtureError(f"{path} needs an integer 'version' and a 'tables' mapping")
+    for table_name in data["tables"]:
+        if table_name not in Base.metadata.tables:
+            raise FixtureError(f"{path}: unknown table {table_name!r}")
+    return data
+
+
+def checksum(data: dict) -> str:
+    """Digest of the parsed contents, so reformatting a file doesn't reload it."""
+    canonical = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _converters(table):
+    converters = {}
+    for column in table.columns:
+        if isinstance(column.type, Enum) and column.type.enum_class is not None:
+            enum_class = column.type.enum_class
+            converters[column.name] = lambda value, enum_class=enum_class: enum_class(value)
+        elif isinstance(column.type, DateTime):
+            converters[column.name] = datetime.fromisoformat
+    return converters
+
+
+def _prepare(table, rows) -> list:
+    from auth import get_password_hash
+    converters = _converters(table)
+    hashes = {}
+    prepared = []
+    for row in rows:
+        row = dict(row)
+        if table.name == "users" and "password" in row:
+            password = row.pop("password")
+            if password not in hashes:
+                hashes[password] = get_password_hash(password)
+            row["hashed_password"] = hashes[password]
+        unknown = set(row) - set(table.columns.keys())
+        if unknown:
+            raise FixtureError(f"{table.name}: unknown columns {', '.join(sorted(unknown))}")
+        for column, convert in converters.items():
+            if isinstance(row.get(column), str):
+                row[column] = convert(row[column])
+        prepared.append(row)
+    return prepared
+
+
+def _scopes(table_name: str, rows) -> set:
+    scopes = set(TABLE_SCOPES.get(table_name, {"catalog"}))
+    for row in rows:
+        if table_name == "advertisements" and "id" in row:
+            scopes.add(f"ad:{row['id']}")
+            if row.get("teacher_id"):
+                scopes.add(f"teacher:{row['teacher_id']}")
+        elif table_name == "users" and "id" in row:
+            scopes.update({f"user:{row['id']}", f"teacher:{row['id']}"})
+    return scopes
+
+
+def _upsert_table(connection, table, key, rows):
+    # executemany needs the same columns in every row of a statement
+    groups = {}
+    for row in rows:
+        groups.setdefault(tuple(sorted(row)), []).append(row)
+    for columns, group in groups.items():
+        missing = set(key) - set(columns)
+        if missing:
+            raise FixtureError(f"{table.name}: rows without key columns {', '.join(sorted(missing))}")
+        updated = [column for column in columns if column not in key] or list(key)
+        for start in range(0, len(group), BATCH_SIZE):
+            upsert(
+                connection, table, group[start:start + BATCH_SIZE], key=list(key),
+                update=lambda _, incoming: {column: incoming[column] for column in updated},
+            )
+
+
+def load_dataset(db, name: str, data: dict, force: bool = False):
+    """Upsert one parsed dataset; returns the rows written, or None if unchanged."""
+    digest = checksum(data)
+    loaded = db.get(FixtureDataset, name)
+    if loaded and not force:
+        if loaded.checksum == digest:
+            return None
+        if loaded.version > data["version"]:
+            raise FixtureError(
+                f"{name} version {data['version']} is older than the loaded version {loaded.version}; use --force"
+            )
+
+    connection = db.connection()
+    scopes = set()
+    total = 0
+    for table_name, spec in data["tables"].items():
+        table = Base.metadata.tables[table_name]
+        rows = _prepare(table, spec.get("rows") or [])
+        _upsert_table(connection, table, spec.get("key") or ["id"], rows)
+        scopes |= _scopes(table_name, rows)
+        total += len(rows)
+    if scopes:
+        versions.touch(connection, scopes)
+
+    upsert(
+        connection, FixtureDataset.__table__,
+        [{"name": name, "version": data["version"], "checksum": digest, "rows": total, "loaded_at": datetime.utcnow()}],
+        key=["name"],
+        update=lambda table, incoming: {
+            "version": incoming.version, "checksum": incoming.checksum,
+            "rows": incoming.rows, "loaded_at": incoming.loaded_at,
+        },
+    )
+    return total
+
+
+def load(db, names=None, force: bool = False) -> dict:
+    """Load the named datasets (default: reference) in one transaction.
+
+    Returns {name: rows written or None if skipped as unchanged}.
+    """
+    results = {}
+    try:
+        for name in names or DEFAULT_DATASETS:
+            path = Path(name) if name.endswith((".json", ".yaml", ".yml")) else dataset_path(name)
+            results[path.stem] = load_dataset(db, path.stem, read_dataset(path), force=force)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return results
+
+
+# ==================== SYNTHETIC DATA ====================
+
+def synthetic(db, ads: int, ads_per_teacher: int = 2, students: int = None, seed: int = 42) -> dict:
+    """Reference data plus about `ads` generated ads for load tests."""
+    from benchmarks.datagen import generate
+    teachers = max(1, -(-ads // max(1, ads_per_teacher)))
+    return generate(db, teachers, ads_per_teacher, students, seed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load fixture datasets")
+    commands = parser.add_subparsers(dest="command", required=True)
+    load_parser = commands.add_parser("load", help="Upsert datasets whose contents changed")
+    load_parser.add_argument("names", nargs="*", help=f"Datasets in {FIXTURES_DIR} (default: reference)")
+    load_parser.add_argument("--file", action="append", default=[], help="Load a dataset file by path")
+    load_parser.add_argument("--force", action="store_true", help="Reload even if unchanged")
+    commands.add_parser("status", help="List the loaded datasets")
+    synthetic_parser = commands.add_parser("synthetic", help="Generate teachers, ads, students and messages")
+    synthetic_parser.add_argument("--ads", type=int, default=10000)
+    synthetic_parser.add_argument("--ads-per-teacher", type=int, default=2)
+    synthetic_parser.add_argument("--students", type=int, default=None)
+    synthetic_parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        if args.command == "load":
+            names = args.names + args.file
+            try:
+                results = load(db, names or None, force=args.force)
+            except FixtureError as e:
+                print(f"❌ {e}")
+                return
+            for name, rows in results.items():
+                print(f"✅ {name}: {rows} rows" if rows is not None else f"⏭️  {name}: unchanged")
+        elif args.command == "status":
+            datasets = db.query(FixtureDataset).order_by(FixtureDataset.name).all()
+            if not datasets:
+                print("No datasets loaded")
+            for dataset in datasets:
+                print(f"  {dataset.name} v{dataset.version}: {dataset.rows} rows, "
+                      f"loaded {dataset.loaded_at:%Y-%m-%d %H:%M}, {dataset.checksum[:12]}")
+        else:
+            started = time.perf_counter()
+            summary = synthetic(db, args.ads, args.ads_per_teacher, args.students, args.seed)
+            print(f"✅ Generated in {time.perf_counter() - started:.1f}s")
+            for table, count in summary.items():
+                print(f"  {table}: {count}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
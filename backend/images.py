@@ -0,0 +1,306 @@
+"""Teacher photos and optimized static images.
+
+Files are stored content-addressed under IMAGE_DIR: each one is named after
+the sha256 of its bytes, so a URL never changes what it points to and is
+served with a year-long immutable Cache-Control. Uploading a photo stores
+the original and queues an "image.variants" job; the job workers (see
+jobs.py) render resized AVIF/WebP/JPEG variants and mark the photo ready.
+Responses describe a photo with srcset strings for <picture> sources.
+
+The frontend's own images are optimized at build time with
+    python images.py assets
+which writes hashed variants next to the originals and a manifest module
+used by <ResponsiveImage>. Files no longer referenced by any photo are
+removed with `python images.py gc`.
+"""
+import argparse
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+import time
+from pathlib import Path
+
+from PIL import Image, ImageOps, features
+from sqlalchemy import select, func, delete
+
+from database import SessionLocal, engine, Base
+from models import TeacherPhoto
+from jobs import handler, enqueue, PRIORITY_HIGH, PRIORITY_LOW
+
+logger = logging.getLogger("images")
+
+IMAGE_DIR = Path(os.getenv("IMAGE_DIR", Path(__file__).resolve().parent / "media"))
+MEDIA_URL = os.getenv("MEDIA_URL", "http://localhost:8000/media")
+MAX_UPLOAD_BYTES = int(os.getenv("IMAGE_MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))
+Image.MAX_IMAGE_PIXELS = 40_000_000  # refuse decompression bombs
+
+PHOTO_WIDTHS = (160, 320, 640, 1280)
+ASSET_WIDTHS = (320, 640, 960, 1280, 1920)
+FALLBACK_WIDTH = 960
+
+# Most compact first: browsers use the first <source> they support
+FORMATS = [f for f in ("avif", "webp") if features.check(f)] + ["jpeg"]
+QUALITY = {"avif": 55, "webp": 78, "jpeg": 82}
+EXTENSIONS = {"avif": "avif", "webp": "webp", "jpeg": "jpg"}
+UPLOAD_FORMATS = {"JPEG": "jpg", "MPO": "jpg", "PNG": "png", "WEBP": "webp", "AVIF": "avif"}
+MIME_TYPES = {"avif": "image/avif", "webp": "image/webp", "jpeg": "image/jpeg"}
+
+IMMUTABLE_HEADERS = {"Cache-Control": "public, max-age=31536000, immutable"}
+
+_NAME = re.compile(r"^[0-9a-f]{64}\.(avif|webp|jpg|png)$")
+
+
+# ==================== STORAGE ====================
+
+def _path(name: str) -> Path:
+    return IMAGE_DIR / name[:2] / name[2:4] / name
+
+
+def store(data: bytes, ext: str) -> str:
+    """Write bytes under their content hash; returns the stored file name."""
+    name = f"{hashlib.sha256(data).hexdigest()}.{ext}"
+    path = _path(name)
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    return name
+
+
+def media_path(name: str):
+    """Path of a stored file, or None if the name isn't one of ours."""
+    if not _NAME.match(name):
+        return None
+    path = _path(name)
+    return path if path.is_file() else None
+
+
+def media_url(name: str) -> str:
+    return f"{MEDIA_URL}/{name}"
+
+
+# ==================== PROCESSING ====================
+
+def open_image(data: bytes):
+    """Decode an upload; returns (upright RGB image, file extension).
+
+    Raises ValueError if the data isn't an image format we accept.
+    """
+    try:
+        Image.open(io.BytesIO(data)).verify()
+        image = Image.open(io.BytesIO(data))
+        ext = UPLOAD_FORMATS.get(image.format)
+        if ext is None:
+            raise ValueError("Not a supported image")
+        image = ImageOps.exif_transpose(image)
+        return image.convert("RGB"), ext
+    except (OSError, SyntaxError, Image.DecompressionBombError) as e:
+        raise ValueError("Not a supported image") from e
+
+
+def encode(image: Image.Image, fmt: str) -> bytes:
+    buffer = io.BytesIO()
+    options = {"quality": QUALITY[fmt]}
+    if fmt == "jpeg":
+        options.update(optimize=True, progressive=True)
+    elif fmt == "webp":
+        options["method"] = 4
+    image.save(buffer, format=fmt.upper(), **options)
+    return buffer.getvalue()
+
+
+def render(image: Image.Image, widths, fallback_width: int):
+    """Yield (format, width, height, bytes) for the widths that fit the original.
+
+    AVIF/WebP are rendered at every width; JPEG, which only browsers without
+    either of them use, just once at about fallback_width.
+    """
+    usable = [w for w in widths if w < image.width]
+    top = min(image.width, max(widths))
+    if not usable or top > usable[-1] * 1.2:
+        usable.append(top)
+    fallback = max([w for w in usable if w <= fallback_width] or usable[:1])
+    modern = [fmt for fmt in FORMATS if fmt != "jpeg"]
+    for width in usable:
+        height = round(image.height * width / image.width)
+        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+        for fmt in modern + (["jpeg"] if width == fallback or not modern else []):
+            yield fmt, width, height, encode(resized, fmt)
+
+
+def sources(variants, url=media_url) -> dict:
+    """src (the JPEG fallback) and one srcset per format, from variant dicts."""
+    by_format = {}
+    for variant in sorted(variants, key=lambda v: v["width"]):
+        by_format.setdefault(variant["format"], []).append(variant)
+    fallback = by_format["jpeg"][-1]
+    return {
+        "src": url(fallback["name"]),
+        "width": fallback["width"],
+        "height": fallback["height"],
+        "sources": [
+            {
+                "type": MIME_TYPES[fmt],
+                "srcset": ", ".join(f"{url(v['name'])} {v['width']}w" for v in by_format[fmt]),
+            }
+            # The JPEG fallback is the <img> src unless it's the only format
+            for fmt in FORMATS if fmt in by_format and (fmt != "jpeg" or len(by_format) == 1)
+        ],
+    }
+
+
+# ==================== TEACHER PHOTOS ====================
+
+def save_upload(db, user_id: int, data: bytes) -> TeacherPhoto:
+    """Store an uploaded photo and queue its variants; the caller commits."""
+    if len(data) > MAX_UPLOAD_BYTES:
+        raise ValueError(f"Image is larger than {MAX_UPLOAD_BYTES // (1024 * 1024)} MB")
+    image, ext = open_image(data)
+    photo = TeacherPhoto(user_id=user_id, original=store(data, ext), width=image.width, height=image.height)
+    db.add(photo)
+    db.flush()
+    enqueue(db, "image.variants", {"photo_id": photo.id}, priority=PRIORITY_HIGH)
+    return photo
+
+
+@handler("image.variants")
+def build_variants(db, payload):
+    """Render a photo's variants, then retire the user's older photos."""
+    photo = db.get(TeacherPhoto, payload["photo_id"])
+    if photo is None:
+        return
+    path = media_path(photo.original)
+    if path is None:
+        photo.status = "failed"
+        return
+    image, _ = open_image(path.read_bytes())
+    variants = [
+        {"format": fmt, "width": width, "height": height, "name": store(data, EXTENSIONS[fmt])}
+        for fmt, width, height, data in render(image, PHOTO_WIDTHS, FALLBACK_WIDTH)
+    ]
+    photo.variants = json.dumps(variants)
+    photo.status = "ready"
+    db.execute(delete(TeacherPhoto).where(
+        TeacherPhoto.user_id == photo.user_id, TeacherPhoto.id < photo.id
+    ), execution_options={"synchronize_session": False})
+
+
+def photo_payload(photo: TeacherPhoto) -> dict:
+    payload = {"id": photo.id, "status": photo.status}
+    if photo.status == "ready":
+        payload.update(sources(json.loads(photo.variants)))
+    return payload
+
+
+def photos_for(db, user_ids) -> dict:
+    """The current (newest ready) photo of each user, as photo_payload()s."""
+    user_ids = list(set(user_ids))
+    if not user_ids:
+        return {}
+    newest = (
+        select(func.max(TeacherPhoto.id))
+        .where(TeacherPhoto.user_id.in_(user_ids), TeacherPhoto.status == "ready")
+        .group_by(TeacherPhoto.user_id)
+    )
+    photos = db.execute(select(TeacherPhoto).where(TeacherPhoto.id.in_(newest))).scalars()
+    return {photo.user_id: photo_payload(photo) for photo in photos}
+
+
+def delete_photos(db, user_ids) -> int:
+    """Delete the users' photo rows and queue removal of their files; the caller commits."""
+    user_ids = list(user_ids)
+    if not user_ids:
+        return 0
+    deleted = db.execute(delete(TeacherPhoto).where(
+        TeacherPhoto.user_id.in_(user_ids)
+    ), execution_options={"synchronize_session": False}).rowcount
+    if deleted:
+        enqueue(db, "image.garbage_collect", priority=PRIORITY_LOW, max_attempts=3)
+    return deleted
+
+
+@handler("image.garbage_collect")
+def collect_garbage(db, payload):
+    """Remove the files no photo references any more, e.g. after users were deleted."""
+    garbage_collect(db)
+
+
+def garbage_collect(db, min_age: float = 3600) -> int:
+    """Delete stored files that no photo references (older than min_age seconds)."""
+    referenced = set()
+    for original, variants in db.execute(select(TeacherPhoto.original, TeacherPhoto.variants)):
+        referenced.add(original)
+        referenced.update(v["name"] for v in json.loads(variants or "[]"))
+    removed = 0
+    cutoff = time.time() - min_age
+    for path in IMAGE_DIR.glob("*/*/*"):
+        if path.name not in referenced and path.stat().st_mtime < cutoff:
+            path.unlink()
+            removed += 1
+    return removed
+
+
+# ==================== STATIC ASSETS ====================
+
+APP_DIR = Path(__file__).resolve().parent.parent / "app"
+
+
+def build_assets(src: Path, out: Path, manifest: Path, public_root: Path) -> int:
+    """Render hashed variants of every JPEG/PNG in src and write the manifest module."""
+    out.mkdir(parents=True, exist_ok=True)
+    entries = {}
+    written = set()
+    for original in sorted(list(src.glob("*.jpg")) + list(src.glob("*.png"))):
+        image, _ = open_image(original.read_bytes())
+        variants = []
+        for fmt, width, height, data in render(image, ASSET_WIDTHS, FALLBACK_WIDTH):
+            digest = hashlib.sha256(data).hexdigest()[:10]
+            name = f"{original.stem}-{width}.{digest}.{EXTENSIONS[fmt]}"
+            if not (out / name).exists():
+                (out / name).write_bytes(data)
+            written.add(name)
+            variants.append({"format": fmt, "width": width, "height": height, "name": name})
+        url_prefix = "/" + out.relative_to(public_root).as_posix()
+        key = "/" + original.relative_to(public_root).as_posix()
+        entries[key] = sources(variants, url=lambda name: f"{url_prefix}/{name}")
+        print(f"  {key}: {original.stat().st_size // 1024} KB -> {len(variants)} variants")
+    for stale in out.iterdir():
+        if stale.name not in written:
+            stale.unlink()
+    manifest.write_text(
+        "// Generated by `python backend/images.py assets`; do not edit.\n"
+        "import type { ImageSources } from '@/components/ResponsiveImage';\n\n"
+        f"export const imageManifest: Record<string, ImageSources> = {json.dumps(entries, indent=2, ensure_ascii=False)};\n"
+    )
+    return len(entries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Image variants and asset optimization")
+    commands = parser.add_subparsers(dest="command", required=True)
+    assets_parser = commands.add_parser("assets", help="Optimize the frontend's static images")
+    assets_parser.add_argument("--src", type=Path, default=APP_DIR / "public" / "images")
+    assets_parser.add_argument("--out", type=Path, default=APP_DIR / "public" / "images" / "optimized")
+    assets_parser.add_argument("--manifest", type=Path, default=APP_DIR / "src" / "lib" / "imageManifest.ts")
+    gc_parser = commands.add_parser("gc", help="Delete stored files no photo references")
+    gc_parser.add_argument("--min-age", type=float, default=3600, help="Keep files younger than this (seconds)")
+    args = parser.parse_args()
+
+    if args.command == "assets":
+        count = build_assets(args.src, args.out, args.manifest, args.src.parent)
+        print(f"✅ Optimized {count} images into {args.out}")
+    else:
+        Base.metadata.create_all(bind=engine)
+        db = SessionLocal()
+        try:
+            print(f"✅ Removed {garbage_collect(db, args.min_age)} unreferenced files")
+        finally:
+            db.close()
+
+
+if __name__ == "__main__":
+    main()
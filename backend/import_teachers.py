@@ -0,0 +1,395 @@
+"""Bulk teacher import.
+
+Streams teachers from a CSV, JSON Lines or JSON file and inserts users,
+teacher profiles, instrument/location links and advertisements in chunked
+transactions. Instruments and locations are resolved from in-memory maps
+loaded once per run, and passwords are hashed on a process pool, which is
+where nearly all of the time goes (bcrypt) - throughput scales with cores.
+
+Existing emails are skipped, so re-running an import is safe. With
+--checkpoint, the number of input records committed so far is saved after
+every chunk and --resume continues from there.
+
+Record fields (CSV columns or JSON keys):
+    email, password | hashed_password, first_name, last_name, phone,
+    bio_short, bio_long, video_url, years_experience, lesson_price,
+    teaching_online, teaching_at_student, teaching_at_teacher,
+    instruments   "Zongora;Ének" or a JSON list
+    locations     "Budapest/V. kerület;Debrecen" or a JSON list of
+                  strings or {"city", "district"} objects
+    ads           JSON list of {title, short_description, long_description,
+                  instrument, location, featured, status, days}; in CSV use
+                  the ad_title, ad_short_description, ... columns for one ad
+
+Usage:
+    python import_teachers.py teachers.csv [--dry-run] [--batch-size 500]
+                              [--workers N] [--checkpoint FILE] [--resume]
+"""
+import argparse
+import csv
+import json
+import secrets
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import insert, select
+
+from database import SessionLocal, engine, Base
+from models import (
+    User, TeacherProfile, Instrument, Location, TeacherInstrument, TeacherLocation,
+    Advertisement, UserRole, AdStatus
+)
+from bulk import chunked
+import versions
+
+TRUE_VALUES = {"true", "1", "yes", "igen"}
+
+
+def hash_password(password: str) -> str:
+    from auth import get_password_hash
+    return get_password_hash(password)
+
+
+# ==================== INPUT ====================
+
+def read_records(path: Path):
+    """Yield raw records from a .csv, .jsonl or .json file."""
+    suffix = path.suffix.lower()
+    with path.open(encoding="utf-8") as f:
+        if suffix == ".csv":
+            yield from csv.DictReader(f)
+        elif suffix in (".jsonl", ".ndjson"):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        elif suffix == ".json":
+            # A JSON array has to be parsed whole; use .jsonl for large inputs
+            yield from json.load(f)
+        else:
+            raise ValueError(f"Unsupported input format: {suffix}")
+
+
+def _split(value):
+    if value is None or value == "":
+        return []
+    if isinstance(value, list):
+        return value
+    return [part.strip() for part in str(value).split(";") if part.strip()]
+
+
+def _bool(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value or "").strip().lower() in TRUE_VALUES
+
+
+def _location_key(value):
+    if isinstance(value, dict):
+        city, district = value.get("city"), value.get("district") or ""
+    else:
+        city, _, district = str(value).partition("/")
+    if not isinstance(city, str) or not city.strip():
+        raise ValueError("location needs a city")
+    return city.strip(), str(district).strip() or None
+
+
+def normalize(raw: dict) -> dict:
+    """Validate a raw record and convert it to the importer's shape."""
+    email = (raw.get("email") or "").strip().lower()
+    if "@" not in email:
+        raise ValueError("missing or invalid email")
+    if not raw.get("first_name") or not raw.get("last_name"):
+        raise ValueError("first_name and last_name are required")
+
+    ads = raw.get("ads")
+    if isinstance(ads, str):
+        ads = json.loads(ads) if ads.strip() else []
+    if not ads and raw.get("ad_title"):
+        ads = [{key[3:]: value for key, value in raw.items() if key.startswith("ad_") and value not in (None, "")}]
+
+    record = {
+        "email": email,
+        "password": raw.get("password") or None,
+        "hashed_password": raw.get("hashed_password") or None,
+        "first_name": raw["first_name"].strip(),
+        "last_name": raw["last_name"].strip(),
+        "phone": raw.get("phone") or None,
+        "bio_short": raw.get("bio_short") or None,
+        "bio_long": raw.get("bio_long") or None,
+        "video_url": raw.get("video_url") or None,
+        "years_experience": int(raw.get("years_experience") or 0),
+        "lesson_price": float(raw["lesson_price"]) if raw.get("lesson_price") not in (None, "") else None,
+        "teaching_online": _bool(raw.get("teaching_online")),
+        "teaching_at_student": _bool(raw.get("teaching_at_student")),
+        "teaching_at_teacher": _bool(raw.get("teaching_at_teacher")),
+        "instruments": _split(raw.get("instruments")),
+        "locations": [_location_key(value) for value in _split(raw.get("locations"))],
+        "ads": [],
+    }
+    for ad in ads or []:
+        if not ad.get("title") or not ad.get("short_description"):
+            raise ValueError("every ad needs a title and short_description")
+        record["ads"].append({
+            "title": ad["title"],
+            "short_description": ad["short_description"],
+            "long_description": ad.get("long_description"),
+            "instrument": ad.get("instrument") or (record["instruments"][0] if record["instruments"] else None),
+            "location": _location_key(ad["location"]) if ad.get("location") else (record["locations"][0] if record["locations"] else None),
+            "featured": _bool(ad.get("featured")),
+            "status": AdStatus(ad.get("status") or AdStatus.PENDING.value),
+            "days": int(ad.get("days") or 30),
+        })
+        if record["ads"][-1]["instrument"] is None or record["ads"][-1]["location"] is None:
+            raise ValueError("ads need an instrument and a location")
+    return record
+
+
+# ==================== REFERENCE DATA ====================
+
+class ReferenceMaps:
+    """Instrument and location ids, loaded once and extended as needed."""
+
+    def __init__(self, db):
+        self.instruments = {}
+        for instrument_id, name, name_hu in db.execute(select(Instrument.id, Instrument.name, Instrument.name_hu)):
+            self.instruments.setdefault(name.lower(), instrument_id)
+            self.instruments.setdefault(name_hu.lower(), instrument_id)
+        self.locations = {}
+        self.cities = {}
+        for location_id, city, district in db.execute(
+            select(Location.id, Location.city, Location.district).order_by(Location.id)
+        ):
+            self.locations[(city.lower(), (district or "").lower())] = location_id
+            self.cities.setdefault(city.lower(), location_id)
+
+    def instrument_id(self, name):
+        return self.instruments.get(name.lower())
+
+    def location_id(self, key):
+        city, district = key
+        if district:
+            return self.locations.get((city.lower(), district.lower()))
+        # A bare city matches any of its locations, like the old one-off scripts did
+        return self.locations.get((city.lower(), "")) or self.cities.get(city.lower())
+
+    def create_missing(self, db, records) -> set:
+        """Insert unknown instruments and locations; return the version scopes touched."""
+        new_instruments = {}
+        new_locations = {}
+        for record in records:
+            names = record["instruments"] + [ad["instrument"] for ad in record["ads"]]
+            for name in names:
+                if self.instrument_id(name) is None:
+                    new_instruments.setdefault(name.lower(), name)
+            for key in record["locations"] + [ad["location"] for ad in record["ads"]]:
+                if self.location_id(key) is None:
+                    new_locations.setdefault((key[0].lower(), (key[1] or "").lower()), key)
+        scopes = set()
+        if new_instruments:
+            db.execute(insert(Instrument), [
+                {"name": name, "name_hu": name, "category": "Egyéb"} for name in new_instruments.values()
+            ])
+            for instrument_id, name in db.execute(
+                select(Instrument.id, Instrument.name).where(Instrument.name.in_(list(new_instruments.values())))
+            ):
+                self.instruments[name.lower()] = instrument_id
+            scopes |= {"instruments", "catalog"}
+        if new_locations:
+            db.execute(insert(Location), [
+                {"city": city, "district": district} for city, district in new_locations.values()
+            ])
+            for location_id, city, district in db.execute(
+                select(Location.id, Location.city, Location.district).where(
+                    Location.city.in_([city for city, _ in new_locations.values()])
+                )
+            ):
+                self.locations.setdefault((city.lower(), (district or "").lower()), location_id)
+                self.cities.setdefault(city.lower(), location_id)
+            scopes |= {"locations", "catalog"}
+        return scopes
+
+
+# ==================== IMPORT ====================
+
+class ImportStats:
+    def __init__(self):
+        self.read = 0
+        self.imported = 0
+        self.existing = 0
+        self.invalid = 0
+        self.ads = 0
+        self.errors = []
+
+    def as_dict(self) -> dict:
+        return {
+            "read": self.read, "imported": self.imported, "existing": self.existing,
+            "invalid": self.invalid, "ads": self.ads,
+        }
+
+
+def _insert_batch(db, records, refs, pool, stats, now):
+    """Insert one chunk of new teachers; returns the version scopes touched."""
+    scopes = refs.create_missing(db, records)
+
+    to_hash = [record for record in records if not record["hashed_password"]]
+    passwords = [record["password"] or secrets.token_urlsafe(16) for record in to_hash]
+    hashes = pool.map(hash_password, passwords, chunksize=8) if pool else map(hash_password, passwords)
+    for record, hashed in zip(to_hash, hashes):
+        record["hashed_password"] = hashed
+
+    db.execute(insert(User), [
+        {
+            "email": r["email"], "hashed_password": r["hashed_password"], "first_name": r["first_name"],
+            "last_name": r["last_name"], "phone": r["phone"], "role": UserRole.TEACHER, "is_active": True,
+        }
+        for r in records
+    ])
+    user_ids = dict(db.execute(
+        select(User.email, User.id).where(User.email.in_([r["email"] for r in records]))
+    ).all())
+
+    db.execute(insert(TeacherProfile), [
+        {
+            "user_id": user_ids[r["email"]], "bio_short": r["bio_short"], "bio_long": r["bio_long"],
+            "video_url": r["video_url"], "years_experience": r["years_experience"],
+            "lesson_price": r["lesson_price"], "teaching_online": r["teaching_online"],
+            "teaching_at_student": r["teaching_at_student"], "teaching_at_teacher": r["teaching_at_teacher"],
+        }
+        for r in records
+    ])
+    profile_ids = dict(db.execute(
+        select(TeacherProfile.user_id, TeacherProfile.id).where(TeacherProfile.user_id.in_(list(user_ids.values())))
+    ).all())
+
+    teacher_instruments, teacher_locations, ads = [], [], []
+    for r in records:
+        user_id = user_ids[r["email"]]
+        profile_id = profile_ids[user_id]
+        for instrument_id in dict.fromkeys(refs.instrument_id(name) for name in r["instruments"]):
+            teacher_instruments.append({"teacher_id": profile_id, "instrument_id": instrument_id, "level": "all"})
+        for location_id in dict.fromkeys(refs.location_id(key) for key in r["locations"]):
+            teacher_locations.append({"teacher_id": profile_id, "location_id": location_id})
+        for ad in r["ads"]:
+            ads.append({
+                "teacher_id": user_id, "title": ad["title"], "short_description": ad["short_description"],
+                "long_description": ad["long_description"], "instrument_id": refs.instrument_id(ad["instrument"]),
+                "location_id": refs.location_id(ad["location"]), "status": ad["status"],
+                "featured": ad["featured"], "expires_at": now + timedelta(days=ad["days"]),
+            })
+        scopes.add(f"teacher:{user_id}")
+    if teacher_instruments:
+        db.execute(insert(TeacherInstrument), teacher_instruments)
+    if teacher_locations:
+        db.execute(insert(TeacherLocation), teacher_locations)
+    if ads:
+        db.execute(insert(Advertisement), ads)
+        scopes.add("catalog")
+
+    stats.imported += len(records)
+    stats.ads += len(ads)
+    return scopes
+
+
+def import_records(records, batch_size: int = 500, workers: int = None, dry_run: bool = False,
+                   checkpoint: Path = None, start_at: int = 0, progress=None) -> ImportStats:
+    """Import an iterable of raw teacher records.
+
+    Each chunk of `batch_size` records is committed in its own transaction.
+    With dry_run, records are validated and resolved but nothing is written.
+    """
+    stats = ImportStats()
+    stats.read = start_at
+    db = SessionLocal()
+    pool = ProcessPoolExecutor(max_workers=workers) if workers != 1 and not dry_run else None
+    now = datetime.utcnow()
+    try:
+        refs = ReferenceMaps(db)
+        iterator = iter(records)
+        for _ in range(start_at):
+            next(iterator, None)
+
+        for chunk in chunked(iterator, batch_size):
+            valid = {}
+            for offset, raw in enumerate(chunk, start=stats.read + 1):
+                try:
+                    record = normalize(raw)
+                except (ValueError, KeyError, TypeError) as e:
+                    stats.invalid += 1
+                    stats.errors.append(f"record {offset}: {e}")
+                    continue
+                if record["email"] in valid:
+                    stats.existing += 1
+                    continue
+                valid[record["email"]] = record
+            stats.read += len(chunk)
+
+            existing = set(db.execute(
+                select(User.email).where(User.email.in_(list(valid)))
+            ).scalars()) if valid else set()
+            stats.existing += len(existing)
+            new_records = [record for email, record in valid.items() if email not in existing]
+
+            if dry_run:
+                stats.imported += len(new_records)
+                stats.ads += sum(len(record["ads"]) for record in new_records)
+            elif new_records:
+                try:
+                    scopes = _insert_batch(db, new_records, refs, pool, stats, now)
+                    versions.touch(db.connection(), scopes)
+                    db.commit()
+                except Exception:
+                    db.rollback()
+                    raise
+            if checkpoint and not dry_run:
+                checkpoint.write_text(json.dumps({"records_done": stats.read, "stats": stats.as_dict()}))
+            if progress:
+                progress(stats)
+    finally:
+        if pool:
+            pool.shutdown()
+        db.close()
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import teachers from CSV/JSON")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=None, help="password hashing processes (default: CPU count)")
+    parser.add_argument("--dry-run", action="store_true", help="validate and resolve without writing")
+    parser.add_argument("--checkpoint", type=Path, help="file recording progress (default: <path>.checkpoint)")
+    parser.add_argument("--resume", action="store_true", help="continue from the checkpoint")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    checkpoint = args.checkpoint or args.path.with_name(args.path.name + ".checkpoint")
+    start_at = 0
+    if args.resume and checkpoint.exists():
+        start_at = json.loads(checkpoint.read_text())["records_done"]
+        print(f"Resuming after record {start_at}")
+
+    started = datetime.utcnow()
+
+    def progress(stats):
+        print(f"  {stats.read} read, {stats.imported} imported, {stats.existing} existing, {stats.invalid} invalid", flush=True)
+
+    stats = import_records(
+        read_records(args.path), args.batch_size, args.workers, args.dry_run, checkpoint, start_at, progress
+    )
+    elapsed = (datetime.utcnow() - started).total_seconds()
+    prefix = "🔍 Dry run:" if args.dry_run else "✅ Import finished:"
+    print(f"{prefix} {stats.imported} teachers, {stats.ads} advertisements in {elapsed:.1f}s")
+    if stats.existing:
+        print(f"   - Skipped existing emails: {stats.existing}")
+    for error in stats.errors[:20]:
+        print(f"   ❌ {error}")
+    if len(stats.errors) > 20:
+        print(f"   ... and {len(stats.errors) - 20} more invalid records")
+    if stats.invalid and not stats.imported:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
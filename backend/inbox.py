@@ -0,0 +1,153 @@
+"""Contact message inbox: cursor pages and maintained unread counters.
+
+Pages are read with a keyset cursor on (created_at, id), so each page costs
+one range scan of ix_contact_messages_inbox no matter how deep it is.
+
+Unread counts live in `inbox_counters` and are adjusted in the same
+transaction as every change to contact_messages (new message, mark read,
+archive, restore). A counter row is created from a COUNT the first time a
+user is touched; call ensure() before the change so that COUNT doesn't
+already include it.
+"""
+import base64
+from datetime import datetime
+
+from sqlalchemy import select, update, func, and_, or_
+
+from database import upsert
+from models import ContactMessage, InboxCounter
+
+PAGE_SIZE = 20
+
+
+# ==================== CURSORS ====================
+
+def encode_cursor(message) -> str:
+    raw = f"{message.created_at.isoformat()}|{message.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    """Return (created_at, id); raises ValueError for malformed cursors."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, message_id = raw.split("|")
+        return datetime.fromisoformat(created_at), int(message_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def page(db, user_id: int, cursor: str = None, limit: int = PAGE_SIZE, unread_only: bool = False):
+    """One page of a user's inbox, newest first. Returns (messages, next_cursor)."""
+    query = select(ContactMessage).where(ContactMessage.recipient_id == user_id)
+    if unread_only:
+        query = query.where(ContactMessage.is_read == False)  # noqa: E712
+    if cursor:
+        created_at, message_id = decode_cursor(cursor)
+        query = query.where(or_(
+            ContactMessage.created_at < created_at,
+            and_(ContactMessage.created_at == created_at, ContactMessage.id < message_id),
+        ))
+    messages = db.execute(
+        query.order_by(ContactMessage.created_at.desc(), ContactMessage.id.desc()).limit(limit + 1)
+    ).scalars().all()
+    next_cursor = encode_cursor(messages[limit - 1]) if len(messages) > limit else None
+    return messages[:limit], next_cursor
+
+
+# ==================== UNREAD COUNTERS ====================
+
+def ensure(db, user_ids):
+    """Create missing counter rows from the current unread COUNT."""
+    user_ids = set(user_ids)
+    if not user_ids:
+        return
+    existing = set(db.execute(
+        select(InboxCounter.user_id).where(InboxCounter.user_id.in_(user_ids))
+    ).scalars())
+    missing = user_ids - existing
+    if not missing:
+        return
+    counts = dict(db.execute(
+        select(ContactMessage.recipient_id, func.count(ContactMessage.id))
+        .where(ContactMessage.recipient_id.in_(missing), ContactMessage.is_read == False)  # noqa: E712
+        .group_by(ContactMessage.recipient_id)
+    ).all())
+    # Another transaction may have created the row meanwhile; its value wins
+    upsert(
+        db.connection(), InboxCounter.__table__,
+        [{"user_id": user_id, "unread": counts.get(user_id, 0)} for user_id in missing],
+        key=["user_id"], update=lambda table, incoming: {"unread": table.c.unread},
+    )
+
+
+def adjust(db, deltas: dict):
+    """Add deltas ({user_id: n}) to unread counters that ensure() has created."""
+    # Never below zero, even if a counter drifted
+    clamp = func.greatest if db.get_bind().dialect.name == "mysql" else func.max
+    for user_id, delta in deltas.items():
+        if delta:
+            db.execute(
+                update(InboxCounter)
+                .where(InboxCounter.user_id == user_id)
+                .values(unread=clamp(InboxCounter.unread + delta, 0)),
+                execution_options={"synchronize_session": False},
+            )
+
+
+def unread_count(db, user_id: int) -> int:
+    unread = db.execute(select(InboxCounter.unread).where(InboxCounter.user_id == user_id)).scalar()
+    if unread is None:
+        ensure(db, [user_id])
+        db.commit()
+        unread = db.execute(select(InboxCounter.unread).where(InboxCounter.user_id == user_id)).scalar()
+    return unread
+
+
+def message_received(db, message):
+    """Count a new message; call before flushing it."""
+    ensure(db, [message.recipient_id])
+    adjust(db, {message.recipient_id: 1})
+
+
+def mark_read(db, user_id: int, ids=None) -> int:
+    """Mark the given messages (or all) as read. Returns how many changed."""
+    ensure(db, [user_id])
+    conditions = [ContactMessage.recipient_id == user_id, ContactMessage.is_read == False]  # noqa: E712
+    if ids is not None:
+        conditions.append(ContactMessage.id.in_(list(ids)))
+    changed = db.execute(
+        update(ContactMessage).where(*conditions).values(is_read=True),
+        execution_options={"synchronize_session": False},
+    ).rowcount
+    adjust(db, {user_id: -changed})
+    return changed
+
+
+def unread_by_recipient(db, message_ids, model=ContactMessage) -> dict:
+    """Unread messages per recipient among the given ids (hot or archived)."""
+    return dict(db.execute(
+        select(model.recipient_id, func.count(model.id))
+        .where(model.id.in_(list(message_ids)), model.is_read == False)  # noqa: E712
+        .group_by(model.recipient_id)
+    ).all())
+
+
+def recount(db, user_ids=None) -> int:
+    """Rebuild counters from COUNTs (all users, or the given ones)."""
+    query = select(ContactMessage.recipient_id, func.count(ContactMessage.id)).where(
+        ContactMessage.is_read == False  # noqa: E712
+    ).group_by(ContactMessage.recipient_id)
+    if user_ids is not None:
+        query = query.where(ContactMessage.recipient_id.in_(list(user_ids)))
+    counts = dict(db.execute(query).all())
+    targets = set(counts) | set(user_ids or [])
+    if user_ids is None:
+        targets |= set(db.execute(select(InboxCounter.user_id)).scalars())
+    upsert(
+        db.connection(), InboxCounter.__table__,
+        [{"user_id": user_id, "unread": counts.get(user_id, 0)} for user_id in targets],
+        key=["user_id"], update=lambda table, incoming: {"unread": incoming.unread},
+    )
+    db.commit()
+    return len(targets)
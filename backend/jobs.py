@@ -0,0 +1,321 @@
+"""Persistent background job queue.
+
+Request handlers call enqueue() with their own session, so the job is
+committed in the same transaction as the write it belongs to and the
+response doesn't wait for the follow-up work. Workers claim due jobs in
+priority order, run the registered handler in a fresh session and either
+mark the job done or schedule a retry with exponential backoff. Jobs that
+fail max_attempts times are kept as `dead` for the admin dead-letter view.
+
+Delivery is at-least-once: a worker that dies mid-job leaves it `running`
+until JOB_LOCK_TIMEOUT passes and another worker picks it up again, so
+handlers should be safe to repeat.
+
+The API process runs one worker thread unless JOBS_IN_PROCESS=0; dedicated
+worker processes are started with:
+    python jobs.py worker [--processes N]
+"""
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import random
+import socket
+import threading
+import time
+import traceback
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, update, insert, delete, func
+
+from database import SessionLocal, engine, Base
+from models import Job
+import metrics
+
+logger = logging.getLogger("jobs")
+
+JOBS_IN_PROCESS = os.getenv("JOBS_IN_PROCESS", "1") == "1"
+POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", "1"))
+LOCK_TIMEOUT = int(os.getenv("JOB_LOCK_TIMEOUT", "300"))
+BATCH_SIZE = 10
+
+PRIORITY_HIGH = 10
+PRIORITY_NORMAL = 100
+PRIORITY_LOW = 1000
+
+# Seconds before retry n (1-based) is 2 ** n * BACKOFF_BASE, capped
+BACKOFF_BASE = 5
+BACKOFF_MAX = 3600
+
+JOBS_PROCESSED = metrics.Counter("jobs_processed_total", "Background jobs run by kind and outcome", ("kind", "outcome"))
+
+_handlers = {}
+
+
+def handler(kind: str):
+    """Register the function that runs jobs of `kind`; it gets (db, payload)."""
+    def register(fn):
+        _handlers[kind] = fn
+        return fn
+    return register
+
+
+def enqueue(db, kind: str, payload: dict = None, priority: int = PRIORITY_NORMAL,
+            delay: float = 0, max_attempts: int = 5) -> Job:
+    """Add a job to the caller's session; it is queued when the caller commits."""
+    job = Job(
+        kind=kind,
+        payload=json.dumps(payload or {}),
+        priority=priority,
+        max_attempts=max_attempts,
+        run_at=datetime.utcnow() + timedelta(seconds=delay),
+    )
+    db.add(job)
+    return job
+
+
+def enqueue_many(db, kind: str, payloads, priority: int = PRIORITY_NORMAL, max_attempts: int = 5) -> int:
+    """Queue many jobs of one kind with a single INSERT."""
+    now = datetime.utcnow()
+    rows = [
+        {
+            "kind": kind, "payload": json.dumps(payload), "priority": priority, "status": "queued",
+            "attempts": 0, "max_attempts": max_attempts, "run_at": now, "created_at": now,
+        }
+        for payload in payloads
+    ]
+    if rows:
+        db.execute(insert(Job.__table__), rows)
+    return len(rows)
+
+
+def backoff(attempts: int) -> float:
+    return min(BACKOFF_BASE * 2 ** attempts, BACKOFF_MAX) * random.uniform(0.8, 1.2)
+
+
+# ==================== WORKER ====================
+
+def claim(db, worker_id: str, limit: int = BATCH_SIZE) -> list:
+    """Lock up to `limit` due jobs for this worker, most urgent first."""
+    now = datetime.utcnow()
+    query = (
+        select(Job.id)
+        .where(Job.status == "queued", Job.run_at <= now)
+        .order_by(Job.priority, Job.run_at, Job.id)
+        .limit(limit)
+    )
+    if db.get_bind().dialect.name == "mysql":
+        query = query.with_for_update(skip_locked=True)
+    claimed = []
+    for job_id in db.execute(query).scalars().all():
+        # The status check makes the claim safe where SKIP LOCKED isn't available
+        result = db.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.status == "queued")
+            .values(status="running", locked_by=worker_id, locked_at=now),
+            execution_options={"synchronize_session": False},
+        )
+        if result.rowcount:
+            claimed.append(job_id)
+    db.commit()
+    return claimed
+
+
+def requeue_stale(db) -> int:
+    """Give jobs of crashed workers back to the queue."""
+    cutoff = datetime.utcnow() - timedelta(seconds=LOCK_TIMEOUT)
+    result = db.execute(
+        update(Job)
+        .where(Job.status == "running", Job.locked_at < cutoff)
+        .values(status="queued", locked_by=None, locked_at=None),
+        execution_options={"synchronize_session": False},
+    )
+    db.commit()
+    return result.rowcount
+
+
+def run_job(job_id: int) -> str:
+    """Run one claimed job and record the outcome (done, retry or dead)."""
+    db = SessionLocal()
+    try:
+        job = db.get(Job, job_id)
+        if job is None:
+            # Deleted after it was claimed (e.g. by a cleanup)
+            logger.warning("Job %s disappeared before it ran", job_id)
+            return "missing"
+        fn = _handlers.get(job.kind)
+        try:
+            if fn is None:
+                raise LookupError(f"No handler registered for job kind '{job.kind}'")
+            fn(db, json.loads(job.payload))
+            # Marked done in the handler's transaction, so its work is recorded once
+            job.attempts += 1
+            job.status = "done"
+            job.finished_at = datetime.utcnow()
+            job.locked_by = job.locked_at = None
+            outcome = "done"
+            kind = job.kind
+            db.commit()
+        except Exception:
+            db.rollback()
+            job = db.get(Job, job_id)
+            if job is None:
+                logger.exception("Job %s failed and disappeared", job_id)
+                return "missing"
+            job.attempts += 1
+            job.last_error = traceback.format_exc()[-4000:]
+            job.locked_by = job.locked_at = None
+            if job.attempts >= job.max_attempts:
+                job.status = "dead"
+                job.finished_at = datetime.utcnow()
+                outcome = "dead"
+                logger.error("Job %s (%s) is dead after %s attempts", job.id, job.kind, job.attempts)
+            else:
+                job.status = "queued"
+                job.run_at = datetime.utcnow() + timedelta(seconds=backoff(job.attempts))
+                outcome = "retry"
+            kind = job.kind
+            db.commit()
+        JOBS_PROCESSED.inc(kind=kind, outcome=outcome)
+        return outcome
+    finally:
+        db.close()
+
+
+def work(worker_id: str = None, once: bool = False, stop: threading.Event = None):
+    """Claim and run jobs until stopped (or until the queue is empty with once=True)."""
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    stop = stop or threading.Event()
+    last_requeue = 0.0
+    while not stop.is_set():
+        db = SessionLocal()
+        try:
+            if time.monotonic() - last_requeue > LOCK_TIMEOUT / 2:
+                requeue_stale(db)
+                last_requeue = time.monotonic()
+            job_ids = claim(db, worker_id)
+        except Exception:
+            logger.exception("Could not claim jobs")
+            job_ids = []
+        finally:
+            db.close()
+        for job_id in job_ids:
+            try:
+                run_job(job_id)
+            except Exception:
+                # e.g. the database went away while recording the outcome; the lock
+                # expires and requeue_stale() gives the job back to the queue
+                logger.exception("Could not run job %s", job_id)
+        if not job_ids:
+            if once:
+                return
+            stop.wait(POLL_INTERVAL)
+
+
+_thread = None
+_stop = threading.Event()
+
+
+def start_worker_thread():
+    """Run a worker inside this process (used by the API unless JOBS_IN_PROCESS=0)."""
+    global _thread
+    if JOBS_IN_PROCESS and _thread is None:
+        _thread = threading.Thread(
+            target=work, kwargs={"worker_id": f"{socket.gethostname()}-{os.getpid()}-api", "stop": _stop},
+            name="job-worker", daemon=True,
+        )
+        _thread.start()
+
+
+def stop_worker_thread():
+    _stop.set()
+
+
+# ==================== ADMIN ====================
+
+def stats(db) -> dict:
+    """Job counts by status, and by kind for queued and dead jobs."""
+    by_status = dict(db.execute(select(Job.status, func.count(Job.id)).group_by(Job.status)).all())
+    by_kind = {}
+    for kind, status, count in db.execute(
+        select(Job.kind, Job.status, func.count(Job.id))
+        .where(Job.status.in_(["queued", "dead"]))
+        .group_by(Job.kind, Job.status)
+    ):
+        by_kind.setdefault(kind, {})[status] = count
+    return {"by_status": by_status, "by_kind": by_kind}
+
+
+def retry(db, job_id: int) -> bool:
+    """Put a dead job back in the queue with a fresh set of attempts."""
+    result = db.execute(
+        update(Job)
+        .where(Job.id == job_id, Job.status == "dead")
+        .values(status="queued", attempts=0, run_at=datetime.utcnow(), finished_at=None),
+        execution_options={"synchronize_session": False},
+    )
+    db.commit()
+    return bool(result.rowcount)
+
+
+def prune(db, older_than_days: int = 7) -> int:
+    """Delete finished jobs older than the given age."""
+    cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+    result = db.execute(delete(Job).where(Job.status == "done", Job.finished_at < cutoff))
+    db.commit()
+    return result.rowcount
+
+
+# ==================== CLI ====================
+
+def _worker_process(index: int):
+    import notifications  # noqa: F401  (registers the handlers)
+    import images  # noqa: F401
+    import sitemap  # noqa: F401
+    work(f"{socket.gethostname()}-{os.getpid()}-{index}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Background job workers")
+    commands = parser.add_subparsers(dest="command", required=True)
+    worker_parser = commands.add_parser("worker", help="Run worker processes")
+    worker_parser.add_argument("--processes", type=int, default=1)
+    worker_parser.add_argument("--once", action="store_true", help="Exit when the queue is empty")
+    prune_parser = commands.add_parser("prune", help="Delete finished jobs")
+    prune_parser.add_argument("--days", type=int, default=7)
+    commands.add_parser("stats", help="Show job counts")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    Base.metadata.create_all(bind=engine)
+    if args.command == "worker":
+        import notifications  # noqa: F401
+        import images  # noqa: F401
+        import sitemap  # noqa: F401
+        if args.once or args.processes == 1:
+            print(f"🚀 Worker started (pid {os.getpid()})")
+            work(once=args.once)
+            return
+        processes = [multiprocessing.Process(target=_worker_process, args=(i,)) for i in range(args.processes)]
+        for process in processes:
+            process.start()
+        print(f"🚀 Started {len(processes)} worker processes")
+        for process in processes:
+            process.join()
+    elif args.command == "prune":
+        db = SessionLocal()
+        try:
+            print(f"✅ Deleted {prune(db, args.days)} finished jobs")
+        finally:
+            db.close()
+    else:
+        db = SessionLocal()
+        try:
+            print(json.dumps(stats(db), indent=2))
+        finally:
+            db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Public catalog queries shared by the API endpoints and the prerenderer.
+
+The endpoints wrap these in their version-keyed caches; prerender.py calls
+them directly when it regenerates the landing page snapshots, so a snapshot
+always inlines exactly what the matching API request would return.
+"""
+from sqlalchemy.orm import joinedload, selectinload
+
+from models import (
+    User, TeacherProfile, Instrument, Location, TeacherInstrument, TeacherLocation,
+    Advertisement, UserRole, AdStatus
+)
+from serializers import serialize_search_page
+import analytics
+import images
+
+
+def featured_teachers(db, limit: int = 6) -> list:
+    """Active teachers with their instruments, cities and photo."""
+    teachers = db.query(User).join(TeacherProfile).options(
+        selectinload(User.teacher_profile).selectinload(TeacherProfile.instruments).joinedload(TeacherInstrument.instrument),
+        selectinload(User.teacher_profile).selectinload(TeacherProfile.locations).joinedload(TeacherLocation.location)
+    ).filter(
+        User.role == UserRole.TEACHER,
+        User.is_active == True
+    ).limit(limit).all()
+
+    photos = images.photos_for(db, [teacher.id for teacher in teachers])
+    result = []
+    for teacher in teachers:
+        profile = teacher.teacher_profile
+        if profile:
+            result.append({
+                "id": teacher.id,
+                "first_name": teacher.first_name,
+                "last_name": teacher.last_name,
+                "bio_short": profile.bio_short,
+                "years_experience": profile.years_experience,
+                "lesson_price": profile.lesson_price,
+                "instruments": [ti.instrument.name_hu for ti in profile.instruments],
+                "locations": [tl.location.city for tl in profile.locations],
+                "teaching_online": profile.teaching_online,
+                "photo": photos.get(teacher.id)
+            })
+    return result
+
+
+def search_page(db, instrument=None, city=None, keyword=None, online_only=False,
+                featured_only=False, page: int = 1, per_page: int = 12):
+    """One page of active ads as (SearchResponse dict, impression targets)."""
+    query = db.query(Advertisement).filter(Advertisement.status == AdStatus.ACTIVE)
+
+    if instrument:
+        query = query.join(Instrument).filter(Instrument.name_hu.ilike(f"%{instrument}%"))
+
+    if city:
+        query = query.join(Location).filter(Location.city.ilike(f"%{city}%"))
+
+    if keyword:
+        query = query.filter(
+            (Advertisement.title.ilike(f"%{keyword}%")) |
+            (Advertisement.short_description.ilike(f"%{keyword}%"))
+        )
+
+    if online_only:
+        query = query.join(User).join(TeacherProfile).filter(TeacherProfile.teaching_online == True)
+
+    if featured_only:
+        query = query.filter(Advertisement.featured == True)
+
+    total = query.count()
+    advertisements = query.options(
+        joinedload(Advertisement.teacher),
+        joinedload(Advertisement.instrument),
+        joinedload(Advertisement.location)
+    ).order_by(Advertisement.id).offset((page - 1) * per_page).limit(per_page).all()
+    # Rows come straight from our database, so skip revalidating them through SearchResponse
+    return serialize_search_page(advertisements, total, page, per_page), analytics.targets(advertisements)
+
+
+def teacher_profile(db, teacher_id: int):
+    """A teacher's public profile with their active ads, or None."""
+    teacher = db.query(User).options(
+        joinedload(User.teacher_profile).selectinload(TeacherProfile.instruments).joinedload(TeacherInstrument.instrument),
+        joinedload(User.teacher_profile).selectinload(TeacherProfile.locations).joinedload(TeacherLocation.location)
+    ).filter(User.id == teacher_id, User.role == UserRole.TEACHER).first()
+    if not teacher:
+        return None
+
+    # Only the active rows, through ix_advertisements_teacher_status
+    ads = db.query(Advertisement).options(
+        joinedload(Advertisement.instrument),
+        joinedload(Advertisement.location)
+    ).filter(Advertisement.teacher_id == teacher.id, Advertisement.status == AdStatus.ACTIVE).order_by(Advertisement.id).all()
+
+    profile = teacher.teacher_profile
+    return {
+        "id": teacher.id,
+        "first_name": teacher.first_name,
+        "last_name": teacher.last_name,
+        "email": teacher.email,
+        "phone": teacher.phone,
+        "photo": images.photos_for(db, [teacher.id]).get(teacher.id),
+        "profile": {
+            "bio_short": profile.bio_short if profile else None,
+            "bio_long": profile.bio_long if profile else None,
+            "video_url": profile.video_url if profile else None,
+            "years_experience": profile.years_experience if profile else 0,
+            "lesson_price": profile.lesson_price if profile else None,
+            "teaching_online": profile.teaching_online if profile else False,
+            "teaching_at_student": profile.teaching_at_student if profile else False,
+            "teaching_at_teacher": profile.teaching_at_teacher if profile else False,
+            "instruments": [ti.instrument.name_hu for ti in profile.instruments] if profile else [],
+            "locations": [tl.location.city for tl in profile.locations] if profile else []
+        },
+        "advertisements": [
+            {
+                "id": ad.id,
+                "title": ad.title,
+                "short_description": ad.short_description,
+                "instrument": ad.instrument.name_hu if ad.instrument else None,
+                "location": ad.location.city if ad.location else None
+            }
+            for ad in ads
+        ]
+    }
+
+
+def cities(db) -> list:
+    return [city for (city,) in db.query(Location.city).distinct().all()]
+
+
+def instruments(db) -> list:
+    return db.query(Instrument).order_by(Instrument.id).all()
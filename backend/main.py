@@ -1,26 +1,52 @@
-from fastapi import FastAPI, Depends, HTTPException, status, Query
+from fastapi import FastAPI, Depends, HTTPException, status, Query, Request, Response, Header, UploadFile, File
+from fastapi.responses import PlainTextResponse, StreamingResponse, FileResponse
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from typing import List, Optional
 import os
+import json
+import uuid
 from dotenv import load_dotenv
 
-from database import engine, Base, get_db
-from models import User, TeacherProfile, Instrument, Location, Advertisement, ContactMessage, Payment, UserRole, AdStatus, SubscriptionType
+from database import engine, Base, get_db, SessionLocal
+from models import User, TeacherProfile, Instrument, Location, Advertisement, ContactMessage, Payment, TeacherPhoto, UserRole, AdStatus
 from schemas import (
     UserCreate, UserResponse, UserLogin,
     InstrumentCreate, InstrumentResponse,
     LocationCreate, LocationResponse,
     TeacherProfileCreate, TeacherProfileResponse,
     AdvertisementCreate, AdvertisementResponse, AdvertisementUpdate,
-    ContactMessageCreate, ContactMessageResponse,
+    ContactMessageCreate, ContactMessageResponse, InboxPage, MarkReadRequest,
     PaymentCreate, PaymentResponse,
     SearchFilters, SearchResponse, Token
 )
-from auth import authenticate_user, create_access_token, get_current_user, get_password_hash, ACCESS_TOKEN_EXPIRE_MINUTES
+from serializers import FastJSONResponse, dumps
+from http_cache import CompressionMiddleware, not_modified
+import versions
+import query_stats
+import metrics
+import profiling
+import analytics
+import payments
+import jobs
+import inbox
+import pubsub
+import dashboard
+import ratelimit
+import coalesce
+import listings
+import catalog
+import outbox
+import profiles
+import notifications  # noqa: F401  (registers the job handlers)
+import images
+import static_site
+import prerender
+import sitemap
+from auth import authenticate_user, create_access_token, get_current_user, get_user_from_token, get_password_hash, ACCESS_TOKEN_EXPIRE_MINUTES
 from datetime import datetime, timedelta
-import stripe
 import admin_routes
 
 load_dotenv()
@@ -28,10 +54,7 @@ load_dotenv()
 # Create database tables
 Base.metadata.create_all(bind=engine)
 
-# Stripe configuration
-stripe.api_key = os.getenv("STRIPE_SECRET_KEY", "sk_test_dummy")
-
-app = FastAPI(title="ZeneTanár.hu API", version="1.0.0")
+app = FastAPI(title="ZeneTanár.hu API", version="1.0.0", default_response_class=FastJSONResponse)
 
 # CORS middleware
 app.add_middleware(
@@ -42,14 +65,101 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON/text responses larger than 1 KB
+app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+# Count queries per request (Server-Timing header, slow query log)
+query_stats.install(engine)
+app.add_middleware(query_stats.QueryStatsMiddleware)
+
+# Per-route request counts and latency for /metrics
+metrics.watch_pool(engine)
+app.add_middleware(metrics.MetricsMiddleware)
+
+# Admin-requested and sampled request profiles, downloadable from /api/admin/profiles
+profiling.install()
+app.add_middleware(profiling.ProfilingMiddleware, router=app.router)
+
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+
+# Search pages and featured teachers, keyed by the catalog version
+SEARCH_CACHE = coalesce.TTLCache("search", ttl=float(os.getenv("SEARCH_CACHE_TTL", "30")))
+FEATURED_CACHE = coalesce.TTLCache("featured", ttl=float(os.getenv("SEARCH_CACHE_TTL", "30")), maxsize=32)
+# Rendered public teacher profiles, keyed by their ETag
+TEACHER_CACHE = coalesce.TTLCache("teacher_profile", ttl=float(os.getenv("TEACHER_CACHE_TTL", "600")), maxsize=2048)
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
 # Include admin routes
 app.include_router(admin_routes.router)
 
+@app.on_event("startup")
+def start_metrics_flusher():
+    metrics.start_flusher()
+
+@app.on_event("startup")
+def start_analytics_writer():
+    analytics.writer.start()
+
+@app.on_event("startup")
+def start_job_worker():
+    jobs.start_worker_thread()
+
+@app.on_event("startup")
+def start_catalog():
+    catalog.active_ads.start()
+
+@app.on_event("startup")
+def start_outbox_dispatcher():
+    outbox.dispatcher.start()
+
+@app.on_event("startup")
+def start_prerenderer():
+    prerender.snapshots.start()
+
+@app.on_event("startup")
+def schedule_sitemap():
+    db = SessionLocal()
+    try:
+        sitemap.schedule(db)
+        db.commit()
+    finally:
+        db.close()
+
+@app.on_event("shutdown")
+def stop_job_worker():
+    jobs.stop_worker_thread()
+
+@app.on_event("shutdown")
+def stop_catalog():
+    catalog.active_ads.stop()
+
+@app.on_event("shutdown")
+def stop_outbox_dispatcher():
+    outbox.dispatcher.stop()
+
+@app.on_event("shutdown")
+def stop_prerenderer():
+    prerender.snapshots.stop()
+
+@app.on_event("shutdown")
+def flush_analytics():
+    analytics.writer.flush()
+
+@app.on_event("shutdown")
+async def close_stripe_client():
+    await payments.stripe_client.close()
+
+@app.get("/metrics", include_in_schema=False)
+def get_metrics(authorization: Optional[str] = Header(None)):
+    """Prometheus scrape endpoint, merged across workers"""
+    if METRICS_TOKEN and authorization != f"Bearer {METRICS_TOKEN}":
+        raise HTTPException(status_code=401, detail="Invalid metrics token")
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
 # ==================== AUTH ENDPOINTS ====================
 
-@app.post("/api/auth/register", response_model=UserResponse)
+@app.post("/api/auth/register", response_model=UserResponse, dependencies=[Depends(ratelimit.limit("register"))])
 def register(user: UserCreate, db: Session = Depends(get_db)):
     db_user = db.query(User).filter(User.email == user.email).first()
     if db_user:
@@ -65,18 +175,20 @@ def register(user: UserCreate, db: Session = Depends(get_db)):
         role=user.role
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    db.flush()
     
     # Create teacher profile if role is teacher
     if user.role == UserRole.TEACHER:
-        teacher_profile = TeacherProfile(user_id=db_user.id)
-        db.add(teacher_profile)
-        db.commit()
+        db.add(TeacherProfile(user_id=db_user.id))
+    
+    jobs.enqueue(db, "user.welcome", {"user_id": db_user.id})
+    dashboard.user_created(db, db_user)
+    db.commit()
+    db.refresh(db_user)
     
     return db_user
 
-@app.post("/api/auth/login", response_model=Token)
+@app.post("/api/auth/login", response_model=Token, dependencies=[Depends(ratelimit.limit("login"))])
 def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
     user = authenticate_user(db, form_data.username, form_data.password)
     if not user:
@@ -98,55 +210,47 @@ def get_me(current_user: User = Depends(get_current_user)):
 # ==================== USER PROFILE ENDPOINTS ====================
 
 @app.get("/api/users/profile")
-def get_user_profile(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
-    """Get full user profile with advertisements"""
-    profile_data = {
-        "id": current_user.id,
-        "email": current_user.email,
-        "first_name": current_user.first_name,
-        "last_name": current_user.last_name,
-        "phone": current_user.phone,
-        "role": current_user.role.value,
-        "created_at": current_user.created_at.isoformat() if current_user.created_at else None,
-    }
-    
-    # Get teacher profile if user is a teacher
-    if current_user.role == UserRole.TEACHER and current_user.teacher_profile:
-        tp = current_user.teacher_profile
-        profile_data["teacher_profile"] = {
-            "bio_short": tp.bio_short,
-            "bio_long": tp.bio_long,
-            "video_url": tp.video_url,
-            "years_experience": tp.years_experience,
-            "lesson_price": float(tp.lesson_price) if tp.lesson_price else None,
-            "price_currency": tp.price_currency,
-            "teaching_online": tp.teaching_online,
-            "teaching_at_student": tp.teaching_at_student,
-            "teaching_at_teacher": tp.teaching_at_teacher,
-            "subscription_type": tp.subscription_type.value,
-            "subscription_expires": tp.subscription_expires.isoformat() if tp.subscription_expires else None,
-        }
-    
-    # Get user's advertisements
-    ads = db.query(Advertisement).filter(Advertisement.teacher_id == current_user.id).all()
-    profile_data["advertisements"] = [
-        {
-            "id": ad.id,
-            "title": ad.title,
-            "short_description": ad.short_description,
-            "status": ad.status.value,
-            "featured": ad.featured,
-            "views": ad.views,
-            "contacts": ad.contacts,
-            "created_at": ad.created_at.isoformat() if ad.created_at else None,
-            "expires_at": ad.expires_at.isoformat() if ad.expires_at else None,
-            "instrument": ad.instrument.name_hu if ad.instrument else None,
-            "location": ad.location.city if ad.location else None,
-        }
-        for ad in ads
-    ]
-    
-    return profile_data
+def get_user_profile(
+    fields: Optional[str] = Query(None, description=f"Comma-separated parts to return: {', '.join(profiles.FIELDS)}"),
+    days: int = Query(profiles.STATS_DAYS, ge=1, le=365),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Everything the profile page shows: user, teacher profile, ads, their stats and unread messages"""
+    return FastJSONResponse(profiles.build(db, current_user, profiles.parse_fields(fields), days))
+
+@app.post("/api/users/profile/photo", status_code=202)
+def upload_profile_photo(
+    file: UploadFile = File(...),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Upload a teacher photo; its variants are rendered in the background"""
+    if current_user.role != UserRole.TEACHER:
+        raise HTTPException(status_code=403, detail="Only teachers can upload a photo")
+    data = file.file.read(images.MAX_UPLOAD_BYTES + 1)
+    try:
+        photo = images.save_upload(db, current_user.id, data)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    db.commit()
+    return images.photo_payload(photo)
+
+@app.get("/api/users/profile/photo/{photo_id}")
+def get_profile_photo(photo_id: int, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+    """Processing status of an uploaded photo"""
+    photo = db.get(TeacherPhoto, photo_id)
+    if not photo or photo.user_id != current_user.id:
+        raise HTTPException(status_code=404, detail="Photo not found")
+    return images.photo_payload(photo)
+
+@app.get("/media/{name}", include_in_schema=False)
+def get_media(name: str):
+    """Content-addressed image files; a name never changes its content"""
+    path = images.media_path(name)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Not found")
+    return FileResponse(path, headers=images.IMMUTABLE_HEADERS)
 
 @app.put("/api/users/profile")
 def update_user_profile(
@@ -200,33 +304,21 @@ def get_my_advertisements(
     db: Session = Depends(get_db)
 ):
     """Get current user's advertisements"""
-    ads = db.query(Advertisement).filter(
-        Advertisement.teacher_id == current_user.id
-    ).order_by(Advertisement.created_at.desc()).all()
-    
-    return [
-        {
-            "id": ad.id,
-            "title": ad.title,
-            "short_description": ad.short_description,
-            "long_description": ad.long_description,
-            "status": ad.status.value,
-            "featured": ad.featured,
-            "views": ad.views,
-            "contacts": ad.contacts,
-            "created_at": ad.created_at.isoformat() if ad.created_at else None,
-            "expires_at": ad.expires_at.isoformat() if ad.expires_at else None,
-            "days_remaining": (ad.expires_at - datetime.utcnow()).days if ad.expires_at else None,
-            "instrument": ad.instrument.name_hu if ad.instrument else None,
-            "location": ad.location.city if ad.location else None,
-        }
-        for ad in ads
-    ]
+    return FastJSONResponse(profiles.build(db, current_user, {"advertisements"})["advertisements"])
 
 # ==================== INSTRUMENT ENDPOINTS ====================
 
 @app.get("/api/instruments", response_model=List[InstrumentResponse])
-def get_instruments(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def get_instruments(
+    request: Request,
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    db: Session = Depends(get_db)
+):
+    cached = not_modified(request, response, versions.etag(db, "instruments"))
+    if cached:
+        return cached
     return db.query(Instrument).offset(skip).limit(limit).all()
 
 @app.post("/api/instruments", response_model=InstrumentResponse)
@@ -241,20 +333,27 @@ def create_instrument(instrument: InstrumentCreate, db: Session = Depends(get_db
 
 @app.get("/api/locations", response_model=List[LocationResponse])
 def get_locations(
+    request: Request,
+    response: Response,
     city: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db)
 ):
+    cached = not_modified(request, response, versions.etag(db, "locations"))
+    if cached:
+        return cached
     query = db.query(Location)
     if city:
         query = query.filter(Location.city.ilike(f"%{city}%"))
     return query.offset(skip).limit(limit).all()
 
 @app.get("/api/locations/cities")
-def get_cities(db: Session = Depends(get_db)):
-    cities = db.query(Location.city).distinct().all()
-    return [city[0] for city in cities]
+def get_cities(request: Request, response: Response, db: Session = Depends(get_db)):
+    cached = not_modified(request, response, versions.etag(db, "locations"))
+    if cached:
+        return cached
+    return listings.cities(db)
 
 @app.post("/api/locations", response_model=LocationResponse)
 def create_location(location: LocationCreate, db: Session = Depends(get_db)):
@@ -266,7 +365,7 @@ def create_location(location: LocationCreate, db: Session = Depends(get_db)):
 
 # ==================== ADVERTISEMENT ENDPOINTS ====================
 
-@app.get("/api/advertisements", response_model=SearchResponse)
+@app.get("/api/advertisements", response_model=SearchResponse, dependencies=[Depends(ratelimit.limit("search"))])
 def search_advertisements(
     instrument: Optional[str] = None,
     city: Optional[str] = None,
@@ -277,46 +376,41 @@ def search_advertisements(
     per_page: int = Query(12, ge=1, le=50),
     db: Session = Depends(get_db)
 ):
-    query = db.query(Advertisement).filter(Advertisement.status == AdStatus.ACTIVE)
-    
-    if instrument:
-        query = query.join(Instrument).filter(Instrument.name_hu.ilike(f"%{instrument}%"))
-    
-    if city:
-        query = query.join(Location).filter(Location.city.ilike(f"%{city}%"))
-    
-    if keyword:
-        query = query.filter(
-            (Advertisement.title.ilike(f"%{keyword}%")) |
-            (Advertisement.short_description.ilike(f"%{keyword}%"))
+    catalog_version = versions.get_versions(db, ["catalog"])["catalog"]
+    if not keyword:
+        # Answered from the in-memory catalog when it is enabled and loaded
+        found = catalog.active_ads.search(
+            db, catalog_version, instrument, city, online_only, featured_only, page, per_page
         )
-    
-    if online_only:
-        query = query.join(User).join(TeacherProfile).filter(TeacherProfile.teaching_online == True)
-    
-    if featured_only:
-        query = query.filter(Advertisement.featured == True)
-    
-    total = query.count()
-    advertisements = query.offset((page - 1) * per_page).limit(per_page).all()
-    
-    return {
-        "advertisements": advertisements,
-        "total": total,
-        "page": page,
-        "per_page": per_page
-    }
-
-@app.get("/api/advertisements/{ad_id}", response_model=AdvertisementResponse)
-def get_advertisement(ad_id: int, db: Session = Depends(get_db)):
+        if found is not None:
+            body, impressions = found
+            analytics.record_impression_targets(impressions)
+            return Response(body, media_type="application/json")
+    
+    # Concurrent identical searches share one query; any catalog change starts a new key
+    key = (catalog_version, instrument, city, keyword, bool(online_only), bool(featured_only), page, per_page)
+    
+    content, impressions = coalesce.cached(db, SEARCH_CACHE, key, lambda: listings.search_page(
+        db, instrument, city, keyword, online_only, featured_only, page, per_page
+    ))
+    analytics.record_impression_targets(impressions)
+    return FastJSONResponse(content)
+
+@app.get("/api/advertisements/{ad_id}", response_model=AdvertisementResponse, dependencies=[Depends(ratelimit.limit("advertisement"))])
+def get_advertisement(ad_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
     ad = db.query(Advertisement).filter(Advertisement.id == ad_id).first()
     if not ad:
         raise HTTPException(status_code=404, detail="Advertisement not found")
     
-    # Increment view count
-    ad.views += 1
-    db.commit()
+    # The view count is left out of the version, so repeat views still revalidate
+    etag = versions.etag(db, f"ad:{ad.id}", f"user:{ad.teacher_id}", "instruments", "locations")
+    
+    # Counted by the analytics writer, which also bumps ad.views in its next batch
+    analytics.record_view(ad)
     
+    cached = not_modified(request, response, etag)
+    if cached:
+        return cached
     return ad
 
 @app.post("/api/advertisements", response_model=AdvertisementResponse)
@@ -335,6 +429,8 @@ def create_advertisement(
         expires_at=datetime.utcnow() + timedelta(days=30)  # 30 days expiration
     )
     db.add(db_ad)
+    db.flush()
+    dashboard.ad_created(db, db_ad)
     db.commit()
     db.refresh(db_ad)
     return db_ad
@@ -352,8 +448,11 @@ def update_advertisement(
     if ad.teacher_id != current_user.id and current_user.role != UserRole.ADMIN:
         raise HTTPException(status_code=403, detail="Not authorized")
     
+    old_status = ad.status
     for field, value in ad_update.dict(exclude_unset=True).items():
         setattr(ad, field, value)
+    if ad.status != old_status:
+        dashboard.ads_changed(db, [ad], {ad.id: old_status})
     
     db.commit()
     db.refresh(ad)
@@ -371,221 +470,287 @@ def delete_advertisement(
     if ad.teacher_id != current_user.id and current_user.role != UserRole.ADMIN:
         raise HTTPException(status_code=403, detail="Not authorized")
     
+    dashboard.ads_deleted(db, {ad.id: ad.status})
     db.delete(ad)
     db.commit()
     return {"message": "Advertisement deleted successfully"}
 
 # ==================== TEACHER ENDPOINTS ====================
 
-@app.get("/api/teachers/featured")
-def get_featured_teachers(limit: int = 6, db: Session = Depends(get_db)):
-    teachers = db.query(User).join(TeacherProfile).filter(
-        User.role == UserRole.TEACHER,
-        User.is_active == True
-    ).limit(limit).all()
-    
-    result = []
-    for teacher in teachers:
-        profile = teacher.teacher_profile
-        if profile:
-            result.append({
-                "id": teacher.id,
-                "first_name": teacher.first_name,
-                "last_name": teacher.last_name,
-                "bio_short": profile.bio_short,
-                "years_experience": profile.years_experience,
-                "lesson_price": profile.lesson_price,
-                "instruments": [ti.instrument.name_hu for ti in profile.instruments],
-                "locations": [tl.location.city for tl in profile.locations],
-                "teaching_online": profile.teaching_online
-            })
-    return result
+@app.get("/api/teachers/featured", dependencies=[Depends(ratelimit.limit("featured"))])
+def get_featured_teachers(limit: int = Query(6, ge=1, le=50), db: Session = Depends(get_db)):
+    catalog = versions.get_versions(db, ["catalog"])["catalog"]
+    
+    return coalesce.cached(db, FEATURED_CACHE, (catalog, limit), lambda: listings.featured_teachers(db, limit))
 
 @app.get("/api/teachers/{teacher_id}")
-def get_teacher_profile(teacher_id: int, db: Session = Depends(get_db)):
-    teacher = db.query(User).filter(User.id == teacher_id, User.role == UserRole.TEACHER).first()
-    if not teacher:
+def get_teacher_profile(teacher_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
+    etag = versions.etag(db, f"teacher:{teacher_id}", "instruments", "locations")
+    cached = not_modified(request, response, etag)
+    if cached:
+        return cached
+    
+    # Rendered once per version; shared links and crawlers are served from memory
+    def render():
+        profile = listings.teacher_profile(db, teacher_id)
+        return dumps(profile) if profile is not None else None
+    
+    body = coalesce.cached(db, TEACHER_CACHE, (teacher_id, etag), render)
+    if body is None:
         raise HTTPException(status_code=404, detail="Teacher not found")
-    
-    profile = teacher.teacher_profile
-    return {
-        "id": teacher.id,
-        "first_name": teacher.first_name,
-        "last_name": teacher.last_name,
-        "email": teacher.email,
-        "phone": teacher.phone,
-        "profile": {
-            "bio_short": profile.bio_short if profile else None,
-            "bio_long": profile.bio_long if profile else None,
-            "video_url": profile.video_url if profile else None,
-            "years_experience": profile.years_experience if profile else 0,
-            "lesson_price": profile.lesson_price if profile else None,
-            "teaching_online": profile.teaching_online if profile else False,
-            "teaching_at_student": profile.teaching_at_student if profile else False,
-            "teaching_at_teacher": profile.teaching_at_teacher if profile else False,
-            "instruments": [ti.instrument.name_hu for ti in profile.instruments] if profile else [],
-            "locations": [tl.location.city for tl in profile.locations] if profile else []
-        },
-        "advertisements": [
-            {
-                "id": ad.id,
-                "title": ad.title,
-                "short_description": ad.short_description,
-                "instrument": ad.instrument.name_hu if ad.instrument else None,
-                "location": ad.location.city if ad.location else None
-            }
-            for ad in teacher.advertisements if ad.status == AdStatus.ACTIVE
-        ]
-    }
+    return Response(body, media_type="application/json", headers={"ETag": etag, "Cache-Control": "no-cache"})
 
 # ==================== CONTACT ENDPOINTS ====================
 
-@app.post("/api/contact", response_model=ContactMessageResponse)
+@app.post("/api/contact", response_model=ContactMessageResponse, dependencies=[Depends(ratelimit.limit("contact"))])
 def send_contact_message(
     message: ContactMessageCreate,
     db: Session = Depends(get_db)
 ):
     db_message = ContactMessage(**message.dict())
+    inbox.message_received(db, db_message)
     db.add(db_message)
+    db.flush()
+    jobs.enqueue(db, "contact.notify_teacher", {"message_id": db_message.id}, priority=jobs.PRIORITY_HIGH)
     db.commit()
     db.refresh(db_message)
     
-    # Increment contact count on advertisement
+    # Counted by the analytics writer, which also bumps ad.contacts in its next batch
     if message.advertisement_id:
-        ad = db.query(Advertisement).filter(Advertisement.id == message.advertisement_id).first()
+        ad = db.query(Advertisement).options(joinedload(Advertisement.location)).filter(
+            Advertisement.id == message.advertisement_id
+        ).first()
         if ad:
-            ad.contacts += 1
-            db.commit()
+            analytics.record_contact(ad)
     
+    pubsub.publish(f"inbox:{db_message.recipient_id}", {
+        "type": "message",
+        "message": ContactMessageResponse.model_validate(db_message).model_dump(),
+    })
     return db_message
 
-@app.get("/api/contact/messages", response_model=List[ContactMessageResponse])
+@app.get("/api/contact/messages", response_model=InboxPage)
 def get_contact_messages(
+    cursor: Optional[str] = None,
+    limit: int = Query(inbox.PAGE_SIZE, ge=1, le=100),
+    unread_only: bool = False,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """One page of the inbox, newest first; pass next_cursor to get the next one"""
+    try:
+        messages, next_cursor = inbox.page(db, current_user.id, cursor, limit, unread_only)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": messages, "next_cursor": next_cursor, "unread": inbox.unread_count(db, current_user.id)}
+
+@app.get("/api/contact/messages/unread-count")
+def get_unread_count(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    return {"unread": inbox.unread_count(db, current_user.id)}
+
+@app.post("/api/contact/messages/mark-read")
+def mark_messages_read(
+    request: MarkReadRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Mark the given messages, or the whole inbox, as read"""
+    changed = inbox.mark_read(db, current_user.id, request.ids)
+    db.commit()
+    unread = inbox.unread_count(db, current_user.id)
+    # Keep the user's other open tabs in sync
+    pubsub.publish(f"inbox:{current_user.id}", {"type": "unread", "unread": unread})
+    return {"marked": changed, "unread": unread}
+
+@app.get("/api/contact/messages/stream")
+async def stream_contact_messages(request: Request, token: str):
+    """Server-sent events with new messages and unread counts.
+    
+    EventSource can't send headers, so the access token comes as a query parameter.
+    """
+    def load():
+        db = SessionLocal()
+        try:
+            user = get_user_from_token(db, token)
+            return (user.id, inbox.unread_count(db, user.id)) if user else (None, None)
+        finally:
+            db.close()
+    
+    user_id, unread = await run_in_threadpool(load)
+    if user_id is None:
+        raise HTTPException(status_code=401, detail="Could not validate credentials")
+    
+    async def events():
+        async with pubsub.subscribe(f"inbox:{user_id}") as queue:
+            async for chunk in pubsub.sse_stream(request, queue, [{"type": "unread", "unread": unread}]):
+                yield chunk
+    
+    return StreamingResponse(events(), media_type="text/event-stream", headers=pubsub.SSE_HEADERS)
+
+# ==================== ANALYTICS ENDPOINTS ====================
+
+@app.get("/api/analytics/advertisements/{ad_id}")
+def get_advertisement_stats(
+    ad_id: int,
+    granularity: str = Query("day", pattern="^(hour|day)$"),
+    periods: int = Query(30, ge=1, le=744),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    messages = db.query(ContactMessage).filter(
-        ContactMessage.recipient_id == current_user.id
-    ).order_by(ContactMessage.created_at.desc()).all()
-    return messages
+    """Views, contacts and search impressions of an ad per hour or day"""
+    ad = db.query(Advertisement).filter(Advertisement.id == ad_id).first()
+    if not ad:
+        raise HTTPException(status_code=404, detail="Advertisement not found")
+    if ad.teacher_id != current_user.id and current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Not authorized")
+    return {
+        "advertisement_id": ad_id,
+        "granularity": granularity,
+        "series": analytics.ad_series(db, ad_id, granularity, periods)
+    }
+
+@app.get("/api/analytics/my-advertisements")
+def get_my_advertisement_stats(
+    days: int = Query(30, ge=1, le=365),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Totals of the last `days` days for each of the current user's ads"""
+    ad_ids = [ad_id for (ad_id,) in db.query(Advertisement.id).filter(Advertisement.teacher_id == current_user.id)]
+    totals = analytics.ad_totals(db, ad_ids, days)
+    return {"days": days, "advertisements": {str(ad_id): counts for ad_id, counts in totals.items()}}
 
 # ==================== PAYMENT ENDPOINTS ====================
 
 @app.post("/api/payments/create-intent")
-def create_payment_intent(
+async def create_payment_intent(
     payment: PaymentCreate,
+    idempotency_key: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
+    user_id = current_user.id
+    # Don't hold a connection while waiting on Stripe
+    await run_in_threadpool(db.close)
+    
+    # A client retry with the same Idempotency-Key gets the same intent back
+    key = f"user-{user_id}-{idempotency_key or uuid.uuid4().hex}"
     try:
-        intent = stripe.PaymentIntent.create(
+        intent = await payments.stripe_client.create_payment_intent(
             amount=int(payment.amount * 100),  # Convert to cents
             currency=payment.currency.lower(),
-            metadata={
-                "user_id": current_user.id,
-                "payment_type": payment.payment_type
-            }
+            metadata={"user_id": user_id, "payment_type": payment.payment_type},
+            idempotency_key=key
         )
-        
-        # Save payment record
+    except payments.StripeError as e:
+        raise HTTPException(status_code=400 if e.status_code and e.status_code < 500 else 502, detail=str(e))
+    
+    def save_payment():
+        existing = db.query(Payment).filter(Payment.stripe_payment_intent_id == intent["id"]).first()
+        if existing:
+            return existing.id
         db_payment = Payment(
-            user_id=current_user.id,
+            user_id=user_id,
             amount=payment.amount,
             currency=payment.currency,
             payment_type=payment.payment_type,
             description=payment.description,
-            stripe_payment_intent_id=intent.id,
+            stripe_payment_intent_id=intent["id"],
             status="pending"
         )
         db.add(db_payment)
         db.commit()
-        
-        return {"client_secret": intent.client_secret, "payment_id": db_payment.id}
-    except stripe.error.StripeError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        return db_payment.id
+    
+    payment_id = await run_in_threadpool(save_payment)
+    return {"client_secret": intent["client_secret"], "payment_id": payment_id}
 
 @app.post("/api/payments/confirm/{payment_id}")
-def confirm_payment(
+async def confirm_payment(
     payment_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    payment = db.query(Payment).filter(Payment.id == payment_id).first()
-    if not payment or payment.user_id != current_user.id:
+    """Fallback for clients that poll; the webhook normally settles payments first"""
+    def load_payment():
+        payment = db.query(Payment).filter(Payment.id == payment_id).first()
+        if not payment or payment.user_id != current_user.id:
+            return None, None
+        status_, intent_id = payment.status, payment.stripe_payment_intent_id
+        db.close()
+        return status_, intent_id
+    
+    current_status, intent_id = await run_in_threadpool(load_payment)
+    if current_status is None:
         raise HTTPException(status_code=404, detail="Payment not found")
+    if current_status != "pending" or not intent_id:
+        return {"status": current_status}
     
     try:
-        intent = stripe.PaymentIntent.retrieve(payment.stripe_payment_intent_id)
-        if intent.status == "succeeded":
-            payment.status = "completed"
-            payment.completed_at = datetime.utcnow()
-            
-            # Update teacher subscription if payment is for premium
-            if payment.payment_type == "subscription":
-                profile = db.query(TeacherProfile).filter(
-                    TeacherProfile.user_id == current_user.id
-                ).first()
-                if profile:
-                    profile.subscription_type = SubscriptionType.PREMIUM
-                    profile.subscription_expires = datetime.utcnow() + timedelta(days=30)
-            
-            db.commit()
-            return {"status": "completed"}
-        else:
-            payment.status = "failed"
-            db.commit()
-            return {"status": "failed"}
-    except stripe.error.StripeError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        intent = await payments.stripe_client.retrieve_payment_intent(intent_id)
+    except payments.StripeError as e:
+        raise HTTPException(status_code=400 if e.status_code and e.status_code < 500 else 502, detail=str(e))
+    
+    def apply():
+        payment = db.query(Payment).filter(Payment.id == payment_id).first()
+        payments.apply_status(db, payment, payments.payment_status_for(intent))
+        db.commit()
+        return payment.status
+    
+    return {"status": await run_in_threadpool(apply)}
 
-# ==================== SEED DATA ====================
-
-@app.post("/api/seed")
-def seed_data(db: Session = Depends(get_db)):
-    """Seed initial data for testing"""
-    # Add instruments
-    instruments = [
-        ("piano", "Zongora", "billentyűs"),
-        ("guitar", "Gitár", "húros"),
-        ("violin", "Hegedű", "húros"),
-        ("voice", "Ének", "ének"),
-        ("drums", "Dob", "ütős"),
-        ("bass", "Basszusgitár", "húros"),
-        ("saxophone", "Szaxofon", "fúvós"),
-        ("flute", "Fuvola", "fúvós"),
-        ("cello", "Cselló", "húros"),
-        ("ukulele", "Ukulele", "húros"),
-    ]
-    
-    for name, name_hu, category in instruments:
-        if not db.query(Instrument).filter(Instrument.name == name).first():
-            db.add(Instrument(name=name, name_hu=name_hu, category=category))
-    
-    # Add locations
-    locations = [
-        ("Budapest", None),
-        ("Budapest", "I. kerület"),
-        ("Budapest", "II. kerület"),
-        ("Budapest", "V. kerület"),
-        ("Budapest", "VI. kerület"),
-        ("Budapest", "VII. kerület"),
-        ("Budapest", "VIII. kerület"),
-        ("Budapest", "IX. kerület"),
-        ("Budapest", "XI. kerület"),
-        ("Budapest", "XIII. kerület"),
-        ("Debrecen", None),
-        ("Szeged", None),
-        ("Pécs", None),
-        ("Győr", None),
-        ("Miskolc", None),
-    ]
-    
-    for city, district in locations:
-        if not db.query(Location).filter(Location.city == city, Location.district == district).first():
-            db.add(Location(city=city, district=district))
+@app.post("/api/payments/webhook", include_in_schema=False)
+async def stripe_webhook(
+    request: Request,
+    stripe_signature: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
+    """Apply Stripe payment events; the signature is checked against the raw body"""
+    payload = await request.body()
+    try:
+        payments.verify_signature(payload, stripe_signature)
+        event = json.loads(payload)
+    except (payments.WebhookSignatureError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    db.commit()
-    return {"message": "Seed data added successfully"}
+    changed = await run_in_threadpool(payments.handle_event, db, event)
+    return {"received": True, "applied": changed}
+
+# ==================== SEO ====================
+
+SITEMAP_HEADERS = {"Cache-Control": "public, max-age=300"}
+
+@app.get("/sitemap.xml", include_in_schema=False)
+def get_sitemap_index():
+    """Sitemap index, written by the sitemap.build job"""
+    path = sitemap.sitemaps.path("sitemap.xml")
+    if path is None:
+        raise HTTPException(status_code=404, detail="Not found")
+    return FileResponse(path, media_type="application/xml", headers=SITEMAP_HEADERS)
+
+@app.get("/sitemaps/{name}", include_in_schema=False)
+def get_sitemap_shard(name: str):
+    path = sitemap.sitemaps.path(f"sitemaps/{name}")
+    if path is None or path.suffix != ".gz":
+        raise HTTPException(status_code=404, detail="Not found")
+    return FileResponse(path, media_type="application/gzip", headers=SITEMAP_HEADERS)
+
+@app.get("/feeds/{kind}/{name}", include_in_schema=False)
+def get_feed(kind: str, name: str):
+    """Atom feed of the newest ads in a city or of an instrument"""
+    path = sitemap.sitemaps.path(f"feeds/{kind}/{name}")
+    if path is None or path.suffix != ".xml":
+        raise HTTPException(status_code=404, detail="Not found")
+    return FileResponse(path, media_type="application/atom+xml", headers=SITEMAP_HEADERS)
+
+# ==================== FRONTEND ====================
+
+# Last, so every API route above takes precedence over the SPA fallback;
+# the landing pages are answered with their prerendered snapshots
+static_site.install(app, pages=prerender.snapshots)
 
 if __name__ == "__main__":
     import uvicorn
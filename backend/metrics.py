@@ -0,0 +1,350 @@
+"""Prometheus-style metrics.
+
+Counters and histograms are sharded per thread, so recording a sample on the
+hot path is a plain dict update with no locking; shards are only summed when
+/metrics is scraped. Gauges are callbacks evaluated at scrape time.
+
+With several uvicorn workers, set METRICS_DIR to a directory shared by the
+workers: each worker periodically writes its snapshot there and /metrics
+merges all of them, whichever worker serves the scrape.
+"""
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from pathlib import Path
+
+METRICS_DIR = os.getenv("METRICS_DIR")
+FLUSH_INTERVAL = float(os.getenv("METRICS_FLUSH_INTERVAL", "5"))
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_registry = {}
+_registry_lock = threading.Lock()
+
+
+class _Metric:
+    type = None
+
+    def __init__(self, name: str, help: str, labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._local = threading.local()
+        self._shards = []
+        self._shards_lock = threading.Lock()
+        with _registry_lock:
+            _registry[name] = self
+
+    def _shard(self) -> dict:
+        try:
+            return self._local.values
+        except AttributeError:
+            values = self._local.values = {}
+            with self._shards_lock:
+                self._shards.append(values)
+            return values
+
+    def _labels(self, labels: dict) -> tuple:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+
+class Counter(_Metric):
+    type = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        shard = self._shard()
+        key = self._labels(labels)
+        shard[key] = shard.get(key, 0) + amount
+
+    def collect(self) -> dict:
+        totals = {}
+        for shard in list(self._shards):
+            for key, value in list(shard.items()):
+                totals[key] = totals.get(key, 0) + value
+        return totals
+
+
+class Histogram(_Metric):
+    type = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, **labels):
+        shard = self._shard()
+        key = self._labels(labels)
+        series = shard.get(key)
+        if series is None:
+            # [count per bucket..., +Inf count, sum]
+            series = shard[key] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    @contextmanager
+    def time(self, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def collect(self) -> dict:
+        totals = {}
+        for shard in list(self._shards):
+            for key, series in list(shard.items()):
+                merged = totals.setdefault(key, [0] * len(series[:-1]) + [0.0])
+                for i, value in enumerate(series):
+                    merged[i] += value
+        return totals
+
+
+class Gauge(_Metric):
+    """Gauge whose value is read from a callback at scrape time.
+
+    The callback returns a number, or a dict mapping label tuples to numbers.
+    Several callbacks may feed one gauge (e.g. one per buffered writer).
+    """
+    type = "gauge"
+
+    def __init__(self, name: str, help: str, labelnames=()):
+        super().__init__(name, help, labelnames)
+        self._callbacks = []
+
+    def set_function(self, fn):
+        self._callbacks.append(fn)
+
+    def collect(self) -> dict:
+        totals = {}
+        for fn in list(self._callbacks):
+            try:
+                value = fn()
+            except Exception:
+                continue
+            if not isinstance(value, dict):
+                value = {(): value}
+            for key, number in value.items():
+                key = tuple(str(part) for part in key)
+                totals[key] = totals.get(key, 0) + number
+        return totals
+
+
+# ==================== METRICS ====================
+
+REQUESTS = Counter("http_requests_total", "HTTP requests by route and status", ("method", "route", "status"))
+REQUEST_LATENCY = Histogram("http_request_duration_seconds", "HTTP request latency", ("method", "route"))
+DB_POOL = Gauge("db_pool_connections", "Database pool connections by state", ("state",))
+CACHE_REQUESTS = Counter("cache_requests_total", "Cache lookups by cache and result", ("cache", "result"))
+FLUSH_BACKLOG = Gauge("counter_flush_backlog", "Buffered counter updates waiting to be flushed", ("writer",))
+STRIPE_LATENCY = Histogram("stripe_request_duration_seconds", "Stripe API call latency", ("operation",))
+
+
+def cache_hit(cache: str):
+    CACHE_REQUESTS.inc(cache=cache, result="hit")
+
+
+def cache_miss(cache: str):
+    CACHE_REQUESTS.inc(cache=cache, result="miss")
+
+
+def register_backlog(writer: str, fn):
+    """Report the number of pending items of a buffered writer."""
+    FLUSH_BACKLOG.set_function(lambda: {(writer,): fn()})
+
+
+def watch_pool(engine):
+    """Report checked-out, idle and overflow connections of the engine's pool."""
+    pool = engine.pool
+
+    def read():
+        values = {}
+        for state, method in (("checked_out", "checkedout"), ("idle", "checkedin"), ("overflow", "overflow"), ("size", "size")):
+            if hasattr(pool, method):
+                values[(state,)] = max(getattr(pool, method)(), 0)
+        return values
+
+    DB_POOL.set_function(read)
+
+
+# ==================== SNAPSHOTS ====================
+
+def snapshot() -> dict:
+    """This worker's current values, keyed by metric name."""
+    with _registry_lock:
+        metrics = list(_registry.values())
+    return {
+        "pid": os.getpid(),
+        "metrics": {
+            metric.name: [[list(key), value] for key, value in metric.collect().items()]
+            for metric in metrics
+        },
+    }
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def write_snapshot():
+    if not METRICS_DIR:
+        return
+    directory = Path(METRICS_DIR)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"worker-{os.getpid()}.json"
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(snapshot()))
+    os.replace(tmp, path)
+
+
+def _flush_loop():
+    while True:
+        time.sleep(FLUSH_INTERVAL)
+        try:
+            write_snapshot()
+        except OSError:
+            pass
+
+
+_flusher = None
+
+
+def start_flusher():
+    """Start writing this worker's snapshot to METRICS_DIR in the background."""
+    global _flusher
+    if METRICS_DIR and _flusher is None:
+        _flusher = threading.Thread(target=_flush_loop, name="metrics-flush", daemon=True)
+        _flusher.start()
+
+
+def collect_all() -> dict:
+    """Merge the snapshots of all workers (or just this one).
+
+    Counters and histograms of exited workers are kept so totals stay
+    monotonic; their gauges are dropped.
+    """
+    if not METRICS_DIR:
+        snapshots = [snapshot()]
+    else:
+        write_snapshot()
+        snapshots = []
+        for path in Path(METRICS_DIR).glob("worker-*.json"):
+            try:
+                snapshots.append(json.loads(path.read_text()))
+            except (OSError, ValueError):
+                continue
+
+    merged = {}
+    for snap in snapshots:
+        alive = snap["pid"] == os.getpid() or _pid_alive(snap["pid"])
+        for name, series in snap["metrics"].items():
+            metric = _registry.get(name)
+            if metric is None or (metric.type == "gauge" and not alive):
+                continue
+            totals = merged.setdefault(name, {})
+            for key, value in series:
+                key = tuple(key)
+                if isinstance(value, list):
+                    current = totals.setdefault(key, [0] * len(value))
+                    totals[key] = [a + b for a, b in zip(current, value)]
+                else:
+                    totals[key] = totals.get(key, 0) + value
+    return merged
+
+
+# ==================== EXPOSITION ====================
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names, values, extra=()) -> str:
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def series(merged: dict = None) -> dict:
+    """Merged metrics as {name: [{"labels": {...}, "value": ...}]}, for JSON."""
+    merged = collect_all() if merged is None else merged
+    return {
+        name: [
+            {"labels": dict(zip(_registry[name].labelnames, key)), "value": value}
+            for key, value in sorted(values.items())
+        ]
+        for name, values in merged.items()
+    }
+
+
+def render(merged: dict = None) -> str:
+    """Render metrics in the Prometheus text exposition format."""
+    merged = collect_all() if merged is None else merged
+    lines = []
+    for name in sorted(merged):
+        metric = _registry[name]
+        lines.append(f"# HELP {name} {metric.help}")
+        lines.append(f"# TYPE {name} {metric.type}")
+        for key, value in sorted(merged[name].items()):
+            if metric.type == "histogram":
+                cumulative = 0
+                for bound, count in zip(list(metric.buckets) + ["+Inf"], value[:-1]):
+                    cumulative += count
+                    labels = _format_labels(metric.labelnames, key, [("le", bound)])
+                    lines.append(f"{name}_bucket{labels} {cumulative}")
+                labels = _format_labels(metric.labelnames, key)
+                lines.append(f"{name}_sum{labels} {value[-1]}")
+                lines.append(f"{name}_count{labels} {cumulative}")
+            else:
+                lines.append(f"{name}{_format_labels(metric.labelnames, key)} {value}")
+
+    # Hit ratio derived from the merged cache counters
+    cache = merged.get(CACHE_REQUESTS.name, {})
+    caches = sorted({key[0] for key in cache})
+    if caches:
+        lines.append("# HELP cache_hit_ratio Share of cache lookups that were hits")
+        lines.append("# TYPE cache_hit_ratio gauge")
+        for name in caches:
+            hits = cache.get((name, "hit"), 0)
+            total = hits + cache.get((name, "miss"), 0)
+            lines.append(f'cache_hit_ratio{{cache="{name}"}} {hits / total if total else 0}')
+    return "\n".join(lines) + "\n"
+
+
+# ==================== MIDDLEWARE ====================
+
+class MetricsMiddleware:
+    """Record request counts and latency per route template."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            # Unmatched paths share one label so scanners can't blow up cardinality
+            route_label = getattr(route, "path", None) or "unmatched"
+            REQUESTS.inc(method=scope["method"], route=route_label, status=status_code)
+            REQUEST_LATENCY.observe(time.perf_counter() - started, method=scope["method"], route=route_label)
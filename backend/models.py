@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Enum, DECIMAL
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Enum, DECIMAL, Index
 from sqlalchemy.orm import relationship
 from database import Base
 from datetime import datetime
@@ -102,6 +102,13 @@ class TeacherLocation(Base):
 
 class Advertisement(Base):
     __tablename__ = "advertisements"
+    __table_args__ = (
+        # A teacher's active ads: WHERE teacher_id = ? AND status = 'active'
+        Index("ix_advertisements_teacher_status", "teacher_id", "status"),
+        # Archived ads keep their ids, so ids must never be handed out again
+        # (MySQL needs 8.0+, which persists the AUTO_INCREMENT counter across restarts)
+        {"sqlite_autoincrement": True},
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     teacher_id = Column(Integer, ForeignKey("users.id"))
@@ -123,6 +130,11 @@ class Advertisement(Base):
 
 class ContactMessage(Base):
     __tablename__ = "contact_messages"
+    __table_args__ = (
+        # Inbox pages: WHERE recipient_id = ? ORDER BY created_at DESC, id DESC
+        Index("ix_contact_messages_inbox", "recipient_id", "created_at", "id"),
+        {"sqlite_autoincrement": True},  # archived messages keep their ids, see Advertisement
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     sender_id = Column(Integer, ForeignKey("users.id"), nullable=True)
@@ -133,7 +145,7 @@ class ContactMessage(Base):
     phone = Column(String(20), nullable=True)
     message = Column(Text, nullable=False)
     is_read = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
     
     sender = relationship("User", foreign_keys=[sender_id])
     recipient = relationship("User", foreign_keys=[recipient_id])
@@ -148,9 +160,143 @@ class Payment(Base):
     currency = Column(String(3), default="HUF")
     payment_type = Column(String(50), nullable=False)  # subscription, featured_ad, commission
     status = Column(String(50), default="pending")  # pending, completed, failed, refunded
-    stripe_payment_intent_id = Column(String(255), nullable=True)
+    stripe_payment_intent_id = Column(String(255), nullable=True, index=True)
     description = Column(String(255), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     completed_at = Column(DateTime, nullable=True)
     
     user = relationship("User")
+
+class ArchivedAdvertisement(Base):
+    __tablename__ = "advertisements_archive"
+    
+    # Same ids and columns as advertisements, so rows can be restored as they were
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    teacher_id = Column(Integer, index=True)
+    title = Column(String(200), nullable=False)
+    short_description = Column(String(500), nullable=False)
+    long_description = Column(Text, nullable=True)
+    instrument_id = Column(Integer)
+    location_id = Column(Integer)
+    status = Column(Enum(AdStatus))
+    featured = Column(Boolean, default=False)
+    views = Column(Integer, default=0)
+    contacts = Column(Integer, default=0)
+    created_at = Column(DateTime)
+    expires_at = Column(DateTime, nullable=True)
+    archived_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+class ArchivedContactMessage(Base):
+    __tablename__ = "contact_messages_archive"
+    
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    sender_id = Column(Integer, nullable=True)
+    recipient_id = Column(Integer, index=True)
+    advertisement_id = Column(Integer, nullable=True)
+    name = Column(String(100), nullable=False)
+    email = Column(String(255), nullable=False)
+    phone = Column(String(20), nullable=True)
+    message = Column(Text, nullable=False)
+    is_read = Column(Boolean, default=False)
+    created_at = Column(DateTime)
+    archived_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+class EngagementEvent(Base):
+    __tablename__ = "engagement_events"
+    
+    # Append-only; ad dimensions are copied so rollups never need a join
+    id = Column(Integer, primary_key=True)
+    event_type = Column(String(20), nullable=False)  # view, contact, impression
+    advertisement_id = Column(Integer, nullable=False, index=True)
+    teacher_id = Column(Integer, nullable=True)
+    instrument_id = Column(Integer, nullable=True)
+    city = Column(String(100), nullable=True)
+    occurred_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+class AdStatsRollup(Base):
+    __tablename__ = "ad_stats_rollups"
+    
+    granularity = Column(String(5), primary_key=True)  # hour, day
+    advertisement_id = Column(Integer, primary_key=True)
+    bucket = Column(DateTime, primary_key=True)
+    views = Column(Integer, nullable=False, default=0)
+    contacts = Column(Integer, nullable=False, default=0)
+    impressions = Column(Integer, nullable=False, default=0)
+
+class SegmentStatsRollup(Base):
+    __tablename__ = "segment_stats_rollups"
+    
+    # instrument_id 0 / city "" hold events of ads without one
+    granularity = Column(String(5), primary_key=True)
+    instrument_id = Column(Integer, primary_key=True)
+    city = Column(String(100), primary_key=True)
+    bucket = Column(DateTime, primary_key=True)
+    views = Column(Integer, nullable=False, default=0)
+    contacts = Column(Integer, nullable=False, default=0)
+    impressions = Column(Integer, nullable=False, default=0)
+
+class InboxCounter(Base):
+    __tablename__ = "inbox_counters"
+    
+    user_id = Column(Integer, primary_key=True)
+    unread = Column(Integer, nullable=False, default=0)
+
+class Job(Base):
+    __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_status_priority_run_at", "status", "priority", "run_at"),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    kind = Column(String(50), nullable=False)
+    payload = Column(Text, nullable=False, default="{}")  # JSON
+    priority = Column(Integer, nullable=False, default=100)  # lower runs first
+    status = Column(String(20), nullable=False, default="queued")  # queued, running, done, dead
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=5)
+    run_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    locked_by = Column(String(100), nullable=True)
+    locked_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
+
+class TeacherPhoto(Base):
+    __tablename__ = "teacher_photos"
+    
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    original = Column(String(80), nullable=False)  # stored file name of the upload
+    width = Column(Integer, nullable=False)
+    height = Column(Integer, nullable=False)
+    status = Column(String(20), nullable=False, default="processing")  # processing, ready, failed
+    variants = Column(Text, nullable=True)  # JSON list of {format, width, height, digest}
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+class EntityVersion(Base):
+    __tablename__ = "entity_versions"
+    
+    scope = Column(String(100), primary_key=True)  # e.g. "ad:12", "teacher:3", "instruments"
+    version = Column(Integer, nullable=False, default=1)
+
+class OutboxEvent(Base):
+    __tablename__ = "outbox_events"
+    __table_args__ = {"sqlite_autoincrement": True}  # never reuse ids once pruned
+    
+    id = Column(Integer, primary_key=True)  # delivered in id order by outbox.py
+    entity = Column(String(20), nullable=False)  # ad, user, teacher, instrument, location, catalog
+    entity_id = Column(Integer, nullable=True)
+    op = Column(String(10), nullable=False)  # insert, update, delete
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+class FixtureDataset(Base):
+    __tablename__ = "fixture_datasets"
+    
+    name = Column(String(100), primary_key=True)  # file stem under datasets/, e.g. "reference"
+    version = Column(Integer, nullable=False)
+    checksum = Column(String(64), nullable=False)  # sha256 of the parsed dataset
+    rows = Column(Integer, nullable=False, default=0)
+    loaded_at = Column(DateTime, default=datetime.utcnow)
+
+# Registers the flush hooks that bump EntityVersion rows
+import versions  # noqa: E402,F401
@@ -0,0 +1,107 @@
+"""E-mail notifications, sent from background jobs.
+
+Mail goes out over SMTP when SMTP_HOST is set; otherwise messages are only
+logged, which is what development and tests use.
+"""
+import logging
+import os
+import smtplib
+from email.message import EmailMessage
+
+from models import User, Advertisement, ContactMessage, Payment
+from jobs import handler
+
+logger = logging.getLogger("notifications")
+
+SMTP_HOST = os.getenv("SMTP_HOST")
+SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
+SMTP_USER = os.getenv("SMTP_USER")
+SMTP_PASSWORD = os.getenv("SMTP_PASSWORD")
+MAIL_FROM = os.getenv("MAIL_FROM", "ZeneTanár.hu <noreply@zenetanar.hu>")
+SITE_URL = os.getenv("SITE_URL", "http://localhost:5173")
+
+# Messages "sent" without SMTP, newest last (kept short for inspection in dev)
+outbox = []
+
+
+def send_mail(to: str, subject: str, body: str):
+    """Send one e-mail; raises on SMTP errors so the job is retried."""
+    if not SMTP_HOST:
+        logger.info("Mail to %s: %s", to, subject)
+        outbox.append({"to": to, "subject": subject, "body": body})
+        del outbox[:-100]
+        return
+    message = EmailMessage()
+    message["From"] = MAIL_FROM
+    message["To"] = to
+    message["Subject"] = subject
+    message.set_content(body)
+    with smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=30) as smtp:
+        smtp.starttls()
+        if SMTP_USER:
+            smtp.login(SMTP_USER, SMTP_PASSWORD)
+        smtp.send_message(message)
+
+
+# ==================== JOB HANDLERS ====================
+
+@handler("contact.notify_teacher")
+def notify_teacher(db, payload):
+    """Tell a teacher about a new contact message."""
+    message = db.get(ContactMessage, payload["message_id"])
+    if message is None or message.recipient is None:
+        return
+    about = f" a(z) „{message.advertisement.title}” hirdetésére" if message.advertisement else ""
+    send_mail(
+        message.recipient.email,
+        f"Új üzenet érkezett: {message.name}",
+        f"Kedves {message.recipient.first_name}!\n\n"
+        f"{message.name} ({message.email}) üzenetet küldött{about}:\n\n"
+        f"{message.message}\n\n"
+        f"Az üzeneteidet itt éred el: {SITE_URL}/profile\n",
+    )
+
+
+@handler("user.welcome")
+def welcome(db, payload):
+    user = db.get(User, payload["user_id"])
+    if user is None:
+        return
+    send_mail(
+        user.email,
+        "Üdvözlünk a ZeneTanár.hu oldalon!",
+        f"Kedves {user.first_name}!\n\nKöszönjük a regisztrációt. "
+        f"A profilodat itt állíthatod be: {SITE_URL}/profile\n",
+    )
+
+
+@handler("payment.receipt")
+def payment_receipt(db, payload):
+    payment = db.get(Payment, payload["payment_id"])
+    if payment is None or payment.user is None:
+        return
+    send_mail(
+        payment.user.email,
+        "Sikeres fizetés",
+        f"Kedves {payment.user.first_name}!\n\n"
+        f"Megkaptuk a {payment.amount:.0f} {payment.currency} összegű befizetésedet"
+        f"{f' ({payment.description})' if payment.description else ''}.\n"
+        f"Azonosító: {payment.stripe_payment_intent_id}\n",
+    )
+
+
+@handler("ad.moderated")
+def ad_moderated(db, payload):
+    """Tell a teacher that their ad was approved or rejected."""
+    ad = db.get(Advertisement, payload["ad_id"])
+    if ad is None or ad.teacher is None:
+        return
+    if payload["action"] == "approve":
+        subject = "Hirdetésed megjelent"
+        text = f"A(z) „{ad.title}” hirdetésedet jóváhagytuk, mostantól megjelenik a keresésben."
+    else:
+        subject = "Hirdetésed nem jelent meg"
+        text = f"A(z) „{ad.title}” hirdetésedet nem hagytuk jóvá."
+        if payload.get("reason"):
+            text += f"\nIndoklás: {payload['reason']}"
+    send_mail(ad.teacher.email, subject, f"Kedves {ad.teacher.first_name}!\n\n{text}\n")
@@ -0,0 +1,254 @@
+"""Transactional outbox of entity changes.
+
+The flush hook in versions.py appends one `outbox_events` row per changed
+ad, user, teacher (profile, instrument/location links and photos),
+instrument and location, in the same transaction as the change, so an
+event exists exactly when its change committed, whichever script or
+endpoint wrote it. Bulk Core writes get theirs from versions.touch, which
+they already call to invalidate caches; their op is always "update".
+
+Every API process runs a dispatcher that reads new events in id order and
+hands them in batches to the subscribers registered with subscribe().
+All processes read the same table, so each worker's subscribers see every
+change in the same order. Committing a flush with events also publishes an
+"outbox" ping (through the pubsub broker, across workers), so dispatchers
+poll at once instead of after OUTBOX_INTERVAL.
+
+Ids are allocated at insert, so a transaction may commit after one with a
+higher id: a missing id holds delivery back for up to OUTBOX_GAP_TIMEOUT
+seconds before it is taken as rolled back. Every API process's dispatcher
+thread prunes events older than OUTBOX_RETENTION seconds, and runs for
+that even when nothing subscribed. A dispatcher that falls behind that far
+resets its subscribers, as does a subscriber that raises. Subscribers therefore
+treat events as "re-read this entity" and must be able to rebuild.
+"""
+import logging
+import os
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, func, insert, select
+
+from database import SessionLocal
+from models import (
+    User, TeacherProfile, TeacherPhoto, Advertisement, Instrument, Location, OutboxEvent, UserRole
+)
+import pubsub
+
+logger = logging.getLogger("outbox")
+
+OUTBOX_ENABLED = os.getenv("OUTBOX_ENABLED", "1") == "1"
+OUTBOX_INTERVAL = float(os.getenv("OUTBOX_INTERVAL", "1"))
+OUTBOX_GAP_TIMEOUT = float(os.getenv("OUTBOX_GAP_TIMEOUT", "5"))
+OUTBOX_RETENTION = float(os.getenv("OUTBOX_RETENTION", "3600"))
+OUTBOX_BATCH = 1000
+PRUNE_INTERVAL = 300
+
+CHANNEL = "outbox"
+
+Event = namedtuple("Event", "id entity entity_id op created_at")
+Subscription = namedtuple("Subscription", "name handler entities on_reset")
+
+
+# ==================== RECORDING ====================
+
+def events_for(obj, op: str) -> list:
+    """(entity, id, op) for one flushed object; teacher links are resolved by the caller."""
+    if isinstance(obj, Advertisement):
+        return [("ad", obj.id, op), ("teacher", obj.teacher_id, "update")]
+    if isinstance(obj, User):
+        events = [("user", obj.id, op)]
+        if obj.role == UserRole.TEACHER:
+            events.append(("teacher", obj.id, op))
+        return events
+    if isinstance(obj, (TeacherProfile, TeacherPhoto)):
+        return [("teacher", obj.user_id, "update")]
+    if isinstance(obj, Instrument):
+        return [("instrument", obj.id, op)]
+    if isinstance(obj, Location):
+        return [("location", obj.id, op)]
+    return []
+
+
+def scope_events(scopes) -> list:
+    """Events for the entities behind version scopes (see versions.py)."""
+    events = []
+    for scope in sorted(scopes):
+        kind, _, entity_id = scope.partition(":")
+        if kind in ("ad", "user", "teacher") and entity_id.isdigit():
+            events.append((kind, int(entity_id), "update"))
+        elif scope in ("instruments", "locations"):
+            events.append((scope[:-1], None, "update"))
+    if not events and "catalog" in scopes:
+        events.append(("catalog", None, "update"))
+    return events
+
+
+def record(connection, events, session=None):
+    """Append events to the outbox in the connection's transaction.
+
+    Pass the session to wake every dispatcher once it commits.
+    """
+    if not OUTBOX_ENABLED:
+        return
+    rows = [
+        {"entity": entity, "entity_id": entity_id, "op": op}
+        for entity, entity_id, op in dict.fromkeys(events)
+        if entity_id is not None or entity in ("instrument", "location", "catalog")
+    ]
+    if not rows:
+        return
+    connection.execute(insert(OutboxEvent.__table__), rows)
+    if session is not None:
+        pubsub.publish_after_commit(session, CHANNEL, {"type": "outbox"})
+
+
+def prune(db, retention: float = OUTBOX_RETENTION) -> int:
+    """Delete events older than the retention."""
+    cutoff = datetime.utcnow() - timedelta(seconds=retention)
+    return db.execute(delete(OutboxEvent).where(OutboxEvent.created_at < cutoff)).rowcount
+
+
+# ==================== DISPATCHER ====================
+
+class Dispatcher:
+    """Delivers the outbox to this process's subscribers, in order."""
+
+    def __init__(self):
+        self._subscriptions = []
+        self._position = None  # every event up to this id was delivered or given up
+        self._gap = None  # (first missing id, monotonic time it was first seen)
+        self._polled_at = 0.0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def subscribe(self, name: str, handler, entities=None, on_reset=None):
+        """Call handler(db, events) with each batch of new events.
+
+        `entities` limits the batches to those entity kinds; on_reset() is
+        called when events may have been missed and state must be rebuilt.
+        """
+        self._subscriptions.append(Subscription(name, handler, frozenset(entities or ()), on_reset))
+
+    @property
+    def position(self):
+        return self._position
+
+    def caught_up(self, db) -> bool:
+        """Whether every event committed so far was delivered."""
+        if self._position is None:
+            return False
+        return self._position >= (db.scalar(select(func.max(OutboxEvent.id))) or 0)
+
+    def _reset(self, subscriptions):
+        for subscription in subscriptions:
+            if subscription.on_reset is not None:
+                try:
+                    subscription.on_reset()
+                except Exception:
+                    logger.exception("Resetting %s failed", subscription.name)
+
+    def _deliver(self, db, events):
+        for subscription in self._subscriptions:
+            batch = [e for e in events if not subscription.entities or e.entity in subscription.entities]
+            if not batch:
+                continue
+            try:
+                subscription.handler(db, batch)
+            except Exception:
+                logger.exception("Outbox subscriber %s failed, resetting it", subscription.name)
+                self._reset([subscription])
+
+    def poll(self, db, blocking: bool = True) -> int:
+        """Deliver the events committed since the last poll; returns how many."""
+        if not self._lock.acquire(blocking=blocking):
+            return 0
+        try:
+            now = time.monotonic()
+            if self._position is None or now - self._polled_at > OUTBOX_RETENTION / 2:
+                # Start from the newest event; anything older is already in the database
+                self._position = db.scalar(select(func.max(OutboxEvent.id))) or 0
+                self._gap = None
+                self._polled_at = now
+                self._reset(self._subscriptions)
+                return 0
+
+            rows = db.execute(
+                select(OutboxEvent.id, OutboxEvent.entity, OutboxEvent.entity_id, OutboxEvent.op, OutboxEvent.created_at)
+                .where(OutboxEvent.id > self._position).order_by(OutboxEvent.id).limit(OUTBOX_BATCH)
+            ).all()
+            ready = []
+            expected = self._position + 1
+            for row in rows:
+                if row.id > expected:
+                    # An id below a committed one: its transaction may still be in flight
+                    if self._gap is None or self._gap[0] != expected:
+                        self._gap = (expected, now)
+                    if now - self._gap[1] < OUTBOX_GAP_TIMEOUT:
+                        break
+                    self._gap = None
+                ready.append(Event(*row))
+                expected = row.id + 1
+            if ready:
+                self._deliver(db, ready)
+                self._position = ready[-1].id
+            self._polled_at = now
+            return len(ready)
+        finally:
+            self._lock.release()
+
+    def _run(self):
+        next_prune = time.monotonic()
+        while not self._stop.is_set():
+            self._wake.clear()
+            db = SessionLocal()
+            try:
+                while self._subscriptions and self.poll(db) == OUTBOX_BATCH:
+                    db.rollback()
+                if time.monotonic() >= next_prune:
+                    db.rollback()
+                    prune(db)
+                    db.commit()
+                    next_prune = time.monotonic() + PRUNE_INTERVAL
+            except Exception:
+                logger.exception("Outbox dispatch failed")
+            finally:
+                db.close()
+            if not self._subscriptions:
+                self._wake.wait(PRUNE_INTERVAL)
+                continue
+            # A gap is retried sooner than the regular poll
+            self._wake.wait(min(OUTBOX_INTERVAL, OUTBOX_GAP_TIMEOUT / 5) if self._gap else OUTBOX_INTERVAL)
+
+    def start(self):
+        """Dispatch and prune in the background.
+
+        Runs even without subscribers, since scripts and other workers keep
+        recording events that only this thread prunes.
+        """
+        if not OUTBOX_ENABLED or self._thread is not None:
+            return
+        if self._subscriptions:
+            pubsub.listen(CHANNEL, lambda event: self._wake.set())
+        self._thread = threading.Thread(target=self._run, name="outbox", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def status(self) -> dict:
+        return {
+            "enabled": OUTBOX_ENABLED,
+            "position": self._position,
+            "waiting_for": self._gap[0] if self._gap else None,
+            "subscribers": [subscription.name for subscription in self._subscriptions],
+        }
+
+
+dispatcher = Dispatcher()
+subscribe = dispatcher.subscribe
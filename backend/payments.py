@@ -0,0 +1,242 @@
+"""Asynchronous Stripe client and payment state transitions.
+
+Stripe is called over its REST API with a shared httpx.AsyncClient, so a
+request waiting on Stripe holds neither a worker thread nor a database
+connection. Calls time out after STRIPE_TIMEOUT seconds and are retried with
+exponential backoff on network errors, 409, 429 and 5xx responses. Every POST
+carries an Idempotency-Key, reused across retries, so a retried create never
+produces a second PaymentIntent.
+
+Payment state is driven by the signed webhook (`/api/payments/webhook`);
+`/api/payments/confirm` stays as a fallback that reads the intent once.
+Point STRIPE_API_BASE at fake_stripe.py for local development and tests.
+"""
+import asyncio
+import hashlib
+import hmac
+import os
+import random
+import time
+from datetime import datetime, timedelta
+from urllib.parse import urlencode
+
+import httpx
+
+from models import Payment, TeacherProfile, SubscriptionType
+import metrics
+import jobs
+import dashboard
+
+STRIPE_API_BASE = os.getenv("STRIPE_API_BASE", "https://api.stripe.com")
+STRIPE_SECRET_KEY = os.getenv("STRIPE_SECRET_KEY", "sk_test_dummy")
+STRIPE_WEBHOOK_SECRET = os.getenv("STRIPE_WEBHOOK_SECRET", "")
+STRIPE_TIMEOUT = float(os.getenv("STRIPE_TIMEOUT", "10"))
+STRIPE_MAX_RETRIES = int(os.getenv("STRIPE_MAX_RETRIES", "2"))
+
+# Seconds a webhook timestamp may differ from our clock
+WEBHOOK_TOLERANCE = 300
+
+RETRY_STATUSES = {409, 429, 500, 502, 503, 504}
+
+
+class StripeError(Exception):
+    def __init__(self, message: str, status_code: int = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class WebhookSignatureError(Exception):
+    pass
+
+
+def _encode(data: dict, prefix: str = "") -> list:
+    """Flatten nested dicts into Stripe's form encoding (metadata[key]=value)."""
+    pairs = []
+    for key, value in data.items():
+        name = f"{prefix}[{key}]" if prefix else key
+        if isinstance(value, dict):
+            pairs.extend(_encode(value, name))
+        elif value is not None:
+            pairs.append((name, str(value)))
+    return pairs
+
+
+class StripeClient:
+    def __init__(self, api_base: str = STRIPE_API_BASE, api_key: str = STRIPE_SECRET_KEY,
+                 timeout: float = STRIPE_TIMEOUT, max_retries: int = STRIPE_MAX_RETRIES):
+        self.api_base = api_base.rstrip("/")
+        self.api_key = api_key
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self._client = None
+        self._loop = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # Pooled connections belong to the event loop that opened them
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            self._loop = loop
+            self._client = httpx.AsyncClient(
+                base_url=self.api_base,
+                timeout=self.timeout,
+                auth=(self.api_key, ""),
+                headers={"Stripe-Version": "2023-10-16"},
+            )
+        return self._client
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def request(self, method: str, path: str, data: dict = None,
+                      idempotency_key: str = None, operation: str = None) -> dict:
+        headers = {"Idempotency-Key": idempotency_key} if idempotency_key else {}
+        body = None
+        if data:
+            body = urlencode(_encode(data))
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+        attempt = 0
+        while True:
+            try:
+                with metrics.STRIPE_LATENCY.time(operation=operation or path):
+                    response = await self.client.request(method, path, content=body, headers=headers)
+            except httpx.TransportError as e:
+                if attempt >= self.max_retries:
+                    raise StripeError(f"Stripe request failed: {e}") from e
+            else:
+                should_retry = response.headers.get("stripe-should-retry")
+                retry = (
+                    should_retry == "true"
+                    or (should_retry != "false" and response.status_code in RETRY_STATUSES)
+                )
+                if response.status_code < 400:
+                    return response.json()
+                if not retry or attempt >= self.max_retries:
+                    try:
+                        message = response.json()["error"]["message"]
+                    except (ValueError, KeyError, TypeError):
+                        message = response.text or f"HTTP {response.status_code}"
+                    raise StripeError(message, response.status_code)
+            # 0.5s, 1s, 2s ... with jitter
+            await asyncio.sleep(0.5 * 2 ** attempt * random.uniform(0.75, 1.25))
+            attempt += 1
+
+    async def create_payment_intent(self, amount: int, currency: str, metadata: dict,
+                                    idempotency_key: str) -> dict:
+        return await self.request(
+            "POST", "/v1/payment_intents",
+            {"amount": amount, "currency": currency, "metadata": metadata},
+            idempotency_key=idempotency_key, operation="PaymentIntent.create",
+        )
+
+    async def retrieve_payment_intent(self, intent_id: str) -> dict:
+        return await self.request(
+            "GET", f"/v1/payment_intents/{intent_id}", operation="PaymentIntent.retrieve"
+        )
+
+
+stripe_client = StripeClient()
+
+
+# ==================== WEBHOOKS ====================
+
+def sign_payload(payload: bytes, secret: str, timestamp: int = None) -> str:
+    """Stripe-Signature header value for a payload (used by the fake server)."""
+    timestamp = int(time.time()) if timestamp is None else timestamp
+    signature = hmac.new(secret.encode(), f"{timestamp}.".encode() + payload, hashlib.sha256).hexdigest()
+    return f"t={timestamp},v1={signature}"
+
+
+def verify_signature(payload: bytes, header: str, secret: str = None, tolerance: int = WEBHOOK_TOLERANCE):
+    """Check a Stripe-Signature header against the raw request body."""
+    secret = STRIPE_WEBHOOK_SECRET if secret is None else secret
+    if not secret:
+        raise WebhookSignatureError("Webhook secret is not configured")
+    timestamp, signatures = None, []
+    for part in (header or "").split(","):
+        key, _, value = part.strip().partition("=")
+        if key == "t":
+            timestamp = value
+        elif key == "v1":
+            signatures.append(value)
+    if not timestamp or not timestamp.isdigit() or not signatures:
+        raise WebhookSignatureError("Malformed signature header")
+    if abs(time.time() - int(timestamp)) > tolerance:
+        raise WebhookSignatureError("Timestamp outside the tolerance zone")
+    expected = hmac.new(secret.encode(), f"{timestamp}.".encode() + payload, hashlib.sha256).hexdigest()
+    if not any(hmac.compare_digest(expected, signature) for signature in signatures):
+        raise WebhookSignatureError("No matching signature")
+
+
+# ==================== STATE TRANSITIONS ====================
+
+# Stripe intent status -> our payment status
+INTENT_STATUSES = {
+    "succeeded": "completed",
+    "canceled": "failed",
+}
+
+# Allowed transitions; a failed payment can still complete when the customer retries
+TRANSITIONS = {
+    "pending": {"completed", "failed"},
+    "failed": {"completed"},
+    "completed": {"refunded"},
+    "refunded": set(),
+}
+
+
+def payment_status_for(intent: dict) -> str:
+    """Our status for a PaymentIntent; `pending` while the customer is still paying."""
+    if intent.get("status") == "requires_payment_method" and intent.get("last_payment_error"):
+        return "failed"
+    return INTENT_STATUSES.get(intent.get("status"), "pending")
+
+
+def apply_status(db, payment: Payment, new_status: str) -> bool:
+    """Move a payment to `new_status` if the transition is allowed.
+
+    Completing a subscription payment upgrades the teacher to premium. Runs
+    at most once per payment, so repeated webhooks and confirms are harmless.
+    Returns whether anything changed; the caller commits.
+    """
+    if new_status == payment.status or new_status not in TRANSITIONS.get(payment.status, set()):
+        return False
+    old_status = payment.status
+    payment.status = new_status
+    if new_status == "completed":
+        payment.completed_at = datetime.utcnow()
+        if payment.payment_type == "subscription":
+            profile = db.query(TeacherProfile).filter(TeacherProfile.user_id == payment.user_id).first()
+            if profile:
+                profile.subscription_type = SubscriptionType.PREMIUM
+                profile.subscription_expires = datetime.utcnow() + timedelta(days=30)
+        jobs.enqueue(db, "payment.receipt", {"payment_id": payment.id})
+    dashboard.payment_status_changed(db, payment, old_status)
+    return True
+
+
+WEBHOOK_EVENTS = {
+    "payment_intent.succeeded": "completed",
+    "payment_intent.payment_failed": "failed",
+    "payment_intent.canceled": "failed",
+    "charge.refunded": "refunded",
+}
+
+
+def handle_event(db, event: dict) -> bool:
+    """Apply a webhook event to its payment. Returns whether anything changed."""
+    new_status = WEBHOOK_EVENTS.get(event.get("type"))
+    if new_status is None:
+        return False
+    obj = event.get("data", {}).get("object", {})
+    intent_id = obj.get("payment_intent") if obj.get("object") == "charge" else obj.get("id")
+    if not intent_id:
+        return False
+    payment = db.query(Payment).filter(Payment.stripe_payment_intent_id == intent_id).first()
+    if payment is None:
+        return False
+    changed = apply_status(db, payment, new_status)
+    db.commit()
+    return changed
@@ -0,0 +1,407 @@
+"""Prerendered landing pages.
+
+The home page and one landing page per city (/varos/<city>) and instrument
+(/hangszer/<instrument>) are rendered into static HTML snapshots of the
+built index.html with:
+
+* the data their sections would otherwise fetch on load inlined as
+  window.__INITIAL_DATA__ (featured teachers, cities, instruments and, on
+  city/instrument pages, the first page of matching ads), so the app
+  renders without waiting for API round trips
+* a page title and description, and a plain HTML version of that data in
+  #root for crawlers and for the first paint before the bundle runs
+
+Snapshots are kept in memory (with precompressed variants) and on disk
+under PRERENDER_DIR, and served by static_site without touching the
+database. The prerenderer is an outbox subscriber (outbox.py): every
+PRERENDER_INTERVAL seconds a background thread re-renders the city and
+instrument pages whose search matches an ad that changed, before or after
+the change, and the home page when a teacher changed. New builds,
+instrument and location changes, bulk writes without ids and outbox
+resets render every page again. Only the snapshots whose HTML differs are
+rewritten. Without the outbox, the thread checks the catalog version and
+renders every page when it changed.
+
+Build all snapshots once, e.g. at deploy time:
+    python prerender.py build [--force]
+"""
+import argparse
+import hashlib
+import html
+import json
+import logging
+import os
+import re
+import threading
+import unicodedata
+from pathlib import Path
+
+from sqlalchemy import or_, select
+
+from database import SessionLocal, engine, Base
+from models import Advertisement, AdStatus, Instrument, Location
+from serializers import dumps, serialize_instrument
+import catalog
+import listings
+import outbox
+import static_site
+import versions
+
+logger = logging.getLogger("prerender")
+
+PRERENDER_ENABLED = os.getenv("PRERENDER_ENABLED", "1") == "1"
+PRERENDER_DIR = Path(os.getenv("PRERENDER_DIR", Path(__file__).resolve().parent / "prerendered"))
+PRERENDER_INTERVAL = float(os.getenv("PRERENDER_INTERVAL", "5"))
+TEMPLATE = static_site.STATIC_DIR / "index.html"
+
+SITE_NAME = "ZeneTanár.hu"
+# Same requests the sections make: /api/teachers/featured?limit=6, 12 ads per search page
+FEATURED_LIMIT = 6
+PER_PAGE = 12
+
+MANIFEST = "manifest.json"
+
+
+def slugify(name: str) -> str:
+    """ASCII file name for a city or instrument ("Pécs" -> "pecs")."""
+    ascii_name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode()
+    return re.sub(r"[^a-z0-9]+", "-", ascii_name.lower()).strip("-") or "page"
+
+
+def _script_json(data) -> str:
+    """JSON that is safe inside an inline <script>."""
+    text = dumps(data).decode()
+    for char, escaped in (("<", "\\u003c"), (">", "\\u003e"), ("&", "\\u0026"),
+                          ("\u2028", "\\u2028"), ("\u2029", "\\u2029")):
+        text = text.replace(char, escaped)
+    return text
+
+
+# ==================== RENDERING ====================
+
+def page_specs(cities, instruments):
+    """(path, file stem, title, kind, name) of every prerendered page."""
+    yield "/", "index", None, "home", None
+    for city in cities:
+        yield f"/varos/{city}", f"varos/{slugify(city)}", f"Zenetanárok – {city}", "city", city
+    for instrument in instruments:
+        name = instrument["name_hu"]
+        yield f"/hangszer/{name}", f"hangszer/{slugify(name)}", f"{name}tanárok", "instrument", name
+
+
+def _teacher_items(featured) -> str:
+    items = []
+    for teacher in featured:
+        details = ", ".join(teacher["instruments"] + teacher["locations"])
+        items.append(
+            f"<li><strong>{html.escape(teacher['first_name'])} {html.escape(teacher['last_name'])}</strong>"
+            f"{' – ' + html.escape(details) if details else ''}</li>"
+        )
+    return "".join(items)
+
+
+def _ad_items(result) -> str:
+    items = []
+    for ad in result["advertisements"]:
+        teacher = f"{ad['teacher']['first_name']} {ad['teacher']['last_name']}"
+        items.append(
+            f"<li><h2>{html.escape(ad['title'])}</h2><p>{html.escape(ad['short_description'] or '')}</p>"
+            f"<p>{html.escape(teacher)} · {html.escape(ad['instrument']['name_hu'])} · "
+            f"{html.escape(ad['location']['city'])}</p></li>"
+        )
+    return "".join(items)
+
+
+def _links(prefix: str, names) -> str:
+    return "".join(
+        f'<li><a href="{prefix}/{html.escape(name)}">{html.escape(name)}</a></li>' for name in names
+    )
+
+
+def render_page(template: str, title, description: str, body: str, data: dict) -> str:
+    """index.html with the page's title, description, inline data and body."""
+    # Vite emits "./assets/..." URLs, which would resolve below /varos/
+    page = re.sub(r'(src|href)="\./', r'\1="/', template)
+    head = f'<meta name="description" content="{html.escape(description)}" />'
+    if title:
+        page = re.sub(r"<title>.*?</title>", lambda _: f"<title>{html.escape(title)} | {SITE_NAME}</title>", page, count=1)
+    head += f"\n    <script>window.__INITIAL_DATA__={_script_json(data)};</script>"
+    page = page.replace("</head>", f"  {head}\n  </head>", 1)
+    # createRoot() replaces this markup once the app mounts
+    return page.replace('<div id="root"></div>', f'<div id="root">{body}</div>', 1)
+
+
+def build_pages(db, template: str, paths=None):
+    """Yield (path, stem, html) for every page, or those in `paths`, from the current data."""
+    cities = listings.cities(db)
+    instruments = [serialize_instrument(instrument) for instrument in listings.instruments(db)]
+    featured = listings.featured_teachers(db, FEATURED_LIMIT)
+    shared = {"cities": cities, "instruments": instruments}
+    navigation = (
+        f"<nav><h2>Városok</h2><ul>{_links('/varos', cities)}</ul></nav>"
+        f"<nav><h2>Hangszerek</h2><ul>{_links('/hangszer', [i['name_hu'] for i in instruments])}</ul></nav>"
+    )
+
+    for path, stem, title, kind, name in page_specs(cities, instruments):
+        if paths is not None and path not in paths:
+            continue
+        if kind == "home":
+            data = {**shared, "path": path, "featured": featured}
+            description = "Találd meg a hozzád illő zenetanárt: kiemelt tanárok hangszer és város szerint."
+            body = (
+                f"<main><h1>{SITE_NAME}</h1><section><h2>Kiemelt tanárok</h2>"
+                f"<ul>{_teacher_items(featured)}</ul></section>{navigation}</main>"
+            )
+        else:
+            filters = {"city": name} if kind == "city" else {"instrument": name}
+            result, _ = listings.search_page(db, per_page=PER_PAGE, **filters)
+            data = {**shared, "path": path, "search": {"filters": filters, "result": result}}
+            description = f"{result['total']} aktív hirdetés – {title}, {SITE_NAME}."
+            body = (
+                f"<main><h1>{html.escape(title)}</h1><p>{result['total']} hirdetés</p>"
+                f"<ul>{_ad_items(result)}</ul>{navigation}</main>"
+            )
+        yield path, stem, render_page(template, title, description, body, data)
+
+
+def listed_ads(db, ad_ids=None, teacher_ids=None) -> dict:
+    """ad id -> (teacher id, city, instrument) of the active ads, or of those given."""
+    query = (
+        select(Advertisement.id, Advertisement.teacher_id, Location.city, Instrument.name_hu)
+        .outerjoin(Location, Advertisement.location_id == Location.id)
+        .outerjoin(Instrument, Advertisement.instrument_id == Instrument.id)
+        .where(Advertisement.status == AdStatus.ACTIVE)
+    )
+    if ad_ids is None and teacher_ids is None:
+        return {row.id: tuple(row[1:]) for row in db.execute(query)}
+    ad_ids, teacher_ids = sorted(ad_ids or ()), sorted(teacher_ids or ())
+    found = {}
+    for start in range(0, max(len(ad_ids), len(teacher_ids)), catalog.IN_CHUNK):
+        condition = or_(
+            Advertisement.id.in_(ad_ids[start:start + catalog.IN_CHUNK]),
+            Advertisement.teacher_id.in_(teacher_ids[start:start + catalog.IN_CHUNK]),
+        )
+        found.update((row.id, tuple(row[1:])) for row in db.execute(query.where(condition)))
+    return found
+
+
+# ==================== SNAPSHOTS ====================
+
+class Prerenderer:
+    """Snapshots by URL path, served from memory and mirrored to `directory`."""
+
+    def __init__(self, directory: Path = PRERENDER_DIR, template: Path = TEMPLATE):
+        self.directory = Path(directory)
+        self.template = Path(template)
+        self._pages = {}     # path -> static_site.Page
+        self._manifest = {}  # path -> {"file", "digest"}
+        self._built_for = None
+        self._ads = {}       # ad id -> (teacher id, city, instrument) as last rendered
+        self._matchers = []  # (path, kind, match(text)) of the city and instrument pages
+        self._lock = threading.Lock()
+        self._pending = (False, set(), set())  # (render everything, ad ids, teacher ids)
+        self._pending_lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+
+    def get(self, path: str):
+        if len(path) > 1:
+            path = path.rstrip("/")
+        return self._pages.get(path)
+
+    def _page(self, file: Path, digest: str):
+        bodies = {None: file.read_bytes()}
+        for encoding, suffix in static_site.ENCODING_SUFFIXES.items():
+            variant = file.with_name(file.name + suffix)
+            if variant.is_file():
+                bodies[encoding] = variant.read_bytes()
+        return static_site.Page(bodies=bodies, etag=f'"{digest}"', modified=file.stat().st_mtime)
+
+    def load(self) -> int:
+        """Serve the snapshots already on disk (e.g. from before a restart)."""
+        try:
+            manifest = json.loads((self.directory / MANIFEST).read_text())
+        except (OSError, ValueError):
+            return 0
+        with self._lock:
+            for path, entry in manifest.items():
+                file = self.directory / entry["file"]
+                if file.is_file():
+                    self._pages[path] = self._page(file, entry["digest"])
+                    self._manifest[path] = entry
+        return len(self._pages)
+
+    def _write(self, name: str, data: bytes):
+        target = self.directory / name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, target)
+
+    def _remove(self, name: str):
+        for suffix in ("", *static_site.ENCODING_SUFFIXES.values()):
+            (self.directory / (name + suffix)).unlink(missing_ok=True)
+
+    def _render(self, db, template: str, paths=None, force: bool = False) -> int:
+        """Write the pages in `paths` (None: every page, dropping the rest); returns how many."""
+        manifest = {} if paths is None else dict(self._manifest)
+        written = 0
+        for path, stem, page in build_pages(db, template, paths):
+            body = page.encode("utf-8")
+            digest = hashlib.sha256(body).hexdigest()[:20]
+            entry = manifest[path] = {"file": f"{stem}.html", "digest": digest}
+            if not force and self._manifest.get(path) == entry and path in self._pages:
+                continue
+            self._write(entry["file"], body)
+            variants = static_site.compress(body)
+            for suffix in static_site.ENCODING_SUFFIXES.values():
+                if suffix in variants:
+                    self._write(entry["file"] + suffix, variants[suffix])
+                else:
+                    (self.directory / (entry["file"] + suffix)).unlink(missing_ok=True)
+            self._pages[path] = self._page(self.directory / entry["file"], digest)
+            written += 1
+
+        # Cities and instruments that no longer exist
+        for path in set(self._pages) - set(manifest):
+            del self._pages[path]
+        for path, entry in self._manifest.items():
+            if path not in manifest and entry["file"] not in {e["file"] for e in manifest.values()}:
+                self._remove(entry["file"])
+        if written or manifest != self._manifest:
+            self._write(MANIFEST, json.dumps(manifest, ensure_ascii=False, indent=1).encode())
+        self._manifest = manifest
+        return written
+
+    def refresh(self, db, force: bool = False) -> int:
+        """Re-render every page if the catalog or the build changed; returns snapshots rewritten."""
+        if not self.template.is_file():
+            return 0
+        state = (versions.get_versions(db, ["catalog"])["catalog"], self.template.stat().st_mtime_ns)
+        if state == self._built_for and not force:
+            return 0
+        template = self.template.read_text(encoding="utf-8")
+
+        with self._lock:
+            dialect = db.get_bind().dialect.name
+            instruments = [{"name_hu": instrument.name_hu} for instrument in listings.instruments(db)]
+            self._matchers = [
+                (path, kind, catalog.like_matcher(dialect, name))
+                for path, _, _, kind, name in page_specs(listings.cities(db), instruments) if kind != "home"
+            ]
+            self._ads = listed_ads(db)
+            written = self._render(db, template, force=force)
+            self._built_for = state
+        return written
+
+    def _pages_of(self, ad) -> set:
+        _, city, instrument = ad
+        return {path for path, kind, matches in self._matchers if matches(city if kind == "city" else instrument)}
+
+    def update(self, db) -> int:
+        """Re-render the pages the outbox events since the last round affect; returns snapshots rewritten."""
+        with self._pending_lock:
+            everything, ad_ids, teacher_ids = self._pending
+            self._pending = (False, set(), set())
+        if not self.template.is_file():
+            return 0
+        if everything:
+            self._built_for = None
+        if self._built_for is None or self.template.stat().st_mtime_ns != self._built_for[1]:
+            return self.refresh(db)
+        if not (ad_ids or teacher_ids):
+            return 0
+        state = (versions.get_versions(db, ["catalog"])["catalog"], self._built_for[1])
+        template = self.template.read_text(encoding="utf-8")
+
+        with self._lock:
+            # The ads as rendered and as they are now: a page changes if it lists either
+            ad_ids = set(ad_ids) | {ad_id for ad_id, ad in self._ads.items() if ad[0] in teacher_ids}
+            current = listed_ads(db, ad_ids, teacher_ids)
+            paths = {"/"} if teacher_ids else set()
+            for ad_id in ad_ids | set(current):
+                if ad_id in self._ads:
+                    paths |= self._pages_of(self._ads.pop(ad_id))
+                if ad_id in current:
+                    self._ads[ad_id] = current[ad_id]
+                    paths |= self._pages_of(current[ad_id])
+            written = self._render(db, template, paths)
+            self._built_for = state
+        return written
+
+    def apply(self, db, events):
+        """Outbox subscriber: note the ads and teachers to render again."""
+        if self._thread is None:
+            return  # nothing serves the snapshots in this process
+        with self._pending_lock:
+            everything, ad_ids, teacher_ids = self._pending
+            for event in events:
+                if event.entity == "ad":
+                    ad_ids.add(event.entity_id)
+                elif event.entity == "teacher":
+                    teacher_ids.add(event.entity_id)
+                else:
+                    # Instruments and locations change every page's navigation
+                    everything = True
+            self._pending = (everything, ad_ids, teacher_ids)
+
+    def reset(self):
+        """Outbox subscriber reset: render every page on the next round."""
+        with self._pending_lock:
+            self._pending = (True, set(), set())
+
+    def _run(self):
+        while not self._stop.is_set():
+            db = SessionLocal()
+            try:
+                written = self.update(db) if outbox.OUTBOX_ENABLED else self.refresh(db)
+                if written:
+                    logger.info("Prerendered %d pages", written)
+            except Exception:
+                logger.exception("Prerendering failed")
+            finally:
+                db.close()
+            self._stop.wait(PRERENDER_INTERVAL)
+
+    def start(self):
+        """Load the snapshots on disk, then keep them current in the background."""
+        if not (PRERENDER_ENABLED and static_site.SERVE_STATIC) or self._thread is not None:
+            return
+        self.load()
+        self._thread = threading.Thread(target=self._run, name="prerender", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+
+snapshots = Prerenderer()
+if PRERENDER_ENABLED:
+    outbox.subscribe(
+        "prerender", snapshots.apply,
+        entities={"ad", "teacher", "instrument", "location", "catalog"}, on_reset=snapshots.reset,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prerender the landing pages")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build_parser = commands.add_parser("build", help="Render the snapshots that changed")
+    build_parser.add_argument("--force", action="store_true", help="Rewrite every snapshot")
+    args = parser.parse_args()
+
+    if not snapshots.template.is_file():
+        print(f"❌ {snapshots.template} not found, build the frontend first")
+        return
+    Base.metadata.create_all(bind=engine)
+    snapshots.load()
+    db = SessionLocal()
+    try:
+        written = snapshots.refresh(db, force=args.force)
+        print(f"✅ Prerendered {written} of {len(snapshots._manifest)} pages into {snapshots.directory}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
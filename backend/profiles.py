@@ -0,0 +1,150 @@
+"""The signed-in user's profile page in one response.
+
+GET /api/users/profile returns the user, their teacher profile, their ads,
+per-ad engagement totals and the unread message count, built from a fixed
+number of queries whatever the number of ads. `?fields=` picks the parts
+to return.
+
+The user, teacher profile and ads are cached per user under the versions of
+teacher:<id> (bumped by any write to the user, profile, photos or ads) and
+of the instrument/location lists, so a write on any worker invalidates the
+entry. Counters that change without a version bump (ad views/contacts, the
+engagement totals and the unread count) are always read fresh.
+"""
+import os
+from datetime import datetime
+
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
+
+from models import Advertisement, UserRole
+import analytics
+import coalesce
+import images
+import inbox
+import versions
+
+FIELDS = ("user", "teacher_profile", "advertisements", "stats", "unread_messages")
+STATS_DAYS = 30
+
+PROFILE_CACHE = coalesce.TTLCache("profile", ttl=float(os.getenv("PROFILE_CACHE_TTL", "300")), maxsize=4096)
+
+
+def parse_fields(value: str = None) -> set:
+    """The requested parts of ?fields=a,b (all of them by default); 400 on unknown names."""
+    if not value:
+        return set(FIELDS)
+    fields = {field.strip() for field in value.split(",") if field.strip()}
+    unknown = fields - set(FIELDS)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}; choose from {', '.join(FIELDS)}",
+        )
+    return fields
+
+
+def _load(db, user) -> dict:
+    """The versioned parts: user, teacher profile and ads without their counters."""
+    data = {
+        "user": {
+            "id": user.id,
+            "email": user.email,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "phone": user.phone,
+            "role": user.role.value,
+            "created_at": user.created_at.isoformat() if user.created_at else None,
+        },
+        "teacher_profile": None,
+    }
+
+    if user.role == UserRole.TEACHER and user.teacher_profile:
+        tp = user.teacher_profile
+        data["teacher_profile"] = {
+            "bio_short": tp.bio_short,
+            "bio_long": tp.bio_long,
+            "video_url": tp.video_url,
+            "years_experience": tp.years_experience,
+            "lesson_price": float(tp.lesson_price) if tp.lesson_price else None,
+            "price_currency": tp.price_currency,
+            "teaching_online": tp.teaching_online,
+            "teaching_at_student": tp.teaching_at_student,
+            "teaching_at_teacher": tp.teaching_at_teacher,
+            "subscription_type": tp.subscription_type.value,
+            "subscription_expires": tp.subscription_expires.isoformat() if tp.subscription_expires else None,
+            "photo": images.photos_for(db, [user.id]).get(user.id),
+        }
+
+    ads = db.query(Advertisement).options(
+        joinedload(Advertisement.instrument),
+        joinedload(Advertisement.location)
+    ).filter(Advertisement.teacher_id == user.id).order_by(Advertisement.created_at.desc()).all()
+    data["advertisements"] = [
+        {
+            "id": ad.id,
+            "title": ad.title,
+            "short_description": ad.short_description,
+            "long_description": ad.long_description,
+            "status": ad.status.value,
+            "featured": ad.featured,
+            "created_at": ad.created_at.isoformat() if ad.created_at else None,
+            "expires_at": ad.expires_at,
+            "instrument": ad.instrument.name_hu if ad.instrument else None,
+            "location": ad.location.city if ad.location else None,
+        }
+        for ad in ads
+    ]
+    return data
+
+
+def _cached(db, user) -> dict:
+    current = versions.get_versions(db, [f"teacher:{user.id}", "instruments", "locations"])
+    key = (user.id, *current.values())
+    return PROFILE_CACHE.get_or_load(key, lambda: _load(db, user))
+
+
+def build(db, user, fields: set, days: int = STATS_DAYS) -> dict:
+    """The requested parts of the profile; user fields stay at the top level."""
+    result = {}
+    if fields & {"user", "teacher_profile", "advertisements"}:
+        cached = _cached(db, user)
+        if "user" in fields:
+            result.update(cached["user"])
+        if "teacher_profile" in fields and cached["teacher_profile"] is not None:
+            result["teacher_profile"] = cached["teacher_profile"]
+
+    ad_ids = None
+    if "advertisements" in fields:
+        counters = {
+            row.id: row for row in db.execute(
+                select(Advertisement.id, Advertisement.views, Advertisement.contacts)
+                .where(Advertisement.teacher_id == user.id)
+            )
+        }
+        now = datetime.utcnow()
+        result["advertisements"] = [
+            {
+                **ad,
+                "views": counters[ad["id"]].views if ad["id"] in counters else 0,
+                "contacts": counters[ad["id"]].contacts if ad["id"] in counters else 0,
+                "expires_at": ad["expires_at"].isoformat() if ad["expires_at"] else None,
+                "days_remaining": (ad["expires_at"] - now).days if ad["expires_at"] else None,
+            }
+            for ad in cached["advertisements"]
+        ]
+        ad_ids = list(counters)
+
+    if "stats" in fields:
+        if ad_ids is None:
+            ad_ids = [ad_id for (ad_id,) in db.execute(
+                select(Advertisement.id).where(Advertisement.teacher_id == user.id)
+            )]
+        totals = analytics.ad_totals(db, ad_ids, days)
+        result["stats"] = {"days": days, "advertisements": {str(ad_id): counts for ad_id, counts in totals.items()}}
+
+    if "unread_messages" in fields:
+        result["unread_messages"] = inbox.unread_count(db, user.id)
+
+    return result
@@ -0,0 +1,335 @@
+"""On-demand cProfile captures of API requests.
+
+A request is profiled when an admin sends it with an `X-Profile: 1` header
+(and their bearer token), or when it is drawn by sampling: with
+PROFILE_SAMPLE_RATE above 0, that fraction of the requests to the routes in
+PROFILE_ROUTES (endpoint names such as search_advertisements or path
+templates such as /api/admin/stats; empty means every route) is profiled.
+Admins can change both per worker at runtime through /api/admin/profiles.
+
+The profile covers the event loop thread for the duration of the request
+plus every threadpool call FastAPI makes for it (sync endpoints and
+dependencies), each in its own cProfile.Profile, merged when the request
+ends. Python 3.12+ allows only one active cProfile per interpreter, which
+the loop thread's holds; there threadpool calls run unprofiled and are
+counted in the profile's threads_skipped. Coroutines of other requests
+running on the loop meanwhile show up in the loop thread's part, so each
+profile records how many requests were in flight when it started. Only one
+request per worker is profiled at a time; the newest PROFILE_BUFFER
+profiles are kept in memory and can be downloaded as pstats files
+(snakeviz, `python -m pstats`) or read as text.
+
+Streams would hold the profiler for as long as a client stays connected,
+so a capture stops when a text/event-stream response starts, or after
+PROFILE_MAX_SECONDS; the profile's `stopped` says which, and the rest of
+the request runs unprofiled.
+
+When no request is profiled, the cost is a header scan per request and a
+context variable lookup per threadpool call.
+"""
+import asyncio
+import cProfile
+import io
+import itertools
+import logging
+import marshal
+import os
+import pstats
+import random
+import threading
+import time
+from collections import deque, namedtuple
+from contextvars import ContextVar
+from datetime import datetime
+
+from starlette.concurrency import run_in_threadpool
+from starlette.routing import Match
+
+from database import SessionLocal
+import metrics
+
+logger = logging.getLogger("profiling")
+
+PROFILE_ENABLED = os.getenv("PROFILE_ENABLED", "1") == "1"
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+PROFILE_ROUTES = os.getenv("PROFILE_ROUTES", "")
+PROFILE_BUFFER = int(os.getenv("PROFILE_BUFFER", "20"))
+PROFILE_MAX_SECONDS = float(os.getenv("PROFILE_MAX_SECONDS", "30"))
+
+HEADER = b"x-profile"
+EVENT_STREAM = b"text/event-stream"
+
+PROFILES_CAPTURED = metrics.Counter("profiles_captured_total", "Request profiles captured by trigger", ("trigger",))
+
+Profile = namedtuple("Profile", "id method path route trigger status duration_ms in_flight threads_skipped stopped started_at stats")
+
+_current = ContextVar("profile_capture", default=None)
+
+
+# ==================== CAPTURE ====================
+
+class Capture:
+    """The profilers of one request: the loop thread's and one per threadpool call."""
+
+    def __init__(self, profile_id: int):
+        self.id = profile_id
+        self.loop_profiler = cProfile.Profile()
+        self.thread_profilers = []
+        self.threads_skipped = 0
+        self.closed = False
+
+    def run(self, func, *args, **kwargs):
+        """Call func in a worker thread under its own profiler, if one can be enabled."""
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # "Another profiling tool is already active" (Python 3.12+)
+            self.threads_skipped += 1
+            return func(*args, **kwargs)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profiler.disable()
+            self.thread_profilers.append(profiler)
+
+    def stats(self) -> pstats.Stats:
+        stats = pstats.Stats(self.loop_profiler)
+        for profiler in self.thread_profilers:
+            stats.add(profiler)
+        return stats
+
+
+def _profiled(run):
+    async def run_in_threadpool(func, *args, **kwargs):
+        capture = _current.get()
+        if capture is None or capture.closed:
+            return await run(func, *args, **kwargs)
+        return await run(capture.run, func, *args, **kwargs)
+    return run_in_threadpool
+
+
+def install():
+    """Profile the threadpool calls FastAPI makes for a profiled request."""
+    if not PROFILE_ENABLED:
+        return
+    # FastAPI imports run_in_threadpool by name, so each importing module gets the wrapper
+    import fastapi.concurrency
+    import fastapi.dependencies.utils
+    import fastapi.routing
+    for module in (fastapi.concurrency, fastapi.dependencies.utils, fastapi.routing):
+        if getattr(module.run_in_threadpool, "__wrapped_run__", None) is None:
+            wrapper = _profiled(module.run_in_threadpool)
+            wrapper.__wrapped_run__ = module.run_in_threadpool
+            module.run_in_threadpool = wrapper
+
+
+# ==================== PROFILER ====================
+
+class Profiler:
+    """Sampling settings and the ring buffer of captured profiles."""
+
+    def __init__(self, sample_rate: float, routes, size: int):
+        self.sample_rate = sample_rate
+        self.routes = frozenset(routes)
+        self._profiles = deque(maxlen=size)
+        self._ids = itertools.count(1)
+        self._busy = threading.Lock()
+
+    def configure(self, sample_rate: float = None, routes=None):
+        if sample_rate is not None:
+            self.sample_rate = min(max(sample_rate, 0.0), 1.0)
+        if routes is not None:
+            self.routes = frozenset(route for route in routes if route)
+
+    def wants(self, route) -> bool:
+        """Whether a sampled request to this route should be profiled."""
+        if not self.routes:
+            return True
+        return route is not None and (route.name in self.routes or getattr(route, "path", None) in self.routes)
+
+    def begin(self):
+        """A new capture, or None while another request is being profiled."""
+        if not self._busy.acquire(blocking=False):
+            return None
+        return Capture(next(self._ids))
+
+    def abandon(self, capture: Capture):
+        self._busy.release()
+
+    def finish(self, capture: Capture, **details):
+        capture.closed = True
+        try:
+            stats = capture.stats()
+        except Exception:
+            logger.exception("Could not collect profile %s", capture.id)
+            return
+        finally:
+            self._busy.release()
+        self._profiles.append(Profile(id=capture.id, threads_skipped=capture.threads_skipped, stats=stats, **details))
+        PROFILES_CAPTURED.inc(trigger=details["trigger"])
+
+    def get(self, profile_id: int):
+        for profile in self._profiles:
+            if profile.id == profile_id:
+                return profile
+        return None
+
+    def summaries(self) -> list:
+        return [
+            {field: value for field, value in profile._asdict().items() if field != "stats"}
+            for profile in reversed(self._profiles)
+        ]
+
+    def clear(self) -> int:
+        cleared = len(self._profiles)
+        self._profiles.clear()
+        return cleared
+
+    def status(self) -> dict:
+        return {
+            "enabled": PROFILE_ENABLED,
+            "sample_rate": self.sample_rate,
+            "routes": sorted(self.routes),
+            "buffer": self._profiles.maxlen,
+            "profiles": len(self._profiles),
+            "busy": self._busy.locked(),
+        }
+
+
+def dump(profile: Profile) -> bytes:
+    """The profile in the pstats file format (what Stats.dump_stats writes)."""
+    return marshal.dumps(profile.stats.stats)
+
+
+def text(profile: Profile, sort: str = "cumulative", limit: int = 50) -> str:
+    """The top `limit` functions as `python -m pstats` prints them."""
+    stream = io.StringIO()
+    stats = pstats.Stats(stream=stream)
+    stats.add(profile.stats)
+    stats.sort_stats(sort).print_stats(limit)
+    return stream.getvalue()
+
+
+profiler = Profiler(
+    PROFILE_SAMPLE_RATE,
+    [route.strip() for route in PROFILE_ROUTES.split(",") if route.strip()],
+    PROFILE_BUFFER,
+)
+
+
+# ==================== MIDDLEWARE ====================
+
+def _is_admin(authorization: bytes) -> bool:
+    from auth import get_user_from_token
+    from models import UserRole
+    scheme, _, token = authorization.decode("latin-1").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return False
+    db = SessionLocal()
+    try:
+        user = get_user_from_token(db, token)
+        return user is not None and user.role == UserRole.ADMIN
+    finally:
+        db.close()
+
+
+class ProfilingMiddleware:
+    """Profile requests asked for by admins or drawn by sampling."""
+
+    def __init__(self, app, router=None):
+        self.app = app
+        self.router = router
+        self.in_flight = 0
+
+    def _route(self, scope):
+        for route in self.router.routes if self.router is not None else ():
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return route
+        return None
+
+    async def _trigger(self, scope):
+        requested = authorization = None
+        for name, value in scope["headers"]:
+            if name == HEADER:
+                requested = value
+            elif name == b"authorization":
+                authorization = value
+        if requested is not None and requested not in (b"", b"0"):
+            # Anyone else asking is served as usual, unprofiled
+            if authorization and await run_in_threadpool(_is_admin, authorization):
+                return "header"
+            return None
+        rate = profiler.sample_rate
+        if rate > 0 and random.random() < rate and profiler.wants(self._route(scope)):
+            return "sample"
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not PROFILE_ENABLED:
+            await self.app(scope, receive, send)
+            return
+        self.in_flight += 1
+        try:
+            trigger = await self._trigger(scope)
+            capture = profiler.begin() if trigger else None
+            if capture is None:
+                await self.app(scope, receive, send)
+                return
+            await self._profile(capture, trigger, scope, receive, send)
+        finally:
+            self.in_flight -= 1
+
+    async def _profile(self, capture, trigger, scope, receive, send):
+        started_at = datetime.utcnow()
+        started = time.perf_counter()
+        in_flight = self.in_flight
+        status_code = None
+
+        def stop(reason=None):
+            # Synchronous, so the capture is released even if the request was cancelled
+            if capture.closed:
+                return
+            capture.loop_profiler.disable()
+            route = scope.get("route")
+            profiler.finish(
+                capture,
+                method=scope["method"],
+                path=scope["path"],
+                route=getattr(route, "path", None),
+                trigger=trigger,
+                # Not started yet when the time limit hits; a request that ended without one failed
+                status=status_code if status_code is not None or reason else 500,
+                duration_ms=round((time.perf_counter() - started) * 1000, 1),
+                in_flight=in_flight,
+                stopped=reason,
+                started_at=started_at,
+            )
+
+        async def send_with_id(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+                message["headers"] = headers + [(b"x-profile-id", str(capture.id).encode())]
+                if any(name.lower() == b"content-type" and value.startswith(EVENT_STREAM) for name, value in headers):
+                    stop("stream")
+            await send(message)
+
+        try:
+            capture.loop_profiler.enable()
+        except ValueError:
+            # Another profiler or debugger owns the interpreter's profiling hook
+            profiler.abandon(capture)
+            logger.warning("Not profiling %s: another profiling tool is active", scope["path"])
+            await self.app(scope, receive, send)
+            return
+        token = _current.set(capture)
+        timer = asyncio.get_running_loop().call_later(PROFILE_MAX_SECONDS, stop, "time limit")
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            timer.cancel()
+            _current.reset(token)
+            stop()
@@ -0,0 +1,277 @@
+"""Publish/subscribe for server-sent events.
+
+publish() may be called from any thread (sync endpoints run in the thread
+pool); events are handed to each subscriber's asyncio queue on the
+subscriber's own event loop. A slow subscriber drops its oldest events
+rather than blocking publishers.
+
+A single process delivers events in memory. With several uvicorn workers,
+set PUBSUB_BROKER to host:port of a broker started with
+    python pubsub.py broker --port 8765
+Every worker then sends its events to the broker, which fans them out to
+all workers (including the sender), so a subscriber on one worker sees
+events published on another. If the broker is unreachable, events are
+delivered locally and the connection is retried in the background. The
+broker disconnects a worker that stops reading once BROKER_BUFFER_BYTES
+are waiting for it, rather than buffering without bound; the worker
+reconnects and misses the events in between.
+
+Use publish_after_commit() for events describing a database change, so
+nothing is announced for a transaction that rolls back.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from contextlib import asynccontextmanager
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from serializers import dumps
+
+logger = logging.getLogger("pubsub")
+
+PUBSUB_BROKER = os.getenv("PUBSUB_BROKER")
+QUEUE_SIZE = 100
+HEARTBEAT_SECONDS = 15
+RECONNECT_SECONDS = 2
+BROKER_BUFFER_BYTES = int(os.getenv("BROKER_BUFFER_BYTES", str(1024 * 1024)))
+
+
+class PubSub:
+    def __init__(self):
+        self._subscribers = {}  # channel -> set of (loop, queue)
+        self._listeners = {}  # channel -> list of callbacks
+        self._lock = threading.Lock()
+        self.broker = None
+
+    def publish(self, channel: str, event: dict):
+        if self.broker is not None and self.broker.send(channel, event):
+            return
+        self.deliver(channel, event)
+
+    def deliver(self, channel: str, event: dict):
+        """Hand an event to this process's subscribers."""
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+            listeners = list(self._listeners.get(channel, ()))
+        for listener in listeners:
+            try:
+                listener(event)
+            except Exception:
+                logger.exception("Listener on %s failed", channel)
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(_offer, queue, event)
+            except RuntimeError:  # loop already closed
+                pass
+
+    def listen(self, channel: str, callback):
+        """Call callback(event) for every event of a channel, on the delivering
+        thread; for background threads rather than request handlers."""
+        with self._lock:
+            self._listeners.setdefault(channel, []).append(callback)
+
+    @asynccontextmanager
+    async def subscribe(self, *channels, maxsize: int = QUEUE_SIZE):
+        """Yield a queue receiving the events of the given channels."""
+        entry = (asyncio.get_running_loop(), asyncio.Queue(maxsize))
+        with self._lock:
+            for channel in channels:
+                self._subscribers.setdefault(channel, set()).add(entry)
+        try:
+            yield entry[1]
+        finally:
+            with self._lock:
+                for channel in channels:
+                    subscribers = self._subscribers.get(channel)
+                    if subscribers is not None:
+                        subscribers.discard(entry)
+                        if not subscribers:
+                            del self._subscribers[channel]
+
+    def subscriber_count(self, channel: str) -> int:
+        return len(self._subscribers.get(channel, ()))
+
+
+def _offer(queue: asyncio.Queue, event: dict):
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(event)
+
+
+# ==================== BROKER ====================
+
+class BrokerClient:
+    """Connection from one worker to the broker, kept open by a background thread."""
+
+    def __init__(self, hub: PubSub, address: str):
+        host, _, port = address.rpartition(":")
+        self.hub = hub
+        self.address = (host or "127.0.0.1", int(port))
+        self._sock = None
+        self._send_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="pubsub-broker", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def send(self, channel: str, event: dict) -> bool:
+        """Send an event to the broker; False if it isn't connected."""
+        sock = self._sock
+        if sock is None:
+            return False
+        line = dumps({"channel": channel, "event": event}) + b"\n"
+        try:
+            with self._send_lock:
+                sock.sendall(line)
+            return True
+        except OSError:
+            self._drop(sock)
+            return False
+
+    def _drop(self, sock):
+        if self._sock is sock:
+            self._sock = None
+        try:
+            sock.close()
+        except OSError:
+            pass
+
+    def _run(self):
+        while True:
+            try:
+                sock = socket.create_connection(self.address, timeout=5)
+                sock.settimeout(None)
+            except OSError:
+                time.sleep(RECONNECT_SECONDS)
+                continue
+            self._sock = sock
+            logger.info("Connected to pubsub broker at %s:%s", *self.address)
+            try:
+                for line in sock.makefile("rb"):
+                    try:
+                        message = json.loads(line)
+                    except ValueError:
+                        continue
+                    self.hub.deliver(message["channel"], message["event"])
+            except OSError:
+                pass
+            self._drop(sock)
+            logger.warning("Lost pubsub broker connection, retrying")
+            time.sleep(RECONNECT_SECONDS)
+
+
+async def run_broker(host: str = "127.0.0.1", port: int = 8765):
+    """Fan every line received from a worker out to all connected workers."""
+    writers = set()
+
+    async def handle(reader, writer):
+        writers.add(writer)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                for target in list(writers):
+                    if target.transport.get_write_buffer_size() > BROKER_BUFFER_BYTES:
+                        # The worker isn't reading; its socket is closed and it reconnects
+                        logger.warning("Disconnecting %s: it stopped reading", target.get_extra_info("peername"))
+                        writers.discard(target)
+                        # close() would wait to flush the buffer it isn't reading
+                        target.transport.abort()
+                        continue
+                    try:
+                        target.write(line)
+                    except Exception:
+                        writers.discard(target)
+        finally:
+            writers.discard(writer)
+            writer.close()
+
+    server = await asyncio.start_server(handle, host, port)
+    print(f"🚀 Pubsub broker listening on {host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+hub = PubSub()
+publish = hub.publish
+subscribe = hub.subscribe
+listen = hub.listen
+
+if PUBSUB_BROKER:
+    hub.broker = BrokerClient(hub, PUBSUB_BROKER)
+    hub.broker.start()
+
+
+# ==================== AFTER COMMIT ====================
+
+def publish_after_commit(db: Session, channel: str, event: dict):
+    """Publish once the session's current transaction commits."""
+    db.info.setdefault("pubsub_pending", []).append((channel, event))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending(session):
+    for channel, pending_event in session.info.pop("pubsub_pending", []):
+        publish(channel, pending_event)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session):
+    session.info.pop("pubsub_pending", None)
+
+
+# ==================== SERVER-SENT EVENTS ====================
+
+def sse_event(event: str, data, event_id=None) -> bytes:
+    """Format one server-sent event."""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    payload = dumps(data).decode() if not isinstance(data, str) else data
+    lines.extend(f"data: {line}" for line in payload.splitlines() or [""])
+    return ("\n".join(lines) + "\n\n").encode()
+
+
+async def sse_stream(request, queue: asyncio.Queue, initial=(), heartbeat: float = HEARTBEAT_SECONDS):
+    """Yield SSE bytes: the initial events, then every queued event, with
+    comment heartbeats so proxies keep the connection open."""
+    for event in initial:
+        yield sse_event(event["type"], event)
+    while True:
+        try:
+            event = await asyncio.wait_for(queue.get(), heartbeat)
+        except asyncio.TimeoutError:
+            if await request.is_disconnected():
+                return
+            yield b": ping\n\n"
+            continue
+        yield sse_event(event["type"], event)
+
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",  # nginx: don't buffer the stream
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pubsub broker for multi-worker deployments")
+    commands = parser.add_subparsers(dest="command", required=True)
+    broker_parser = commands.add_parser("broker", help="Run the broker")
+    broker_parser.add_argument("--host", default="127.0.0.1")
+    broker_parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    asyncio.run(run_broker(args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
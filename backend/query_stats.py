@@ -0,0 +1,158 @@
+"""Per-request SQL query accounting.
+
+SQLAlchemy engine events count the statements and database time of each
+request. The totals are sent back in a Server-Timing header, statements
+slower than SLOW_QUERY_MS are logged with their route and the shape (not
+the values) of their parameters, and check_query_budget() lets tests fail
+when an endpoint runs more queries than it should.
+"""
+import logging
+import os
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import event
+
+logger = logging.getLogger("query_stats")
+
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))
+
+_current = ContextVar("query_stats", default=None)
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+class QueryStats:
+    __slots__ = ("count", "duration", "scope")
+
+    def __init__(self, scope=None):
+        self.count = 0
+        self.duration = 0.0
+        self.scope = scope
+
+    @property
+    def route(self) -> str:
+        if self.scope is None:
+            return "-"
+        route = self.scope.get("route")
+        return getattr(route, "path", None) or self.scope.get("path", "-")
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.duration * 1000:.1f};desc="{self.count} queries"'
+
+
+def current_stats():
+    """Stats of the request being handled in this context, if any."""
+    return _current.get()
+
+
+def params_shape(parameters):
+    """Describe bound parameters by type only, so no user data reaches the logs."""
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (dict, list, tuple)):
+            return f"{len(parameters)} x {params_shape(parameters[0])}"
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_started"].pop()
+    stats = _current.get()
+    if stats is not None:
+        stats.count += 1
+        stats.duration += elapsed
+    if elapsed * 1000 >= SLOW_QUERY_MS:
+        logger.warning(
+            "Slow query (%.1f ms) on %s: %s -- params %s",
+            elapsed * 1000,
+            stats.route if stats is not None else "-",
+            " ".join(statement.split()),
+            params_shape(parameters),
+        )
+
+
+def _handle_error(exception_context):
+    started = exception_context.connection.info.get("query_started") if exception_context.connection else None
+    if started:
+        started.pop()
+
+
+def install(engine):
+    """Attach the query counting listeners to an engine."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
+
+
+@contextmanager
+def count_queries():
+    """Count the queries run in this context (outside of a request)."""
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+class QueryStatsMiddleware:
+    """Collect query stats per request and report them in Server-Timing."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        stats = QueryStats(scope)
+        token = _current.set(stats)
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"server-timing", stats.server_timing().encode())
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+
+
+# ==================== TEST HELPERS ====================
+
+_SERVER_TIMING_QUERIES = re.compile(r'db;dur=[\d.]+;desc="(\d+) queries"')
+
+
+def queries_in(response) -> int:
+    """Number of queries a response reported in its Server-Timing header."""
+    match = _SERVER_TIMING_QUERIES.search(response.headers.get("server-timing", ""))
+    if not match:
+        raise QueryBudgetExceeded("Response has no query count; is QueryStatsMiddleware installed?")
+    return int(match.group(1))
+
+
+def check_query_budget(client, method: str, url: str, budget: int, **kwargs):
+    """Send a request and fail if the endpoint ran more than `budget` queries.
+
+    Works with TestClient or any httpx client pointed at the app. Returns
+    the response so the caller can make further assertions.
+    """
+    response = client.request(method, url, **kwargs)
+    used = queries_in(response)
+    if used > budget:
+        raise QueryBudgetExceeded(f"{method} {url} ran {used} queries, budget is {budget}")
+    return response
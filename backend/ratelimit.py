@@ -0,0 +1,204 @@
+"""Token-bucket rate limiting for public endpoints.
+
+Each budget allows `requests` per `seconds`, refilled continuously, with
+bursts of up to `requests`. Clients are keyed by user when the request
+carries a valid access token and by IP address otherwise. Endpoints opt in
+with a dependency:
+
+    @app.get("/api/advertisements", dependencies=[Depends(ratelimit.limit("search"))])
+
+Budgets can be overridden per deployment, e.g. RATE_LIMIT_SEARCH=300/60.
+
+Buckets live in memory, so with several uvicorn workers each worker
+enforces the budget on its own. Set RATE_LIMIT_REDIS_URL (needs the `redis`
+package) to share the buckets between workers and hosts. If the shared
+backend fails, requests are let through rather than rejected.
+"""
+import logging
+import math
+import os
+import threading
+import time
+from dataclasses import dataclass
+
+from fastapi import HTTPException, Request
+from jose import JWTError, jwt
+from starlette.concurrency import run_in_threadpool
+
+from auth import SECRET_KEY, ALGORITHM
+import metrics
+
+try:
+    import redis
+except ImportError:  # optional, only needed for the shared backend
+    redis = None
+
+logger = logging.getLogger("ratelimit")
+
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "1") == "1"
+RATE_LIMIT_REDIS_URL = os.getenv("RATE_LIMIT_REDIS_URL")
+# Only trust X-Forwarded-For behind a proxy that sets it
+TRUST_PROXY_HEADERS = os.getenv("TRUST_PROXY_HEADERS", "0") == "1"
+
+RATE_LIMITED = metrics.Counter("rate_limited_total", "Requests rejected by the rate limiter", ("budget",))
+
+
+@dataclass(frozen=True)
+class Budget:
+    requests: int
+    seconds: float
+
+    @property
+    def rate(self) -> float:
+        return self.requests / self.seconds
+
+    @classmethod
+    def parse(cls, value: str) -> "Budget":
+        """Parse "requests/seconds", e.g. "60/60"."""
+        requests, _, seconds = value.partition("/")
+        return cls(int(requests), float(seconds or 1))
+
+
+DEFAULT_BUDGETS = {
+    "search": "120/60",
+    "advertisement": "240/60",
+    "featured": "120/60",
+    "contact": "5/300",
+    "register": "5/3600",
+    "login": "10/300",
+}
+
+
+def _budget(name: str) -> Budget:
+    return Budget.parse(os.getenv(f"RATE_LIMIT_{name.upper()}", DEFAULT_BUDGETS[name]))
+
+
+# ==================== BACKENDS ====================
+
+class MemoryBackend:
+    """Buckets in a dict of this process."""
+
+    blocking = False
+    PRUNE_EVERY = 10000
+
+    def __init__(self):
+        self._buckets = {}  # key -> (tokens, updated)
+        self._lock = threading.Lock()
+        self._calls = 0
+
+    def take(self, key: str, budget: Budget, now: float = None) -> float:
+        """Take one token. Returns 0 if allowed, else seconds until one is available."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (budget.requests, now))
+            tokens = min(budget.requests, tokens + (now - updated) * budget.rate)
+            if tokens >= 1:
+                self._buckets[key] = (tokens - 1, now)
+                wait = 0.0
+            else:
+                self._buckets[key] = (tokens, now)
+                wait = (1 - tokens) / budget.rate
+            self._calls += 1
+            if self._calls >= self.PRUNE_EVERY:
+                self._calls = 0
+                self._prune(now)
+        return wait
+
+    def _prune(self, now: float):
+        # Buckets idle for an hour are full again for any budget up to that window
+        self._buckets = {key: value for key, value in self._buckets.items() if now - value[1] < 3600}
+
+
+class RedisBackend:
+    """Buckets in Redis, shared by every worker."""
+
+    blocking = True
+
+    # KEYS[1] bucket; ARGV: capacity, rate per second, now, ttl
+    SCRIPT = """
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local tokens = tonumber(bucket[1]) or capacity
+local updated = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated', now)
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return tostring(wait)
+"""
+
+    def __init__(self, url: str):
+        self._client = redis.Redis.from_url(url, socket_timeout=0.5)
+        self._script = self._client.register_script(self.SCRIPT)
+
+    def take(self, key: str, budget: Budget, now: float = None) -> float:
+        now = time.time() if now is None else now
+        try:
+            return float(self._script(
+                keys=[f"ratelimit:{key}"],
+                args=[budget.requests, budget.rate, now, math.ceil(budget.seconds) + 1],
+            ))
+        except redis.RedisError:
+            logger.warning("Rate limit backend unavailable, allowing request", exc_info=True)
+            return 0.0
+
+
+def _default_backend():
+    if RATE_LIMIT_REDIS_URL:
+        if redis is not None:
+            return RedisBackend(RATE_LIMIT_REDIS_URL)
+        logger.warning("RATE_LIMIT_REDIS_URL is set but redis is not installed; using in-memory buckets")
+    return MemoryBackend()
+
+
+backend = _default_backend()
+
+
+# ==================== DEPENDENCY ====================
+
+def client_key(request: Request) -> str:
+    """"user:<email>" for a valid bearer token, else "ip:<address>"."""
+    authorization = request.headers.get("authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() == "bearer" and token:
+        try:
+            subject = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM]).get("sub")
+        except JWTError:
+            subject = None
+        if subject:
+            return f"user:{subject}"
+    if TRUST_PROXY_HEADERS:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return f"ip:{forwarded.split(',')[0].strip()}"
+    return f"ip:{request.client.host if request.client else 'unknown'}"
+
+
+def limit(name: str):
+    """Dependency enforcing the named budget; raises 429 with Retry-After."""
+    budget = _budget(name)
+
+    async def check(request: Request):
+        if not RATE_LIMIT_ENABLED:
+            return
+        key = f"{name}:{client_key(request)}"
+        if backend.blocking:
+            wait = await run_in_threadpool(backend.take, key, budget)
+        else:
+            wait = backend.take(key, budget)
+        if wait > 0:
+            RATE_LIMITED.inc(budget=name)
+            raise HTTPException(
+                status_code=429,
+                detail="Too many requests, please try again later",
+                headers={"Retry-After": str(math.ceil(wait))},
+            )
+
+    return check
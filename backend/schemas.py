@@ -1,5 +1,5 @@
-from pydantic import BaseModel, EmailStr
-from typing import Optional, List
+from pydantic import BaseModel, EmailStr, Field
+from typing import Optional, List, Literal
 from datetime import datetime
 from decimal import Decimal
 from models import UserRole, AdStatus, SubscriptionType
@@ -135,6 +135,40 @@ class SearchResponse(BaseModel):
     page: int
     per_page: int
 
+# Bulk moderation schemas
+class BulkAdFilter(BaseModel):
+    status: Optional[AdStatus] = None
+    older_than_days: Optional[int] = Field(None, ge=0)
+
+class BulkModerationRequest(BaseModel):
+    action: Literal["approve", "reject", "extend", "delete"]
+    ids: Optional[List[int]] = None
+    filter: Optional[BulkAdFilter] = None
+    days: int = Field(30, ge=1)
+    reason: Optional[str] = None
+
+class BulkOutcome(BaseModel):
+    id: int
+    outcome: str
+
+class BulkModerationResponse(BaseModel):
+    action: str
+    processed: int
+    results: List[BulkOutcome]
+
+class ProfilingConfig(BaseModel):
+    sample_rate: Optional[float] = Field(None, ge=0, le=1)
+    routes: Optional[List[str]] = None
+
+class ArchiveRunRequest(BaseModel):
+    ads_days: Optional[int] = Field(None, ge=1)
+    messages_days: Optional[int] = Field(None, ge=1)
+    dry_run: bool = False
+
+class ArchiveRestoreRequest(BaseModel):
+    kind: Literal["ads", "messages"]
+    ids: List[int]
+
 # Contact message schemas
 class ContactMessageBase(BaseModel):
     name: str
@@ -157,6 +191,14 @@ class ContactMessageResponse(ContactMessageBase):
     class Config:
         from_attributes = True
 
+class InboxPage(BaseModel):
+    items: List[ContactMessageResponse]
+    next_cursor: Optional[str] = None
+    unread: int
+
+class MarkReadRequest(BaseModel):
+    ids: Optional[List[int]] = None  # None marks the whole inbox as read
+
 # Payment schemas
 class PaymentBase(BaseModel):
     amount: Decimal
@@ -0,0 +1,89 @@
+"""Fast JSON serialization for the hot list endpoints.
+
+Rows loaded from our own database are already trusted, so the list endpoints
+turn them into plain dicts with precompiled attribute getters instead of
+revalidating every nested object through the Pydantic response models.
+The result is encoded with orjson when it is installed.
+"""
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from operator import attrgetter
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib encoder
+    orjson = None
+
+
+def _default(obj):
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content) -> bytes:
+    """Encode content to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content, default=_default, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse that uses orjson when available and understands
+    datetimes, enums and decimals without a jsonable_encoder pass."""
+
+    def render(self, content) -> bytes:
+        return dumps(content)
+
+
+def _compile(fields):
+    """Build a serializer that copies the given attributes into a dict."""
+    getter = attrgetter(*fields)
+    if len(fields) == 1:
+        return lambda obj: {fields[0]: getter(obj)}
+    return lambda obj: dict(zip(fields, getter(obj)))
+
+
+# Field lists mirror UserResponse, InstrumentResponse, LocationResponse and
+# AdvertisementResponse in schemas.py - keep them in sync.
+USER_FIELDS = ("email", "first_name", "last_name", "phone", "id", "role", "is_active", "created_at")
+INSTRUMENT_FIELDS = ("name", "name_hu", "category", "icon", "id")
+LOCATION_FIELDS = ("city", "district", "country", "id")
+ADVERTISEMENT_FIELDS = (
+    "title", "short_description", "long_description", "instrument_id", "location_id",
+    "id", "teacher_id", "status", "featured", "views", "contacts", "created_at", "expires_at",
+)
+
+serialize_user = _compile(USER_FIELDS)
+serialize_instrument = _compile(INSTRUMENT_FIELDS)
+serialize_location = _compile(LOCATION_FIELDS)
+_serialize_advertisement_fields = _compile(ADVERTISEMENT_FIELDS)
+
+
+def serialize_advertisement(ad) -> dict:
+    """Serialize an Advertisement the same way AdvertisementResponse does."""
+    data = _serialize_advertisement_fields(ad)
+    data["teacher"] = serialize_user(ad.teacher)
+    data["instrument"] = serialize_instrument(ad.instrument)
+    data["location"] = serialize_location(ad.location)
+    return data
+
+
+def serialize_search_page(advertisements, total: int, page: int, per_page: int) -> dict:
+    """Serialize a search result page the same way SearchResponse does."""
+    return {
+        "advertisements": [serialize_advertisement(ad) for ad in advertisements],
+        "total": total,
+        "page": page,
+        "per_page": per_page,
+    }
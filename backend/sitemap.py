@@ -0,0 +1,305 @@
+"""Sitemaps and per-city/instrument feeds for search engines.
+
+Everything is generated into SITEMAP_DIR by the "sitemap.build" job and
+served as files:
+
+    /sitemap.xml                    sitemap index
+    /sitemaps/pages.xml.gz          home, city and instrument landing pages
+    /sitemaps/ad-<n>.xml.gz         active advertisements, by id range
+    /sitemaps/teacher-<n>.xml.gz    active teacher profiles, by id range
+    /feeds/varos/<city>.xml         Atom feed of a city's newest ads
+    /feeds/hangszer/<name>.xml      Atom feed of an instrument's newest ads
+
+Shard n holds the ids n * SITEMAP_SHARD_SIZE up to the next shard, so it
+never exceeds the protocol's 50,000 URLs. Every write to an ad or teacher
+bumps its shard's version (see versions.touch), and a build only rewrites
+the shards whose version moved since the last one, streaming their rows
+with yield_per. Landing pages and feeds are checked when the catalog
+version changes and rewritten only if their content did.
+
+The job reschedules itself every SITEMAP_INTERVAL seconds; the API queues
+the first one at startup. To build once by hand:
+    python sitemap.py build [--force]
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import quote
+from xml.sax.saxutils import escape
+
+from sqlalchemy import select, func
+from sqlalchemy.orm import joinedload
+
+from database import SessionLocal, engine, Base
+from models import (
+    Advertisement, Instrument, Location, TeacherProfile, User, Job, EntityVersion, UserRole, AdStatus
+)
+from jobs import handler, enqueue, PRIORITY_LOW
+from serializers import serialize_instrument
+from versions import SITEMAP_SHARD_SIZE
+import listings
+import prerender
+import versions
+
+SITEMAP_DIR = Path(os.getenv("SITEMAP_DIR", Path(__file__).resolve().parent / "sitemaps"))
+SITE_URL = os.getenv("SITE_URL", "http://localhost:8000").rstrip("/")
+SITEMAP_INTERVAL = float(os.getenv("SITEMAP_INTERVAL", "300"))
+
+FEED_SIZE = 50
+YIELD_PER = 5000
+STATE = "state.json"
+JOB_KIND = "sitemap.build"
+
+# Public URL of each entity; the teacher profile is the API's detail endpoint
+URLS = {
+    "ad": "/api/advertisements/{id}",
+    "teacher": "/api/teachers/{id}",
+}
+
+
+def _url(path: str) -> str:
+    return SITE_URL + quote(path)
+
+
+def _shard_ids(db, kind: str, shard: int):
+    """Stream the ids of the public entities in one shard."""
+    low, high = shard * SITEMAP_SHARD_SIZE, (shard + 1) * SITEMAP_SHARD_SIZE
+    if kind == "ad":
+        query = select(Advertisement.id).where(
+            Advertisement.status == AdStatus.ACTIVE, Advertisement.id >= low, Advertisement.id < high
+        ).order_by(Advertisement.id)
+    else:
+        query = select(User.id).join(TeacherProfile).where(
+            User.role == UserRole.TEACHER, User.is_active == True, User.id >= low, User.id < high
+        ).order_by(User.id)
+    return db.execute(query.execution_options(yield_per=YIELD_PER)).scalars()
+
+
+def _max_id(db, kind: str) -> int:
+    column = Advertisement.id if kind == "ad" else User.id
+    return db.scalar(select(func.max(column))) or 0
+
+
+# ==================== WRITERS ====================
+
+class Sitemaps:
+    """Files under `directory` plus the state that makes rebuilds incremental."""
+
+    def __init__(self, directory: Path = SITEMAP_DIR):
+        self.directory = Path(directory)
+
+    def path(self, name: str):
+        """File for a URL path below the directory, or None."""
+        target = (self.directory / name).resolve()
+        if self.directory.resolve() not in target.parents or not target.is_file() or target.name == STATE:
+            return None
+        return target
+
+    def _state(self) -> dict:
+        try:
+            return json.loads((self.directory / STATE).read_text())
+        except (OSError, ValueError):
+            return {"shards": {}, "catalog": None, "digests": {}}
+
+    def _open(self, name: str):
+        target = self.directory / name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        return target, target.with_name(f"{target.name}.{os.getpid()}.tmp")
+
+    def _write(self, name: str, data: bytes):
+        target, tmp = self._open(name)
+        tmp.write_bytes(data)
+        os.replace(tmp, target)
+
+    def _write_urlset(self, name: str, urls) -> int:
+        """Stream URLs into a gzipped <urlset>; returns how many were written."""
+        target, tmp = self._open(name)
+        count = 0
+        with open(tmp, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as out:
+            out.write(b'<?xml version="1.0" encoding="UTF-8"?>\n'
+                      b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n')
+            for url in urls:
+                out.write(f"<url><loc>{escape(url)}</loc></url>\n".encode())
+                count += 1
+            out.write(b"</urlset>\n")
+        os.replace(tmp, target)
+        return count
+
+    def _write_if_changed(self, state: dict, name: str, data: bytes) -> bool:
+        digest = hashlib.sha256(data).hexdigest()[:20]
+        if state["digests"].get(name) == digest and (self.directory / name).is_file():
+            return False
+        self._write(name, data)
+        state["digests"][name] = digest
+        return True
+
+    # ---------- entity shards ----------
+
+    def _build_shards(self, db, state: dict, force: bool) -> int:
+        shard_versions = dict(db.execute(
+            select(EntityVersion.scope, EntityVersion.version)
+            .where(EntityVersion.scope.like("sitemap:%"))
+        ).all())
+        written = 0
+        for kind in URLS:
+            known = {int(key.split(":")[1]) for key in state["shards"] if key.startswith(f"{kind}:")}
+            for shard in sorted(known | set(range(_max_id(db, kind) // SITEMAP_SHARD_SIZE + 1))):
+                key = f"{kind}:{shard}"
+                version = shard_versions.get(f"sitemap:{key}", 0)
+                entry = state["shards"].get(key)
+                name = f"sitemaps/{kind}-{shard}.xml.gz"
+                if not force and entry and entry["version"] == version and (
+                    entry["urls"] == 0 or (self.directory / name).is_file()
+                ):
+                    continue
+                template = URLS[kind]
+                count = self._write_urlset(name, (
+                    _url(template.format(id=entity_id)) for entity_id in _shard_ids(db, kind, shard)
+                ))
+                if count == 0:
+                    (self.directory / name).unlink(missing_ok=True)
+                state["shards"][key] = {
+                    "version": version, "urls": count, "lastmod": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+                }
+                written += 1
+        return written
+
+    # ---------- landing pages and feeds ----------
+
+    def _feed(self, title: str, path: str, ads) -> bytes:
+        updated = max((ad.created_at for ad in ads if ad.created_at), default=datetime(2024, 1, 1))
+        entries = "".join(
+            "<entry>"
+            f"<id>{escape(_url(URLS['ad'].format(id=ad.id)))}</id>"
+            f"<title>{escape(ad.title)}</title>"
+            f'<link href="{escape(_url(URLS["ad"].format(id=ad.id)))}"/>'
+            f"<updated>{(ad.created_at or updated).strftime('%Y-%m-%dT%H:%M:%SZ')}</updated>"
+            f"<summary>{escape(ad.short_description or '')}</summary>"
+            f"<author><name>{escape(f'{ad.teacher.first_name} {ad.teacher.last_name}')}</name></author>"
+            "</entry>\n"
+            for ad in ads
+        )
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<feed xmlns="http://www.w3.org/2005/Atom">\n'
+            f"<id>{escape(_url(path))}</id><title>{escape(title)} | {prerender.SITE_NAME}</title>"
+            f'<link rel="alternate" href="{escape(_url(path))}"/>'
+            f"<updated>{updated.strftime('%Y-%m-%dT%H:%M:%SZ')}</updated>\n"
+            f"{entries}</feed>\n"
+        ).encode()
+
+    def _newest_ads(self, db, kind: str, name: str):
+        query = db.query(Advertisement).options(joinedload(Advertisement.teacher)).filter(
+            Advertisement.status == AdStatus.ACTIVE
+        )
+        if kind == "city":
+            query = query.join(Location).filter(Location.city == name)
+        else:
+            query = query.join(Instrument).filter(Instrument.name_hu == name)
+        return query.order_by(Advertisement.id.desc()).limit(FEED_SIZE).all()
+
+    def _build_pages(self, db, state: dict, force: bool) -> int:
+        catalog = versions.get_versions(db, ["catalog"])["catalog"]
+        if catalog == state["catalog"] and not force:
+            return 0
+        cities = listings.cities(db)
+        instruments = [serialize_instrument(instrument) for instrument in listings.instruments(db)]
+        specs = list(prerender.page_specs(cities, instruments))
+
+        written = 0
+        current = {"sitemaps/pages.xml.gz"}
+        pages = "".join(f"<url><loc>{escape(_url(path))}</loc></url>\n" for path, *_ in specs)
+        pages_xml = (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+            f"{pages}</urlset>\n"
+        ).encode()
+        written += self._write_if_changed(state, "sitemaps/pages.xml.gz", gzip.compress(pages_xml, mtime=0))
+        for path, stem, title, kind, name in specs:
+            if kind == "home":
+                continue
+            feed_name = f"feeds/{stem}.xml"
+            current.add(feed_name)
+            written += self._write_if_changed(state, feed_name, self._feed(title, path, self._newest_ads(db, kind, name)))
+
+        # Feeds of cities and instruments that no longer exist
+        for name in set(state["digests"]) - current:
+            (self.directory / name).unlink(missing_ok=True)
+            del state["digests"][name]
+        state["catalog"] = catalog
+        return written
+
+    # ---------- index ----------
+
+    def _write_index(self, state: dict):
+        pages_lastmod = datetime.utcfromtimestamp(
+            (self.directory / "sitemaps/pages.xml.gz").stat().st_mtime
+        ).strftime("%Y-%m-%dT%H:%M:%SZ")
+        entries = [(f"{SITE_URL}/sitemaps/pages.xml.gz", pages_lastmod)]
+        for key, entry in sorted(state["shards"].items(), key=lambda item: (item[0].split(":")[0], int(item[0].split(":")[1]))):
+            if entry["urls"]:
+                kind, shard = key.split(":")
+                entries.append((f"{SITE_URL}/sitemaps/{kind}-{shard}.xml.gz", entry["lastmod"]))
+        body = "".join(
+            f"<sitemap><loc>{escape(loc)}</loc><lastmod>{lastmod}</lastmod></sitemap>\n" for loc, lastmod in entries
+        )
+        self._write("sitemap.xml", (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+            f"{body}</sitemapindex>\n"
+        ).encode())
+
+    def build(self, db, force: bool = False) -> int:
+        """Rewrite what changed since the last build; returns files written."""
+        state = self._state()
+        written = self._build_shards(db, state, force) + self._build_pages(db, state, force)
+        if written or not (self.directory / "sitemap.xml").is_file():
+            self._write_index(state)
+            self._write(STATE, json.dumps(state, indent=1).encode())
+        return written
+
+
+sitemaps = Sitemaps()
+
+
+# ==================== JOB ====================
+
+def schedule(db, delay: float = 0):
+    """Queue a build unless one is already waiting; the caller commits."""
+    waiting = db.scalar(
+        select(func.count()).select_from(Job).where(Job.kind == JOB_KIND, Job.status == "queued")
+    )
+    if not waiting:
+        enqueue(db, JOB_KIND, delay=delay, priority=PRIORITY_LOW, max_attempts=3)
+        db.flush()
+
+
+@handler(JOB_KIND)
+def build_job(db, payload):
+    """Incremental build, then the next one in SITEMAP_INTERVAL seconds."""
+    sitemaps.build(db)
+    schedule(db, delay=SITEMAP_INTERVAL)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sitemaps and SEO feeds")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build_parser = commands.add_parser("build", help="Write the sitemaps and feeds that changed")
+    build_parser.add_argument("--force", action="store_true", help="Rewrite every file")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        written = sitemaps.build(db, force=args.force)
+        print(f"✅ Wrote {written} files into {sitemaps.directory}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+"""Serve the built frontend (app/dist) from the API process.
+
+Small deployments can run the SPA and the API behind one port without a
+separate web server:
+
+* files under assets/ and images/optimized/ carry a content hash in their
+  name and are served with an immutable, year-long Cache-Control; everything
+  else (index.html above all) is revalidated with its ETag
+* build-time precompressed .br/.gz siblings are sent as they are when the
+  client accepts them, so nothing is compressed per request
+* file bodies go out with the ASGI pathsend/zerocopysend extensions where
+  the server offers them (sendfile), and in chunks otherwise
+* paths that aren't files fall back to index.html for client-side routing,
+  except the ones with a prerendered snapshot (see prerender.py), which are
+  answered from memory
+
+app/dist is build output and not tracked; build it before serving:
+    cd app && npm ci && npm run build
+
+Precompress after each frontend build (run automatically by npm's
+postbuild step):
+    python static_site.py precompress
+"""
+import argparse
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+from dataclasses import dataclass
+from email.utils import formatdate
+from pathlib import Path
+
+import anyio
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, .gz variants are always built
+    brotli = None
+
+APP_DIR = Path(__file__).resolve().parent.parent / "app"
+STATIC_DIR = Path(os.getenv("STATIC_DIR", APP_DIR / "dist"))
+SERVE_STATIC = os.getenv("SERVE_STATIC", "1") == "1"
+
+# Vite's assetsDir and the output of `images.py assets`
+IMMUTABLE_DIRS = ("assets/", "images/optimized/")
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+PRECOMPRESS_SUFFIXES = (".html", ".js", ".mjs", ".css", ".json", ".svg", ".txt", ".xml", ".map", ".webmanifest")
+PRECOMPRESS_MIN_SIZE = 1024
+# Client paths that never fall back to the SPA
+API_PREFIXES = ("/api/", "/media/", "/metrics")
+CHUNK_SIZE = 64 * 1024
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+mimetypes.add_type("application/javascript", ".mjs")
+mimetypes.add_type("image/avif", ".avif")
+mimetypes.add_type("image/webp", ".webp")
+mimetypes.add_type("application/manifest+json", ".webmanifest")
+
+_ASSET_PATH = re.compile(r"^[\w\-./@~]+$")
+
+
+def _accepts(header: str) -> set:
+    accepted = set()
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        if params.replace(" ", "") not in ("q=0", "q=0.0"):
+            accepted.add(name.strip().lower())
+    return accepted
+
+
+def _choose_encoding(request_headers: dict, available) -> str:
+    """The best precompressed encoding the client accepts, or None."""
+    accepted = _accepts(request_headers.get("accept-encoding", ""))
+    for name in ("br", "gzip"):
+        if name in accepted and name in available:
+            return name
+    return None
+
+
+@dataclass(frozen=True)
+class Page:
+    """A document held in memory: its body per encoding (None = identity)."""
+    bodies: dict
+    etag: str
+    modified: float
+    content_type: str = "text/html; charset=utf-8"
+
+
+class StaticSite:
+    """ASGI app serving a built single-page app from `directory`.
+
+    `pages` is anything with a get(path) returning a Page or None; those
+    paths are served from memory before the files are looked at.
+    """
+
+    def __init__(self, directory, index: str = "index.html", pages=None):
+        self.directory = Path(directory).resolve()
+        self.index = index
+        self.pages = pages
+
+    def _resolve(self, path: str):
+        """The file for a URL path, or None; never leaves the directory."""
+        relative = path.lstrip("/")
+        if not relative:
+            return None
+        if not _ASSET_PATH.match(relative) or ".." in relative.split("/"):
+            return None
+        candidate = self.directory / relative
+        return candidate if candidate.is_file() else None
+
+    async def __call__(self, scope, receive, send):
+        path = scope["path"]
+        page = self.pages.get(path) if self.pages is not None else None
+        if page is not None:
+            await self._send_page(scope, send, page)
+            return
+        file = self._resolve(path)
+        if file is None:
+            # Routes of the SPA have no file extension; missing assets stay 404s
+            if path.startswith(API_PREFIXES) or "." in path.rsplit("/", 1)[-1]:
+                await self._not_found(send)
+                return
+            file = self.directory / self.index
+            if not file.is_file():
+                await self._not_found(send)
+                return
+        await self._send_file(scope, send, file)
+
+    async def _send_file(self, scope, send, file: Path):
+        request_headers = {key.decode().lower(): value.decode() for key, value in scope["headers"]}
+        relative = file.relative_to(self.directory).as_posix()
+        content_type, _ = mimetypes.guess_type(file.name)
+        content_type = content_type or "application/octet-stream"
+        if content_type.startswith("text/") or content_type == "application/javascript":
+            content_type += "; charset=utf-8"
+
+        available = {name for name, suffix in ENCODING_SUFFIXES.items() if file.with_name(file.name + suffix).is_file()}
+        encoding = _choose_encoding(request_headers, available)
+        body_file = file.with_name(file.name + ENCODING_SUFFIXES[encoding]) if encoding else file
+
+        stat = body_file.stat()
+        etag = '"%s"' % hashlib.md5(f"{relative}:{stat.st_mtime_ns}:{stat.st_size}".encode()).hexdigest()
+        headers = [
+            (b"content-type", content_type.encode()),
+            (b"cache-control", (IMMUTABLE if relative.startswith(IMMUTABLE_DIRS) else REVALIDATE).encode()),
+            (b"etag", etag.encode()),
+            (b"last-modified", formatdate(stat.st_mtime, usegmt=True).encode()),
+            (b"vary", b"Accept-Encoding"),
+        ]
+        if encoding:
+            headers.append((b"content-encoding", encoding.encode()))
+
+        if request_headers.get("if-none-match") == etag:
+            await send({"type": "http.response.start", "status": 304, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        headers.append((b"content-length", str(stat.st_size).encode()))
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        if scope["method"] == "HEAD":
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        extensions = scope.get("extensions") or {}
+        if "http.response.pathsend" in extensions:
+            await send({"type": "http.response.pathsend", "path": str(body_file)})
+        elif "http.response.zerocopysend" in extensions:
+            with open(body_file, "rb") as f:
+                await send({"type": "http.response.zerocopysend", "file": f.fileno(), "count": stat.st_size})
+        else:
+            async with await anyio.open_file(body_file, "rb") as f:
+                more_body = True
+                while more_body:
+                    chunk = await f.read(CHUNK_SIZE)
+                    more_body = len(chunk) == CHUNK_SIZE
+                    await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+    async def _send_page(self, scope, send, page: Page):
+        request_headers = {key.decode().lower(): value.decode() for key, value in scope["headers"]}
+        encoding = _choose_encoding(request_headers, page.bodies)
+        body = page.bodies[encoding]
+        etag = page.etag if encoding is None else page.etag[:-1] + f'-{encoding}"'
+        headers = [
+            (b"content-type", page.content_type.encode()),
+            (b"cache-control", REVALIDATE.encode()),
+            (b"etag", etag.encode()),
+            (b"last-modified", formatdate(page.modified, usegmt=True).encode()),
+            (b"vary", b"Accept-Encoding"),
+        ]
+        if encoding:
+            headers.append((b"content-encoding", encoding.encode()))
+        if request_headers.get("if-none-match") == etag:
+            await send({"type": "http.response.start", "status": 304, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        headers.append((b"content-length", str(len(body)).encode()))
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": b"" if scope["method"] == "HEAD" else body})
+
+    async def _not_found(self, send):
+        body = b'{"detail":"Not Found"}'
+        await send({"type": "http.response.start", "status": 404, "headers": [
+            (b"content-type", b"application/json"), (b"content-length", str(len(body)).encode()),
+        ]})
+        await send({"type": "http.response.body", "body": body})
+
+
+def install(app, directory=STATIC_DIR, pages=None):
+    """Serve the SPA for GET/HEAD requests no API route matched.
+
+    Call after every route is registered, so API routes (and their 405s for
+    other methods) keep precedence.
+    """
+    if not SERVE_STATIC or not Path(directory).is_dir():
+        return False
+    app.add_route("/{path:path}", StaticSite(directory, pages=pages), methods=["GET", "HEAD"], include_in_schema=False)
+    return True
+
+
+# ==================== PRECOMPRESSION ====================
+
+def compress(data: bytes) -> dict:
+    """Worthwhile precompressed variants of data, keyed by file suffix."""
+    if len(data) < PRECOMPRESS_MIN_SIZE:
+        return {}
+    variants = {".gz": gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants[".br"] = brotli.compress(data, quality=11)
+    # Not worth a second file if it barely shrinks
+    return {suffix: body for suffix, body in variants.items() if len(body) < len(data) * 0.9}
+
+
+def precompress(directory: Path) -> int:
+    """Write .gz (and .br with brotli installed) next to every compressible file."""
+    written = 0
+    for file in directory.rglob("*"):
+        if not file.is_file() or file.suffix not in PRECOMPRESS_SUFFIXES:
+            continue
+        targets = [file.with_name(file.name + suffix) for suffix in ENCODING_SUFFIXES.values()]
+        if all(target.exists() and target.stat().st_mtime >= file.stat().st_mtime for target in targets):
+            continue
+        for suffix, body in compress(file.read_bytes()).items():
+            file.with_name(file.name + suffix).write_bytes(body)
+            written += 1
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Static frontend serving helpers")
+    commands = parser.add_subparsers(dest="command", required=True)
+    precompress_parser = commands.add_parser("precompress", help="Write .gz/.br variants of the built frontend")
+    precompress_parser.add_argument("--dir", type=Path, default=STATIC_DIR)
+    args = parser.parse_args()
+    if brotli is None:
+        print("⚠️  brotli is not installed, writing .gz variants only")
+    print(f"✅ Wrote {precompress(args.dir)} precompressed files in {args.dir}")
+
+
+if __name__ == "__main__":
+    main()
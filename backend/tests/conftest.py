@@ -0,0 +1,104 @@
+"""Shared fixtures: a throwaway SQLite database and a local fake Stripe server.
+
+Run from the backend directory:
+    python -m pytest tests
+"""
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+# Configuration is read at import time, so it has to be in place before the app is imported
+STRIPE_PORT = _free_port()
+os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/test.db"
+os.environ["STRIPE_API_BASE"] = f"http://127.0.0.1:{STRIPE_PORT}"
+os.environ["STRIPE_WEBHOOK_SECRET"] = "whsec_test"
+os.environ.pop("FAKE_STRIPE_WEBHOOK_URL", None)
+
+
+@pytest.fixture(scope="session")
+def fake_stripe():
+    """fake_stripe.py served by uvicorn on a local port."""
+    import uvicorn
+    import fake_stripe as server
+
+    config = uvicorn.Config(server.app, host="127.0.0.1", port=STRIPE_PORT, log_level="warning")
+    runner = uvicorn.Server(config)
+    thread = threading.Thread(target=runner.run, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not runner.started:
+        if time.monotonic() > deadline:
+            raise RuntimeError("Fake Stripe server did not start")
+        time.sleep(0.05)
+    yield server
+    runner.should_exit = True
+    thread.join(timeout=5)
+
+
+@pytest.fixture(autouse=True)
+def reset_fake_stripe(fake_stripe):
+    fake_stripe.failures.update(count=0, status=503, delay=0.0)
+    yield
+
+
+@pytest.fixture(scope="session")
+def client(fake_stripe):
+    from fastapi.testclient import TestClient
+    import main
+    return TestClient(main.app)
+
+
+@pytest.fixture
+def db(client):
+    from database import SessionLocal
+    session = SessionLocal()
+    yield session
+    session.close()
+
+
+def _user(db, role, name: str):
+    from auth import create_access_token, get_password_hash
+    from models import User
+    count = db.query(User).count()
+    user = User(
+        email=f"{name}{count}@example.com", hashed_password=get_password_hash("secret"),
+        first_name="Test", last_name=name.title(), role=role,
+    )
+    db.add(user)
+    db.flush()
+    return user, {"Authorization": f"Bearer {create_access_token({'sub': user.email})}"}
+
+
+@pytest.fixture
+def teacher(db):
+    """A new teacher with a free profile, as (user, auth headers)."""
+    from models import TeacherProfile, UserRole
+    user, headers = _user(db, UserRole.TEACHER, "teacher")
+    db.add(TeacherProfile(user_id=user.id))
+    db.commit()
+    return user, headers
+
+
+@pytest.fixture
+def admin(db):
+    """A new admin, as (user, auth headers)."""
+    from models import UserRole
+    user, headers = _user(db, UserRole.ADMIN, "admin")
+    db.commit()
+    return user, headers
@@ -0,0 +1,67 @@
+"""Query budgets of the read endpoints that used to run a query per row.
+
+Each budget is checked with several teachers, ads, instruments and cities
+in the database, so an N+1 regression exceeds it.
+"""
+import pytest
+
+from models import (
+    Advertisement, AdStatus, Instrument, Location, TeacherInstrument, TeacherLocation, TeacherProfile
+)
+from query_stats import check_query_budget
+
+TEACHERS = 5
+
+
+@pytest.fixture
+def catalog(db, teacher):
+    """The `teacher` plus TEACHERS - 1 more, each with two instruments, two cities and two ads."""
+    from conftest import _user
+    from models import UserRole
+
+    suffix = db.query(Instrument).count()
+    instruments = [
+        Instrument(name=f"budget-{suffix + i}", name_hu=f"Hangszer {suffix + i}", category="test") for i in range(2)
+    ]
+    locations = [Location(city=f"Város {i}") for i in range(2)]
+    db.add_all(instruments + locations)
+    db.flush()
+    users = [teacher[0]]
+    for _ in range(TEACHERS - 1):
+        user, _ = _user(db, UserRole.TEACHER, "teacher")
+        db.add(TeacherProfile(user_id=user.id))
+        users.append(user)
+    db.flush()
+    for user in users:
+        profile = db.query(TeacherProfile).filter(TeacherProfile.user_id == user.id).one()
+        for instrument, location in zip(instruments, locations):
+            db.add(TeacherInstrument(teacher_id=profile.id, instrument_id=instrument.id))
+            db.add(TeacherLocation(teacher_id=profile.id, location_id=location.id))
+            db.add(Advertisement(
+                teacher_id=user.id, title="Órák", short_description="Rövid", long_description="Hosszú",
+                instrument_id=instrument.id, location_id=location.id, status=AdStatus.ACTIVE,
+            ))
+    db.commit()
+    return users
+
+
+def test_get_all_users(client, admin, catalog):
+    _, headers = admin
+    response = check_query_budget(client, "GET", "/api/admin/users", 2, headers=headers)
+    assert response.status_code == 200
+
+
+def test_get_featured_teachers(client, catalog):
+    response = check_query_budget(client, "GET", f"/api/teachers/featured?limit={TEACHERS}", 6)
+    assert response.status_code == 200
+
+
+def test_get_teacher_profile(client, catalog):
+    response = check_query_budget(client, "GET", f"/api/teachers/{catalog[0].id}", 6)
+    assert len(response.json()["advertisements"]) == 2
+
+
+def test_get_user_profile(client, teacher, catalog):
+    _, headers = teacher
+    response = check_query_budget(client, "GET", "/api/users/profile", 12, headers=headers)
+    assert response.status_code == 200
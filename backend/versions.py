@@ -0,0 +1,146 @@
+"""Version counters for cache validation.
+
+Every flush that changes an ad, teacher, user, instrument or location bumps
+the matching rows in `entity_versions` inside the same transaction, so any
+worker can tell whether a cached representation is still current with a
+single primary-key lookup.
+
+Scopes:
+    ad:<id>         one advertisement
+    user:<id>       one user row
+    teacher:<id>    a teacher's public profile (user, profile, links, ads)
+    instruments     the instrument list
+    locations       the location list
+    catalog         anything shown on landing/search pages
+    sitemap:ad:<n>, sitemap:teacher:<n>
+                    the sitemap shard of ids n * SITEMAP_SHARD_SIZE up to the
+                    next shard; bumped along with every ad:/teacher: scope
+
+The same hook records the changed entities in the outbox (outbox.py);
+bulk writes that call touch() directly get events derived from their scopes.
+"""
+import hashlib
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session
+
+from database import upsert
+from models import (
+    User, TeacherProfile, TeacherInstrument, TeacherLocation, Advertisement,
+    Instrument, Location, EntityVersion, TeacherPhoto, UserRole
+)
+import outbox
+
+# Columns whose changes don't affect any cached representation
+IGNORED_ATTRIBUTES = {
+    Advertisement: {"views", "contacts"},
+}
+
+
+# URLs per sitemap shard, the protocol's limit
+SITEMAP_SHARD_SIZE = 50000
+
+
+def shard_scope(kind: str, entity_id: int) -> str:
+    return f"sitemap:{kind}:{entity_id // SITEMAP_SHARD_SIZE}"
+
+
+def touch(connection, scopes, record: bool = True):
+    """Bump the version of each scope on the given connection.
+
+    With `record`, also add outbox events for the entities behind the
+    scopes; the flush hook passes False as it records exact ones.
+    """
+    scopes = set(scopes)
+    for scope in list(scopes):
+        kind, _, entity_id = scope.partition(":")
+        if kind in ("ad", "teacher") and entity_id.isdigit():
+            scopes.add(shard_scope(kind, int(entity_id)))
+    upsert(
+        connection,
+        EntityVersion.__table__,
+        [{"scope": scope, "version": 1} for scope in sorted(scopes)],
+        key=["scope"],
+        update=lambda table, incoming: {"version": table.c.version + 1},
+    )
+    if record:
+        outbox.record(connection, outbox.scope_events(scopes))
+
+
+def get_versions(db: Session, scopes) -> dict:
+    """Return the current version of each scope (0 if never bumped)."""
+    scopes = list(scopes)
+    rows = db.execute(
+        select(EntityVersion.scope, EntityVersion.version).where(EntityVersion.scope.in_(scopes))
+    ).all()
+    found = dict(rows)
+    return {scope: found.get(scope, 0) for scope in scopes}
+
+
+def etag(db: Session, *scopes) -> str:
+    """Weak ETag derived from the versions of the given scopes."""
+    current = get_versions(db, scopes)
+    token = ";".join(f"{scope}={current[scope]}" for scope in scopes)
+    return 'W/"%s"' % hashlib.blake2b(token.encode(), digest_size=8).hexdigest()
+
+
+def _has_relevant_changes(obj) -> bool:
+    ignored = IGNORED_ATTRIBUTES.get(type(obj))
+    if not ignored:
+        return True
+    state = inspect(obj)
+    return any(
+        attr.key not in ignored and attr.history.has_changes()
+        for attr in state.attrs
+    )
+
+
+def _scopes_for(obj, profile_ids: set) -> set:
+    if isinstance(obj, Advertisement):
+        return {f"ad:{obj.id}", f"teacher:{obj.teacher_id}", "catalog"}
+    if isinstance(obj, User):
+        scopes = {f"user:{obj.id}", f"teacher:{obj.id}"}
+        if obj.role == UserRole.TEACHER:
+            scopes.add("catalog")
+        return scopes
+    if isinstance(obj, TeacherProfile):
+        return {f"user:{obj.user_id}", f"teacher:{obj.user_id}", "catalog"}
+    if isinstance(obj, (TeacherInstrument, TeacherLocation)):
+        # Resolved to the owning user below, once for the whole flush
+        profile_ids.add(obj.teacher_id)
+        return {"catalog"}
+    if isinstance(obj, TeacherPhoto):
+        return {f"teacher:{obj.user_id}", "catalog"}
+    if isinstance(obj, Instrument):
+        return {"instruments", "catalog"}
+    if isinstance(obj, Location):
+        return {"locations", "catalog"}
+    return set()
+
+
+@event.listens_for(Session, "after_flush")
+def _touch_changed_entities(session, flush_context):
+    scopes = set()
+    events = []
+    profile_ids = set()
+    changes = (
+        ("insert", session.new),
+        ("update", [obj for obj in session.dirty if session.is_modified(obj) and _has_relevant_changes(obj)]),
+        ("delete", session.deleted),
+    )
+    for op, objects in changes:
+        for obj in objects:
+            scopes |= _scopes_for(obj, profile_ids)
+            events.extend(outbox.events_for(obj, op))
+    if not scopes:
+        return
+    connection = session.connection()
+    profile_ids.discard(None)
+    if profile_ids:
+        user_ids = list(connection.execute(
+            select(TeacherProfile.user_id).where(TeacherProfile.id.in_(profile_ids))
+        ).scalars())
+        scopes |= {f"teacher:{user_id}" for user_id in user_ids}
+        events.extend(("teacher", user_id, "update") for user_id in user_ids)
+    touch(connection, scopes, record=False)
+    outbox.record(connection, events, session=session)